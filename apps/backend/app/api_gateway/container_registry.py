@@ -80,6 +80,9 @@ _REGISTRY_ENTRIES = {
     "product.nodes.TagUsageStore": "domains.product.tags.adapters.memory.store:TagUsageStore",
     "product.nodes.EmbeddingClient": "domains.product.nodes.application.embedding:EmbeddingClient",
     "product.nodes.register_embedding_worker": "domains.product.nodes.application.embedding_worker:register_embedding_worker",
+    "product.nodes.SQLAdminStats": "domains.product.nodes.adapters.sql.admin_stats:create_admin_stats",
+    "product.nodes.register_admin_stats_events": "domains.product.nodes.adapters.admin_stats_events:register_admin_stats_projection",
+    "product.nodes.register_cache_invalidation": "domains.product.nodes.adapters.cache_events:register_node_cache_invalidation",
     "product.nodes.NodeViewsService": "domains.product.nodes.application:NodeViewsService",
     "product.nodes.NodeReactionsService": "domains.product.nodes.application:NodeReactionsService",
     "product.nodes.NodeCommentsService": "domains.product.nodes.application:NodeCommentsService",
@@ -93,11 +96,18 @@ _REGISTRY_ENTRIES = {
     "product.achievements.SQLRepo": "domains.product.achievements.adapters.sql.repository:create_repo",
     "product.achievements.Service": "domains.product.achievements.application.service:AchievementsService",
     "product.achievements.AdminService": "domains.product.achievements.application.service:AchievementsAdminService",
+    "product.achievements.CounterStore": "domains.product.achievements.adapters.sql.counters:create_counter_store",
+    "product.achievements.RuleEngine": "domains.product.achievements.application.rule_engine:AchievementRuleEngine",
+    "product.achievements.register_rules": "domains.product.achievements.adapters.rule_events:register_achievement_rules",
     "product.worlds.SQLRepo": "domains.product.worlds.adapters.sql.repository:create_repo",
     "product.worlds.Service": "domains.product.worlds.application.service:WorldsService",
     "product.referrals.SQLRepo": "domains.product.referrals.adapters.sql.repository:create_repo",
     "product.referrals.Service": "domains.product.referrals.application.service:ReferralsService",
     "product.premium.Service": "domains.product.premium.application.service:PremiumService",
+    "product.premium.EntitlementsRepo": "domains.product.premium.adapters.sql.repository:create_entitlements_repo",
+    "product.premium.EntitlementsCache": "domains.product.premium.adapters.memory.cache:MemoryEntitlementsCache",
+    "product.premium.SharedEntitlementsCache": "domains.product.premium.adapters.redis_cache:create_shared_cache",
+    "product.premium.register_billing_events": "domains.product.premium.adapters.billing_events:register_entitlement_invalidation",
     "product.quests.SQLRepo": "domains.product.quests.adapters.sql.repository:create_repo",
     "product.quests.Service": "domains.product.quests.application.service:QuestService",
     "product.moderation.SQLRepo": "domains.product.moderation.adapters.sql.repository:create_repo",
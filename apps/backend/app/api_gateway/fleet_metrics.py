@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, cast
+
+from fastapi import FastAPI
+from starlette.applications import Starlette
+
+from .events_relay import ShutdownHook
+
+logger = logging.getLogger(__name__)
+
+
+async def start_metrics_flush(app: FastAPI) -> ShutdownHook:
+    """Start flushing this process' metrics to the fleet store.
+
+    Returns a coroutine that stops the flusher and pushes a final flush.
+    """
+
+    sapp = cast(Starlette, app)
+    container: Any | None = getattr(sapp.state, "container", None)
+    telemetry = getattr(container, "telemetry", None)
+    fleet = getattr(telemetry, "fleet_metrics", None)
+    if fleet is None or not fleet.shared:
+        logger.info("Fleet metrics flush not started: no shared store")
+
+        async def _noop() -> None:
+            return None
+
+        return _noop
+
+    fleet.start()
+
+    async def _shutdown() -> None:
+        await asyncio.to_thread(fleet.stop)
+
+    return _shutdown
+
+
+__all__ = ["start_metrics_flush"]
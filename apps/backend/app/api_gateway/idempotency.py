@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+import gzip
+import hashlib
+import json
 import logging
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
 from functools import lru_cache
+from typing import Any
 
+import jwt
 from fastapi import Depends, Header, Request, status
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.responses import Response
 
 from packages.core.config import to_async_dsn
 from packages.core.db import get_async_engine
@@ -13,10 +23,42 @@ from packages.core.errors import ApiError
 
 from .routers import get_container
 
+try:
+    import redis.asyncio as aioredis  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - optional dependency
+    aioredis = None  # type: ignore[assignment]
+
+try:
+    from redis.exceptions import RedisError  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - optional dependency
+    RedisError = Exception  # type: ignore[misc, assignment]
+
+try:  # pragma: no cover - import guard mirrors iam.security
+    from jwt import PyJWTError  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover
+    from jwt import InvalidTokenError as PyJWTError  # type: ignore[attr-defined]
+
 logger = logging.getLogger(__name__)
 
 IDEMPOTENCY_HEADER = "Idempotency-Key"
+IDEMPOTENCY_REPLAYED_HEADER = "Idempotent-Replayed"
 IDEMPOTENCY_RETRY_SECONDS = 5
+IDEMPOTENCY_STATE_KEY = "idempotency_reservation"
+MAX_KEY_LENGTH = 255
+MAX_STORED_BODY_BYTES = 1024 * 1024
+
+# Headers that describe the original transport or session rather than the
+# resource itself; they are never replayed.
+_SKIPPED_HEADERS = frozenset(
+    {
+        "connection",
+        "content-length",
+        "date",
+        "server",
+        "set-cookie",
+        "transfer-encoding",
+    }
+)
 
 
 @lru_cache(maxsize=1)
@@ -24,21 +66,382 @@ def _engine_for_dsn(dsn: str) -> AsyncEngine:
     return get_async_engine("idempotency", url=dsn, pool_pre_ping=True, future=True)
 
 
+@dataclass(slots=True, frozen=True)
+class IdempotencyRecord:
+    key: str
+    fingerprint: str | None = None
+    status_code: int | None = None
+    headers: tuple[tuple[str, str], ...] = ()
+    body: bytes | None = None
+    locked_until: datetime | None = None
+    expires_at: datetime | None = None
+
+    @property
+    def completed(self) -> bool:
+        return self.status_code is not None
+
+    @property
+    def replayable(self) -> bool:
+        """Completed with a stored body; oversized responses keep none."""
+        return self.completed and self.body is not None
+
+
+def compress_body(body: bytes) -> bytes:
+    return gzip.compress(body, compresslevel=5, mtime=0)
+
+
+def decompress_body(payload: bytes | memoryview | None) -> bytes | None:
+    if payload is None:
+        return None
+    return gzip.decompress(bytes(payload))
+
+
+class RedisIdempotencyCache:
+    """Hot copy of completed responses so most replays skip Postgres."""
+
+    def __init__(self, client: Any, *, prefix: str = "idem:") -> None:
+        self._client = client
+        self._prefix = prefix
+
+    def _key(self, key: str) -> str:
+        return f"{self._prefix}{key}"
+
+    async def get(self, key: str) -> IdempotencyRecord | None:
+        try:
+            raw = await self._client.hgetall(self._key(key))
+        except RedisError as exc:
+            logger.debug("idempotency cache read failed", exc_info=exc)
+            return None
+        if not raw:
+            return None
+        data = {_decode(k): v for k, v in raw.items()}
+        try:
+            status_code = int(_decode(data["status"]))
+            headers = tuple(
+                (str(name), str(value))
+                for name, value in json.loads(_decode(data.get("headers", b"[]")))
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+        body = data.get("body")
+        return IdempotencyRecord(
+            key=key,
+            fingerprint=_decode(data["fingerprint"]) if data.get("fingerprint") else None,
+            status_code=status_code,
+            headers=headers,
+            body=decompress_body(body) if body else None,
+        )
+
+    async def put(self, record: IdempotencyRecord, *, ttl_seconds: int) -> None:
+        if not record.completed or ttl_seconds <= 0:
+            return
+        mapping: dict[str, Any] = {
+            "status": str(record.status_code),
+            "headers": json.dumps([list(pair) for pair in record.headers]),
+            "fingerprint": record.fingerprint or "",
+        }
+        if record.body is not None:
+            mapping["body"] = compress_body(record.body)
+        pipe = self._client.pipeline(transaction=True)
+        pipe.hset(self._key(record.key), mapping=mapping)
+        pipe.expire(self._key(record.key), int(ttl_seconds))
+        try:
+            await pipe.execute()
+        except RedisError as exc:
+            logger.debug("idempotency cache write failed", exc_info=exc)
+
+    async def delete(self, key: str) -> None:
+        try:
+            await self._client.delete(self._key(key))
+        except RedisError as exc:
+            logger.debug("idempotency cache delete failed", exc_info=exc)
+
+
 class IdempotencyStore:
-    def __init__(self, engine: AsyncEngine) -> None:
+    """Postgres-backed idempotency keys with response capture.
+
+    A key moves from *locked* (``locked_until`` in the future, no status) to
+    *completed* (status, headers and a gzip body stored) and is removed by the
+    sweeper once ``expires_at`` passes. Locks that outlive ``locked_until``
+    belong to a crashed request and may be taken over by a retry.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        *,
+        cache: RedisIdempotencyCache | None = None,
+    ) -> None:
         self._engine = engine
+        self._cache = cache
+
+    async def reserve(
+        self,
+        key: str,
+        *,
+        fingerprint: str | None = None,
+        lock_seconds: int = 30,
+        ttl_seconds: int = 86400,
+    ) -> bool:
+        stmt = text(
+            """
+            INSERT INTO idempotency_keys(
+                key, locked, created_at, fingerprint, locked_until, expires_at
+            )
+            VALUES (
+                :key,
+                true,
+                now(),
+                :fingerprint,
+                now() + make_interval(secs => :lock_seconds),
+                now() + make_interval(secs => :ttl_seconds)
+            )
+            ON CONFLICT (key) DO UPDATE
+            SET locked = true,
+                created_at = EXCLUDED.created_at,
+                fingerprint = EXCLUDED.fingerprint,
+                locked_until = EXCLUDED.locked_until,
+                expires_at = EXCLUDED.expires_at,
+                status_code = NULL,
+                response_headers = NULL,
+                response_body = NULL,
+                completed_at = NULL
+            WHERE idempotency_keys.expires_at <= now()
+               OR (
+                    idempotency_keys.status_code IS NULL
+                    AND idempotency_keys.locked_until <= now()
+                    AND idempotency_keys.fingerprint IS NOT DISTINCT FROM EXCLUDED.fingerprint
+               )
+            RETURNING key
+            """
+        )
+        async with self._engine.begin() as conn:
+            result = await conn.execute(
+                stmt,
+                {
+                    "key": key,
+                    "fingerprint": fingerprint,
+                    "lock_seconds": int(lock_seconds),
+                    "ttl_seconds": int(ttl_seconds),
+                },
+            )
+            return result.first() is not None
+
+    async def get(self, key: str) -> IdempotencyRecord | None:
+        if self._cache is not None:
+            cached = await self._cache.get(key)
+            if cached is not None:
+                return cached
+        stmt = text(
+            """
+            SELECT key, fingerprint, status_code, response_headers,
+                   response_body, locked_until, expires_at
+            FROM idempotency_keys
+            WHERE key = :key
+              AND (expires_at IS NULL OR expires_at > now())
+            """
+        )
+        async with self._engine.connect() as conn:
+            row = (await conn.execute(stmt, {"key": key})).mappings().first()
+        if row is None:
+            return None
+        headers = row["response_headers"] or []
+        if isinstance(headers, str):
+            headers = json.loads(headers)
+        return IdempotencyRecord(
+            key=str(row["key"]),
+            fingerprint=row["fingerprint"],
+            status_code=row["status_code"],
+            headers=tuple((str(name), str(value)) for name, value in headers),
+            body=decompress_body(row["response_body"]),
+            locked_until=row["locked_until"],
+            expires_at=row["expires_at"],
+        )
+
+    async def complete(
+        self,
+        key: str,
+        *,
+        status_code: int,
+        headers: Sequence[tuple[str, str]],
+        body: bytes | None,
+        fingerprint: str | None = None,
+        ttl_seconds: int = 86400,
+    ) -> None:
+        stmt = text(
+            """
+            UPDATE idempotency_keys
+            SET status_code = :status_code,
+                response_headers = cast(:headers as jsonb),
+                response_body = :body,
+                completed_at = now(),
+                locked = false,
+                locked_until = NULL
+            WHERE key = :key AND status_code IS NULL
+            """
+        )
+        async with self._engine.begin() as conn:
+            await conn.execute(
+                stmt,
+                {
+                    "key": key,
+                    "status_code": int(status_code),
+                    "headers": json.dumps([list(pair) for pair in headers]),
+                    "body": compress_body(body) if body is not None else None,
+                },
+            )
+        if self._cache is not None:
+            await self._cache.put(
+                IdempotencyRecord(
+                    key=key,
+                    fingerprint=fingerprint,
+                    status_code=int(status_code),
+                    headers=tuple(headers),
+                    body=body,
+                ),
+                ttl_seconds=ttl_seconds,
+            )
+
+    async def release(self, key: str) -> None:
+        stmt = text(
+            "DELETE FROM idempotency_keys WHERE key = :key AND status_code IS NULL"
+        )
+        async with self._engine.begin() as conn:
+            await conn.execute(stmt, {"key": key})
+
+    async def sweep(self, *, limit: int = 1000, legacy_ttl_seconds: int = 86400) -> int:
+        """Delete up to ``limit`` expired keys; rows from before response
+        capture have no ``expires_at`` and age out by ``created_at``."""
 
-    async def reserve(self, key: str) -> bool:
         stmt = text(
             """
-            INSERT INTO idempotency_keys(key, locked, created_at)
-            VALUES (:key, true, now())
-            ON CONFLICT (key) DO NOTHING
+            WITH doomed AS (
+                SELECT key
+                FROM idempotency_keys
+                WHERE expires_at <= now()
+                   OR (
+                        expires_at IS NULL
+                        AND created_at <= now() - make_interval(secs => :legacy_ttl)
+                   )
+                LIMIT :limit
+                FOR UPDATE SKIP LOCKED
+            )
+            DELETE FROM idempotency_keys AS k
+            USING doomed
+            WHERE k.key = doomed.key
             """
         )
         async with self._engine.begin() as conn:
-            result = await conn.execute(stmt, {"key": key})
-        return bool(getattr(result, "rowcount", 0))
+            result = await conn.execute(
+                stmt, {"limit": int(limit), "legacy_ttl": int(legacy_ttl_seconds)}
+            )
+        return int(getattr(result, "rowcount", 0) or 0)
+
+
+class IdempotencySweeper:
+    def __init__(
+        self,
+        store: IdempotencyStore,
+        *,
+        batch_size: int = 1000,
+        max_batches: int = 20,
+        legacy_ttl_seconds: int = 86400,
+    ) -> None:
+        self._store = store
+        self._batch_size = max(1, int(batch_size))
+        self._max_batches = max(1, int(max_batches))
+        self._legacy_ttl = int(legacy_ttl_seconds)
+
+    async def run_once(self) -> int:
+        removed = 0
+        for _ in range(self._max_batches):
+            deleted = await self._store.sweep(
+                limit=self._batch_size, legacy_ttl_seconds=self._legacy_ttl
+            )
+            removed += deleted
+            if deleted < self._batch_size:
+                break
+        return removed
+
+
+@dataclass(slots=True)
+class IdempotencyReservation:
+    """Handle left on ``request.state`` for the capture middleware."""
+
+    store: Any
+    key: str
+    fingerprint: str | None
+    ttl_seconds: int
+    finished: bool = field(default=False)
+
+    async def complete(
+        self, status_code: int, headers: Iterable[tuple[str, str]], body: bytes | None
+    ) -> None:
+        if self.finished:
+            return
+        self.finished = True
+        await self.store.complete(
+            self.key,
+            status_code=status_code,
+            headers=replayable_headers(headers),
+            body=body,
+            fingerprint=self.fingerprint,
+            ttl_seconds=self.ttl_seconds,
+        )
+
+    async def release(self) -> None:
+        if self.finished:
+            return
+        self.finished = True
+        await self.store.release(self.key)
+
+
+class IdempotentReplay(Exception):
+    """Raised by the dependency to short-circuit with a stored response."""
+
+    def __init__(self, record: IdempotencyRecord) -> None:
+        super().__init__(record.key)
+        self.record = record
+
+
+def replayable_headers(headers: Iterable[tuple[str, str]]) -> list[tuple[str, str]]:
+    return [
+        (name, value)
+        for name, value in headers
+        if name.lower() not in _SKIPPED_HEADERS
+    ]
+
+
+def replay_response(record: IdempotencyRecord) -> Response:
+    response = Response(
+        content=record.body or b"", status_code=int(record.status_code or 200)
+    )
+    for name, value in record.headers:
+        response.headers.append(name, value)
+    response.headers[IDEMPOTENCY_REPLAYED_HEADER] = "true"
+    return response
+
+
+async def idempotent_replay_handler(request: Request, exc: IdempotentReplay) -> Response:
+    return replay_response(exc.record)
+
+
+def _decode(value: Any) -> str:
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return str(value)
+
+
+@lru_cache(maxsize=4)
+def _cache_for_url(url: str) -> RedisIdempotencyCache | None:
+    if aioredis is None:
+        return None
+    try:
+        client = aioredis.from_url(url, decode_responses=False)
+    except (RedisError, ValueError) as exc:
+        logger.warning("Failed to initialise idempotency cache: %s", exc)
+        return None
+    return RedisIdempotencyCache(client)
 
 
 def _get_store(settings) -> IdempotencyStore | None:
@@ -50,7 +453,59 @@ def _get_store(settings) -> IdempotencyStore | None:
     if not dsn:
         return None
     engine = _engine_for_dsn(str(dsn))
-    return IdempotencyStore(engine)
+    cache_url = getattr(settings, "idempotency_redis_url", None)
+    cache = _cache_for_url(str(cache_url)) if cache_url else None
+    return IdempotencyStore(engine, cache=cache)
+
+
+def _principal(request: Request, settings) -> str:
+    claims = getattr(request.state, "auth_claims", None)
+    if claims and claims.get("sub"):
+        return str(claims["sub"])
+    token = request.cookies.get("access_token")
+    if not token:
+        auth = request.headers.get("Authorization") or ""
+        if auth.startswith("Bearer "):
+            token = auth[len("Bearer ") :].strip()
+    if not token:
+        return "anonymous"
+    try:
+        decoded = jwt.decode(
+            token,
+            key=settings.auth_jwt_secret.get_secret_value(),
+            algorithms=[settings.auth_jwt_algorithm],
+            # A retry may carry an expired or refreshed token; only the
+            # subject matters for scoping.
+            options={"verify_exp": False, "verify_aud": False},
+        )
+    except (PyJWTError, AttributeError):
+        return "token:" + hashlib.sha256(token.encode("utf-8")).hexdigest()[:32]
+    return str(decoded.get("sub") or "anonymous")
+
+
+async def _fingerprint(request: Request, principal: str) -> str:
+    digest = hashlib.sha256()
+    for part in (principal, request.method, request.url.path, request.url.query):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    digest.update(await request.body())
+    return digest.hexdigest()
+
+
+def _response_unavailable() -> ApiError:
+    return ApiError(
+        code="E_IDEMPOTENCY_RESPONSE_UNAVAILABLE",
+        status_code=status.HTTP_409_CONFLICT,
+        message="Request already processed; its response is too large to replay",
+    )
+
+
+def _key_reused() -> ApiError:
+    return ApiError(
+        code="E_IDEMPOTENCY_KEY_REUSED",
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        message=f"{IDEMPOTENCY_HEADER} was already used for a different request",
+    )
 
 
 async def require_idempotency_key(
@@ -60,34 +515,93 @@ async def require_idempotency_key(
     ),
     container=Depends(get_container),
 ) -> str:
+    """Reserve ``key`` for this request or replay the stored response.
+
+    Duplicates that arrive while the original is still running poll the key
+    for up to ``idempotency_wait_seconds`` and then replay its response; only
+    if the original is still in flight after that do they get a 409.
+    """
     if not key:
         raise ApiError(
             code="E_IDEMPOTENCY_KEY_REQUIRED",
             status_code=status.HTTP_400_BAD_REQUEST,
             message=f"{IDEMPOTENCY_HEADER} header required",
         )
-    store = _get_store(container.settings)
+    if len(key) > MAX_KEY_LENGTH:
+        raise ApiError(
+            code="E_IDEMPOTENCY_KEY_INVALID",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            message=f"{IDEMPOTENCY_HEADER} must be at most {MAX_KEY_LENGTH} characters",
+        )
+    settings = container.settings
+    store = _get_store(settings)
     if store is None:
         raise ApiError(
             code="E_IDEMPOTENCY_UNAVAILABLE",
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             message="Idempotency storage unavailable",
         )
-    inserted = await store.reserve(key)
-    if not inserted:
-        raise ApiError(
-            code="E_IDEMPOTENCY_CONFLICT",
-            status_code=status.HTTP_409_CONFLICT,
-            message="Request already processed",
-            retry_after=IDEMPOTENCY_RETRY_SECONDS,
-        )
+    ttl_seconds = int(getattr(settings, "idempotency_ttl_seconds", 86400))
+    lock_seconds = int(getattr(settings, "idempotency_lock_seconds", 30))
+    wait_seconds = float(getattr(settings, "idempotency_wait_seconds", 10.0))
+    fingerprint = await _fingerprint(request, _principal(request, settings))
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait_seconds
+    delay = 0.05
+    while True:
+        if await store.reserve(
+            key,
+            fingerprint=fingerprint,
+            lock_seconds=lock_seconds,
+            ttl_seconds=ttl_seconds,
+        ):
+            break
+        # ``None`` means the key expired or was released between the two
+        # statements; the next reserve attempt should win it.
+        record = await store.get(key)
+        if record is not None:
+            if record.fingerprint and record.fingerprint != fingerprint:
+                raise _key_reused()
+            if record.completed:
+                if not record.replayable:
+                    raise _response_unavailable()
+                raise IdempotentReplay(record)
+        legacy = record is not None and record.locked_until is None
+        if legacy or loop.time() >= deadline:
+            raise ApiError(
+                code="E_IDEMPOTENCY_CONFLICT",
+                status_code=status.HTTP_409_CONFLICT,
+                message="Request already processed",
+                retry_after=IDEMPOTENCY_RETRY_SECONDS,
+            )
+        await asyncio.sleep(min(delay, max(deadline - loop.time(), 0.0)))
+        delay = min(delay * 2, 0.5)
+
     request.state.idempotency_key = key
+    setattr(
+        request.state,
+        IDEMPOTENCY_STATE_KEY,
+        IdempotencyReservation(
+            store=store, key=key, fingerprint=fingerprint, ttl_seconds=ttl_seconds
+        ),
+    )
     return key
 
 
 __all__ = [
     "IDEMPOTENCY_HEADER",
+    "IDEMPOTENCY_REPLAYED_HEADER",
     "IDEMPOTENCY_RETRY_SECONDS",
-    "require_idempotency_key",
+    "IDEMPOTENCY_STATE_KEY",
+    "MAX_STORED_BODY_BYTES",
+    "IdempotencyRecord",
+    "IdempotencyReservation",
     "IdempotencyStore",
+    "IdempotencySweeper",
+    "IdempotentReplay",
+    "RedisIdempotencyCache",
+    "idempotent_replay_handler",
+    "replay_response",
+    "require_idempotency_key",
 ]
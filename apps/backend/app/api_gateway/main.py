@@ -25,8 +25,13 @@ from packages.core.errors import ApiError
 from packages.core.testing import is_test_mode
 
 from .events_relay import ShutdownHook, start_events_relay
+from .fleet_metrics import start_metrics_flush
+from .idempotency import IdempotentReplay, idempotent_replay_handler
 from .metrics_middleware import setup_http_metrics
 from .middlewares.audience import AudienceMiddleware
+from .middlewares.idempotency import IdempotencyMiddleware
+from .middlewares.query_stats import QueryStatsMiddleware
+from .middlewares.read_your_writes import ReadYourWritesMiddleware
 from .settings import me_router as settings_me_router
 from .settings import router as settings_router
 from .wires import Container, build_container
@@ -279,6 +284,19 @@ async def _warmup_tag_catalog(container: Container) -> None:
             logger.warning("Tag catalog warmup failed", exc_info=exc)
 
 
+def _media_shutdown_hook(container: Container) -> ShutdownHook | None:
+    media = getattr(container, "media", None)
+    close = getattr(getattr(media, "variants", None), "close", None)
+    if not callable(close):
+        return None
+
+    async def _shutdown() -> None:
+        # Stops the image variant process pool so its workers do not outlive us.
+        close()
+
+    return _shutdown
+
+
 def create_lifespan(
     settings: Settings,
     *,
@@ -312,12 +330,19 @@ def create_lifespan(
 
         try:
             if container is not None:
+                media_hook = _media_shutdown_hook(container)
+                if media_hook is not None:
+                    shutdown_callbacks.append(media_hook)
                 await _warmup_tag_catalog(container)
                 await _warmup_search(container)
             try:
                 shutdown_callbacks.append(await start_events_relay(app))
             except Exception as exc:
                 logger.exception("Failed to start events relay", exc_info=exc)
+            try:
+                shutdown_callbacks.append(await start_metrics_flush(app))
+            except Exception as exc:
+                logger.exception("Failed to start fleet metrics flush", exc_info=exc)
             try:
                 shutdown_callbacks.extend(await _setup_rate_limiter(sapp, settings))
             except Exception as exc:
@@ -339,6 +364,7 @@ def create_lifespan(
 def _register_exception_handlers(app: FastAPI) -> None:
     app.add_exception_handler(ApiError, _api_error_handler)
     app.add_exception_handler(RequestValidationError, _validation_error_handler)
+    app.add_exception_handler(IdempotentReplay, idempotent_replay_handler)
 
 
 def _register_health_routes(app: FastAPI, settings: Settings) -> None:
@@ -454,6 +480,7 @@ def _register_core_routers(app: FastAPI, settings: Settings, contour: str) -> No
     )
     from domains.product.quests.api.http import make_router as quests_router
     from domains.product.referrals.api.http import make_router as referrals_router
+    from domains.product.site.api import make_public_router as site_public_router
     from domains.product.site.api import make_router as site_router
     from domains.product.tags.api.http import make_router as tags_router
     from domains.product.worlds.api.http import make_router as worlds_router
@@ -499,7 +526,7 @@ def _register_core_routers(app: FastAPI, settings: Settings, contour: str) -> No
     if settings.navigation_enabled:
         public_specs.append(navigation_router)
     if settings.content_enabled:
-        public_specs.extend([content_router, home_public_router])
+        public_specs.extend([content_router, home_public_router, site_public_router])
     if settings.ai_enabled:
         public_specs.append(ai_router)
     if settings.achievements_enabled:
@@ -699,6 +726,9 @@ def create_app(
         contour=effective_contour,
         settings=settings,
     )
+    app.add_middleware(IdempotencyMiddleware)
+    app.add_middleware(QueryStatsMiddleware)
+    app.add_middleware(ReadYourWritesMiddleware)
     _register_core_routers(app, settings, effective_contour)
     _prune_routes(app, effective_contour)
     _register_health_routes(app, settings)
@@ -1,81 +1,202 @@
+"""HTTP request metrics as a pure ASGI middleware.
+
+The route template is read from ``scope["route"]`` after the router has run,
+so ``/nodes/abc/next`` is recorded as ``/nodes/{slug}/next``. Requests that
+match no route share the ``unmatched`` label, and templates beyond
+``MAX_TRACKED_ROUTES`` share ``other``. Duration runs until the last body
+chunk has been handed to the server, so streaming responses are timed in
+full.
+"""
+
 from __future__ import annotations
 
 import logging
 import time
-from collections.abc import Callable
 from typing import Any
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from domains.platform.telemetry.domain.metrics import trace_exemplar
 
 logger = logging.getLogger(__name__)
 
 try:
-    from prometheus_client import Counter, Histogram  # type: ignore
+    from prometheus_client import REGISTRY, Counter, Gauge, Histogram  # type: ignore
 except ImportError:  # pragma: no cover
-    Counter = Histogram = None  # type: ignore
+    REGISTRY = Counter = Gauge = Histogram = None  # type: ignore
 
 HTTP_REQUESTS: Any | None = None
 HTTP_REQUEST_DURATION: Any | None = None
+HTTP_RESPONSE_SIZE: Any | None = None
+HTTP_IN_FLIGHT: Any | None = None
+
+# Route templates beyond this many distinct values share the "other" label.
+MAX_TRACKED_ROUTES = 500
+UNMATCHED = "unmatched"
+OTHER = "other"
+_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+
+
+def _existing(name: str) -> Any | None:
+    registry: Any | None = REGISTRY
+    if registry is None:
+        return None
+    return getattr(registry, "_names_to_collectors", {}).get(name)
+
+
+def _build_counter(name: str, documentation: str, *, labelnames: tuple[str, ...]) -> Any | None:
+    try:
+        return Counter(name, documentation, labelnames=labelnames)
+    except ValueError:
+        # Already registered, e.g. this module was imported under another path.
+        return _existing(name)
+
+
+def _build_histogram(
+    name: str,
+    documentation: str,
+    *,
+    labelnames: tuple[str, ...],
+    buckets: tuple[float, ...],
+) -> Any | None:
+    try:
+        return Histogram(name, documentation, labelnames=labelnames, buckets=buckets)
+    except ValueError:
+        return _existing(name)
+
+
+def _build_gauge(name: str, documentation: str, *, labelnames: tuple[str, ...]) -> Any | None:
+    try:
+        return Gauge(name, documentation, labelnames=labelnames)
+    except ValueError:
+        return _existing(name)
 
 
 def _ensure_metrics() -> None:
-    global HTTP_REQUESTS, HTTP_REQUEST_DURATION
+    global HTTP_REQUESTS, HTTP_REQUEST_DURATION, HTTP_RESPONSE_SIZE, HTTP_IN_FLIGHT
     if HTTP_REQUESTS is not None and HTTP_REQUEST_DURATION is not None:
         return
-    if Counter is None or Histogram is None:
+    if Counter is None or Gauge is None or Histogram is None:
         return
-    HTTP_REQUESTS = Counter(
+    HTTP_REQUESTS = _build_counter(
         "http_requests_total",
         "Total HTTP requests",
         labelnames=("method", "path", "status"),
     )
-    HTTP_REQUEST_DURATION = Histogram(
+    HTTP_REQUEST_DURATION = _build_histogram(
         "http_request_duration_ms",
-        "HTTP request duration in milliseconds",
-        labelnames=("method", "path"),
+        "HTTP request duration in milliseconds, until the last body chunk",
+        labelnames=("method", "path", "status_class"),
         buckets=(1, 2, 5, 10, 20, 50, 100, 200, 300, 500, 750, 1000, 2000, 5000),
     )
+    HTTP_RESPONSE_SIZE = _build_histogram(
+        "http_response_size_bytes",
+        "HTTP response body size in bytes",
+        labelnames=("method", "path"),
+        buckets=(128, 512, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216),
+    )
+    HTTP_IN_FLIGHT = _build_gauge(
+        "http_requests_in_flight",
+        "HTTP requests currently being served",
+        labelnames=("method",),
+    )
 
 
-def _route_template(request: Request) -> str:
-    try:
-        route = request.scope.get("route")
-        return (
-            getattr(route, "path", None)
-            or getattr(route, "path_format", None)
-            or request.url.path
-        )
-    except AttributeError:
-        return request.url.path
+def _content_length(message: Message | None) -> int:
+    for name, value in (message or {}).get("headers", ()):
+        if name.lower() == b"content-length":
+            try:
+                return int(value)
+            except ValueError:
+                return 0
+    return 0
+
+
+class HTTPMetricsMiddleware:
+    """Record latency, response size, status and in-flight requests by route."""
+
+    def __init__(self, app: ASGIApp, *, max_routes: int = MAX_TRACKED_ROUTES) -> None:
+        self.app = app
+        self.max_routes = max_routes
+        self._routes: set[str] = set()
+        # (method, path, status) -> (requests, duration, size) label children
+        self._series: dict[tuple[str, str, int], tuple[Any, Any, Any]] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or HTTP_REQUESTS is None or HTTP_IN_FLIGHT is None:
+            await self.app(scope, receive, send)
+            return
+        method = scope.get("method", "GET")
+        if method not in _METHODS:
+            method = "OTHER"
+        status = 500
+        size = 0
+        finished: float | None = None
+        start_message: Message | None = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status, size, finished, start_message
+            kind = message["type"]
+            if kind == "http.response.start":
+                status = message["status"]
+                start_message = message
+            await send(message)
+            if kind == "http.response.body":
+                size += len(message.get("body", b""))
+                if not message.get("more_body", False):
+                    finished = time.perf_counter()
+            elif kind == "http.response.pathsend":
+                size = _content_length(start_message)
+                finished = time.perf_counter()
+
+        in_flight = HTTP_IN_FLIGHT.labels(method)
+        in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed_ms = ((finished or time.perf_counter()) - started) * 1000.0
+            in_flight.dec()
+            try:
+                self._record(scope, method, status, size, elapsed_ms)
+            except (ValueError, RuntimeError):
+                logger.exception("Failed to record HTTP metrics for %s", scope.get("path"))
+
+    def _path(self, scope: Scope) -> str:
+        route = scope.get("route")
+        template = getattr(route, "path_format", None) or getattr(route, "path", None)
+        if not template:
+            return UNMATCHED
+        if template not in self._routes:
+            if len(self._routes) >= self.max_routes:
+                return OTHER
+            self._routes.add(template)
+        return template
+
+    def _record(self, scope: Scope, method: str, status: int, size: int, ms: float) -> None:
+        path = self._path(scope)
+        key = (method, path, status)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = (
+                HTTP_REQUESTS.labels(method, path, str(status)),  # type: ignore[union-attr]
+                HTTP_REQUEST_DURATION.labels(  # type: ignore[union-attr]
+                    method, path, f"{status // 100}xx"
+                ),
+                HTTP_RESPONSE_SIZE.labels(method, path),  # type: ignore[union-attr]
+            )
+        requests, duration, response_size = series
+        requests.inc()
+        duration.observe(ms, trace_exemplar())
+        response_size.observe(size)
 
 
 def setup_http_metrics(app: FastAPI) -> None:
     _ensure_metrics()
-    if Counter is None or Histogram is None:
+    if HTTP_REQUESTS is None:
         return
+    app.add_middleware(HTTPMetricsMiddleware)
 
-    @app.middleware("http")
-    async def _metrics_middleware(request: Request, call_next: Callable):  # type: ignore[override]
-        method = request.method
-        path = _route_template(request)
-        t0 = time.perf_counter()
-        status = "500"
-        try:
-            response = await call_next(request)
-            status = str(getattr(response, "status_code", 200))
-            return response
-        finally:
-            dt_ms = (time.perf_counter() - t0) * 1000.0
-            counter = HTTP_REQUESTS
-            duration = HTTP_REQUEST_DURATION
-            if counter is not None and duration is not None:
-                try:
-                    counter.labels(method=method, path=path, status=status).inc()
-                    duration.labels(method=method, path=path).observe(dt_ms)
-                except (ValueError, RuntimeError):
-                    logger.exception(
-                        "Failed to record HTTP metrics for %s %s", method, path
-                    )
-
-
-__all__ = ["setup_http_metrics"]
+
+__all__ = ["HTTPMetricsMiddleware", "MAX_TRACKED_ROUTES", "setup_http_metrics"]
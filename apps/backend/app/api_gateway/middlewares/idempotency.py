@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..idempotency import IDEMPOTENCY_STATE_KEY, MAX_STORED_BODY_BYTES
+
+logger = logging.getLogger(__name__)
+
+
+class IdempotencyMiddleware:
+    """Capture responses of requests that reserved an ``Idempotency-Key``.
+
+    ``require_idempotency_key`` leaves a reservation in ``scope["state"]``;
+    once the response has been sent it is stored for replay, or the key is
+    released when the handler failed with a 5xx so the client may retry.
+    Bodies above ``max_body_bytes`` are stored as status only, without
+    headers or body, so retries get a 409 instead of a corrupt replay.
+    """
+
+    def __init__(self, app: ASGIApp, *, max_body_bytes: int = MAX_STORED_BODY_BYTES) -> None:
+        self.app = app
+        self._max_body_bytes = int(max_body_bytes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        state: dict[str, Any] = scope.setdefault("state", {})
+        status_code: int | None = None
+        headers: list[tuple[str, str]] = []
+        chunks: list[bytes] = []
+        size = 0
+        truncated = False
+
+        async def _send(message: Message) -> None:
+            nonlocal status_code, size, truncated
+            if state.get(IDEMPOTENCY_STATE_KEY) is not None:
+                if message["type"] == "http.response.start":
+                    status_code = int(message["status"])
+                    headers[:] = [
+                        (name.decode("latin-1"), value.decode("latin-1"))
+                        for name, value in message.get("headers", [])
+                    ]
+                elif message["type"] == "http.response.body" and not truncated:
+                    body = message.get("body", b"")
+                    size += len(body)
+                    if size > self._max_body_bytes:
+                        truncated = True
+                        chunks.clear()
+                    else:
+                        chunks.append(body)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, _send)
+        except BaseException:
+            reservation = state.get(IDEMPOTENCY_STATE_KEY)
+            if reservation is not None:
+                await asyncio.shield(self._release(reservation))
+            raise
+
+        reservation = state.get(IDEMPOTENCY_STATE_KEY)
+        if reservation is None:
+            return
+        if status_code is None or status_code >= 500:
+            await self._release(reservation)
+            return
+        try:
+            if truncated:
+                await reservation.complete(status_code, [], None)
+            else:
+                await reservation.complete(status_code, headers, b"".join(chunks))
+        except Exception as exc:
+            logger.warning("Failed to store idempotent response: %s", exc)
+
+    @staticmethod
+    async def _release(reservation: Any) -> None:
+        try:
+            await reservation.release()
+        except Exception as exc:
+            logger.warning("Failed to release idempotency key: %s", exc)
+
+
+__all__ = ["IdempotencyMiddleware"]
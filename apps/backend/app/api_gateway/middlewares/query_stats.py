@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from packages.core.db_queries import STATEMENTS_PER_REQUEST, track_queries
+
+
+def _route_template(scope: Scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or getattr(route, "path_format", None) or "unmatched"
+
+
+class QueryStatsMiddleware:
+    """Count the SQL statements each HTTP request runs.
+
+    Opens a ``track_queries`` block per request so the engine listeners in
+    ``packages.core.db_queries`` can attribute statements (and N+1 warnings)
+    to it, then records ``db_statements_per_request`` by route template.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        label = f"{scope.get('method', 'GET')} {scope.get('path', '')}"
+        with track_queries(label) as stats:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                if STATEMENTS_PER_REQUEST is not None:
+                    STATEMENTS_PER_REQUEST.labels(path=_route_template(scope)).observe(
+                        stats.statements
+                    )
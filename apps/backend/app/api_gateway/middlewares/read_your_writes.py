@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import math
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import cookie_parser
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from packages.core.db_replicas import replica_router, use_primary
+
+COOKIE_NAME = "db_primary_until"
+_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def _pinned_by_cookie(scope: Scope) -> bool:
+    for key, value in scope.get("headers") or ():
+        if key != b"cookie":
+            continue
+        raw = cookie_parser(value.decode("latin-1")).get(COOKIE_NAME)
+        try:
+            return raw is not None and float(raw) > time.time()
+        except ValueError:
+            return False
+    return False
+
+
+class ReadYourWritesMiddleware:
+    """Keep a client on the primary for a short window after it writes.
+
+    Requests with an unsafe method run pinned to the primary; a successful one
+    sets a ``db_primary_until`` cookie for ``DATABASE_READ_YOUR_WRITES_SECONDS``
+    so the client's next reads skip replicas (in every worker process) until
+    replication has had time to catch up. A no-op when no replica is configured.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        router = replica_router()
+        if scope["type"] != "http" or not router.enabled:
+            await self.app(scope, receive, send)
+            return
+        writes = scope.get("method", "GET") not in _SAFE_METHODS
+        if not writes and not _pinned_by_cookie(scope):
+            await self.app(scope, receive, send)
+            return
+        window = router.settings.read_your_writes_seconds
+
+        async def send_wrapper(message: Message) -> None:
+            if (
+                writes
+                and window > 0
+                and message["type"] == "http.response.start"
+                and message["status"] < 400
+            ):
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "set-cookie",
+                    f"{COOKIE_NAME}={time.time() + window:.3f}; Max-Age={math.ceil(window)}; "
+                    "Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        with use_primary():
+            await self.app(scope, receive, send_wrapper)
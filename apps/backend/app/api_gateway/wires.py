@@ -14,6 +14,12 @@ from domains.platform.events.adapters.outbox_memory import InMemoryOutbox
 from domains.platform.worker.wires import (
     build_container as build_worker_queue_container,
 )
+from domains.product.nodes.adapters.admin_stats_events import (
+    ADMIN_STATS_TOPICS as NODE_ADMIN_STATS_TOPICS,
+)
+from domains.product.nodes.adapters.cache_events import (
+    CACHE_BATCH_TOPICS as NODE_CACHE_BATCH_TOPICS,
+)
 from domains.product.nodes.infrastructure.cache import (
     InMemoryNodeCache,
     NodeCacheConfig,
@@ -104,6 +110,13 @@ EmbeddingClient = container_registry.resolve("product.nodes.EmbeddingClient")
 register_embedding_worker = container_registry.resolve(
     "product.nodes.register_embedding_worker"
 )
+NodeAdminStatsFactory = container_registry.resolve("product.nodes.SQLAdminStats")
+register_node_admin_stats_events = container_registry.resolve(
+    "product.nodes.register_admin_stats_events"
+)
+register_node_cache_invalidation = container_registry.resolve(
+    "product.nodes.register_cache_invalidation"
+)
 NodeViewsService = container_registry.resolve("product.nodes.NodeViewsService")
 NodeReactionsService = container_registry.resolve("product.nodes.NodeReactionsService")
 NodeCommentsService = container_registry.resolve("product.nodes.NodeCommentsService")
@@ -130,6 +143,13 @@ DddAchievementsService = container_registry.resolve("product.achievements.Servic
 DddAchievementsAdminService = container_registry.resolve(
     "product.achievements.AdminService"
 )
+AchievementCountersFactory = container_registry.resolve(
+    "product.achievements.CounterStore"
+)
+AchievementRuleEngine = container_registry.resolve("product.achievements.RuleEngine")
+register_achievement_rules = container_registry.resolve(
+    "product.achievements.register_rules"
+)
 
 WorldsRepoFactory = container_registry.resolve("product.worlds.SQLRepo")
 DddWorldsService = container_registry.resolve("product.worlds.Service")
@@ -138,6 +158,16 @@ ReferralsRepoFactory = container_registry.resolve("product.referrals.SQLRepo")
 DddReferralsService = container_registry.resolve("product.referrals.Service")
 
 DddPremiumService = container_registry.resolve("product.premium.Service")
+PremiumEntitlementsRepoFactory = container_registry.resolve(
+    "product.premium.EntitlementsRepo"
+)
+PremiumEntitlementsCache = container_registry.resolve("product.premium.EntitlementsCache")
+PremiumSharedCacheFactory = container_registry.resolve(
+    "product.premium.SharedEntitlementsCache"
+)
+register_premium_billing_events = container_registry.resolve(
+    "product.premium.register_billing_events"
+)
 
 QuestsRepoFactory = container_registry.resolve("product.quests.SQLRepo")
 QuestsService = container_registry.resolve("product.quests.Service")
@@ -187,6 +217,7 @@ class Container:
     ai_registry: Any
     achievements_service: Any
     achievements_admin: Any
+    achievement_rules: Any
     worlds_service: Any
     referrals_service: Any
     referrals_repo: Any
@@ -256,6 +287,11 @@ def build_container(
     topics = [t.strip() for t in str(settings.event_topics).split(",") if t.strip()]
     if "node.embedding.requested.v1" not in topics:
         topics.append("node.embedding.requested.v1")
+    if "billing.plan.changed.v1" not in topics:
+        topics.append("billing.plan.changed.v1")
+    for topic in (*NODE_ADMIN_STATS_TOPICS, *NODE_CACHE_BATCH_TOPICS):
+        if topic not in topics:
+            topics.append(topic)
     if test_mode:
         outbox = InMemoryOutbox()
         bus = InMemoryEventBus()
@@ -388,6 +424,10 @@ def build_container(
         cache=node_cache,
     )
     register_embedding_worker(events, nodes)
+    node_admin_stats = NodeAdminStatsFactory(settings)
+    if node_admin_stats is not None:
+        register_node_admin_stats_events(events, node_admin_stats)
+    register_node_cache_invalidation(events, node_cache)
 
     # Tags service based on usage store
     tags_repo = TagsRepoFactory(settings, store=tag_usage_store)
@@ -480,6 +520,10 @@ def build_container(
     ach_repo = AchievementsRepoFactory(settings)
     achievements_service = DddAchievementsService(ach_repo, outbox=outbox)
     achievements_admin = DddAchievementsAdminService(ach_repo, outbox=outbox)
+    achievement_rules = AchievementRuleEngine(
+        ach_repo, AchievementCountersFactory(settings), outbox=outbox
+    )
+    register_achievement_rules(events, achievement_rules, topics)
 
     # Worlds
     worlds_repo = WorldsRepoFactory(settings)
@@ -490,13 +534,22 @@ def build_container(
     referrals_service = DddReferralsService(referrals_repo, outbox=outbox)
 
     # Premium
-    premium_service = DddPremiumService()
+    quota = build_quota_container(settings)
+    premium_service = DddPremiumService(
+        repo=PremiumEntitlementsRepoFactory(settings),
+        cache=PremiumEntitlementsCache(
+            ttl_seconds=settings.premium_entitlements_local_ttl_seconds,
+            max_entries=settings.premium_entitlements_local_max_entries,
+        ),
+        shared_cache=PremiumSharedCacheFactory(settings),
+        quota=quota.service,
+    )
+    register_premium_billing_events(events, premium_service)
 
     # Moderation
     _mod_repo = ModerationRepoFactory(settings)
     moderation_service = DddModerationService(_mod_repo, outbox=outbox)
     telemetry = build_telemetry_container(settings)
-    quota = build_quota_container(settings)
     # Wire notifications: channels + event subscriptions
     if settings.notify_webhook_url:
         register_webhook_channel(str(settings.notify_webhook_url))
@@ -557,6 +610,7 @@ def build_container(
         ai_registry=ai_registry,
         achievements_service=achievements_service,
         achievements_admin=achievements_admin,
+        achievement_rules=achievement_rules,
         worlds_service=worlds_service,
         referrals_service=referrals_service,
         referrals_repo=referrals_repo,
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
+from domains.platform.telemetry.application.fleet_metrics_service import (
+    FleetMetrics,
+    FleetView,
+)
 from domains.platform.telemetry.application.metrics_registry import llm_metrics
 from domains.platform.telemetry.application.worker_metrics_service import worker_metrics
 
@@ -12,17 +17,59 @@ def _safe_iso(value: datetime | None) -> str | None:
     return value.isoformat() if value else None
 
 
+def _job_counts(snapshot: dict[str, Any]) -> tuple[int, int, float]:
+    jobs = snapshot.get("jobs", {}) or {}
+    completed = int(jobs.get("completed", jobs.get("succeeded", 0)))
+    failed = int(jobs.get("failed", 0))
+    total = completed + failed
+    return completed, failed, (failed / total) if total else 0.0
+
+
 @dataclass
 class MetricsProbe:
+    """Worker and LLM signals; fleet-wide when ``fleet`` has a shared store."""
+
+    fleet: FleetMetrics | None = None
+
+    async def collect(self) -> FleetView | None:
+        if self.fleet is None:
+            return None
+        return await asyncio.to_thread(self.fleet.collect)
+
+    def _process_signals(self, view: FleetView) -> list[dict[str, Any]]:
+        signals: list[dict[str, Any]] = []
+        for item in view.instances:
+            snapshot = view.for_instance(item, "worker").snapshot()
+            completed, failed, failure_rate = _job_counts(snapshot)
+            status = "warning" if item.stale else "healthy"
+            signals.append(
+                {
+                    "id": f"process:{item.instance}",
+                    "label": f"{item.role} · {item.host}:{item.pid or '?'}",
+                    "status": status,
+                    "ok": not item.stale,
+                    "stale": item.stale,
+                    "role": item.role,
+                    "jobs_completed": completed,
+                    "jobs_failed": failed,
+                    "failure_rate": failure_rate,
+                    "flush_ms": item.flush_ms,
+                    "last_heartbeat": _safe_iso(item.last_flush),
+                    "hint": (
+                        f"No metrics flush for {int(item.age_s)}s."
+                        if item.stale
+                        else "Metrics flushed to the fleet store."
+                    ),
+                }
+            )
+        return signals
+
     def worker_signals(
-        self, collected_at: str
+        self, collected_at: str, view: FleetView | None = None
     ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
-        snapshot = worker_metrics.snapshot()
-        jobs = snapshot.get("jobs", {}) or {}
-        completed = int(jobs.get("completed", jobs.get("succeeded", 0)))
-        failed = int(jobs.get("failed", 0))
-        total = completed + failed
-        failure_rate = (failed / total) if total else 0.0
+        metrics = view.merged("worker") if view is not None else worker_metrics
+        snapshot = metrics.snapshot()
+        completed, failed, failure_rate = _job_counts(snapshot)
         status = "healthy"
         if failure_rate >= 0.2:
             status = "critical"
@@ -41,16 +88,21 @@ class MetricsProbe:
             "last_heartbeat": collected_at,
             "hint": "Async workers delivering jobs.",
         }
-        summary = {
+        summary: dict[str, Any] = {
             "worker_avg_ms": float(snapshot.get("job_avg_ms") or 0.0),
             "worker_failure_rate": failure_rate,
         }
-        return [signal], summary
+        if view is None or not view.shared:
+            return [signal], summary
+        summary["processes_total"] = len(view.instances)
+        summary["processes_stale"] = len(view.stale)
+        return [signal, *self._process_signals(view)], summary
 
     def llm_signals(
-        self, collected_at: str
+        self, collected_at: str, view: FleetView | None = None
     ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
-        snapshot = llm_metrics.snapshot()
+        metrics = view.merged("llm") if view is not None else llm_metrics
+        snapshot = metrics.snapshot()
         calls = snapshot.get("calls", []) or []
         success = sum(
             int(item.get("count", 0))
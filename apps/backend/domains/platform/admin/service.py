@@ -125,11 +125,12 @@ class AdminService:
         collected_at = datetime.now(UTC)
         db_signal, queue_signal = await self._collect_db_and_queue()
         redis_signal = await self.redis_probe.ping()
+        fleet = await self.metrics_probe.collect()
         worker_signals, worker_summary = self.metrics_probe.worker_signals(
-            _safe_iso(collected_at) or ""
+            _safe_iso(collected_at) or "", fleet
         )
         llm_signals, llm_summary = self.metrics_probe.llm_signals(
-            _safe_iso(collected_at) or ""
+            _safe_iso(collected_at) or "", fleet
         )
         incidents = await self._collect_incident_data()
 
@@ -242,6 +243,8 @@ class AdminService:
             "queue_status": queue_signal.get("status"),
             "worker_avg_ms": worker_summary.get("worker_avg_ms"),
             "worker_failure_rate": worker_summary.get("worker_failure_rate"),
+            "processes_total": worker_summary.get("processes_total"),
+            "processes_stale": worker_summary.get("processes_stale"),
             "llm_success_rate": llm_summary.get("llm_success_rate"),
             "active_incidents": len(incidents.get("active", [])),
         }
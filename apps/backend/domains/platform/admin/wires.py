@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from domains.platform.telemetry.wires import build_fleet_metrics
 from packages.core.config import Settings
 
 from .adapters.database import DatabaseProbe
@@ -22,7 +23,7 @@ def build_container(settings: Settings) -> AdminContainer:
     redis_probe = RedisProbe(
         redis_url=str(settings.redis_url) if settings.redis_url else None
     )
-    metrics_probe = MetricsProbe()
+    metrics_probe = MetricsProbe(fleet=build_fleet_metrics(settings))
     service = AdminService(
         settings=settings,
         database_probe=db_probe,
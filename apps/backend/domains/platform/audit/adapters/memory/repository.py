@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import time
+import uuid
+from datetime import datetime
 
 from domains.platform.audit.domain.audit import AuditEntry
 from domains.platform.audit.ports.repo import AuditLogRepository
@@ -21,6 +23,7 @@ class InMemoryAuditRepo(AuditLogRepository):
 
     async def add(self, entry: AuditEntry) -> None:
         row = {
+            "id": str(uuid.uuid4()),
             "ts": int(time.time() * 1000),
             "actor_id": str(entry.actor_id) if entry.actor_id else None,
             "action": entry.action,
@@ -117,5 +120,36 @@ class InMemoryAuditRepo(AuditLogRepository):
         end = start + max(int(limit), 0)
         return data[start:end]
 
+    async def list_after(
+        self,
+        *,
+        after: tuple[datetime, str] | None = None,
+        limit: int = 1000,
+        actions: list[str] | None = None,
+        actor_id: str | None = None,
+        date_from: str | None = None,
+        date_to: str | None = None,
+        resource_types: list[str] | None = None,
+        modules: list[str] | None = None,
+        search: str | None = None,
+    ) -> list[dict]:
+        data = await self.list(
+            limit=len(self._items),
+            actions=actions,
+            actor_id=actor_id,
+            date_from=date_from,
+            date_to=date_to,
+            resource_types=resource_types,
+            modules=modules,
+            search=search,
+        )
+        data.sort(key=lambda d: (int(d.get("ts", 0)), str(d.get("id"))), reverse=True)
+        if after is not None:
+            position = (round(after[0].timestamp() * 1000), str(after[1]))
+            data = [
+                d for d in data if (int(d.get("ts", 0)), str(d.get("id"))) < position
+            ]
+        return data[: max(int(limit), 0)]
+
 
 __all__ = ["InMemoryAuditRepo"]
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import logging
+from datetime import datetime
 from typing import Any
 
 from sqlalchemy import text
@@ -81,54 +82,18 @@ class SQLAuditRepo(AuditLogRepository):
         modules: list[str] | None = None,
         search: str | None = None,
     ) -> list[dict]:
-        base = (
-            "SELECT id, actor_id, action, resource_type, resource_id, workspace_id, before, after, override, reason, ip, user_agent, created_at, extra "
-            "FROM audit_logs"
+        where, params = _build_filters(
+            actions=actions,
+            actor_id=actor_id,
+            date_from=date_from,
+            date_to=date_to,
+            resource_types=resource_types,
+            modules=modules,
+            search=search,
         )
-        where: list[str] = []
-        params: dict[str, Any] = {
-            "limit": int(max(limit, 0)),
-            "offset": int(max(offset, 0)),
-        }
-        if actions:
-            acts = [str(a).strip() for a in actions if a and str(a).strip()]
-            if acts:
-                clause = []
-                for idx, action in enumerate(acts):
-                    key = f"act_{idx}"
-                    clause.append(f"action = :{key}")
-                    params[key] = action
-                where.append("(" + " OR ".join(clause) + ")")
-        if actor_id:
-            where.append("actor_id = :actor_id")
-            params["actor_id"] = str(actor_id)
-        if date_from:
-            where.append("created_at >= :date_from")
-            params["date_from"] = date_from
-        if date_to:
-            where.append("created_at <= :date_to")
-            params["date_to"] = date_to
-        if resource_types:
-            rt = [str(r).strip() for r in resource_types if r and str(r).strip()]
-            if rt:
-                where.append("resource_type = ANY(:resource_types)")
-                params["resource_types"] = rt
-        if modules:
-            mods = [str(m).strip() for m in modules if m and str(m).strip()]
-            if mods:
-                mod_clauses = []
-                for idx, mod in enumerate(mods):
-                    key = f"module_{idx}"
-                    mod_clauses.append(f"action = :{key} OR action LIKE :{key}_like")
-                    params[key] = mod
-                    params[f"{key}_like"] = f"{mod}.%"
-                where.append("(" + " OR ".join(mod_clauses) + ")")
-        if search:
-            needle = f"%{search.strip()}%"
-            where.append(
-                "(action ILIKE :search OR resource_id ILIKE :search OR resource_type ILIKE :search OR reason ILIKE :search OR ip ILIKE :search OR user_agent ILIKE :search)"
-            )
-            params["search"] = needle
+        params["limit"] = int(max(limit, 0))
+        params["offset"] = int(max(offset, 0))
+        base = _SELECT_SQL
         if where:
             base += " WHERE " + " AND ".join(where)
         base += " ORDER BY created_at DESC, id DESC LIMIT :limit OFFSET :offset"
@@ -138,5 +103,107 @@ class SQLAuditRepo(AuditLogRepository):
             rows = res.mappings().all()
             return [dict(row) for row in rows]
 
+    async def list_after(
+        self,
+        *,
+        after: tuple[datetime, str] | None = None,
+        limit: int = 1000,
+        actions: list[str] | None = None,
+        actor_id: str | None = None,
+        date_from: str | None = None,
+        date_to: str | None = None,
+        resource_types: list[str] | None = None,
+        modules: list[str] | None = None,
+        search: str | None = None,
+    ) -> list[dict]:
+        """Keyset page in ``(created_at DESC, id DESC)`` order.
+
+        Unlike ``OFFSET`` paging every page costs the same index range scan,
+        so exports of any size read the table exactly once.
+        """
+
+        where, params = _build_filters(
+            actions=actions,
+            actor_id=actor_id,
+            date_from=date_from,
+            date_to=date_to,
+            resource_types=resource_types,
+            modules=modules,
+            search=search,
+        )
+        if after is not None:
+            where.append(
+                "(created_at, id) < (:after_created_at, cast(:after_id as uuid))"
+            )
+            params["after_created_at"] = after[0]
+            params["after_id"] = str(after[1])
+        params["limit"] = int(max(limit, 0))
+        base = _SELECT_SQL
+        if where:
+            base += " WHERE " + " AND ".join(where)
+        base += " ORDER BY created_at DESC, id DESC LIMIT :limit"
+        async with self._engine.connect() as conn:
+            res = await conn.execute(text(base), params)
+            return [dict(row) for row in res.mappings().all()]
+
+
+_SELECT_SQL = (
+    "SELECT id, actor_id, action, resource_type, resource_id, workspace_id, before, after, override, reason, ip, user_agent, created_at, extra "
+    "FROM audit_logs"
+)
+
+
+def _build_filters(
+    *,
+    actions: list[str] | None,
+    actor_id: str | None,
+    date_from: str | None,
+    date_to: str | None,
+    resource_types: list[str] | None,
+    modules: list[str] | None,
+    search: str | None,
+) -> tuple[list[str], dict[str, Any]]:
+    where: list[str] = []
+    params: dict[str, Any] = {}
+    if actions:
+        acts = [str(a).strip() for a in actions if a and str(a).strip()]
+        if acts:
+            clause = []
+            for idx, action in enumerate(acts):
+                key = f"act_{idx}"
+                clause.append(f"action = :{key}")
+                params[key] = action
+            where.append("(" + " OR ".join(clause) + ")")
+    if actor_id:
+        where.append("actor_id = :actor_id")
+        params["actor_id"] = str(actor_id)
+    if date_from:
+        where.append("created_at >= :date_from")
+        params["date_from"] = date_from
+    if date_to:
+        where.append("created_at <= :date_to")
+        params["date_to"] = date_to
+    if resource_types:
+        rt = [str(r).strip() for r in resource_types if r and str(r).strip()]
+        if rt:
+            where.append("resource_type = ANY(:resource_types)")
+            params["resource_types"] = rt
+    if modules:
+        mods = [str(m).strip() for m in modules if m and str(m).strip()]
+        if mods:
+            mod_clauses = []
+            for idx, mod in enumerate(mods):
+                key = f"module_{idx}"
+                mod_clauses.append(f"action = :{key} OR action LIKE :{key}_like")
+                params[key] = mod
+                params[f"{key}_like"] = f"{mod}.%"
+            where.append("(" + " OR ".join(mod_clauses) + ")")
+    if search:
+        needle = f"%{search.strip()}%"
+        where.append(
+            "(action ILIKE :search OR resource_id ILIKE :search OR resource_type ILIKE :search OR reason ILIKE :search OR ip ILIKE :search OR user_agent ILIKE :search)"
+        )
+        params["search"] = needle
+    return where, params
 
 __all__ = ["SQLAuditRepo"]
@@ -1,14 +1,32 @@
 from __future__ import annotations
 
 from collections import Counter
-from datetime import UTC, datetime
-from io import StringIO
 from typing import Any
 
-from fastapi import APIRouter, Depends, Query, Request
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request
+from fastapi.responses import FileResponse, StreamingResponse
 
 from app.api_gateway.routers import get_container
+from domains.platform.audit.application.export import (
+    EXPORT_MEDIA_TYPES,
+    AuditExportFilters,
+    AuditExportJob,
+    InvalidExportCursor,
+    accepts_gzip,
+    export_filename,
+)
+from domains.platform.audit.application.export import (
+    infer_result as _infer_result,
+)
+from domains.platform.audit.application.export import (
+    normalize_row as _normalize_row,
+)
+from domains.platform.audit.application.export import (
+    safe_json as _safe_json,
+)
+from domains.platform.audit.application.export import (
+    split_action as _split_action,
+)
 from domains.platform.iam.security import csrf_protect, require_admin
 from packages.fastapi_rate_limit import optional_rate_limiter
 
@@ -19,56 +37,6 @@ def _parse_csv(value: str | None) -> list[str]:
     return [chunk.strip() for chunk in value.split(",") if chunk.strip()]
 
 
-def _normalize_row(row: dict[str, Any]) -> dict[str, Any]:
-    if row.get("created_at") is None:
-        ts = row.get("ts")
-        if isinstance(ts, (int, float)):
-            row["created_at"] = datetime.fromtimestamp(
-                float(ts) / 1000.0, tz=UTC
-            ).isoformat()
-    elif isinstance(row.get("created_at"), datetime):
-        row["created_at"] = row["created_at"].astimezone(UTC).isoformat()
-    return row
-
-
-def _safe_json(value: Any) -> Any:
-    if value is None:
-        return None
-    if isinstance(value, (dict, list)):
-        return value
-    try:
-        import json
-
-        return json.loads(value)
-    except (ValueError, TypeError):
-        return value
-
-
-def _split_action(action: str) -> tuple[str, str]:
-    if not action:
-        return "unknown", "unknown"
-    parts = action.split(".")
-    if len(parts) == 1:
-        return parts[0], parts[0]
-    return parts[0], ".".join(parts[1:])
-
-
-def _infer_result(action: str, extra: Any) -> str:
-    lowered = action.lower()
-    failure_markers = ["fail", "failed", "error", "denied", "rejected"]
-    if any(marker in lowered for marker in failure_markers):
-        return "failure"
-    if isinstance(extra, dict):
-        err = extra.get("error") or extra.get("status")
-        if (
-            err
-            and isinstance(err, str)
-            and err.lower() in {"error", "failed", "denied"}
-        ):
-            return "failure"
-    return "success"
-
-
 def _resource_label(row: dict[str, Any]) -> str:
     rtype = row.get("resource_type") or "resource"
     rid = row.get("resource_id") or ""
@@ -184,13 +152,45 @@ def make_router() -> APIRouter:
             },
         }
 
+    def _export_filters(
+        actions: list[str] | None,
+        action: str | None,
+        actor: str | None,
+        date_from: str | None,
+        date_to: str | None,
+        resource_type: str | None,
+        module: str | None,
+        search: str | None,
+    ) -> AuditExportFilters:
+        action_filters = list(actions or [])
+        if action:
+            action_filters.extend(_parse_csv(action))
+        return AuditExportFilters(
+            actions=tuple(action_filters),
+            actor_id=actor,
+            date_from=date_from,
+            date_to=date_to,
+            resource_types=tuple(_parse_csv(resource_type)),
+            modules=tuple(_parse_csv(module)),
+            search=search,
+        )
+
+    def _job_payload(job: AuditExportJob) -> dict[str, Any]:
+        data = job.to_dict()
+        data.pop("file_name", None)
+        if job.status == "completed":
+            data["download_url"] = f"/v1/audit/exports/{job.id}/download"
+        return data
+
     @router.get("/export")
     async def export_events(
         req: Request,
         export_format: str = Query(
-            default="json", pattern="^(json|csv)$", alias="format"
+            default="json", pattern="^(json|csv|ndjson)$", alias="format"
         ),
-        limit: int = Query(default=5000, ge=1, le=20000),
+        limit: int | None = Query(default=None, ge=1),
+        cursor: str | None = Query(default=None, max_length=256),
+        gzip: bool = Query(default=False),
         actions: list[str] | None = Query(default=None),
         action: str | None = Query(default=None),
         actor_id: str | None = Query(default=None),
@@ -203,80 +203,119 @@ def make_router() -> APIRouter:
         _admin: None = Depends(require_admin),
     ) -> Any:
         container = get_container(req)
-        repo = container.audit.repo
-        action_filters = list(actions or [])
-        if action:
-            action_filters.extend(_parse_csv(action))
-        resource_filters = _parse_csv(resource_type)
-        module_filters = _parse_csv(module)
-        items = await repo.list(
-            limit=int(limit),
-            offset=0,
-            actions=action_filters or None,
-            actor_id=actor or actor_id,
-            date_from=date_from,
-            date_to=date_to,
-            resource_types=resource_filters or None,
-            modules=module_filters or None,
-            search=search,
+        exports = container.audit.exports
+        filters = _export_filters(
+            actions,
+            action,
+            actor or actor_id,
+            date_from,
+            date_to,
+            resource_type,
+            module,
+            search,
         )
-        processed = []
-        for row in items:
-            normalized = _normalize_row(dict(row))
-            extra_obj = _safe_json(normalized.get("extra"))
-            before_obj = _safe_json(normalized.get("before"))
-            after_obj = _safe_json(normalized.get("after"))
-            module_name, verb = _split_action(str(normalized.get("action", "")))
-            processed.append(
-                {
-                    "id": str(normalized.get("id")),
-                    "created_at": normalized.get("created_at"),
-                    "actor_id": normalized.get("actor_id"),
-                    "action": normalized.get("action"),
-                    "module": module_name,
-                    "verb": verb,
-                    "resource_type": normalized.get("resource_type"),
-                    "resource_id": normalized.get("resource_id"),
-                    "reason": normalized.get("reason"),
-                    "ip": normalized.get("ip"),
-                    "user_agent": normalized.get("user_agent"),
-                    "before": before_obj,
-                    "after": after_obj,
-                    "extra": extra_obj,
-                    "result": _infer_result(
-                        str(normalized.get("action", "")), extra_obj
-                    ),
-                }
+        try:
+            position = exports.decode_cursor(cursor, filters)
+        except InvalidExportCursor as exc:
+            raise HTTPException(status_code=400, detail="invalid_cursor") from exc
+        compress = gzip or accepts_gzip(req.headers.get("accept-encoding"))
+        headers = {
+            "Cache-Control": "no-store",
+            "X-Accel-Buffering": "no",
+            "Vary": "Accept-Encoding",
+        }
+        if export_format != "json":
+            headers["Content-Disposition"] = (
+                f"attachment; filename={export_filename(export_format)}"
             )
-        if export_format == "json":
-            return JSONResponse(content={"items": processed})
-        columns = [
-            "id",
-            "created_at",
-            "actor_id",
-            "action",
-            "module",
-            "verb",
-            "resource_type",
-            "resource_id",
-            "result",
-            "reason",
-            "ip",
-            "user_agent",
-        ]
-        csv_buffer = StringIO()
-        import csv
+        if compress:
+            headers["Content-Encoding"] = "gzip"
+        return StreamingResponse(
+            exports.stream(
+                filters,
+                fmt=export_format,
+                cursor=position,
+                limit=limit,
+                compress=compress,
+            ),
+            media_type=EXPORT_MEDIA_TYPES[export_format],
+            headers=headers,
+        )
 
-        writer = csv.DictWriter(csv_buffer, fieldnames=columns)
-        writer.writeheader()
-        for row in processed:
-            flat = {key: row.get(key) for key in columns}
-            writer.writerow(flat)
-        response = PlainTextResponse(csv_buffer.getvalue())
-        response.headers["Content-Disposition"] = (
-            "attachment; filename=audit-export.csv"
+    @router.post("/exports", status_code=202)
+    async def create_export_job(
+        req: Request,
+        background: BackgroundTasks,
+        export_format: str = Query(
+            default="csv", pattern="^(json|csv|ndjson)$", alias="format"
+        ),
+        limit: int | None = Query(default=None, ge=1),
+        cursor: str | None = Query(default=None, max_length=256),
+        gzip: bool = Query(default=True),
+        actions: list[str] | None = Query(default=None),
+        action: str | None = Query(default=None),
+        actor_id: str | None = Query(default=None),
+        actor: str | None = Query(default=None),
+        date_from: str | None = Query(default=None, alias="from"),
+        date_to: str | None = Query(default=None, alias="to"),
+        resource_type: str | None = Query(default=None),
+        module: str | None = Query(default=None),
+        search: str | None = Query(default=None, alias="q"),
+        _admin: None = Depends(require_admin),
+        _csrf: None = Depends(csrf_protect),
+    ) -> dict[str, Any]:
+        container = get_container(req)
+        exports = container.audit.exports
+        filters = _export_filters(
+            actions,
+            action,
+            actor or actor_id,
+            date_from,
+            date_to,
+            resource_type,
+            module,
+            search,
+        )
+        try:
+            job = exports.create_job(
+                filters, fmt=export_format, cursor=cursor, limit=limit, compress=gzip
+            )
+        except InvalidExportCursor as exc:
+            raise HTTPException(status_code=400, detail="invalid_cursor") from exc
+        background.add_task(exports.run_job, job.id)
+        return _job_payload(job)
+
+    @router.get("/exports/{job_id}")
+    async def get_export_job(
+        req: Request,
+        job_id: str,
+        _admin: None = Depends(require_admin),
+    ) -> dict[str, Any]:
+        job = get_container(req).audit.exports.get_job(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="export_not_found")
+        return _job_payload(job)
+
+    @router.get("/exports/{job_id}/download")
+    async def download_export_job(
+        req: Request,
+        job_id: str,
+        _admin: None = Depends(require_admin),
+    ) -> FileResponse:
+        exports = get_container(req).audit.exports
+        job = exports.get_job(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="export_not_found")
+        if job.status != "completed":
+            raise HTTPException(status_code=409, detail="export_not_ready")
+        media_type = (
+            "application/gzip" if job.compress else EXPORT_MEDIA_TYPES[job.format]
+        )
+        return FileResponse(
+            exports.file_path(job),
+            media_type=media_type,
+            filename=export_filename(job.format, compress=job.compress),
         )
-        return response
 
     @router.post("")
     @router.post(
@@ -0,0 +1,709 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import csv
+import hashlib
+import json
+import logging
+import os
+import time
+import uuid
+import zlib
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, replace
+from datetime import UTC, datetime, timedelta
+from functools import cached_property
+from io import StringIO
+from pathlib import Path
+from typing import Any
+
+from domains.platform.audit.ports.repo import AuditLogRepository
+
+logger = logging.getLogger(__name__)
+
+EXPORT_COLUMNS: tuple[str, ...] = (
+    "id",
+    "created_at",
+    "actor_id",
+    "action",
+    "module",
+    "verb",
+    "resource_type",
+    "resource_id",
+    "result",
+    "reason",
+    "ip",
+    "user_agent",
+    "cursor",
+)
+
+EXPORT_MEDIA_TYPES: dict[str, str] = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+    "json": "application/json",
+}
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+# Manifest updates hold ``<job>.lock`` for a few file operations; a lock this
+# old was left behind by a process that died inside one.
+_LOCK_WAIT_SECONDS = 5.0
+_LOCK_STALE_SECONDS = 30.0
+
+
+class InvalidExportCursor(ValueError):
+    """Raised when a resume token is malformed or belongs to other filters."""
+
+
+class _LeaseLost(RuntimeError):
+    """The job was taken over; this run must not write its manifest or file."""
+
+
+def normalize_row(row: dict[str, Any]) -> dict[str, Any]:
+    if row.get("created_at") is None:
+        ts = row.get("ts")
+        if isinstance(ts, (int, float)):
+            row["created_at"] = datetime.fromtimestamp(
+                float(ts) / 1000.0, tz=UTC
+            ).isoformat()
+    elif isinstance(row.get("created_at"), datetime):
+        row["created_at"] = row["created_at"].astimezone(UTC).isoformat()
+    return row
+
+
+def safe_json(value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, (dict, list)):
+        return value
+    try:
+        return json.loads(value)
+    except (ValueError, TypeError):
+        return value
+
+
+def split_action(action: str) -> tuple[str, str]:
+    if not action:
+        return "unknown", "unknown"
+    parts = action.split(".")
+    if len(parts) == 1:
+        return parts[0], parts[0]
+    return parts[0], ".".join(parts[1:])
+
+
+def infer_result(action: str, extra: Any) -> str:
+    lowered = action.lower()
+    failure_markers = ["fail", "failed", "error", "denied", "rejected"]
+    if any(marker in lowered for marker in failure_markers):
+        return "failure"
+    if isinstance(extra, dict):
+        err = extra.get("error") or extra.get("status")
+        if (
+            err
+            and isinstance(err, str)
+            and err.lower() in {"error", "failed", "denied"}
+        ):
+            return "failure"
+    return "success"
+
+
+@dataclass(frozen=True)
+class AuditExportFilters:
+    actions: tuple[str, ...] = ()
+    actor_id: str | None = None
+    date_from: str | None = None
+    date_to: str | None = None
+    resource_types: tuple[str, ...] = ()
+    modules: tuple[str, ...] = ()
+    search: str | None = None
+
+    def as_kwargs(self) -> dict[str, Any]:
+        return {
+            "actions": list(self.actions) or None,
+            "actor_id": self.actor_id,
+            "date_from": self.date_from,
+            "date_to": self.date_to,
+            "resource_types": list(self.resource_types) or None,
+            "modules": list(self.modules) or None,
+            "search": self.search,
+        }
+
+    @cached_property
+    def digest(self) -> str:
+        payload = json.dumps(asdict(self), sort_keys=True, separators=(",", ":"))
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:8]
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> AuditExportFilters:
+        return cls(
+            actions=tuple(data.get("actions") or ()),
+            actor_id=data.get("actor_id"),
+            date_from=data.get("date_from"),
+            date_to=data.get("date_to"),
+            resource_types=tuple(data.get("resource_types") or ()),
+            modules=tuple(data.get("modules") or ()),
+            search=data.get("search"),
+        )
+
+
+@dataclass(frozen=True)
+class ExportCursor:
+    """Keyset position of the last exported row.
+
+    Encoded as ``<created_at µs>.<id>.<filters digest>`` in URL-safe base64 so
+    a token can only resume the export it was issued for.
+    """
+
+    created_at: datetime
+    id: str
+
+    def encode(self, filters: AuditExportFilters) -> str:
+        micros = (self.created_at.astimezone(UTC) - _EPOCH) // _MICROSECOND
+        raw = f"{micros}.{self.id}.{filters.digest}".encode("ascii")
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+    @classmethod
+    def decode(cls, token: str, filters: AuditExportFilters) -> ExportCursor:
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("ascii")
+            micros, row_id, digest = raw.split(".")
+            created_at = _EPOCH + int(micros) * _MICROSECOND
+        except (ValueError, UnicodeError) as exc:
+            raise InvalidExportCursor("malformed export cursor") from exc
+        if digest != filters.digest:
+            raise InvalidExportCursor("export cursor does not match filters")
+        return cls(created_at=created_at, id=row_id)
+
+    @classmethod
+    def from_row(cls, row: dict[str, Any]) -> ExportCursor:
+        created_at = row.get("created_at")
+        if not isinstance(created_at, datetime):
+            ts = row.get("ts")
+            created_at = (
+                datetime.fromtimestamp(float(ts) / 1000.0, tz=UTC)
+                if isinstance(ts, (int, float))
+                else _EPOCH
+            )
+        elif created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=UTC)
+        return cls(created_at=created_at, id=str(row.get("id")))
+
+
+def build_export_item(row: dict[str, Any], cursor: str) -> dict[str, Any]:
+    normalized = normalize_row(dict(row))
+    extra_obj = safe_json(normalized.get("extra"))
+    action = str(normalized.get("action", ""))
+    module_name, verb = split_action(action)
+    return {
+        "id": str(normalized.get("id")),
+        "created_at": normalized.get("created_at"),
+        "actor_id": normalized.get("actor_id"),
+        "action": normalized.get("action"),
+        "module": module_name,
+        "verb": verb,
+        "resource_type": normalized.get("resource_type"),
+        "resource_id": normalized.get("resource_id"),
+        "reason": normalized.get("reason"),
+        "ip": normalized.get("ip"),
+        "user_agent": normalized.get("user_agent"),
+        "before": safe_json(normalized.get("before")),
+        "after": safe_json(normalized.get("after")),
+        "extra": extra_obj,
+        "result": infer_result(action, extra_obj),
+        "cursor": cursor,
+    }
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+class _CsvEncoder:
+    def __init__(self) -> None:
+        self._buffer = StringIO()
+        self._writer = csv.writer(self._buffer)
+
+    def _drain(self) -> bytes:
+        data = self._buffer.getvalue().encode("utf-8")
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return data
+
+    def header(self) -> bytes:
+        self._writer.writerow(EXPORT_COLUMNS)
+        return self._drain()
+
+    def encode(self, items: Iterable[dict[str, Any]]) -> bytes:
+        self._writer.writerows(
+            [item.get(column) for column in EXPORT_COLUMNS] for item in items
+        )
+        return self._drain()
+
+    def footer(self) -> bytes:
+        return b""
+
+
+class _NdjsonEncoder:
+    def header(self) -> bytes:
+        return b""
+
+    def encode(self, items: Iterable[dict[str, Any]]) -> bytes:
+        return b"".join(
+            json.dumps(item, ensure_ascii=False, default=_json_default).encode("utf-8")
+            + b"\n"
+            for item in items
+        )
+
+    def footer(self) -> bytes:
+        return b""
+
+
+class _JsonEncoder:
+    """Streams the legacy ``{"items": [...]}`` document one batch at a time."""
+
+    def __init__(self) -> None:
+        self._first = True
+
+    def header(self) -> bytes:
+        return b'{"items":['
+
+    def encode(self, items: Iterable[dict[str, Any]]) -> bytes:
+        parts = []
+        for item in items:
+            encoded = json.dumps(item, ensure_ascii=False, default=_json_default)
+            parts.append(encoded if self._first else "," + encoded)
+            self._first = False
+        return "".join(parts).encode("utf-8")
+
+    def footer(self) -> bytes:
+        return b"]}"
+
+
+_ENCODERS: dict[str, Callable[[], Any]] = {
+    "csv": _CsvEncoder,
+    "ndjson": _NdjsonEncoder,
+    "json": _JsonEncoder,
+}
+
+
+def accepts_gzip(accept_encoding: str | None) -> bool:
+    """Whether an ``Accept-Encoding`` value allows gzip.
+
+    The value is parsed as comma-separated codings with optional ``q``
+    weights: ``gzip`` (or ``x-gzip``) counts unless weighted ``q=0``, and
+    ``*`` covers it when gzip is not listed.
+    """
+
+    wildcard = False
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        weight = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    weight = float(value.strip())
+                except ValueError:
+                    weight = 0.0
+        if coding in ("gzip", "x-gzip"):
+            return weight > 0
+        if coding == "*":
+            wildcard = weight > 0
+    return wildcard
+
+
+def export_filename(fmt: str, *, compress: bool = False) -> str:
+    name = f"audit-export.{fmt}"
+    return name + ".gz" if compress else name
+
+
+@dataclass
+class AuditExportJob:
+    id: str
+    format: str
+    compress: bool
+    filters: AuditExportFilters
+    created_at: datetime
+    status: str = "pending"
+    cursor: str | None = None
+    limit: int | None = None
+    rows: int = 0
+    bytes: int = 0
+    next_cursor: str | None = None
+    finished_at: datetime | None = None
+    error: str | None = None
+    lease_until: datetime | None = None
+    lease_token: str | None = None
+    file_name: str = field(default="")
+
+    def __post_init__(self) -> None:
+        if not self.file_name:
+            suffix = f".{self.format}.gz" if self.compress else f".{self.format}"
+            self.file_name = f"{self.id}{suffix}"
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["filters"] = asdict(self.filters)
+        data["created_at"] = self.created_at.isoformat()
+        data["finished_at"] = self.finished_at.isoformat() if self.finished_at else None
+        data["lease_until"] = self.lease_until.isoformat() if self.lease_until else None
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> AuditExportJob:
+        finished = data.get("finished_at")
+        lease = data.get("lease_until")
+        return cls(
+            id=str(data["id"]),
+            format=str(data["format"]),
+            compress=bool(data.get("compress")),
+            filters=AuditExportFilters.from_dict(data.get("filters") or {}),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            status=str(data.get("status", "pending")),
+            cursor=data.get("cursor"),
+            limit=data.get("limit"),
+            rows=int(data.get("rows", 0)),
+            bytes=int(data.get("bytes", 0)),
+            next_cursor=data.get("next_cursor"),
+            finished_at=datetime.fromisoformat(finished) if finished else None,
+            error=data.get("error"),
+            lease_until=datetime.fromisoformat(lease) if lease else None,
+            lease_token=data.get("lease_token"),
+            file_name=str(data.get("file_name") or ""),
+        )
+
+
+class AuditExportService:
+    """Streams audit rows page by page instead of materialising the export.
+
+    Rows are read with keyset pagination (``list_after``), so memory use is
+    bounded by ``batch_size`` regardless of the exported range. Large ranges
+    can be written to ``storage_dir`` as background jobs; every job has a JSON
+    manifest next to its data file so any API process can report its status.
+    A running job holds a lease renewed as batches are written; a job whose
+    lease expired lost its worker and is reported as failed, and ``run_job``
+    may take it over. Claims and manifest writes are compare-and-swap steps
+    under an ``O_EXCL`` lock file: a claim issues a new ``lease_token``, and a
+    worker whose token was replaced stops without touching the manifest or the
+    finished file.
+    """
+
+    def __init__(
+        self,
+        repo: AuditLogRepository,
+        *,
+        storage_dir: str | Path | None = None,
+        batch_size: int = 1000,
+        compress_level: int = 6,
+        lease_seconds: int = 300,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        self._repo = repo
+        self._storage_dir = Path(storage_dir) if storage_dir else None
+        self._batch_size = max(1, int(batch_size))
+        self._compress_level = int(compress_level)
+        self._lease = timedelta(seconds=max(1, int(lease_seconds)))
+        self._clock = clock or (lambda: datetime.now(UTC))
+
+    def decode_cursor(
+        self, token: str | None, filters: AuditExportFilters
+    ) -> ExportCursor | None:
+        if not token:
+            return None
+        return ExportCursor.decode(token, filters)
+
+    async def iter_batches(
+        self,
+        filters: AuditExportFilters,
+        *,
+        cursor: ExportCursor | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        remaining = limit
+        position = cursor
+        kwargs = filters.as_kwargs()
+        while remaining is None or remaining > 0:
+            page_size = (
+                self._batch_size
+                if remaining is None
+                else min(self._batch_size, remaining)
+            )
+            after = (position.created_at, position.id) if position else None
+            rows = await self._repo.list_after(after=after, limit=page_size, **kwargs)
+            if not rows:
+                return
+            items = []
+            for row in rows:
+                position = ExportCursor.from_row(row)
+                items.append(build_export_item(row, position.encode(filters)))
+            yield items
+            if remaining is not None:
+                remaining -= len(rows)
+            if len(rows) < page_size:
+                return
+
+    async def stream(
+        self,
+        filters: AuditExportFilters,
+        *,
+        fmt: str = "csv",
+        cursor: ExportCursor | None = None,
+        limit: int | None = None,
+        compress: bool = False,
+        on_batch: Callable[[list[dict[str, Any]]], None] | None = None,
+    ) -> AsyncIterator[bytes]:
+        encoder = _ENCODERS[fmt]()
+        compressor = (
+            zlib.compressobj(self._compress_level, zlib.DEFLATED, 31)
+            if compress
+            else None
+        )
+
+        def _out(data: bytes, *, final: bool = False) -> bytes:
+            if compressor is None:
+                return data
+            # Sync-flush each batch so clients receive bytes as they are read
+            # instead of waiting for the deflate window to fill.
+            flush_mode = zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH
+            return compressor.compress(data) + compressor.flush(flush_mode)
+
+        head = encoder.header()
+        if head:
+            yield _out(head)
+        async for items in self.iter_batches(filters, cursor=cursor, limit=limit):
+            if on_batch is not None:
+                on_batch(items)
+            yield _out(encoder.encode(items))
+        tail = _out(encoder.footer(), final=True)
+        if tail:
+            yield tail
+
+    def _require_storage(self) -> Path:
+        if self._storage_dir is None:
+            raise RuntimeError("audit export storage is not configured")
+        self._storage_dir.mkdir(parents=True, exist_ok=True)
+        return self._storage_dir
+
+    def _manifest_path(self, job_id: str) -> Path:
+        return self._require_storage() / f"{job_id}.json"
+
+    def file_path(self, job: AuditExportJob) -> Path:
+        return self._require_storage() / job.file_name
+
+    def _partial_path(self, job: AuditExportJob) -> Path:
+        target = self.file_path(job)
+        return target.with_name(f"{target.name}.{job.lease_token}.part")
+
+    @contextmanager
+    def _manifest_lock(self, job_id: str) -> Iterator[None]:
+        path = self._manifest_path(job_id).with_suffix(".lock")
+        deadline = time.monotonic() + _LOCK_WAIT_SECONDS
+        while True:
+            try:
+                os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                break
+            except FileExistsError:
+                try:
+                    if time.time() - path.stat().st_mtime > _LOCK_STALE_SECONDS:
+                        path.unlink(missing_ok=True)
+                        continue
+                except FileNotFoundError:
+                    continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"audit export {job_id} is locked") from None
+                time.sleep(0.01)
+        try:
+            yield
+        finally:
+            path.unlink(missing_ok=True)
+
+    def _update(self, job: AuditExportJob, **changes: Any) -> AuditExportJob:
+        """Write ``changes`` if ``job`` still holds the lease, else raise."""
+
+        with self._manifest_lock(job.id):
+            current = self._load(job.id)
+            if current is None or current.lease_token != job.lease_token:
+                raise _LeaseLost(job.id)
+            job = replace(job, **changes)
+            self._save(job)
+        return job
+
+    def _save(self, job: AuditExportJob) -> None:
+        path = self._manifest_path(job.id)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(job.to_dict()), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def _load(self, job_id: str) -> AuditExportJob | None:
+        try:
+            uuid.UUID(job_id)
+        except ValueError:
+            return None
+        path = self._manifest_path(job_id)
+        if not path.exists():
+            return None
+        return AuditExportJob.from_dict(json.loads(path.read_text(encoding="utf-8")))
+
+    def _stale(self, job: AuditExportJob) -> bool:
+        if job.status != "running":
+            return False
+        return job.lease_until is None or job.lease_until <= self._clock()
+
+    def get_job(self, job_id: str) -> AuditExportJob | None:
+        job = self._load(job_id)
+        if job is None or not self._stale(job):
+            return job
+        with self._manifest_lock(job.id):
+            job = self._load(job.id)
+            if job is None or not self._stale(job):
+                return job
+            logger.warning("audit_export_lease_expired", extra={"job_id": job.id})
+            self._partial_path(job).unlink(missing_ok=True)
+            job = replace(
+                job,
+                status="failed",
+                error="export_worker_lost",
+                lease_until=None,
+                lease_token=None,
+                finished_at=self._clock(),
+            )
+            self._save(job)
+        return job
+
+    def create_job(
+        self,
+        filters: AuditExportFilters,
+        *,
+        fmt: str = "csv",
+        cursor: str | None = None,
+        limit: int | None = None,
+        compress: bool = True,
+    ) -> AuditExportJob:
+        if cursor:
+            ExportCursor.decode(cursor, filters)
+        job = AuditExportJob(
+            id=str(uuid.uuid4()),
+            format=fmt,
+            compress=compress,
+            filters=filters,
+            created_at=self._clock(),
+            cursor=cursor,
+            limit=limit,
+        )
+        self._save(job)
+        return job
+
+    async def run_job(self, job_id: str) -> AuditExportJob:
+        if self._load(job_id) is None:
+            raise LookupError(job_id)
+        with self._manifest_lock(job_id):
+            job = self._load(job_id)
+            if job is None:
+                raise LookupError(job_id)
+            if job.status == "completed" or (
+                job.status == "running" and not self._stale(job)
+            ):
+                return job
+            job = replace(
+                job,
+                status="running",
+                error=None,
+                finished_at=None,
+                lease_until=self._clock() + self._lease,
+                lease_token=uuid.uuid4().hex,
+            )
+            self._save(job)
+        target = self.file_path(job)
+        partial = self._partial_path(job)
+        cursor = ExportCursor.decode(job.cursor, job.filters) if job.cursor else None
+        progress: dict[str, Any] = {"rows": 0, "cursor": None}
+        written = 0
+
+        def _track(items: list[dict[str, Any]]) -> None:
+            nonlocal job
+            progress["rows"] += len(items)
+            progress["cursor"] = items[-1]["cursor"]
+            now = self._clock()
+            if job.lease_until is None or job.lease_until - now < self._lease / 2:
+                job = self._update(job, rows=progress["rows"], lease_until=now + self._lease)
+
+        try:
+            handle = await asyncio.to_thread(partial.open, "wb")
+            try:
+                async for chunk in self.stream(
+                    job.filters,
+                    fmt=job.format,
+                    cursor=cursor,
+                    limit=job.limit,
+                    compress=job.compress,
+                    on_batch=_track,
+                ):
+                    await asyncio.to_thread(handle.write, chunk)
+                    written += len(chunk)
+            finally:
+                await asyncio.to_thread(handle.close)
+            with self._manifest_lock(job.id):
+                current = self._load(job.id)
+                if current is None or current.lease_token != job.lease_token:
+                    raise _LeaseLost(job.id)
+                os.replace(partial, target)
+                job = replace(
+                    job,
+                    status="completed",
+                    rows=progress["rows"],
+                    bytes=written,
+                    next_cursor=(
+                        progress["cursor"]
+                        if job.limit and progress["rows"] >= job.limit
+                        else None
+                    ),
+                    lease_until=None,
+                    lease_token=None,
+                    finished_at=self._clock(),
+                )
+                self._save(job)
+        except _LeaseLost:
+            logger.warning("audit_export_lease_lost", extra={"job_id": job.id})
+            partial.unlink(missing_ok=True)
+            return self._load(job.id) or job
+        except Exception as exc:
+            logger.exception("audit_export_failed", extra={"job_id": job.id})
+            partial.unlink(missing_ok=True)
+            try:
+                return self._update(
+                    job,
+                    status="failed",
+                    error=str(exc) or type(exc).__name__,
+                    lease_until=None,
+                    lease_token=None,
+                    finished_at=self._clock(),
+                )
+            except _LeaseLost:
+                return self._load(job.id) or job
+        return job
+
+
+__all__ = [
+    "EXPORT_COLUMNS",
+    "EXPORT_MEDIA_TYPES",
+    "AuditExportFilters",
+    "AuditExportJob",
+    "AuditExportService",
+    "ExportCursor",
+    "InvalidExportCursor",
+    "accepts_gzip",
+    "build_export_item",
+    "export_filename",
+    "infer_result",
+    "normalize_row",
+    "safe_json",
+    "split_action",
+]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Protocol
 
 from domains.platform.audit.domain.audit import AuditEntry
@@ -22,5 +23,19 @@ class AuditLogRepository(Protocol):
         search: str | None = None,
     ) -> list[dict]: ...
 
+    async def list_after(
+        self,
+        *,
+        after: tuple[datetime, str] | None = None,
+        limit: int = 1000,
+        actions: list[str] | None = None,
+        actor_id: str | None = None,
+        date_from: str | None = None,
+        date_to: str | None = None,
+        resource_types: list[str] | None = None,
+        modules: list[str] | None = None,
+        search: str | None = None,
+    ) -> list[dict]: ...
+
 
 __all__ = ["AuditLogRepository"]
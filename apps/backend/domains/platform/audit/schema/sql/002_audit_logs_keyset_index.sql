@@ -0,0 +1,3 @@
+-- Keyset pagination for audit exports: ORDER BY created_at DESC, id DESC
+-- with (created_at, id) < (:created_at, :id) walks this index without sorting.
+CREATE INDEX IF NOT EXISTS ix_audit_logs_created_at_id ON audit_logs (created_at DESC, id DESC);
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 
 from domains.platform.audit.adapters.memory.repository import InMemoryAuditRepo
 from domains.platform.audit.adapters.sql.repository import SQLAuditRepo
+from domains.platform.audit.application.export import AuditExportService
 from domains.platform.audit.application.service import AuditService
 from domains.platform.audit.ports.repo import AuditLogRepository
 from packages.core.config import Settings, load_settings, to_async_dsn
@@ -14,6 +15,7 @@ from packages.core.testing import is_test_mode
 class AuditContainer:
     repo: AuditLogRepository
     service: AuditService
+    exports: AuditExportService
 
 
 def _db_reachable(url: str) -> bool:
@@ -30,11 +32,21 @@ def _db_reachable(url: str) -> bool:
         return False
 
 
+def _build_exports(repo: AuditLogRepository, cfg: Settings) -> AuditExportService:
+    return AuditExportService(
+        repo,
+        storage_dir=cfg.audit_export_dir,
+        batch_size=cfg.audit_export_batch_size,
+    )
+
+
 def build_container(settings: Settings | None = None) -> AuditContainer:
     cfg = settings or load_settings()
     if is_test_mode(cfg):
         repo: AuditLogRepository = InMemoryAuditRepo()
-        return AuditContainer(repo=repo, service=AuditService(repo))
+        return AuditContainer(
+            repo=repo, service=AuditService(repo), exports=_build_exports(repo, cfg)
+        )
 
     raw_db_url = cfg.database_url_for_contour("ops")
     if not raw_db_url:
@@ -48,7 +60,9 @@ def build_container(settings: Settings | None = None) -> AuditContainer:
         dsn = dsn.split("?", 1)[0]
     repo = SQLAuditRepo(dsn)
     svc = AuditService(repo)
-    return AuditContainer(repo=repo, service=svc)
+    return AuditContainer(
+        repo=repo, service=svc, exports=_build_exports(repo, cfg)
+    )
 
 
 __all__ = ["AuditContainer", "build_container"]
@@ -13,6 +13,7 @@ from domains.platform.billing.metrics import (
 )
 from domains.platform.billing.ports import BillingAnalyticsRepo, JsonDict, JsonDictList
 from packages.core.db import get_async_engine
+from packages.core.db_schema import schema_capabilities
 
 logger = logging.getLogger(__name__)
 
@@ -312,20 +313,8 @@ class SQLBillingAnalyticsRepo(BillingAnalyticsRepo):
         return data
 
     async def _column_exists(self, conn, table_name: str, column_name: str) -> bool:
-        result = await conn.execute(
-            text(
-                """
-                SELECT 1
-                FROM information_schema.columns
-                WHERE table_schema = ANY (current_schemas(false))
-                  AND table_name = :table_name
-                  AND column_name = :column_name
-                LIMIT 1
-                """
-            ),
-            {"table_name": table_name, "column_name": column_name},
-        )
-        return result.scalar() is not None
+        caps = await schema_capabilities().get(conn)
+        return caps.has_column(table_name, column_name)
 
     async def _resolve_payment_amount_column(self, conn) -> str:
         if self._amount_column:
@@ -0,0 +1,5 @@
+-- Entitlement lookups (product.premium) pick the newest active subscription
+-- per user for many users at once.
+CREATE INDEX IF NOT EXISTS ix_user_subscriptions_active
+    ON user_subscriptions (user_id, created_at DESC)
+    WHERE status = 'active';
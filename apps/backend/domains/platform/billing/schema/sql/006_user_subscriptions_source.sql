@@ -0,0 +1,4 @@
+-- Rows written outside billing carry their owner (e.g. 'premium' for manual
+-- plan grants), so that module can end its own grants without touching paid
+-- subscriptions. Billing's own rows keep NULL.
+ALTER TABLE user_subscriptions ADD COLUMN IF NOT EXISTS source text NULL;
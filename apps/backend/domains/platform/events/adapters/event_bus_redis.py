@@ -1,11 +1,31 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import Any
 
 from domains.platform.events.logic.relay import RedisRelay
 from domains.platform.events.ports import EventBus, Handler
 
 
+def _fan_out(handlers: list[Handler]) -> Handler:
+    """Call every subscriber of a topic; the first failure is re-raised after all ran."""
+
+    if len(handlers) == 1:
+        return handlers[0]
+
+    def _dispatch(topic: str, payload: dict[str, Any]) -> None:
+        error: Exception | None = None
+        for handler in handlers:
+            try:
+                handler(topic, payload)
+            except Exception as exc:
+                error = error or exc
+        if error is not None:
+            raise error
+
+    return _dispatch
+
+
 class RedisEventBus(EventBus):
     def __init__(
         self,
@@ -22,10 +42,12 @@ class RedisEventBus(EventBus):
             consumer=consumer,
             redis_client=redis_client,
         )
+        self._handlers: dict[str, list[Handler]] = defaultdict(list)
         self._routes: dict[str, Handler] = {}
 
     def subscribe(self, topic: str, handler: Handler) -> None:
-        self._routes[topic] = handler
+        self._handlers[topic].append(handler)
+        self._routes[topic] = _fan_out(list(self._handlers[topic]))
 
     def run(self, block_ms: int | None = None, count: int | None = None) -> None:
         self._relay.loop(routes=self._routes, block_ms=block_ms, count=count)
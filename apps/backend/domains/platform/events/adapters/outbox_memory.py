@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 from collections import deque
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from typing import Any
 
-from domains.platform.events.ports import OutboxPublisher
+from domains.platform.events.ports import OutboxEvent, OutboxPublisher
 
 
 class InMemoryOutbox(OutboxPublisher):
@@ -18,6 +18,9 @@ class InMemoryOutbox(OutboxPublisher):
     ) -> None:
         self._events.append((topic, dict(payload), key))
 
+    def publish_many(self, events: Sequence[OutboxEvent]) -> None:
+        self._events.extend((topic, dict(payload), key) for topic, payload, key in events)
+
     def drain(self) -> Iterable[tuple[str, dict[str, Any], str | None]]:
         while self._events:
             yield self._events.popleft()
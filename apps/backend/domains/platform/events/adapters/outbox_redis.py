@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any
 
+from domains.platform.events.ports import OutboxEvent
 from packages.core.redis_outbox import RedisOutboxCore
 from packages.core.schema_registry import validate_event_payload
 
@@ -18,5 +20,13 @@ class RedisOutbox:
             raise ValueError(f"invalid event payload for {topic}") from exc
         self._core.publish(topic=topic, payload=payload, key=key)
 
+    def publish_many(self, events: Sequence[OutboxEvent]) -> None:
+        for topic, payload, _key in events:
+            try:
+                validate_event_payload(topic, payload)
+            except (ValueError, TypeError) as exc:
+                raise ValueError(f"invalid event payload for {topic}") from exc
+        self._core.publish_many(events)
+
 
 __all__ = ["RedisOutbox"]
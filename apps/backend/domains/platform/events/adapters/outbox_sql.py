@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Sequence
 from typing import Any
 
 from sqlalchemy import text
@@ -8,6 +9,13 @@ from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 from packages.core.db import get_async_engine
 
+_INSERT_SQL = text(
+    """
+    INSERT INTO outbox (topic, payload_json, dedup_key, status, attempts, next_retry_at)
+    VALUES (:topic, cast(:payload as jsonb), :key, 'NEW', 0, now())
+    """
+)
+
 
 class SQLOutbox:
     """Async SQL outbox publisher compatible with legacy `outbox` table.
@@ -30,24 +38,33 @@ class SQLOutbox:
             )
 
     async def publish(self, topic: str, payload: dict, key: str | None = None) -> None:
-        sql = text(
-            """
-            INSERT INTO outbox (topic, payload_json, dedup_key, status, attempts, next_retry_at)
-            VALUES (:topic, cast(:payload as jsonb), :key, 'NEW', 0, now())
-            """
-        )
         params: dict[str, Any] = {
             "topic": topic,
             "payload": json.dumps(payload),
             "key": key,
         }
+        await self._execute(params)
+
+    async def publish_many(
+        self, events: Sequence[tuple[str, dict, str | None]]
+    ) -> None:
+        """Insert all events with one executemany in a single transaction."""
+
+        params = [
+            {"topic": topic, "payload": json.dumps(payload), "key": key}
+            for topic, payload, key in events
+        ]
+        if params:
+            await self._execute(params)
+
+    async def _execute(self, params: dict[str, Any] | list[dict[str, Any]]) -> None:
         if self._session is not None:
-            await self._session.execute(sql, params)
+            await self._session.execute(_INSERT_SQL, params)
             return
         if self._engine is None:
             raise RuntimeError("outbox_engine_missing")
         async with self._engine.begin() as conn:
-            await conn.execute(sql, params)
+            await conn.execute(_INSERT_SQL, params)
 
 
 __all__ = ["SQLOutbox"]
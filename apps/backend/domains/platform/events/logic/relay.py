@@ -129,6 +129,7 @@ class RedisRelay:
                         getattr(handler, "__name__", "handler"),
                         ok,
                         elapsed_ms,
+                        exemplar={"msg_id": str(msg_id)},
                     )
                 except (RuntimeError, ValueError) as exc:
                     logger.debug(
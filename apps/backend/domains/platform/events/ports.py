@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import Any, Protocol, runtime_checkable
 
 # Topic name convention example: "profile.updated.v1"
 Handler = Callable[[str, dict[str, Any]], None]
+# (topic, payload, key) as accepted by ``publish_many``
+OutboxEvent = tuple[str, dict[str, Any], str | None]
 
 
 @runtime_checkable
@@ -14,10 +16,23 @@ class OutboxPublisher(Protocol):
     ) -> None: ...
 
 
+@runtime_checkable
+class BatchOutboxPublisher(Protocol):
+    """Outbox that can append many events in one round trip."""
+
+    def publish_many(self, events: Sequence[OutboxEvent]) -> None: ...
+
+
 @runtime_checkable
 class EventBus(Protocol):
     def subscribe(self, topic: str, handler: Handler) -> None: ...
     def run(self, block_ms: int | None = None, count: int | None = None) -> None: ...
 
 
-__all__ = ["OutboxPublisher", "EventBus", "Handler"]
+__all__ = [
+    "BatchOutboxPublisher",
+    "OutboxEvent",
+    "OutboxPublisher",
+    "EventBus",
+    "Handler",
+]
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import logging
+from collections import Counter
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 from domains.platform.events.ports import (
+    BatchOutboxPublisher,
     EventBus,
     Handler,
+    OutboxEvent,
     OutboxPublisher,
 )
 from domains.platform.telemetry.application.event_metrics_service import (
@@ -31,6 +35,23 @@ class Events:
             )
         self.outbox.publish(topic=topic, payload=payload, key=key)
 
+    # Publish several events in one outbox round trip when the outbox supports it
+    def publish_many(self, events: Sequence[OutboxEvent]) -> None:
+        if not events:
+            return
+        for topic, count in Counter(topic for topic, _, _ in events).items():
+            try:
+                event_metrics.inc(topic, count)
+            except (RuntimeError, ValueError) as exc:
+                logger.debug(
+                    "event_metrics_inc_failed", extra={"topic": topic}, exc_info=exc
+                )
+        if isinstance(self.outbox, BatchOutboxPublisher):
+            self.outbox.publish_many(events)
+            return
+        for topic, payload, key in events:
+            self.outbox.publish(topic=topic, payload=payload, key=key)
+
     # Subscribe handler to topic
     def on(self, topic: str, handler: Handler) -> None:
         self.bus.subscribe(topic, handler)
@@ -2,12 +2,10 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
-from threading import Lock
 
 from sqlalchemy import text
 from sqlalchemy.exc import ProgrammingError
 from sqlalchemy.ext.asyncio import AsyncEngine
-from sqlalchemy.pool import NullPool
 
 from domains.platform.iam.ports.credentials_port import AuthIdentity, CredentialsPort
 from packages.core.db import get_async_engine
@@ -30,11 +28,7 @@ class SQLCredentialsAdapter(CredentialsPort):
             self.engine_factory = lambda: get_async_engine(
                 "iam-credentials.repo",
                 url=dsn,
-                cache=False,
-                pool_pre_ping=False,
-                poolclass=NullPool,
             )
-        self._engine_lock = Lock()
         self._use_fallback = False
         self._primary_query = text(
             """
@@ -114,10 +108,8 @@ class SQLCredentialsAdapter(CredentialsPort):
         factory = self.engine_factory
         if factory is None:
             raise RuntimeError("credentials engine is not configured")
-        with self._engine_lock:
-            if self.engine is None:
-                self.engine = factory()
-            return self.engine
+        # Resolved per call: the registry keeps one shared pool per event loop.
+        return factory()
 
 
 __all__ = ["SQLCredentialsAdapter"]
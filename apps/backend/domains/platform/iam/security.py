@@ -14,6 +14,7 @@ from domains.platform.users.application.service import (
 )
 from packages.core.config import Settings, load_settings, to_async_dsn
 from packages.core.db import get_async_engine
+from packages.core.db_schema import schema_capabilities
 
 try:
     from jwt import PyJWTError  # type: ignore[attr-defined]
@@ -115,14 +116,8 @@ async def get_current_user(req: Request) -> dict[str, Any]:
                         raise RuntimeError("remote_database_access_disabled")
                     eng = get_async_engine("iam-security-check", url=dsn, future=True)
                     async with eng.begin() as conn:
-                        exists_tbl = (
-                            await conn.execute(
-                                text(
-                                    "SELECT 1 FROM information_schema.tables WHERE table_schema = current_schema() AND table_name = 'user_sanctions' LIMIT 1"
-                                )
-                            )
-                        ).first()
-                        if exists_tbl:
+                        caps = await schema_capabilities().get(conn)
+                        if caps.has_table("user_sanctions"):
                             banned = (
                                 await conn.execute(
                                     text(
@@ -133,7 +128,6 @@ async def get_current_user(req: Request) -> dict[str, Any]:
                             ).first()
                             if banned:
                                 raise HTTPException(status_code=403, detail="banned")
-                    await eng.dispose()
         except HTTPException:
             raise
         except (SQLAlchemyError, RuntimeError, ValueError) as exc:
@@ -1,39 +1,250 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import mimetypes
-import uuid
+import os
+import re
+import tempfile
+import threading
+from collections.abc import AsyncIterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from typing import BinaryIO
+from typing import Any, BinaryIO
+
+from domains.platform.media.ports.storage_port import StoredBlob, UploadTooLarge
+
+try:  # POSIX only; Windows dev boxes fall back to in-process locking
+    import fcntl
+except ImportError:  # pragma: no cover - platform specific
+    fcntl = None  # type: ignore[assignment]
+
+DEFAULT_CHUNK_SIZE = 256 * 1024
+
+_TMP_DIR = ".tmp"
+_REFS_DIR = ".refs"
+_EXTENSION = re.compile(r"^\.[a-z0-9]{1,10}$")
+_BLOB_NAME = re.compile(r"^[0-9a-f]{64}\.[a-z0-9]{1,10}$")
 
 
 class LocalStorageGateway:
-    """Local filesystem storage adapter.
+    """Content-addressed local filesystem storage.
 
-    Saves files under ``apps/apps/backend/var/uploads`` and returns URL path
-    ``/v1/media/file/<name>`` which is served by the media API router.
+    Blobs are stored as ``<base_dir>/<aa>/<bb>/<sha256><ext>`` and served by
+    the media API at ``/v1/media/file/<aa>/<bb>/<name>``. Uploads are written
+    to ``<base_dir>/.tmp`` chunk by chunk in a worker thread while being
+    hashed, then renamed into place, so identical content is stored once.
+    Every save increments a reference counter kept in ``<base_dir>/.refs``;
+    ``release`` decrements it and removes the blob when nothing refers to it.
     """
 
     def __init__(
         self,
         base_dir: str = "apps/backend/var/uploads",
         public_route_prefix: str = "/v1/media/file",
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
     ) -> None:
         self.base_dir = Path(base_dir)
         self.base_dir.mkdir(parents=True, exist_ok=True)
-        self.public_route_prefix = public_route_prefix
+        (self.base_dir / _TMP_DIR).mkdir(exist_ok=True)
+        (self.base_dir / _REFS_DIR).mkdir(exist_ok=True)
+        self.public_route_prefix = public_route_prefix.rstrip("/")
+        self.chunk_size = max(4096, int(chunk_size))
+        self._locks = [threading.Lock() for _ in range(64)]
+
+    # ------------------------------------------------------------------ paths
+
+    @staticmethod
+    def _extension(filename: str, content_type: str) -> str:
+        ext = mimetypes.guess_extension(content_type or "") or Path(filename).suffix
+        ext = (ext or "").lower()
+        return ext if _EXTENSION.match(ext) else ".bin"
+
+    def _blob_path(self, name: str) -> Path:
+        return self.base_dir / name[:2] / name[2:4] / name
+
+    def _refs_path(self, name: str) -> Path:
+        return self.base_dir / _REFS_DIR / name[:2] / f"{name}.json"
+
+    def url_for(self, name: str) -> str:
+        return f"{self.public_route_prefix}/{name[:2]}/{name[2:4]}/{name}"
+
+    def _name_from_url(self, url: str) -> str:
+        return url.rstrip("/").rsplit("/", 1)[-1]
+
+    # ---------------------------------------------------------------- locking
+
+    @contextmanager
+    def _locked(self, name: str) -> Iterator[None]:
+        lock = self._locks[int(name[:2], 16) % len(self._locks)]
+        with lock:
+            if fcntl is None:
+                yield
+                return
+            lock_path = self.base_dir / _REFS_DIR / f"{name[:2]}.lock"
+            lock_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(lock_path, "a+b") as handle:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def _read_refs(self, name: str) -> dict[str, Any]:
+        path = self._refs_path(name)
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _write_refs(self, name: str, data: dict[str, Any]) -> None:
+        path = self._refs_path(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp, path)
+
+    # ----------------------------------------------------------------- writes
+
+    def _open_temp(self) -> tuple[BinaryIO, Path]:
+        fd, raw_path = tempfile.mkstemp(dir=self.base_dir / _TMP_DIR, suffix=".part")
+        return os.fdopen(fd, "wb"), Path(raw_path)
+
+    @staticmethod
+    def _write_chunk(handle: BinaryIO, hasher: Any, chunk: bytes) -> None:
+        # hashlib and file writes release the GIL for large buffers.
+        hasher.update(chunk)
+        handle.write(chunk)
+
+    @staticmethod
+    def _discard(handle: BinaryIO, tmp_path: Path) -> None:
+        try:
+            handle.close()
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def _finalize(
+        self,
+        handle: BinaryIO,
+        tmp_path: Path,
+        digest: str,
+        size: int,
+        ext: str,
+        content_type: str,
+    ) -> StoredBlob:
+        handle.flush()
+        os.fsync(handle.fileno())
+        handle.close()
+        name = f"{digest}{ext}"
+        target = self._blob_path(name)
+        with self._locked(name):
+            if target.exists():
+                tmp_path.unlink(missing_ok=True)
+            else:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(tmp_path, target)
+            refs = self._read_refs(name)
+            count = int(refs.get("refs", 0)) + 1
+            self._write_refs(
+                name,
+                {"refs": count, "size": size, "content_type": content_type},
+            )
+        return StoredBlob(
+            url=self.url_for(name),
+            sha256=digest,
+            size=size,
+            content_type=content_type,
+            refs=count,
+        )
 
     def save(self, fileobj: BinaryIO, filename: str, content_type: str) -> str:
-        ext = mimetypes.guess_extension(content_type) or Path(filename).suffix or ".bin"
-        uid = uuid.uuid4().hex
-        # Two‑level sharding to avoid too many files in one dir
-        shard_a, shard_b = uid[:2], uid[2:4]
-        safe_name = f"{uid}{ext.lower()}"
-        target_dir = self.base_dir / shard_a / shard_b
-        target_dir.mkdir(parents=True, exist_ok=True)
-        target = target_dir / safe_name
-        with open(target, "wb") as f:
-            f.write(fileobj.read())
-        return f"{self.public_route_prefix}/{shard_a}/{shard_b}/{safe_name}"
-
-
-__all__ = ["LocalStorageGateway"]
+        """Blocking save used by synchronous callers; prefer ``save_stream``."""
+
+        handle, tmp_path = self._open_temp()
+        hasher = hashlib.sha256()
+        size = 0
+        try:
+            while chunk := fileobj.read(self.chunk_size):
+                size += len(chunk)
+                self._write_chunk(handle, hasher, chunk)
+            blob = self._finalize(
+                handle,
+                tmp_path,
+                hasher.hexdigest(),
+                size,
+                self._extension(filename, content_type),
+                content_type,
+            )
+        except BaseException:
+            self._discard(handle, tmp_path)
+            raise
+        return blob.url
+
+    async def save_stream(
+        self,
+        chunks: AsyncIterable[bytes],
+        filename: str,
+        content_type: str,
+        *,
+        max_bytes: int | None = None,
+    ) -> StoredBlob:
+        """Stream ``chunks`` to disk without blocking the event loop."""
+
+        handle, tmp_path = await asyncio.to_thread(self._open_temp)
+        hasher = hashlib.sha256()
+        size = 0
+        try:
+            async for chunk in chunks:
+                if not chunk:
+                    continue
+                size += len(chunk)
+                if max_bytes is not None and size > max_bytes:
+                    raise UploadTooLarge(max_bytes)
+                await asyncio.to_thread(self._write_chunk, handle, hasher, chunk)
+            return await asyncio.to_thread(
+                self._finalize,
+                handle,
+                tmp_path,
+                hasher.hexdigest(),
+                size,
+                self._extension(filename, content_type),
+                content_type,
+            )
+        except BaseException:
+            await asyncio.to_thread(self._discard, handle, tmp_path)
+            raise
+
+    # --------------------------------------------------------------- refcount
+
+    def refs(self, url: str) -> int:
+        name = self._name_from_url(url)
+        if not _BLOB_NAME.match(name):
+            return 0
+        return int(self._read_refs(name).get("refs", 0))
+
+    def _release(self, name: str) -> int:
+        if not _BLOB_NAME.match(name):
+            return 0
+        with self._locked(name):
+            refs = self._read_refs(name)
+            if not refs:
+                # Legacy uuid uploads carry no counter; never delete them here.
+                return 0
+            count = int(refs.get("refs", 0)) - 1
+            if count > 0:
+                refs["refs"] = count
+                self._write_refs(name, refs)
+                return count
+            self._blob_path(name).unlink(missing_ok=True)
+            self._refs_path(name).unlink(missing_ok=True)
+            return 0
+
+    async def release(self, url: str) -> int:
+        """Drop one reference to the blob behind ``url``; returns what is left."""
+
+        return await asyncio.to_thread(self._release, self._name_from_url(url))
+
+
+__all__ = ["DEFAULT_CHUNK_SIZE", "LocalStorageGateway"]
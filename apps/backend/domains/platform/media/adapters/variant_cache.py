@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+
+class VariantDiskCache:
+    """Size-bounded LRU cache of rendered variants on local disk.
+
+    Files live at ``<root>/<key[:2]>/<key>``. Recency is tracked in memory and
+    seeded from file mtimes on start-up; hits bump the mtime so a restarted
+    process keeps roughly the same order. When the total size exceeds
+    ``budget_bytes`` the least recently used variants are deleted — they are
+    derived data and will be re-rendered on demand.
+    """
+
+    def __init__(self, root: str | Path, *, budget_bytes: int) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.budget_bytes = max(0, int(budget_bytes))
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._total = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def path(self, key: str) -> Path:
+        return self.root / key[:2] / key
+
+    def _load(self) -> None:
+        found: list[tuple[float, str, int]] = []
+        for path in self.root.glob("*/*"):
+            if not path.is_file() or path.name.endswith(".tmp"):
+                continue
+            stat = path.stat()
+            found.append((stat.st_mtime, path.name, stat.st_size))
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._total += size
+
+    def get(self, key: str) -> Path | None:
+        path = self.path(key)
+        with self._lock:
+            if key in self._entries:
+                if not path.exists():
+                    # Evicted by another process sharing the directory.
+                    self._total -= self._entries.pop(key)
+                    return None
+                self._entries.move_to_end(key)
+            elif path.exists():
+                size = path.stat().st_size
+                self._entries[key] = size
+                self._total += size
+            else:
+                return None
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def put(self, key: str, data: bytes) -> Path:
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        with self._lock:
+            self._total -= self._entries.pop(key, 0)
+            self._entries[key] = len(data)
+            self._total += len(data)
+            self._evict_locked(keep=key)
+        return path
+
+    def _evict_locked(self, *, keep: str) -> None:
+        while self._total > self.budget_bytes and len(self._entries) > 1:
+            oldest = next(iter(self._entries))
+            if oldest == keep:
+                self._entries.move_to_end(oldest)
+                continue
+            self._total -= self._entries.pop(oldest)
+            self.path(oldest).unlink(missing_ok=True)
+
+
+__all__ = ["VariantDiskCache"]
@@ -1,22 +1,44 @@
 from __future__ import annotations
 
-import io
 import logging
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile
-from fastapi.responses import FileResponse
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+)
 
 from apps.backend.app.api_gateway.routers import get_container
 from domains.platform.iam.security import csrf_protect, get_current_user
+from domains.platform.media.api.serving import (
+    NO_STORE_CACHE_CONTROL,
+    MediaFileResponse,
+)
 from domains.platform.media.application.storage_service import (
     StorageService,
 )
+from domains.platform.media.application.variants import VariantUnavailable
+from domains.platform.media.ports.storage_port import UploadTooLarge
 from packages.fastapi_rate_limit import optional_rate_limiter
 
 logger = logging.getLogger(__name__)
 
+ALLOWED_CONTENT_TYPES = {"image/jpeg", "image/png", "image/webp"}
+
+
+async def _iter_upload(file: UploadFile, chunk_size: int) -> AsyncIterator[bytes]:
+    # UploadFile.read offloads to a thread once the spooled file hits disk.
+    while chunk := await file.read(chunk_size):
+        yield chunk
+
 
 def make_router() -> APIRouter:
     router = APIRouter(prefix="/v1", tags=["media"])
@@ -27,25 +49,45 @@ def make_router() -> APIRouter:
     )
     async def upload_media(
         req: Request,
+        background: BackgroundTasks,
         file: UploadFile = File(...),
         _csrf: None = Depends(csrf_protect),
         _claims: dict[str, Any] = Depends(get_current_user),
     ) -> dict[str, Any]:  # noqa: B008
         c = get_container(req)
-        if file.content_type not in {"image/jpeg", "image/png", "image/webp"}:
+        if file.content_type not in ALLOWED_CONTENT_TYPES:
             raise HTTPException(status_code=415, detail="unsupported_media_type")
-        data = await file.read()
-        if len(data) > 5 * 1024 * 1024:
-            raise HTTPException(status_code=413, detail="file_too_large")
-        url = StorageService(c.media.storage).save_file(
-            io.BytesIO(data), file.filename, file.content_type
-        )
-        return {"success": 1, "file": {"url": url}, "url": url}
+        storage = c.media.storage
+        chunk_size = int(getattr(storage, "chunk_size", 256 * 1024))
+        try:
+            blob = await StorageService(storage).save_upload(
+                _iter_upload(file, chunk_size),
+                file.filename or "upload",
+                file.content_type,
+                max_bytes=int(c.media.max_upload_bytes),
+            )
+        except UploadTooLarge as exc:
+            raise HTTPException(status_code=413, detail="file_too_large") from exc
+        url = blob.url
+        variants = c.media.variants
+        file_payload: dict[str, Any] = {
+            "url": url,
+            "sha256": blob.sha256,
+            "size": blob.size,
+        }
+        if variants.enabled:
+            name = url.removeprefix(storage.public_route_prefix).lstrip("/")
+            background.add_task(variants.pregenerate, name)
+            file_payload["variants"] = variants.urls(url)
+        return {"success": 1, "file": file_payload, "url": url}
 
-    @router.get("/media/file/{name:path}")
+    @router.api_route("/media/file/{name:path}", methods=["GET", "HEAD"])
     async def fetch_file(
-        req: Request, name: str, _claims: dict[str, Any] = Depends(get_current_user)
-    ) -> FileResponse:
+        req: Request,
+        name: str,
+        variant: str | None = Query(default=None, max_length=64),
+        _claims: dict[str, Any] = Depends(get_current_user),
+    ) -> MediaFileResponse:
         c = get_container(req)
         base = Path(c.media.upload_dir).resolve()
         candidate = (base / name).resolve()
@@ -55,10 +97,24 @@ def make_router() -> APIRouter:
         except ValueError as exc:
             logger.warning("media fetch rejected for invalid path %s: %s", name, exc)
             raise HTTPException(status_code=400, detail="invalid_path") from exc
+        if any(part.startswith(".") for part in candidate.relative_to(base).parts):
+            # .tmp uploads and .refs counters are internal to the storage.
+            raise HTTPException(status_code=404)
         file_path = candidate
-        if not file_path.exists():
+        if not file_path.is_file():
             raise HTTPException(status_code=404)
-        # Best-effort content-type guess
-        return FileResponse(str(file_path))
+        if variant:
+            variants = c.media.variants
+            if variant not in variants.presets:
+                raise HTTPException(status_code=400, detail="unknown_variant")
+            try:
+                variant_path, preset = await variants.get(name, variant)
+            except VariantUnavailable as exc:
+                # Non-image payloads or a missing Pillow: serve the original, but
+                # never let it be cached for good under the variant URL.
+                logger.debug("media variant %s unavailable for %s: %s", variant, name, exc)
+                return MediaFileResponse(file_path, cache_control=NO_STORE_CACHE_CONTROL)
+            return MediaFileResponse(variant_path, media_type=preset.media_type)
+        return MediaFileResponse(file_path)
 
     return router
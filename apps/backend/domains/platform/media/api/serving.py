@@ -0,0 +1,321 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import mimetypes
+import os
+import re
+import secrets
+import stat
+from email.utils import formatdate
+from pathlib import Path
+from typing import BinaryIO
+
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+IMMUTABLE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "private, no-cache"
+NO_STORE_CACHE_CONTROL = "private, no-store"
+
+CHUNK_SIZE = 256 * 1024
+MAX_RANGES = 16
+
+# Content-addressed blobs (<sha256>.<ext>) and their variants
+# (<sha256>.<preset>...<ext>) never change once written.
+_HASHED_NAME = re.compile(r"^[0-9a-f]{64}(\.[0-9a-z_.-]+)?$")
+_RANGE_SPEC = re.compile(r"^\s*(\d*)\s*-\s*(\d*)\s*$")
+
+
+class _Unsatisfiable(Exception):
+    pass
+
+
+def _read_at(handle: BinaryIO, count: int, offset: int) -> bytes:
+    if hasattr(os, "pread"):
+        return os.pread(handle.fileno(), count, offset)
+    handle.seek(offset)  # pragma: no cover - Windows
+    return handle.read(count)  # pragma: no cover - Windows
+
+
+def is_immutable_name(name: str) -> bool:
+    return bool(_HASHED_NAME.match(name))
+
+
+def strong_etag(path: Path) -> str | None:
+    if not is_immutable_name(path.name):
+        return None
+    return f'"{path.name.rsplit(".", 1)[0]}"'
+
+
+def _weak_etag(st: os.stat_result) -> str:
+    base = f"{st.st_mtime_ns}-{st.st_size}".encode()
+    return f'W/"{hashlib.md5(base, usedforsecurity=False).hexdigest()}"'
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """Weak comparison used by ``If-None-Match`` (RFC 9110 §13.1.2)."""
+
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in header.split(",")
+    )
+
+
+def parse_ranges(header: str, size: int) -> list[tuple[int, int]] | None:
+    """Parse a ``Range`` header into sorted, merged ``[start, end)`` pairs.
+
+    Returns ``None`` when the header should be ignored (unsupported unit,
+    malformed or too many ranges) so the full entity is sent with 200, and
+    raises ``_Unsatisfiable`` when no range overlaps the entity.
+    """
+
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or not spec:
+        return None
+    ranges: list[tuple[int, int]] = []
+    parts = spec.split(",")
+    if len(parts) > MAX_RANGES:
+        return None
+    for part in parts:
+        match = _RANGE_SPEC.match(part)
+        if match is None:
+            return None
+        first, last = match.groups()
+        if not first and not last:
+            return None
+        if not first:
+            suffix = int(last)
+            if suffix == 0:
+                continue
+            ranges.append((max(0, size - suffix), size))
+            continue
+        start = int(first)
+        end = min(int(last) + 1, size) if last else size
+        if last and int(last) < start:
+            return None
+        if start >= size:
+            continue
+        ranges.append((start, end))
+    if not ranges:
+        raise _Unsatisfiable()
+    ranges.sort()
+    merged = [ranges[0]]
+    for start, end in ranges[1:]:
+        prev_start, prev_end = merged[-1]
+        if start <= prev_end:
+            merged[-1] = (prev_start, max(prev_end, end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class MediaFileResponse(Response):
+    """``FileResponse`` replacement tuned for content-addressed media.
+
+    * strong ETag from the content hash in the file name (weak mtime/size
+      ETag for legacy names) and ``immutable`` caching for hashed URLs unless
+      ``cache_control`` overrides it;
+    * ``If-None-Match`` → 304, ``If-Range`` honoured only for a strong match
+      or the exact ``Last-Modified`` date;
+    * single and multi-range 206 responses (``multipart/byteranges``);
+    * zero-copy transfer through the ASGI ``zerocopysend``/``pathsend``
+      extensions when the server offers them, ``os.pread`` in a worker thread
+      otherwise.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        media_type: str | None = None,
+        chunk_size: int = CHUNK_SIZE,
+        cache_control: str | None = None,
+    ) -> None:
+        self.path = Path(path)
+        self.cache_control = cache_control
+        self.status_code = 200
+        guessed = mimetypes.guess_type(self.path.name)[0]
+        self.media_type = media_type or guessed or "application/octet-stream"
+        self.background = None
+        self.chunk_size = chunk_size
+        self.init_headers(None)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        st = await asyncio.to_thread(os.stat, self.path)
+        if not stat.S_ISREG(st.st_mode):
+            raise RuntimeError(f"{self.path} is not a file")
+        size = st.st_size
+        etag = strong_etag(self.path)
+        immutable = etag is not None
+        etag = etag or _weak_etag(st)
+        last_modified = formatdate(st.st_mtime, usegmt=True)
+        cache_control = self.cache_control or (
+            IMMUTABLE_CACHE_CONTROL if immutable else REVALIDATE_CACHE_CONTROL
+        )
+        base_headers = [
+            (key, value)
+            for key, value in self.raw_headers
+            if key not in (b"content-type", b"content-length")
+        ]
+        base_headers += [
+            (b"etag", etag.encode("latin-1")),
+            (b"last-modified", last_modified.encode("latin-1")),
+            (b"cache-control", cache_control.encode("latin-1")),
+            (b"accept-ranges", b"bytes"),
+        ]
+        request = Headers(scope=scope)
+        head_only = scope.get("method", "GET").upper() == "HEAD"
+
+        if_none_match = request.get("if-none-match")
+        if if_none_match is not None and _etag_matches(if_none_match, etag):
+            await send(
+                {"type": "http.response.start", "status": 304, "headers": base_headers}
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        ranges: list[tuple[int, int]] | None = None
+        range_header = request.get("range")
+        if range_header is not None and size > 0:
+            if_range = request.get("if-range")
+            range_allowed = if_range is None or (
+                (if_range == etag and not etag.startswith("W/"))
+                or if_range == last_modified
+            )
+            if range_allowed:
+                try:
+                    ranges = parse_ranges(range_header, size)
+                except _Unsatisfiable:
+                    headers = [
+                        *base_headers,
+                        (b"content-range", f"bytes */{size}".encode()),
+                        (b"content-length", b"0"),
+                    ]
+                    await send(
+                        {"type": "http.response.start", "status": 416, "headers": headers}
+                    )
+                    await send({"type": "http.response.body", "body": b""})
+                    return
+
+        content_type = self.media_type.encode("latin-1")
+        if not ranges or ranges == [(0, size)]:
+            headers = [
+                *base_headers,
+                (b"content-type", content_type),
+                (b"content-length", str(size).encode()),
+            ]
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            if head_only:
+                await send({"type": "http.response.body", "body": b""})
+                return
+            extensions = scope.get("extensions") or {}
+            if (
+                "http.response.pathsend" in extensions
+                and "http.response.zerocopysend" not in extensions
+            ):
+                await send({"type": "http.response.pathsend", "path": str(self.path)})
+                return
+            await self._send_ranges(scope, send, [(0, size)], [None], b"")
+            return
+
+        if len(ranges) == 1:
+            start, end = ranges[0]
+            headers = [
+                *base_headers,
+                (b"content-type", content_type),
+                (b"content-range", f"bytes {start}-{end - 1}/{size}".encode()),
+                (b"content-length", str(end - start).encode()),
+            ]
+            await send({"type": "http.response.start", "status": 206, "headers": headers})
+            if head_only:
+                await send({"type": "http.response.body", "body": b""})
+                return
+            await self._send_ranges(scope, send, ranges, [None], b"")
+            return
+
+        boundary = secrets.token_hex(16)
+        part_headers = [
+            (
+                f"\r\n--{boundary}\r\n"
+                f"Content-Type: {self.media_type}\r\n"
+                f"Content-Range: bytes {start}-{end - 1}/{size}\r\n\r\n"
+            ).encode("latin-1")
+            for start, end in ranges
+        ]
+        trailer = f"\r\n--{boundary}--\r\n".encode("latin-1")
+        length = (
+            sum(len(h) for h in part_headers)
+            + sum(end - start for start, end in ranges)
+            + len(trailer)
+        )
+        headers = [
+            *base_headers,
+            (
+                b"content-type",
+                f"multipart/byteranges; boundary={boundary}".encode("latin-1"),
+            ),
+            (b"content-length", str(length).encode()),
+        ]
+        await send({"type": "http.response.start", "status": 206, "headers": headers})
+        if head_only:
+            await send({"type": "http.response.body", "body": b""})
+            return
+        await self._send_ranges(scope, send, ranges, part_headers, trailer)
+
+    async def _send_ranges(
+        self,
+        scope: Scope,
+        send: Send,
+        ranges: list[tuple[int, int]],
+        part_headers: list[bytes | None],
+        trailer: bytes,
+    ) -> None:
+        zerocopy = "http.response.zerocopysend" in (scope.get("extensions") or {})
+        handle = await asyncio.to_thread(open, self.path, "rb", buffering=0)
+        try:
+            for (start, end), part_header in zip(ranges, part_headers, strict=True):
+                if part_header:
+                    await send(
+                        {"type": "http.response.body", "body": part_header, "more_body": True}
+                    )
+                if zerocopy:
+                    # The server hands the descriptor to sendfile(2).
+                    await send(
+                        {
+                            "type": "http.response.zerocopysend",
+                            "file": handle,
+                            "offset": start,
+                            "count": end - start,
+                            "more_body": True,
+                        }
+                    )
+                    continue
+                offset = start
+                while offset < end:
+                    count = min(self.chunk_size, end - offset)
+                    chunk = await asyncio.to_thread(_read_at, handle, count, offset)
+                    if not chunk:
+                        break
+                    offset += len(chunk)
+                    await send(
+                        {"type": "http.response.body", "body": chunk, "more_body": True}
+                    )
+            await send({"type": "http.response.body", "body": trailer, "more_body": False})
+        finally:
+            handle.close()
+
+
+__all__ = [
+    "IMMUTABLE_CACHE_CONTROL",
+    "NO_STORE_CACHE_CONTROL",
+    "REVALIDATE_CACHE_CONTROL",
+    "MediaFileResponse",
+    "is_immutable_name",
+    "parse_ranges",
+    "strong_etag",
+]
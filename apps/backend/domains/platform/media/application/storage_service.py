@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+import io
+from collections.abc import AsyncIterable
 from typing import BinaryIO
 
-from domains.platform.media.ports.storage_port import IStorageGateway
+from domains.platform.media.ports.storage_port import (
+    IStorageGateway,
+    StoredBlob,
+    UploadTooLarge,
+)
 
 
 class StorageService:
@@ -12,5 +19,44 @@ class StorageService:
     def save_file(self, fileobj: BinaryIO, filename: str, content_type: str) -> str:
         return self._storage.save(fileobj, filename, content_type)
 
+    async def save_bytes(self, content: bytes, filename: str, content_type: str) -> str:
+        """Save an in-memory payload without blocking the event loop."""
+
+        return await asyncio.to_thread(
+            self._storage.save, io.BytesIO(content), filename, content_type
+        )
+
+    async def save_upload(
+        self,
+        chunks: AsyncIterable[bytes],
+        filename: str,
+        content_type: str,
+        *,
+        max_bytes: int | None = None,
+    ) -> StoredBlob:
+        save_stream = getattr(self._storage, "save_stream", None)
+        if save_stream is not None:
+            return await save_stream(
+                chunks, filename, content_type, max_bytes=max_bytes
+            )
+        # Gateways without streaming support get a buffered, threaded save.
+        buffer = io.BytesIO()
+        async for chunk in chunks:
+            buffer.write(chunk)
+            if max_bytes is not None and buffer.tell() > max_bytes:
+                raise UploadTooLarge(max_bytes)
+        size = buffer.tell()
+        buffer.seek(0)
+        url = await asyncio.to_thread(
+            self._storage.save, buffer, filename, content_type
+        )
+        return StoredBlob(url=url, sha256="", size=size, content_type=content_type)
+
+    async def release_file(self, url: str) -> int:
+        release = getattr(self._storage, "release", None)
+        if release is None:
+            return 0
+        return await release(url)
+
 
 __all__ = ["StorageService"]
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import logging
+import re
+from collections.abc import Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from domains.platform.media.adapters.variant_cache import VariantDiskCache
+
+try:
+    from PIL import Image, ImageOps  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - optional dependency
+    Image = None  # type: ignore[assignment]
+    ImageOps = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Pillow raises these for truncated, non-image or oversized payloads.
+_DECODE_ERRORS: tuple[type[BaseException], ...] = (OSError, ValueError)
+if Image is not None:
+    _DECODE_ERRORS += (Image.DecompressionBombError,)
+
+# Bump when the rendering code changes output so stale variants get new keys.
+PIPELINE_VERSION = 1
+
+_SOURCE_NAME = re.compile(r"^[0-9a-zA-Z_-]{8,128}\.[a-z0-9]{1,10}$")
+_FORMAT_EXTENSIONS = {"webp": "webp", "jpeg": "jpg"}
+
+
+class VariantUnavailable(LookupError):
+    """Raised when a variant cannot be produced for the requested source."""
+
+
+@dataclass(frozen=True)
+class VariantPreset:
+    name: str
+    width: int
+    format: str = "webp"
+    quality: int = 80
+    eager: bool = False
+
+    @property
+    def extension(self) -> str:
+        return _FORMAT_EXTENSIONS[self.format]
+
+    @property
+    def media_type(self) -> str:
+        return f"image/{self.format}"
+
+
+DEFAULT_PRESETS: tuple[VariantPreset, ...] = (
+    VariantPreset("avatar-64", 64, eager=True),
+    VariantPreset("avatar-128", 128, eager=True),
+    VariantPreset("thumb-320", 320, eager=True),
+    VariantPreset("card-640", 640),
+    VariantPreset("full-1280", 1280),
+    VariantPreset("card-640-jpeg", 640, format="jpeg", quality=82),
+)
+
+
+def variant_key(source_name: str, preset: VariantPreset) -> str:
+    """Deterministic cache key: same source and preset parameters, same key."""
+
+    stem = source_name.rsplit(".", 1)[0]
+    return (
+        f"{stem}.{preset.name}.w{preset.width}.q{preset.quality}"
+        f".v{PIPELINE_VERSION}.{preset.extension}"
+    )
+
+
+def render_variant(source: str, width: int, fmt: str, quality: int) -> bytes:
+    """Resize and re-encode ``source``; runs inside the process pool.
+
+    Images are never upscaled, EXIF orientation is applied and metadata is
+    dropped. Transparent images rendered to JPEG are flattened on white.
+    """
+
+    if Image is None:
+        raise VariantUnavailable("Pillow is not installed")
+    with Image.open(source) as opened:
+        # JPEG decoders can downscale by 1/2..1/8 while decoding.
+        opened.draft("RGB", (width, width))
+        image = ImageOps.exif_transpose(opened)
+        if image.width > width:
+            height = max(1, round(image.height * width / image.width))
+            image = image.resize((width, height), Image.Resampling.LANCZOS)
+        if fmt == "jpeg":
+            if image.mode in ("RGBA", "LA", "P"):
+                rgba = image.convert("RGBA")
+                background = Image.new("RGB", rgba.size, (255, 255, 255))
+                background.paste(rgba, mask=rgba.getchannel("A"))
+                image = background
+            elif image.mode != "RGB":
+                image = image.convert("RGB")
+            options = {"quality": quality, "optimize": True, "progressive": True}
+        else:
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+            options = {"quality": quality, "method": 4}
+        buffer = io.BytesIO()
+        image.save(buffer, format=fmt.upper(), **options)
+        return buffer.getvalue()
+
+
+class ImageVariantService:
+    """Produces resized variants of stored images.
+
+    Rendering runs in a process pool so decoding and resampling never hold the
+    event loop or the GIL of the API process. Concurrent requests for the same
+    missing variant share one render (single-flight); results are kept in a
+    ``VariantDiskCache`` bounded by an LRU byte budget.
+    """
+
+    def __init__(
+        self,
+        base_dir: str | Path,
+        cache: VariantDiskCache,
+        *,
+        presets: Iterable[VariantPreset] = DEFAULT_PRESETS,
+        max_workers: int = 2,
+        executor: Executor | None = None,
+    ) -> None:
+        self._base_dir = Path(base_dir).resolve()
+        self.cache = cache
+        self.presets = {preset.name: preset for preset in presets}
+        self._max_workers = max(1, int(max_workers))
+        self._executor = executor
+        self._inflight: dict[str, asyncio.Future[Path]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return Image is not None
+
+    def _pool(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+        return self._executor
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def preset(self, name: str) -> VariantPreset:
+        try:
+            return self.presets[name]
+        except KeyError as exc:
+            raise VariantUnavailable(f"unknown preset {name}") from exc
+
+    def _source_path(self, name: str) -> Path:
+        candidate = (self._base_dir / name).resolve()
+        try:
+            relative = candidate.relative_to(self._base_dir)
+        except ValueError as exc:
+            raise VariantUnavailable("invalid source") from exc
+        hidden = any(part.startswith(".") for part in relative.parts)
+        if hidden or not _SOURCE_NAME.match(candidate.name):
+            raise VariantUnavailable("invalid source")
+        return candidate
+
+    def urls(self, url: str) -> dict[str, str]:
+        return {name: f"{url}?variant={name}" for name in self.presets}
+
+    async def get(self, name: str, preset_name: str) -> tuple[Path, VariantPreset]:
+        """Return the cached variant, rendering it once if it is missing."""
+
+        if not self.enabled:
+            raise VariantUnavailable("Pillow is not installed")
+        preset = self.preset(preset_name)
+        source = self._source_path(name)
+        key = variant_key(source.name, preset)
+        pending = self._inflight.get(key)
+        if pending is None:
+            cached = await asyncio.to_thread(self.cache.get, key)
+            if cached is not None:
+                return cached, preset
+            pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending), preset
+        future: asyncio.Future[Path] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            path = await self._render(source, key, preset)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Followers see the error; nobody else needs to retrieve it.
+            future.exception()
+            raise
+        else:
+            future.set_result(path)
+            return path, preset
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _render(self, source: Path, key: str, preset: VariantPreset) -> Path:
+        if not await asyncio.to_thread(source.is_file):
+            raise VariantUnavailable("source not found")
+        loop = asyncio.get_running_loop()
+        try:
+            data = await loop.run_in_executor(
+                self._pool(),
+                render_variant,
+                str(source),
+                preset.width,
+                preset.format,
+                preset.quality,
+            )
+        except _DECODE_ERRORS as exc:
+            raise VariantUnavailable("source is not a readable image") from exc
+        return await asyncio.to_thread(self.cache.put, key, data)
+
+    async def pregenerate(self, name: str) -> int:
+        """Render eager presets for a fresh upload; failures are only logged."""
+
+        if not self.enabled:
+            return 0
+        eager = [preset.name for preset in self.presets.values() if preset.eager]
+        results = await asyncio.gather(
+            *(self.get(name, preset) for preset in eager), return_exceptions=True
+        )
+        failures = [r for r in results if isinstance(r, BaseException)]
+        if failures:
+            logger.warning(
+                "media variant pregeneration failed for %s: %s", name, failures[0]
+            )
+        return len(results) - len(failures)
+
+
+__all__ = [
+    "DEFAULT_PRESETS",
+    "PIPELINE_VERSION",
+    "ImageVariantService",
+    "VariantPreset",
+    "VariantUnavailable",
+    "render_variant",
+    "variant_key",
+]
@@ -1,10 +1,51 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterable
+from dataclasses import dataclass
 from typing import BinaryIO, Protocol
 
 
+class UploadTooLarge(ValueError):
+    """Raised when a streamed upload exceeds the configured size limit."""
+
+    def __init__(self, max_bytes: int) -> None:
+        super().__init__(f"upload exceeds {max_bytes} bytes")
+        self.max_bytes = max_bytes
+
+
+@dataclass(frozen=True)
+class StoredBlob:
+    url: str
+    sha256: str
+    size: int
+    content_type: str
+    refs: int = 1
+
+    @property
+    def deduplicated(self) -> bool:
+        return self.refs > 1
+
+
 class IStorageGateway(Protocol):
     def save(self, fileobj: BinaryIO, filename: str, content_type: str) -> str: ...
 
 
-__all__ = ["IStorageGateway"]
+class IStreamingStorageGateway(IStorageGateway, Protocol):
+    async def save_stream(
+        self,
+        chunks: AsyncIterable[bytes],
+        filename: str,
+        content_type: str,
+        *,
+        max_bytes: int | None = None,
+    ) -> StoredBlob: ...
+
+    async def release(self, url: str) -> int: ...
+
+
+__all__ = [
+    "IStorageGateway",
+    "IStreamingStorageGateway",
+    "StoredBlob",
+    "UploadTooLarge",
+]
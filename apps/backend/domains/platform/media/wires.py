@@ -5,17 +5,37 @@ from dataclasses import dataclass
 from domains.platform.media.adapters.local_storage import (
     LocalStorageGateway,
 )
+from domains.platform.media.adapters.variant_cache import VariantDiskCache
+from domains.platform.media.application.variants import ImageVariantService
+from packages.core.config import Settings, load_settings
 
 
 @dataclass
 class MediaContainer:
     storage: LocalStorageGateway
     upload_dir: str
-
-
-def build_container() -> MediaContainer:
-    storage = LocalStorageGateway()
-    return MediaContainer(storage=storage, upload_dir=str(storage.base_dir))
+    variants: ImageVariantService
+    max_upload_bytes: int = 5 * 1024 * 1024
+
+
+def build_container(settings: Settings | None = None) -> MediaContainer:
+    cfg = settings or load_settings()
+    storage = LocalStorageGateway(
+        cfg.media_upload_dir, chunk_size=cfg.media_upload_chunk_bytes
+    )
+    cache = VariantDiskCache(
+        storage.base_dir / ".variants",
+        budget_bytes=cfg.media_variant_cache_bytes,
+    )
+    variants = ImageVariantService(
+        storage.base_dir, cache, max_workers=cfg.media_variant_workers
+    )
+    return MediaContainer(
+        storage=storage,
+        upload_dir=str(storage.base_dir),
+        variants=variants,
+        max_upload_bytes=cfg.media_max_upload_bytes,
+    )
 
 
 __all__ = ["MediaContainer", "build_container"]
@@ -10,6 +10,7 @@ from sqlalchemy import text as sa_text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncEngine
 
+from packages.core.db_schema import schema_capabilities
 from packages.core.testing import is_test_mode
 
 from .exceptions import ModerationUserError, UserNotFoundError
@@ -118,55 +119,16 @@ class ModerationUsersRepository:
                     logger.debug("moderation users: invalid cursor %r: %s", cursor, exc)
                     offset = 0
 
-                have_user_roles = bool(
-                    (
-                        await conn.execute(
-                            sa_text(
-                                """
-                                SELECT 1
-                                FROM information_schema.tables
-                                WHERE table_schema = current_schema()
-                                  AND table_name = 'user_roles'
-                                LIMIT 1
-                                """
-                            )
-                        )
-                    ).first()
-                )
-                have_notes_table = bool(
-                    (
-                        await conn.execute(
-                            sa_text(
-                                """
-                                SELECT 1
-                                FROM information_schema.tables
-                                WHERE table_schema = current_schema()
-                                  AND table_name = 'moderator_user_notes'
-                                LIMIT 1
-                                """
-                            )
-                        )
-                    ).first()
-                )
+                caps = await schema_capabilities().get(conn)
+                have_user_roles = caps.has_table("user_roles")
+                have_notes_table = caps.has_table("moderator_user_notes")
                 notes_select = (
                     "(SELECT COUNT(*) FROM moderator_user_notes mn WHERE mn.user_id = u.id) AS notes_count"
                     if have_notes_table
                     else "0 AS notes_count"
                 )
 
-                cols = (
-                    (
-                        await conn.execute(
-                            sa_text(
-                                "SELECT column_name FROM information_schema.columns "
-                                "WHERE table_schema = current_schema() AND table_name = 'users'"
-                            )
-                        )
-                    )
-                    .scalars()
-                    .all()
-                )
-                cols_set = {str(c) for c in cols}
+                cols_set = caps.columns_of("users")
 
                 name_expr_parts: list[str] = []
                 if "username" in cols_set:
@@ -289,36 +251,9 @@ class ModerationUsersRepository:
             return None
         try:
             async with engine.begin() as conn:
-                have_user_roles = bool(
-                    (
-                        await conn.execute(
-                            sa_text(
-                                """
-                                SELECT 1
-                                FROM information_schema.tables
-                                WHERE table_schema = current_schema()
-                                  AND table_name = 'user_roles'
-                                LIMIT 1
-                                """
-                            )
-                        )
-                    ).first()
-                )
-                have_notes_table = bool(
-                    (
-                        await conn.execute(
-                            sa_text(
-                                """
-                                SELECT 1
-                                FROM information_schema.tables
-                                WHERE table_schema = current_schema()
-                                  AND table_name = 'moderator_user_notes'
-                                LIMIT 1
-                                """
-                            )
-                        )
-                    ).first()
-                )
+                caps = await schema_capabilities().get(conn)
+                have_user_roles = caps.has_table("user_roles")
+                have_notes_table = caps.has_table("moderator_user_notes")
                 if have_user_roles:
                     sql = sa_text(
                         """
@@ -466,16 +401,8 @@ class ModerationUsersRepository:
         auto_ban_created = False
         try:
             async with engine.begin() as conn:
-                exists_tbl = (
-                    await conn.execute(
-                        sa_text(
-                            "SELECT 1 FROM information_schema.tables "
-                            "WHERE table_schema = current_schema() "
-                            "AND table_name = 'user_sanctions' LIMIT 1"
-                        )
-                    )
-                ).first()
-                if not exists_tbl:
+                caps = await schema_capabilities().get(conn)
+                if not caps.has_table("user_sanctions"):
                     return 0, False
                 await conn.execute(
                     sa_text(
@@ -599,27 +526,9 @@ class ModerationUsersRepository:
                 if not exists:
                     raise UserNotFoundError()
 
-                have_user_roles = bool(
-                    (
-                        await conn.execute(
-                            sa_text(
-                                "SELECT 1 FROM information_schema.tables "
-                                "WHERE table_schema = current_schema() AND table_name = 'user_roles' LIMIT 1"
-                            )
-                        )
-                    ).first()
-                )
-                has_role_col = bool(
-                    (
-                        await conn.execute(
-                            sa_text(
-                                "SELECT 1 FROM information_schema.columns "
-                                "WHERE table_schema = current_schema() AND table_name = 'users' "
-                                "AND column_name = 'role' LIMIT 1"
-                            )
-                        )
-                    ).first()
-                )
+                caps = await schema_capabilities().get(conn)
+                have_user_roles = caps.has_table("user_roles")
+                has_role_col = caps.has_column("users", "role")
 
                 if have_user_roles:
                     for role in add:
@@ -718,19 +627,8 @@ class ModerationUsersRepository:
                 ).scalar()
                 if not exists:
                     raise UserNotFoundError()
-                have_notes_table = bool(
-                    (
-                        await conn.execute(
-                            sa_text(
-                                """
-                                SELECT 1 FROM information_schema.tables
-                                WHERE table_schema = current_schema() AND table_name = 'moderator_user_notes'
-                                LIMIT 1
-                                """
-                            )
-                        )
-                    ).first()
-                )
+                caps = await schema_capabilities().get(conn)
+                have_notes_table = caps.has_table("moderator_user_notes")
                 if not have_notes_table:
                     raise RuntimeError("moderator_user_notes_missing")
                 note_row = (
@@ -3,7 +3,6 @@ from __future__ import annotations
 from typing import Any, cast
 
 from sqlalchemy.ext.asyncio import AsyncEngine
-from sqlalchemy.pool import NullPool
 
 from packages.core.db import get_async_engine
 
@@ -15,13 +14,7 @@ def ensure_async_engine(
         return engine
     if hasattr(engine, "begin") and callable(engine.begin):
         return cast(AsyncEngine, engine)
-    return get_async_engine(
-        f"{name}.repo",
-        url=engine,
-        cache=False,
-        pool_pre_ping=False,
-        poolclass=NullPool,
-    )
+    return get_async_engine(f"{name}.repo", url=engine)
 
 
 __all__ = ["ensure_async_engine"]
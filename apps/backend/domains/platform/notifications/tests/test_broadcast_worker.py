@@ -35,15 +35,7 @@ class _StubContainer:
 
 
 def _reset_worker_metrics() -> None:
-    worker_metrics.counters.clear()
-    worker_metrics.counters.update({"started": 0, "completed": 0, "failed": 0})
-    worker_metrics.duration_sum_ms = 0.0
-    worker_metrics.duration_count = 0
-    worker_metrics.cost_usd_total = 0.0
-    worker_metrics.tokens_prompt_total = 0
-    worker_metrics.tokens_completion_total = 0
-    worker_metrics.stage_counts.clear()
-    worker_metrics.stage_duration_sum_ms.clear()
+    worker_metrics.reset()
 
 
 @pytest.mark.asyncio
@@ -41,6 +41,10 @@ class InMemoryIndex(IndexPort, QueryPort):
             self._docs.pop(id, None)
             self._tf.pop(id, None)
 
+    async def delete_many(self, ids: Sequence[str]) -> None:
+        for doc_id in ids:
+            await self.delete(doc_id)
+
     async def list_all(self) -> list[Doc]:
         return list(self._docs.values())
 
@@ -1,14 +1,13 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Sequence
-from threading import Lock
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine
-from sqlalchemy.pool import NullPool
 
 from domains.platform.search.ports import Doc, Hit, IndexPort, QueryPort
 from packages.core.db import get_async_engine
+from packages.core.db_replicas import read_only
 
 
 class SQLSearchIndex(IndexPort, QueryPort):
@@ -26,11 +25,7 @@ class SQLSearchIndex(IndexPort, QueryPort):
             self._engine_factory = lambda: get_async_engine(
                 "platform-search.index",
                 url=dsn,
-                cache=False,
-                pool_pre_ping=False,
-                poolclass=NullPool,
             )
-        self._engine_lock = Lock()
 
     async def upsert(self, doc: Doc) -> None:
         sql = text(
@@ -61,6 +56,13 @@ class SQLSearchIndex(IndexPort, QueryPort):
         async with self._get_engine().begin() as conn:
             await conn.execute(sql, {"id": id})
 
+    async def delete_many(self, ids: Sequence[str]) -> None:
+        if not ids:
+            return
+        sql = text("DELETE FROM search_documents WHERE id = ANY(:ids)")
+        async with self._get_engine().begin() as conn:
+            await conn.execute(sql, {"ids": list(ids)})
+
     async def list_all(self) -> list[Doc]:
         sql = text("SELECT id, title, body, tags FROM search_documents ORDER BY id")
         async with self._get_engine().begin() as conn:
@@ -123,7 +125,7 @@ class SQLSearchIndex(IndexPort, QueryPort):
               LIMIT :limit OFFSET :offset
             """
         )  # nosec
-        async with self._get_engine().begin() as conn:
+        async with self._get_read_engine().begin() as conn:
             rows = (await conn.execute(sql, params)).mappings().all()
         hits: list[Hit] = []
         for row in rows:
@@ -145,10 +147,13 @@ class SQLSearchIndex(IndexPort, QueryPort):
         factory = self._engine_factory
         if factory is None:
             raise RuntimeError("search index engine is not configured")
-        with self._engine_lock:
-            if self._engine is None:
-                self._engine = factory()
-            return self._engine
+        # Resolved per call: the registry keeps one shared pool per event loop.
+        return factory()
+
+    def _get_read_engine(self) -> AsyncEngine:
+        # Search results tolerate replica lag; upserts keep the primary.
+        with read_only():
+            return self._get_engine()
 
 
 __all__ = ["SQLSearchIndex"]
@@ -4,6 +4,7 @@ from collections.abc import Sequence
 from dataclasses import dataclass
 
 from domains.platform.search.ports import (
+    BatchIndexPort,
     Doc,
     Hit,
     IndexPort,
@@ -36,6 +37,22 @@ class SearchService:
             docs = await self.index.list_all()
             await self.persist.save(docs)
 
+    async def delete_many(self, ids: Sequence[str]) -> None:
+        """Delete several documents with one cache bump and one persist."""
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return
+        if isinstance(self.index, BatchIndexPort):
+            await self.index.delete_many(ids)
+        else:
+            for doc_id in ids:
+                await self.index.delete(doc_id)
+        if self.cache:
+            await self.cache.bump_version()
+        if self.persist:
+            docs = await self.index.list_all()
+            await self.persist.save(docs)
+
     async def search(
         self,
         q: str,
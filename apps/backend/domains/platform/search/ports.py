@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import Protocol
+from typing import Protocol, runtime_checkable
 
 
 @dataclass(frozen=True)
@@ -27,6 +27,11 @@ class IndexPort(Protocol):
     async def list_all(self) -> list[Doc]: ...
 
 
+@runtime_checkable
+class BatchIndexPort(Protocol):
+    async def delete_many(self, ids: Sequence[str]) -> None: ...
+
+
 class QueryPort(Protocol):
     async def search(
         self, q: str, *, tags: Sequence[str] | None, match: str, limit: int, offset: int
@@ -45,4 +50,12 @@ class SearchPersistence(Protocol):
     async def save(self, docs: list[Doc]) -> None: ...
 
 
-__all__ = ["Doc", "Hit", "IndexPort", "QueryPort", "SearchCache", "SearchPersistence"]
+__all__ = [
+    "BatchIndexPort",
+    "Doc",
+    "Hit",
+    "IndexPort",
+    "QueryPort",
+    "SearchCache",
+    "SearchPersistence",
+]
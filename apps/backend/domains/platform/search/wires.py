@@ -113,7 +113,24 @@ def register_event_indexers(events: Events, container: SearchContainer) -> None:
         except RuntimeError:
             asyncio.run(_on_profile_updated(topic, payload))
 
+    async def _on_nodes_batch_updated(_topic: str, payload: dict[str, Any]) -> None:
+        # Nodes a bulk action took out of public view leave the index in one
+        # delete (one cache bump, one persist) instead of one per node.
+        if payload.get("is_public") is not False:
+            return
+        ids = [f"node:{int(node_id)}" for node_id in payload.get("ids") or []]
+        await container.service.delete_many(ids)
+
+    def _schedule_nodes_batch(topic: str, payload: dict[str, Any]) -> None:
+        try:
+            asyncio.get_running_loop().create_task(
+                _on_nodes_batch_updated(topic, payload)
+            )
+        except RuntimeError:
+            asyncio.run(_on_nodes_batch_updated(topic, payload))
+
     events.on("profile.updated.v1", _schedule_profile_update)
+    events.on("node.updated.batch.v1", _schedule_nodes_batch)
 
 
 __all__ = ["SearchContainer", "build_container", "register_event_indexers"]
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from domains.platform.telemetry.ports.fleet_metrics_port import (
+    IFleetMetricsStore,
+    InstanceRecord,
+)
+
+
+def _text(value: Any) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
+
+
+class RedisFleetMetricsStore(IFleetMetricsStore):
+    """Per-process metric hashes in Redis.
+
+    ``{ns}:instances`` is a sorted set of instance ids scored by their last
+    flush; ``{ns}:series:{id}`` holds cumulative values that flushes bump with
+    HINCRBYFLOAT, ``{ns}:meta:{id}`` the process labels. Both hashes expire
+    ``retention_s`` after the last flush, so dead processes age out.
+
+    Takes a synchronous client: flushes run on a background thread and must
+    work in processes without an event loop.
+    """
+
+    def __init__(self, client: Any, *, namespace: str = "telemetry:fleet:v1") -> None:
+        self._client = client
+        self._ns = namespace
+
+    def _series_key(self, instance: str) -> str:
+        return f"{self._ns}:series:{instance}"
+
+    def _meta_key(self, instance: str) -> str:
+        return f"{self._ns}:meta:{instance}"
+
+    def push(
+        self,
+        instance: str,
+        *,
+        meta: Mapping[str, str],
+        deltas: Mapping[str, float],
+        replace: bool,
+        flushed_at: float,
+        retention_s: int,
+    ) -> None:
+        series_key = self._series_key(instance)
+        meta_key = self._meta_key(instance)
+        pipe = self._client.pipeline(transaction=True)
+        if replace:
+            pipe.delete(series_key)
+            if deltas:
+                pipe.hset(series_key, mapping=dict(deltas))
+        else:
+            for field, delta in deltas.items():
+                pipe.hincrbyfloat(series_key, field, delta)
+        pipe.hset(meta_key, mapping=dict(meta))
+        pipe.expire(series_key, retention_s)
+        pipe.expire(meta_key, retention_s)
+        pipe.zadd(f"{self._ns}:instances", {instance: flushed_at})
+        pipe.execute()
+
+    def read(self, *, now: float, retention_s: int) -> list[InstanceRecord]:
+        index = f"{self._ns}:instances"
+        self._client.zremrangebyscore(index, "-inf", now - retention_s)
+        members = self._client.zrange(index, 0, -1, withscores=True)
+        if not members:
+            return []
+        instances = [(_text(member), float(score)) for member, score in members]
+        pipe = self._client.pipeline(transaction=False)
+        for instance, _ in instances:
+            pipe.hgetall(self._meta_key(instance))
+            pipe.hgetall(self._series_key(instance))
+        replies = pipe.execute()
+        records: list[InstanceRecord] = []
+        for pos, (instance, last_flush) in enumerate(instances):
+            meta, series = replies[2 * pos], replies[2 * pos + 1]
+            records.append(
+                InstanceRecord(
+                    instance=instance,
+                    last_flush=last_flush,
+                    meta={_text(k): _text(v) for k, v in (meta or {}).items()},
+                    series={_text(k): float(v) for k, v in (series or {}).items()},
+                )
+            )
+        return records
+
+
+__all__ = ["RedisFleetMetricsStore"]
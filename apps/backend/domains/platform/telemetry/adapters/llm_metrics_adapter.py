@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
+
+from domains.platform.telemetry.domain.metrics import MetricsRegistry
 from domains.platform.telemetry.ports.llm_metrics_port import (
     ILLMMetricsSink,
     LLMCallLabels,
@@ -8,41 +11,58 @@ from domains.platform.telemetry.ports.llm_metrics_port import (
 
 class InMemoryLLMMetricsSink(ILLMMetricsSink):
     def __init__(self) -> None:
-        self.counters: dict[tuple[str, str, str, str], int] = {}
-        self.latency_sum: dict[tuple[str, str, str], float] = {}
-        self.latency_count: dict[tuple[str, str, str], int] = {}
-        self.tokens_sum: dict[tuple[str, str, str, str], int] = {}
-        self.cost_sum: dict[tuple[str, str, str], float] = {}
+        self.registry = MetricsRegistry()
+        labels = ("provider", "model", "stage")
+        self._calls = self.registry.counter(
+            "llm_calls", "Total LLM calls", ("type", *labels), max_series=2000
+        )
+        self._latency = self.registry.histogram(
+            "llm_latency_ms", "LLM latency (ms)", labels, max_series=500
+        )
+        self._tokens = self.registry.counter(
+            "llm_tokens", "Total tokens by type", (*labels, "type"), max_series=1000
+        )
+        self._cost = self.registry.counter(
+            "llm_cost_usd", "Total cost (USD)", labels, max_series=500
+        )
 
-    def _k(self, metric: str, labels: LLMCallLabels) -> tuple[str, str, str, str]:
-        return (metric, labels.provider, labels.model, labels.stage or "unknown")
+    @staticmethod
+    def _labels(labels: LLMCallLabels) -> tuple[str, str, str]:
+        return (labels.provider, labels.model, labels.stage or "unknown")
 
     def inc(self, metric: str, labels: LLMCallLabels, by: int = 1) -> None:
-        self.counters[self._k(metric, labels)] = (
-            self.counters.get(self._k(metric, labels), 0) + by
-        )
+        self._calls.inc(metric, *self._labels(labels), amount=by)
 
     def observe_latency(self, labels: LLMCallLabels, ms: float) -> None:
-        key = (labels.provider, labels.model, labels.stage or "unknown")
-        self.latency_sum[key] = self.latency_sum.get(key, 0.0) + float(ms)
-        self.latency_count[key] = self.latency_count.get(key, 0) + 1
+        self._latency.observe(ms, *self._labels(labels))
 
     def observe_tokens(
         self, labels: LLMCallLabels, prompt: int, completion: int
     ) -> None:
-        kpr = (labels.provider, labels.model, labels.stage or "unknown", "prompt")
-        kco = (labels.provider, labels.model, labels.stage or "unknown", "completion")
-        self.tokens_sum[kpr] = self.tokens_sum.get(kpr, 0) + int(prompt)
-        self.tokens_sum[kco] = self.tokens_sum.get(kco, 0) + int(completion)
+        key = self._labels(labels)
+        self._tokens.inc(*key, "prompt", amount=int(prompt))
+        self._tokens.inc(*key, "completion", amount=int(completion))
 
     def observe_cost(self, labels: LLMCallLabels, cost: float) -> None:
-        key = (labels.provider, labels.model, labels.stage or "unknown")
-        self.cost_sum[key] = self.cost_sum.get(key, 0.0) + float(cost)
+        self._cost.inc(*self._labels(labels), amount=float(cost))
+
+    def export_series(self) -> dict[tuple[str, ...], float]:
+        """Cumulative values as flat series, so several processes can be summed."""
+
+        return self.registry.export()
+
+    @classmethod
+    def from_series(
+        cls, series: Mapping[tuple[str, ...], float]
+    ) -> InMemoryLLMMetricsSink:
+        sink = cls()
+        sink.registry.load(series)
+        return sink
 
     def snapshot(self) -> dict:
         """JSON-friendly snapshot for admin UI consumption."""
         calls: list[dict[str, object]] = []
-        for (metric, provider, model, stage), cnt in self.counters.items():
+        for (metric, provider, model, stage), cnt in self._calls.values().items():
             calls.append(
                 {
                     "type": metric,
@@ -53,8 +73,7 @@ class InMemoryLLMMetricsSink(ILLMMetricsSink):
                 }
             )
         lat: list[dict[str, object]] = []
-        for (provider, model, stage), s in self.latency_sum.items():
-            c = self.latency_count.get((provider, model, stage), 1)
+        for (provider, model, stage), (c, s) in self._latency.series().items():
             lat.append(
                 {
                     "provider": provider,
@@ -64,7 +83,7 @@ class InMemoryLLMMetricsSink(ILLMMetricsSink):
                 }
             )
         toks: list[dict[str, object]] = []
-        for (provider, model, stage, t), s in self.tokens_sum.items():
+        for (provider, model, stage, t), s in self._tokens.values().items():
             toks.append(
                 {
                     "provider": provider,
@@ -75,7 +94,7 @@ class InMemoryLLMMetricsSink(ILLMMetricsSink):
                 }
             )
         cost: list[dict[str, object]] = []
-        for (provider, model, stage), s in self.cost_sum.items():
+        for (provider, model, stage), s in self._cost.values().items():
             cost.append(
                 {
                     "provider": provider,
@@ -91,35 +110,8 @@ class InMemoryLLMMetricsSink(ILLMMetricsSink):
             "cost_usd_total": cost,
         }
 
-    def prometheus(self) -> str:
-        lines = []
-        lines.append("# HELP llm_calls_total Total LLM calls")
-        lines.append("# TYPE llm_calls_total counter")
-        for (metric, provider, model, stage), cnt in self.counters.items():
-            lines.append(
-                f'llm_calls_total{{type="{metric}",provider="{provider}",model="{model}",stage="{stage}"}} {cnt}'
-            )
-        lines.append("# HELP llm_latency_ms Average LLM latency (ms)")
-        lines.append("# TYPE llm_latency_ms gauge")
-        for (provider, model, stage), s in self.latency_sum.items():
-            c = self.latency_count.get((provider, model, stage), 1)
-            avg = s / max(c, 1)
-            lines.append(
-                f'llm_latency_ms{{provider="{provider}",model="{model}",stage="{stage}"}} {avg}'
-            )
-        lines.append("# HELP llm_tokens_total Total tokens by type")
-        lines.append("# TYPE llm_tokens_total counter")
-        for (provider, model, stage, t), s in self.tokens_sum.items():
-            lines.append(
-                f'llm_tokens_total{{provider="{provider}",model="{model}",stage="{stage}",type="{t}"}} {s}'
-            )
-        lines.append("# HELP llm_cost_usd_total Total cost (USD)")
-        lines.append("# TYPE llm_cost_usd_total counter")
-        for (provider, model, stage), s in self.cost_sum.items():
-            lines.append(
-                f'llm_cost_usd_total{{provider="{provider}",model="{model}",stage="{stage}"}} {s}'
-            )
-        return "\n".join(lines) + "\n"
+    def prometheus(self, *, openmetrics: bool = False) -> str:
+        return self.registry.exposition(openmetrics=openmetrics)
 
 
 __all__ = ["InMemoryLLMMetricsSink"]
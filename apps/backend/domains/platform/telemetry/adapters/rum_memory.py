@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 from collections import deque
+from collections.abc import Sequence
 from typing import Any
 
 from domains.platform.telemetry.ports.rum_port import IRumRepository
@@ -16,6 +17,11 @@ class RumMemoryRepository(IRumRepository):
         async with self._lock:
             self._buf.appendleft(dict(event))
 
+    async def add_many(self, events: Sequence[dict[str, Any]]) -> int:
+        async with self._lock:
+            self._buf.extendleft(dict(event) for event in events)
+        return len(events)
+
     async def list(self, limit: int) -> list[dict[str, Any]]:
         async with self._lock:
             out = list(self._buf)[: max(0, int(limit))]
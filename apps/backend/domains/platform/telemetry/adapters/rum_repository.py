@@ -6,18 +6,25 @@ import json
 import logging
 import math
 import time
-from collections.abc import Iterable
-from dataclasses import dataclass
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
 from typing import Any
-from urllib.parse import urlparse
 
 import redis.asyncio as redis  # type: ignore
 
+from domains.platform.telemetry.domain.rum import (
+    MAX_WINDOW_ROUTES,
+    OTHER_ROUTE,
+    normalise_route,
+)
+from domains.platform.telemetry.domain.sketch import QuantileSketch
 from domains.platform.telemetry.ports.rum_port import IRumRepository
 
 _DEFAULT_KEY_PREFIX = "telemetry:rum"
 _STATE_TTL_SECONDS = 72 * 3600
 _ERROR_TTL_SECONDS = 30 * 24 * 3600
+_TRIM_EVERY = 64
+_WINDOW_MS = 3600 * 1000
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +40,7 @@ class RumAggregate:
     sums: dict[str, float]
     sum_squares: dict[str, float]
     last_ts: int
+    sketches: dict[str, QuantileSketch] = field(default_factory=dict)
 
     def average(self, metric: str) -> float | None:
         total = self.sums.get(metric)
@@ -40,6 +48,98 @@ class RumAggregate:
             return None
         return total / float(self.count)
 
+    def quantile(self, metric: str, q: float) -> float | None:
+        sketch = self.sketches.get(metric)
+        return sketch.quantile(q) if sketch is not None else None
+
+
+# KEYS[1] = pending aggregates ZSET, ARGV[1] = JSON batch built by add_many.
+_BATCH_LUA = """
+local batch = cjson.decode(ARGV[1])
+for _, item in ipairs(batch.raw) do
+  redis.call('ZADD', item[1], item[2], item[3])
+end
+for key, ttl in pairs(batch.raw_ttl) do
+  redis.call('EXPIRE', key, ttl)
+end
+for _, agg in ipairs(batch.aggs) do
+  local key = agg.k
+  redis.call('HINCRBY', key, 'count', agg.c)
+  redis.call('HSET', key, 'event', agg.m[1], 'category', agg.m[2],
+    'route', agg.m[3], 'bucket_ms', agg.m[4])
+  local last_ts = tonumber(redis.call('HGET', key, 'last_ts') or '0') or 0
+  if agg.ts > last_ts then
+    redis.call('HSET', key, 'last_ts', agg.ts)
+  end
+  for field, value in pairs(agg.f) do
+    redis.call('HINCRBYFLOAT', key, field, value)
+  end
+  for field, value in pairs(agg.i) do
+    redis.call('HINCRBY', key, field, value)
+  end
+  redis.call('EXPIRE', key, agg.ttl)
+  redis.call('ZADD', KEYS[1], agg.m[4], key)
+end
+redis.call('EXPIRE', KEYS[1], batch.pending_ttl)
+return #batch.aggs
+"""
+
+# KEYS[1] = pending aggregates ZSET, ARGV[1] = JSON batch built by
+# commit_aggregates. Bins go to the hour's all-routes window and to its
+# per-route window. The merged amounts are subtracted from the minute hash, so
+# beacons that landed after the fetch stay pending and are merged exactly once.
+_COMMIT_LUA = """
+local batch = cjson.decode(ARGV[1])
+for _, agg in ipairs(batch.aggs) do
+  -- The hour admits up to batch.max_routes routes; later ones share agg.ro.
+  local route_window = agg.rw
+  if redis.call('SISMEMBER', agg.rs, agg.rh) == 0 then
+    if redis.call('SCARD', agg.rs) < batch.max_routes then
+      redis.call('SADD', agg.rs, agg.rh)
+      redis.call('EXPIRE', agg.rs, batch.ttl)
+    else
+      route_window = agg.ro
+    end
+  end
+  local merged = false
+  for field, value in pairs(agg.b) do
+    redis.call('HINCRBY', agg.w, field, value)
+    redis.call('HINCRBY', route_window, field, value)
+    if redis.call('HINCRBY', agg.k, 'q:' .. field, -value) <= 0 then
+      redis.call('HDEL', agg.k, 'q:' .. field)
+    end
+    merged = true
+  end
+  if merged then
+    redis.call('EXPIRE', agg.w, batch.ttl)
+    redis.call('EXPIRE', route_window, batch.ttl)
+  end
+  for field, value in pairs(agg.f) do
+    redis.call('HINCRBYFLOAT', agg.k, field, value)
+  end
+  if redis.call('HINCRBY', agg.k, 'count', -agg.c) <= 0 then
+    redis.call('DEL', agg.k)
+    redis.call('ZREM', KEYS[1], agg.k)
+  end
+end
+return #batch.aggs
+"""
+
+
+@dataclass(slots=True)
+class _PreparedEvent:
+    event: str
+    category: str
+    route: str
+    ts_ms: int
+    bucket_ms: int
+    serialized: str
+    raw_key: str
+    ttl: int
+    agg_key: str
+    metrics: list[tuple[str, float]]
+    weight: int
+
 
 def _now_ms() -> int:
     return int(time.time() * 1000)
@@ -71,17 +171,6 @@ def _to_float(value: Any, default: float = 0.0) -> float:
         return default
 
 
-def _normalise_route(url: str | None) -> str:
-    if not url:
-        return "unknown"
-    parsed = urlparse(url)
-    netloc = (parsed.netloc or "").lower()
-    path = parsed.path or "/"
-    route = f"{netloc}{path}" if netloc else path
-    route = route.strip() or "unknown"
-    return route[:256]
-
-
 def _hash_route(route: str) -> str:
     return hashlib.sha1(route.encode("utf-8"), usedforsecurity=False).hexdigest()[:12]
 
@@ -95,6 +184,18 @@ def _iter_numeric_metrics(data: Any) -> Iterable[tuple[str, float]]:
 
 
 class RumRedisRepository(IRumRepository):
+    """Redis-backed RUM storage.
+
+    Each event is appended to a raw ZSET and folded into a per-minute,
+    per-route aggregate hash holding counts, sums and DDSketch bins
+    (``q:<metric>:<bin>`` counters). The rollup worker merges minute sketches
+    into hourly ``sketch`` hashes that back windowed percentiles: one over all
+    routes and one per route, capped at ``max_window_routes`` routes per event
+    and hour (later routes share ``other``). Sampled events carry
+    ``sample_weight``; counts, sums and bins are scaled by it so the
+    aggregates estimate the unsampled traffic.
+    """
+
     def __init__(
         self,
         client: redis.Redis,
@@ -102,68 +203,181 @@ class RumRedisRepository(IRumRepository):
         key_prefix: str = _DEFAULT_KEY_PREFIX,
         state_ttl_seconds: int = _STATE_TTL_SECONDS,
         error_ttl_seconds: int = _ERROR_TTL_SECONDS,
+        trim_every: int = _TRIM_EVERY,
+        max_window_routes: int = MAX_WINDOW_ROUTES,
     ) -> None:
         self._redis = client
         self._state_key = f"{key_prefix}:state:raw"
         self._error_key = f"{key_prefix}:error:raw"
         self._agg_prefix = f"{key_prefix}:agg"
         self._agg_pending_key = f"{key_prefix}:agg:pending"
+        self._sketch_prefix = f"{key_prefix}:sketch"
         self._state_ttl = max(int(state_ttl_seconds), 60)
         self._error_ttl = max(int(error_ttl_seconds), self._state_ttl)
+        self._trim_every = max(int(trim_every), 1)
+        self._max_window_routes = max(int(max_window_routes), 1)
+        self._adds = 0
+        self._sketch = QuantileSketch()
+        self._batch_script: Any | None = None
+        self._commit_script: Any | None = None
 
     async def add(self, event: dict[str, Any]) -> None:
-        payload = dict(event or {})
         now_ms = _now_ms()
+        prepared = self._prepare(event, now_ms)
+
+        pipe = self._redis.pipeline()
+        pipe.zadd(prepared.raw_key, {prepared.serialized: float(prepared.ts_ms)})
+        pipe.expire(prepared.raw_key, prepared.ttl)
+
+        agg_key = prepared.agg_key
+        weight = prepared.weight
+        pipe.hincrby(agg_key, "count", weight)
+        pipe.hset(
+            agg_key,
+            mapping={
+                "event": prepared.event,
+                "category": prepared.category,
+                "route": prepared.route,
+                "bucket_ms": prepared.bucket_ms,
+                "last_ts": prepared.ts_ms,
+            },
+        )
+        for metric_name, metric_value in prepared.metrics:
+            pipe.hincrbyfloat(
+                agg_key, f"sum:{metric_name}", weight * metric_value
+            )
+            pipe.hincrbyfloat(
+                agg_key,
+                f"sumsq:{metric_name}",
+                weight * metric_value * metric_value,
+            )
+            pipe.hincrby(
+                agg_key, f"q:{metric_name}:{self._sketch.key(metric_value)}", weight
+            )
+        pipe.expire(agg_key, prepared.ttl)
+
+        pipe.zadd(self._agg_pending_key, {agg_key: float(prepared.bucket_ms)})
+        pipe.expire(self._agg_pending_key, self._error_ttl)
+
+        # Trimming scans the ZSET; amortise it instead of paying on every add.
+        if self._count_adds(1):
+            self._queue_trim(pipe, now_ms)
+
+        await pipe.execute()
+
+    async def add_many(self, events: Sequence[dict[str, Any]]) -> int:
+        """Store a batch of events with a single ``EVALSHA``.
+
+        Events are coalesced per aggregate hash first, so counters, sums and
+        sketch bins of the whole batch become one increment per field.
+        """
+        if not events:
+            return 0
+        now_ms = _now_ms()
+        raw: list[list[Any]] = []
+        raw_ttl: dict[str, int] = {}
+        aggs: dict[str, dict[str, Any]] = {}
+        for event in events:
+            prepared = self._prepare(event, now_ms)
+            raw.append([prepared.raw_key, prepared.ts_ms, prepared.serialized])
+            raw_ttl[prepared.raw_key] = prepared.ttl
+            agg = aggs.get(prepared.agg_key)
+            if agg is None:
+                agg = aggs[prepared.agg_key] = {
+                    "k": prepared.agg_key,
+                    "c": 0,
+                    "m": [
+                        prepared.event,
+                        prepared.category,
+                        prepared.route,
+                        prepared.bucket_ms,
+                    ],
+                    "ts": prepared.ts_ms,
+                    "ttl": prepared.ttl,
+                    "f": {},
+                    "i": {},
+                }
+            weight = prepared.weight
+            agg["c"] += weight
+            agg["ts"] = max(agg["ts"], prepared.ts_ms)
+            floats: dict[str, float] = agg["f"]
+            ints: dict[str, int] = agg["i"]
+            for metric_name, metric_value in prepared.metrics:
+                sum_field = f"sum:{metric_name}"
+                sq_field = f"sumsq:{metric_name}"
+                bin_field = f"q:{metric_name}:{self._sketch.key(metric_value)}"
+                floats[sum_field] = (
+                    floats.get(sum_field, 0.0) + weight * metric_value
+                )
+                floats[sq_field] = (
+                    floats.get(sq_field, 0.0) + weight * metric_value * metric_value
+                )
+                ints[bin_field] = ints.get(bin_field, 0) + weight
+        for agg in aggs.values():
+            # Lua numbers lose precision past 14 digits; ship floats as text.
+            agg["f"] = {name: repr(value) for name, value in agg["f"].items()}
+        batch = {
+            "raw": raw,
+            "raw_ttl": raw_ttl,
+            "aggs": list(aggs.values()),
+            "pending_ttl": self._error_ttl,
+        }
+        if self._batch_script is None:
+            self._batch_script = self._redis.register_script(_BATCH_LUA)
+        await self._batch_script(
+            keys=[self._agg_pending_key],
+            args=[json.dumps(batch, ensure_ascii=False, separators=(",", ":"))],
+        )
+        if self._count_adds(len(events)):
+            await self.trim(now_ms)
+        return len(events)
+
+    def _count_adds(self, count: int) -> bool:
+        before = self._adds // self._trim_every
+        self._adds += count
+        return self._adds // self._trim_every != before
+
+    def _prepare(self, event: dict[str, Any], now_ms: int) -> _PreparedEvent:
+        payload = dict(event or {})
         ts_ms = _coerce_ts(payload.get("ts"), fallback=now_ms)
         payload["ts"] = ts_ms
 
         event_name = str(payload.get("event") or "unknown").strip() or "unknown"
         url = str(payload.get("url") or "").strip()
-        route = _normalise_route(url)
+        route = normalise_route(url)
         category = self._classify_event(event_name)
 
         serialized = json.dumps(
             {**payload, "event": event_name, "url": url}, ensure_ascii=False
         )
-
         raw_key, ttl = self._raw_key_and_ttl(category)
-        cutoff_ms = now_ms - (ttl * 1000)
-
-        pipe = self._redis.pipeline()
-        pipe.zadd(raw_key, {serialized: float(ts_ms)})
-        pipe.zremrangebyscore(raw_key, 0, cutoff_ms)
-        pipe.expire(raw_key, ttl)
-
         bucket_ms = (ts_ms // 60000) * 60000
-        agg_key = self._agg_key(category, event_name, bucket_ms, route)
-        metrics = list(_iter_numeric_metrics(payload.get("data")))
-        pipe.hincrby(agg_key, "count", 1)
-        pipe.hset(
-            agg_key,
-            mapping={
-                "event": event_name,
-                "category": category,
-                "route": route,
-                "bucket_ms": bucket_ms,
-                "last_ts": ts_ms,
-            },
+        return _PreparedEvent(
+            event=event_name,
+            category=category,
+            route=route,
+            ts_ms=ts_ms,
+            bucket_ms=bucket_ms,
+            serialized=serialized,
+            raw_key=raw_key,
+            ttl=ttl,
+            agg_key=self._agg_key(category, event_name, bucket_ms, route),
+            metrics=list(_iter_numeric_metrics(payload.get("data"))),
+            weight=max(1, _to_int(payload.get("sample_weight"), default=1)),
         )
-        for metric_name, metric_value in metrics:
-            pipe.hincrbyfloat(agg_key, f"sum:{metric_name}", metric_value)
-            pipe.hincrbyfloat(
-                agg_key, f"sumsq:{metric_name}", metric_value * metric_value
-            )
-        pipe.expire(agg_key, ttl)
 
-        pipe.zadd(self._agg_pending_key, {agg_key: float(bucket_ms)})
+    async def trim(self, now_ms: int | None = None) -> None:
+        """Drop raw events and pending markers older than their TTLs."""
+        pipe = self._redis.pipeline()
+        self._queue_trim(pipe, now_ms if now_ms is not None else _now_ms())
+        await pipe.execute()
+
+    def _queue_trim(self, pipe: Any, now_ms: int) -> None:
+        pipe.zremrangebyscore(self._state_key, 0, now_ms - self._state_ttl * 1000)
+        pipe.zremrangebyscore(self._error_key, 0, now_ms - self._error_ttl * 1000)
         pipe.zremrangebyscore(
-            self._agg_pending_key,
-            0,
-            now_ms - (self._error_ttl * 1000),
+            self._agg_pending_key, 0, now_ms - self._error_ttl * 1000
         )
-        pipe.expire(self._agg_pending_key, self._error_ttl)
-
-        await pipe.execute()
 
     async def list(self, limit: int) -> builtins.list[dict[str, Any]]:
         lim = max(int(limit), 0)
@@ -227,20 +441,125 @@ class RumRedisRepository(IRumRepository):
             return
         await self._redis.zrem(self._agg_pending_key, *items)
 
+    async def commit_aggregates(self, aggregates: Iterable[RumAggregate]) -> None:
+        """Merge minute sketches into hourly windows and ack them atomically.
+
+        One ``EVALSHA`` adds the fetched bins to the hourly hashes and subtracts
+        the fetched count, sums and bins from each minute hash. A minute that
+        drains to zero is deleted and acked; one that received beacons after
+        the fetch keeps only those and stays pending for the next commit.
+        """
+        items = tuple(aggregates)
+        if not items:
+            return
+        aggs: list[dict[str, Any]] = []
+        for agg in items:
+            bins = {
+                f"{metric_name}:{token}": int(count)
+                for metric_name, sketch in agg.sketches.items()
+                for token, count in sketch.bins()
+            }
+            floats = {f"sum:{name}": -value for name, value in agg.sums.items()}
+            floats.update(
+                {f"sumsq:{name}": -value for name, value in agg.sum_squares.items()}
+            )
+            hour_ms = (agg.bucket_ms // _WINDOW_MS) * _WINDOW_MS
+            window = self._window_key(agg.category, agg.event, hour_ms)
+            aggs.append(
+                {
+                    "k": agg.key,
+                    "w": window,
+                    "rw": self._window_key(agg.category, agg.event, hour_ms, agg.route),
+                    "ro": self._window_key(agg.category, agg.event, hour_ms, OTHER_ROUTE),
+                    "rs": f"{window}:routes",
+                    "rh": _hash_route(agg.route),
+                    "c": int(agg.count),
+                    "b": bins,
+                    # Lua numbers lose precision past 14 digits; ship floats as text.
+                    "f": {name: repr(value) for name, value in floats.items()},
+                }
+            )
+        if self._commit_script is None:
+            self._commit_script = self._redis.register_script(_COMMIT_LUA)
+        await self._commit_script(
+            keys=[self._agg_pending_key],
+            args=[
+                json.dumps(
+                    {
+                        "aggs": aggs,
+                        "ttl": self._error_ttl,
+                        "max_routes": self._max_window_routes,
+                    },
+                    ensure_ascii=False,
+                    separators=(",", ":"),
+                )
+            ],
+        )
+
+    async def load_window_sketches(
+        self,
+        event: str,
+        since_ms: int,
+        until_ms: int,
+        *,
+        route: str | None = None,
+    ) -> dict[str, QuantileSketch]:
+        """Merge the hourly sketches of ``event`` overlapping the window.
+
+        ``route`` (a URL or ``host/path``) narrows them to one route; routes
+        past the per-hour cap are only found as ``other``.
+        """
+        event_name = str(event or "").strip() or "unknown"
+        category = self._classify_event(event_name)
+        start = (max(int(since_ms), 0) // _WINDOW_MS) * _WINDOW_MS
+        end = max(int(until_ms), start)
+        normalised = normalise_route(route) if route else None
+        keys = [
+            self._window_key(category, event_name, hour, normalised)
+            for hour in range(start, end + 1, _WINDOW_MS)
+        ]
+        pipe = self._redis.pipeline()
+        for key in keys:
+            pipe.hgetall(key)
+        rows = await pipe.execute()
+        bins: dict[str, list[tuple[str, Any]]] = {}
+        for raw in rows:
+            for field_name, value in (raw or {}).items():
+                metric_name, _, token = _decode(field_name).rpartition(":")
+                if metric_name:
+                    bins.setdefault(metric_name, []).append((token, value))
+        sketches: dict[str, QuantileSketch] = {}
+        for metric_name, items in bins.items():
+            sketch = QuantileSketch()
+            sketch.load_bins(items)
+            if sketch.count:
+                sketches[metric_name] = sketch
+        return sketches
+
     def _parse_aggregate(self, key: str, raw: dict[str, Any]) -> RumAggregate:
         event = str(raw.get("event") or "unknown")
         category = str(raw.get("category") or "state")
         route = str(raw.get("route") or "unknown")
-        bucket_ms = _coerce_ts(raw.get("bucket_ms"), fallback=0)
-        last_ts = _coerce_ts(raw.get("last_ts"), fallback=bucket_ms)
+        # Hash values come back as strings; _coerce_ts only accepts numbers.
+        bucket_ms = _to_int(raw.get("bucket_ms"), default=0)
+        last_ts = _to_int(raw.get("last_ts"), default=bucket_ms)
         count = _to_int(raw.get("count"), default=0)
         sums: dict[str, float] = {}
         sum_squares: dict[str, float] = {}
-        for field, value in raw.items():
-            if field.startswith("sum:"):
-                sums[field[4:]] = _to_float(value)
-            elif field.startswith("sumsq:"):
-                sum_squares[field[6:]] = _to_float(value)
+        sketches: dict[str, QuantileSketch] = {}
+        for field_name, value in raw.items():
+            if field_name.startswith("sum:"):
+                sums[field_name[4:]] = _to_float(value)
+            elif field_name.startswith("sumsq:"):
+                sum_squares[field_name[6:]] = _to_float(value)
+            elif field_name.startswith("q:"):
+                metric_name, _, token = field_name[2:].rpartition(":")
+                if not metric_name:
+                    continue
+                sketch = sketches.get(metric_name)
+                if sketch is None:
+                    sketch = sketches[metric_name] = QuantileSketch()
+                sketch.load_bins(((token, value),))
         return RumAggregate(
             key=key,
             event=event,
@@ -251,6 +570,7 @@ class RumRedisRepository(IRumRepository):
             sums=sums,
             sum_squares=sum_squares,
             last_ts=last_ts,
+            sketches=sketches,
         )
 
     def _classify_event(self, event_name: str) -> str:
@@ -268,8 +588,23 @@ class RumRedisRepository(IRumRepository):
         self, category: str, event_name: str, bucket_ms: int, route: str
     ) -> str:
         route_hash = _hash_route(route)
-        safe_event = event_name.replace(":", "_").replace(" ", "_").lower()
-        return f"{self._agg_prefix}:{category}:{safe_event}:{bucket_ms}:{route_hash}"
+        return f"{self._agg_prefix}:{category}:{_safe_event(event_name)}:{bucket_ms}:{route_hash}"
+
+    def _window_key(
+        self, category: str, event_name: str, hour_ms: int, route: str | None = None
+    ) -> str:
+        key = f"{self._sketch_prefix}:{category}:{_safe_event(event_name)}:{hour_ms}"
+        return f"{key}:r:{_hash_route(route)}" if route is not None else key
+
+
+def _safe_event(event_name: str) -> str:
+    return event_name.replace(":", "_").replace(" ", "_").lower()
+
+
+def _decode(value: Any) -> str:
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode("utf-8")
+    return str(value)
 
 
 __all__ = ["RumRedisRepository", "RumAggregate"]
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import logging
 import uuid
+from collections.abc import Sequence
 from datetime import UTC, datetime
 from typing import Any
 
@@ -15,6 +16,14 @@ from packages.core.db import get_async_engine
 logger = logging.getLogger(__name__)
 
 
+_INSERT_SQL = text(
+    """
+    INSERT INTO telemetry_rum_events (id, event, url, ts_ms, occurred_at, payload)
+    VALUES (cast(:id as uuid), :event, :url, :ts_ms, :occurred_at, CAST(:payload AS jsonb))
+    """
+)
+
+
 def _coerce_int(value: Any, default: int = 0) -> int:
     try:
         return int(value)  # type: ignore[arg-type]
@@ -30,34 +39,35 @@ class RumSQLRepository(IRumRepository):
             self._engine = get_async_engine("telemetry-rum", url=engine)
 
     async def add(self, event: dict[str, Any]) -> None:
+        await self.add_many([event])
+
+    async def add_many(self, events: Sequence[dict[str, Any]]) -> int:
+        if not events:
+            return 0
+        now_ms = int(datetime.now(UTC).timestamp() * 1000)
+        params = [self._row(event, now_ms) for event in events]
+        async with self._engine.begin() as conn:
+            await conn.execute(_INSERT_SQL, params)
+        return len(params)
+
+    @staticmethod
+    def _row(event: dict[str, Any], now_ms: int) -> dict[str, Any]:
         payload = dict(event or {})
         name = str(payload.get("event") or "").strip() or "unknown"
         url = str(payload.get("url") or "").strip() or "unknown"
         ts_value = payload.get("ts")
-        if isinstance(ts_value, (int, float)):
-            ts_ms = int(ts_value)
-        else:
-            ts_ms = int(datetime.now(UTC).timestamp() * 1000)
+        ts_ms = int(ts_value) if isinstance(ts_value, (int, float)) else now_ms
         payload["event"] = name
         payload["url"] = url
         payload["ts"] = ts_ms
-        occurred_at = datetime.fromtimestamp(ts_ms / 1000.0, tz=UTC)
-        sql = text(
-            """
-            INSERT INTO telemetry_rum_events (id, event, url, ts_ms, occurred_at, payload)
-            VALUES (cast(:id as uuid), :event, :url, :ts_ms, :occurred_at, CAST(:payload AS jsonb))
-            """
-        )
-        params = {
+        return {
             "id": str(uuid.uuid4()),
             "event": name,
             "url": url,
             "ts_ms": ts_ms,
-            "occurred_at": occurred_at,
+            "occurred_at": datetime.fromtimestamp(ts_ms / 1000.0, tz=UTC),
             "payload": json.dumps(payload),
         }
-        async with self._engine.begin() as conn:
-            await conn.execute(sql, params)
 
     async def list(self, limit: int) -> list[dict[str, Any]]:
         lim = max(int(limit), 0)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 from fastapi import APIRouter, Depends, Query, Request
@@ -7,6 +8,7 @@ from fastapi import APIRouter, Depends, Query, Request
 from apps.backend.app.api_gateway.routers import get_container
 from domains.platform.iam.security import require_admin
 from domains.platform.telemetry.application.event_metrics_service import event_metrics
+from domains.platform.telemetry.application.fleet_metrics_service import FleetView
 from domains.platform.telemetry.application.metrics_registry import llm_metrics
 from domains.platform.telemetry.application.transition_metrics_service import (
     transition_metrics,
@@ -21,6 +23,13 @@ except ImportError:  # pragma: no cover
     REGISTRY = None  # type: ignore
 
 
+async def _fleet_view(req: Request) -> FleetView | None:
+    fleet = getattr(get_container(req).telemetry, "fleet_metrics", None)
+    if fleet is None:
+        return None
+    return await asyncio.to_thread(fleet.collect)
+
+
 def make_router() -> APIRouter:
     router = APIRouter(
         prefix="/v1/admin/telemetry", tags=["admin-telemetry"]
@@ -55,15 +64,32 @@ def make_router() -> APIRouter:
         container = get_container(req)
         return await container.telemetry.rum_service.summary(window)
 
+    @router.get(
+        "/rum/percentiles",
+        dependencies=(optional_rate_limiter(times=60, seconds=60)),
+    )
+    async def rum_percentiles(
+        req: Request,
+        event: str = Query(default="navigation", min_length=1, max_length=100),
+        route: str | None = Query(default=None, min_length=1, max_length=512),
+        window_minutes: int = Query(default=60, ge=1, le=7 * 24 * 60),
+        _admin: None = Depends(require_admin),
+    ) -> dict[str, Any]:
+        container = get_container(req)
+        return await container.telemetry.rum_service.percentiles(
+            event, route=route, window_minutes=window_minutes
+        )
+
     @router.get("/summary")
     async def telemetry_summary(
         req: Request, _admin: None = Depends(require_admin)
     ) -> dict[str, Any]:
         container = get_container(req)
         rum = await container.telemetry.rum_service.summary(window=500)
+        view = await _fleet_view(req)
         return {
-            "llm": llm_metrics.snapshot(),
-            "workers": worker_metrics.snapshot(),
+            "llm": (view.merged("llm") if view else llm_metrics).snapshot(),
+            "workers": (view.merged("worker") if view else worker_metrics).snapshot(),
             "events": {
                 "counts": event_metrics.snapshot(),
                 "handlers": event_metrics.handler_snapshot(),
@@ -94,11 +120,15 @@ def make_router() -> APIRouter:
                     if sample.name.endswith("_sum"):
                         method = sample.labels.get("method", "GET")
                         path = sample.labels.get("path", "unknown")
-                        d_sum[(method, path)] = float(sample.value)
+                        d_sum[(method, path)] = d_sum.get((method, path), 0.0) + float(
+                            sample.value
+                        )
                     elif sample.name.endswith("_count"):
                         method = sample.labels.get("method", "GET")
                         path = sample.labels.get("path", "unknown")
-                        d_cnt[(method, path)] = float(sample.value)
+                        d_cnt[(method, path)] = d_cnt.get((method, path), 0.0) + float(
+                            sample.value
+                        )
         # Aggregate per (method,path)
         rows: list[dict[str, Any]] = []
         seen_keys: set[tuple[str, str]] = set()
@@ -133,12 +163,47 @@ def make_router() -> APIRouter:
         return _http_summary_from_registry(top=50)
 
     @router.get("/llm/summary")
-    async def llm_summary(_admin: None = Depends(require_admin)) -> dict[str, Any]:
-        return llm_metrics.snapshot()
+    async def llm_summary(
+        req: Request, _admin: None = Depends(require_admin)
+    ) -> dict[str, Any]:
+        view = await _fleet_view(req)
+        return (view.merged("llm") if view else llm_metrics).snapshot()
 
     @router.get("/workers/summary")
-    async def workers_summary(_admin: None = Depends(require_admin)) -> dict[str, Any]:
-        return worker_metrics.snapshot()
+    async def workers_summary(
+        req: Request, _admin: None = Depends(require_admin)
+    ) -> dict[str, Any]:
+        view = await _fleet_view(req)
+        return (view.merged("worker") if view else worker_metrics).snapshot()
+
+    @router.get("/fleet")
+    async def fleet_instances(
+        req: Request, _admin: None = Depends(require_admin)
+    ) -> dict[str, Any]:
+        fleet = getattr(get_container(req).telemetry, "fleet_metrics", None)
+        view = await _fleet_view(req)
+        if fleet is None or view is None:
+            return {"shared": False, "instances": [], "flush": {}}
+        return {
+            "shared": view.shared,
+            "collected_at": view.collected_at.isoformat(),
+            "instances": [
+                {
+                    "instance": item.instance,
+                    "role": item.role,
+                    "host": item.host,
+                    "pid": item.pid,
+                    "local": item.local,
+                    "stale": item.stale,
+                    "last_flush": item.last_flush.isoformat(),
+                    "age_s": item.age_s,
+                    "flush_ms": item.flush_ms,
+                    "workers": view.for_instance(item, "worker").snapshot(),
+                }
+                for item in view.instances
+            ],
+            "flush": fleet.stats(),
+        }
 
     @router.get("/events/summary")
     async def events_summary(_admin: None = Depends(require_admin)) -> dict[str, Any]:
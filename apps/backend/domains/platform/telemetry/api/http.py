@@ -1,13 +1,23 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import zlib
 from typing import Any
 
 from fastapi import APIRouter, HTTPException, Request, Response
 
 try:  # optional dependency
-    from prometheus_client import generate_latest  # type: ignore
+    from prometheus_client import REGISTRY, generate_latest  # type: ignore
+    from prometheus_client.openmetrics.exposition import (  # type: ignore
+        CONTENT_TYPE_LATEST as OPENMETRICS_CONTENT_TYPE,
+    )
+    from prometheus_client.openmetrics.exposition import (  # type: ignore
+        generate_latest as generate_openmetrics,
+    )
 except ImportError:  # pragma: no cover - optional import
-    generate_latest = None  # type: ignore
+    generate_latest = generate_openmetrics = REGISTRY = None  # type: ignore
+    OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
 try:  # optional dependency
     from fastapi_limiter import FastAPILimiter  # type: ignore
 except ImportError:  # pragma: no cover - optional import
@@ -29,26 +39,65 @@ from domains.platform.telemetry.application.ux_metrics_service import (
 from domains.platform.telemetry.application.worker_metrics_service import (
     worker_metrics,
 )
+from domains.platform.telemetry.domain.metrics import dropped_series_exposition
 from packages.fastapi_rate_limit import optional_rate_limiter
 
+MAX_RUM_BATCH_BYTES = 1024 * 1024
+
+
+def _decode_batch_body(raw: bytes, encoding: str | None) -> bytes:
+    if (encoding or "").strip().lower() != "gzip":
+        if len(raw) > MAX_RUM_BATCH_BYTES:
+            raise HTTPException(status_code=413, detail="rum_batch_too_large")
+        return raw
+    inflater = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+    try:
+        body = inflater.decompress(raw, MAX_RUM_BATCH_BYTES + 1)
+    except zlib.error as exc:
+        raise HTTPException(status_code=400, detail="invalid_gzip") from exc
+    if len(body) > MAX_RUM_BATCH_BYTES or inflater.unconsumed_tail:
+        raise HTTPException(status_code=413, detail="rum_batch_too_large")
+    return body
+
 
 def make_router() -> APIRouter:
     router = APIRouter(prefix="/v1")
 
     @router.get("/metrics", include_in_schema=False)
-    async def metrics() -> Response:
+    async def metrics(req: Request) -> Response:
         if generate_latest is None:
             raise HTTPException(
                 status_code=503, detail="prometheus_client not installed"
             )
-        text = (
-            generate_latest().decode()
-            + worker_metrics.prometheus()
-            + event_metrics.prometheus()
-            + ux_metrics.prometheus()
-            + transition_metrics.prometheus()
-            + llm_metrics.prometheus()
+        # Exemplars only exist in OpenMetrics; Prometheus asks for it when
+        # exemplar storage is enabled.
+        om = "application/openmetrics-text" in req.headers.get("accept", "")
+        # Worker and LLM series are summed over every process that flushes
+        # to the fleet store, so scraping any replica shows the whole fleet.
+        fleet = getattr(get_container(req).telemetry, "fleet_metrics", None)
+        if fleet is not None:
+            view = await asyncio.to_thread(fleet.collect)
+            fleet_text = (
+                view.merged("worker").prometheus(openmetrics=om)
+                + view.merged("llm").prometheus(openmetrics=om)
+                + view.prometheus()
+            )
+        else:
+            fleet_text = "".join(
+                source.prometheus(openmetrics=om) for source in (worker_metrics, llm_metrics)
+            )
+        own = (
+            event_metrics.prometheus(openmetrics=om)
+            + ux_metrics.prometheus(openmetrics=om)
+            + transition_metrics.prometheus(openmetrics=om)
+            + fleet_text
+            # Every registry reports overflow here; rendered once per scrape.
+            + dropped_series_exposition(openmetrics=om)
         )
+        if om:
+            base = generate_openmetrics(REGISTRY).decode().removesuffix("# EOF\n")
+            return Response(base + own + "# EOF\n", media_type=OPENMETRICS_CONTENT_TYPE)
+        text = generate_latest().decode() + own
         return Response(text, media_type="text/plain; version=0.0.4")
 
     limiter_deps = ()
@@ -65,4 +114,28 @@ def make_router() -> APIRouter:
         await container.telemetry.rum_service.record(payload)
         return {"ok": True}
 
+    @router.post(
+        "/metrics/rum/batch",
+        dependencies=limiter_deps,
+    )
+    async def rum_metrics_batch(req: Request) -> dict[str, Any]:
+        container = get_container(req)
+        body = _decode_batch_body(
+            await req.body(), req.headers.get("content-encoding")
+        )
+        try:
+            payload = json.loads(body or b"null")
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail="invalid_json") from exc
+        events = payload.get("events") if isinstance(payload, dict) else payload
+        if not isinstance(events, list):
+            raise HTTPException(status_code=400, detail="events_array_required")
+        max_events = int(
+            getattr(container.settings, "rum_batch_max_events", 500) or 500
+        )
+        if len(events) > max_events:
+            raise HTTPException(status_code=413, detail="rum_batch_too_many_events")
+        result = await container.telemetry.rum_service.record_batch(events)
+        return {"ok": True, **result.as_dict()}
+
     return router
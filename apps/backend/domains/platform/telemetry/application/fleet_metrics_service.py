@@ -0,0 +1,408 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any, Protocol
+
+from domains.platform.telemetry.ports.fleet_metrics_port import (
+    IFleetMetricsStore,
+    InstanceRecord,
+)
+
+try:
+    from redis.exceptions import RedisError  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - optional dependency
+    RedisError = OSError  # type: ignore[misc, assignment]
+
+logger = logging.getLogger(__name__)
+
+SeriesKey = tuple[str, ...]
+
+# Field names repeat across processes and reads; decoded ones are memoized.
+_MAX_DECODED_FIELDS = 50_000
+
+
+class MetricsSource(Protocol):
+    """In-process metrics that can be flattened and rebuilt from summed series."""
+
+    def export_series(self) -> Mapping[SeriesKey, float]: ...
+
+    def from_series(self, series: Mapping[SeriesKey, float]) -> Any: ...
+
+
+@dataclass(frozen=True)
+class ProcessIdentity:
+    instance: str
+    role: str
+    host: str
+    pid: int
+    started_at: float
+
+    def meta(self) -> dict[str, str]:
+        return {
+            "role": self.role,
+            "host": self.host,
+            "pid": str(self.pid),
+            "started_at": f"{self.started_at:.3f}",
+        }
+
+
+_identity: ProcessIdentity | None = None
+_identity_lock = threading.Lock()
+
+
+def process_identity(role: str = "api") -> ProcessIdentity:
+    """Identity of the current process; ``role`` only applies on first use.
+
+    Recomputed after a fork so pre-forked server workers get their own id.
+    """
+
+    global _identity
+    with _identity_lock:
+        if _identity is None or _identity.pid != os.getpid():
+            host = socket.gethostname()
+            pid = os.getpid()
+            started = time.time()
+            _identity = ProcessIdentity(
+                instance=f"{role}@{host}:{pid}:{int(started)}",
+                role=role,
+                host=host,
+                pid=pid,
+                started_at=started,
+            )
+        return _identity
+
+
+@dataclass(frozen=True)
+class InstanceView:
+    instance: str
+    role: str
+    host: str
+    pid: int | None
+    last_flush: datetime
+    age_s: float
+    stale: bool
+    local: bool
+    flush_ms: float | None
+    series: dict[str, dict[SeriesKey, float]] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class FleetView:
+    """Series of every known process, summed on demand per source."""
+
+    collected_at: datetime
+    instances: tuple[InstanceView, ...]
+    sources: Mapping[str, MetricsSource]
+    shared: bool
+
+    @property
+    def stale(self) -> list[InstanceView]:
+        return [item for item in self.instances if item.stale]
+
+    def merged_series(self, source: str) -> dict[SeriesKey, float]:
+        # Stale processes keep their counters: their work still happened.
+        merged: dict[SeriesKey, float] = {}
+        for item in self.instances:
+            for key, value in item.series.get(source, {}).items():
+                merged[key] = merged.get(key, 0.0) + value
+        return merged
+
+    def merged(self, source: str) -> Any:
+        return self.sources[source].from_series(self.merged_series(source))
+
+    def for_instance(self, item: InstanceView, source: str) -> Any:
+        return self.sources[source].from_series(item.series.get(source, {}))
+
+    def prometheus(self) -> str:
+        # Gauges only: identical in the text format and OpenMetrics.
+        lines = [
+            "# HELP telemetry_fleet_instance_up Process flushed metrics within the"
+            " staleness window",
+            "# TYPE telemetry_fleet_instance_up gauge",
+        ]
+        for item in self.instances:
+            labels = f'instance="{item.instance}",role="{item.role}"'
+            lines.append(f"telemetry_fleet_instance_up{{{labels}}} {0 if item.stale else 1}")
+        lines.append(
+            "# HELP telemetry_fleet_last_flush_age_seconds Seconds since the last flush"
+        )
+        lines.append("# TYPE telemetry_fleet_last_flush_age_seconds gauge")
+        for item in self.instances:
+            labels = f'instance="{item.instance}",role="{item.role}"'
+            lines.append(f"telemetry_fleet_last_flush_age_seconds{{{labels}}} {item.age_s}")
+        lines.append("# HELP telemetry_fleet_flush_duration_ms Duration of the last flush (ms)")
+        lines.append("# TYPE telemetry_fleet_flush_duration_ms gauge")
+        for item in self.instances:
+            if item.flush_ms is None:
+                continue
+            labels = f'instance="{item.instance}",role="{item.role}"'
+            lines.append(f"telemetry_fleet_flush_duration_ms{{{labels}}} {item.flush_ms}")
+        return "\n".join(lines) + "\n"
+
+
+def _as_datetime(ts: float) -> datetime:
+    return datetime.fromtimestamp(ts, tz=UTC)
+
+
+class FleetMetrics:
+    """Cross-process view of in-memory metric sources.
+
+    Every process periodically flushes what its sources accumulated since the
+    previous flush into the shared store; ``collect`` reads all processes back,
+    marks those that stopped flushing as stale and substitutes live values for
+    the current process. Without a store the view is the local process only.
+    """
+
+    def __init__(
+        self,
+        sources: Mapping[str, MetricsSource],
+        *,
+        store: IFleetMetricsStore | None = None,
+        identity: ProcessIdentity | None = None,
+        flush_interval: float = 10.0,
+        stale_after: float = 30.0,
+        retention_s: int = 3600,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._sources = dict(sources)
+        self._store = store
+        self._identity = identity
+        self._interval = max(0.5, float(flush_interval))
+        self._stale_after = max(self._interval, float(stale_after))
+        self._retention = max(int(self._stale_after) + 1, int(retention_s))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._flushed: dict[SeriesKey, float] = {}
+        self._fields: dict[SeriesKey, str] = {}
+        self._keys: dict[str, SeriesKey | None] = {}
+        # The first flush and any flush after the store may have expired our
+        # hash overwrite it instead of adding deltas.
+        self._needs_full = True
+        self._last_ok = 0.0
+        self._stats = {"flushes": 0, "errors": 0, "last_ms": 0.0, "total_ms": 0.0, "max_ms": 0.0}
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    @property
+    def identity(self) -> ProcessIdentity:
+        return self._identity or process_identity()
+
+    @property
+    def shared(self) -> bool:
+        return self._store is not None
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            stats = dict(self._stats)
+        flushes = stats["flushes"] or 1
+        stats["avg_ms"] = stats["total_ms"] / flushes
+        return stats
+
+    def _export(self) -> dict[SeriesKey, float]:
+        series: dict[SeriesKey, float] = {}
+        for name, source in self._sources.items():
+            try:
+                exported = source.export_series()
+            except RuntimeError:
+                # Another thread resized a dict mid-iteration; next flush catches up.
+                exported = {
+                    key[1:]: value for key, value in self._flushed.items() if key[0] == name
+                }
+            for key, value in exported.items():
+                series[(name, *key)] = float(value)
+        return series
+
+    def _field(self, key: SeriesKey) -> str:
+        encoded = self._fields.get(key)
+        if encoded is None:
+            encoded = json.dumps(key, separators=(",", ":"), ensure_ascii=False)
+            self._fields[key] = encoded
+        return encoded
+
+    def flush(self) -> int:
+        """Push changes since the previous flush; returns how many series were sent."""
+
+        if self._store is None:
+            return 0
+        started = time.perf_counter()
+        with self._lock:
+            now = self._clock()
+            current = self._export()
+            replace = self._needs_full
+            if replace:
+                deltas = current
+            else:
+                deltas = {}
+                for key, value in current.items():
+                    delta = value - self._flushed.get(key, 0.0)
+                    if delta:
+                        deltas[key] = delta
+                for key, value in self._flushed.items():
+                    if key not in current and value:
+                        deltas[key] = -value  # the source was reset
+            meta = self.identity.meta()
+            meta["flush_ms"] = f"{self._stats['last_ms']:.3f}"
+            meta["series"] = str(len(current))
+            try:
+                self._store.push(
+                    self.identity.instance,
+                    meta=meta,
+                    deltas={self._field(key): value for key, value in deltas.items()},
+                    replace=replace,
+                    flushed_at=now,
+                    retention_s=self._retention,
+                )
+            except (RedisError, OSError) as exc:
+                self._stats["errors"] += 1
+                if now - self._last_ok > self._retention / 2:
+                    self._needs_full = True
+                logger.debug("Fleet metrics flush failed: %s", exc)
+                return 0
+            self._flushed = current
+            self._needs_full = False
+            self._last_ok = now
+            elapsed_ms = (time.perf_counter() - started) * 1000.0
+            self._stats["flushes"] += 1
+            self._stats["last_ms"] = elapsed_ms
+            self._stats["total_ms"] += elapsed_ms
+            self._stats["max_ms"] = max(self._stats["max_ms"], elapsed_ms)
+        return len(deltas)
+
+    def _decode(self, record: InstanceRecord) -> dict[str, dict[SeriesKey, float]]:
+        series: dict[str, dict[SeriesKey, float]] = {}
+        if len(self._keys) > _MAX_DECODED_FIELDS:
+            self._keys.clear()
+        for raw, value in record.series.items():
+            if raw in self._keys:
+                key = self._keys[raw]
+            else:
+                try:
+                    key = tuple(str(part) for part in json.loads(raw))
+                except (TypeError, ValueError):
+                    key = None
+                if key is not None and (len(key) < 2 or key[0] not in self._sources):
+                    key = None
+                self._keys[raw] = key
+            if key is None:
+                continue
+            series.setdefault(key[0], {})[key[1:]] = value
+        return series
+
+    def _local_view(self, now: float) -> InstanceView:
+        identity = self.identity
+        series: dict[str, dict[SeriesKey, float]] = {}
+        for key, value in self._export().items():
+            series.setdefault(key[0], {})[key[1:]] = value
+        stats = self._stats
+        return InstanceView(
+            instance=identity.instance,
+            role=identity.role,
+            host=identity.host,
+            pid=identity.pid,
+            last_flush=_as_datetime(now),
+            age_s=0.0,
+            stale=False,
+            local=True,
+            flush_ms=stats["last_ms"] if stats["flushes"] else None,
+            series=series,
+        )
+
+    def collect(self) -> FleetView:
+        """Read every process from the store (blocking; call via a thread in async code)."""
+
+        now = self._clock()
+        records: list[InstanceRecord] = []
+        shared = self._store is not None
+        if self._store is not None:
+            try:
+                records = self._store.read(now=now, retention_s=self._retention)
+            except (RedisError, OSError) as exc:
+                logger.warning("Fleet metrics unavailable, using local metrics: %s", exc)
+                shared = False
+        local_id = self.identity.instance
+        views: list[InstanceView] = []
+        for record in records:
+            if record.instance == local_id:
+                continue
+            age = max(0.0, now - record.last_flush)
+            pid = record.meta.get("pid")
+            flush_ms = record.meta.get("flush_ms")
+            views.append(
+                InstanceView(
+                    instance=record.instance,
+                    role=record.meta.get("role", "unknown"),
+                    host=record.meta.get("host", "unknown"),
+                    pid=int(pid) if pid and pid.isdigit() else None,
+                    last_flush=_as_datetime(record.last_flush),
+                    age_s=round(age, 3),
+                    stale=age > self._stale_after,
+                    local=False,
+                    flush_ms=float(flush_ms) if flush_ms else None,
+                    series=self._decode(record),
+                )
+            )
+        views.sort(key=lambda item: (item.role, item.instance))
+        views.insert(0, self._local_view(now))
+        return FleetView(
+            collected_at=_as_datetime(now),
+            instances=tuple(views),
+            sources=self._sources,
+            shared=shared,
+        )
+
+    # Background flushing
+
+    def start(self) -> None:
+        """Flush every ``flush_interval`` seconds on a daemon thread."""
+
+        if self._store is None or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="fleet-metrics-flush", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            try:
+                self.flush()
+            except Exception:  # pragma: no cover - keep the thread alive
+                logger.exception("Fleet metrics flush crashed")
+
+    def stop(self, *, final_flush: bool = True) -> None:
+        thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._stop.set()
+        thread.join(timeout=self._interval)
+        if final_flush:
+            self.flush()
+
+
+def default_sources() -> dict[str, MetricsSource]:
+    from domains.platform.telemetry.application.metrics_registry import llm_metrics
+    from domains.platform.telemetry.application.worker_metrics_service import (
+        worker_metrics,
+    )
+
+    return {"worker": worker_metrics, "llm": llm_metrics}
+
+
+__all__ = [
+    "FleetMetrics",
+    "FleetView",
+    "InstanceView",
+    "MetricsSource",
+    "ProcessIdentity",
+    "default_sources",
+    "process_identity",
+]
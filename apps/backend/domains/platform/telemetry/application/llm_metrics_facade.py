@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
+
 from domains.platform.telemetry.ports.llm_metrics_port import (
     ILLMMetricsSink,
     LLMCallLabels,
@@ -24,8 +26,17 @@ class LLMMetricsFacade:
     def observe_cost(self, labels: LLMCallLabels, cost: float) -> None:
         self._sink.observe_cost(labels, cost)
 
-    def prometheus(self) -> str:
-        return self._sink.prometheus()
+    def prometheus(self, *, openmetrics: bool = False) -> str:
+        return self._sink.prometheus(openmetrics=openmetrics)
+
+    def export_series(self) -> dict[tuple[str, ...], float]:
+        export = getattr(self._sink, "export_series", None)
+        return export() if callable(export) else {}
+
+    def from_series(self, series: Mapping[tuple[str, ...], float]) -> LLMMetricsFacade:
+        """Facade over a sink of the same type rebuilt from merged series."""
+
+        return LLMMetricsFacade(type(self._sink).from_series(series))  # type: ignore[attr-defined]
 
     def snapshot(self) -> dict:
         """Lightweight JSON snapshot for admin UI."""
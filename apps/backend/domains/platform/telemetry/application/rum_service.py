@@ -2,10 +2,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from statistics import mean
+import math
+import random
+import time
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass
 from typing import Any
 
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 try:  # optional dependency
     from redis.exceptions import RedisError  # type: ignore[import-untyped]
@@ -19,6 +23,8 @@ except ImportError:  # pragma: no cover - optional
     SQLAlchemyError = Exception  # type: ignore[misc, assignment]
 
 
+from domains.platform.telemetry.domain.rum import normalise_route
+from domains.platform.telemetry.domain.sketch import DEFAULT_QUANTILES, QuantileSketch
 from domains.platform.telemetry.ports.rum_port import IRumRepository
 
 log = logging.getLogger(__name__)
@@ -42,9 +48,150 @@ class RUMEvent(BaseModel):
     data: dict[str, Any] | None = None
 
 
+_BATCH_ADAPTER = TypeAdapter(list[RUMEvent])
+_MIN_PRESSURE_FACTOR = 0.05
+
+
+@dataclass(slots=True)
+class RumBatchResult:
+    received: int
+    accepted: int = 0
+    rejected: int = 0
+    sampled_out: int = 0
+    shed: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+def _is_error_event(name: str) -> bool:
+    lowered = name.lower()
+    return lowered.startswith("ui_") or "error" in lowered
+
+
+def _sample_weight(rate: float) -> int | None:
+    """Keep one event in ``weight``; ``None`` when nothing is kept.
+
+    ``rate`` is rounded down to ``1/n`` so the weight stays a whole number
+    and can scale counts and sketch bins exactly.
+    """
+    if rate <= 0.0:
+        return None
+    return max(1, math.ceil(1.0 / rate - 1e-9))
+
+
+def _weight_of(item: dict[str, Any]) -> int:
+    weight = item.get("sample_weight")
+    return int(weight) if isinstance(weight, (int, float)) and weight >= 1 else 1
+
+
 class RumMetricsService:
-    def __init__(self, repo: IRumRepository | None) -> None:
+    def __init__(
+        self,
+        repo: IRumRepository | None,
+        *,
+        sample_rate: float = 1.0,
+        max_inflight_writes: int = 16,
+        slow_write_ms: float = 50.0,
+        rng: random.Random | None = None,
+    ) -> None:
         self._repo = repo
+        self._sample_rate = min(max(float(sample_rate), 0.0), 1.0)
+        self._max_inflight = max(int(max_inflight_writes), 1)
+        self._slow_write_ms = max(float(slow_write_ms), 1.0)
+        self._rng = rng or random.Random()
+        self._inflight = 0
+        self._write_ewma_ms = 0.0
+        self._pressure = 1.0
+
+    @property
+    def effective_sample_rate(self) -> float:
+        return self._sample_rate * self._pressure
+
+    async def record_batch(self, payloads: Sequence[Any]) -> RumBatchResult:
+        """Validate, sample and store a beacon batch with one repository write.
+
+        The whole list goes through one pydantic-core validation; invalid items
+        are dropped individually. Error events are never sampled. When writes
+        get slow the sample rate for other events backs off, and batches that
+        arrive while ``max_inflight_writes`` are pending keep only errors.
+        Every kept event carries ``sample_weight`` (1 for errors), which the
+        aggregates multiply counts, sums and percentiles by; ``sampled_out`` and
+        ``shed`` count events actually dropped.
+        """
+        result = RumBatchResult(received=len(payloads))
+        if self._repo is None or not payloads:
+            return result
+        events = self._validate_batch(payloads, result)
+        if not events:
+            return result
+
+        overloaded = self._inflight >= self._max_inflight
+        weight = _sample_weight(self.effective_sample_rate)
+        kept: list[dict[str, Any]] = []
+        for event in events:
+            if _is_error_event(event["event"]):
+                event["sample_weight"] = 1
+                kept.append(event)
+            elif overloaded:
+                result.shed += 1
+            elif weight is not None and (weight == 1 or self._rng.random() * weight < 1.0):
+                event["sample_weight"] = weight
+                kept.append(event)
+            else:
+                result.sampled_out += 1
+        if not kept:
+            return result
+
+        self._inflight += 1
+        started = time.perf_counter()
+        try:
+            await self._repo.add_many(kept)
+        except _STORAGE_ERRORS as exc:  # pragma: no cover - backend failure
+            log.warning("Failed to store RUM batch of %s events: %s", len(kept), exc)
+            result.shed += len(kept)
+            self._observe_write(self._slow_write_ms * 4)
+            return result
+        finally:
+            self._inflight -= 1
+        self._observe_write((time.perf_counter() - started) * 1000.0)
+        result.accepted = len(kept)
+        return result
+
+    def _validate_batch(
+        self, payloads: Sequence[Any], result: RumBatchResult
+    ) -> list[dict[str, Any]]:
+        items = list(payloads)
+        try:
+            models = _BATCH_ADAPTER.validate_python(items)
+        except ValidationError as exc:
+            bad = {
+                err["loc"][0]
+                for err in exc.errors()
+                if err.get("loc") and isinstance(err["loc"][0], int)
+            }
+            if not bad:
+                result.rejected = len(items)
+                return []
+            result.rejected = len(bad)
+            items = [item for index, item in enumerate(items) if index not in bad]
+            try:
+                models = _BATCH_ADAPTER.validate_python(items)
+            except ValidationError:  # pragma: no cover - defensive
+                result.rejected += len(items)
+                return []
+        return [model.model_dump() for model in models]
+
+    def _observe_write(self, elapsed_ms: float) -> None:
+        self._write_ewma_ms = (
+            elapsed_ms
+            if self._write_ewma_ms == 0.0
+            else 0.8 * self._write_ewma_ms + 0.2 * elapsed_ms
+        )
+        if self._write_ewma_ms > self._slow_write_ms:
+            self._pressure = max(self._pressure / 2.0, _MIN_PRESSURE_FACTOR)
+        elif self._pressure < 1.0:
+            self._pressure = min(self._pressure * 1.25, 1.0)
 
     async def record(self, payload: dict[str, Any]) -> None:
         if self._repo is None:
@@ -99,29 +246,33 @@ class RumMetricsService:
     async def summary(self, window: int) -> dict[str, Any]:
         items = await self.list_events(limit=window)
         counts: dict[str, int] = {}
-        login_durations: list[float] = []
-        nav_ttfb: list[float] = []
-        nav_dcl: list[float] = []
-        nav_load: list[float] = []
+        # (value, sample weight) pairs
+        login_durations: list[tuple[float, int]] = []
+        nav_ttfb: list[tuple[float, int]] = []
+        nav_dcl: list[tuple[float, int]] = []
+        nav_load: list[tuple[float, int]] = []
         for it in items:
             ev = str(it.get("event", "") or "")
-            counts[ev] = counts.get(ev, 0) + 1
+            weight = _weight_of(it)
+            counts[ev] = counts.get(ev, 0) + weight
             if ev == "login_attempt":
                 d = it.get("data", {})
                 if isinstance(d, dict) and isinstance(d.get("dur_ms"), (int, float)):
-                    login_durations.append(float(d["dur_ms"]))
+                    login_durations.append((float(d["dur_ms"]), weight))
             elif ev == "navigation":
                 d = it.get("data", {})
                 if isinstance(d, dict):
                     if isinstance(d.get("ttfb"), (int, float)):
-                        nav_ttfb.append(float(d["ttfb"]))
+                        nav_ttfb.append((float(d["ttfb"]), weight))
                     if isinstance(d.get("domContentLoaded"), (int, float)):
-                        nav_dcl.append(float(d["domContentLoaded"]))
+                        nav_dcl.append((float(d["domContentLoaded"]), weight))
                     if isinstance(d.get("loadEvent"), (int, float)):
-                        nav_load.append(float(d["loadEvent"]))
+                        nav_load.append((float(d["loadEvent"]), weight))
 
-        def avg(arr: list[float]) -> float | None:
-            return round(mean(arr), 2) if arr else None
+        def avg(arr: list[tuple[float, int]]) -> float | None:
+            if not arr:
+                return None
+            return round(sum(v * w for v, w in arr) / sum(w for _, w in arr), 2)
 
         return {
             "window": window,
@@ -134,5 +285,61 @@ class RumMetricsService:
             },
         }
 
+    async def percentiles(
+        self,
+        event: str,
+        *,
+        route: str | None = None,
+        window_minutes: int = 60,
+        quantiles: Sequence[float] = DEFAULT_QUANTILES,
+    ) -> dict[str, Any]:
+        """Per-metric percentiles of ``event`` over the trailing window.
+
+        Redis storage answers from hourly DDSketches (the window is widened
+        to whole hours); other backends sketch the recent raw events.
+        ``route`` (a URL or ``host/path``) limits the result to one route.
+        """
+        until_ms = int(time.time() * 1000)
+        since_ms = until_ms - max(int(window_minutes), 1) * 60_000
+        normalised = normalise_route(route) if route else None
+        sketches: dict[str, QuantileSketch] = {}
+        loader = getattr(self._repo, "load_window_sketches", None)
+        if loader is not None:
+            sketches = await loader(event, since_ms, until_ms, route=normalised)
+        elif self._repo is not None:
+            for item in await self._repo.list(5000):
+                if str(item.get("event") or "") != event:
+                    continue
+                if normalised is not None and (
+                    normalise_route(str(item.get("url") or "")) != normalised
+                ):
+                    continue
+                ts = item.get("ts")
+                if isinstance(ts, (int, float)) and ts < since_ms:
+                    continue
+                data = item.get("data")
+                if not isinstance(data, dict):
+                    continue
+                weight = _weight_of(item)
+                for name, value in data.items():
+                    if isinstance(value, (int, float)) and math.isfinite(value):
+                        sketches.setdefault(str(name), QuantileSketch()).add(
+                            float(value), weight
+                        )
+        metrics: dict[str, Any] = {}
+        for name in sorted(sketches):
+            sketch = sketches[name]
+            values = {
+                label: round(value, 3) if value is not None else None
+                for label, value in sketch.quantiles(quantiles).items()
+            }
+            metrics[name] = {"count": sketch.count, **values}
+        return {
+            "event": event,
+            "route": normalised,
+            "window_minutes": window_minutes,
+            "metrics": metrics,
+        }
+
 
-__all__ = ["RumMetricsService", "RUMEvent"]
+__all__ = ["RumBatchResult", "RumMetricsService", "RUMEvent"]
@@ -1,124 +1,104 @@
 from __future__ import annotations
 
-import threading
-from collections import defaultdict
+from domains.platform.telemetry.domain.metrics import RATIO_BUCKETS, MetricsRegistry
+
+_ENTROPY_BUCKETS = (0.25, 0.5, 1, 1.5, 2, 3, 4, 6, 8)
+_MAX_MODES = 64
 
 
 class TransitionMetrics:
     def __init__(self) -> None:
-        self._lock = threading.Lock()
-        self.latency_sum: dict[str, float] = defaultdict(float)
-        self.latency_count: dict[str, int] = defaultdict(int)
-        self.no_route: dict[str, int] = defaultdict(int)
-        self.fallback: dict[str, int] = defaultdict(int)
-        self.entropy_sum: dict[str, float] = defaultdict(float)
-        self.entropy_count: dict[str, int] = defaultdict(int)
-        self.repeat_sum: dict[str, float] = defaultdict(float)
-        self.repeat_count: dict[str, int] = defaultdict(int)
-        self.novelty_sum: dict[str, float] = defaultdict(float)
-        self.novelty_count: dict[str, int] = defaultdict(int)
+        self.registry = MetricsRegistry()
+        self._latency = self.registry.histogram(
+            "transition_latency_ms", "Transition latency (ms)", ("mode",), max_series=_MAX_MODES
+        )
+        self._no_route = self.registry.counter(
+            "transition_no_route", "Transitions without a route", ("mode",), max_series=_MAX_MODES
+        )
+        self._fallback = self.registry.counter(
+            "transition_fallback",
+            "Transitions served by fallback",
+            ("mode",),
+            max_series=_MAX_MODES,
+        )
+        self._entropy = self.registry.histogram(
+            "transition_entropy",
+            "Entropy of transition choices",
+            ("mode",),
+            buckets=_ENTROPY_BUCKETS,
+            max_series=_MAX_MODES,
+        )
+        self._repeat = self.registry.histogram(
+            "transition_repeat_rate",
+            "Share of repeated nodes",
+            ("mode",),
+            buckets=RATIO_BUCKETS,
+            max_series=_MAX_MODES,
+        )
+        self._novelty = self.registry.histogram(
+            "transition_novelty_rate",
+            "Share of novel nodes",
+            ("mode",),
+            buckets=RATIO_BUCKETS,
+            max_series=_MAX_MODES,
+        )
 
     def _key(self, mode: str | None) -> str:
         value = (mode or "default").strip().lower()
         return value or "default"
 
     def observe_latency(self, mode: str | None, ms: float) -> None:
-        key = self._key(mode)
-        with self._lock:
-            self.latency_sum[key] += float(ms)
-            self.latency_count[key] += 1
+        self._latency.observe(ms, self._key(mode))
 
     def observe_repeat_rate(self, mode: str | None, rate: float) -> None:
-        key = self._key(mode)
-        with self._lock:
-            self.repeat_sum[key] += float(rate)
-            self.repeat_count[key] += 1
+        self._repeat.observe(rate, self._key(mode))
 
     def observe_novelty_rate(self, mode: str | None, rate: float) -> None:
-        key = self._key(mode)
-        with self._lock:
-            self.novelty_sum[key] += float(rate)
-            self.novelty_count[key] += 1
+        self._novelty.observe(rate, self._key(mode))
 
     def observe_entropy(self, mode: str | None, entropy: float) -> None:
-        key = self._key(mode)
-        with self._lock:
-            self.entropy_sum[key] += float(entropy)
-            self.entropy_count[key] += 1
+        self._entropy.observe(entropy, self._key(mode))
 
     def inc_no_route(self, mode: str | None) -> None:
-        key = self._key(mode)
-        with self._lock:
-            self.no_route[key] += 1
+        self._no_route.inc(self._key(mode))
 
     def inc_fallback(self, mode: str | None) -> None:
-        key = self._key(mode)
-        with self._lock:
-            self.fallback[key] += 1
-
-    def prometheus(self) -> str:
-        lines: list[str] = []
-        lines.append("# HELP transition_latency_ms Average transition latency (ms)")
-        lines.append("# TYPE transition_latency_ms gauge")
-        with self._lock:
-            keys = set(self.latency_count.keys())
-            for mode in keys:
-                count = self.latency_count[mode]
-                avg = self.latency_sum[mode] / count if count else 0.0
-                lines.append(f'transition_latency_ms{{mode="{mode}"}} {avg}')
-                no_r = self.no_route.get(mode, 0)
-                fb = self.fallback.get(mode, 0)
-                nr_ratio = no_r / count if count else 0.0
-                fb_ratio = fb / count if count else 0.0
-                lines.append(f'no_route_ratio{{mode="{mode}"}} {nr_ratio}')
-                lines.append(f'fallback_ratio{{mode="{mode}"}} {fb_ratio}')
-                ent_sum = self.entropy_sum.get(mode, 0.0)
-                ent_cnt = self.entropy_count.get(mode, 0)
-                ent_avg = ent_sum / ent_cnt if ent_cnt else 0.0
-                lines.append(f'entropy{{mode="{mode}"}} {ent_avg}')
-                rep_sum = self.repeat_sum.get(mode, 0.0)
-                rep_cnt = self.repeat_count.get(mode, 0)
-                rep_avg = rep_sum / rep_cnt if rep_cnt else 0.0
-                lines.append(f'repeat_rate{{mode="{mode}"}} {rep_avg}')
-                nov_sum = self.novelty_sum.get(mode, 0.0)
-                nov_cnt = self.novelty_count.get(mode, 0)
-                nov_avg = nov_sum / nov_cnt if nov_cnt else 0.0
-                lines.append(f'novelty_rate{{mode="{mode}"}} {nov_avg}')
-        return "\n".join(lines) + "\n"
+        self._fallback.inc(self._key(mode))
+
+    def reset(self) -> None:
+        self.registry.reset()
+
+    def prometheus(self, *, openmetrics: bool = False) -> str:
+        return self.registry.exposition(openmetrics=openmetrics)
 
     def snapshot(self) -> list[dict[str, object]]:
         """JSON snapshot with averages/ratios per mode."""
+
+        def _avg(stats: tuple[int, float]) -> float:
+            count, total = stats
+            return total / count if count else 0.0
+
+        no_route = self._no_route.values()
+        fallback = self._fallback.values()
+        entropy = self._entropy.series()
+        repeat = self._repeat.series()
+        novelty = self._novelty.series()
         out: list[dict[str, object]] = []
-        with self._lock:
-            keys = set(self.latency_count.keys())
-            for mode in keys:
-                count = self.latency_count.get(mode, 0)
-                avg = (self.latency_sum.get(mode, 0.0) / count) if count else 0.0
-                no_r = self.no_route.get(mode, 0)
-                fb = self.fallback.get(mode, 0)
-                nr_ratio = (no_r / count) if count else 0.0
-                fb_ratio = (fb / count) if count else 0.0
-                ent_avg = self.entropy_sum.get(mode, 0.0) / max(
-                    self.entropy_count.get(mode, 0), 1
-                )
-                rep_avg = self.repeat_sum.get(mode, 0.0) / max(
-                    self.repeat_count.get(mode, 0), 1
-                )
-                nov_avg = self.novelty_sum.get(mode, 0.0) / max(
-                    self.novelty_count.get(mode, 0), 1
-                )
-                out.append(
-                    {
-                        "mode": mode,
-                        "avg_latency_ms": avg,
-                        "no_route_ratio": nr_ratio,
-                        "fallback_ratio": fb_ratio,
-                        "entropy": ent_avg,
-                        "repeat_rate": rep_avg,
-                        "novelty_rate": nov_avg,
-                        "count": count,
-                    }
-                )
+        for key, (count, total) in self._latency.series().items():
+            mode = key[0]
+            out.append(
+                {
+                    "mode": mode,
+                    "avg_latency_ms": (total / count) if count else 0.0,
+                    "p95_latency_ms": self._latency.quantile(0.95, mode),
+                    "no_route_ratio": (no_route.get(key, 0.0) / count) if count else 0.0,
+                    "fallback_ratio": (fallback.get(key, 0.0) / count) if count else 0.0,
+                    "entropy": _avg(entropy.get(key, (0, 0.0))),
+                    "repeat_rate": _avg(repeat.get(key, (0, 0.0))),
+                    "novelty_rate": _avg(novelty.get(key, (0, 0.0))),
+                    "count": count,
+                }
+            )
         return out
 
 
@@ -1,73 +1,48 @@
 from __future__ import annotations
 
-import threading
-from collections import deque
+from domains.platform.telemetry.domain.metrics import MetricsRegistry
+
+_FIRST_SAVE_BUCKETS = (1, 2, 5, 10, 20, 30, 60, 120, 300, 600, 1800)
 
 
 class UXMetrics:
     def __init__(self) -> None:
-        self._lock = threading.Lock()
-        self._first_save: deque[float] = deque(maxlen=1000)
-        self._published_total = 0
-        self._published_with_tags = 0
-        self._save_next_total = 0
+        self.registry = MetricsRegistry()
+        self._first_save = self.registry.histogram(
+            "app_ux_time_to_first_save_seconds",
+            "Time to first save",
+            buckets=_FIRST_SAVE_BUCKETS,
+        )
+        self._published = self.registry.counter(
+            "app_ux_published_nodes", "Published nodes by whether they have tags", ("tagged",)
+        )
+        self._save_next = self.registry.counter("app_ux_save_next", "Count of Save & Next actions")
 
     def record_first_save(self, seconds: float) -> None:
-        with self._lock:
-            self._first_save.append(seconds)
+        self._first_save.observe(seconds)
 
     def record_publish(self, has_tags: bool) -> None:
-        with self._lock:
-            self._published_total += 1
-            if has_tags:
-                self._published_with_tags += 1
+        self._published.inc("true" if has_tags else "false")
 
     def inc_save_next(self) -> None:
-        with self._lock:
-            self._save_next_total += 1
+        self._save_next.inc()
+
+    def reset(self) -> None:
+        self.registry.reset()
 
-    def prometheus(self) -> str:
-        with self._lock:
-            avg = (
-                sum(self._first_save) / len(self._first_save)
-                if self._first_save
-                else 0.0
-            )
-            ratio = (
-                self._published_with_tags / self._published_total
-                if self._published_total
-                else 0.0
-            )
-            lines = [
-                "# HELP app_ux_time_to_first_save_seconds_avg Average time to first save",
-                "# TYPE app_ux_time_to_first_save_seconds_avg gauge",
-                f"app_ux_time_to_first_save_seconds_avg {avg}",
-                "# HELP app_ux_tagged_ratio Ratio of published nodes with tags",
-                "# TYPE app_ux_tagged_ratio gauge",
-                f"app_ux_tagged_ratio {ratio}",
-                "# HELP app_ux_save_next_total Count of Save & Next actions",
-                "# TYPE app_ux_save_next_total counter",
-                f"app_ux_save_next_total {self._save_next_total}",
-            ]
-            return "\n".join(lines) + "\n"
+    def prometheus(self, *, openmetrics: bool = False) -> str:
+        return self.registry.exposition(openmetrics=openmetrics)
 
     def snapshot(self) -> dict[str, float | int]:
-        with self._lock:
-            avg = (
-                sum(self._first_save) / len(self._first_save)
-                if self._first_save
-                else 0.0
-            )
-            ratio = (
-                self._published_with_tags / self._published_total
-                if self._published_total
-                else 0.0
-            )
-            return {
-                "time_to_first_save_avg_s": float(avg),
-                "published_tagged_ratio": float(ratio),
-                "save_next_total": int(self._save_next_total),
-            }
+        count, total = self._first_save.stats()
+        tagged = self._published.value("true")
+        published = tagged + self._published.value("false")
+        return {
+            "time_to_first_save_avg_s": float(total / count) if count else 0.0,
+            "time_to_first_save_p95_s": self._first_save.quantile(0.95),
+            "published_tagged_ratio": float(tagged / published) if published else 0.0,
+            "save_next_total": int(self._save_next.value()),
+        }
 
 
 ux_metrics = UXMetrics()
@@ -1,48 +1,100 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 
+from domains.platform.telemetry.domain.metrics import MetricsRegistry
+
+# Flat series keys: (family, *labels[, "bucket", le | "sum"])
+Series = dict[tuple[str, ...], float]
+
+_JOB_STATUSES = ("started", "completed", "failed")
+
 
 class WorkerMetrics:
     def __init__(self) -> None:
-        self.counters: dict[str, int] = {"started": 0, "completed": 0, "failed": 0}
-        self.duration_sum_ms: float = 0.0
-        self.duration_count: int = 0
-        self.cost_usd_total: float = 0.0
-        self.tokens_prompt_total: int = 0
-        self.tokens_completion_total: int = 0
-        self.stage_counts: dict[str, int] = {}
-        self.stage_duration_sum_ms: dict[str, float] = {}
+        self.registry = MetricsRegistry()
+        self._jobs = self.registry.counter(
+            "ai_worker_jobs", "Total AI generation jobs by status", ("status",), max_series=64
+        )
+        self._duration = self.registry.histogram(
+            "ai_worker_job_duration_ms", "Job duration (ms)"
+        )
+        self._cost = self.registry.counter(
+            "ai_worker_cost_usd", "Total cost of generated jobs (USD)"
+        )
+        self._tokens = self.registry.counter(
+            "ai_worker_tokens", "Total tokens across jobs by type", ("type",), max_series=4
+        )
+        self._stages = self.registry.histogram(
+            "ai_worker_stage_duration_ms", "Stage duration (ms)", ("stage",), max_series=200
+        )
+        self._init_series()
+
+    def _init_series(self) -> None:
+        for status in _JOB_STATUSES:
+            self._jobs.inc(status, amount=0)
+
+    def reset(self) -> None:
+        self.registry.reset()
+        self._init_series()
 
     def inc(self, key: str, by: int = 1) -> None:
-        self.counters[key] = self.counters.get(key, 0) + by
+        self._jobs.inc(key, amount=by)
 
-    def observe_duration(self, ms: float) -> None:
-        self.duration_sum_ms += float(ms)
-        self.duration_count += 1
+    def observe_duration(self, ms: float, *, exemplar: Mapping[str, str] | None = None) -> None:
+        self._duration.observe(ms, exemplar=exemplar)
 
     def observe_job(
         self, *, cost_usd: float, prompt_tokens: int, completion_tokens: int
     ) -> None:
-        self.cost_usd_total += float(cost_usd)
-        self.tokens_prompt_total += int(prompt_tokens)
-        self.tokens_completion_total += int(completion_tokens)
+        self._cost.inc(amount=float(cost_usd))
+        self._tokens.inc("prompt", amount=int(prompt_tokens))
+        self._tokens.inc("completion", amount=int(completion_tokens))
 
     def observe_stage(self, stage: str, ms: float) -> None:
-        s = stage or "unknown"
-        self.stage_counts[s] = self.stage_counts.get(s, 0) + 1
-        self.stage_duration_sum_ms[s] = self.stage_duration_sum_ms.get(s, 0.0) + float(
-            ms
-        )
+        self._stages.observe(ms, stage or "unknown")
+
+    # Read-only views kept from the dict-based implementation.
+
+    @property
+    def counters(self) -> dict[str, int]:
+        return {key[0]: int(value) for key, value in self._jobs.values().items()}
+
+    @property
+    def duration_count(self) -> int:
+        return self._duration.stats()[0]
+
+    @property
+    def duration_sum_ms(self) -> float:
+        return self._duration.stats()[1]
+
+    @property
+    def cost_usd_total(self) -> float:
+        return self._cost.value()
+
+    @property
+    def tokens_prompt_total(self) -> int:
+        return int(self._tokens.value("prompt"))
+
+    @property
+    def tokens_completion_total(self) -> int:
+        return int(self._tokens.value("completion"))
+
+    @property
+    def stage_counts(self) -> dict[str, int]:
+        return {key[0]: count for key, (count, _) in self._stages.series().items()}
+
+    @property
+    def stage_duration_sum_ms(self) -> dict[str, float]:
+        return {key[0]: total for key, (_, total) in self._stages.series().items()}
 
     def snapshot(self) -> dict[str, Any]:
+        count, total = self._duration.stats()
         out: dict[str, Any] = {
-            "jobs": dict(self.counters),
-            "job_avg_ms": (
-                (self.duration_sum_ms / self.duration_count)
-                if self.duration_count
-                else 0.0
-            ),
+            "jobs": self.counters,
+            "job_avg_ms": (total / count) if count else 0.0,
+            "job_p95_ms": self._duration.quantile(0.95),
             "cost_usd_total": self.cost_usd_total,
             "tokens": {
                 "prompt": self.tokens_prompt_total,
@@ -50,44 +102,23 @@ class WorkerMetrics:
             },
             "stages": {},
         }
-        for k, cnt in self.stage_counts.items():
-            ssum = self.stage_duration_sum_ms.get(k, 0.0)
-            out["stages"][k] = {"count": cnt, "avg_ms": (ssum / cnt) if cnt else 0.0}
+        for (stage,), (cnt, ssum) in self._stages.series().items():
+            out["stages"][stage] = {"count": cnt, "avg_ms": (ssum / cnt) if cnt else 0.0}
         return out
 
-    def prometheus(self) -> str:
-        lines = []
-        lines.append("# HELP ai_worker_jobs_total Total AI generation jobs by status")
-        lines.append("# TYPE ai_worker_jobs_total counter")
-        for k, v in self.counters.items():
-            lines.append(f'ai_worker_jobs_total{{status="{k}"}} {v}')
-        avg = (
-            (self.duration_sum_ms / self.duration_count) if self.duration_count else 0.0
-        )
-        lines.append("# HELP ai_worker_job_duration_ms_avg Average job duration (ms)")
-        lines.append("# TYPE ai_worker_job_duration_ms_avg gauge")
-        lines.append(f"ai_worker_job_duration_ms_avg {avg}")
-        lines.append(
-            "# HELP ai_worker_cost_usd_total Total cost of generated jobs (USD)"
-        )
-        lines.append("# TYPE ai_worker_cost_usd_total counter")
-        lines.append(f"ai_worker_cost_usd_total {self.cost_usd_total}")
-        lines.append("# HELP ai_worker_tokens_total Total tokens across jobs by type")
-        lines.append("# TYPE ai_worker_tokens_total counter")
-        lines.append(
-            f'ai_worker_tokens_total{{type="prompt"}} {self.tokens_prompt_total}'
-        )
-        lines.append(
-            f'ai_worker_tokens_total{{type="completion"}} {self.tokens_completion_total}'
-        )
-        lines.append("# HELP ai_worker_stage_avg_ms Average stage duration (ms)")
-        lines.append("# TYPE ai_worker_stage_avg_ms gauge")
-        for k, cnt in self.stage_counts.items():
-            ssum = self.stage_duration_sum_ms.get(k, 0.0)
-            avg_ms = (ssum / cnt) if cnt else 0.0
-            lines.append(f'ai_worker_stage_avg_ms{{stage="{k}"}} {avg_ms}')
-            lines.append(f'ai_worker_stage_total{{stage="{k}"}} {cnt}')
-        return "\n".join(lines) + "\n"
+    def export_series(self) -> Series:
+        """Cumulative values as flat series, so several processes can be summed."""
+
+        return self.registry.export()
+
+    @classmethod
+    def from_series(cls, series: Mapping[tuple[str, ...], float]) -> WorkerMetrics:
+        metrics = cls()
+        metrics.registry.load(series)
+        return metrics
+
+    def prometheus(self, *, openmetrics: bool = False) -> str:
+        return self.registry.exposition(openmetrics=openmetrics)
 
 
 worker_metrics = WorkerMetrics()
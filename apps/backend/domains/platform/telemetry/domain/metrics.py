@@ -0,0 +1,524 @@
+"""Low-overhead in-process metrics with Prometheus/OpenMetrics exposition.
+
+Writes go to one of ``SHARDS`` lock-guarded shards picked per thread, so
+threads observing the same family rarely wait on each other. Every write
+marks its series dirty; exposition re-renders only dirty series and returns
+the cached text unchanged while nothing was written.
+
+Families cap their label combinations at ``max_series``; later combinations
+are folded into one series whose labels are all ``"__overflow__"``. Folded
+observations are counted once per process in ``DROPPED_SERIES``, which the
+``/v1/metrics`` handler renders after all registries.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+try:  # optional dependency: exemplars from the active trace
+    from opentelemetry import trace as _otel_trace  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional dependency
+    _otel_trace = None
+
+SHARDS = 8
+OVERFLOW = "__overflow__"
+DEFAULT_MS_BUCKETS: tuple[float, ...] = (
+    5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000,
+)
+RATIO_BUCKETS: tuple[float, ...] = (0.05, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0)
+
+Labels = tuple[str, ...]
+Exemplar = Mapping[str, str]
+
+_thread_slots = itertools.count()
+_local = threading.local()
+
+
+def _shard_index() -> int:
+    try:
+        return _local.shard
+    except AttributeError:
+        _local.shard = next(_thread_slots) % SHARDS
+        return _local.shard
+
+
+def trace_exemplar() -> dict[str, str] | None:
+    """``{"trace_id": ...}`` of the current OpenTelemetry span, if any."""
+
+    if _otel_trace is None:
+        return None
+    context = _otel_trace.get_current_span().get_span_context()
+    if not context.is_valid:
+        return None
+    return {"trace_id": format(context.trace_id, "032x")}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _fmt(value: float) -> str:
+    try:
+        whole = int(value)
+    except OverflowError:
+        return "+Inf" if value > 0 else "-Inf"
+    except ValueError:
+        return "NaN"
+    return str(whole) if whole == value else repr(float(value))
+
+
+def _label_text(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Shard:
+    __slots__ = ("lock", "values", "dirty", "exemplars")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.values: dict[Labels, Any] = {}
+        self.dirty: set[Labels] = set()
+        self.exemplars: dict[tuple[Labels, int], tuple[Exemplar, float, float]] = {}
+
+
+class MetricFamily:
+    kind = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        *,
+        max_series: int = 1000,
+    ) -> None:
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self.max_series = max(1, int(max_series))
+        self.dropped = 0
+        self._shards = tuple(_Shard() for _ in range(SHARDS))
+        self._known: set[Labels] = set()
+        self._label_texts: dict[Labels, str] = {}
+        self._admit_lock = threading.Lock()
+        self._render_lock = threading.Lock()
+        self._version = 0
+        # openmetrics flag -> (version, text) and per-series rendered lines
+        self._cache: dict[bool, tuple[int, str]] = {}
+        self._lines: dict[bool, dict[Labels, str]] = {False: {}, True: {}}
+        self._pending: dict[bool, set[Labels]] = {False: set(), True: set()}
+
+    def _key(self, labels: tuple[Any, ...], *, report: bool = True) -> Labels:
+        if labels in self._known:
+            return labels
+        key = tuple(str(value) for value in labels)
+        if key in self._known:
+            return key
+        if len(key) != len(self.labelnames):
+            raise ValueError(f"{self.name}: expected labels {self.labelnames}, got {key}")
+        with self._admit_lock:
+            if key in self._known:
+                return key
+            if len(self._known) < self.max_series:
+                self._label_texts[key] = _label_text(self.labelnames, key)
+                self._known.add(key)
+                return key
+            self.dropped += 1
+        if report and self is not DROPPED_SERIES:
+            DROPPED_SERIES.inc(self.name)
+        overflow = (OVERFLOW,) * len(self.labelnames)
+        self._label_texts.setdefault(overflow, _label_text(self.labelnames, overflow))
+        return overflow
+
+    def _labels_of(self, key: Labels) -> str:
+        text = self._label_texts.get(key)
+        if text is None:
+            text = self._label_texts[key] = _label_text(self.labelnames, key)
+        return text
+
+    def _merge(self, a: Any, b: Any) -> Any:
+        raise NotImplementedError
+
+    def _merged(self, keys: Iterable[Labels] | None = None) -> dict[Labels, Any]:
+        merged: dict[Labels, Any] = {}
+        wanted = set(keys) if keys is not None else None
+        copy = self._copy
+        for shard in self._shards:
+            with shard.lock:
+                if wanted is None:
+                    items = [(k, copy(v)) for k, v in shard.values.items()]
+                elif len(wanted) * 4 > len(shard.values):
+                    items = [(k, copy(v)) for k, v in shard.values.items() if k in wanted]
+                else:
+                    values = shard.values
+                    items = [(k, copy(values[k])) for k in wanted if k in values]
+            for key, value in items:
+                merged[key] = self._merge(merged[key], value) if key in merged else value
+        return merged
+
+    def _copy(self, value: Any) -> Any:
+        return value
+
+    def reset(self) -> None:
+        with self._admit_lock:
+            self._known.clear()
+            self._label_texts.clear()
+            self.dropped = 0
+        for shard in self._shards:
+            with shard.lock:
+                shard.values.clear()
+                shard.dirty.clear()
+                shard.exemplars.clear()
+        self._lines = {False: {}, True: {}}
+        self._pending = {False: set(), True: set()}
+        self._cache.clear()
+        self._version += 1
+
+    # Exposition
+
+    def _header(self, openmetrics: bool) -> str:
+        name = self.name
+        if self.kind == "counter" and not openmetrics:
+            name = f"{self.name}_total"
+        kind = self.kind if self.kind != "untyped" or openmetrics else "untyped"
+        return f"# HELP {name} {self.help}\n# TYPE {name} {kind}\n"
+
+    def _render_series(
+        self, key: Labels, value: Any, exemplars: Mapping[int, tuple], openmetrics: bool
+    ) -> str:
+        raise NotImplementedError
+
+    def render(self, *, openmetrics: bool = False) -> str:
+        version = self._version
+        cached = self._cache.get(openmetrics)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        with self._render_lock:
+            return self._render(version, openmetrics)
+
+    def _render(self, version: int, openmetrics: bool) -> str:
+        drained: set[Labels] = set()
+        for shard in self._shards:
+            with shard.lock:
+                if shard.dirty:
+                    drained |= shard.dirty
+                    shard.dirty = set()
+        for pending in self._pending.values():
+            pending |= drained
+        lines = self._lines[openmetrics]
+        todo = self._pending[openmetrics]
+        self._pending[openmetrics] = set()
+        if todo:
+            values = self._merged(None if not lines else todo)
+            exemplars = self._exemplars(todo) if openmetrics else {}
+            lines.update(self._render_many(values, exemplars, openmetrics))
+        text = self._header(openmetrics) + "".join(lines.values())
+        self._cache[openmetrics] = (version, text)
+        return text
+
+    def _render_many(
+        self, values: Mapping[Labels, Any], exemplars: Mapping[Labels, dict], openmetrics: bool
+    ) -> dict[Labels, str]:
+        empty: dict[int, tuple] = {}
+        return {
+            key: self._render_series(key, value, exemplars.get(key, empty), openmetrics)
+            for key, value in values.items()
+        }
+
+    def _exemplars(self, keys: set[Labels]) -> dict[Labels, dict[int, tuple]]:
+        latest: dict[Labels, dict[int, tuple]] = {}
+        for shard in self._shards:
+            with shard.lock:
+                found = [
+                    (key, bucket, entry)
+                    for (key, bucket), entry in shard.exemplars.items()
+                    if key in keys
+                ]
+            for key, bucket, entry in found:
+                current = latest.setdefault(key, {}).get(bucket)
+                if current is None or entry[2] > current[2]:
+                    latest[key][bucket] = entry
+        return latest
+
+    # Flat series for cross-process aggregation
+
+    def export(self) -> dict[tuple[str, ...], float]:
+        raise NotImplementedError
+
+    def load(self, key: tuple[str, ...], value: float) -> None:
+        raise NotImplementedError
+
+
+class Counter(MetricFamily):
+    kind = "counter"
+
+    def inc(self, *labels: Any, amount: float = 1.0) -> None:
+        key = labels if labels in self._known else self._key(labels)
+        self._add(key, amount)
+
+    def _add(self, key: Labels, amount: float) -> None:
+        shard = self._shards[_shard_index()]
+        with shard.lock:
+            shard.values[key] = shard.values.get(key, 0.0) + amount
+            shard.dirty.add(key)
+        self._version += 1
+
+    def _merge(self, a: float, b: float) -> float:
+        return a + b
+
+    def values(self) -> dict[Labels, float]:
+        return self._merged()
+
+    def value(self, *labels: Any) -> float:
+        key = tuple(str(value) for value in labels)
+        return self._merged([key]).get(key, 0.0)
+
+    def _render_series(self, key, value, exemplars, openmetrics) -> str:
+        return f"{self.name}_total{self._labels_of(key)} {_fmt(value)}\n"
+
+    def _render_many(self, values, exemplars, openmetrics) -> dict[Labels, str]:
+        name, labels_of = f"{self.name}_total", self._labels_of
+        return {key: f"{name}{labels_of(key)} {_fmt(value)}\n" for key, value in values.items()}
+
+    def export(self) -> dict[tuple[str, ...], float]:
+        return {(self.name, *key): value for key, value in self._merged().items()}
+
+    def load(self, key: tuple[str, ...], value: float) -> None:
+        # Series merged from other processes were counted where they dropped.
+        self._add(self._key(key, report=False), float(value))
+
+
+class Histogram(MetricFamily):
+    """Cumulative-bucket histogram; each bucket keeps its latest exemplar."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        *,
+        buckets: Sequence[float] = DEFAULT_MS_BUCKETS,
+        max_series: int = 1000,
+        trace_exemplars: bool = True,
+    ) -> None:
+        super().__init__(name, help_text, labelnames, max_series=max_series)
+        bounds = sorted({float(b) for b in buckets if not math.isinf(float(b))})
+        if not bounds:
+            raise ValueError(f"{name}: at least one finite bucket is required")
+        self.bounds = tuple(bounds)
+        self._le = tuple(_fmt(b) for b in self.bounds) + ("+Inf",)
+        self._le_labels = tuple(f'le="{le}"' for le in self._le)
+        self._bucket_prefixes: dict[Labels, tuple[str, ...]] = {}
+        self._trace_exemplars = trace_exemplars and _otel_trace is not None
+
+    def observe(self, value: float, *labels: Any, exemplar: Exemplar | None = None) -> None:
+        key = labels if labels in self._known else self._key(labels)
+        bucket = bisect_left(self.bounds, value)
+        if exemplar is None and self._trace_exemplars:
+            exemplar = trace_exemplar()
+        shard = self._shards[_shard_index()]
+        with shard.lock:
+            state = shard.values.get(key)
+            if state is None:
+                # per-bucket (non-cumulative) counts, then the sum
+                state = shard.values[key] = [0] * (len(self.bounds) + 1) + [0.0]
+            state[bucket] += 1
+            state[-1] += value
+            shard.dirty.add(key)
+            if exemplar:
+                shard.exemplars[(key, bucket)] = (exemplar, value, time.time())
+        self._version += 1
+
+    def _copy(self, value: list) -> list:
+        return list(value)
+
+    def _merge(self, a: list, b: list) -> list:
+        return [x + y for x, y in zip(a, b, strict=True)]
+
+    def stats(self, *labels: Any) -> tuple[int, float]:
+        """``(count, sum)`` of one series."""
+
+        key = tuple(str(value) for value in labels)
+        state = self._merged([key]).get(key)
+        if state is None:
+            return 0, 0.0
+        return int(sum(state[:-1])), float(state[-1])
+
+    def series(self) -> dict[Labels, tuple[int, float]]:
+        return {
+            key: (int(sum(state[:-1])), float(state[-1]))
+            for key, state in self._merged().items()
+        }
+
+    def quantile(self, q: float, *labels: Any) -> float:
+        """Estimate by linear interpolation inside the bucket holding ``q``."""
+
+        key = tuple(str(value) for value in labels)
+        state = self._merged([key]).get(key)
+        if state is None:
+            return 0.0
+        counts = state[:-1]
+        total = sum(counts)
+        if not total:
+            return 0.0
+        rank = q * total
+        seen = 0
+        for index, count in enumerate(counts):
+            if count and seen + count >= rank:
+                if index >= len(self.bounds):
+                    return self.bounds[-1]
+                lower = self.bounds[index - 1] if index else 0.0
+                return lower + (self.bounds[index] - lower) * ((rank - seen) / count)
+            seen += count
+        return self.bounds[-1]
+
+    def _render_series(self, key, value, exemplars, openmetrics) -> str:
+        parts: list[str] = []
+        cumulative = 0
+        prefixes = self._bucket_prefixes.get(key)
+        if prefixes is None:
+            prefixes = self._bucket_prefixes[key] = tuple(
+                f"{self.name}_bucket{_label_text(self.labelnames, key, le_label)} "
+                for le_label in self._le_labels
+            )
+        for index, prefix in enumerate(prefixes):
+            cumulative += value[index]
+            line = f"{prefix}{cumulative}"
+            exemplar = exemplars.get(index)
+            if exemplar is not None:
+                labels, observed, ts = exemplar
+                line += (
+                    f" # {_label_text(tuple(labels), tuple(labels.values())) or '{}'}"
+                    f" {_fmt(observed)} {ts:.3f}"
+                )
+            parts.append(line + "\n")
+        labels_text = self._labels_of(key)
+        parts.append(f"{self.name}_sum{labels_text} {_fmt(value[-1])}\n")
+        parts.append(f"{self.name}_count{labels_text} {cumulative}\n")
+        return "".join(parts)
+
+    def export(self) -> dict[tuple[str, ...], float]:
+        series: dict[tuple[str, ...], float] = {}
+        for key, state in self._merged().items():
+            for index, le in enumerate(self._le):
+                if state[index]:
+                    series[(self.name, *key, "bucket", le)] = float(state[index])
+            series[(self.name, *key, "sum")] = float(state[-1])
+        return series
+
+    def load(self, key: tuple[str, ...], value: float) -> None:
+        if key and key[-1] == "sum":
+            labels, bucket = key[:-1], None
+        elif len(key) >= 2 and key[-2] == "bucket" and key[-1] in self._le:
+            labels, bucket = key[:-2], self._le.index(key[-1])
+        else:
+            return
+        series = self._key(labels, report=False)
+        shard = self._shards[_shard_index()]
+        with shard.lock:
+            state = shard.values.get(series)
+            if state is None:
+                state = shard.values[series] = [0] * (len(self.bounds) + 1) + [0.0]
+            if bucket is None:
+                state[-1] += float(value)
+            else:
+                state[bucket] += int(value)
+            shard.dirty.add(series)
+        self._version += 1
+
+
+class MetricsRegistry:
+    """Families of one service, exposed together and cached as a whole."""
+
+    def __init__(self) -> None:
+        self._families: dict[str, MetricFamily] = {}
+        self._cache: dict[bool, tuple[tuple[int, ...], str]] = {}
+
+    def _add(self, family: MetricFamily) -> Any:
+        if family.name in self._families:
+            raise ValueError(f"metric already registered: {family.name}")
+        self._families[family.name] = family
+        return family
+
+    def counter(
+        self, name: str, help_text: str, labelnames: Sequence[str] = (), **kwargs: Any
+    ) -> Counter:
+        return self._add(Counter(name, help_text, labelnames, **kwargs))
+
+    def histogram(
+        self, name: str, help_text: str, labelnames: Sequence[str] = (), **kwargs: Any
+    ) -> Histogram:
+        return self._add(Histogram(name, help_text, labelnames, **kwargs))
+
+    def exposition(self, *, openmetrics: bool = False) -> str:
+        families = list(self._families.values())
+        versions = tuple(family._version for family in families)
+        cached = self._cache.get(openmetrics)
+        if cached is not None and cached[0] == versions:
+            return cached[1]
+        text = "".join(family.render(openmetrics=openmetrics) for family in families)
+        self._cache[openmetrics] = (versions, text)
+        return text
+
+    def export(self) -> dict[tuple[str, ...], float]:
+        series: dict[tuple[str, ...], float] = {}
+        for family in self._families.values():
+            series.update(family.export())
+        return series
+
+    def load(self, series: Mapping[tuple[str, ...], float]) -> None:
+        for key, value in series.items():
+            family = self._families.get(key[0]) if key else None
+            if family is not None:
+                try:
+                    family.load(tuple(key[1:]), value)
+                except ValueError:
+                    continue
+
+    def reset(self) -> None:
+        for family in self._families.values():
+            family.reset()
+        self._cache.clear()
+
+
+# One family for the whole process: every registry reports into it, so
+# ``/v1/metrics`` exposes it exactly once.
+DROPPED_SERIES = Counter(
+    "telemetry_metric_series_dropped",
+    "Observations folded into the overflow series",
+    ("metric",),
+)
+
+
+def dropped_series_exposition(*, openmetrics: bool = False) -> str:
+    """``DROPPED_SERIES`` in the requested format, or ``""`` while nothing dropped."""
+
+    if not DROPPED_SERIES._known:
+        return ""
+    return DROPPED_SERIES.render(openmetrics=openmetrics)
+
+
+__all__ = [
+    "Counter",
+    "DROPPED_SERIES",
+    "DEFAULT_MS_BUCKETS",
+    "Histogram",
+    "MetricFamily",
+    "MetricsRegistry",
+    "OVERFLOW",
+    "RATIO_BUCKETS",
+    "SHARDS",
+    "dropped_series_exposition",
+    "trace_exemplar",
+]
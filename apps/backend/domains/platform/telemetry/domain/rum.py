@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from urllib.parse import urlparse
+
+# Hourly percentile windows keep this many routes per event; the rest share
+# ``OTHER_ROUTE``.
+MAX_WINDOW_ROUTES = 200
+OTHER_ROUTE = "other"
+
+
+def normalise_route(url: str | None) -> str:
+    """``host/path`` of a beacon URL (query and fragment dropped)."""
+
+    if not url:
+        return "unknown"
+    parsed = urlparse(url)
+    netloc = (parsed.netloc or "").lower()
+    path = parsed.path or "/"
+    route = f"{netloc}{path}" if netloc else path
+    route = route.strip() or "unknown"
+    return route[:256]
+
+
+__all__ = ["MAX_WINDOW_ROUTES", "OTHER_ROUTE", "normalise_route"]
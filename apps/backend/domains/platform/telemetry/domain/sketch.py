@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BINS = 2048
+DEFAULT_QUANTILES = (0.5, 0.75, 0.95, 0.99)
+
+# Values at or below this magnitude land in the zero bin.
+_MIN_INDEXABLE = 1e-9
+ZERO_BIN = "z"
+_NEGATIVE_PREFIX = "n"
+
+
+class QuantileSketch:
+    """Mergeable DDSketch with a fixed relative accuracy.
+
+    Values are counted in logarithmic bins ``ceil(log_gamma(v))``, so every
+    quantile is returned within ``relative_accuracy`` of the true value and two
+    sketches merge by adding bin counts. Bins are addressed by string tokens
+    (``"42"``, ``"n42"`` for negatives, ``"z"`` for zero) so they can live as
+    plain counters in a Redis hash.
+    """
+
+    __slots__ = (
+        "relative_accuracy",
+        "max_bins",
+        "_gamma",
+        "_log_gamma",
+        "_positive",
+        "_negative",
+        "_zero",
+        "count",
+        "min",
+        "max",
+    )
+
+    def __init__(
+        self,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        *,
+        max_bins: int = DEFAULT_MAX_BINS,
+    ) -> None:
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError("relative_accuracy must be within (0, 1)")
+        self.relative_accuracy = float(relative_accuracy)
+        self.max_bins = max(int(max_bins), 16)
+        self._gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive: dict[int, int] = {}
+        self._negative: dict[int, int] = {}
+        self._zero = 0
+        self.count = 0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def key(self, value: float) -> str:
+        """Return the bin token ``value`` is counted under."""
+        magnitude = abs(value)
+        if magnitude <= _MIN_INDEXABLE:
+            return ZERO_BIN
+        index = math.ceil(math.log(magnitude) / self._log_gamma)
+        return f"{_NEGATIVE_PREFIX}{index}" if value < 0 else str(index)
+
+    def add(self, value: float, count: int = 1) -> None:
+        if count <= 0 or not math.isfinite(value):
+            return
+        self.add_bin(self.key(value), count)
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def add_bin(self, token: str, count: int) -> None:
+        if count <= 0:
+            return
+        if token == ZERO_BIN:
+            self._zero += count
+        elif token.startswith(_NEGATIVE_PREFIX):
+            index = int(token[len(_NEGATIVE_PREFIX) :])
+            self._negative[index] = self._negative.get(index, 0) + count
+        else:
+            index = int(token)
+            self._positive[index] = self._positive.get(index, 0) + count
+        self.count += count
+        if len(self._positive) + len(self._negative) > self.max_bins:
+            self._collapse()
+
+    def merge(self, other: QuantileSketch) -> None:
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("cannot merge sketches with different accuracy")
+        for token, count in other.bins():
+            self.add_bin(token, count)
+        for bound in (other.min, other.max):
+            if bound is None:
+                continue
+            self.min = bound if self.min is None else min(self.min, bound)
+            self.max = bound if self.max is None else max(self.max, bound)
+
+    def bins(self) -> Iterable[tuple[str, int]]:
+        if self._zero:
+            yield ZERO_BIN, self._zero
+        for index, count in self._negative.items():
+            yield f"{_NEGATIVE_PREFIX}{index}", count
+        for index, count in self._positive.items():
+            yield str(index), count
+
+    def quantile(self, q: float) -> float | None:
+        if self.count == 0:
+            return None
+        q = min(max(float(q), 0.0), 1.0)
+        rank = q * (self.count - 1)
+        seen = 0
+        value: float | None = None
+        for index in sorted(self._negative, reverse=True):
+            seen += self._negative[index]
+            if seen > rank:
+                value = -self._value(index)
+                break
+        if value is None:
+            seen += self._zero
+            if seen > rank:
+                value = 0.0
+        if value is None:
+            for index in sorted(self._positive):
+                seen += self._positive[index]
+                if seen > rank:
+                    value = self._value(index)
+                    break
+        if value is None:  # pragma: no cover - guarded by count
+            value = self.max or 0.0
+        if self.min is not None:
+            value = max(value, self.min)
+        if self.max is not None:
+            value = min(value, self.max)
+        return value
+
+    def quantiles(
+        self, qs: Iterable[float] = DEFAULT_QUANTILES
+    ) -> dict[str, float | None]:
+        return {quantile_label(q): self.quantile(q) for q in qs}
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "alpha": self.relative_accuracy,
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "bins": dict(self.bins()),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> QuantileSketch:
+        sketch = cls(float(data.get("alpha", DEFAULT_RELATIVE_ACCURACY)))
+        sketch.load_bins((data.get("bins") or {}).items())
+        sketch.min = data.get("min")
+        sketch.max = data.get("max")
+        return sketch
+
+    def load_bins(self, items: Iterable[tuple[str, Any]]) -> None:
+        for token, raw in items:
+            try:
+                count = int(raw)
+            except (TypeError, ValueError):
+                continue
+            try:
+                self.add_bin(str(token), count)
+            except ValueError:
+                continue
+
+    def _value(self, index: int) -> float:
+        # Midpoint of (gamma^(i-1), gamma^i] in relative terms.
+        return 2.0 * math.pow(self._gamma, index) / (self._gamma + 1.0)
+
+    def _collapse(self) -> None:
+        # Fold the lowest-magnitude positive bins together; the tail quantiles
+        # that matter for latency stay accurate.
+        store = self._positive if self._positive else self._negative
+        overflow = len(self._positive) + len(self._negative) - self.max_bins
+        if overflow <= 0 or len(store) < 2:
+            return
+        keys = sorted(store)
+        target = keys[overflow]
+        folded = sum(store.pop(index) for index in keys[:overflow])
+        store[target] = store.get(target, 0) + folded
+
+
+def quantile_label(q: float) -> str:
+    pct = round(float(q) * 100, 3)
+    text = f"{pct:g}".replace(".", "_")
+    return f"p{text}"
+
+
+__all__ = [
+    "DEFAULT_QUANTILES",
+    "DEFAULT_RELATIVE_ACCURACY",
+    "QuantileSketch",
+    "ZERO_BIN",
+    "quantile_label",
+]
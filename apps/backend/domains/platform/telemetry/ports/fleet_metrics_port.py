@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Protocol
+
+
+@dataclass(frozen=True)
+class InstanceRecord:
+    """What one process last flushed: its metadata and cumulative series."""
+
+    instance: str
+    last_flush: float  # unix seconds
+    meta: dict[str, str] = field(default_factory=dict)
+    series: dict[str, float] = field(default_factory=dict)
+
+
+class IFleetMetricsStore(Protocol):
+    def push(
+        self,
+        instance: str,
+        *,
+        meta: Mapping[str, str],
+        deltas: Mapping[str, float],
+        replace: bool,
+        flushed_at: float,
+        retention_s: int,
+    ) -> None:
+        """Add ``deltas`` to the instance series (or overwrite them if ``replace``)."""
+
+    def read(self, *, now: float, retention_s: int) -> list[InstanceRecord]:
+        """Every instance flushed within ``retention_s``; older ones are dropped."""
+
+
+__all__ = ["IFleetMetricsStore", "InstanceRecord"]
@@ -22,7 +22,7 @@ class ILLMMetricsSink(Protocol):
 
     def observe_cost(self, labels: LLMCallLabels, cost: float) -> None: ...
 
-    def prometheus(self) -> str: ...
+    def prometheus(self, *, openmetrics: bool = False) -> str: ...
 
 
 __all__ = ["ILLMMetricsSink", "LLMCallLabels"]
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any, Protocol
 
 
 class IRumRepository(Protocol):
     async def add(self, event: dict[str, Any]) -> None: ...
 
+    async def add_many(self, events: Sequence[dict[str, Any]]) -> int: ...
+
     async def list(self, limit: int) -> list[dict[str, Any]]: ...
 
 
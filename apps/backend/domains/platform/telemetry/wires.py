@@ -10,6 +10,11 @@ try:
 except ImportError:  # pragma: no cover - optional dependency
     redis = None  # type: ignore[assignment]
 
+try:
+    import redis as redis_sync  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - optional dependency
+    redis_sync = None  # type: ignore[assignment]
+
 try:
     from redis.exceptions import RedisError  # type: ignore[import-untyped]
 except ImportError:  # pragma: no cover - optional dependency
@@ -17,14 +22,23 @@ except ImportError:  # pragma: no cover - optional dependency
 
 from sqlalchemy.exc import SQLAlchemyError
 
+from domains.platform.telemetry.adapters.fleet_metrics_redis import (
+    RedisFleetMetricsStore,
+)
 from domains.platform.telemetry.adapters.rum_memory import RumMemoryRepository
 from domains.platform.telemetry.adapters.rum_repository import RumRedisRepository
 from domains.platform.telemetry.adapters.sql.rum import RumSQLRepository
+from domains.platform.telemetry.application.fleet_metrics_service import (
+    FleetMetrics,
+    default_sources,
+    process_identity,
+)
 from domains.platform.telemetry.application.rum_service import (
     RumMetricsService,
 )
 from domains.platform.telemetry.ports.rum_port import IRumRepository
 from packages.core.config import Settings, load_settings, to_async_dsn
+from packages.core.testing import is_test_mode
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +48,7 @@ class TelemetryContainer:
     settings: Settings
     rum_service: RumMetricsService
     rum_repository: IRumRepository | None
+    fleet_metrics: FleetMetrics
 
 
 def _redis_reachable(url: str) -> bool:
@@ -64,6 +79,33 @@ def _database_dsn(settings: Settings) -> str | None:
     return None
 
 
+def build_fleet_metrics(settings: Settings, *, role: str = "api") -> FleetMetrics:
+    """Fleet-wide metrics for this process; local-only without a reachable Redis."""
+
+    store: RedisFleetMetricsStore | None = None
+    enabled = bool(getattr(settings, "telemetry_fleet_enabled", True))
+    redis_url = getattr(settings, "redis_url", None)
+    if enabled and redis_sync is not None and redis_url and not is_test_mode(settings):
+        try:
+            if _redis_reachable(str(redis_url)):
+                client = redis_sync.Redis.from_url(
+                    str(redis_url), decode_responses=True, socket_timeout=1.0
+                )
+                store = RedisFleetMetricsStore(client)
+            else:
+                logger.info("Fleet metrics Redis not reachable, using local metrics")
+        except (RedisError, ValueError) as exc:
+            logger.warning("Fleet metrics Redis misconfigured: %s", exc)
+    return FleetMetrics(
+        default_sources(),
+        store=store,
+        identity=process_identity(role),
+        flush_interval=float(getattr(settings, "telemetry_fleet_flush_interval_sec", 10.0)),
+        stale_after=float(getattr(settings, "telemetry_fleet_stale_after_sec", 30.0)),
+        retention_s=int(getattr(settings, "telemetry_fleet_retention_sec", 3600)),
+    )
+
+
 def build_container(settings: Settings | None = None) -> TelemetryContainer:
     s = settings or load_settings()
     repo: IRumRepository | None = None
@@ -101,8 +143,18 @@ def build_container(settings: Settings | None = None) -> TelemetryContainer:
         )
         repo = RumMemoryRepository(maxlen=1000)
 
-    rum_service = RumMetricsService(repo)
-    return TelemetryContainer(settings=s, rum_service=rum_service, rum_repository=repo)
-
-
-__all__ = ["TelemetryContainer", "build_container"]
+    rum_service = RumMetricsService(
+        repo,
+        sample_rate=float(getattr(s, "rum_sample_rate", 1.0)),
+        max_inflight_writes=int(getattr(s, "rum_max_inflight_writes", 16)),
+        slow_write_ms=float(getattr(s, "rum_slow_write_ms", 50.0)),
+    )
+    return TelemetryContainer(
+        settings=s,
+        rum_service=rum_service,
+        rum_repository=repo,
+        fleet_metrics=build_fleet_metrics(s),
+    )
+
+
+__all__ = ["TelemetryContainer", "build_container", "build_fleet_metrics"]
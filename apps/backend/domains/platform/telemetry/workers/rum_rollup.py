@@ -138,6 +138,7 @@ class RumRollupWorker(PeriodicWorker):
         super().__init__(_WORKER_NAME, _tick, config=config, logger=context.logger)
 
     async def _run_once(self) -> None:
+        await self._repo.trim()
         ready_before_ms = _now_ms() - self._min_age_ms
         aggregates = await self._repo.fetch_pending_aggregates(
             ready_before_ms,
@@ -160,7 +161,7 @@ class RumRollupWorker(PeriodicWorker):
                 self.logger.exception("RUM rollup export failed", exc_info=exc)
                 return
 
-        await self._repo.ack_aggregates(keys)
+        await self._repo.commit_aggregates(aggregates)
         total_events = sum(agg.count for agg in aggregates)
         if exported and self._exporter is not None:
             self.logger.info(
@@ -197,6 +198,10 @@ class RumRollupWorker(PeriodicWorker):
                 entry["sum_squares"] = sq
             if agg.count > 0:
                 entry["avg"] = total / float(agg.count)
+            sketch = agg.sketches.get(name)
+            if sketch is not None and sketch.count:
+                entry.update(sketch.quantiles())
+                entry["sketch"] = sketch.to_dict()
             metrics[name] = entry
         bucket_iso = datetime.fromtimestamp(agg.bucket_ms / 1000, tz=UTC).isoformat()
         return {
@@ -3,13 +3,11 @@ from __future__ import annotations
 import logging
 import uuid as _uuid
 from collections.abc import Callable
-from threading import Lock
 from typing import Any
 
 from sqlalchemy import text
 from sqlalchemy.exc import ProgrammingError
 from sqlalchemy.ext.asyncio import AsyncEngine
-from sqlalchemy.pool import NullPool
 
 from domains.platform.users.domain.models import User
 from domains.platform.users.ports import UsersRepo
@@ -45,11 +43,7 @@ class SQLUsersRepo(UsersRepo):
             self._engine_factory = lambda: get_async_engine(
                 "users.repo",
                 url=sanitized,
-                cache=False,
-                pool_pre_ping=False,
-                poolclass=NullPool,
             )
-        self._engine_lock = Lock()
         self._use_roles_table = True
         self._use_role_column = True
 
@@ -155,16 +149,8 @@ class SQLUsersRepo(UsersRepo):
         factory = self._engine_factory
         if factory is None:
             raise RuntimeError("users repo engine is not configured")
-        with self._engine_lock:
-            if self._engine is None:
-                engine = factory()
-                logger.debug(
-                    "users_repo_engine_created pool=%s pre_ping=%s",
-                    type(engine.sync_engine.pool).__name__,
-                    getattr(engine.sync_engine.pool, "_pre_ping", None),
-                )
-                self._engine = engine
-            return self._engine
+        # Resolved per call: the registry keeps one shared pool per event loop.
+        return factory()
 
 
 __all__ = ["SQLUsersRepo"]
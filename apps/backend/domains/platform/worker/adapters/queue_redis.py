@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
@@ -21,21 +21,49 @@ logger = logging.getLogger(__name__)
 
 
 class RedisWorkerQueue:
-    """Sorted-set based queue for worker jobs (lower score dequeued first)."""
+    """Sorted-set based queue for worker jobs (lower score dequeued first).
 
-    def __init__(self, client: Any, *, key: str = "worker:jobs") -> None:
+    Jobs whose ``available_at`` lies in the future are parked in a separate
+    delayed set scored by due time and promoted into the ready set once due,
+    so scheduled retries are not handed out early.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        key: str = "worker:jobs",
+        delayed_key: str | None = None,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
         self._client = client
         self._key = key
+        self._delayed_key = delayed_key or f"{key}:delayed"
+        self._clock = clock or (lambda: datetime.now(UTC))
 
-    async def push(self, job_id: UUID, priority: int) -> None:
-        score = self._score(priority)
+    async def push(
+        self,
+        job_id: UUID,
+        priority: int,
+        *,
+        available_at: datetime | None = None,
+    ) -> None:
+        now = self._clock()
+        if available_at is not None and available_at > now:
+            member = self._delayed_member(job_id, priority)
+            await self._client.zadd(
+                self._delayed_key, {member: available_at.timestamp()}
+            )
+            return
+        score = self._score(priority, available_at or now)
         await self._client.zadd(self._key, {str(job_id): score})
 
     async def push_many(self, pairs: Sequence[tuple[UUID, int]]) -> None:
         if not pairs:
             return
+        now = self._clock()
         mapping = {
-            str(job_id): self._score(priority, offset=index)
+            str(job_id): self._score(priority, now, offset=index)
             for index, (job_id, priority) in enumerate(pairs)
         }
         await self._client.zadd(self._key, mapping)
@@ -43,8 +71,74 @@ class RedisWorkerQueue:
     async def pop_many(self, limit: int) -> list[UUID]:
         if limit <= 0:
             return []
+        await self.promote_due(limit=max(limit, 100))
         items = await self._client.zpopmin(self._key, limit)
-        return [UUID(value) for value, _score in items]
+        return [UUID(self._decode(value)) for value, _score in items]
+
+    async def pop_blocking(self, limit: int, *, timeout: float) -> list[UUID]:
+        """Pop up to ``limit`` jobs, blocking with ``BZPOPMIN`` while empty.
+
+        The wait is capped at the next delayed job's due time so it gets
+        promoted instead of sleeping through the whole timeout.
+        """
+        ids = await self.pop_many(limit)
+        if ids or timeout <= 0:
+            return ids
+        wait = timeout
+        next_due = await self._client.zrange(self._delayed_key, 0, 0, withscores=True)
+        if next_due:
+            until_due = float(next_due[0][1]) - self._clock().timestamp()
+            wait = max(min(wait, until_due), 0.01)
+        item = await self._client.bzpopmin(self._key, timeout=wait)
+        if not item:
+            return await self.pop_many(limit) if next_due else []
+        _key, member, _score = item
+        ids = [UUID(self._decode(member))]
+        if limit > 1:
+            rest = await self._client.zpopmin(self._key, limit - 1)
+            ids.extend(UUID(self._decode(value)) for value, _score in rest)
+        return ids
+
+    async def promote_due(self, *, limit: int = 500) -> int:
+        """Move due jobs from the delayed set into the ready set.
+
+        ``ZREM`` acts as the claim: only the caller that actually removed a
+        member re-adds it, so concurrent promoters never duplicate a job.
+        """
+        if limit <= 0:
+            return 0
+        now = self._clock()
+        due = await self._client.zrangebyscore(
+            self._delayed_key,
+            "-inf",
+            now.timestamp(),
+            start=0,
+            num=limit,
+            withscores=True,
+        )
+        if not due:
+            return 0
+        members = [(self._decode(member), float(score)) for member, score in due]
+        pipe = self._client.pipeline(transaction=False)
+        for member, _score in members:
+            pipe.zrem(self._delayed_key, member)
+        removed = await pipe.execute()
+        mapping: dict[str, float] = {}
+        for (member, due_ts), claimed in zip(members, removed, strict=True):
+            if not claimed:
+                continue
+            job_id, priority = self._parse_delayed_member(member)
+            due_at = datetime.fromtimestamp(due_ts, tz=UTC)
+            mapping[str(job_id)] = self._score(priority, due_at)
+        if mapping:
+            await self._client.zadd(self._key, mapping)
+        return len(mapping)
+
+    async def delayed_count(self) -> int:
+        return int(await self._client.zcard(self._delayed_key))
+
+    async def ready_count(self) -> int:
+        return int(await self._client.zcard(self._key))
 
     async def close(self) -> None:  # pragma: no cover - optional cleanup
         try:
@@ -58,10 +152,25 @@ class RedisWorkerQueue:
             logger.debug("redis queue close failed on wait_closed(): %s", exc)
 
     @staticmethod
-    def _score(priority: int, *, offset: int = 0) -> float:
+    def _score(priority: int, available_at: datetime, *, offset: int = 0) -> float:
         base = max(0, int(priority)) * 1_000_000_000
-        now = int(datetime.now(UTC).timestamp() * 1_000_000)
-        return float(base + now + offset)
+        due = int(available_at.timestamp() * 1_000_000)
+        return float(base + due + offset)
+
+    @staticmethod
+    def _delayed_member(job_id: UUID, priority: int) -> str:
+        return f"{max(0, int(priority))}:{job_id}"
+
+    @staticmethod
+    def _parse_delayed_member(member: str) -> tuple[UUID, int]:
+        priority, _, job_id = member.partition(":")
+        return UUID(job_id), int(priority)
+
+    @staticmethod
+    def _decode(value: Any) -> str:
+        if isinstance(value, bytes):
+            return value.decode("utf-8")
+        return str(value)
 
 
 __all__ = ["RedisWorkerQueue"]
@@ -11,9 +11,23 @@ from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncEngine
 
-from domains.platform.worker.domain.models import JobStatus, WorkerJob
+from domains.platform.worker.domain.models import (
+    JobStatus,
+    LeaseStats,
+    ReclaimedLease,
+    WorkerJob,
+)
 from packages.core.db import get_async_engine
 
+from .listener import PgNotificationListener
+
+JOBS_CHANNEL = "worker_jobs"
+
+_INSERT_EVENT_SQL = text(
+    "INSERT INTO worker_job_events (job_id, event, details) VALUES (:job_id, :event, :details)"
+)
+_NOTIFY_SQL = text("SELECT pg_notify(:channel, '')")
+
 
 class SQLWorkerJobRepository:
     def __init__(self, engine: AsyncEngine | str) -> None:
@@ -21,6 +35,7 @@ class SQLWorkerJobRepository:
             self._engine = engine
         else:
             self._engine = get_async_engine("worker", url=engine)
+        self._listener = PgNotificationListener(self._engine, JOBS_CHANNEL)
 
     async def enqueue(self, payload: dict[str, Any]) -> WorkerJob:
         sql = text(
@@ -63,9 +78,7 @@ class SQLWorkerJobRepository:
                 if row is None:
                     raise RuntimeError("database_row_missing")
                 await conn.execute(
-                    text(
-                        "INSERT INTO worker_job_events (job_id, event, details) VALUES (:job_id, :event, :details)"
-                    ),
+                    _INSERT_EVENT_SQL,
                     {
                         "job_id": row["job_id"],
                         "event": "queued",
@@ -74,6 +87,7 @@ class SQLWorkerJobRepository:
                         ),
                     },
                 )
+                await conn.execute(_NOTIFY_SQL, {"channel": JOBS_CHANNEL})
                 return self._row_to_job(row)
         except IntegrityError:
             existing = await self.find_by_idempotency(
@@ -83,6 +97,145 @@ class SQLWorkerJobRepository:
                 raise
             return existing
 
+    async def enqueue_many(self, payloads: Sequence[dict[str, Any]]) -> list[WorkerJob]:
+        """Insert jobs and their ``queued`` events in a single statement.
+
+        Rows colliding on an idempotency key are skipped and the existing
+        jobs are returned in their place, preserving the input order.
+        """
+        if not payloads:
+            return []
+        rows_param = json.dumps(
+            [
+                {
+                    "job_id": str(payload["job_id"]),
+                    "type": payload["type"],
+                    "priority": int(payload["priority"]),
+                    "idempotency_key": payload.get("idempotency_key"),
+                    "code_version": payload.get("code_version"),
+                    "model_version": payload.get("model_version"),
+                    "config_hash": payload.get("config_hash"),
+                    "cost_cap_eur": (
+                        str(payload["cost_cap_eur"])
+                        if payload.get("cost_cap_eur") is not None
+                        else None
+                    ),
+                    "budget_tag": payload.get("budget_tag"),
+                    "input": self._ensure_dict(payload.get("input")) or {},
+                }
+                for payload in payloads
+            ]
+        )
+        sql = text(
+            """
+            WITH inserted AS (
+                INSERT INTO worker_jobs (
+                    job_id,
+                    type,
+                    status,
+                    priority,
+                    idempotency_key,
+                    code_version,
+                    model_version,
+                    config_hash,
+                    attempts,
+                    cost_cap_eur,
+                    budget_tag,
+                    input,
+                    result
+                )
+                SELECT
+                    r.job_id,
+                    r.type,
+                    'queued',
+                    r.priority,
+                    r.idempotency_key,
+                    r.code_version,
+                    r.model_version,
+                    r.config_hash,
+                    0,
+                    r.cost_cap_eur,
+                    r.budget_tag,
+                    r.input,
+                    NULL
+                FROM jsonb_to_recordset(CAST(:rows AS jsonb)) AS r(
+                    job_id uuid,
+                    type text,
+                    priority integer,
+                    idempotency_key text,
+                    code_version text,
+                    model_version text,
+                    config_hash text,
+                    cost_cap_eur numeric,
+                    budget_tag text,
+                    input jsonb
+                )
+                ON CONFLICT DO NOTHING
+                RETURNING *
+            ),
+            events AS (
+                INSERT INTO worker_job_events (job_id, event, details)
+                SELECT job_id, 'queued', jsonb_build_object('priority', priority)
+                FROM inserted
+            )
+            SELECT * FROM inserted
+            """
+        )
+        async with self._engine.begin() as conn:
+            rows = (await conn.execute(sql, {"rows": rows_param})).mappings().all()
+            if rows:
+                await conn.execute(_NOTIFY_SQL, {"channel": JOBS_CHANNEL})
+        inserted = {row["job_id"]: self._row_to_job(row) for row in rows}
+        missing = [p for p in payloads if p["job_id"] not in inserted]
+        existing = await self._find_many_by_idempotency(missing)
+        jobs: list[WorkerJob] = []
+        for payload in payloads:
+            job = inserted.get(payload["job_id"])
+            if job is None:
+                job = existing.get((payload["type"], payload.get("idempotency_key")))
+            if job is not None:
+                jobs.append(job)
+        return jobs
+
+    async def _find_many_by_idempotency(
+        self, payloads: Sequence[dict[str, Any]]
+    ) -> dict[tuple[str, str | None], WorkerJob]:
+        keyed = [p for p in payloads if p.get("idempotency_key")]
+        if not keyed:
+            return {}
+        sql = text(
+            """
+            SELECT j.*
+            FROM worker_jobs AS j
+            JOIN unnest(CAST(:types AS text[]), CAST(:keys AS text[])) AS k(type, key)
+              ON j.type = k.type AND j.idempotency_key = k.key
+            """
+        )
+        async with self._engine.begin() as conn:
+            rows = (
+                (
+                    await conn.execute(
+                        sql,
+                        {
+                            "types": [p["type"] for p in keyed],
+                            "keys": [p["idempotency_key"] for p in keyed],
+                        },
+                    )
+                )
+                .mappings()
+                .all()
+            )
+        return {
+            (row["type"], row["idempotency_key"]): self._row_to_job(row) for row in rows
+        }
+
+    async def wait_for_jobs(self, timeout: float) -> bool:
+        """Wait for a ``NOTIFY`` signalling newly queued jobs."""
+        return await self._listener.wait(timeout)
+
+    async def close(self) -> None:
+        await self._listener.close()
+
     async def get(self, job_id: UUID) -> WorkerJob | None:
         sql = text("SELECT * FROM worker_jobs WHERE job_id = :job_id")
         async with self._engine.begin() as conn:
@@ -164,7 +317,6 @@ class SQLWorkerJobRepository:
         """
         )
 
-        jobs: list[WorkerJob] = []
         async with self._engine.begin() as conn:
             if not job_ids:
                 if select_sql is None:
@@ -195,23 +347,20 @@ class SQLWorkerJobRepository:
                 .mappings()
                 .all()
             )
-            for row in rows:
-                job = self._row_to_job(row)
-                jobs.append(job)
-                await conn.execute(
-                    text(
-                        "INSERT INTO worker_job_events (job_id, event, details) VALUES (:job_id, :event, :details)"
-                    ),
+            jobs = [self._row_to_job(row) for row in rows]
+            if jobs:
+                details = self._serialize_details(
                     {
-                        "job_id": job.job_id,
-                        "event": "leased",
-                        "details": self._serialize_details(
-                            {
-                                "worker_id": worker_id,
-                                "lease_until": lease_until.isoformat(),
-                            }
-                        ),
-                    },
+                        "worker_id": worker_id,
+                        "lease_until": lease_until.isoformat(),
+                    }
+                )
+                await conn.execute(
+                    _INSERT_EVENT_SQL,
+                    [
+                        {"job_id": job.job_id, "event": "leased", "details": details}
+                        for job in jobs
+                    ],
                 )
         return jobs
 
@@ -222,6 +371,8 @@ class SQLWorkerJobRepository:
         worker_id: str,
         lease_seconds: int,
     ) -> WorkerJob | None:
+        # Heartbeats only extend the lease; worker_job_events keeps state
+        # transitions, so no event row is written here.
         lease_until = datetime.now(UTC) + timedelta(seconds=max(lease_seconds, 1))
         sql = text(
             """
@@ -250,19 +401,6 @@ class SQLWorkerJobRepository:
                 .mappings()
                 .first()
             )
-            if row:
-                await conn.execute(
-                    text(
-                        "INSERT INTO worker_job_events (job_id, event, details) VALUES (:job_id, :event, :details)"
-                    ),
-                    {
-                        "job_id": job_id,
-                        "event": "heartbeat",
-                        "details": self._serialize_details(
-                            {"lease_until": lease_until.isoformat()}
-                        ),
-                    },
-                )
         return self._row_to_job(row) if row else None
 
     async def complete(
@@ -306,9 +444,7 @@ class SQLWorkerJobRepository:
             if row is None:
                 raise RuntimeError("job_not_leased_by_worker")
             await conn.execute(
-                text(
-                    "INSERT INTO worker_job_events (job_id, event, details) VALUES (:job_id, :event, :details)"
-                ),
+                _INSERT_EVENT_SQL,
                 {
                     "job_id": job_id,
                     "event": status.value,
@@ -360,9 +496,7 @@ class SQLWorkerJobRepository:
                 raise RuntimeError("job_not_leased_by_worker")
             job = self._row_to_job(row)
             await conn.execute(
-                text(
-                    "INSERT INTO worker_job_events (job_id, event, details) VALUES (:job_id, :event, :details)"
-                ),
+                _INSERT_EVENT_SQL,
                 {
                     "job_id": job.job_id,
                     "event": "requeued",
@@ -377,18 +511,154 @@ class SQLWorkerJobRepository:
             )
             return job
 
+    async def reclaim_expired_leases(
+        self,
+        *,
+        now: datetime,
+        limit: int,
+    ) -> list[ReclaimedLease]:
+        """Return expired leases to the queue, dead-lettering exhausted jobs.
+
+        Attempts are counted when a job is leased, so a job whose owner died
+        on its last allowed attempt is moved to ``expired`` instead of being
+        queued again.
+        """
+        if limit <= 0:
+            return []
+        sql = text(
+            """
+            WITH expired AS (
+                SELECT job_id, lease_owner, lease_until
+                FROM worker_jobs
+                WHERE status = :leased AND lease_until < :now
+                ORDER BY lease_until ASC
+                FOR UPDATE SKIP LOCKED
+                LIMIT :limit
+            )
+            UPDATE worker_jobs AS j
+            SET status = CASE
+                    WHEN j.attempts >= j.max_attempts THEN :expired_status
+                    ELSE :queued
+                END,
+                lease_owner = NULL,
+                lease_until = NULL,
+                available_at = CASE
+                    WHEN j.attempts >= j.max_attempts THEN j.available_at
+                    ELSE :now
+                END,
+                updated_at = now()
+            FROM expired
+            WHERE j.job_id = expired.job_id
+            RETURNING
+                j.job_id,
+                j.type,
+                j.priority,
+                j.status,
+                j.attempts,
+                j.max_attempts,
+                j.available_at,
+                expired.lease_owner AS previous_owner,
+                expired.lease_until AS previous_lease_until
+            """
+        )
+        async with self._engine.begin() as conn:
+            rows = (
+                (
+                    await conn.execute(
+                        sql,
+                        {
+                            "leased": JobStatus.LEASED.value,
+                            "expired_status": JobStatus.EXPIRED.value,
+                            "queued": JobStatus.QUEUED.value,
+                            "now": now,
+                            "limit": limit,
+                        },
+                    )
+                )
+                .mappings()
+                .all()
+            )
+            reclaimed = [
+                ReclaimedLease(
+                    job_id=row["job_id"],
+                    type=row["type"],
+                    priority=int(row["priority"]),
+                    status=JobStatus(row["status"]),
+                    previous_owner=row.get("previous_owner"),
+                    lease_until=row["previous_lease_until"],
+                    attempts=int(row.get("attempts", 0)),
+                    max_attempts=int(row.get("max_attempts", 3)),
+                    available_at=row["available_at"],
+                )
+                for row in rows
+            ]
+            if reclaimed:
+                await conn.execute(
+                    _INSERT_EVENT_SQL,
+                    [
+                        {
+                            "job_id": lease.job_id,
+                            "event": (
+                                "dead_lettered"
+                                if lease.dead_lettered
+                                else "lease_expired"
+                            ),
+                            "details": self._serialize_details(
+                                {
+                                    "worker_id": lease.previous_owner,
+                                    "lease_until": lease.lease_until.isoformat(),
+                                    "attempt": lease.attempts,
+                                    "max_attempts": lease.max_attempts,
+                                }
+                            ),
+                        }
+                        for lease in reclaimed
+                    ],
+                )
+            if any(not lease.dead_lettered for lease in reclaimed):
+                await conn.execute(_NOTIFY_SQL, {"channel": JOBS_CHANNEL})
+        return reclaimed
+
+    async def lease_stats(self, *, now: datetime) -> LeaseStats:
+        sql = text(
+            """
+            SELECT
+                COUNT(*) FILTER (WHERE lease_until >= :now) AS active,
+                COUNT(*) FILTER (WHERE lease_until < :now) AS expired,
+                MIN(lease_until) FILTER (WHERE lease_until < :now) AS oldest_expired
+            FROM worker_jobs
+            WHERE status = :leased
+            """
+        )
+        async with self._engine.begin() as conn:
+            row = (
+                (
+                    await conn.execute(
+                        sql, {"now": now, "leased": JobStatus.LEASED.value}
+                    )
+                )
+                .mappings()
+                .first()
+            )
+        if row is None:
+            return LeaseStats(active=0, expired=0, oldest_overdue_seconds=0.0)
+        oldest = row.get("oldest_expired")
+        overdue = (now - oldest).total_seconds() if oldest is not None else 0.0
+        return LeaseStats(
+            active=int(row.get("active") or 0),
+            expired=int(row.get("expired") or 0),
+            oldest_overdue_seconds=max(overdue, 0.0),
+        )
+
     async def record_event(
         self,
         job_id: UUID,
         event: str,
         details: dict[str, Any] | None = None,
     ) -> None:
-        sql = text(
-            "INSERT INTO worker_job_events (job_id, event, details) VALUES (:job_id, :event, :details)"
-        )
         async with self._engine.begin() as conn:
             await conn.execute(
-                sql,
+                _INSERT_EVENT_SQL,
                 {
                     "job_id": job_id,
                     "event": event,
@@ -459,4 +729,4 @@ class SQLWorkerJobRepository:
             raise ValueError("worker_job_event_not_serializable") from exc
 
 
-__all__ = ["SQLWorkerJobRepository"]
+__all__ = ["JOBS_CHANNEL", "SQLWorkerJobRepository"]
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+
+class PgNotificationListener:
+    """Wakes waiters when a Postgres ``NOTIFY`` arrives on ``channel``.
+
+    One dedicated connection per listener holds the ``LISTEN``. Drivers
+    without listener support (anything but asyncpg) degrade to sleeping for
+    the requested timeout, so callers simply fall back to polling.
+    """
+
+    def __init__(self, engine: AsyncEngine, channel: str) -> None:
+        self._engine = engine
+        self._channel = channel
+        self._conn: AsyncConnection | None = None
+        self._driver: Any | None = None
+        self._supported = True
+        self._event: asyncio.Event | None = None
+        self._lock: asyncio.Lock | None = None
+
+    @property
+    def channel(self) -> str:
+        return self._channel
+
+    async def wait(self, timeout: float) -> bool:
+        """Block until a notification arrives or ``timeout`` elapses."""
+        if timeout <= 0:
+            return False
+        if not await self._ensure_listening():
+            await asyncio.sleep(timeout)
+            return False
+        event = self._current_event()
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+        except TimeoutError:
+            return False
+        return True
+
+    async def close(self) -> None:
+        driver, conn = self._driver, self._conn
+        self._driver = None
+        self._conn = None
+        if driver is not None:
+            try:
+                await driver.remove_listener(self._channel, self._on_notify)
+            except (OSError, RuntimeError) as exc:  # pragma: no cover - defensive
+                logger.debug("pg listener remove failed: %s", exc)
+        if conn is not None:
+            try:
+                await conn.close()
+            except (SQLAlchemyError, OSError) as exc:  # pragma: no cover - defensive
+                logger.debug("pg listener close failed: %s", exc)
+
+    def _current_event(self) -> asyncio.Event:
+        if self._event is None:
+            self._event = asyncio.Event()
+        return self._event
+
+    def _on_notify(self, _connection: Any, _pid: int, _channel: str, _payload: str) -> None:
+        # Swap the event first so waiters arriving later block on the next
+        # notification instead of seeing an already-set event.
+        event = self._current_event()
+        self._event = asyncio.Event()
+        event.set()
+
+    async def _ensure_listening(self) -> bool:
+        if self._driver is not None and not self._driver_closed():
+            return True
+        if not self._supported:
+            return False
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._driver is not None and not self._driver_closed():
+                return True
+            await self.close()
+            conn: AsyncConnection | None = None
+            try:
+                conn = await self._engine.connect()
+                raw = await conn.get_raw_connection()
+                driver = getattr(raw, "driver_connection", None)
+                add_listener = getattr(driver, "add_listener", None)
+                if add_listener is None:
+                    self._supported = False
+                    await conn.close()
+                    return False
+                await add_listener(self._channel, self._on_notify)
+            except (SQLAlchemyError, OSError) as exc:
+                logger.warning("pg listener for %s unavailable: %s", self._channel, exc)
+                if conn is not None:
+                    await conn.close()
+                return False
+            self._conn = conn
+            self._driver = driver
+            return True
+
+    def _driver_closed(self) -> bool:
+        is_closed = getattr(self._driver, "is_closed", None)
+        return bool(is_closed()) if callable(is_closed) else False
+
+
+__all__ = ["PgNotificationListener"]
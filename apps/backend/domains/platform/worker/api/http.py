@@ -8,6 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, Field
 
 from domains.platform.worker.application.service import (
+    MAX_LEASE_WAIT_SECONDS,
     JobCompletionCommand,
     JobCreateCommand,
     JobFailureCommand,
@@ -49,11 +50,20 @@ class JobView(BaseModel):
     updated_at: str
 
 
+class JobBatchPayload(BaseModel):
+    jobs: list[JobPayload] = Field(min_length=1, max_length=1000)
+
+
+class JobBatchResponse(BaseModel):
+    jobs: list[JobView]
+
+
 class JobLeaseRequest(BaseModel):
     worker_id: str
     job_types: list[str] | None = None
     limit: int = Field(default=1, ge=1, le=100)
     lease_seconds: int = Field(default=600, ge=1, le=3600)
+    wait_seconds: float = Field(default=0.0, ge=0.0, le=MAX_LEASE_WAIT_SECONDS)
 
 
 class JobLeaseResponse(BaseModel):
@@ -85,22 +95,19 @@ def make_router() -> APIRouter:
         payload: JobPayload,
         service: WorkerQueueService = Depends(_service_dep),
     ) -> JobView:
-        job = await service.enqueue(
-            JobCreateCommand(
-                job_id=payload.job_id,
-                type=payload.type,
-                input=payload.input,
-                priority=payload.priority,
-                idempotency_key=payload.idempotency_key,
-                code_version=payload.code_version,
-                model_version=payload.model_version,
-                config_hash=payload.config_hash,
-                cost_cap_eur=payload.cost_cap_eur,
-                budget_tag=payload.budget_tag,
-            )
-        )
+        job = await service.enqueue(_payload_to_command(payload))
         return _job_to_view(job)
 
+    @router.post("/batch", response_model=JobBatchResponse)
+    async def enqueue_jobs(
+        payload: JobBatchPayload,
+        service: WorkerQueueService = Depends(_service_dep),
+    ) -> JobBatchResponse:
+        jobs = await service.enqueue_many(
+            [_payload_to_command(item) for item in payload.jobs]
+        )
+        return JobBatchResponse(jobs=[_job_to_view(job) for job in jobs])
+
     @router.get("/{job_id}", response_model=JobView)
     async def get_job(
         job_id: UUID,
@@ -121,6 +128,7 @@ def make_router() -> APIRouter:
             job_types=payload.job_types,
             limit=payload.limit,
             lease_seconds=payload.lease_seconds,
+            wait_seconds=payload.wait_seconds,
         )
         return JobLeaseResponse(jobs=[_job_to_view(job) for job in jobs])
 
@@ -177,6 +185,21 @@ def _service_dep(request: Request) -> WorkerQueueService:
     return container.worker.service  # type: ignore[no-any-return]
 
 
+def _payload_to_command(payload: JobPayload) -> JobCreateCommand:
+    return JobCreateCommand(
+        job_id=payload.job_id,
+        type=payload.type,
+        input=payload.input,
+        priority=payload.priority,
+        idempotency_key=payload.idempotency_key,
+        code_version=payload.code_version,
+        model_version=payload.model_version,
+        config_hash=payload.config_hash,
+        cost_cap_eur=payload.cost_cap_eur,
+        budget_tag=payload.budget_tag,
+    )
+
+
 def _job_to_view(job: WorkerJob) -> JobView:
     lease_until = job.lease_until.isoformat() if job.lease_until else None
     created_at = job.created_at.isoformat()
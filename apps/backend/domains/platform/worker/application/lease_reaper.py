@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from domains.platform.worker import metrics
+from domains.platform.worker.domain.models import ReclaimedLease
+
+from ..adapters.sql.jobs import SQLWorkerJobRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class LeaseReapSummary:
+    requeued: int = 0
+    dead_lettered: int = 0
+    promoted: int = 0
+
+    @property
+    def reclaimed(self) -> int:
+        return self.requeued + self.dead_lettered
+
+
+class LeaseReaper:
+    """Recovers jobs whose worker died while holding a lease.
+
+    Each pass promotes due delayed jobs in the Redis queue, returns expired
+    leases to the queue (or dead-letters them once ``max_attempts`` is
+    exhausted) and refreshes lease gauges.
+    """
+
+    def __init__(
+        self,
+        repo: SQLWorkerJobRepository,
+        queue: Any | None = None,
+        *,
+        batch_size: int = 100,
+        max_batches: int = 10,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        self._repo = repo
+        self._queue = queue
+        self._batch_size = max(1, int(batch_size))
+        self._max_batches = max(1, int(max_batches))
+        self._clock = clock or (lambda: datetime.now(UTC))
+
+    async def run_once(self) -> LeaseReapSummary:
+        summary = LeaseReapSummary()
+        if self._queue is not None:
+            summary.promoted = await self._queue.promote_due(limit=self._batch_size)
+            metrics.observe_promoted(summary.promoted)
+
+        for _ in range(self._max_batches):
+            now = self._clock()
+            reclaimed = await self._repo.reclaim_expired_leases(
+                now=now, limit=self._batch_size
+            )
+            for lease in reclaimed:
+                await self._handle_reclaimed(lease, now)
+                if lease.dead_lettered:
+                    summary.dead_lettered += 1
+                else:
+                    summary.requeued += 1
+            if len(reclaimed) < self._batch_size:
+                break
+
+        stats = await self._repo.lease_stats(now=self._clock())
+        metrics.set_lease_stats(
+            active=stats.active,
+            expired=stats.expired,
+            oldest_overdue_s=stats.oldest_overdue_seconds,
+        )
+        return summary
+
+    async def _handle_reclaimed(self, lease: ReclaimedLease, now: datetime) -> None:
+        overdue = (now - lease.lease_until).total_seconds()
+        metrics.observe_reclaimed(
+            lease.type, dead_lettered=lease.dead_lettered, overdue_s=overdue
+        )
+        if lease.dead_lettered:
+            logger.warning(
+                "worker job %s dead-lettered after %s/%s attempts (owner=%s)",
+                lease.job_id,
+                lease.attempts,
+                lease.max_attempts,
+                lease.previous_owner,
+            )
+            return
+        if self._queue is not None:
+            await self._queue.push(
+                lease.job_id, lease.priority, available_at=lease.available_at
+            )
+
+
+__all__ = ["LeaseReapSummary", "LeaseReaper"]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import json
 from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
@@ -11,6 +13,8 @@ from domains.platform.worker.domain.models import JobStatus, WorkerJob
 
 from ..adapters.sql.jobs import SQLWorkerJobRepository
 
+MAX_LEASE_WAIT_SECONDS = 30.0
+
 
 @dataclass(slots=True)
 class JobCreateCommand:
@@ -43,47 +47,51 @@ class JobFailureCommand:
 
 
 class WorkerQueueService:
-    def __init__(self, repo: SQLWorkerJobRepository, queue=None) -> None:
+    def __init__(
+        self,
+        repo: SQLWorkerJobRepository,
+        queue=None,
+        *,
+        poll_interval: float = 2.0,
+    ) -> None:
         self._repo = repo
         self._queue = queue
+        self._poll_interval = max(0.05, float(poll_interval))
 
     async def enqueue(self, command: JobCreateCommand) -> WorkerJob:
-        if command.job_id is None:
-            job_id = uuid4()
-        else:
-            job_id = command.job_id
         if command.idempotency_key:
             existing = await self._repo.find_by_idempotency(
                 command.type, command.idempotency_key
             )
             if existing is not None:
                 return existing
-        input_payload: Any = command.input
-        if input_payload is not None and not isinstance(input_payload, str):
-            try:
-                import json
-
-                input_payload = json.dumps(input_payload)
-            except TypeError as exc:
-                raise ValueError("worker_job_input_not_serializable") from exc
-        payload = {
-            "job_id": job_id,
-            "type": command.type,
-            "status": JobStatus.QUEUED.value,
-            "priority": command.priority,
-            "idempotency_key": command.idempotency_key,
-            "code_version": command.code_version,
-            "model_version": command.model_version,
-            "config_hash": command.config_hash,
-            "cost_cap_eur": command.cost_cap_eur,
-            "budget_tag": command.budget_tag,
-            "input": input_payload,
-        }
-        job = await self._repo.enqueue(payload)
+        job = await self._repo.enqueue(self._build_payload(command))
         if self._queue is not None:
-            await self._queue.push(job.job_id, job.priority)
+            await self._queue.push(
+                job.job_id, job.priority, available_at=job.available_at
+            )
         return job
 
+    async def enqueue_many(self, commands: Sequence[JobCreateCommand]) -> list[WorkerJob]:
+        """Enqueue a batch with one SQL statement and one queue write.
+
+        Jobs already present under the same idempotency key are returned as
+        they are and not pushed to the queue again.
+        """
+        if not commands:
+            return []
+        payloads = [self._build_payload(command) for command in commands]
+        jobs = await self._repo.enqueue_many(payloads)
+        if self._queue is not None:
+            new_ids = {payload["job_id"] for payload in payloads}
+            fresh = [
+                (job.job_id, job.priority)
+                for job in jobs
+                if job.job_id in new_ids and job.status is JobStatus.QUEUED
+            ]
+            await self._queue.push_many(fresh)
+        return jobs
+
     async def lease(
         self,
         *,
@@ -91,25 +99,63 @@ class WorkerQueueService:
         job_types: Sequence[str] | None,
         limit: int,
         lease_seconds: int,
+        wait_seconds: float = 0.0,
+    ) -> list[WorkerJob]:
+        """Lease up to ``limit`` jobs, optionally long-polling while idle.
+
+        With ``wait_seconds`` the call blocks until work appears or the wait
+        elapses: on ``BZPOPMIN`` when the Redis queue serves the request,
+        otherwise on a Postgres ``NOTIFY`` from the enqueue path.
+        """
+        jobs = await self._lease_now(
+            worker_id=worker_id,
+            job_types=job_types,
+            limit=limit,
+            lease_seconds=lease_seconds,
+        )
+        if jobs or wait_seconds <= 0:
+            return jobs
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + min(float(wait_seconds), MAX_LEASE_WAIT_SECONDS)
+        while (remaining := deadline - loop.time()) > 0:
+            timeout = min(remaining, self._poll_interval)
+            if self._queue is not None and not job_types:
+                ids = await self._queue.pop_blocking(limit, timeout=timeout)
+                if ids:
+                    jobs = await self._lease_popped(
+                        ids, worker_id=worker_id, lease_seconds=lease_seconds
+                    )
+                    if jobs:
+                        return jobs
+                continue
+            await self._repo.wait_for_jobs(timeout)
+            jobs = await self._repo.lease_jobs(
+                worker_id=worker_id,
+                job_types=job_types,
+                limit=limit,
+                lease_seconds=lease_seconds,
+            )
+            if jobs:
+                return jobs
+        return []
+
+    async def _lease_now(
+        self,
+        *,
+        worker_id: str,
+        job_types: Sequence[str] | None,
+        limit: int,
+        lease_seconds: int,
     ) -> list[WorkerJob]:
         if self._queue is not None and not job_types:
             ids = await self._queue.pop_many(limit)
             jobs: list[WorkerJob] = []
             if ids:
-                leased = await self._repo.lease_jobs(
-                    worker_id=worker_id,
-                    job_types=None,
-                    limit=len(ids),
-                    lease_seconds=lease_seconds,
-                    job_ids=ids,
+                jobs.extend(
+                    await self._lease_popped(
+                        ids, worker_id=worker_id, lease_seconds=lease_seconds
+                    )
                 )
-                jobs.extend(leased)
-                leased_ids = {job.job_id for job in leased}
-                missing = [jid for jid in ids if jid not in leased_ids]
-                for jid in missing:
-                    existing = await self._repo.get(jid)
-                    if existing and existing.status is JobStatus.QUEUED:
-                        await self._queue.push(existing.job_id, existing.priority)
             remaining = limit - len(jobs)
             if remaining > 0:
                 extra = await self._repo.lease_jobs(
@@ -127,6 +173,51 @@ class WorkerQueueService:
             lease_seconds=lease_seconds,
         )
 
+    async def _lease_popped(
+        self, ids: Sequence[UUID], *, worker_id: str, lease_seconds: int
+    ) -> list[WorkerJob]:
+        leased = await self._repo.lease_jobs(
+            worker_id=worker_id,
+            job_types=None,
+            limit=len(ids),
+            lease_seconds=lease_seconds,
+            job_ids=ids,
+        )
+        leased_ids = {job.job_id for job in leased}
+        missing = [jid for jid in ids if jid not in leased_ids]
+        for jid in missing:
+            existing = await self._repo.get(jid)
+            if existing and existing.status is JobStatus.QUEUED:
+                await self._queue.push(
+                    existing.job_id,
+                    existing.priority,
+                    available_at=existing.available_at,
+                )
+        return leased
+
+    @staticmethod
+    def _build_payload(command: JobCreateCommand) -> dict[str, Any]:
+        job_id = command.job_id if command.job_id is not None else uuid4()
+        input_payload: Any = command.input
+        if input_payload is not None and not isinstance(input_payload, str):
+            try:
+                input_payload = json.dumps(input_payload)
+            except TypeError as exc:
+                raise ValueError("worker_job_input_not_serializable") from exc
+        return {
+            "job_id": job_id,
+            "type": command.type,
+            "status": JobStatus.QUEUED.value,
+            "priority": command.priority,
+            "idempotency_key": command.idempotency_key,
+            "code_version": command.code_version,
+            "model_version": command.model_version,
+            "config_hash": command.config_hash,
+            "cost_cap_eur": command.cost_cap_eur,
+            "budget_tag": command.budget_tag,
+            "input": input_payload,
+        }
+
     async def heartbeat(
         self, job_id: UUID, worker_id: str, lease_seconds: int
     ) -> WorkerJob | None:
@@ -172,7 +263,9 @@ class WorkerQueueService:
                 available_at=next_available,
             )
             if self._queue is not None:
-                await self._queue.push(job.job_id, job.priority)
+                await self._queue.push(
+                    job.job_id, job.priority, available_at=job.available_at
+                )
             return job
 
         failure_details = dict(details)
@@ -205,6 +298,7 @@ class WorkerQueueService:
 
 
 __all__ = [
+    "MAX_LEASE_WAIT_SECONDS",
     "JobCreateCommand",
     "JobCompletionCommand",
     "JobFailureCommand",
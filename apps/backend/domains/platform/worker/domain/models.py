@@ -50,4 +50,36 @@ class WorkerJobEvent:
     details: dict[str, Any] | None
 
 
-__all__ = ["JobStatus", "WorkerJob", "WorkerJobEvent"]
+@dataclass(slots=True)
+class ReclaimedLease:
+    """Lease returned to the queue (or dead-lettered) after its owner vanished."""
+
+    job_id: UUID
+    type: str
+    priority: int
+    status: JobStatus
+    previous_owner: str | None
+    lease_until: datetime
+    attempts: int
+    max_attempts: int
+    available_at: datetime
+
+    @property
+    def dead_lettered(self) -> bool:
+        return self.status is JobStatus.EXPIRED
+
+
+@dataclass(slots=True)
+class LeaseStats:
+    active: int
+    expired: int
+    oldest_overdue_seconds: float
+
+
+__all__ = [
+    "JobStatus",
+    "LeaseStats",
+    "ReclaimedLease",
+    "WorkerJob",
+    "WorkerJobEvent",
+]
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+try:  # pragma: no cover - optional dependency
+    from prometheus_client import REGISTRY, Counter, Gauge, Histogram  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    Counter = None  # type: ignore
+    Gauge = None  # type: ignore
+    Histogram = None  # type: ignore
+    REGISTRY = None  # type: ignore
+
+
+def _existing(name: str) -> Any | None:
+    registry: Any | None = REGISTRY  # type: ignore[assignment]
+    if registry is None:
+        return None
+    return getattr(registry, "_names_to_collectors", {}).get(name)
+
+
+def _build_counter(
+    name: str, documentation: str, *, labelnames: Iterable[str] = ()
+):  # pragma: no cover - thin wrapper
+    if Counter is None:
+        return None
+    try:
+        return Counter(name, documentation, labelnames=tuple(labelnames))  # type: ignore[misc]
+    except ValueError:
+        return _existing(name)
+
+
+def _build_gauge(
+    name: str, documentation: str, *, labelnames: Iterable[str] = ()
+):  # pragma: no cover - thin wrapper
+    if Gauge is None:
+        return None
+    try:
+        return Gauge(name, documentation, labelnames=tuple(labelnames))  # type: ignore[misc]
+    except ValueError:
+        return _existing(name)
+
+
+def _build_histogram(
+    name: str,
+    documentation: str,
+    *,
+    buckets: Iterable[float],
+    labelnames: Iterable[str] = (),
+):  # pragma: no cover - thin wrapper
+    if Histogram is None:
+        return None
+    try:
+        return Histogram(  # type: ignore[misc]
+            name,
+            documentation,
+            labelnames=tuple(labelnames),
+            buckets=tuple(buckets),
+        )
+    except ValueError:
+        return _existing(name)
+
+
+LEASES_RECLAIMED_TOTAL = _build_counter(
+    "worker_leases_reclaimed_total",
+    "Expired worker job leases reclaimed by the reaper.",
+    labelnames=("type", "outcome"),
+)
+LEASE_OVERDUE_SECONDS = _build_histogram(
+    "worker_lease_overdue_seconds",
+    "Seconds between lease expiry and its reclamation.",
+    buckets=(1, 5, 15, 30, 60, 120, 300, 900, 1800, 3600),
+)
+LEASES_ACTIVE = _build_gauge(
+    "worker_leases_active",
+    "Worker job leases that have not expired yet.",
+)
+LEASES_EXPIRED = _build_gauge(
+    "worker_leases_expired",
+    "Worker job leases past their expiry awaiting reclamation.",
+)
+LEASE_OLDEST_OVERDUE_SECONDS = _build_gauge(
+    "worker_lease_oldest_overdue_seconds",
+    "Age past expiry of the oldest unreclaimed lease.",
+)
+DELAYED_PROMOTED_TOTAL = _build_counter(
+    "worker_delayed_jobs_promoted_total",
+    "Delayed worker jobs promoted into the ready queue.",
+)
+
+
+def observe_reclaimed(job_type: str, *, dead_lettered: bool, overdue_s: float) -> None:
+    """Record a reclaimed lease (no-op when Prometheus disabled)."""
+
+    outcome = "dead_lettered" if dead_lettered else "requeued"
+    if LEASES_RECLAIMED_TOTAL is not None:
+        LEASES_RECLAIMED_TOTAL.labels(type=job_type or "unknown", outcome=outcome).inc()
+    if LEASE_OVERDUE_SECONDS is not None:
+        LEASE_OVERDUE_SECONDS.observe(max(float(overdue_s), 0.0))
+
+
+def set_lease_stats(*, active: int, expired: int, oldest_overdue_s: float) -> None:
+    """Expose lease gauges."""
+
+    if LEASES_ACTIVE is not None:
+        LEASES_ACTIVE.set(float(active))
+    if LEASES_EXPIRED is not None:
+        LEASES_EXPIRED.set(float(expired))
+    if LEASE_OLDEST_OVERDUE_SECONDS is not None:
+        LEASE_OLDEST_OVERDUE_SECONDS.set(max(float(oldest_overdue_s), 0.0))
+
+
+def observe_promoted(count: int) -> None:
+    """Record delayed jobs promoted into the ready queue."""
+
+    if DELAYED_PROMOTED_TOTAL is not None and count > 0:
+        DELAYED_PROMOTED_TOTAL.inc(count)
+
+
+__all__ = ["observe_promoted", "observe_reclaimed", "set_lease_stats"]
@@ -113,7 +113,7 @@ class _StubQueue:
         self.pushed: list[tuple[UUID, int]] = []
         self.to_pop: list[UUID] = []
 
-    async def push(self, job_id: UUID, priority: int) -> None:
+    async def push(self, job_id: UUID, priority: int, *, available_at=None) -> None:
         self.pushed.append((job_id, priority))
 
     async def pop_many(self, limit: int) -> list[UUID]:
@@ -7,6 +7,7 @@ from packages.core.config import Settings, load_settings, to_async_dsn
 
 from .adapters.queue_redis import RedisWorkerQueue
 from .adapters.sql.jobs import SQLWorkerJobRepository
+from .application.lease_reaper import LeaseReaper
 from .application.service import WorkerQueueService
 
 logger = logging.getLogger(__name__)
@@ -17,6 +18,7 @@ class WorkerContainer:
     repo: SQLWorkerJobRepository
     queue: object | None
     service: WorkerQueueService
+    reaper: LeaseReaper
 
 
 def build_container(settings: Settings | None = None) -> WorkerContainer:
@@ -38,7 +40,8 @@ def build_container(settings: Settings | None = None) -> WorkerContainer:
             except (RedisError, ValueError, TypeError) as exc:
                 logger.error("worker redis queue init failed: %s", exc)
     service = WorkerQueueService(repo, queue=queue)
-    return WorkerContainer(repo=repo, queue=queue, service=service)
+    reaper = LeaseReaper(repo, queue=queue)
+    return WorkerContainer(repo=repo, queue=queue, service=service, reaper=reaper)
 
 
 __all__ = ["WorkerContainer", "build_container"]
@@ -0,0 +1,3 @@
+from .lease_reaper import build_lease_reaper_worker
+
+__all__ = ["build_lease_reaper_worker"]
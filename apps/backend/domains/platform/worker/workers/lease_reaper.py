@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from packages.core.db import dispose_async_engines
+from packages.worker import PeriodicWorker, PeriodicWorkerConfig
+from packages.worker.registry import WorkerRuntimeContext, register_worker
+
+from ..application.lease_reaper import LeaseReaper
+from ..wires import build_container
+
+_WORKER_NAME = "worker.lease_reaper"
+
+
+def _env_float(env: Mapping[str, str], key: str, default: float) -> float:
+    try:
+        return float(env.get(key, default))
+    except (TypeError, ValueError):  # pragma: no cover - defensive
+        return default
+
+
+def _env_int(env: Mapping[str, str], key: str, default: int) -> int:
+    try:
+        return int(env.get(key, default))
+    except (TypeError, ValueError):  # pragma: no cover - defensive
+        return default
+
+
+class LeaseReaperWorker(PeriodicWorker):
+    def __init__(
+        self,
+        *,
+        context: WorkerRuntimeContext,
+        interval: float,
+        jitter: float,
+        container_factory: Callable[[WorkerRuntimeContext], Any] | None = None,
+    ) -> None:
+        factory = container_factory or self._default_container_factory
+        container = factory(context)
+        reaper = getattr(container, "reaper", None)
+        if reaper is None:
+            raise RuntimeError("worker container missing lease reaper")
+        self._reaper = reaper
+        self._container = container
+
+        async def _tick() -> None:
+            await self._run_tick()
+
+        config = PeriodicWorkerConfig(interval=interval, jitter=jitter, immediate=True)
+        super().__init__(_WORKER_NAME, _tick, config=config, logger=context.logger)
+
+    @staticmethod
+    def _default_container_factory(ctx: WorkerRuntimeContext):
+        return build_container(settings=ctx.settings)
+
+    async def _run_tick(self) -> None:
+        summary = await self._reaper.run_once()
+        if summary.reclaimed or summary.promoted:
+            self.logger.info(
+                "lease reaper requeued=%s dead_lettered=%s promoted=%s",
+                summary.requeued,
+                summary.dead_lettered,
+                summary.promoted,
+            )
+
+    async def shutdown(self) -> None:
+        queue = getattr(self._container, "queue", None)
+        if queue is not None:
+            await queue.close()
+        await dispose_async_engines()
+        await super().shutdown()
+
+
+@register_worker(_WORKER_NAME)
+async def build_lease_reaper_worker(context: WorkerRuntimeContext):
+    env = dict(context.env)
+    interval = max(_env_float(env, "WORKER_LEASE_REAPER_INTERVAL", 15.0), 1.0)
+    jitter = min(_env_float(env, "WORKER_LEASE_REAPER_JITTER", 2.0), interval / 2)
+    batch_size = max(1, _env_int(env, "WORKER_LEASE_REAPER_BATCH_SIZE", 100))
+
+    def _factory(ctx: WorkerRuntimeContext):
+        container = build_container(settings=ctx.settings)
+        container.reaper = LeaseReaper(
+            container.repo, queue=container.queue, batch_size=batch_size
+        )
+        return container
+
+    return LeaseReaperWorker(
+        context=context,
+        interval=interval,
+        jitter=jitter,
+        container_factory=_factory,
+    )
+
+
+__all__ = ["LeaseReaperWorker", "build_lease_reaper_worker"]
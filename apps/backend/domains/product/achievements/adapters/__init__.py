@@ -1,4 +1,13 @@
+from .memory.counters import MemoryCounterStore
 from .memory.repository import MemoryRepo
+from .sql.counters import SQLCounterStore, create_counter_store
 from .sql.repository import SQLRepo, create_repo
 
-__all__ = ["MemoryRepo", "SQLRepo", "create_repo"]
+__all__ = [
+    "MemoryCounterStore",
+    "MemoryRepo",
+    "SQLCounterStore",
+    "SQLRepo",
+    "create_counter_store",
+    "create_repo",
+]
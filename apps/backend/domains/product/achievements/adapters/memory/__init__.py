@@ -1,3 +1,4 @@
+from .counters import MemoryCounterStore
 from .repository import MemoryRepo
 
-__all__ = ["MemoryRepo"]
+__all__ = ["MemoryCounterStore", "MemoryRepo"]
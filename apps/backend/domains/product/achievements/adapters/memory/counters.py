@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
+
+from domains.product.achievements.application.ports import (
+    CounterIncrement,
+    CounterStore,
+)
+
+
+class MemoryCounterStore(CounterStore):
+    def __init__(self) -> None:
+        # user -> counter -> bucket -> value
+        self._values: dict[str, dict[str, dict[int, float]]] = defaultdict(
+            lambda: defaultdict(dict)
+        )
+
+    async def apply(
+        self,
+        user_id: str,
+        increments: Sequence[CounterIncrement],
+        windows: Mapping[str, int],
+    ) -> dict[str, float]:
+        counters = self._values[user_id]
+        for key, bucket, delta in increments:
+            buckets = counters[key]
+            buckets[bucket] = buckets.get(bucket, 0.0) + float(delta)
+        return await self.read(user_id, windows)
+
+    async def read(self, user_id: str, windows: Mapping[str, int]) -> dict[str, float]:
+        counters = self._values.get(user_id, {})
+        out: dict[str, float] = {}
+        for key, since in windows.items():
+            buckets = counters.get(key)
+            if buckets:
+                out[key] = sum(v for b, v in buckets.items() if b >= since)
+        return out
+
+    async def users(self, *, after: str | None, limit: int) -> list[str]:
+        ordered = sorted(u for u, counters in self._values.items() if counters)
+        if after is not None:
+            ordered = [u for u in ordered if u > after]
+        return ordered[:limit]
+
+
+__all__ = ["MemoryCounterStore"]
@@ -25,14 +25,16 @@ class MemoryRepo(Repo):
         self._by_code: dict[str, str] = {}
 
     # User views
-    def list_for_user(
+    async def list_for_user(
         self, user_id: str
     ) -> Iterable[tuple[Achievement, UserAchievement | None]]:
         owned = self._user_map.get(user_id, {})
-        for a in sorted(self._ach.values(), key=lambda x: (x.title or "")):
-            yield a, owned.get(a.id)
+        return [
+            (a, owned.get(a.id))
+            for a in sorted(self._ach.values(), key=lambda x: (x.title or ""))
+        ]
 
-    def grant(self, user_id: str, achievement_id: str) -> bool:
+    async def grant(self, user_id: str, achievement_id: str) -> bool:
         if achievement_id not in self._ach:
             return False
         bag = self._user_map.setdefault(user_id, {})
@@ -43,7 +45,7 @@ class MemoryRepo(Repo):
         )
         return True
 
-    def revoke(self, user_id: str, achievement_id: str) -> bool:
+    async def revoke(self, user_id: str, achievement_id: str) -> bool:
         bag = self._user_map.get(user_id, {})
         if achievement_id not in bag:
             return False
@@ -51,16 +53,16 @@ class MemoryRepo(Repo):
         return True
 
     # Admin
-    def list_all(self) -> list[Achievement]:
+    async def list_all(self) -> list[Achievement]:
         return sorted(self._ach.values(), key=lambda x: (x.title or ""))
 
-    def get(self, achievement_id: str) -> Achievement | None:
+    async def get(self, achievement_id: str) -> Achievement | None:
         return self._ach.get(achievement_id)
 
-    def exists_code(self, code: str) -> bool:
+    async def exists_code(self, code: str) -> bool:
         return code in self._by_code
 
-    def create(self, data: dict) -> Achievement:
+    async def create(self, data: dict) -> Achievement:
         aid = _uuid()
         a = Achievement(
             id=aid,
@@ -77,7 +79,7 @@ class MemoryRepo(Repo):
         self._by_code[a.code] = aid
         return a
 
-    def update(self, achievement_id: str, data: dict) -> Achievement | None:
+    async def update(self, achievement_id: str, data: dict) -> Achievement | None:
         a = self._ach.get(achievement_id)
         if not a:
             return None
@@ -105,7 +107,7 @@ class MemoryRepo(Repo):
         a.updated_at = datetime.now(tz=UTC)
         return a
 
-    def delete(self, achievement_id: str) -> bool:
+    async def delete(self, achievement_id: str) -> bool:
         a = self._ach.pop(achievement_id, None)
         if not a:
             return False
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from domains.platform.events.application.publisher import Events
+from domains.product.achievements.application.rule_engine import (
+    RELOAD_TOPICS,
+    AchievementRuleEngine,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def register_achievement_rules(
+    events: Events, engine: AchievementRuleEngine, topics: Iterable[str]
+) -> None:
+    """Feed relay ``topics`` (and catalog changes) into the rule engine.
+
+    Topics without rules are ignored by the engine, so subscribing to every
+    relay topic costs one dictionary lookup per event.
+    """
+
+    async def _on_event(topic: str, payload: dict[str, Any]) -> None:
+        try:
+            await engine.handle(topic, payload)
+        except SQLAlchemyError as exc:
+            logger.warning("Failed to evaluate achievement rules: %s", exc)
+        except (ValueError, KeyError, TypeError, RuntimeError) as exc:
+            logger.warning("Invalid payload for achievement rules: %s", exc)
+
+    def _log_task_failure(task: asyncio.Task[Any]) -> None:
+        try:
+            exc = task.exception()
+        except asyncio.CancelledError:
+            return
+        if exc:
+            logger.exception(
+                "Unexpected error while evaluating achievement rules", exc_info=exc
+            )
+
+    def _schedule(topic: str, payload: dict[str, Any]) -> None:
+        try:
+            task = asyncio.create_task(_on_event(topic, payload))
+            task.add_done_callback(_log_task_failure)
+        except RuntimeError:
+            asyncio.run(_on_event(topic, payload))
+
+    for topic in dict.fromkeys([*topics, *sorted(RELOAD_TOPICS)]):
+        events.on(topic, _schedule)
+
+
+__all__ = ["register_achievement_rules"]
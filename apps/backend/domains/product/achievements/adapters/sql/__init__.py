@@ -1,3 +1,4 @@
+from .counters import SQLCounterStore, create_counter_store
 from .repository import SQLRepo, create_repo
 
-__all__ = ["SQLRepo", "create_repo"]
+__all__ = ["SQLCounterStore", "SQLRepo", "create_counter_store", "create_repo"]
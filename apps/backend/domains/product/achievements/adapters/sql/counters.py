@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Mapping, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from domains.product.achievements.application.ports import (
+    CounterIncrement,
+    CounterStore,
+)
+from packages.core.db import get_async_engine
+from packages.core.sql_fallback import evaluate_sql_backend
+
+from ..memory.counters import MemoryCounterStore
+
+logger = logging.getLogger(__name__)
+
+_UPSERT = text(
+    """
+    INSERT INTO product_achievement_counters(user_id, counter, bucket, value)
+    VALUES (cast(:uid as uuid), :counter, :bucket, :delta)
+    ON CONFLICT (user_id, counter, bucket)
+    DO UPDATE SET value = product_achievement_counters.value + EXCLUDED.value,
+                  updated_at = now()
+    """
+)
+_READ = text(
+    """
+    SELECT counter, bucket, value
+      FROM product_achievement_counters
+     WHERE user_id = cast(:uid as uuid)
+       AND counter = ANY(:counters)
+       AND bucket >= :since
+    """
+)
+_USERS_FIRST = text(
+    """
+    SELECT DISTINCT user_id::text AS user_id
+      FROM product_achievement_counters
+     ORDER BY user_id::text
+     LIMIT :limit
+    """
+)
+_USERS_AFTER = text(
+    """
+    SELECT DISTINCT user_id::text AS user_id
+      FROM product_achievement_counters
+     WHERE user_id > cast(:after as uuid)
+     ORDER BY user_id::text
+     LIMIT :limit
+    """
+)
+
+
+class SQLCounterStore(CounterStore):
+    def __init__(self, engine: AsyncEngine | str) -> None:
+        self._engine: AsyncEngine = (
+            get_async_engine("achievements", url=engine)
+            if isinstance(engine, str)
+            else engine
+        )
+
+    async def apply(
+        self,
+        user_id: str,
+        increments: Sequence[CounterIncrement],
+        windows: Mapping[str, int],
+    ) -> dict[str, float]:
+        async with self._engine.begin() as conn:
+            if increments:
+                await conn.execute(
+                    _UPSERT,
+                    [
+                        {"uid": user_id, "counter": key, "bucket": bucket, "delta": delta}
+                        for key, bucket, delta in increments
+                    ],
+                )
+            return await self._read(conn, user_id, windows)
+
+    async def read(self, user_id: str, windows: Mapping[str, int]) -> dict[str, float]:
+        async with self._engine.connect() as conn:
+            return await self._read(conn, user_id, windows)
+
+    async def _read(
+        self, conn: AsyncConnection, user_id: str, windows: Mapping[str, int]
+    ) -> dict[str, float]:
+        if not windows:
+            return {}
+        rows = await conn.execute(
+            _READ,
+            {"uid": user_id, "counters": list(windows), "since": min(windows.values())},
+        )
+        out: dict[str, float] = {}
+        for counter, bucket, value in rows:
+            if bucket >= windows[counter]:
+                out[counter] = out.get(counter, 0.0) + float(value)
+        return out
+
+    async def users(self, *, after: str | None, limit: int) -> list[str]:
+        sql = _USERS_FIRST if after is None else _USERS_AFTER
+        async with self._engine.connect() as conn:
+            rows = await conn.execute(sql, {"after": after, "limit": int(limit)})
+            return [str(row[0]) for row in rows]
+
+
+def create_counter_store(settings) -> CounterStore:
+    decision = evaluate_sql_backend(settings)
+    if not decision.dsn:
+        logger.debug("achievement counters: using memory backend (%s)", decision.reason)
+        return MemoryCounterStore()
+    try:
+        return SQLCounterStore(decision.dsn)
+    except Exception as exc:  # pragma: no cover - defensive fallback
+        logger.warning(
+            "achievement counters: falling back to memory due to SQL error: %s", exc
+        )
+        return MemoryCounterStore()
+
+
+__all__ = ["SQLCounterStore", "create_counter_store"]
@@ -18,6 +18,7 @@ from domains.product.achievements.api.schemas import (
     AchievementOut,
     AchievementUpdateIn,
 )
+from domains.product.achievements.domain.rules import ConditionError
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +89,10 @@ def make_router() -> APIRouter:
         try:
             actor = str(claims.get("sub") or "")
             item = await container.achievements_admin.create(data, actor)
+        except ConditionError as err:
+            raise HTTPException(
+                status_code=400, detail={"code": "invalid_condition", "reason": str(err)}
+            ) from err
         except ValueError as err:
             if str(err) == "code_conflict":
                 raise HTTPException(status_code=409, detail="conflict") from err
@@ -123,6 +128,10 @@ def make_router() -> APIRouter:
             item = await container.achievements_admin.update(
                 str(achievement_id), data, actor
             )
+        except ConditionError as err:
+            raise HTTPException(
+                status_code=400, detail={"code": "invalid_condition", "reason": str(err)}
+            ) from err
         except ValueError as err:
             if str(err) == "code_conflict":
                 raise HTTPException(status_code=409, detail="conflict") from err
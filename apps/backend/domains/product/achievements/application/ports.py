@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping, Sequence
 from typing import Protocol, runtime_checkable
 
 from domains.product.achievements.domain.entities import (
@@ -12,16 +12,40 @@ from domains.product.achievements.domain.entities import (
 @runtime_checkable
 class Repo(Protocol):
     # User views
-    def list_for_user(
+    async def list_for_user(
         self, user_id: str
     ) -> Iterable[tuple[Achievement, UserAchievement | None]]: ...
-    def grant(self, user_id: str, achievement_id: str) -> bool: ...
-    def revoke(self, user_id: str, achievement_id: str) -> bool: ...
+    async def grant(self, user_id: str, achievement_id: str) -> bool: ...
+    async def revoke(self, user_id: str, achievement_id: str) -> bool: ...
 
     # Admin
-    def list_all(self) -> list[Achievement]: ...
-    def get(self, achievement_id: str) -> Achievement | None: ...
-    def exists_code(self, code: str) -> bool: ...
-    def create(self, data: dict) -> Achievement: ...
-    def update(self, achievement_id: str, data: dict) -> Achievement | None: ...
-    def delete(self, achievement_id: str) -> bool: ...
+    async def list_all(self) -> list[Achievement]: ...
+    async def get(self, achievement_id: str) -> Achievement | None: ...
+    async def exists_code(self, code: str) -> bool: ...
+    async def create(self, data: dict) -> Achievement: ...
+    async def update(self, achievement_id: str, data: dict) -> Achievement | None: ...
+    async def delete(self, achievement_id: str) -> bool: ...
+
+
+# (counter key, bucket, delta) — see domain.rules.CounterSpec.bucket
+CounterIncrement = tuple[str, int, float]
+
+
+@runtime_checkable
+class CounterStore(Protocol):
+    """Per-user rule counters, bucketed by UTC day for windowed rules."""
+
+    async def apply(
+        self,
+        user_id: str,
+        increments: Sequence[CounterIncrement],
+        windows: Mapping[str, int],
+    ) -> dict[str, float]:
+        """Add ``increments`` and return the totals of ``windows`` counters.
+
+        ``windows`` maps a counter key to the first bucket that still counts.
+        """
+        ...
+
+    async def read(self, user_id: str, windows: Mapping[str, int]) -> dict[str, float]: ...
+    async def users(self, *, after: str | None, limit: int) -> list[str]: ...
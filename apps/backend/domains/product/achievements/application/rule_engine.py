@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from domains.platform.events.application.publisher import OutboxPublisher
+from domains.product.achievements.application.ports import (
+    CounterIncrement,
+    CounterStore,
+    Repo,
+)
+from domains.product.achievements.application.service import _safe_publish
+from domains.product.achievements.domain.rules import (
+    CompiledRule,
+    ConditionError,
+    CounterSpec,
+    compile_condition,
+)
+
+logger = logging.getLogger(__name__)
+
+# Admin changes to the catalog: rules are recompiled on the next event.
+RELOAD_TOPICS = frozenset(
+    {"achievement.created.v1", "achievement.updated.v1", "achievement.deleted.v1"}
+)
+
+
+@dataclass
+class BackfillReport:
+    users: int = 0
+    granted: int = 0
+
+
+class AchievementRuleEngine:
+    """Grant achievements from domain events using incremental counters.
+
+    Conditions are compiled once per catalog version and indexed by topic. An
+    event only touches the counters that subscribe to its topic and re-evaluates
+    the rules that depend on them, so the cost per event does not depend on the
+    user's history. ``Repo.grant`` is idempotent, so redelivered events or a
+    concurrent backfill never grant twice; pairs already granted are remembered
+    (up to ``granted_cache_size``) so satisfied rules do not hit the database on
+    every further event.
+    """
+
+    def __init__(
+        self,
+        repo: Repo,
+        counters: CounterStore,
+        *,
+        outbox: OutboxPublisher | None = None,
+        reload_interval: float = 60.0,
+        granted_cache_size: int = 100_000,
+        clock: Callable[[], float] = time.time,
+        monotonic: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.repo = repo
+        self.counters = counters
+        self.outbox = outbox
+        self.reload_interval = reload_interval
+        self.clock = clock
+        self.monotonic = monotonic
+        self._rules: list[CompiledRule] = []
+        self._specs_by_topic: dict[str, list[CounterSpec]] = {}
+        self._rules_by_counter: dict[str, list[CompiledRule]] = {}
+        self._loaded_at: float | None = None
+        self._granted: OrderedDict[tuple[str, str], None] = OrderedDict()
+        self._granted_cache_size = granted_cache_size
+        self._lock = asyncio.Lock()
+
+    @property
+    def rules(self) -> list[CompiledRule]:
+        return list(self._rules)
+
+    @property
+    def topics(self) -> frozenset[str]:
+        return frozenset(self._specs_by_topic)
+
+    def invalidate(self) -> None:
+        self._loaded_at = None
+
+    async def load(self) -> None:
+        """Compile the conditions of every achievement in the catalog."""
+
+        rules: list[CompiledRule] = []
+        for achievement in await self.repo.list_all():
+            try:
+                expr = compile_condition(achievement.condition)
+            except ConditionError as exc:
+                logger.warning(
+                    "achievement %s has an invalid condition: %s", achievement.code, exc
+                )
+                continue
+            if expr is not None:
+                rules.append(CompiledRule(achievement.id, achievement.code, expr))
+        specs_by_topic: dict[str, dict[str, CounterSpec]] = defaultdict(dict)
+        rules_by_counter: dict[str, list[CompiledRule]] = defaultdict(list)
+        for rule in rules:
+            for spec in rule.counters:
+                specs_by_topic[spec.topic][spec.key] = spec
+                bucket = rules_by_counter[spec.key]
+                if not bucket or bucket[-1] is not rule:
+                    bucket.append(rule)
+        self._rules = rules
+        self._specs_by_topic = {t: list(s.values()) for t, s in specs_by_topic.items()}
+        self._rules_by_counter = dict(rules_by_counter)
+        self._loaded_at = self.monotonic()
+
+    async def _ensure_loaded(self) -> None:
+        loaded_at = self._loaded_at
+        if loaded_at is not None and self.monotonic() - loaded_at < self.reload_interval:
+            return
+        async with self._lock:
+            loaded_at = self._loaded_at
+            if loaded_at is None or self.monotonic() - loaded_at >= self.reload_interval:
+                await self.load()
+
+    async def handle(self, topic: str, payload: Mapping[str, Any]) -> list[str]:
+        """Apply one event; returns ids of achievements granted by it."""
+
+        if topic in RELOAD_TOPICS:
+            self.invalidate()
+            return []
+        await self._ensure_loaded()
+        specs = self._specs_by_topic.get(topic)
+        if not specs:
+            return []
+        now = self.clock()
+        increments: dict[str, list[CounterIncrement]] = defaultdict(list)
+        for spec in specs:
+            if not spec.matches(payload):
+                continue
+            user_id = spec.user_of(payload)
+            delta = spec.delta(payload)
+            if user_id and delta:
+                increments[user_id].append((spec.key, spec.bucket(now), delta))
+        granted: list[str] = []
+        for user_id, items in increments.items():
+            granted.extend(await self._apply(user_id, items, now))
+        return granted
+
+    async def _apply(
+        self, user_id: str, items: list[CounterIncrement], now: float
+    ) -> list[str]:
+        rules: dict[str, CompiledRule] = {}
+        for key, _bucket, _delta in items:
+            for rule in self._rules_by_counter.get(key, ()):
+                rules.setdefault(rule.achievement_id, rule)
+        windows = {
+            spec.key: spec.since(now) for rule in rules.values() for spec in rule.counters
+        }
+        values = await self.counters.apply(user_id, items, windows)
+        granted: list[str] = []
+        for rule in rules.values():
+            if rule.expr.evaluate(values) and await self._grant(user_id, rule):
+                granted.append(rule.achievement_id)
+        return granted
+
+    async def _grant(self, user_id: str, rule: CompiledRule) -> bool:
+        pair = (user_id, rule.achievement_id)
+        if pair in self._granted:
+            self._granted.move_to_end(pair)
+            return False
+        ok = await self.repo.grant(user_id, rule.achievement_id)
+        self._granted[pair] = None
+        if len(self._granted) > self._granted_cache_size:
+            self._granted.popitem(last=False)
+        if ok:
+            logger.info("achievement %s granted to %s by rule", rule.code, user_id)
+            _safe_publish(
+                self.outbox,
+                "achievement.granted.v1",
+                {
+                    "user_id": user_id,
+                    "achievement_id": rule.achievement_id,
+                    "code": rule.code,
+                    "source": "rule",
+                },
+                context=f"achievement:{rule.code}",
+            )
+        return ok
+
+    async def evaluate_user(self, user_id: str) -> list[str]:
+        """Grant every rule the user's stored counters already satisfy."""
+
+        await self._ensure_loaded()
+        now = self.clock()
+        windows = {
+            spec.key: spec.since(now) for rule in self._rules for spec in rule.counters
+        }
+        values = await self.counters.read(user_id, windows)
+        granted: list[str] = []
+        for rule in self._rules:
+            if rule.expr.evaluate(values) and await self._grant(user_id, rule):
+                granted.append(rule.achievement_id)
+        return granted
+
+    async def backfill(self, *, batch_size: int = 500) -> BackfillReport:
+        """Evaluate all users with counters, ``batch_size`` users per page."""
+
+        await self.load()
+        report = BackfillReport()
+        after: str | None = None
+        while True:
+            users = await self.counters.users(after=after, limit=batch_size)
+            if not users:
+                break
+            for user_id in users:
+                report.granted += len(await self.evaluate_user(user_id))
+            report.users += len(users)
+            after = users[-1]
+            logger.info(
+                "achievements backfill: %s users, %s grants", report.users, report.granted
+            )
+        return report
+
+
+__all__ = ["AchievementRuleEngine", "BackfillReport", "RELOAD_TOPICS"]
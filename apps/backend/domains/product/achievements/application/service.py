@@ -5,6 +5,10 @@ from typing import Any
 
 from domains.platform.events.application.publisher import OutboxPublisher
 from domains.product.achievements.application.ports import Repo
+from domains.product.achievements.domain.rules import (
+    compile_condition,
+    is_rule_condition,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -20,17 +24,29 @@ def _safe_publish(
         logger.exception("Failed to publish %s for %s", event, context)
 
 
+def _check_condition(code: str, condition: Any) -> None:
+    """Reject malformed rules; keep conditions the engine does not read."""
+
+    if not condition:
+        return
+    if not is_rule_condition(condition):
+        logger.info(
+            "achievement %s condition has no rule keys; it is manual-only", code
+        )
+        return
+    compile_condition(condition)
+
+
 class AchievementsService:
     def __init__(self, repo: Repo, outbox: OutboxPublisher | None = None):
         self.repo = repo
         self.outbox = outbox
 
     async def list(self, user_id: str):
-        # synchronous repo; keep API async-friendly
-        return list(self.repo.list_for_user(user_id))
+        return list(await self.repo.list_for_user(user_id))
 
     async def grant_manual(self, user_id: str, achievement_id: str) -> bool:
-        ok = self.repo.grant(user_id, achievement_id)
+        ok = await self.repo.grant(user_id, achievement_id)
         if ok:
             _safe_publish(
                 self.outbox,
@@ -41,7 +57,7 @@ class AchievementsService:
         return ok
 
     async def revoke_manual(self, user_id: str, achievement_id: str) -> bool:
-        ok = self.repo.revoke(user_id, achievement_id)
+        ok = await self.repo.revoke(user_id, achievement_id)
         if ok:
             _safe_publish(
                 self.outbox,
@@ -58,18 +74,19 @@ class AchievementsAdminService:
         self.outbox = outbox
 
     async def list(self):
-        return self.repo.list_all()
+        return await self.repo.list_all()
 
     async def create(self, data: dict[str, Any], actor_id: str) -> Any:
         code = (data.get("code") or "").strip()
         if not code:
             raise ValueError("code_required")
-        if self.repo.exists_code(code):
+        if await self.repo.exists_code(code):
             raise ValueError("code_conflict")
+        _check_condition(code, data.get("condition"))
         payload = dict(data)
         payload["created_by_user_id"] = actor_id
         payload["updated_by_user_id"] = actor_id
-        res = self.repo.create(payload)
+        res = await self.repo.create(payload)
         _safe_publish(
             self.outbox,
             "achievement.created.v1",
@@ -83,9 +100,11 @@ class AchievementsAdminService:
             _code = str(data["code"]).strip()
             # conflict if another achievement already has this code
             # repo.update returns None in case of conflict or not found
+        if data.get("condition") is not None:
+            _check_condition(str(data.get("code") or achievement_id), data["condition"])
         payload = dict(data)
         payload["updated_by_user_id"] = actor_id
-        updated = self.repo.update(achievement_id, payload)
+        updated = await self.repo.update(achievement_id, payload)
         if updated:
             _safe_publish(
                 self.outbox,
@@ -99,7 +118,7 @@ class AchievementsAdminService:
         return updated
 
     async def delete(self, achievement_id: str) -> bool:
-        ok = self.repo.delete(achievement_id)
+        ok = await self.repo.delete(achievement_id)
         if ok:
             _safe_publish(
                 self.outbox,
@@ -0,0 +1,256 @@
+"""Compile ``achievements.condition`` documents into evaluators (no I/O).
+
+A condition is a JSON object stored with the achievement:
+
+* ``{}`` — no rule, the achievement is granted manually only; so is any
+  object without rule keys (``event``, ``all``, ``any``, ``count``, ...),
+  which is stored as-is for clients and ignored by the engine;
+* ``{"event": "node.created.v1", "where": {"status": "published"}, "count": 10}``
+  — a counter of matching events per user reaching a threshold. Instead of
+  ``count`` the threshold may be ``gte``; ``"sum": "amount"`` accumulates a
+  payload field instead of counting; ``"window_days": 7`` only counts the
+  last N days; ``"user": "author_id"`` names the payload field with the user
+  id (by default ``user_id``, ``author_id`` or ``actor_id``, whichever is set);
+* ``{"all": [...]}`` / ``{"any": [...]}`` — combinations of the above.
+
+``where`` maps (dotted) payload fields to a value or an operator object
+(``eq``, ``ne``, ``in``, ``gt``, ``gte``, ``lt``, ``lte``, ``exists``).
+
+Identical counters of different rules compile to the same :class:`CounterSpec`
+key, so "publish 1 / 10 / 100 nodes" share one stored counter.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+DAY_SECONDS = 86400
+DEFAULT_USER_FIELDS = ("user_id", "author_id", "actor_id")
+# Keys that make a condition a rule; anything else is a manual-only note.
+RULE_KEYS = frozenset(
+    {"event", "all", "any", "count", "gte", "sum", "where", "window_days", "user"}
+)
+
+_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "eq": lambda value, arg: value == arg,
+    "ne": lambda value, arg: value != arg,
+    "in": lambda value, arg: value in arg,
+    "gt": lambda value, arg: value is not None and value > arg,
+    "gte": lambda value, arg: value is not None and value >= arg,
+    "lt": lambda value, arg: value is not None and value < arg,
+    "lte": lambda value, arg: value is not None and value <= arg,
+    "exists": lambda value, arg: (value is not None) is bool(arg),
+}
+_MISSING = object()
+
+
+class ConditionError(ValueError):
+    """Achievement condition cannot be compiled."""
+
+
+def _lookup(payload: Mapping[str, Any], path: str) -> Any:
+    current: Any = payload
+    for part in path.split("."):
+        if not isinstance(current, Mapping):
+            return None
+        current = current.get(part, _MISSING)
+        if current is _MISSING:
+            return None
+    return current
+
+
+def _compile_where(where: Any) -> tuple[tuple[str, str, Any], ...]:
+    if where is None:
+        return ()
+    if not isinstance(where, Mapping):
+        raise ConditionError("where must be an object")
+    clauses: list[tuple[str, str, Any]] = []
+    for path, expected in sorted(where.items()):
+        if isinstance(expected, Mapping):
+            for op, arg in sorted(expected.items()):
+                if op not in _OPERATORS:
+                    raise ConditionError(f"unknown operator {op!r} for {path!r}")
+                if op == "in":
+                    if not isinstance(arg, list | tuple):
+                        raise ConditionError(f"'in' for {path!r} expects a list")
+                    arg = tuple(arg)
+                clauses.append((str(path), op, arg))
+        else:
+            clauses.append((str(path), "eq", expected))
+    return tuple(clauses)
+
+
+@dataclass(frozen=True)
+class CounterSpec:
+    """Per-user counter of events on ``topic`` matching ``where``."""
+
+    topic: str
+    where: tuple[tuple[str, str, Any], ...] = ()
+    user_field: str | None = None
+    measure: str | None = None
+    window_days: int = 0
+    key: str = field(default="", compare=False)
+
+    def __post_init__(self) -> None:
+        if not self.key:
+            canonical = json.dumps(
+                [self.topic, self.where, self.user_field, self.measure, self.window_days],
+                sort_keys=True,
+                default=str,
+            )
+            digest = hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:16]
+            object.__setattr__(self, "key", f"{self.topic}:{digest}")
+
+    def matches(self, payload: Mapping[str, Any]) -> bool:
+        for path, op, arg in self.where:
+            try:
+                if not _OPERATORS[op](_lookup(payload, path), arg):
+                    return False
+            except TypeError:
+                return False
+        return True
+
+    def user_of(self, payload: Mapping[str, Any]) -> str | None:
+        fields = (self.user_field,) if self.user_field else DEFAULT_USER_FIELDS
+        for name in fields:
+            value = _lookup(payload, name)
+            if value not in (None, ""):
+                return str(value)
+        return None
+
+    def delta(self, payload: Mapping[str, Any]) -> float:
+        if self.measure is None:
+            return 1.0
+        try:
+            return float(_lookup(payload, self.measure) or 0)
+        except (TypeError, ValueError):
+            return 0.0
+
+    def bucket(self, ts: float) -> int:
+        """Storage bucket for an event at ``ts``: the UTC day, ``0`` for all-time."""
+
+        return int(ts // DAY_SECONDS) if self.window_days else 0
+
+    def since(self, ts: float) -> int:
+        """First bucket that still counts at ``ts``."""
+
+        return self.bucket(ts) - self.window_days + 1 if self.window_days else 0
+
+
+class Expr:
+    counters: tuple[CounterSpec, ...] = ()
+
+    def evaluate(self, values: Mapping[str, float]) -> bool:  # pragma: no cover
+        raise NotImplementedError
+
+
+@dataclass(frozen=True)
+class Threshold(Expr):
+    counter: CounterSpec
+    threshold: float
+
+    @property
+    def counters(self) -> tuple[CounterSpec, ...]:  # type: ignore[override]
+        return (self.counter,)
+
+    def evaluate(self, values: Mapping[str, float]) -> bool:
+        return values.get(self.counter.key, 0.0) >= self.threshold
+
+
+@dataclass(frozen=True)
+class AllOf(Expr):
+    children: tuple[Expr, ...]
+
+    @property
+    def counters(self) -> tuple[CounterSpec, ...]:  # type: ignore[override]
+        return tuple(spec for child in self.children for spec in child.counters)
+
+    def evaluate(self, values: Mapping[str, float]) -> bool:
+        return all(child.evaluate(values) for child in self.children)
+
+
+@dataclass(frozen=True)
+class AnyOf(AllOf):
+    def evaluate(self, values: Mapping[str, float]) -> bool:
+        return any(child.evaluate(values) for child in self.children)
+
+
+def _compile_threshold(node: Mapping[str, Any]) -> Threshold:
+    topic = str(node.get("event") or "").strip()
+    if not topic:
+        raise ConditionError("event is required")
+    raw_threshold = node.get("count", node.get("gte", 1))
+    try:
+        threshold = float(raw_threshold)
+        window_days = int(node.get("window_days") or 0)
+    except (TypeError, ValueError) as exc:
+        raise ConditionError("count/gte and window_days must be numbers") from exc
+    if threshold <= 0:
+        raise ConditionError("threshold must be positive")
+    if window_days < 0:
+        raise ConditionError("window_days must not be negative")
+    spec = CounterSpec(
+        topic=topic,
+        where=_compile_where(node.get("where")),
+        user_field=(str(node["user"]) if node.get("user") else None),
+        measure=(str(node["sum"]) if node.get("sum") else None),
+        window_days=window_days,
+    )
+    return Threshold(spec, threshold)
+
+
+def _compile(node: Any) -> Expr:
+    if not isinstance(node, Mapping):
+        raise ConditionError("condition must be an object")
+    for name, kind in (("all", AllOf), ("any", AnyOf)):
+        if name in node:
+            children = node[name]
+            if not isinstance(children, list) or not children:
+                raise ConditionError(f"{name!r} expects a non-empty list")
+            return kind(tuple(_compile(child) for child in children))
+    return _compile_threshold(node)
+
+
+def is_rule_condition(condition: Any) -> bool:
+    """Whether ``condition`` is meant for the rule engine."""
+
+    return isinstance(condition, Mapping) and not RULE_KEYS.isdisjoint(condition)
+
+
+def compile_condition(condition: Mapping[str, Any] | None) -> Expr | None:
+    """Evaluator for ``condition``; ``None`` when the achievement is manual."""
+
+    if not condition:
+        return None
+    if isinstance(condition, Mapping) and not is_rule_condition(condition):
+        return None
+    return _compile(condition)
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    achievement_id: str
+    code: str
+    expr: Expr
+
+    @property
+    def counters(self) -> tuple[CounterSpec, ...]:
+        return self.expr.counters
+
+
+__all__ = [
+    "AllOf",
+    "AnyOf",
+    "CompiledRule",
+    "ConditionError",
+    "CounterSpec",
+    "Expr",
+    "RULE_KEYS",
+    "Threshold",
+    "compile_condition",
+    "is_rule_condition",
+]
@@ -0,0 +1,10 @@
+-- Per-user rule counters (bucket = UTC day number for windowed rules, 0 otherwise)
+CREATE TABLE IF NOT EXISTS product_achievement_counters (
+  user_id uuid NOT NULL,
+  counter text NOT NULL,
+  bucket integer NOT NULL DEFAULT 0,
+  value double precision NOT NULL DEFAULT 0,
+  updated_at timestamptz NOT NULL DEFAULT now(),
+  PRIMARY KEY (user_id, counter, bucket)
+);
+CREATE INDEX IF NOT EXISTS ix_product_achievement_counters_counter ON product_achievement_counters(counter);
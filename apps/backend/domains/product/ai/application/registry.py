@@ -220,30 +220,26 @@ class _SQLBackend:
              ORDER BY slug
             """
         )
-        engine, dispose = await self._engine_for_call()
-        try:
-            async with engine.begin() as conn:
-                rows = (await conn.execute(sql)).mappings().all()
-            result: list[LLMProviderCfg] = []
-            for row in rows:
-                extras = row["extras"] if row["extras"] is None else dict(row["extras"])
-                result.append(
-                    LLMProviderCfg(
-                        slug=row["slug"],
-                        title=row["title"],
-                        enabled=bool(row["enabled"]),
-                        base_url=row["base_url"],
-                        api_key=row["api_key"],
-                        timeout_sec=row["timeout_sec"],
-                        extras=extras,
-                        created_at=row.get("created_at"),
-                        updated_at=row.get("updated_at"),
-                    )
+        engine = self._get_engine()
+        async with engine.begin() as conn:
+            rows = (await conn.execute(sql)).mappings().all()
+        result: list[LLMProviderCfg] = []
+        for row in rows:
+            extras = row["extras"] if row["extras"] is None else dict(row["extras"])
+            result.append(
+                LLMProviderCfg(
+                    slug=row["slug"],
+                    title=row["title"],
+                    enabled=bool(row["enabled"]),
+                    base_url=row["base_url"],
+                    api_key=row["api_key"],
+                    timeout_sec=row["timeout_sec"],
+                    extras=extras,
+                    created_at=row.get("created_at"),
+                    updated_at=row.get("updated_at"),
                 )
-            return result
-        finally:
-            if dispose:
-                await engine.dispose()
+            )
+        return result
 
     async def upsert_provider(self, data: dict[str, Any]) -> LLMProviderCfg:
         slug = str(data.get("slug") or "").strip()
@@ -274,40 +270,32 @@ class _SQLBackend:
             "timeout_sec": int(data.get("timeout_sec") or 0) or None,
             "extras": json.dumps(extras) if extras is not None else None,
         }
-        engine, dispose = await self._engine_for_call()
-        try:
-            async with engine.begin() as conn:
-                row = (await conn.execute(sql, params)).mappings().first()
-            if row is None:
-
-                raise RuntimeError("database_row_missing")
-            stored_extras = (
-                row["extras"] if row["extras"] is None else dict(row["extras"])
-            )
-            return LLMProviderCfg(
-                slug=row["slug"],
-                title=row["title"],
-                enabled=bool(row["enabled"]),
-                base_url=row["base_url"],
-                api_key=row["api_key"],
-                timeout_sec=row["timeout_sec"],
-                extras=stored_extras,
-                created_at=row.get("created_at"),
-                updated_at=row.get("updated_at"),
-            )
-        finally:
-            if dispose:
-                await engine.dispose()
+        engine = self._get_engine()
+        async with engine.begin() as conn:
+            row = (await conn.execute(sql, params)).mappings().first()
+        if row is None:
+
+            raise RuntimeError("database_row_missing")
+        stored_extras = (
+            row["extras"] if row["extras"] is None else dict(row["extras"])
+        )
+        return LLMProviderCfg(
+            slug=row["slug"],
+            title=row["title"],
+            enabled=bool(row["enabled"]),
+            base_url=row["base_url"],
+            api_key=row["api_key"],
+            timeout_sec=row["timeout_sec"],
+            extras=stored_extras,
+            created_at=row.get("created_at"),
+            updated_at=row.get("updated_at"),
+        )
 
     async def delete_provider(self, slug: str) -> None:
         sql = text("DELETE FROM ai_providers WHERE slug = :slug")
-        engine, dispose = await self._engine_for_call()
-        try:
-            async with engine.begin() as conn:
-                await conn.execute(sql, {"slug": slug})
-        finally:
-            if dispose:
-                await engine.dispose()
+        engine = self._get_engine()
+        async with engine.begin() as conn:
+            await conn.execute(sql, {"slug": slug})
 
     async def list_models(self) -> list[LLMModelCfg]:
         sql = text(
@@ -325,30 +313,26 @@ class _SQLBackend:
              ORDER BY updated_at DESC, created_at DESC
             """
         )
-        engine, dispose = await self._engine_for_call()
-        try:
-            async with engine.begin() as conn:
-                rows = (await conn.execute(sql)).mappings().all()
-            result: list[LLMModelCfg] = []
-            for row in rows:
-                params = row["params"] if row["params"] is None else dict(row["params"])
-                result.append(
-                    LLMModelCfg(
-                        id=str(row["id"]),
-                        name=row["name"],
-                        provider_slug=row["provider_slug"],
-                        version=row["version"],
-                        status=row["status"],
-                        is_default=bool(row["is_default"]),
-                        params=params,
-                        created_at=row.get("created_at"),
-                        updated_at=row.get("updated_at"),
-                    )
+        engine = self._get_engine()
+        async with engine.begin() as conn:
+            rows = (await conn.execute(sql)).mappings().all()
+        result: list[LLMModelCfg] = []
+        for row in rows:
+            params = row["params"] if row["params"] is None else dict(row["params"])
+            result.append(
+                LLMModelCfg(
+                    id=str(row["id"]),
+                    name=row["name"],
+                    provider_slug=row["provider_slug"],
+                    version=row["version"],
+                    status=row["status"],
+                    is_default=bool(row["is_default"]),
+                    params=params,
+                    created_at=row.get("created_at"),
+                    updated_at=row.get("updated_at"),
                 )
-            return result
-        finally:
-            if dispose:
-                await engine.dispose()
+            )
+        return result
 
     async def upsert_model(self, data: dict[str, Any]) -> LLMModelCfg:
         mid = str(data.get("id") or uuid.uuid4())
@@ -385,40 +369,32 @@ class _SQLBackend:
             "is_default": bool(data.get("is_default", False)),
             "params": json.dumps(params_json) if params_json is not None else None,
         }
-        engine, dispose = await self._engine_for_call()
-        try:
-            async with engine.begin() as conn:
-                row = (await conn.execute(sql, params)).mappings().first()
-            if row is None:
-
-                raise RuntimeError("database_row_missing")
-            stored_params = (
-                row["params"] if row["params"] is None else dict(row["params"])
-            )
-            return LLMModelCfg(
-                id=str(row["id"]),
-                name=row["name"],
-                provider_slug=row["provider_slug"],
-                version=row["version"],
-                status=row["status"],
-                is_default=bool(row["is_default"]),
-                params=stored_params,
-                created_at=row.get("created_at"),
-                updated_at=row.get("updated_at"),
-            )
-        finally:
-            if dispose:
-                await engine.dispose()
+        engine = self._get_engine()
+        async with engine.begin() as conn:
+            row = (await conn.execute(sql, params)).mappings().first()
+        if row is None:
+
+            raise RuntimeError("database_row_missing")
+        stored_params = (
+            row["params"] if row["params"] is None else dict(row["params"])
+        )
+        return LLMModelCfg(
+            id=str(row["id"]),
+            name=row["name"],
+            provider_slug=row["provider_slug"],
+            version=row["version"],
+            status=row["status"],
+            is_default=bool(row["is_default"]),
+            params=stored_params,
+            created_at=row.get("created_at"),
+            updated_at=row.get("updated_at"),
+        )
 
     async def delete_model(self, model_id: str) -> None:
         sql = text("DELETE FROM ai_models WHERE id = cast(:id as uuid)")
-        engine, dispose = await self._engine_for_call()
-        try:
-            async with engine.begin() as conn:
-                await conn.execute(sql, {"id": model_id})
-        finally:
-            if dispose:
-                await engine.dispose()
+        engine = self._get_engine()
+        async with engine.begin() as conn:
+            await conn.execute(sql, {"id": model_id})
 
     async def list_fallbacks(self) -> list[FallbackRule]:
         sql = text(
@@ -435,26 +411,22 @@ class _SQLBackend:
              ORDER BY priority NULLS LAST, created_at ASC
             """
         )
-        engine, dispose = await self._engine_for_call()
-        try:
-            async with engine.begin() as conn:
-                rows = (await conn.execute(sql)).mappings().all()
-            return [
-                FallbackRule(
-                    id=str(row["id"]),
-                    primary_model=row["primary_model"],
-                    fallback_model=row["fallback_model"],
-                    mode=row["mode"],
-                    ratio=row["ratio"],
-                    priority=row["priority"],
-                    created_at=row.get("created_at"),
-                    updated_at=row.get("updated_at"),
-                )
-                for row in rows
-            ]
-        finally:
-            if dispose:
-                await engine.dispose()
+        engine = self._get_engine()
+        async with engine.begin() as conn:
+            rows = (await conn.execute(sql)).mappings().all()
+        return [
+            FallbackRule(
+                id=str(row["id"]),
+                primary_model=row["primary_model"],
+                fallback_model=row["fallback_model"],
+                mode=row["mode"],
+                ratio=row["ratio"],
+                priority=row["priority"],
+                created_at=row.get("created_at"),
+                updated_at=row.get("updated_at"),
+            )
+            for row in rows
+        ]
 
     async def upsert_fallback(self, data: dict[str, Any]) -> FallbackRule:
         rid = str(data.get("id") or uuid.uuid4())
@@ -489,43 +461,36 @@ class _SQLBackend:
             "ratio": ratio,
             "priority": priority,
         }
-        engine, dispose = await self._engine_for_call()
-        try:
-            async with engine.begin() as conn:
-                row = (await conn.execute(sql, params)).mappings().first()
-            if row is None:
-
-                raise RuntimeError("database_row_missing")
-            return FallbackRule(
-                id=str(row["id"]),
-                primary_model=row["primary_model"],
-                fallback_model=row["fallback_model"],
-                mode=row["mode"],
-                ratio=row["ratio"],
-                priority=row["priority"],
-                created_at=row.get("created_at"),
-                updated_at=row.get("updated_at"),
-            )
-        finally:
-            if dispose:
-                await engine.dispose()
+        engine = self._get_engine()
+        async with engine.begin() as conn:
+            row = (await conn.execute(sql, params)).mappings().first()
+        if row is None:
+
+            raise RuntimeError("database_row_missing")
+        return FallbackRule(
+            id=str(row["id"]),
+            primary_model=row["primary_model"],
+            fallback_model=row["fallback_model"],
+            mode=row["mode"],
+            ratio=row["ratio"],
+            priority=row["priority"],
+            created_at=row.get("created_at"),
+            updated_at=row.get("updated_at"),
+        )
 
     async def delete_fallback(self, rule_id: str) -> None:
         sql = text("DELETE FROM ai_fallbacks WHERE id = cast(:id as uuid)")
-        engine, dispose = await self._engine_for_call()
-        try:
-            async with engine.begin() as conn:
-                await conn.execute(sql, {"id": rule_id})
-        finally:
-            if dispose:
-                await engine.dispose()
+        engine = self._get_engine()
+        async with engine.begin() as conn:
+            await conn.execute(sql, {"id": rule_id})
 
-    async def _engine_for_call(self) -> tuple[AsyncEngine, bool]:
+    def _get_engine(self) -> AsyncEngine:
         if self._engine is not None:
-            return self._engine, False
+            return self._engine
         if self._dsn is None:
             raise RuntimeError("LLM SQL backend requires configuration")
-        return get_async_engine("ai-registry", url=self._dsn), True
+        # Shared pooled engine; disposing it per call would drop the whole pool.
+        return get_async_engine("ai-registry", url=self._dsn)
 
 
 def redact_provider(d: LLMProviderCfg) -> dict[str, Any]:
@@ -402,7 +402,7 @@ def _build_quest_data_service(container) -> QuestDataService:
             ref = str(item)
             if ref in cache:
                 continue
-            card = _fetch_quest_card(svc, ref)
+            card = await _fetch_quest_card(svc, ref)
             if card is None:
                 continue
             cache[ref] = card
@@ -629,17 +629,17 @@ def _node_to_card(view: Any) -> dict[str, Any]:
     }
 
 
-def _fetch_quest_card(service, ref: str) -> dict[str, Any] | None:
+async def _fetch_quest_card(service, ref: str) -> dict[str, Any] | None:
     quest = None
     try:
-        quest = service.get(ref)
+        quest = await service.get(ref)
     except Exception:  # pragma: no cover - defensive fallback
         quest = None
     if quest is None:
         getter = getattr(getattr(service, "repo", None), "get_by_slug", None)
         if callable(getter):
             try:
-                quest = getter(ref)
+                quest = await getter(ref)
             except Exception:  # pragma: no cover - defensive fallback
                 quest = None
     if quest is None:
@@ -13,6 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncEngine
 from apps.backend.app.api_gateway.routers import get_container
 from packages.core.config import to_async_dsn
 from packages.core.db import get_async_engine
+from packages.core.db_replicas import read_only
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +38,8 @@ async def _ensure_engine(settings) -> AsyncEngine | None:
         dsn = to_async_dsn(settings.database_url)
         if not dsn:
             return None
-        return get_async_engine("content-analytics", url=dsn, future=True)
+        with read_only():
+            return get_async_engine("content-analytics", url=dsn, future=True)
     except (ValidationError, ValueError, TypeError) as exc:
         logger.warning("content analytics: invalid database configuration: %s", exc)
         return None
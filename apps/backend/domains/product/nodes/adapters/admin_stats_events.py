@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Protocol
+
+from domains.platform.events.application.publisher import Events
+
+logger = logging.getLogger(__name__)
+
+# Comment and ban events after which a node's admin stats row is stale.
+ADMIN_STATS_TOPICS: tuple[str, ...] = (
+    "node.comment.created.v1",
+    "node.comment.deleted.v1",
+    "node.comment.status_changed.v1",
+    "node.comments.user_banned.v1",
+    "node.comments.user_unbanned.v1",
+)
+
+
+class AdminStatsProjection(Protocol):
+    async def refresh(self, node_ids: list[int]) -> None: ...
+
+
+def register_admin_stats_projection(events: Events, stats: AdminStatsProjection) -> None:
+    """Refresh ``node_admin_stats`` for the node named in comment events.
+
+    Node ids arriving while a refresh is running are collected and refreshed
+    together by the same task, so a bulk moderation action costs one upsert
+    per batch rather than one per comment.
+    """
+
+    pending: set[int] = set()
+    running: dict[str, asyncio.Task[Any]] = {}
+
+    async def _flush() -> None:
+        while pending:
+            batch = sorted(pending)
+            pending.clear()
+            await stats.refresh(batch)
+
+    def _log_task_failure(task: asyncio.Task[Any]) -> None:
+        running.pop("flush", None)
+        try:
+            exc = task.exception()
+        except asyncio.CancelledError:
+            return
+        if exc:
+            logger.exception("Failed to refresh node admin stats", exc_info=exc)
+
+    def _schedule(topic: str, payload: dict[str, Any]) -> None:
+        del topic
+        try:
+            pending.add(int(payload.get("node_id")))  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            return
+        if "flush" in running:
+            return
+        try:
+            task = asyncio.create_task(_flush())
+        except RuntimeError:
+            asyncio.run(_flush())
+            return
+        running["flush"] = task
+        task.add_done_callback(_log_task_failure)
+
+    for topic in ADMIN_STATS_TOPICS:
+        events.on(topic, _schedule)
+
+
+__all__ = ["ADMIN_STATS_TOPICS", "register_admin_stats_projection"]
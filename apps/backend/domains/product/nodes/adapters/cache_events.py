@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from domains.platform.events.application.publisher import Events
+from domains.product.nodes.application.interactors.events import (
+    NODE_TAGS_UPDATED_BATCH_TOPIC,
+    NODE_UPDATED_BATCH_TOPIC,
+)
+from domains.product.nodes.application.ports import BatchNodeCache, NodeCache
+
+logger = logging.getLogger(__name__)
+
+# Batch envelopes published by admin bulk actions; each names many nodes.
+CACHE_BATCH_TOPICS: tuple[str, ...] = (
+    NODE_UPDATED_BATCH_TOPIC,
+    NODE_TAGS_UPDATED_BATCH_TOPIC,
+)
+
+
+async def invalidate_batch(cache: NodeCache, payload: dict[str, Any]) -> int:
+    """Drop cached entries for every node listed in a batch envelope."""
+
+    ids = [int(node_id) for node_id in payload.get("ids") or []]
+    if not ids:
+        return 0
+    slugs = [str(slug) for slug in payload.get("slugs") or [] if slug]
+    if isinstance(cache, BatchNodeCache):
+        await cache.invalidate_many(ids, slugs)
+    else:
+        for node_id in ids:
+            await cache.invalidate(node_id)
+    return len(ids)
+
+
+def register_node_cache_invalidation(events: Events, cache: NodeCache) -> None:
+    """Invalidate the node cache once per batch envelope.
+
+    Per-node events are still emitted for legacy consumers; the cache reacts
+    only to the envelope so a 10k-node bulk update costs a handful of DELs.
+    """
+
+    def _log_task_failure(task: asyncio.Task[Any]) -> None:
+        try:
+            exc = task.exception()
+        except asyncio.CancelledError:
+            return
+        if exc:
+            logger.exception("Failed to invalidate node cache batch", exc_info=exc)
+
+    def _schedule(topic: str, payload: dict[str, Any]) -> None:
+        del topic
+        try:
+            task = asyncio.create_task(invalidate_batch(cache, payload))
+        except RuntimeError:
+            asyncio.run(invalidate_batch(cache, payload))
+            return
+        task.add_done_callback(_log_task_failure)
+
+    for topic in CACHE_BATCH_TOPICS:
+        events.on(topic, _schedule)
+
+
+__all__ = ["CACHE_BATCH_TOPICS", "invalidate_batch", "register_node_cache_invalidation"]
@@ -5,10 +5,20 @@ from datetime import UTC, datetime
 from itertools import count
 from typing import Any
 
+from domains.product.nodes.application.comment_threads import (
+    MAX_THREAD_WINDOW,
+    ThreadCursor,
+    ThreadScope,
+    comment_path,
+    is_visible_status,
+    path_ids,
+    subtree_bounds,
+)
 from domains.product.nodes.application.ports import (
     NodeCommentBanDTO,
     NodeCommentDTO,
     NodeCommentsRepo,
+    NodeCommentThreadPage,
 )
 
 _MAX_DEPTH = 5
@@ -45,6 +55,8 @@ def _dto_from_state(state: dict[str, Any]) -> NodeCommentDTO:
         metadata=_clone_metadata(state["metadata"]),
         created_at=str(state["created_at"]),
         updated_at=str(state["updated_at"]),
+        reply_count=int(state.get("reply_count", 0)),
+        descendant_count=int(state.get("descendant_count", 0)),
     )
 
 
@@ -58,6 +70,8 @@ class MemoryNodeCommentsRepo(NodeCommentsRepo):
         self._bans: dict[tuple[int, str], NodeCommentBanDTO] = {}
         self._locks: dict[int, dict[str, str | None]] = {}
         self._disabled: set[int] = set()
+        # node_id -> [visible comments, visible root comments]
+        self._counters: dict[int, list[int]] = defaultdict(lambda: [0, 0])
 
     async def create(
         self,
@@ -71,6 +85,7 @@ class MemoryNodeCommentsRepo(NodeCommentsRepo):
         node_key = int(node_id)
         parent_id = parent_comment_id
         depth = 0
+        parent_path: str | None = None
         if parent_id is not None:
             parent_state = self._comments.get(int(parent_id))
             if parent_state is None:
@@ -80,6 +95,7 @@ class MemoryNodeCommentsRepo(NodeCommentsRepo):
             depth = int(parent_state["depth"]) + 1
             if depth > _MAX_DEPTH:
                 raise ValueError("comment_depth_exceeded")
+            parent_path = str(parent_state["path"])
         comment_id = next(self._id_seq)
         created = _now_iso()
         state = {
@@ -93,9 +109,13 @@ class MemoryNodeCommentsRepo(NodeCommentsRepo):
             "metadata": dict(metadata or {}),
             "created_at": created,
             "updated_at": created,
+            "path": comment_path(parent_path, comment_id),
+            "reply_count": 0,
+            "descendant_count": 0,
         }
         self._comments[comment_id] = state
         self._by_node[node_key][parent_id].append(comment_id)
+        self._apply_reply_counts(state, visible_delta=1, own_delta=1)
         return _dto_from_state(state)
 
     async def get(self, comment_id: int) -> NodeCommentDTO | None:
@@ -130,6 +150,74 @@ class MemoryNodeCommentsRepo(NodeCommentsRepo):
         dtos.sort(key=lambda dto: dto.created_at)
         return dtos[offset : offset + limit]
 
+    async def list_thread(
+        self,
+        node_id: int,
+        *,
+        parent_comment_id: int | None = None,
+        cursor: str | None = None,
+        limit: int = 50,
+        max_depth: int = 5,
+        include_deleted: bool = False,
+    ) -> NodeCommentThreadPage:
+        scope = ThreadScope(
+            node_id=int(node_id),
+            parent_comment_id=(
+                int(parent_comment_id) if parent_comment_id is not None else None
+            ),
+            max_depth=max(0, min(int(max_depth), _MAX_DEPTH)),
+            include_deleted=bool(include_deleted),
+        )
+        after = ThreadCursor.decode(cursor, scope).path if cursor else ""
+        size = max(1, min(int(limit), MAX_THREAD_WINDOW))
+        lower, depth_limit = "", scope.max_depth
+        upper: str | None = None
+        if scope.parent_comment_id is not None:
+            parent = self._comments.get(scope.parent_comment_id)
+            if parent is None or int(parent["node_id"]) != scope.node_id:
+                # Same as the SQL window: an unknown parent yields no rows.
+                lower = upper = ""
+            else:
+                lower, upper = subtree_bounds(str(parent["path"]))
+                depth_limit = int(parent["depth"]) + 1 + scope.max_depth
+        states = [
+            state
+            for state in self._comments.values()
+            if int(state["node_id"]) == scope.node_id
+            and state["path"] > max(after, lower)
+            and (upper is None or state["path"] < upper)
+            and int(state["depth"]) <= depth_limit
+            and (scope.include_deleted or is_visible_status(state["status"]))
+        ]
+        window = sorted(states, key=lambda state: state["path"])[:size]
+        comments_count, threads_count = self._counters.get(scope.node_id, (0, 0))
+        return NodeCommentThreadPage(
+            items=[_dto_from_state(state) for state in window],
+            next_cursor=(
+                ThreadCursor(path=window[-1]["path"]).encode(scope)
+                if len(window) == size
+                else None
+            ),
+            comments_count=comments_count,
+            threads_count=threads_count,
+        )
+
+    def _apply_reply_counts(
+        self, state: dict[str, Any], *, visible_delta: int, own_delta: int
+    ) -> None:
+        ancestors = path_ids(str(state["path"]))[:-1]
+        for ancestor_id in ancestors:
+            ancestor = self._comments.get(ancestor_id)
+            if ancestor is None:
+                continue
+            ancestor["descendant_count"] += visible_delta
+            if ancestor_id == ancestors[-1]:
+                ancestor["reply_count"] += own_delta
+        counters = self._counters[int(state["node_id"])]
+        counters[0] = max(counters[0] + visible_delta, 0)
+        if not ancestors:
+            counters[1] = max(counters[1] + own_delta, 0)
+
     async def update_status(
         self,
         comment_id: int,
@@ -151,8 +239,12 @@ class MemoryNodeCommentsRepo(NodeCommentsRepo):
                 "at": _now_iso(),
             }
         )
+        delta = int(is_visible_status(normalized)) - int(
+            is_visible_status(state["status"])
+        )
         state["status"] = normalized
         state["updated_at"] = _now_iso()
+        self._apply_reply_counts(state, visible_delta=delta, own_delta=delta)
         return _dto_from_state(state)
 
     async def soft_delete(
@@ -174,8 +266,10 @@ class MemoryNodeCommentsRepo(NodeCommentsRepo):
                 "at": _now_iso(),
             }
         )
+        delta = -int(is_visible_status(state["status"]))
         state["status"] = "deleted"
         state["updated_at"] = _now_iso()
+        self._apply_reply_counts(state, visible_delta=delta, own_delta=delta)
         return True
 
     async def hard_delete(self, comment_id: int) -> bool:
@@ -183,6 +277,12 @@ class MemoryNodeCommentsRepo(NodeCommentsRepo):
         state = self._comments.pop(comment_id, None)
         if state is None:
             return False
+        own = int(is_visible_status(state["status"]))
+        self._apply_reply_counts(
+            state,
+            visible_delta=-(own + int(state["descendant_count"])),
+            own_delta=-own,
+        )
         node_key = int(state["node_id"])
         parent_id = state["parent_comment_id"]
         self._remove_child_reference(node_key, parent_id, comment_id)
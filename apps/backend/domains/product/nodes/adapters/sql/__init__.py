@@ -1,3 +1,4 @@
+from .admin_stats import SQLNodeAdminStats, create_admin_stats
 from .comments import SQLNodeCommentsRepo
 from .comments import create_repo as create_comments_repo
 from .reactions import SQLNodeReactionsRepo
@@ -11,6 +12,7 @@ from .views import create_repo as create_views_repo
 
 __all__ = [
     "SQLNodesRepo",
+    "SQLNodeAdminStats",
     "SQLNodeCommentsRepo",
     "SQLNodeReactionsRepo",
     "SQLNodeViewsRepo",
@@ -20,4 +22,5 @@ __all__ = [
     "create_reactions_repo",
     "create_views_repo",
     "create_usage_projection",
+    "create_admin_stats",
 ]
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from packages.core.db import get_async_engine
+from packages.core.sql_fallback import evaluate_sql_backend
+
+logger = logging.getLogger(__name__)
+
+# Recomputes the row from node_comments/node_comment_bans instead of applying
+# deltas, so replayed or reordered events converge on the same counts.
+_REFRESH_SQL = text(
+    """
+    INSERT INTO node_admin_stats (
+        node_id, total_comments, pending_count, published_count, hidden_count,
+        deleted_count, blocked_count, bans_count,
+        last_comment_created_at, last_comment_updated_at, refreshed_at
+    )
+    SELECT n.id,
+           COALESCE(c.total_comments, 0),
+           COALESCE(c.pending_count, 0),
+           COALESCE(c.published_count, 0),
+           COALESCE(c.hidden_count, 0),
+           COALESCE(c.deleted_count, 0),
+           COALESCE(c.blocked_count, 0),
+           COALESCE(b.bans_count, 0),
+           c.last_comment_created_at,
+           c.last_comment_updated_at,
+           CURRENT_TIMESTAMP
+      FROM nodes AS n
+      LEFT JOIN (
+          SELECT node_id,
+                 COUNT(*) AS total_comments,
+                 SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END) AS pending_count,
+                 SUM(CASE WHEN status = 'published' THEN 1 ELSE 0 END) AS published_count,
+                 SUM(CASE WHEN status = 'hidden' THEN 1 ELSE 0 END) AS hidden_count,
+                 SUM(CASE WHEN status = 'deleted' THEN 1 ELSE 0 END) AS deleted_count,
+                 SUM(CASE WHEN status = 'blocked' THEN 1 ELSE 0 END) AS blocked_count,
+                 MAX(created_at) AS last_comment_created_at,
+                 MAX(updated_at) AS last_comment_updated_at
+            FROM node_comments
+           WHERE node_id IN :ids
+           GROUP BY node_id
+      ) AS c ON c.node_id = n.id
+      LEFT JOIN (
+          SELECT node_id, COUNT(*) AS bans_count
+            FROM node_comment_bans
+           WHERE node_id IN :ids
+           GROUP BY node_id
+      ) AS b ON b.node_id = n.id
+     WHERE n.id IN :ids
+    ON CONFLICT (node_id) DO UPDATE SET
+        total_comments = excluded.total_comments,
+        pending_count = excluded.pending_count,
+        published_count = excluded.published_count,
+        hidden_count = excluded.hidden_count,
+        deleted_count = excluded.deleted_count,
+        blocked_count = excluded.blocked_count,
+        bans_count = excluded.bans_count,
+        last_comment_created_at = excluded.last_comment_created_at,
+        last_comment_updated_at = excluded.last_comment_updated_at,
+        refreshed_at = excluded.refreshed_at
+    """
+).bindparams(bindparam("ids", expanding=True))
+
+
+class SQLNodeAdminStats:
+    """Per-node comment and ban counts read by the admin node listing."""
+
+    def __init__(self, engine: AsyncEngine | str) -> None:
+        self._engine: AsyncEngine = (
+            engine
+            if isinstance(engine, AsyncEngine)
+            else get_async_engine("node-admin-stats", url=engine)
+        )
+
+    async def refresh(self, node_ids: Iterable[int]) -> None:
+        ids = sorted({int(node_id) for node_id in node_ids})
+        if not ids:
+            return
+        async with self._engine.begin() as conn:
+            await conn.execute(_REFRESH_SQL, {"ids": ids})
+
+
+def create_admin_stats(settings) -> SQLNodeAdminStats | None:
+    decision = evaluate_sql_backend(settings)
+    if not decision.dsn:
+        logger.debug(
+            "node admin stats: disabled without SQL backend (%s)", decision.reason
+        )
+        return None
+    try:
+        return SQLNodeAdminStats(decision.dsn)
+    except Exception as exc:  # pragma: no cover - defensive fallback
+        logger.warning("node admin stats: engine initialization failed: %s", exc)
+        return None
+
+
+__all__ = ["SQLNodeAdminStats", "create_admin_stats"]
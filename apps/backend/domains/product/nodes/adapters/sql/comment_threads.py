@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from domains.product.nodes.application.comment_threads import (
+    HIDDEN_COMMENT_STATUSES,
+    ThreadCursor,
+    ThreadScope,
+    path_ids,
+)
+
+_HIDDEN = ", ".join(f"'{status}'" for status in sorted(HIDDEN_COMMENT_STATUSES))
+
+_WINDOW_COLUMNS = """
+    c.id,
+    c.node_id,
+    CAST(c.author_id AS TEXT) AS author_id,
+    c.parent_comment_id,
+    c.depth,
+    c.content,
+    c.status,
+    c.metadata,
+    c.created_at,
+    c.updated_at,
+    c.path,
+    c.reply_count,
+    c.descendant_count
+"""
+
+_ANCESTORS_SQL = text(
+    """
+    UPDATE node_comments
+       SET descendant_count = descendant_count + :delta,
+           reply_count = reply_count + CASE WHEN id = :parent_id THEN :own ELSE 0 END
+     WHERE id IN :ids
+    """
+).bindparams(bindparam("ids", expanding=True))
+
+_NODE_COUNTERS_SQL = text(
+    """
+    INSERT INTO node_comment_counters (node_id, comments_count, threads_count, updated_at)
+    VALUES (
+        :node_id,
+        CASE WHEN :delta < 0 THEN 0 ELSE :delta END,
+        CASE WHEN :threads < 0 THEN 0 ELSE :threads END,
+        CURRENT_TIMESTAMP
+    )
+    ON CONFLICT (node_id) DO UPDATE SET
+        comments_count = node_comment_counters.comments_count + :delta,
+        threads_count = node_comment_counters.threads_count + :threads,
+        updated_at = excluded.updated_at
+    """
+)
+
+
+def build_thread_window_query(
+    scope: ThreadScope, *, cursor: ThreadCursor | None, limit: int
+) -> tuple[str, dict[str, Any]]:
+    """One index range scan over ``(node_id, path)`` for a window of a thread.
+
+    Rows come back in depth-first order; a subtree window joins the parent
+    row so its path bounds are resolved in the same statement.
+    """
+
+    params: dict[str, Any] = {
+        "node_id": int(scope.node_id),
+        "after": cursor.path if cursor else "",
+        "limit": int(limit),
+    }
+    sources = ["node_comments AS c"]
+    where = ["c.node_id = :node_id", "c.path > :after"]
+    if scope.parent_comment_id is None:
+        params["max_depth"] = int(scope.max_depth)
+        where.append("c.depth <= :max_depth")
+    else:
+        sources.append(
+            "(SELECT path, depth FROM node_comments"
+            " WHERE id = :parent_id AND node_id = :node_id) AS p"
+        )
+        params["parent_id"] = int(scope.parent_comment_id)
+        params["max_depth"] = int(scope.max_depth) + 1
+        where.extend(
+            [
+                "c.path > p.path || '.'",
+                "c.path < p.path || '/'",
+                "c.depth <= p.depth + :max_depth",
+            ]
+        )
+    if not scope.include_deleted:
+        where.append(f"c.status NOT IN ({_HIDDEN})")
+    sql = (
+        f"SELECT {_WINDOW_COLUMNS} FROM {', '.join(sources)}"
+        f" WHERE {' AND '.join(where)} ORDER BY c.path LIMIT :limit"
+    )
+    return sql, params
+
+
+def _format_timestamp(value: Any) -> str:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if not isinstance(value, datetime):
+        return str(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+async def fetch_thread_window(
+    conn: AsyncConnection,
+    scope: ThreadScope,
+    *,
+    cursor: ThreadCursor | None,
+    limit: int,
+) -> list[dict[str, Any]]:
+    sql, params = build_thread_window_query(scope, cursor=cursor, limit=limit)
+    rows = (await conn.execute(text(sql), params)).mappings().all()
+    window: list[dict[str, Any]] = []
+    for row in rows:
+        item = dict(row)
+        item["created_at"] = _format_timestamp(item["created_at"])
+        item["updated_at"] = _format_timestamp(item["updated_at"])
+        if isinstance(item.get("metadata"), str):
+            item["metadata"] = json.loads(item["metadata"] or "{}")
+        window.append(item)
+    return window
+
+
+async def fetch_comment_counters(conn: AsyncConnection, node_id: int) -> tuple[int, int]:
+    row = (
+        await conn.execute(
+            text(
+                "SELECT comments_count, threads_count FROM node_comment_counters"
+                " WHERE node_id = :node_id"
+            ),
+            {"node_id": int(node_id)},
+        )
+    ).first()
+    if row is None:
+        return 0, 0
+    return int(row[0] or 0), int(row[1] or 0)
+
+
+async def apply_reply_counts(
+    conn: AsyncConnection,
+    *,
+    node_id: int,
+    path: str,
+    visible_delta: int,
+    own_delta: int,
+) -> None:
+    """Shift reply counters after comments at ``path`` appeared or vanished.
+
+    ``visible_delta`` is the change in visible comments of the subtree rooted
+    at ``path`` (the comment itself included); ``own_delta`` is the change of
+    the comment's own visibility. Ancestors are read off the path, so the
+    update costs one statement per level set, not a tree walk.
+    """
+
+    if not visible_delta and not own_delta:
+        return
+    ancestors = path_ids(path)[:-1]
+    if ancestors:
+        await conn.execute(
+            _ANCESTORS_SQL,
+            {
+                "delta": int(visible_delta),
+                "own": int(own_delta),
+                "parent_id": ancestors[-1],
+                "ids": ancestors,
+            },
+        )
+    await conn.execute(
+        _NODE_COUNTERS_SQL,
+        {
+            "node_id": int(node_id),
+            "delta": int(visible_delta),
+            "threads": int(own_delta) if not ancestors else 0,
+        },
+    )
+
+
+__all__ = [
+    "apply_reply_counts",
+    "build_thread_window_query",
+    "fetch_comment_counters",
+    "fetch_thread_window",
+]
@@ -8,15 +8,28 @@ from typing import Any
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine
 
+from domains.product.nodes.application.comment_threads import (
+    MAX_THREAD_WINDOW,
+    PATH_SEGMENT_WIDTH,
+    ThreadCursor,
+    ThreadScope,
+    is_visible_status,
+)
 from domains.product.nodes.application.ports import (
     NodeCommentBanDTO,
     NodeCommentDTO,
     NodeCommentsRepo,
+    NodeCommentThreadPage,
 )
 from packages.core.db import get_async_engine
 from packages.core.sql_fallback import evaluate_sql_backend
 
 from ..memory.comments import MemoryNodeCommentsRepo
+from .comment_threads import (
+    apply_reply_counts,
+    fetch_comment_counters,
+    fetch_thread_window,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -58,10 +71,11 @@ class SQLNodeCommentsRepo(NodeCommentsRepo):
     ) -> NodeCommentDTO:
         async with self._engine.begin() as conn:
             depth = 0
+            path_prefix = ""
             if parent_comment_id is not None:
                 parent_sql = text(
                     """
-                    SELECT node_id, depth
+                    SELECT node_id, depth, path
                       FROM node_comments
                      WHERE id = :parent_id
                     """
@@ -82,10 +96,20 @@ class SQLNodeCommentsRepo(NodeCommentsRepo):
                 depth = int(parent_row["depth"]) + 1
                 if depth > _MAX_DEPTH:
                     raise ValueError("comment_depth_exceeded")
+                path_prefix = f"{parent_row['path']}."
+            # The id is drawn first so the row's materialized path can end with it.
             insert_sql = text(
                 """
-                INSERT INTO node_comments(node_id, author_id, parent_comment_id, depth, content, metadata)
-                VALUES (:node_id, cast(:author_id as uuid), :parent_id, :depth, :content, CAST(:metadata AS jsonb))
+                WITH new_comment AS (
+                    SELECT nextval(pg_get_serial_sequence('node_comments', 'id')) AS id
+                )
+                INSERT INTO node_comments(
+                    id, node_id, author_id, parent_comment_id, depth, content, metadata, path
+                )
+                SELECT new_comment.id, :node_id, cast(:author_id as uuid), :parent_id, :depth,
+                       :content, CAST(:metadata AS jsonb),
+                       CAST(:path_prefix AS text) || lpad(new_comment.id::text, :width, '0')
+                  FROM new_comment
                 RETURNING id,
                           node_id,
                           author_id::text AS author_id,
@@ -94,6 +118,9 @@ class SQLNodeCommentsRepo(NodeCommentsRepo):
                           content,
                           status,
                           metadata,
+                          path,
+                          reply_count,
+                          descendant_count,
                           to_char(created_at, :fmt) AS created_at,
                           to_char(updated_at, :fmt) AS updated_at
                 """
@@ -109,6 +136,8 @@ class SQLNodeCommentsRepo(NodeCommentsRepo):
                             "depth": depth,
                             "content": content,
                             "metadata": _serialize_metadata(metadata),
+                            "path_prefix": path_prefix,
+                            "width": PATH_SEGMENT_WIDTH,
                             "fmt": _DATETIME_FMT,
                         },
                     )
@@ -118,6 +147,14 @@ class SQLNodeCommentsRepo(NodeCommentsRepo):
             )
             if row is None:  # pragma: no cover - defensive
                 raise RuntimeError("comment_create_failed")
+            if is_visible_status(row["status"]):
+                await apply_reply_counts(
+                    conn,
+                    node_id=int(node_id),
+                    path=str(row["path"]),
+                    visible_delta=1,
+                    own_delta=1,
+                )
             return self._row_to_comment(row)
 
     async def get(self, comment_id: int) -> NodeCommentDTO | None:
@@ -135,6 +172,8 @@ class SQLNodeCommentsRepo(NodeCommentsRepo):
                                content,
                                status,
                                metadata,
+                               reply_count,
+                               descendant_count,
                                to_char(created_at, :fmt) AS created_at,
                                to_char(updated_at, :fmt) AS updated_at
                           FROM node_comments
@@ -182,6 +221,8 @@ class SQLNodeCommentsRepo(NodeCommentsRepo):
                    content,
                    status,
                    metadata,
+                   reply_count,
+                   descendant_count,
                    to_char(created_at, :fmt) AS created_at,
                    to_char(updated_at, :fmt) AS updated_at
               FROM node_comments
@@ -194,6 +235,41 @@ class SQLNodeCommentsRepo(NodeCommentsRepo):
             rows = (await conn.execute(query, params)).mappings()
             return [self._row_to_comment(row) for row in rows]
 
+    async def list_thread(
+        self,
+        node_id: int,
+        *,
+        parent_comment_id: int | None = None,
+        cursor: str | None = None,
+        limit: int = 50,
+        max_depth: int = 5,
+        include_deleted: bool = False,
+    ) -> NodeCommentThreadPage:
+        scope = ThreadScope(
+            node_id=int(node_id),
+            parent_comment_id=(
+                int(parent_comment_id) if parent_comment_id is not None else None
+            ),
+            max_depth=max(0, min(int(max_depth), _MAX_DEPTH)),
+            include_deleted=bool(include_deleted),
+        )
+        position = ThreadCursor.decode(cursor, scope) if cursor else None
+        size = max(1, min(int(limit), MAX_THREAD_WINDOW))
+        async with self._engine.connect() as conn:
+            rows = await fetch_thread_window(conn, scope, cursor=position, limit=size)
+            comments_count, threads_count = await fetch_comment_counters(conn, node_id)
+        next_cursor = (
+            ThreadCursor(path=str(rows[-1]["path"])).encode(scope)
+            if len(rows) == size
+            else None
+        )
+        return NodeCommentThreadPage(
+            items=[self._row_to_comment(row) for row in rows],
+            next_cursor=next_cursor,
+            comments_count=comments_count,
+            threads_count=threads_count,
+        )
+
     async def update_status(
         self,
         comment_id: int,
@@ -205,14 +281,21 @@ class SQLNodeCommentsRepo(NodeCommentsRepo):
         normalized = _normalize_status(status)
         async with self._engine.begin() as conn:
             current = (
-                await conn.execute(
-                    text("SELECT metadata FROM node_comments WHERE id = :id"),
-                    {"id": int(comment_id)},
+                (
+                    await conn.execute(
+                        text(
+                            "SELECT node_id, path, status, metadata FROM node_comments"
+                            " WHERE id = :id FOR UPDATE"
+                        ),
+                        {"id": int(comment_id)},
+                    )
                 )
-            ).scalar_one_or_none()
+                .mappings()
+                .first()
+            )
             if current is None:
                 raise ValueError("comment_not_found")
-            meta = dict(current or {})
+            meta = dict(current["metadata"] or {})
             meta.setdefault("history", []).append(
                 {
                     "status": normalized,
@@ -236,6 +319,8 @@ class SQLNodeCommentsRepo(NodeCommentsRepo):
                           content,
                           status,
                           metadata,
+                          reply_count,
+                          descendant_count,
                           to_char(created_at, :fmt) AS created_at,
                           to_char(updated_at, :fmt) AS updated_at
                 """
@@ -257,6 +342,17 @@ class SQLNodeCommentsRepo(NodeCommentsRepo):
             )
             if row is None:
                 raise ValueError("comment_not_found")
+            delta = int(is_visible_status(normalized)) - int(
+                is_visible_status(current["status"])
+            )
+            if delta:
+                await apply_reply_counts(
+                    conn,
+                    node_id=int(current["node_id"]),
+                    path=str(current["path"]),
+                    visible_delta=delta,
+                    own_delta=delta,
+                )
             return self._row_to_comment(row)
 
     async def soft_delete(
@@ -279,12 +375,35 @@ class SQLNodeCommentsRepo(NodeCommentsRepo):
 
     async def hard_delete(self, comment_id: int) -> bool:
         async with self._engine.begin() as conn:
-            result = await conn.execute(
-                text("DELETE FROM node_comments WHERE id = :id"),
-                {"id": int(comment_id)},
+            # Replies go with the comment (ON DELETE CASCADE); their visible
+            # count is already held in descendant_count.
+            removed = (
+                (
+                    await conn.execute(
+                        text(
+                            """
+                            DELETE FROM node_comments
+                             WHERE id = :id
+                            RETURNING node_id, path, status, descendant_count
+                            """
+                        ),
+                        {"id": int(comment_id)},
+                    )
+                )
+                .mappings()
+                .first()
             )
-            deleted = result.rowcount or 0
-            return bool(deleted)
+            if removed is None:
+                return False
+            own = int(is_visible_status(removed["status"]))
+            await apply_reply_counts(
+                conn,
+                node_id=int(removed["node_id"]),
+                path=str(removed["path"]),
+                visible_delta=-(own + int(removed["descendant_count"] or 0)),
+                own_delta=-own,
+            )
+            return True
 
     async def lock_node(
         self,
@@ -449,6 +568,8 @@ class SQLNodeCommentsRepo(NodeCommentsRepo):
             metadata=dict(metadata),
             created_at=str(row["created_at"]),
             updated_at=str(row["updated_at"]),
+            reply_count=int(row.get("reply_count") or 0),
+            descendant_count=int(row.get("descendant_count") or 0),
         )
 
     @staticmethod
@@ -3,7 +3,8 @@ from __future__ import annotations
 from functools import wraps
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
 from apps.backend.app.api_gateway.routers import get_container
 from domains.platform.iam.application.facade import (
@@ -16,6 +17,7 @@ from domains.product.nodes.application.admin_queries import (
     bulk_update_status,
     bulk_update_tags,
     delete_node,
+    export_nodes_admin_csv,
     get_node_engagement,
     list_nodes_admin,
     restore_node,
@@ -39,6 +41,7 @@ def register_nodes_routes(router: APIRouter) -> None:
     @router.get("/list", summary="List nodes for admin")
     @_wrap_admin_errors
     async def list_nodes(
+        response: Response,
         q: str | None = Query(default=None),
         slug: str | None = Query(default=None, description="Filter by exact slug"),
         tag: str | None = Query(default=None, description="Filter by tag slug"),
@@ -47,6 +50,9 @@ def register_nodes_routes(router: APIRouter) -> None:
         ),
         limit: int = Query(ge=1, le=1000, default=50),
         offset: int = Query(ge=0, default=0),
+        cursor: str | None = Query(
+            default=None, description="X-Next-Cursor of the previous page"
+        ),
         status: str | None = Query(default="all"),
         moderation_status: str | None = Query(default=None),
         updated_from: str | None = Query(default=None),
@@ -56,7 +62,7 @@ def register_nodes_routes(router: APIRouter) -> None:
         _: None = Depends(require_admin),
         container=Depends(get_container),
     ) -> list[dict[str, Any]]:
-        return await list_nodes_admin(
+        items = await list_nodes_admin(
             container,
             q=q,
             slug=slug,
@@ -70,6 +76,51 @@ def register_nodes_routes(router: APIRouter) -> None:
             updated_to=updated_to,
             sort=sort,
             order=order,
+            cursor=cursor,
+        )
+        if len(items) == limit and items[-1].get("cursor"):
+            response.headers["X-Next-Cursor"] = str(items[-1]["cursor"])
+        return items
+
+    @router.get("/export", summary="Export filtered nodes as CSV")
+    @_wrap_admin_errors
+    async def export_nodes(
+        q: str | None = Query(default=None),
+        slug: str | None = Query(default=None),
+        tag: str | None = Query(default=None),
+        author_id: str | None = Query(default=None),
+        status: str | None = Query(default="all"),
+        moderation_status: str | None = Query(default=None),
+        updated_from: str | None = Query(default=None),
+        updated_to: str | None = Query(default=None),
+        sort: str | None = Query(default="updated_at"),
+        order: str | None = Query(default="desc"),
+        cursor: str | None = Query(
+            default=None, description="Resume after the row with this cursor"
+        ),
+        limit: int | None = Query(default=None, ge=1),
+        _: None = Depends(require_admin),
+        container=Depends(get_container),
+    ) -> StreamingResponse:
+        chunks = await export_nodes_admin_csv(
+            container,
+            q=q,
+            slug=slug,
+            tag=tag,
+            author_id=author_id,
+            status=status,
+            moderation_status=moderation_status,
+            updated_from=updated_from,
+            updated_to=updated_to,
+            sort=sort,
+            order=order,
+            cursor=cursor,
+            limit=limit,
+        )
+        return StreamingResponse(
+            chunks,
+            media_type="text/csv",
+            headers={"Content-Disposition": 'attachment; filename="nodes.csv"'},
         )
 
     @router.get("/{node_id}/engagement", summary="Get node engagement summary")
@@ -34,6 +34,28 @@ def register_comment_routes(router: APIRouter) -> None:
             claims=claims,
         )
 
+    @router.get("/{node_id}/comments/thread")
+    async def list_comment_thread(
+        node_id: str,
+        _req: Request,
+        service=service_dep,
+        claims=Depends(get_current_user),
+        parent_id: int | None = Query(default=None, alias="parentId"),
+        cursor: str | None = Query(default=None),
+        limit: int = Query(default=50, ge=1, le=200),
+        max_depth: int = Query(default=5, ge=0, le=5, alias="maxDepth"),
+        include_deleted: bool = Query(default=False, alias="includeDeleted"),
+    ):
+        return await service.list_comment_thread(
+            node_id,
+            parent_comment_id=parent_id,
+            cursor=cursor,
+            limit=limit,
+            max_depth=max_depth,
+            include_deleted=include_deleted,
+            claims=claims,
+        )
+
     @router.post(
         "/{node_id}/comments",
         dependencies=NODES_PUBLIC_RATE_LIMIT,
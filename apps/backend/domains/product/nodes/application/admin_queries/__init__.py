@@ -44,6 +44,7 @@ from .use_cases import (
     delete_comment,
     delete_comment_ban,
     delete_node,
+    export_nodes_admin_csv,
     fetch_node_analytics,
     get_moderation_detail,
     get_node_engagement,
@@ -93,6 +94,7 @@ __all__ = [
     "delete_comment",
     "delete_comment_ban",
     "delete_node",
+    "export_nodes_admin_csv",
     "fetch_node_analytics",
     "get_moderation_detail",
     "get_node_engagement",
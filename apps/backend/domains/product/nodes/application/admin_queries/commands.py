@@ -10,6 +10,7 @@ from domains.platform.audit.application.facade import AuditLogPayload
 from domains.product.nodes.infrastructure import (
     AdminEvent,
     emit_admin_activity,
+    emit_admin_events,
     make_event_context,
     make_event_payload,
 )
@@ -54,9 +55,14 @@ async def _emit_admin_activity(
     )
 
 
+def _emit_admin_events(container, events: Iterable[AdminEvent]) -> None:
+    emit_admin_events(container, list(events), log=logger)
+
+
 __all__ = [
     "SYSTEM_ACTOR_ID",
     "_emit_admin_activity",
+    "_emit_admin_events",
     "_extract_actor_id",
     "logger",
     "AuditLogPayload",
@@ -0,0 +1,383 @@
+"""Keyset-paged admin node listing and its streamed CSV export.
+
+Pages are ordered by ``(sort key, id)`` and continued with an opaque cursor
+holding the last row's position, so page 10 000 costs the same index range
+scan as page 1. Comment and ban counts come from ``node_admin_stats``, which
+the ``node.comment.*``/``node.comments.user_*`` event handlers keep current,
+instead of being aggregated per node on every request.
+"""
+
+from __future__ import annotations
+
+import base64
+import csv
+import hashlib
+import json
+from collections.abc import AsyncIterator
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime, timedelta
+from functools import cached_property
+from io import StringIO
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from packages.core.db_schema import schema_capabilities
+
+DEV_BLOG_TAG = "dev-blog"
+
+SORT_KEYS: dict[str, str] = {
+    "updated_at": "n.updated_at",
+    "created_at": "n.created_at",
+    "views": "n.views_count",
+    "comments": "COALESCE(s.total_comments, 0)",
+}
+_TIMESTAMP_SORTS = frozenset({"updated_at", "created_at"})
+
+STATS_COLUMNS: tuple[str, ...] = (
+    "total_comments",
+    "pending_count",
+    "published_count",
+    "hidden_count",
+    "deleted_count",
+    "blocked_count",
+    "bans_count",
+)
+
+EXPORT_COLUMNS: tuple[str, ...] = (
+    "id",
+    "slug",
+    "title",
+    "status",
+    "is_public",
+    "moderation_status",
+    "author_id",
+    "created_at",
+    "updated_at",
+    "views_count",
+    *STATS_COLUMNS,
+    "last_comment_created_at",
+    "cursor",
+)
+
+# Before migration 0138 the counts are aggregated on the fly.
+_STATS_FALLBACK = """(
+    SELECT c.node_id,
+           COUNT(*) AS total_comments,
+           SUM(CASE WHEN c.status = 'pending' THEN 1 ELSE 0 END) AS pending_count,
+           SUM(CASE WHEN c.status = 'published' THEN 1 ELSE 0 END) AS published_count,
+           SUM(CASE WHEN c.status = 'hidden' THEN 1 ELSE 0 END) AS hidden_count,
+           SUM(CASE WHEN c.status = 'deleted' THEN 1 ELSE 0 END) AS deleted_count,
+           SUM(CASE WHEN c.status = 'blocked' THEN 1 ELSE 0 END) AS blocked_count,
+           (SELECT COUNT(*) FROM node_comment_bans b WHERE b.node_id = c.node_id)
+               AS bans_count,
+           MAX(c.created_at) AS last_comment_created_at,
+           MAX(c.updated_at) AS last_comment_updated_at
+      FROM node_comments AS c
+     GROUP BY c.node_id
+)"""
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+class InvalidListCursor(ValueError):
+    """Raised when a cursor is malformed or was issued for other filters."""
+
+
+def _clean(value: str | None) -> str | None:
+    cleaned = (value or "").strip()
+    return cleaned or None
+
+
+@dataclass(frozen=True)
+class NodeListFilters:
+    q: str | None = None
+    slug: str | None = None
+    tag: str | None = None
+    author_id: str | None = None
+    status: str = "all"
+    moderation_status: str | None = None
+    updated_from: str | None = None
+    updated_to: str | None = None
+    sort: str = "updated_at"
+    order: str = "desc"
+
+    @classmethod
+    def create(
+        cls,
+        *,
+        q: str | None = None,
+        slug: str | None = None,
+        tag: str | None = None,
+        author_id: str | None = None,
+        status: str | None = None,
+        moderation_status: str | None = None,
+        updated_from: str | None = None,
+        updated_to: str | None = None,
+        sort: str | None = None,
+        order: str | None = None,
+    ) -> NodeListFilters:
+        sort_key = (sort or "updated_at").strip().lower()
+        tag_slug = _clean(tag)
+        mod_status = _clean(moderation_status)
+        return cls(
+            q=_clean(q),
+            slug=_clean(slug),
+            tag=tag_slug.lower() if tag_slug else None,
+            author_id=_clean(author_id),
+            status=(status or "all").strip().lower() or "all",
+            moderation_status=mod_status.lower() if mod_status else None,
+            updated_from=_clean(updated_from),
+            updated_to=_clean(updated_to),
+            sort=sort_key if sort_key in SORT_KEYS else "updated_at",
+            order="desc" if (order or "desc").strip().lower() == "desc" else "asc",
+        )
+
+    @cached_property
+    def digest(self) -> str:
+        payload = json.dumps(asdict(self), sort_keys=True, separators=(",", ":"))
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:8]
+
+
+@dataclass(frozen=True)
+class NodeListCursor:
+    """Position of the last listed row: its sort value and id.
+
+    Encoded as ``<sort value>.<id>.<filters digest>`` in URL-safe base64
+    (timestamps as epoch microseconds), so a cursor only continues the
+    listing it was issued for.
+    """
+
+    value: datetime | int
+    id: int
+
+    def encode(self, filters: NodeListFilters) -> str:
+        if isinstance(self.value, datetime):
+            value = (self.value.astimezone(UTC) - _EPOCH) // _MICROSECOND
+        else:
+            value = int(self.value)
+        raw = f"{value}.{self.id}.{filters.digest}".encode("ascii")
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+    @classmethod
+    def decode(cls, token: str, filters: NodeListFilters) -> NodeListCursor:
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("ascii")
+            value, row_id, digest = raw.split(".")
+            position: datetime | int = int(value)
+            if filters.sort in _TIMESTAMP_SORTS:
+                position = _EPOCH + int(value) * _MICROSECOND
+            cursor = cls(value=position, id=int(row_id))
+        except (ValueError, UnicodeError) as exc:
+            raise InvalidListCursor("malformed node list cursor") from exc
+        if digest != filters.digest:
+            raise InvalidListCursor("node list cursor does not match filters")
+        return cursor
+
+    @classmethod
+    def from_row(cls, row: dict[str, Any], filters: NodeListFilters) -> NodeListCursor:
+        value = row.get("sort_value")
+        if filters.sort in _TIMESTAMP_SORTS:
+            if isinstance(value, str):
+                value = datetime.fromisoformat(value)
+            if not isinstance(value, datetime):
+                value = _EPOCH
+            elif value.tzinfo is None:
+                value = value.replace(tzinfo=UTC)
+            return cls(value=value, id=int(row["id"]))
+        return cls(value=int(value or 0), id=int(row["id"]))
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def build_page_query(
+    filters: NodeListFilters,
+    *,
+    cursor: NodeListCursor | None,
+    limit: int,
+    offset: int = 0,
+    include_stats: bool = False,
+    stats_table: bool = True,
+) -> tuple[str, dict[str, Any]]:
+    """SQL and parameters for one listing page."""
+
+    where: list[str] = []
+    params: dict[str, Any] = {"limit": int(limit)}
+    dev_blog_clause = (
+        "NOT EXISTS (SELECT 1 FROM product_node_tags AS dt"
+        " WHERE dt.node_id = n.id AND dt.slug = :dev_tag)"
+    )
+    if filters.tag:
+        where.append(
+            "EXISTS (SELECT 1 FROM product_node_tags AS t"
+            " WHERE t.node_id = n.id AND t.slug = :tag_slug)"
+        )
+        params["tag_slug"] = filters.tag
+    if filters.tag != DEV_BLOG_TAG:
+        where.append(dev_blog_clause)
+        params["dev_tag"] = DEV_BLOG_TAG
+    if filters.q:
+        # Served by the pg_trgm GIN indexes on title and slug (3+ characters).
+        search = ["n.title ILIKE :q", "n.slug ILIKE :q"]
+        if filters.q.isdigit():
+            search.append("n.id = :qid")
+            params["qid"] = int(filters.q)
+        where.append("(" + " OR ".join(search) + ")")
+        params["q"] = f"%{_escape_like(filters.q)}%"
+    if filters.slug:
+        where.append("n.slug = :slug")
+        params["slug"] = filters.slug
+    if filters.author_id:
+        where.append("n.author_id = cast(:author_id as uuid)")
+        params["author_id"] = filters.author_id
+    if filters.updated_from:
+        where.append("n.updated_at >= cast(:updated_from as timestamptz)")
+        params["updated_from"] = filters.updated_from
+    if filters.updated_to:
+        where.append("n.updated_at <= cast(:updated_to as timestamptz)")
+        params["updated_to"] = filters.updated_to
+    if filters.status not in {"all", "any"}:
+        where.append("n.status = :status_filter")
+        params["status_filter"] = filters.status
+    if filters.moderation_status:
+        where.append("n.moderation_status = :moderation_status")
+        params["moderation_status"] = filters.moderation_status
+
+    sort_expr = SORT_KEYS[filters.sort]
+    direction = "DESC" if filters.order == "desc" else "ASC"
+    if cursor is not None:
+        comparison = "<" if direction == "DESC" else ">"
+        where.append(f"({sort_expr}, n.id) {comparison} (:cursor_value, :cursor_id)")
+        params["cursor_value"] = cursor.value
+        params["cursor_id"] = cursor.id
+
+    join_stats = include_stats or filters.sort == "comments"
+    columns = [
+        "n.id",
+        "n.slug",
+        "n.title",
+        "CAST(n.author_id AS TEXT) AS author_id",
+        "n.status",
+        "n.is_public",
+        "n.updated_at",
+        "n.created_at",
+        "n.views_count",
+        "n.embedding_ready",
+        "n.embedding_status",
+        "n.moderation_status",
+        "n.moderation_status_updated_at",
+        f"{sort_expr} AS sort_value",
+    ]
+    joins = ""
+    if join_stats:
+        columns.extend(f"COALESCE(s.{column}, 0) AS {column}" for column in STATS_COLUMNS)
+        columns.extend(["s.last_comment_created_at", "s.last_comment_updated_at"])
+        source = "node_admin_stats" if stats_table else _STATS_FALLBACK
+        joins = f"LEFT JOIN {source} AS s ON s.node_id = n.id"
+    sql = (
+        f"SELECT {', '.join(columns)} FROM nodes AS n {joins}"
+        f" WHERE {' AND '.join(where) or '1=1'}"
+        f" ORDER BY {sort_expr} {direction}, n.id {direction}"
+        " LIMIT :limit"
+    )
+    if offset and cursor is None:
+        sql += " OFFSET :offset"
+        params["offset"] = int(offset)
+    return sql, params
+
+
+async def fetch_node_page(
+    conn: AsyncConnection,
+    filters: NodeListFilters,
+    *,
+    cursor: NodeListCursor | None,
+    limit: int,
+    offset: int = 0,
+    include_stats: bool = False,
+) -> list[dict[str, Any]]:
+    """One page of raw rows, each carrying the ``cursor`` that resumes after it."""
+
+    stats_table = True
+    if include_stats or filters.sort == "comments":
+        caps = await schema_capabilities().get(conn)
+        stats_table = caps.has_table("node_admin_stats")
+    sql, params = build_page_query(
+        filters,
+        cursor=cursor,
+        limit=limit,
+        offset=offset,
+        include_stats=include_stats,
+        stats_table=stats_table,
+    )
+    rows = [dict(row) for row in (await conn.execute(text(sql), params)).mappings()]
+    for row in rows:
+        row["cursor"] = NodeListCursor.from_row(row, filters).encode(filters)
+    return rows
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+async def stream_nodes_csv(
+    engine: AsyncEngine,
+    filters: NodeListFilters,
+    *,
+    cursor: NodeListCursor | None = None,
+    batch_size: int = 500,
+    max_rows: int | None = None,
+) -> AsyncIterator[bytes]:
+    """Yield the filtered listing as CSV, one keyset page per chunk.
+
+    Each page runs on its own short connection, so nothing is held open while
+    a slow client drains the response. The ``cursor`` column lets an
+    interrupted download resume after the last row it received.
+    """
+
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+
+    def drain() -> bytes:
+        data = buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+        return data
+
+    writer.writerow(EXPORT_COLUMNS)
+    yield drain()
+    remaining = max_rows
+    while remaining is None or remaining > 0:
+        limit = batch_size if remaining is None else min(batch_size, remaining)
+        async with engine.connect() as conn:
+            rows = await fetch_node_page(
+                conn, filters, cursor=cursor, limit=limit, include_stats=True
+            )
+        if not rows:
+            break
+        writer.writerows([_csv_value(row.get(column)) for column in EXPORT_COLUMNS] for row in rows)
+        yield drain()
+        if remaining is not None:
+            remaining -= len(rows)
+        if len(rows) < limit:
+            break
+        cursor = NodeListCursor.from_row(rows[-1], filters)
+
+
+__all__ = [
+    "DEV_BLOG_TAG",
+    "EXPORT_COLUMNS",
+    "InvalidListCursor",
+    "NodeListCursor",
+    "NodeListFilters",
+    "SORT_KEYS",
+    "build_page_query",
+    "fetch_node_page",
+    "stream_nodes_csv",
+]
@@ -11,6 +11,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 from packages.core.db import get_async_engine
+from packages.core.db_replicas import read_only
 from packages.core.sql_fallback import evaluate_sql_backend
 
 from .exceptions import AdminQueryError
@@ -24,7 +25,7 @@ from .presenter import (
 logger = logging.getLogger("domains.product.nodes.application.admin_queries")
 
 
-async def _ensure_engine(container) -> AsyncEngine | None:
+async def _ensure_engine(container, *, replica: bool = False) -> AsyncEngine | None:
     decision = evaluate_sql_backend(getattr(container, "settings", None))
     dsn = decision.dsn
     if not dsn:
@@ -34,6 +35,10 @@ async def _ensure_engine(container) -> AsyncEngine | None:
     if "?" in dsn:
         dsn = dsn.split("?", 1)[0]
     try:
+        if replica:
+            # Listing/analytics reads tolerate replica lag (see db_replicas).
+            with read_only():
+                return get_async_engine("nodes-admin", url=dsn, future=True)
         return get_async_engine("nodes-admin", url=dsn, future=True)
     except SQLAlchemyError as exc:
         logger.error("nodes_admin_engine_init_failed", exc_info=exc)
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Iterable
+import uuid
+from collections.abc import AsyncIterator, Iterable
 from datetime import UTC, datetime
 from typing import Any, TypedDict, cast
 
@@ -13,12 +14,18 @@ from sqlalchemy.exc import SQLAlchemyError
 from domains.product.nodes.adapters.memory.utils import (
     resolve_memory_node as _resolve_memory_node,
 )
+from domains.product.nodes.application.interactors.events import (
+    BATCH_EVENT_MAX_IDS,
+    NODE_TAGS_UPDATED_BATCH_TOPIC,
+    NODE_UPDATED_BATCH_TOPIC,
+)
 
 from .commands import (
     SYSTEM_ACTOR_ID,
     AdminEvent,
     AuditLogPayload,
     _emit_admin_activity,
+    _emit_admin_events,
     make_event_context,
     make_event_payload,
 )
@@ -26,7 +33,15 @@ from .commands import (
     logger as _base_logger,
 )
 from .exceptions import AdminQueryError
+from .listing import (
+    InvalidListCursor,
+    NodeListCursor,
+    NodeListFilters,
+    fetch_node_page,
+    stream_nodes_csv,
+)
 from .presenter import (
+    _ALLOWED_MODERATION_STATUSES,
     _DECISION_STATUS_MAP,
     _analytics_to_csv,
     _ban_to_dict,
@@ -81,7 +96,7 @@ async def fetch_node_analytics(
     (UTC ISO) or ``None`` when SQL backend cannot be used.
     """
 
-    engine = await _ensure_engine(container)
+    engine = await _ensure_engine(container, replica=True)
     if engine is None:
         return None
     try:
@@ -859,8 +874,9 @@ async def list_nodes_admin(
     updated_to: str | None,
     sort: str | None,
     order: str | None,
+    cursor: str | None = None,
 ) -> list[dict[str, Any]]:
-    engine = await _ensure_engine(container)
+    engine = await _ensure_engine(container, replica=True)
     embedding_enabled = bool(getattr(container.settings, "embedding_enabled", True))
     if engine is None:
         service = getattr(container, "nodes_service", None)
@@ -891,109 +907,51 @@ async def list_nodes_admin(
             )
         return results[offset : offset + limit]
 
-    where = ["1=1"]
-    params: dict[str, Any] = {"limit": limit, "offset": offset}
-    mod_filter = (
-        (moderation_status or "").strip().lower() if moderation_status else None
+    filters = NodeListFilters.create(
+        q=q,
+        slug=slug,
+        tag=tag,
+        author_id=author_id,
+        status=status,
+        moderation_status=moderation_status,
+        updated_from=updated_from,
+        updated_to=updated_to,
+        sort=sort,
+        order=order,
     )
-    tag_filter = (tag or "").strip().lower() if tag else None
+    if (
+        filters.moderation_status
+        and filters.moderation_status not in _ALLOWED_MODERATION_STATUSES
+    ):
+        return []
+    position: NodeListCursor | None = None
+    if cursor:
+        try:
+            position = NodeListCursor.decode(cursor, filters)
+        except InvalidListCursor as exc:
+            raise AdminQueryError(400, "cursor_invalid", cause=exc) from exc
+    tag_filter = filters.tag
     dev_blog_clause = "NOT EXISTS (SELECT 1 FROM product_node_tags AS dt WHERE dt.node_id = n.id AND dt.slug = :dev_tag)"
-    if tag_filter:
-        where.append(
-            "EXISTS (SELECT 1 FROM product_node_tags AS t WHERE t.node_id = n.id AND t.slug = :tag_slug)"
-        )
-        params["tag_slug"] = tag_filter
-        if tag_filter != DEV_BLOG_TAG:
-            where.append(dev_blog_clause)
-            params["dev_tag"] = DEV_BLOG_TAG
-    else:
-        where.append(dev_blog_clause)
-        params["dev_tag"] = DEV_BLOG_TAG
-    if q:
-        where.append(
-            "(n.title ILIKE :q OR n.slug ILIKE :q OR cast(n.id as text) = :qid)"
-        )
-        params["q"] = f"%{q}%"
-        params["qid"] = str(q)
-    if slug:
-        where.append("n.slug = :slug")
-        params["slug"] = str(slug)
-    if author_id:
-        where.append("n.author_id = cast(:author_id as uuid)")
-        params["author_id"] = str(author_id)
-    if updated_from:
-        where.append("n.updated_at >= cast(:updated_from as timestamptz)")
-        params["updated_from"] = updated_from
-    if updated_to:
-        where.append("n.updated_at <= cast(:updated_to as timestamptz)")
-        params["updated_to"] = updated_to
-    status_filter = (status or "all").lower()
-    if status_filter not in {"all", "any"}:
-        where.append("COALESCE(n.status, '') = :status_filter")
-        params["status_filter"] = status_filter
-    sort_field = (sort or "updated_at").strip().lower()
-    order_clause = "DESC" if (order or "desc").lower() == "desc" else "ASC"
-    valid_sort = {
-        "updated_at": "n.updated_at",
-        "created_at": "n.created_at",
-        "views": "n.views_count",
-        "comments": "stats.total_comments",
-    }
-    sort_column = valid_sort.get(sort_field, "n.updated_at")
-
-    sql = f"""
-        SELECT
-            n.id,
-            n.slug,
-            n.title,
-            n.author_id::text AS author_id,
-            n.status,
-            n.is_public,
-            n.updated_at,
-            n.created_at,
-            n.views_count,
-            n.embedding_ready,
-            n.embedding_status,
-            stats.total_comments,
-            stats.pending_count,
-            stats.published_count,
-            stats.hidden_count,
-            stats.deleted_count,
-            stats.blocked_count,
-            stats.bans_count,
-            stats.last_comment_created_at,
-            stats.last_comment_updated_at,
-            n.moderation_status,
-            n.moderation_status_updated_at
-        FROM nodes AS n
-        LEFT JOIN LATERAL (
-            SELECT
-                COUNT(*)::bigint AS total_comments,
-                COALESCE(SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END), 0)::bigint AS pending_count,
-                COALESCE(SUM(CASE WHEN status = 'published' THEN 1 ELSE 0 END), 0)::bigint AS published_count,
-                COALESCE(SUM(CASE WHEN status = 'hidden' THEN 1 ELSE 0 END), 0)::bigint AS hidden_count,
-                COALESCE(SUM(CASE WHEN status = 'deleted' THEN 1 ELSE 0 END), 0)::bigint AS deleted_count,
-                COALESCE(SUM(CASE WHEN status = 'blocked' THEN 1 ELSE 0 END), 0)::bigint AS blocked_count,
-                (SELECT COUNT(*)::bigint FROM node_comment_bans b WHERE b.node_id = n.id) AS bans_count,
-                MAX(created_at) AS last_comment_created_at,
-                MAX(updated_at) AS last_comment_updated_at
-            FROM node_comments
-            WHERE node_id = n.id
-        ) AS stats ON TRUE
-        WHERE {' AND '.join(where)}
-        ORDER BY {sort_column} {order_clause} NULLS LAST, n.id {order_clause}
-        LIMIT :limit OFFSET :offset
-    """
 
     items: list[dict[str, Any]] = []
     try:
         async with engine.begin() as conn:
-            rows = (await conn.execute(text(sql), params)).mappings().all()
-            items.extend(dict(row) for row in rows)
-            if not items and slug and sort_column != "n.updated_at":
-                params2 = dict(params)
-                params2["limit"] = limit
-                params2["offset"] = offset
+            items.extend(
+                await fetch_node_page(
+                    conn, filters, cursor=position, limit=limit, offset=offset
+                )
+            )
+            if not items and slug and filters.sort != "updated_at" and position is None:
+                params2: dict[str, Any] = {
+                    "slug": filters.slug,
+                    "dev_tag": DEV_BLOG_TAG,
+                    "limit": limit,
+                    "offset": offset,
+                }
+                if tag_filter:
+                    params2["tag_slug"] = tag_filter
+                if q:
+                    params2["q"] = f"%{q}%"
                 where2 = ["n.slug = :slug"]
                 if tag_filter:
                     where2.append(
@@ -1083,23 +1041,58 @@ async def list_nodes_admin(
                 "embedding_status": status_val,
                 "moderation_status": mod_status,
                 "moderation_status_updated_at": mod_updated,
+                "cursor": it.get("cursor"),
             }
         )
-    if mod_filter:
-        normalized = [
-            item
-            for item in normalized
-            if _normalize_moderation_status(item.get("moderation_status")) == mod_filter
-        ]
     return normalized
 
 
+async def export_nodes_admin_csv(
+    container,
+    *,
+    q: str | None,
+    slug: str | None,
+    tag: str | None,
+    author_id: str | None,
+    status: str | None,
+    moderation_status: str | None,
+    updated_from: str | None,
+    updated_to: str | None,
+    sort: str | None,
+    order: str | None,
+    cursor: str | None = None,
+    limit: int | None = None,
+) -> AsyncIterator[bytes]:
+    engine = await _ensure_engine(container, replica=True)
+    if engine is None:
+        raise AdminQueryError(500, "service_unavailable")
+    filters = NodeListFilters.create(
+        q=q,
+        slug=slug,
+        tag=tag,
+        author_id=author_id,
+        status=status,
+        moderation_status=moderation_status,
+        updated_from=updated_from,
+        updated_to=updated_to,
+        sort=sort,
+        order=order,
+    )
+    position: NodeListCursor | None = None
+    if cursor:
+        try:
+            position = NodeListCursor.decode(cursor, filters)
+        except InvalidListCursor as exc:
+            raise AdminQueryError(400, "cursor_invalid", cause=exc) from exc
+    return stream_nodes_csv(engine, filters, cursor=position, max_rows=limit)
+
+
 async def get_node_engagement(
     container,
     *,
     node_identifier: str,
 ) -> dict[str, Any]:
-    engine = await _ensure_engine(container)
+    engine = await _ensure_engine(container, replica=True)
     if engine is not None:
         try:
             resolved_id = await _resolve_node_id(node_identifier, container, engine)
@@ -1154,6 +1147,38 @@ async def delete_node(
     return {"ok": True}
 
 
+def _chunks(values: list[Any], size: int) -> Iterable[list[Any]]:
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+def _publish_bulk_events(
+    container,
+    *,
+    batch_topic: str,
+    batch_payloads: list[dict[str, Any]],
+    item_events: list[AdminEvent],
+) -> None:
+    """Publish batch envelopes plus, unless disabled, the per-node events.
+
+    Everything goes out in one outbox call; per-node payloads carry the
+    ``batch_id`` of their envelope so consumers of both can skip duplicates.
+    """
+
+    events = [
+        AdminEvent(
+            event=batch_topic,
+            payload=payload,
+            key=f"nodes:batch:{payload['batch_id']}",
+            context=make_event_context(source=str(payload.get("source") or "bulk")),
+        )
+        for payload in batch_payloads
+    ]
+    if bool(getattr(container.settings, "nodes_bulk_item_events", True)):
+        events.extend(item_events)
+    _emit_admin_events(container, events)
+
+
 async def bulk_update_status(
     container,
     *,
@@ -1183,18 +1208,21 @@ async def bulk_update_status(
                        unpublish_at = COALESCE(cast(:unpublish_at as timestamptz), unpublish_at),
                        updated_at = now()
                  WHERE n.id = ANY(:ids)
+             RETURNING n.id, n.slug
                 """
             )
-            await conn.execute(
-                sql,
-                {
-                    "status": status,
-                    "pub": bool(is_pub),
-                    "publish_at": publish_at,
-                    "unpublish_at": unpublish_at,
-                    "ids": ids,
-                },
-            )
+            updated_rows = (
+                await conn.execute(
+                    sql,
+                    {
+                        "status": status,
+                        "pub": bool(is_pub),
+                        "publish_at": publish_at,
+                        "unpublish_at": unpublish_at,
+                        "ids": ids,
+                    },
+                )
+            ).all()
     except SQLAlchemyError as exc:
         logger.error(
             "nodes_admin_bulk_status_failed",
@@ -1202,24 +1230,39 @@ async def bulk_update_status(
             exc_info=exc,
         )
         raise AdminQueryError(500, "bulk_status_failed") from exc
-    for nid in ids:
-        await _emit_admin_activity(
-            container,
-            event=AdminEvent(
+    fields = ["status", "publish_at", "unpublish_at"]
+    batch_payloads: list[dict[str, Any]] = []
+    item_events: list[AdminEvent] = []
+    for chunk in _chunks(sorted(updated_rows, key=lambda row: int(row[0])), BATCH_EVENT_MAX_IDS):
+        batch_id = uuid.uuid4().hex
+        batch_payloads.append(
+            {
+                "batch_id": batch_id,
+                "ids": [int(row[0]) for row in chunk],
+                "slugs": [str(row[1]) for row in chunk if row[1]],
+                "fields": fields,
+                "status": status,
+                "is_public": bool(is_pub),
+                "source": "bulk_status",
+            }
+        )
+        item_events.extend(
+            AdminEvent(
                 event="node.updated.v1",
                 payload=make_event_payload(
-                    base={
-                        "id": int(nid),
-                        "fields": ["status", "publish_at", "unpublish_at"],
-                    },
-                ),
-                key=f"node:{int(nid)}",
-                context=make_event_context(
-                    node_id=int(nid),
-                    source="bulk_status",
+                    base={"id": int(row[0]), "fields": fields, "batch_id": batch_id},
                 ),
-            ),
+                key=f"node:{int(row[0])}",
+                context=make_event_context(node_id=int(row[0]), source="bulk_status"),
+            )
+            for row in chunk
         )
+    _publish_bulk_events(
+        container,
+        batch_topic=NODE_UPDATED_BATCH_TOPIC,
+        batch_payloads=batch_payloads,
+        item_events=item_events,
+    )
     await _emit_admin_activity(
         container,
         audit=AuditLogPayload(
@@ -1259,26 +1302,39 @@ async def bulk_update_tags(
     engine = await _ensure_engine(container)
     if engine is None:
         raise AdminQueryError(500, "no_engine")
-    updated = 0
     try:
         async with engine.begin() as conn:
             if action_norm == "add":
-                for nid in ids:
-                    for slug in slugs:
-                        await conn.execute(
-                            text(
-                                "INSERT INTO product_node_tags(node_id, slug) VALUES (:id, :slug) ON CONFLICT DO NOTHING"
-                            ),
-                            {"id": nid, "slug": slug},
-                        )
-                        updated += 1
+                changed_sql = text(
+                    """
+                    INSERT INTO product_node_tags (node_id, slug)
+                    SELECT n.id, s.slug
+                      FROM nodes AS n
+                     CROSS JOIN unnest(cast(:slugs as text[])) AS s(slug)
+                     WHERE n.id = ANY(:ids)
+                    ON CONFLICT DO NOTHING
+                    RETURNING node_id, slug
+                    """
+                )
             else:
+                changed_sql = text(
+                    """
+                    DELETE FROM product_node_tags
+                     WHERE node_id = ANY(:ids) AND slug = ANY(:slugs)
+                    RETURNING node_id, slug
+                    """
+                )
+            changed = (
+                await conn.execute(changed_sql, {"ids": ids, "slugs": slugs})
+            ).all()
+            nodes = (
                 await conn.execute(
                     text(
-                        "DELETE FROM product_node_tags WHERE node_id = ANY(:ids) AND slug = ANY(:slugs)"
+                        "SELECT id, slug, author_id::text AS author_id FROM nodes WHERE id = ANY(:ids)"
                     ),
-                    {"ids": ids, "slugs": slugs},
+                    {"ids": ids},
                 )
+            ).all()
     except SQLAlchemyError as exc:
         logger.error(
             "nodes_admin_bulk_tags_failed",
@@ -1286,21 +1342,62 @@ async def bulk_update_tags(
             exc_info=exc,
         )
         raise AdminQueryError(500, "bulk_tags_failed") from exc
-    for nid in ids:
-        await _emit_admin_activity(
-            container,
-            event=AdminEvent(
+    node_rows = {int(row[0]): row for row in nodes}
+    changed_by_node: dict[int, list[str]] = {}
+    for node_id, slug in changed:
+        changed_by_node.setdefault(int(node_id), []).append(str(slug))
+    usage_key = "added" if action_norm == "add" else "removed"
+    batch_payloads: list[dict[str, Any]] = []
+    item_events: list[AdminEvent] = []
+    for chunk in _chunks(sorted(node_rows), BATCH_EVENT_MAX_IDS):
+        batch_id = uuid.uuid4().hex
+        # Tag usage deltas per author, only for rows that actually changed.
+        usage: dict[str, list[str]] = {}
+        for node_id in chunk:
+            author_id = node_rows[node_id][2]
+            if author_id and changed_by_node.get(node_id):
+                usage.setdefault(str(author_id), []).extend(changed_by_node[node_id])
+        batch_payloads.append(
+            {
+                "batch_id": batch_id,
+                "ids": chunk,
+                "slugs": [str(node_rows[nid][1]) for nid in chunk if node_rows[nid][1]],
+                "tags": slugs,
+                "action": action_norm,
+                "content_type": "node",
+                "usage": [
+                    {"author_id": author_id, "added": [], "removed": [], usage_key: deltas}
+                    for author_id, deltas in usage.items()
+                ],
+                "source": "bulk_tags",
+            }
+        )
+        item_events.extend(
+            AdminEvent(
                 event="node.tags.updated.v1",
                 payload=make_event_payload(
-                    base={"id": nid, "tags": slugs, "action": action_norm},
+                    base={
+                        "id": nid,
+                        "tags": slugs,
+                        "action": action_norm,
+                        "batch_id": batch_id,
+                    },
                 ),
                 key=f"node:{nid}:tags",
                 context=make_event_context(
                     node_id=nid,
                     extra={"source": "bulk_tags", "action": action_norm},
                 ),
-            ),
+            )
+            for nid in chunk
         )
+    _publish_bulk_events(
+        container,
+        batch_topic=NODE_TAGS_UPDATED_BATCH_TOPIC,
+        batch_payloads=batch_payloads,
+        item_events=item_events,
+    )
+    updated = len(changed)
     await _emit_admin_activity(
         container,
         audit=AuditLogPayload(
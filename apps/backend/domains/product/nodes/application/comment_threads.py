@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+
+# Statuses excluded from public listings and from reply counts.
+HIDDEN_COMMENT_STATUSES = frozenset({"deleted", "hidden", "blocked"})
+# Comment ids are zero-padded to this width in materialized paths, so string
+# order of paths is depth-first thread order for any bigint id.
+PATH_SEGMENT_WIDTH = 19
+MAX_THREAD_WINDOW = 200
+
+
+class InvalidThreadCursor(ValueError):
+    """Raised when a thread cursor is malformed or issued for another scope."""
+
+    def __init__(self) -> None:
+        super().__init__("cursor_invalid")
+
+
+def is_visible_status(status: str | None) -> bool:
+    return (status or "").strip().lower() not in HIDDEN_COMMENT_STATUSES
+
+
+def comment_path(parent_path: str | None, comment_id: int) -> str:
+    segment = str(int(comment_id)).zfill(PATH_SEGMENT_WIDTH)
+    return f"{parent_path}.{segment}" if parent_path else segment
+
+
+def path_ids(path: str) -> list[int]:
+    return [int(segment) for segment in path.split(".") if segment]
+
+
+def subtree_bounds(path: str) -> tuple[str, str]:
+    """Exclusive ``(lower, upper)`` bounds of the descendants of ``path``."""
+
+    return f"{path}.", f"{path}/"
+
+
+@dataclass(frozen=True)
+class ThreadScope:
+    """What a thread window lists: a node's threads or one comment's subtree.
+
+    ``max_depth`` counts reply levels below the first listed level (roots,
+    or the direct replies of ``parent_comment_id``).
+    """
+
+    node_id: int
+    parent_comment_id: int | None = None
+    max_depth: int = 5
+    include_deleted: bool = False
+
+    @property
+    def digest(self) -> str:
+        payload = json.dumps(asdict(self), sort_keys=True, separators=(",", ":"))
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:8]
+
+
+@dataclass(frozen=True)
+class ThreadCursor:
+    """Path of the last comment of a window.
+
+    Encoded as ``<id>-<id>-...:<scope digest>`` in URL-safe base64, so a
+    cursor only continues the scope it was issued for.
+    """
+
+    path: str
+
+    def encode(self, scope: ThreadScope) -> str:
+        ids = "-".join(str(comment_id) for comment_id in path_ids(self.path))
+        raw = f"{ids}:{scope.digest}".encode("ascii")
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+    @classmethod
+    def decode(cls, token: str, scope: ThreadScope) -> ThreadCursor:
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("ascii")
+            ids, digest = raw.split(":")
+            path: str | None = None
+            for comment_id in ids.split("-"):
+                path = comment_path(path, int(comment_id))
+        except (ValueError, UnicodeError) as exc:
+            raise InvalidThreadCursor() from exc
+        if not path or digest != scope.digest:
+            raise InvalidThreadCursor()
+        return cls(path=path)
+
+
+__all__ = [
+    "HIDDEN_COMMENT_STATUSES",
+    "InvalidThreadCursor",
+    "MAX_THREAD_WINDOW",
+    "PATH_SEGMENT_WIDTH",
+    "ThreadCursor",
+    "ThreadScope",
+    "comment_path",
+    "is_visible_status",
+    "path_ids",
+    "subtree_bounds",
+]
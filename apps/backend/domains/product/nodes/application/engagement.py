@@ -8,6 +8,7 @@ from domains.product.nodes.application.ports import (
     NodeCommentBanDTO,
     NodeCommentDTO,
     NodeCommentsRepo,
+    NodeCommentThreadPage,
     NodeReactionsRepo,
     NodeReactionsSummary,
     NodeViewsLimiter,
@@ -147,6 +148,25 @@ class NodeCommentsService:
             include_deleted=include_deleted,
         )
 
+    async def list_thread(
+        self,
+        node_id: int,
+        *,
+        parent_comment_id: int | None = None,
+        cursor: str | None = None,
+        limit: int = 50,
+        max_depth: int = 5,
+        include_deleted: bool = False,
+    ) -> NodeCommentThreadPage:
+        return await self.repo.list_thread(
+            node_id,
+            parent_comment_id=parent_comment_id,
+            cursor=cursor,
+            limit=limit,
+            max_depth=max_depth,
+            include_deleted=include_deleted,
+        )
+
     async def delete_comment(
         self,
         comment_id: int,
@@ -2,15 +2,22 @@ from __future__ import annotations
 
 import logging
 import time
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from typing import Any
 
-from domains.product.nodes.application.ports import Outbox
+from domains.product.nodes.application.ports import BatchOutbox, Outbox
 from packages.core import with_trace
 
 logger = logging.getLogger(__name__)
 
+# Batch envelopes published by bulk admin actions: one event for many node
+# ids instead of one ``node.updated.v1``/``node.tags.updated.v1`` per node.
+NODE_UPDATED_BATCH_TOPIC = "node.updated.batch.v1"
+NODE_TAGS_UPDATED_BATCH_TOPIC = "node.tags.updated.batch.v1"
+# Node ids per batch envelope; larger bulk actions publish several.
+BATCH_EVENT_MAX_IDS = 1000
+
 
 @dataclass(frozen=True)
 class NodeEvent:
@@ -50,5 +57,42 @@ class NodeEventPublisher:
             },
         )
 
+    @with_trace
+    def publish_many(self, events: Sequence[NodeEvent]) -> None:
+        """Publish ``events`` in one outbox call when the outbox supports batches."""
+
+        if not events:
+            return
+        if not isinstance(self._outbox, BatchOutbox):
+            for event in events:
+                self.publish(event)
+            return
+        started = time.perf_counter()
+        try:
+            self._outbox.publish_many(
+                [(event.name, dict(event.payload), event.key) for event in events]
+            )
+        except Exception as exc:  # pragma: no cover - best effort logging
+            logger.exception(
+                "node_event_outbox_failed",
+                extra={"event": events[0].name, "count": len(events)},
+                exc_info=exc,
+            )
+            return
+        logger.debug(
+            "node_event_outbox_published",
+            extra={
+                "event": events[0].name,
+                "count": len(events),
+                "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+            },
+        )
+
 
-__all__ = ["NodeEvent", "NodeEventPublisher"]
+__all__ = [
+    "BATCH_EVENT_MAX_IDS",
+    "NODE_TAGS_UPDATED_BATCH_TOPIC",
+    "NODE_UPDATED_BATCH_TOPIC",
+    "NodeEvent",
+    "NodeEventPublisher",
+]
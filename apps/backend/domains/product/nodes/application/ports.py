@@ -62,6 +62,16 @@ class NodeCommentDTO:
     metadata: dict[str, Any]
     created_at: str
     updated_at: str
+    reply_count: int = 0
+    descendant_count: int = 0
+
+
+@dataclass(frozen=True)
+class NodeCommentThreadPage:
+    items: list[NodeCommentDTO]
+    next_cursor: str | None
+    comments_count: int
+    threads_count: int
 
 
 @dataclass(frozen=True)
@@ -190,6 +200,17 @@ class NodeCommentsRepo(Protocol):
         include_deleted: bool = False,
     ) -> list[NodeCommentDTO]: ...
 
+    async def list_thread(
+        self,
+        node_id: int,
+        *,
+        parent_comment_id: int | None = None,
+        cursor: str | None = None,
+        limit: int = 50,
+        max_depth: int = 5,
+        include_deleted: bool = False,
+    ) -> NodeCommentThreadPage: ...
+
     async def update_status(
         self,
         comment_id: int,
@@ -253,6 +274,11 @@ class Outbox(Protocol):
     def publish(self, topic: str, payload: dict, key: str | None = None) -> None: ...
 
 
+@runtime_checkable
+class BatchOutbox(Protocol):
+    def publish_many(self, events: Sequence[tuple[str, dict, str | None]]) -> None: ...
+
+
 @runtime_checkable
 class NodeCache(Protocol):
     async def get(self, node_id: int) -> NodeDTO | None: ...
@@ -264,6 +290,13 @@ class NodeCache(Protocol):
     async def invalidate(self, node_id: int, slug: str | None = None) -> None: ...
 
 
+@runtime_checkable
+class BatchNodeCache(Protocol):
+    async def invalidate_many(
+        self, node_ids: Sequence[int], slugs: Sequence[str] = ()
+    ) -> None: ...
+
+
 @runtime_checkable
 class UsageProjection(Protocol):
     def apply_diff(
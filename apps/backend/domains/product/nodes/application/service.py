@@ -27,6 +27,7 @@ from domains.product.nodes.application.ports import (
     NodeCache,
     NodeCommentBanDTO,
     NodeCommentDTO,
+    NodeCommentThreadPage,
     NodeDTO,
     NodeReactionsSummary,
     NodeViewStat,
@@ -183,6 +184,9 @@ class NodeService:
             )
         )
 
+    def _safe_publish_many(self, events: Sequence[NodeEvent]) -> None:
+        self._events.publish_many(events)
+
     def _record_embedding_metric(
         self,
         *,
@@ -648,6 +652,26 @@ class NodeService:
             include_deleted=include_deleted,
         )
 
+    async def list_comment_thread(
+        self,
+        node_id: int,
+        *,
+        parent_comment_id: int | None = None,
+        cursor: str | None = None,
+        limit: int = 50,
+        max_depth: int = 5,
+        include_deleted: bool = False,
+    ) -> NodeCommentThreadPage:
+        service = self._require_comments_service()
+        return await service.list_thread(
+            node_id,
+            parent_comment_id=parent_comment_id,
+            cursor=cursor,
+            limit=limit,
+            max_depth=max_depth,
+            include_deleted=include_deleted,
+        )
+
     @with_trace
     async def delete_comment(
         self,
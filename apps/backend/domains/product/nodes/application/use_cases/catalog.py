@@ -10,6 +10,7 @@ from fastapi import HTTPException
 from domains.product.nodes.infrastructure.dev_blog_repository import DevBlogRepository
 from domains.product.nodes.infrastructure.engine import ensure_engine
 from domains.product.nodes.utils import has_role, normalize_actor_id
+from packages.core.db_replicas import read_only
 
 PREVIEW_ALLOWED_STATUSES: tuple[str, ...] = (
     "draft",
@@ -226,7 +227,8 @@ class NodeCatalogService:
 
 def build_dev_blog_service(container: Any) -> DevBlogService:
     async def engine_factory():
-        return await ensure_engine(container)
+        with read_only():
+            return await ensure_engine(container)
 
     repository = DevBlogRepository()
     return DevBlogService(engine_factory=engine_factory, repository=repository)
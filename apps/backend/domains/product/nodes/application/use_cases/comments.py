@@ -50,6 +50,43 @@ class CommentsService:
             "count": len(comments),
         }
 
+    async def list_comment_thread(
+        self,
+        node_ref: str,
+        *,
+        parent_comment_id: int | None,
+        cursor: str | None,
+        limit: int,
+        max_depth: int,
+        include_deleted: bool,
+        claims: Mapping[str, Any] | None,
+    ) -> dict[str, Any]:
+        view, node_id = await resolve_node_ref(self.nodes_service, node_ref)
+        actor_id = normalize_actor_id(claims)
+        allow_deleted = include_deleted and (
+            has_role(claims, "moderator") or view.author_id == actor_id
+        )
+        if include_deleted and not allow_deleted:
+            raise HTTPException(status_code=403, detail="insufficient_role")
+        try:
+            page = await self.nodes_service.list_comment_thread(
+                node_id,
+                parent_comment_id=parent_comment_id,
+                cursor=cursor,
+                limit=limit,
+                max_depth=max_depth,
+                include_deleted=allow_deleted,
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        return {
+            "items": [comment_to_dict(item) for item in page.items],
+            "count": len(page.items),
+            "next_cursor": page.next_cursor,
+            "comments_count": page.comments_count,
+            "threads_count": page.threads_count,
+        }
+
     async def create_comment(
         self,
         node_ref: str,
@@ -7,6 +7,7 @@ from typing import Protocol
 from domains.product.nodes.application.ports import (
     NodeCommentBanDTO,
     NodeCommentDTO,
+    NodeCommentThreadPage,
     NodeReactionsSummary,
     NodeViewStat,
 )
@@ -81,6 +82,17 @@ class NodesServicePort(Protocol):
         include_deleted: bool = False,
     ) -> list[NodeCommentDTO]: ...
 
+    async def list_comment_thread(
+        self,
+        node_id: int,
+        *,
+        parent_comment_id: int | None = None,
+        cursor: str | None = None,
+        limit: int = 50,
+        max_depth: int = 5,
+        include_deleted: bool = False,
+    ) -> NodeCommentThreadPage: ...
+
     async def create_comment(
         self,
         *,
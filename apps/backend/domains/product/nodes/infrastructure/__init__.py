@@ -1,6 +1,7 @@
 from .admin_activity import (
     AdminEvent,
     emit_admin_activity,
+    emit_admin_events,
     make_event_context,
     make_event_payload,
 )
@@ -24,6 +25,7 @@ __all__ = [
     "SavedViewsUnavailable",
     "AdminEvent",
     "emit_admin_activity",
+    "emit_admin_events",
     "make_event_context",
     "make_event_payload",
 ]
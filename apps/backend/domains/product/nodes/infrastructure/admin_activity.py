@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from typing import Any
 
 from domains.platform.audit.application.facade import AuditLogPayload, safe_audit_log
+from domains.product.nodes.application.interactors.events import NodeEvent
 
 logger = logging.getLogger("domains.product.nodes.admin_activity")
 
@@ -115,9 +116,55 @@ async def emit_admin_activity(
         )
 
 
+def emit_admin_events(
+    container,
+    events: Sequence[AdminEvent],
+    *,
+    log: logging.Logger | None = None,
+) -> None:
+    """Publish several admin events with a single outbox call.
+
+    Uses ``NodeService._safe_publish_many`` (one pipelined outbox write) and
+    falls back to ``Events.publish_many`` when the nodes service is absent.
+    """
+
+    activity_logger = log or logger
+    ready = [event for event in events if event.event and event.payload is not None]
+    if not ready:
+        return
+    nodes_service = getattr(container, "nodes_service", None)
+    safe_publish_many = (
+        getattr(nodes_service, "_safe_publish_many", None) if nodes_service else None
+    )
+    if callable(safe_publish_many):
+        safe_publish_many(
+            [
+                NodeEvent(
+                    name=str(event.event),
+                    payload=dict(event.payload or {}),
+                    key=event.key,
+                    context={"source": "nodes_admin_api", **(event.context or {})},
+                )
+                for event in ready
+            ]
+        )
+        return
+    try:
+        container.events.publish_many(
+            [(str(event.event), dict(event.payload or {}), event.key) for event in ready]
+        )
+    except Exception as exc:  # noqa: BLE001
+        activity_logger.warning(
+            "nodes_admin_event_publish_failed",
+            extra={"event": ready[0].event, "count": len(ready)},
+            exc_info=exc,
+        )
+
+
 __all__ = [
     "AdminEvent",
     "emit_admin_activity",
+    "emit_admin_events",
     "make_event_context",
     "make_event_payload",
 ]
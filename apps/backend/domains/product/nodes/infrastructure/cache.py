@@ -4,6 +4,7 @@ import asyncio
 import json
 import logging
 import time
+from collections.abc import Sequence
 from dataclasses import asdict, dataclass
 from typing import Any
 
@@ -112,6 +113,27 @@ class RedisNodeCache(NodeCache):
                 exc_info=exc,
             )
 
+    async def invalidate_many(
+        self, node_ids: Sequence[int], slugs: Sequence[str] = ()
+    ) -> None:
+        """Drop id and slug entries for a batch of nodes with a single DEL.
+
+        Slugs are expected from the batch event; unlike ``invalidate`` no
+        lookup is made for nodes whose slug is not supplied.
+        """
+        keys = [self._key_id(node_id) for node_id in node_ids]
+        keys.extend(self._key_slug(slug) for slug in slugs if slug)
+        if not keys:
+            return
+        try:
+            await self._client.delete(*keys)
+        except RedisError as exc:  # pragma: no cover
+            logger.debug(
+                "node_cache_redis_delete_many_failed",
+                extra={"count": len(keys)},
+                exc_info=exc,
+            )
+
 
 class InMemoryNodeCache(NodeCache):
     def __init__(self, config: NodeCacheConfig | None = None) -> None:
@@ -166,6 +188,16 @@ class InMemoryNodeCache(NodeCache):
             if slug_key:
                 self._slug_index.pop(slug_key, None)
 
+    async def invalidate_many(
+        self, node_ids: Sequence[int], slugs: Sequence[str] = ()
+    ) -> None:
+        async with self._lock:
+            for node_id in node_ids:
+                self._delete_locked(node_id)
+            for slug in slugs:
+                if slug:
+                    self._slug_index.pop(slug.lower(), None)
+
     def _delete_locked(self, node_id: int) -> None:
         entry = self._store.pop(int(node_id), None)
         if entry is None:
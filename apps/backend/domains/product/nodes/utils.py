@@ -87,6 +87,8 @@ def comment_to_dict(comment) -> dict[str, Any]:
         "metadata": comment.metadata,
         "created_at": comment.created_at,
         "updated_at": comment.updated_at,
+        "reply_count": getattr(comment, "reply_count", 0),
+        "descendant_count": getattr(comment, "descendant_count", 0),
     }
 
 
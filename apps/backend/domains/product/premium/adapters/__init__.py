@@ -0,0 +1,13 @@
+from .memory.cache import MemoryEntitlementsCache
+from .memory.repository import MemoryEntitlementsRepo
+from .redis_cache import RedisEntitlementsCache, create_shared_cache
+from .sql.repository import SQLEntitlementsRepo, create_entitlements_repo
+
+__all__ = [
+    "MemoryEntitlementsCache",
+    "MemoryEntitlementsRepo",
+    "RedisEntitlementsCache",
+    "SQLEntitlementsRepo",
+    "create_entitlements_repo",
+    "create_shared_cache",
+]
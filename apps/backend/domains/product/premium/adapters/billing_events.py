@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from domains.platform.events.application.publisher import Events
+from domains.product.premium.application.service import PremiumService
+
+logger = logging.getLogger(__name__)
+
+# Billing events after which a user's cached entitlements are stale.
+ENTITLEMENT_TOPICS: tuple[str, ...] = ("billing.plan.changed.v1",)
+
+
+def register_entitlement_invalidation(events: Events, service: PremiumService) -> None:
+    """Drop cached entitlements of the user named in billing plan events."""
+
+    async def _on_event(payload: dict[str, Any]) -> None:
+        user_id = payload.get("user_id")
+        if not user_id:
+            return
+        await service.invalidate([str(user_id)])
+
+    def _log_task_failure(task: asyncio.Task[Any]) -> None:
+        try:
+            exc = task.exception()
+        except asyncio.CancelledError:
+            return
+        if exc:
+            logger.exception("Failed to invalidate premium entitlements", exc_info=exc)
+
+    def _schedule(topic: str, payload: dict[str, Any]) -> None:
+        del topic
+        try:
+            task = asyncio.create_task(_on_event(payload))
+            task.add_done_callback(_log_task_failure)
+        except RuntimeError:
+            asyncio.run(_on_event(payload))
+
+    for topic in ENTITLEMENT_TOPICS:
+        events.on(topic, _schedule)
+
+
+__all__ = ["ENTITLEMENT_TOPICS", "register_entitlement_invalidation"]
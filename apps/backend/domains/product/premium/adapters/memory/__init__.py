@@ -0,0 +1,4 @@
+from .cache import MemoryEntitlementsCache
+from .repository import MemoryEntitlementsRepo
+
+__all__ = ["MemoryEntitlementsCache", "MemoryEntitlementsRepo"]
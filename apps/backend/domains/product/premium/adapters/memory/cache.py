@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from datetime import UTC, datetime, timedelta
+
+from domains.product.premium.application.ports import EntitlementsCache
+from domains.product.premium.domain.entitlements import Entitlements
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
+class MemoryEntitlementsCache(EntitlementsCache):
+    """Per-process LRU of resolved entitlements.
+
+    Entries live ``ttl_seconds`` at most and never past the subscription
+    window. Invalidations only reach this process, so the TTL bounds how long
+    another replica may serve a plan that billing already changed.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = 15.0,
+        max_entries: int = 10_000,
+        clock: Callable[[], datetime] = _utcnow,
+    ) -> None:
+        self._ttl = timedelta(seconds=max(ttl_seconds, 0.0))
+        self._max_entries = max(int(max_entries), 1)
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[datetime, Entitlements]] = OrderedDict()
+
+    async def get_many(self, user_ids: Sequence[str]) -> dict[str, Entitlements]:
+        now = self._clock()
+        out: dict[str, Entitlements] = {}
+        for user_id in user_ids:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                continue
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._entries[user_id]
+                continue
+            self._entries.move_to_end(user_id)
+            out[user_id] = value
+        return out
+
+    async def set_many(self, items: Sequence[Entitlements]) -> None:
+        now = self._clock()
+        for value in items:
+            expires_at = now + self._ttl
+            if value.valid_until is not None:
+                expires_at = min(expires_at, value.valid_until)
+            self._entries[value.user_id] = (expires_at, value)
+            self._entries.move_to_end(value.user_id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def invalidate(self, user_ids: Sequence[str]) -> None:
+        for user_id in user_ids:
+            self._entries.pop(user_id, None)
+
+
+__all__ = ["MemoryEntitlementsCache"]
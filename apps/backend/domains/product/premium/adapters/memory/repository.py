@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from dataclasses import replace
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from domains.product.premium.application.ports import EntitlementsRepo
+from domains.product.premium.domain.entitlements import PlanGrant
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
+class MemoryEntitlementsRepo(EntitlementsRepo):
+    """Process-local subscriptions; plan limits come from the service config."""
+
+    def __init__(self, *, clock: Callable[[], datetime] = _utcnow) -> None:
+        self._clock = clock
+        # user -> (started_at, grant), newest last
+        self._grants: dict[str, list[tuple[datetime, PlanGrant]]] = {}
+
+    async def active_grants(
+        self, user_ids: Sequence[str], *, at: datetime
+    ) -> dict[str, PlanGrant]:
+        out: dict[str, PlanGrant] = {}
+        for user_id in user_ids:
+            for started_at, grant in reversed(self._grants.get(user_id, [])):
+                if started_at <= at and (grant.ends_at is None or grant.ends_at > at):
+                    out[user_id] = grant
+                    break
+        return out
+
+    async def assign(
+        self, user_id: str, plan: str, *, ends_at: datetime | None = None
+    ) -> PlanGrant:
+        now = self._clock()
+        await self.revoke(user_id)
+        grant = PlanGrant(
+            user_id=user_id, plan=plan, subscription_id=str(uuid4()), ends_at=ends_at
+        )
+        self._grants.setdefault(user_id, []).append((now, grant))
+        return grant
+
+    async def revoke(self, user_id: str) -> None:
+        now = self._clock()
+        self._grants[user_id] = [
+            (
+                started_at,
+                grant
+                if grant.ends_at is not None and grant.ends_at <= now
+                else replace(grant, ends_at=now),
+            )
+            for started_at, grant in self._grants.get(user_id, [])
+        ]
+
+
+__all__ = ["MemoryEntitlementsRepo"]
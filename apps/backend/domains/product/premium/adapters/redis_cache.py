@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import json
+import logging
+import math
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from typing import Any
+
+try:  # pragma: no cover - optional dependency
+    import redis.asyncio as redis  # type: ignore[import-untyped]
+    from redis.exceptions import RedisError  # type: ignore[import]
+except ImportError:  # pragma: no cover - optional dependency
+    redis = None  # type: ignore[assignment]
+    RedisError = Exception  # type: ignore[misc,assignment]
+
+from domains.product.premium.application.ports import EntitlementsCache
+from domains.product.premium.domain.entitlements import Entitlements
+from packages.core.testing import is_test_mode
+
+logger = logging.getLogger(__name__)
+
+
+def _decode(raw: Any) -> Entitlements | None:
+    if raw is None:
+        return None
+    if isinstance(raw, bytes):
+        raw = raw.decode("utf-8")
+    try:
+        return Entitlements.from_payload(json.loads(raw))
+    except (TypeError, ValueError, KeyError):
+        return None
+
+
+class RedisEntitlementsCache(EntitlementsCache):
+    """Entitlements shared by every replica; billing events delete entries."""
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        ttl_seconds: int = 600,
+        namespace: str = "product:premium:entitlements:v1",
+    ) -> None:
+        self._client = client
+        self._ttl = max(int(ttl_seconds), 1)
+        self._namespace = namespace
+
+    def _key(self, user_id: str) -> str:
+        return f"{self._namespace}:{user_id}"
+
+    async def get_many(self, user_ids: Sequence[str]) -> dict[str, Entitlements]:
+        if not user_ids:
+            return {}
+        try:
+            raws = await self._client.mget([self._key(user_id) for user_id in user_ids])
+        except RedisError as exc:  # pragma: no cover - network error
+            logger.debug("premium_cache_redis_get_failed", exc_info=exc)
+            return {}
+        out: dict[str, Entitlements] = {}
+        for user_id, raw in zip(user_ids, raws, strict=True):
+            value = _decode(raw)
+            if value is not None:
+                out[user_id] = value
+        return out
+
+    async def set_many(self, items: Sequence[Entitlements]) -> None:
+        if not items:
+            return
+        now = datetime.now(UTC)
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for value in items:
+                    ttl = self._ttl
+                    if value.valid_until is not None:
+                        remaining = (value.valid_until - now).total_seconds()
+                        if remaining <= 0:
+                            continue
+                        ttl = min(ttl, math.ceil(remaining))
+                    payload = json.dumps(
+                        value.to_payload(), ensure_ascii=False, separators=(",", ":")
+                    )
+                    pipe.set(self._key(value.user_id), payload, ex=ttl)
+                await pipe.execute()
+        except RedisError as exc:  # pragma: no cover - network error
+            logger.debug("premium_cache_redis_set_failed", exc_info=exc)
+
+    async def invalidate(self, user_ids: Sequence[str]) -> None:
+        if not user_ids:
+            return
+        try:
+            await self._client.delete(*(self._key(user_id) for user_id in user_ids))
+        except RedisError as exc:  # pragma: no cover - network error
+            logger.warning(
+                "premium_cache_redis_delete_failed",
+                extra={"users": len(user_ids)},
+                exc_info=exc,
+            )
+
+
+def create_shared_cache(settings: Any) -> RedisEntitlementsCache | None:
+    """Redis layer for the API process; ``None`` in tests or without redis."""
+
+    redis_url = getattr(settings, "redis_url", None)
+    if redis is None or not redis_url or is_test_mode(settings):
+        return None
+    try:
+        client = redis.from_url(str(redis_url), decode_responses=True)
+    except (RedisError, ValueError) as exc:
+        logger.warning("premium entitlements: redis cache unavailable: %s", exc)
+        return None
+    return RedisEntitlementsCache(
+        client,
+        ttl_seconds=int(getattr(settings, "premium_entitlements_cache_ttl_seconds", 600)),
+    )
+
+
+__all__ = ["RedisEntitlementsCache", "create_shared_cache"]
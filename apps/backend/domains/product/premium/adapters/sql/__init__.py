@@ -0,0 +1,3 @@
+from .repository import SQLEntitlementsRepo, create_entitlements_repo
+
+__all__ = ["SQLEntitlementsRepo", "create_entitlements_repo"]
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from domains.product.premium.application.ports import EntitlementsRepo
+from domains.product.premium.domain.entitlements import PlanGrant
+from packages.core.db import get_async_engine
+from packages.core.sql_fallback import evaluate_sql_backend
+
+from ..memory.repository import MemoryEntitlementsRepo
+
+logger = logging.getLogger(__name__)
+
+# Billing owns ``user_subscriptions``/``subscription_plans``; the newest active
+# subscription whose window contains ``:at`` wins, as in billing itself.
+_ACTIVE_GRANTS = text(
+    """
+    SELECT DISTINCT ON (s.user_id)
+           s.user_id::text AS user_id,
+           s.id::text AS subscription_id,
+           s.ends_at,
+           p.slug,
+           p.monthly_limits,
+           p.features
+      FROM user_subscriptions AS s
+      JOIN subscription_plans AS p ON p.id = s.plan_id
+     WHERE s.user_id = ANY(cast(:uids AS uuid[]))
+       AND s.status = 'active'
+       AND s.started_at <= :at
+       AND (s.ends_at IS NULL OR s.ends_at > :at)
+     ORDER BY s.user_id, s.created_at DESC
+    """
+)
+_PLAN_BY_SLUG = text(
+    "SELECT id, slug, monthly_limits, features FROM subscription_plans WHERE slug = :slug"
+)
+# Grants written here are tagged with ``source`` and only those are ended, so
+# paid subscriptions stay under billing's control (and apply again once a
+# grant ends).
+_SOURCE = "premium"
+_END_ACTIVE = text(
+    """
+    UPDATE user_subscriptions
+       SET status = 'canceled',
+           ends_at = CASE WHEN ends_at IS NULL OR ends_at > now() THEN now() ELSE ends_at END,
+           updated_at = now()
+     WHERE user_id = cast(:uid AS uuid) AND status = 'active' AND source = :source
+    """
+)
+_INSERT = text(
+    """
+    INSERT INTO user_subscriptions
+           (user_id, plan_id, status, auto_renew, started_at, ends_at, source,
+            created_at, updated_at)
+    VALUES (cast(:uid AS uuid), :pid, 'active', false, now(), :ends, :source, now(), now())
+    RETURNING id::text AS id, ends_at
+    """
+)
+
+
+def _as_dict(value: Any) -> dict[str, Any]:
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return {}
+    return dict(value) if isinstance(value, Mapping) else {}
+
+
+def _limits(value: Any) -> dict[str, int]:
+    limits: dict[str, int] = {}
+    for key, limit in _as_dict(value).items():
+        try:
+            limits[str(key)] = int(limit)
+        except (TypeError, ValueError):
+            continue
+    return limits
+
+
+def _normalize(user_id: str) -> str | None:
+    try:
+        return str(UUID(str(user_id)))
+    except ValueError:
+        return None
+
+
+class SQLEntitlementsRepo(EntitlementsRepo):
+    def __init__(self, engine: AsyncEngine | str) -> None:
+        self._engine: AsyncEngine = (
+            get_async_engine("premium", url=engine) if isinstance(engine, str) else engine
+        )
+
+    async def active_grants(
+        self, user_ids: Sequence[str], *, at: datetime
+    ) -> dict[str, PlanGrant]:
+        valid = sorted({n for user_id in user_ids if (n := _normalize(user_id))})
+        if not valid:
+            return {}
+        async with self._engine.connect() as conn:
+            rows = (await conn.execute(_ACTIVE_GRANTS, {"uids": valid, "at": at})).mappings()
+            grants = {
+                row["user_id"]: PlanGrant(
+                    user_id=row["user_id"],
+                    plan=str(row["slug"]),
+                    monthly_limits=_limits(row["monthly_limits"]),
+                    features=_as_dict(row["features"]),
+                    subscription_id=row["subscription_id"],
+                    ends_at=row["ends_at"],
+                )
+                for row in rows
+            }
+        # Callers key by the ids they passed in, which may differ in case.
+        return {
+            user_id: grants[normalized]
+            for user_id in user_ids
+            if (normalized := _normalize(user_id)) in grants
+        }
+
+    async def assign(
+        self, user_id: str, plan: str, *, ends_at: datetime | None = None
+    ) -> PlanGrant:
+        if _normalize(user_id) is None:
+            raise ValueError("premium_user_id_invalid")
+        async with self._engine.begin() as conn:
+            plan_row = (await conn.execute(_PLAN_BY_SLUG, {"slug": plan})).mappings().first()
+            if plan_row is None:
+                raise ValueError("premium_plan_not_found")
+            await conn.execute(_END_ACTIVE, {"uid": user_id, "source": _SOURCE})
+            inserted = (
+                (
+                    await conn.execute(
+                        _INSERT,
+                        {
+                            "uid": user_id,
+                            "pid": plan_row["id"],
+                            "ends": ends_at,
+                            "source": _SOURCE,
+                        },
+                    )
+                )
+                .mappings()
+                .first()
+            )
+            if inserted is None:
+                raise RuntimeError("database_row_missing")
+        return PlanGrant(
+            user_id=user_id,
+            plan=str(plan_row["slug"]),
+            monthly_limits=_limits(plan_row["monthly_limits"]),
+            features=_as_dict(plan_row["features"]),
+            subscription_id=inserted["id"],
+            ends_at=inserted["ends_at"],
+        )
+
+    async def revoke(self, user_id: str) -> None:
+        async with self._engine.begin() as conn:
+            await conn.execute(_END_ACTIVE, {"uid": user_id, "source": _SOURCE})
+
+
+def create_entitlements_repo(settings) -> EntitlementsRepo:
+    decision = evaluate_sql_backend(settings)
+    if not decision.dsn:
+        logger.debug("premium entitlements: using memory backend (%s)", decision.reason)
+        return MemoryEntitlementsRepo()
+    try:
+        return SQLEntitlementsRepo(decision.dsn)
+    except Exception as exc:  # pragma: no cover - defensive fallback
+        logger.warning(
+            "premium entitlements: falling back to memory due to SQL error: %s", exc
+        )
+        return MemoryEntitlementsRepo()
+
+
+__all__ = ["SQLEntitlementsRepo", "create_entitlements_repo"]
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any, Protocol, runtime_checkable
+
+from domains.product.premium.domain.entitlements import Entitlements, PlanGrant
+
+
+@runtime_checkable
+class EntitlementsRepo(Protocol):
+    async def active_grants(
+        self, user_ids: Sequence[str], *, at: datetime
+    ) -> dict[str, PlanGrant]:
+        """Return the active grant per user whose window contains ``at``.
+
+        Users without one are absent from the result.
+        """
+        ...
+
+    async def assign(
+        self, user_id: str, plan: str, *, ends_at: datetime | None = None
+    ) -> PlanGrant:
+        """End the user's active grants and start one on ``plan``."""
+        ...
+
+    async def revoke(self, user_id: str) -> None:
+        """End the user's active grants; billing's own subscriptions stay."""
+        ...
+
+
+@runtime_checkable
+class EntitlementsCache(Protocol):
+    async def get_many(self, user_ids: Sequence[str]) -> dict[str, Entitlements]: ...
+
+    async def set_many(self, items: Sequence[Entitlements]) -> None: ...
+
+    async def invalidate(self, user_ids: Sequence[str]) -> None: ...
+
+
+@runtime_checkable
+class QuotaPort(Protocol):
+    """The slice of ``platform.quota.QuotaService`` premium relies on."""
+
+    async def consume(
+        self,
+        *,
+        user_id: str,
+        key: str,
+        limit: int,
+        amount: int = 1,
+        scope: str = "day",
+        now: datetime | None = None,
+        dry_run: bool = False,
+    ) -> Any: ...
+
+
+__all__ = ["EntitlementsCache", "EntitlementsRepo", "QuotaPort"]
@@ -1,30 +1,201 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
+from dataclasses import replace
+from datetime import UTC, datetime
 from typing import Any
 
+from domains.product.premium.adapters.memory.cache import MemoryEntitlementsCache
+from domains.product.premium.adapters.memory.repository import MemoryEntitlementsRepo
+from domains.product.premium.application.ports import (
+    EntitlementsCache,
+    EntitlementsRepo,
+    QuotaPort,
+)
+from domains.product.premium.domain.entitlements import (
+    DEFAULT_PLAN,
+    Entitlements,
+    PlanGrant,
+)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
 
 class PremiumService:
-    def __init__(self, plans: dict[str, dict[str, Any]] | None = None) -> None:
-        # plans: plan_slug -> {quota_key: {"month": limit}, "__grace__": 0}
+    """Resolves user plans into entitlements and checks quotas against them.
+
+    Lookups go through the in-process cache, then the shared one (Redis),
+    and only then to SQL, so steady-state checks never hit the database.
+    ``invalidate`` drops both layers; billing events call it.
+    """
+
+    def __init__(
+        self,
+        plans: dict[str, dict[str, Any]] | None = None,
+        *,
+        repo: EntitlementsRepo | None = None,
+        cache: EntitlementsCache | None = None,
+        shared_cache: EntitlementsCache | None = None,
+        quota: QuotaPort | None = None,
+        clock: Callable[[], datetime] = _utcnow,
+    ) -> None:
+        # plans: plan_slug -> {quota_key: {"month": limit}, "__grace__": 0,
+        # "__features__": {...}}; defaults under what billing plans define.
         self._plans = plans or {"free": {"__grace__": 0, "stories": {"month": 0}}}
-        self._user_plans: dict[str, str] = {}
-        self._usage: dict[tuple[str, str, str], int] = (
-            {}
-        )  # (user_id, quota_key, scope) -> used
+        self._repo = repo or MemoryEntitlementsRepo()
+        self._cache = cache or MemoryEntitlementsCache(clock=clock)
+        self._shared = shared_cache
+        self._quota = quota
+        self._clock = clock
+        # Used only without a quota service: (user_id, quota_key, scope) -> used
+        self._usage: dict[tuple[str, str, str], int] = {}
+        # Users invalidated while a load was in flight must not be re-cached
+        # with what that load read.
+        self._epoch = 0
+        self._loads = 0
+        self._invalidated: dict[str, int] = {}
 
-    async def set_user_plan(self, user_id: str, plan: str) -> None:
-        self._user_plans[str(user_id)] = str(plan)
+    # Entitlements
 
-    async def get_effective_plan_slug(self, user_id: str | None) -> str:
+    def _entitlements(self, user_id: str, grant: PlanGrant | None) -> Entitlements:
+        plan = grant.plan if grant is not None else DEFAULT_PLAN
+        base = Entitlements.from_plan_config(user_id, plan, self._plans.get(plan, {}))
+        if grant is None:
+            return base
+        granted = Entitlements.from_grant(grant)
+        return replace(
+            granted,
+            limits={**base.limits, **granted.limits},
+            features={**base.features, **granted.features},
+        )
+
+    async def resolve(self, user_id: str | None) -> Entitlements:
         if not user_id:
-            return "free"
-        return self._user_plans.get(str(user_id), "free")
+            return self._entitlements("", None)
+        resolved = await self.resolve_many([str(user_id)])
+        return resolved[str(user_id)]
+
+    async def resolve_many(self, user_ids: Iterable[str]) -> dict[str, Entitlements]:
+        """Entitlements of many users at once (one SQL query for all misses)."""
+
+        wanted = list(dict.fromkeys(str(user_id) for user_id in user_ids if user_id))
+        found = await self._cache.get_many(wanted)
+        missing = [user_id for user_id in wanted if user_id not in found]
+        if missing and self._shared is not None:
+            shared = await self._shared.get_many(missing)
+            now = self._clock()
+            fresh = [
+                value
+                for value in shared.values()
+                if value.valid_until is None or value.valid_until > now
+            ]
+            await self._cache.set_many(fresh)
+            found.update((value.user_id, value) for value in fresh)
+            missing = [user_id for user_id in missing if user_id not in found]
+        if missing:
+            found.update(await self._load(missing))
+        return {user_id: found[user_id] for user_id in wanted}
+
+    async def _load(self, user_ids: list[str]) -> dict[str, Entitlements]:
+        started = self._epoch
+        self._loads += 1
+        try:
+            grants = await self._repo.active_grants(user_ids, at=self._clock())
+        finally:
+            self._loads -= 1
+        loaded = {
+            user_id: self._entitlements(user_id, grants.get(user_id))
+            for user_id in user_ids
+        }
+        cacheable = [
+            value
+            for user_id, value in loaded.items()
+            if self._invalidated.get(user_id, -1) <= started
+        ]
+        if not self._loads:
+            self._invalidated.clear()
+        await self._cache.set_many(cacheable)
+        if self._shared is not None:
+            await self._shared.set_many(cacheable)
+        return loaded
+
+    async def invalidate(self, user_ids: Iterable[str]) -> None:
+        targets = list(dict.fromkeys(str(user_id) for user_id in user_ids if user_id))
+        if not targets:
+            return
+        if self._loads:
+            self._epoch += 1
+            for user_id in targets:
+                self._invalidated[user_id] = self._epoch
+        await self._cache.invalidate(targets)
+        if self._shared is not None:
+            await self._shared.invalidate(targets)
+
+    async def set_user_plan(
+        self, user_id: str, plan: str, *, ends_at: datetime | None = None
+    ) -> None:
+        if str(plan) == DEFAULT_PLAN:
+            await self._repo.revoke(str(user_id))
+        else:
+            await self._repo.assign(str(user_id), str(plan), ends_at=ends_at)
+        await self.invalidate([str(user_id)])
+
+    async def get_effective_plan_slug(self, user_id: str | None) -> str:
+        return (await self.resolve(user_id)).plan
+
+    async def has_feature(self, user_id: str | None, feature: str) -> bool:
+        return (await self.resolve(user_id)).has_feature(feature)
+
+    # Quotas
 
     async def get_quota_status(
         self, user_id: str, *, quota_key: str, scope: str = "month"
     ) -> dict:
-        plan = await self.get_effective_plan_slug(user_id)
-        conf = self._plans.get(plan, {})
-        total = int(((conf.get(quota_key) or {}).get(scope)) or 0)
-        used = int(self._usage.get((str(user_id), quota_key, scope), 0))
+        total = (await self.resolve(user_id)).limit(quota_key, scope)
+        if self._quota is None or total <= 0 or not user_id:
+            used = int(self._usage.get((str(user_id), quota_key, scope), 0))
+        else:
+            result = await self._quota.consume(
+                user_id=str(user_id),
+                key=quota_key,
+                limit=total,
+                amount=0,
+                scope=scope,
+                dry_run=True,
+            )
+            used = total - int(result.remaining)
         return {"limit": total, "used": used, "remaining": max(0, total - used)}
+
+    async def consume_quota(
+        self, user_id: str, *, quota_key: str, amount: int = 1, scope: str = "month"
+    ) -> dict:
+        """Spend ``amount`` of the user's plan quota; ``allowed`` is False past it."""
+
+        total = (await self.resolve(user_id)).limit(quota_key, scope)
+        if total <= 0:
+            return {"allowed": False, "limit": total, "used": 0, "remaining": 0}
+        if self._quota is None:
+            key = (str(user_id), quota_key, scope)
+            used = self._usage.get(key, 0) + int(amount)
+            self._usage[key] = used
+            return {
+                "allowed": used <= total,
+                "limit": total,
+                "used": used,
+                "remaining": max(0, total - used),
+            }
+        result = await self._quota.consume(
+            user_id=str(user_id), key=quota_key, limit=total, amount=amount, scope=scope
+        )
+        remaining = int(result.remaining)
+        return {
+            "allowed": bool(result.allowed),
+            "limit": total,
+            "used": total - remaining,
+            "remaining": remaining,
+        }
+
+
+__all__ = ["PremiumService"]
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+DEFAULT_PLAN = "free"
+
+
+@dataclass(frozen=True, slots=True)
+class PlanGrant:
+    """An active subscription of one user, as stored by billing."""
+
+    user_id: str
+    plan: str
+    monthly_limits: Mapping[str, int] = field(default_factory=dict)
+    features: Mapping[str, Any] = field(default_factory=dict)
+    subscription_id: str | None = None
+    ends_at: datetime | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class Entitlements:
+    """What a user may do right now: plan, quota limits and feature flags.
+
+    ``limits`` maps a quota key to ``{scope: limit}``; ``valid_until`` is the
+    end of the subscription window, after which the value must be resolved
+    again (caches never keep it past that point).
+    """
+
+    user_id: str
+    plan: str
+    limits: Mapping[str, Mapping[str, int]] = field(default_factory=dict)
+    features: Mapping[str, Any] = field(default_factory=dict)
+    valid_until: datetime | None = None
+    subscription_id: str | None = None
+
+    def limit(self, quota_key: str, scope: str = "month") -> int:
+        return int((self.limits.get(quota_key) or {}).get(scope) or 0)
+
+    def has_feature(self, name: str) -> bool:
+        return bool(self.features.get(name))
+
+    @classmethod
+    def from_grant(cls, grant: PlanGrant) -> Entitlements:
+        return cls(
+            user_id=grant.user_id,
+            plan=grant.plan,
+            limits={
+                key: {"month": int(value)}
+                for key, value in grant.monthly_limits.items()
+                if value is not None
+            },
+            features=dict(grant.features),
+            valid_until=grant.ends_at,
+            subscription_id=grant.subscription_id,
+        )
+
+    @classmethod
+    def from_plan_config(
+        cls, user_id: str, plan: str, config: Mapping[str, Any]
+    ) -> Entitlements:
+        """Build entitlements from a ``{quota_key: {scope: limit}}`` config.
+
+        Keys starting with ``__`` (e.g. ``__grace__``) are plan settings, and
+        ``__features__`` holds the feature flags.
+        """
+
+        limits = {
+            key: {str(scope): int(limit or 0) for scope, limit in value.items()}
+            for key, value in config.items()
+            if not key.startswith("__") and isinstance(value, Mapping)
+        }
+        features = config.get("__features__")
+        return cls(
+            user_id=user_id,
+            plan=plan,
+            limits=limits,
+            features=dict(features) if isinstance(features, Mapping) else {},
+        )
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "user_id": self.user_id,
+            "plan": self.plan,
+            "limits": {key: dict(value) for key, value in self.limits.items()},
+            "features": dict(self.features),
+            "valid_until": self.valid_until.isoformat() if self.valid_until else None,
+            "subscription_id": self.subscription_id,
+        }
+
+    @classmethod
+    def from_payload(cls, payload: Mapping[str, Any]) -> Entitlements:
+        valid_until = payload.get("valid_until")
+        return cls(
+            user_id=str(payload["user_id"]),
+            plan=str(payload["plan"]),
+            limits={
+                str(key): {str(scope): int(limit) for scope, limit in value.items()}
+                for key, value in (payload.get("limits") or {}).items()
+            },
+            features=dict(payload.get("features") or {}),
+            valid_until=datetime.fromisoformat(valid_until) if valid_until else None,
+            subscription_id=payload.get("subscription_id"),
+        )
+
+
+__all__ = ["DEFAULT_PLAN", "Entitlements", "PlanGrant"]
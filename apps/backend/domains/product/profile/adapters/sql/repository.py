@@ -4,13 +4,11 @@ import logging
 import re
 from collections.abc import Callable
 from datetime import datetime
-from threading import Lock
 from typing import Any
 
 from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError, ProgrammingError
 from sqlalchemy.ext.asyncio import AsyncEngine
-from sqlalchemy.pool import NullPool
 
 from domains.product.profile.application.ports import Repo
 from domains.product.profile.domain.entities import Profile
@@ -47,11 +45,7 @@ class SQLProfileRepo(Repo):
             self._engine_factory = lambda: get_async_engine(
                 "profile.repo",
                 url=dsn,
-                cache=False,
-                pool_pre_ping=False,
-                poolclass=NullPool,
             )
-        self._engine_lock = Lock()
         self._include_limits = True
         self._include_email_requests = True
         self._include_role_column = True
@@ -298,16 +292,8 @@ class SQLProfileRepo(Repo):
         factory = self._engine_factory
         if factory is None:
             raise RuntimeError("profile repo engine is not configured")
-        with self._engine_lock:
-            if self._engine is None:
-                engine = factory()
-                logger.debug(
-                    "profile_repo_engine_created pool=%s pre_ping=%s",
-                    type(engine.sync_engine.pool).__name__,
-                    getattr(engine.sync_engine.pool, "_pre_ping", None),
-                )
-                self._engine = engine
-            return self._engine
+        # Resolved per call: the registry keeps one shared pool per event loop.
+        return factory()
 
     async def email_in_use(
         self, email: str, exclude_user_id: str | None = None
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import io
 from collections.abc import Mapping
 from http import HTTPStatus
 from typing import Any
@@ -240,7 +239,7 @@ async def upload_avatar(
         )
 
     name = file_name or "avatar"
-    url = storage.save_file(io.BytesIO(content), name, content_type)
+    url = await storage.save_bytes(content, name, content_type)
     return build_avatar_result(url)
 
 
@@ -15,21 +15,21 @@ class MemoryQuestsRepo(Repo):
         self._by_id: dict[str, QuestDTO] = {}
         self._by_slug: dict[str, str] = {}
 
-    def get(self, quest_id: str) -> QuestDTO | None:
+    async def get(self, quest_id: str) -> QuestDTO | None:
         return self._by_id.get(str(quest_id))
 
-    def get_by_slug(self, slug: str) -> QuestDTO | None:
+    async def get_by_slug(self, slug: str) -> QuestDTO | None:
         qid = self._by_slug.get(str(slug))
         return self._by_id.get(qid) if qid else None
 
-    def list_by_author(
+    async def list_by_author(
         self, author_id: str, *, limit: int = 50, offset: int = 0
     ) -> list[QuestDTO]:
         items = [q for q in self._by_id.values() if q.author_id == str(author_id)]
         items.sort(key=lambda x: x.id)
         return items[offset : offset + limit]
 
-    def create(self, data: CreateQuestInput, slug: str) -> QuestDTO:
+    async def create(self, data: CreateQuestInput, slug: str) -> QuestDTO:
         qid = str(uuid.uuid4())
         dto = QuestDTO(
             id=qid,
@@ -44,7 +44,7 @@ class MemoryQuestsRepo(Repo):
         self._by_slug[dto.slug] = qid
         return dto
 
-    def set_tags(self, quest_id: str, tags: Sequence[str]) -> QuestDTO:
+    async def set_tags(self, quest_id: str, tags: Sequence[str]) -> QuestDTO:
         q = self._by_id.get(str(quest_id))
         if not q:
             raise ValueError("quest not found")
@@ -60,7 +60,7 @@ class MemoryQuestsRepo(Repo):
         self._by_id[q.id] = dto
         return dto
 
-    def update(
+    async def update(
         self,
         quest_id: str,
         *,
@@ -11,14 +11,14 @@ def make_router() -> APIRouter:
     router = APIRouter(prefix="/v1/quests")
 
     @router.get("/{quest_id}")
-    def get_quest(
+    async def get_quest(
         quest_id: str,
         req: Request,
         container=Depends(get_container),
         claims=Depends(get_current_user),
     ):
         svc = container.quests_service
-        view = svc.get(quest_id)
+        view = await svc.get(quest_id)
         if not view:
             raise HTTPException(status_code=404, detail="not_found")
         uid = str(claims.get("sub")) if claims else None
@@ -36,7 +36,7 @@ def make_router() -> APIRouter:
         }
 
     @router.post("")
-    def create_quest(
+    async def create_quest(
         body: dict,
         req: Request,
         container=Depends(get_container),
@@ -56,11 +56,11 @@ def make_router() -> APIRouter:
         if not data.title:
             raise HTTPException(status_code=400, detail="title_required")
         svc = container.quests_service
-        view = svc.create(data)
+        view = await svc.create(data)
         return {"id": view.id, "slug": view.slug}
 
     @router.put("/{quest_id}/tags")
-    def set_tags(
+    async def set_tags(
         quest_id: str,
         body: dict,
         req: Request,
@@ -69,7 +69,7 @@ def make_router() -> APIRouter:
         _csrf: None = Depends(csrf_protect),
     ):
         svc = container.quests_service
-        view = svc.get(quest_id)
+        view = await svc.get(quest_id)
         if not view:
             raise HTTPException(status_code=404, detail="not_found")
         uid = str(claims.get("sub")) if claims else None
@@ -79,7 +79,7 @@ def make_router() -> APIRouter:
         tags = body.get("tags") or []
         if not isinstance(tags, list):
             raise HTTPException(status_code=400, detail="tags_list_required")
-        updated = svc.update_tags(quest_id, tags, actor_id=uid or "")
+        updated = await svc.update_tags(quest_id, tags, actor_id=uid or "")
         return {"id": updated.id, "tags": list(updated.tags)}
 
     return router
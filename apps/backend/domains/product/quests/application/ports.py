@@ -27,14 +27,14 @@ class CreateQuestInput:
 
 @runtime_checkable
 class Repo(Protocol):
-    def get(self, quest_id: str) -> QuestDTO | None: ...
-    def get_by_slug(self, slug: str) -> QuestDTO | None: ...
-    def list_by_author(
+    async def get(self, quest_id: str) -> QuestDTO | None: ...
+    async def get_by_slug(self, slug: str) -> QuestDTO | None: ...
+    async def list_by_author(
         self, author_id: str, *, limit: int = 50, offset: int = 0
     ) -> list[QuestDTO]: ...
-    def create(self, data: CreateQuestInput, slug: str) -> QuestDTO: ...
-    def set_tags(self, quest_id: str, tags: Sequence[str]) -> QuestDTO: ...
-    def update(
+    async def create(self, data: CreateQuestInput, slug: str) -> QuestDTO: ...
+    async def set_tags(self, quest_id: str, tags: Sequence[str]) -> QuestDTO: ...
+    async def update(
         self,
         quest_id: str,
         *,
@@ -54,8 +54,8 @@ class QuestService:
             )
             raise OutboxError("quest_outbox_publish_unexpected", topic=topic) from exc
 
-    def get(self, quest_id: str) -> QuestView | None:
-        q = self.repo.get(quest_id)
+    async def get(self, quest_id: str) -> QuestView | None:
+        q = await self.repo.get(quest_id)
         if not q:
             return None
         return QuestView(
@@ -69,12 +69,12 @@ class QuestService:
         )
 
     @with_trace
-    def create(self, data: CreateQuestInput) -> QuestView:
+    async def create(self, data: CreateQuestInput) -> QuestView:
         slug = hashlib.sha256(
             f"{data.author_id}-{data.title}-{time.time()}".encode()
         ).hexdigest()[:16]
         tags = self.tags.ensure_canonical_slugs(list(data.tags or ()))
-        created = self.repo.create(
+        created = await self.repo.create(
             CreateQuestInput(
                 author_id=data.author_id,
                 title=data.title,
@@ -108,7 +108,7 @@ class QuestService:
                 key=f"quest:{created.id}:tags",
                 context={"quest_id": created.id},
             )
-        return self.get(created.id) or QuestView(
+        return await self.get(created.id) or QuestView(
             id=created.id,
             author_id=created.author_id,
             slug=created.slug,
@@ -119,12 +119,12 @@ class QuestService:
         )
 
     @with_trace
-    def update_tags(
+    async def update_tags(
         self, quest_id: str, new_slugs: Sequence[str], *, actor_id: str
     ) -> QuestView:
         tags = self.tags.ensure_canonical_slugs(list(new_slugs))
-        before = self.repo.get(quest_id)
-        updated = self.repo.set_tags(quest_id, tags)
+        before = await self.repo.get(quest_id)
+        updated = await self.repo.set_tags(quest_id, tags)
         old = set(before.tags) if before else set()
         new = set(tags)
         added = sorted(new - old)
@@ -143,7 +143,7 @@ class QuestService:
                 key=f"quest:{updated.id}:tags",
                 context={"quest_id": updated.id, "actor_id": actor_id},
             )
-        return self.get(quest_id) or QuestView(
+        return await self.get(quest_id) or QuestView(
             id=updated.id,
             author_id=updated.author_id,
             slug=updated.slug,
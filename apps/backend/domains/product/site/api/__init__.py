@@ -1,5 +1,6 @@
 """API routers for the site editor."""
 
 from .admin_http import make_router
+from .public_http import make_public_router
 
-__all__ = ["make_router"]
+__all__ = ["make_router", "make_public_router"]
@@ -1174,6 +1174,24 @@ async def diff_page_draft(
     }
 
 
+@router.get(
+    "/pages/{page_id}/draft/patch",
+    dependencies=[Depends(require_role_db("editor"))],
+)
+async def patch_page_draft(
+    page_id: UUID,
+    service: SiteService = Depends(get_site_service),
+) -> dict[str, Any]:
+    patch, draft_version, published_version = await service.patch_page_draft(page_id)
+    return {
+        "page_id": str(page_id),
+        "draft_version": draft_version,
+        "published_version": published_version,
+        "operations": patch.to_patch(),
+        "truncated": patch.truncated,
+    }
+
+
 @router.post(
     "/pages/{page_id}/preview",
     dependencies=[Depends(csrf_protect), Depends(require_role_db("editor"))],
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from apps.backend.infra.security.rate_limits import PUBLIC_RATE_LIMITS
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, Field
+
+from domains.product.site.application import SiteService
+from domains.product.site.domain import (
+    MetricEvent,
+    MetricEventKind,
+    SitePageNotFound,
+)
+
+from .admin_http import get_site_service
+
+# Snapshots change only on publish, so clients revalidate cheaply with the
+# ETag once the short max-age runs out.
+_CACHE_CONTROL = "public, max-age=60"
+
+MAX_BEACON_EVENTS = 100
+# Beacons queued by an offline client are still accepted for this long; the
+# rollup folds late buckets into their own periods.
+MAX_EVENT_AGE = timedelta(hours=24)
+
+
+class MetricEventPayload(BaseModel):
+    kind: MetricEventKind
+    page_id: UUID
+    block_id: UUID | None = None
+    locale: str = Field(default="ru", min_length=2, max_length=8)
+    visitor_id: str | None = Field(default=None, max_length=64)
+    occurred_at: datetime | None = None
+    time_on_page_ms: int | None = Field(default=None, ge=0, le=86_400_000)
+    bounced: bool = False
+    mobile: bool = False
+    revenue: float | None = Field(default=None, ge=0)
+
+
+class MetricEventsPayload(BaseModel):
+    events: list[MetricEventPayload] = Field(min_length=1, max_length=MAX_BEACON_EVENTS)
+
+
+def _to_metric_events(
+    payload: MetricEventsPayload, *, now: datetime
+) -> list[MetricEvent]:
+    """Convert beacon items; client clocks are trusted only within the window."""
+
+    events: list[MetricEvent] = []
+    for item in payload.events:
+        occurred_at = item.occurred_at
+        if occurred_at is None or occurred_at.tzinfo is None:
+            occurred_at = now
+        occurred_at = min(occurred_at.astimezone(UTC), now)
+        if occurred_at < now - MAX_EVENT_AGE:
+            continue
+        try:
+            events.append(
+                MetricEvent(
+                    kind=item.kind,
+                    occurred_at=occurred_at,
+                    page_id=item.page_id,
+                    block_id=item.block_id,
+                    locale=item.locale,
+                    visitor_id=item.visitor_id,
+                    time_on_page_ms=item.time_on_page_ms,
+                    bounced=item.bounced,
+                    mobile=item.mobile,
+                    revenue=item.revenue,
+                )
+            )
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=422, detail="site_metric_event_invalid"
+            ) from exc
+    return events
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag for candidate in header.split(",")
+    )
+
+
+def make_public_router() -> APIRouter:
+    router = APIRouter(prefix="/v1/public/site", tags=["public-site"])
+
+    content_rate_limit = PUBLIC_RATE_LIMITS["content"].as_dependencies()
+
+    @router.get(
+        "/pages",
+        summary="Get the published render snapshot of a site page",
+        dependencies=content_rate_limit,
+    )
+    async def get_public_page(
+        request: Request,
+        slug: str = Query(..., min_length=1, max_length=256),
+        locale: str | None = Query(default=None, max_length=16),
+        service: SiteService = Depends(get_site_service),
+    ) -> Response:
+        try:
+            snapshot = await service.get_page_snapshot(slug=slug.strip(), locale=locale)
+        except SitePageNotFound as exc:
+            raise HTTPException(status_code=404, detail="site_page_not_found") from exc
+        headers = {
+            "ETag": snapshot.etag,
+            "Cache-Control": _CACHE_CONTROL,
+            "Content-Language": snapshot.locale,
+        }
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, snapshot.etag):
+            return Response(status_code=304, headers=headers)
+        return JSONResponse(content=dict(snapshot.document), headers=headers)
+
+    @router.post(
+        "/events",
+        summary="Record analytics events from the public site",
+        status_code=202,
+        dependencies=PUBLIC_RATE_LIMITS["site_events"].as_dependencies(),
+    )
+    async def record_site_events(
+        payload: MetricEventsPayload,
+        service: SiteService = Depends(get_site_service),
+    ) -> dict[str, int]:
+        events = _to_metric_events(payload, now=datetime.now(UTC))
+        await service.record_metric_events(events)
+        return {"accepted": len(events)}
+
+    return router
+
+
+__all__ = ["MetricEventsPayload", "make_public_router"]
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Collection, Mapping
+from collections.abc import Collection, Mapping, Sequence
 from typing import Any
 from uuid import UUID
 
@@ -22,14 +22,17 @@ from domains.product.site.domain import (
     BlockTemplate,
     BlockUsage,
     BlockVersion,
+    MetricEvent,
     Page,
     PageDraft,
     PageMetrics,
     PageReviewStatus,
+    PageSnapshot,
     PageStatus,
     PageType,
     PageVersion,
 )
+from domains.product.site.domain.diff import DocumentDiff
 from domains.product.site.infrastructure import SiteRepository
 from domains.product.site.infrastructure.repositories import helpers as repo_helpers
 from domains.product.site.schema import (
@@ -190,6 +193,17 @@ class SiteService:
     async def get_page_draft(self, page_id: UUID) -> PageDraft:
         return await self._repo.get_page_draft(page_id)
 
+    async def get_page_snapshot(
+        self,
+        *,
+        page_id: UUID | None = None,
+        slug: str | None = None,
+        locale: str | None = None,
+    ) -> PageSnapshot:
+        return await self._repo.get_page_snapshot(
+            page_id=page_id, slug=slug, locale=locale
+        )
+
     async def list_page_shared_bindings(
         self,
         page_id: UUID,
@@ -295,6 +309,11 @@ class SiteService:
     ) -> tuple[list[Mapping[str, Any]], int, int | None]:
         return await self._repo.diff_current_draft(page_id)
 
+    async def patch_page_draft(
+        self, page_id: UUID
+    ) -> tuple[DocumentDiff, int, int | None]:
+        return await self._repo.patch_current_draft(page_id)
+
     async def get_page_version(self, page_id: UUID, version: int) -> PageVersion:
         return await self._repo.get_page_version(page_id, version)
 
@@ -313,6 +332,11 @@ class SiteService:
     ) -> PageMetrics | None:
         return await self._repo.get_page_metrics(page_id, period=period, locale=locale)
 
+    async def record_metric_events(self, events: Sequence[MetricEvent]) -> int:
+        if not events:
+            return 0
+        return await self._repo.record_metric_events(events)
+
     def validate_draft_payload(
         self,
         *,
@@ -507,7 +531,9 @@ class SiteService:
             diff=diff,
         )
         usage = await self._repo.list_block_usage(block_id)
-        jobs = await self._enqueue_page_republish_jobs(block_id, usage)
+        jobs = await self._enqueue_page_republish_jobs(
+            block_id, usage, version=block.published_version
+        )
         refreshed_block = await self._repo.get_block(block_id)
         await self._notify_block_publish(
             refreshed_block,
@@ -905,30 +931,37 @@ class SiteService:
                 )
 
     async def _enqueue_page_republish_jobs(
-        self, block_id: UUID, usage: list[BlockUsage]
+        self,
+        block_id: UUID,
+        usage: list[BlockUsage],
+        *,
+        version: int | None = None,
     ) -> list[WorkerJob]:
+        """Re-materialize snapshots of the pages that inline ``block_id``.
+
+        With a worker queue the pages are handed to ``site.page_republish``;
+        without one they are rebuilt inline. Only pages using the block are
+        touched either way.
+        """
+        page_ids = list(dict.fromkeys(item.page_id for item in usage))
         if not self._worker_queue:
+            for page_id in page_ids:
+                await self._repo.materialize_page_snapshots(page_id)
             return []
-        jobs: list[WorkerJob] = []
-        seen: set[UUID] = set()
-        for item in usage:
-            page_id = item.page_id
-            if page_id in seen:
-                continue
-            seen.add(page_id)
-            command = JobCreateCommand(
+        commands = [
+            JobCreateCommand(
                 type="page_republish",
                 input={
                     "page_id": str(page_id),
                     "block_id": str(block_id),
+                    "block_version": version,
                     "reason": "block_publish",
                 },
                 priority=3,
-                idempotency_key=f"page_republish:{page_id}:{block_id}",
+                idempotency_key=f"page_republish:{page_id}:{block_id}:{version}",
             )
-            job = await self._worker_queue.enqueue(command)
-            jobs.append(job)
-        return jobs
-
+            for page_id in page_ids
+        ]
+        return await self._worker_queue.enqueue_many(commands)
 
 __all__ = ["SiteService"]
@@ -1,5 +1,6 @@
 """Domain models for the site editor."""
 
+from .analytics import MetricEvent, MetricEventKind, VisitorSketch
 from .errors import (
     SitePageNotFound,
     SitePageVersionNotFound,
@@ -25,6 +26,7 @@ from .models import (
     PageDraft,
     PageMetrics,
     PageReviewStatus,
+    PageSnapshot,
     PageStatus,
     PageType,
     PageVersion,
@@ -42,12 +44,15 @@ __all__ = [
     "BlockTemplate",
     "BlockVersion",
     "MetricAlert",
+    "MetricEvent",
+    "MetricEventKind",
     "MetricSeverity",
     "MetricValue",
     "Page",
     "PageDraft",
     "PageMetrics",
     "PageReviewStatus",
+    "PageSnapshot",
     "PageStatus",
     "PageType",
     "PageVersion",
@@ -56,4 +61,5 @@ __all__ = [
     "SiteRepositoryError",
     "SiteUnauthorizedError",
     "SiteValidationError",
+    "VisitorSketch",
 ]
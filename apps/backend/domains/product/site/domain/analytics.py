@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import zlib
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from enum import StrEnum
+from uuid import UUID
+
+from .errors import SiteRepositoryError
+
+
+class MetricEventKind(StrEnum):
+    PAGE_VIEW = "page_view"
+    CTA_CLICK = "cta_click"
+    CONVERSION = "conversion"
+    BLOCK_IMPRESSION = "block_impression"
+    BLOCK_CLICK = "block_click"
+
+
+_BLOCK_KINDS = frozenset({MetricEventKind.BLOCK_IMPRESSION, MetricEventKind.BLOCK_CLICK})
+
+
+@dataclass(slots=True)
+class MetricEvent:
+    """One raw analytics event from the public site.
+
+    ``page_id`` is the page the event happened on; block events also carry
+    ``block_id``. A conversion with ``block_id`` is credited to both the page
+    and the block (with ``revenue``).
+    """
+
+    kind: MetricEventKind
+    occurred_at: datetime
+    page_id: UUID
+    block_id: UUID | None = None
+    locale: str = "ru"
+    visitor_id: str | None = None
+    time_on_page_ms: int | None = None
+    bounced: bool = False
+    mobile: bool = False
+    revenue: float | None = None
+
+    def __post_init__(self) -> None:
+        self.kind = MetricEventKind(self.kind)
+        if self.kind in _BLOCK_KINDS and self.block_id is None:
+            raise ValueError(f"{self.kind.value} event requires block_id")
+        if self.occurred_at.tzinfo is None:
+            self.occurred_at = self.occurred_at.replace(tzinfo=UTC)
+
+
+# Tumbling periods served by the metrics panels: UTC day, ISO week and
+# calendar month. Keys match ``helpers._SUPPORTED_METRIC_PERIODS``.
+METRIC_PERIODS = ("1d", "7d", "30d")
+
+
+def hour_floor(moment: datetime) -> datetime:
+    return moment.astimezone(UTC).replace(minute=0, second=0, microsecond=0)
+
+
+def period_bounds(period: str, moment: datetime) -> tuple[datetime, datetime]:
+    """Return ``[start, end)`` of the ``period`` bucket containing ``moment``."""
+
+    day = moment.astimezone(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+    if period == "1d":
+        return day, day + timedelta(days=1)
+    if period == "7d":
+        start = day - timedelta(days=day.weekday())
+        return start, start + timedelta(days=7)
+    if period == "30d":
+        start = day.replace(day=1)
+        if start.month == 12:
+            return start, start.replace(year=start.year + 1, month=1)
+        return start, start.replace(month=start.month + 1)
+    raise SiteRepositoryError("site_metrics_unsupported_period")
+
+
+class VisitorSketch:
+    """HyperLogLog counter of distinct visitors.
+
+    Hourly buckets and period rollups keep a sketch instead of visitor ids:
+    sketches merge by taking register maxima, so the unique visitors of a week
+    are computed from the week's hourly buckets without rescanning events.
+    With ``precision=10`` (1024 registers) the standard error is about 3%.
+
+    Most hourly buckets see a handful of visitors, so while few registers are
+    set the sketch also tracks their indexes: merging and serializing such a
+    sketch costs O(set registers) instead of O(all registers).
+    """
+
+    __slots__ = ("precision", "registers", "_touched")
+
+    def __init__(self, precision: int = 10, registers: bytearray | None = None):
+        if not 4 <= precision <= 16:
+            raise ValueError("precision must be between 4 and 16")
+        self.precision = precision
+        size = 1 << precision
+        if registers is not None and len(registers) != size:
+            raise ValueError("register count does not match precision")
+        self.registers = registers if registers is not None else bytearray(size)
+        self._touched: set[int] | None = set() if registers is None else None
+
+    @property
+    def _sparse_limit(self) -> int:
+        return len(self.registers) // 8
+
+    def _set(self, index: int, rank: int) -> None:
+        touched = self._touched
+        if touched is not None and not self.registers[index]:
+            touched.add(index)
+            if len(touched) > self._sparse_limit:
+                self._touched = None
+        self.registers[index] = rank
+
+    def add(self, visitor_id: str) -> None:
+        digest = hashlib.blake2b(visitor_id.encode("utf-8"), digest_size=8).digest()
+        value = int.from_bytes(digest, "big")
+        bits = 64 - self.precision
+        index = value >> bits
+        rest = value & ((1 << bits) - 1)
+        rank = bits - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self._set(index, rank)
+
+    def merge(self, other: VisitorSketch) -> None:
+        if other.precision != self.precision:
+            raise ValueError("cannot merge sketches with different precision")
+        if other._touched is None:
+            self.registers = bytearray(map(max, self.registers, other.registers))
+            self._touched = None
+            return
+        registers = self.registers
+        for index in other._touched:
+            rank = other.registers[index]
+            if rank > registers[index]:
+                self._set(index, rank)
+
+    def estimate(self) -> int:
+        registers = self.registers
+        size = len(registers)
+        zeros = registers.count(0)
+        if zeros == size:
+            return 0
+        alpha = 0.7213 / (1 + 1.079 / size)
+        harmonic = sum(
+            registers.count(rank) * 2.0**-rank for rank in range(max(registers) + 1)
+        )
+        raw = alpha * size * size / harmonic
+        if raw <= 2.5 * size and zeros:
+            raw = size * math.log(size / zeros)
+        return int(round(raw))
+
+    def to_bytes(self) -> bytes:
+        header = bytes([self.precision])
+        if self._touched is not None:
+            pairs = bytearray()
+            for index in sorted(self._touched):
+                pairs += index.to_bytes(2, "big")
+                pairs.append(self.registers[index])
+            return header + b"S" + bytes(pairs)
+        return header + b"D" + zlib.compress(bytes(self.registers), 1)
+
+    @classmethod
+    def from_bytes(cls, payload: bytes | None) -> VisitorSketch:
+        if not payload:
+            return cls()
+        precision, kind, body = payload[0], payload[1:2], payload[2:]
+        if kind == b"D":
+            return cls(precision, bytearray(zlib.decompress(body)))
+        sketch = cls(precision)
+        for offset in range(0, len(body), 3):
+            index = int.from_bytes(body[offset : offset + 2], "big")
+            sketch._set(index, body[offset + 2])
+        return sketch
+
+
+__all__ = [
+    "METRIC_PERIODS",
+    "MetricEvent",
+    "MetricEventKind",
+    "VisitorSketch",
+    "hour_floor",
+    "period_bounds",
+]
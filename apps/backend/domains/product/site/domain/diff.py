@@ -0,0 +1,361 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Callable, Mapping, Sequence
+from copy import deepcopy
+from dataclasses import dataclass, field
+from typing import Any
+
+_MISSING: Any = object()
+
+
+def document_hash(document: Any) -> str:
+    """Stable sha256 of a JSON document (key order does not matter)."""
+
+    encoded = json.dumps(
+        document,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _escape(token: str | int) -> str:
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def join_pointer(base: str, token: str | int) -> str:
+    return f"{base}/{_escape(token)}"
+
+
+def split_pointer(pointer: str) -> list[str]:
+    if not pointer:
+        return []
+    if not pointer.startswith("/"):
+        raise ValueError(f"invalid JSON pointer: {pointer!r}")
+    return [_unescape(token) for token in pointer[1:].split("/")]
+
+
+@dataclass(frozen=True, slots=True)
+class PatchOperation:
+    """One RFC 6902 operation.
+
+    ``previous`` keeps the value a ``remove``/``replace`` drops, so a diff
+    can be rendered (or inverted) without the source document.
+    """
+
+    op: str
+    path: str
+    value: Any = _MISSING
+    from_path: str | None = None
+    previous: Any = _MISSING
+
+    def to_dict(self) -> dict[str, Any]:
+        payload: dict[str, Any] = {"op": self.op, "path": self.path}
+        if self.from_path is not None:
+            payload["from"] = self.from_path
+        if self.value is not _MISSING:
+            payload["value"] = self.value
+        return payload
+
+
+@dataclass(frozen=True, slots=True)
+class DocumentDiff:
+    operations: tuple[PatchOperation, ...]
+    # Set when ``max_nodes`` ran out and some subtrees were replaced whole
+    # instead of being diffed further; the patch is still exact.
+    truncated: bool = False
+    visited: int = 0
+
+    def __bool__(self) -> bool:
+        return bool(self.operations)
+
+    def to_patch(self) -> list[dict[str, Any]]:
+        return [operation.to_dict() for operation in self.operations]
+
+
+def _keyed(items: Sequence[Any], key_field: str) -> list[str] | None:
+    """Return item keys when every item is a mapping with a unique string key."""
+
+    keys: list[str] = []
+    for item in items:
+        if not isinstance(item, Mapping):
+            return None
+        key = item.get(key_field)
+        if not isinstance(key, str) or not key:
+            return None
+        keys.append(key)
+    if len(set(keys)) != len(keys):
+        return None
+    return keys
+
+
+def _stable_keys(order: Sequence[int]) -> set[int]:
+    """Positions forming a longest increasing subsequence of ``order``."""
+
+    tails: list[int] = []
+    tail_positions: list[int] = []
+    parents: list[int] = [-1] * len(order)
+    for position, value in enumerate(order):
+        slot = bisect_left(tails, value)
+        if slot == len(tails):
+            tails.append(value)
+            tail_positions.append(position)
+        else:
+            tails[slot] = value
+            tail_positions[slot] = position
+        parents[position] = tail_positions[slot - 1] if slot else -1
+    stable: set[int] = set()
+    cursor = tail_positions[-1] if tail_positions else -1
+    while cursor != -1:
+        stable.add(cursor)
+        cursor = parents[cursor]
+    return stable
+
+
+class _Differ:
+    def __init__(self, *, key_field: str, max_nodes: int | None) -> None:
+        self.key_field = key_field
+        self.budget = max_nodes
+        self.visited = 0
+        self.truncated = False
+        self.operations: list[PatchOperation] = []
+
+    def _emit(self, op: str, path: str, **kwargs: Any) -> None:
+        self.operations.append(PatchOperation(op, path, **kwargs))
+
+    def diff(self, before: Any, after: Any, path: str) -> None:
+        if before == after:
+            return
+        self.visited += 1
+        if self.budget is not None and self.visited > self.budget:
+            self.truncated = True
+            self._emit("replace", path, value=after, previous=before)
+            return
+        if isinstance(before, Mapping) and isinstance(after, Mapping):
+            self._diff_mapping(before, after, path)
+        elif isinstance(before, list) and isinstance(after, list):
+            self._diff_list(before, after, path)
+        else:
+            self._emit("replace", path, value=after, previous=before)
+
+    def _diff_mapping(
+        self, before: Mapping[str, Any], after: Mapping[str, Any], path: str
+    ) -> None:
+        for key, value in before.items():
+            if key not in after:
+                self._emit("remove", join_pointer(path, key), previous=value)
+        for key, value in after.items():
+            if key not in before:
+                self._emit("add", join_pointer(path, key), value=value)
+        for key, value in after.items():
+            if key in before:
+                self.diff(before[key], value, join_pointer(path, key))
+
+    def _diff_list(self, before: list[Any], after: list[Any], path: str) -> None:
+        before_keys = _keyed(before, self.key_field)
+        after_keys = _keyed(after, self.key_field) if before_keys is not None else None
+        if before_keys is None or after_keys is None:
+            self._diff_positional(before, after, path)
+            return
+        self._diff_keyed(before, before_keys, after, after_keys, path)
+
+    def _diff_positional(self, before: list[Any], after: list[Any], path: str) -> None:
+        common = min(len(before), len(after))
+        for index in range(len(before) - 1, common - 1, -1):
+            self._emit("remove", join_pointer(path, index), previous=before[index])
+        for index in range(common):
+            self.diff(before[index], after[index], join_pointer(path, index))
+        for index in range(common, len(after)):
+            self._emit("add", join_pointer(path, index), value=after[index])
+
+    def _diff_keyed(
+        self,
+        before: list[Any],
+        before_keys: list[str],
+        after: list[Any],
+        after_keys: list[str],
+        path: str,
+    ) -> None:
+        after_index = {key: index for index, key in enumerate(after_keys)}
+        before_index = {key: index for index, key in enumerate(before_keys)}
+
+        # 1. Removals, back to front so earlier indexes stay valid.
+        for index in range(len(before_keys) - 1, -1, -1):
+            key = before_keys[index]
+            if key not in after_index:
+                self._emit("remove", join_pointer(path, index), previous=before[index])
+        working = [key for key in before_keys if key in after_index]
+
+        # 2. Items on a longest increasing run (by target position) stay put;
+        # every other survivor moves exactly once and new items are added.
+        # Walking the target back to front, each placed item goes right before
+        # its successor, so earlier placements never disturb later ones.
+        stable_positions = _stable_keys([after_index[key] for key in working])
+        stable = {working[position] for position in stable_positions}
+        anchor: str | None = None
+        for target in range(len(after_keys) - 1, -1, -1):
+            key = after_keys[target]
+            if key in stable:
+                anchor = key
+                continue
+            insert_at = len(working) if anchor is None else working.index(anchor)
+            if key in before_index:
+                source = working.index(key)
+                working.pop(source)
+                if source < insert_at:
+                    insert_at -= 1
+                working.insert(insert_at, key)
+                if source != insert_at:
+                    self._emit(
+                        "move",
+                        join_pointer(path, insert_at),
+                        from_path=join_pointer(path, source),
+                    )
+            else:
+                working.insert(insert_at, key)
+                self._emit("add", join_pointer(path, insert_at), value=after[target])
+            anchor = key
+
+        # 3. Content changes of surviving items, at their final positions.
+        for target, key in enumerate(after_keys):
+            source = before_index.get(key)
+            if source is not None:
+                self.diff(before[source], after[target], join_pointer(path, target))
+
+
+def diff_documents(
+    before: Any,
+    after: Any,
+    *,
+    key_field: str = "id",
+    max_nodes: int | None = None,
+) -> DocumentDiff:
+    """Diff two JSON documents into JSON-Patch operations.
+
+    Lists whose items all carry a unique ``key_field`` are matched by key, so
+    reordered blocks become ``move`` operations (a minimal set: items on the
+    longest already-ordered run never move) instead of cascades of replaces.
+    ``max_nodes`` bounds the number of differing containers descended into;
+    past it, differing subtrees are replaced whole and ``truncated`` is set.
+    """
+
+    differ = _Differ(key_field=key_field, max_nodes=max_nodes)
+    differ.diff(before, after, "")
+    return DocumentDiff(
+        operations=tuple(differ.operations),
+        truncated=differ.truncated,
+        visited=differ.visited,
+    )
+
+
+def _resolve(document: Any, tokens: list[str]) -> Any:
+    target = document
+    for token in tokens:
+        target = target[int(token)] if isinstance(target, list) else target[token]
+    return target
+
+
+def apply_patch(document: Any, patch: Sequence[Mapping[str, Any]]) -> Any:
+    """Apply ``add``/``remove``/``replace``/``move`` operations to a copy."""
+
+    result = deepcopy(document)
+    for operation in patch:
+        op = operation["op"]
+        tokens = split_pointer(operation["path"])
+        if op == "move":
+            from_tokens = split_pointer(operation["from"])
+            value = _pop(result, from_tokens)
+            result = _put(result, tokens, value, insert=True)
+        elif op == "remove":
+            _pop(result, tokens)
+        elif op in {"add", "replace"}:
+            result = _put(
+                result, tokens, deepcopy(operation["value"]), insert=op == "add"
+            )
+        else:
+            raise ValueError(f"unsupported patch operation: {op!r}")
+    return result
+
+
+def _pop(document: Any, tokens: list[str]) -> Any:
+    parent = _resolve(document, tokens[:-1])
+    if isinstance(parent, list):
+        return parent.pop(int(tokens[-1]))
+    return parent.pop(tokens[-1])
+
+
+def _put(document: Any, tokens: list[str], value: Any, *, insert: bool) -> Any:
+    if not tokens:
+        return value
+    parent = _resolve(document, tokens[:-1])
+    if isinstance(parent, list):
+        index = len(parent) if tokens[-1] == "-" else int(tokens[-1])
+        if insert:
+            parent.insert(index, value)
+        else:
+            parent[index] = value
+    else:
+        parent[tokens[-1]] = value
+    return document
+
+
+@dataclass(slots=True)
+class DiffCache:
+    """LRU memo of diffs keyed by the version identity of both documents.
+
+    Editors reopen the same draft/published pair many times. Callers pass a
+    key such as ``(page_id, published_version, draft_version)`` instead of
+    hashing the documents, which costs more than the diff itself. A draft save
+    bumps ``draft_version`` and a publish bumps ``published_version``, so an
+    edit produces a new key and the old entry simply ages out of the LRU.
+    The key must cover every input the documents are derived from: page
+    settings such as ``default_locale`` change without a version bump, so the
+    site repositories add the locale next to the versions. The key is only
+    sound while a version number is never reused for different content.
+    """
+
+    maxsize: int = 256
+    _entries: OrderedDict[tuple[Any, ...], Any] = field(default_factory=OrderedDict)
+    hits: int = 0
+    misses: int = 0
+
+    def get_or_compute(
+        self, key: tuple[Any, ...], compute: Callable[[], Any]
+    ) -> Any:
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+            self.hits += 1
+            return entries[key]
+        self.misses += 1
+        value = compute()
+        entries[key] = value
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+
+__all__ = [
+    "DiffCache",
+    "DocumentDiff",
+    "PatchOperation",
+    "apply_patch",
+    "diff_documents",
+    "document_hash",
+    "join_pointer",
+    "split_pointer",
+]
@@ -249,6 +249,26 @@ class BlockTopPage:
     ctr: float | None = None
 
 
+@dataclass(slots=True)
+class PageSnapshot:
+    """Render-ready published page for one locale.
+
+    Shared blocks are inlined at their published versions; ``content_hash``
+    changes whenever the rendered document does.
+    """
+
+    page_id: UUID
+    locale: str
+    version: int
+    content_hash: str
+    document: Mapping[str, Any]
+    rendered_at: datetime
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.content_hash}"'
+
+
 @dataclass(slots=True)
 class PageMetrics:
     page_id: UUID
@@ -298,4 +318,5 @@ __all__ = [
     "PageType",
     "PageVersion",
     "PageMetrics",
+    "PageSnapshot",
 ]
@@ -1,6 +1,6 @@
 """Infrastructure layer for the site editor."""
 
-from .repository import SiteRepository
+from .repository import MetricsRollupReport, SiteRepository
 from .tables import metadata
 
-__all__ = ["SiteRepository", "metadata"]
+__all__ = ["MetricsRollupReport", "SiteRepository", "metadata"]
@@ -0,0 +1,566 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql as pg
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from domains.product.site.domain import SiteRepositoryError
+from domains.product.site.domain.analytics import (
+    METRIC_PERIODS,
+    MetricEvent,
+    MetricEventKind,
+    VisitorSketch,
+    hour_floor,
+    period_bounds,
+)
+
+from ..tables import (
+    SITE_BLOCK_METRICS_TABLE,
+    SITE_BLOCKS_TABLE,
+    SITE_METRIC_HOURLY_TABLE,
+    SITE_METRIC_ROLLUPS_TABLE,
+    SITE_METRIC_WATERMARKS_TABLE,
+    SITE_PAGE_METRICS_TABLE,
+    SITE_PAGES_TABLE,
+)
+from . import helpers
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+_ROLLUP_WATERMARK = "site_metrics_rollup"
+_TOP_PAGES_LIMIT = 5
+_IN_CHUNK = 500
+_PAGE_KINDS = frozenset(
+    {
+        MetricEventKind.PAGE_VIEW,
+        MetricEventKind.CTA_CLICK,
+        MetricEventKind.CONVERSION,
+    }
+)
+_BLOCK_KINDS = frozenset(
+    {
+        MetricEventKind.BLOCK_IMPRESSION,
+        MetricEventKind.BLOCK_CLICK,
+        MetricEventKind.CONVERSION,
+    }
+)
+_COUNTERS = (
+    "views",
+    "clicks",
+    "conversions",
+    "time_on_page_ms",
+    "time_samples",
+    "bounces",
+    "mobile_views",
+)
+
+
+@dataclass(slots=True)
+class MetricsRollupReport:
+    hourly_rows: int = 0
+    periods: int = 0
+    watermark: int = 0
+
+
+class _Totals:
+    """Additive counters of one hourly bucket or one rolled-up period."""
+
+    __slots__ = (*_COUNTERS, "revenue", "sketch", "pages")
+
+    def __init__(self) -> None:
+        self.views = 0
+        self.clicks = 0
+        self.conversions = 0
+        self.time_on_page_ms = 0
+        self.time_samples = 0
+        self.bounces = 0
+        self.mobile_views = 0
+        self.revenue = 0.0
+        self.sketch: VisitorSketch | None = None
+        self.pages: dict[str, list[int]] = {}
+
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> _Totals:
+        totals = cls()
+        for name in _COUNTERS:
+            setattr(totals, name, int(row.get(name) or 0))
+        totals.revenue = float(row.get("revenue") or 0)
+        if row.get("visitors"):
+            totals.sketch = VisitorSketch.from_bytes(row["visitors"])
+        pages = helpers.as_mapping(row.get("pages"))
+        totals.pages = {key: [int(v) for v in value] for key, value in pages.items()}
+        return totals
+
+    def visitor_sketch(self) -> VisitorSketch:
+        if self.sketch is None:
+            self.sketch = VisitorSketch()
+        return self.sketch
+
+    def merge(self, other: _Totals) -> None:
+        for name in _COUNTERS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        self.revenue += other.revenue
+        if other.sketch is not None:
+            if self.sketch is None:
+                self.sketch = VisitorSketch(other.sketch.precision)
+            self.sketch.merge(other.sketch)
+        for page_id, (impressions, clicks) in other.pages.items():
+            slot = self.pages.setdefault(page_id, [0, 0])
+            slot[0] += impressions
+            slot[1] += clicks
+
+    def as_values(self) -> dict[str, Any]:
+        values: dict[str, Any] = {name: getattr(self, name) for name in _COUNTERS}
+        values["revenue"] = round(self.revenue, 4)
+        values["visitors"] = self.sketch.to_bytes() if self.sketch else None
+        return values
+
+
+def _aware(moment: datetime) -> datetime:
+    return moment if moment.tzinfo is not None else moment.replace(tzinfo=UTC)
+
+
+def _chunks(values: Sequence[Any]) -> Iterable[Sequence[Any]]:
+    for offset in range(0, len(values), _IN_CHUNK):
+        yield values[offset : offset + _IN_CHUNK]
+
+
+def _ratio(numerator: int, denominator: int) -> float | None:
+    return round(numerator / denominator, 4) if denominator else None
+
+
+class AnalyticsRepositoryMixin:
+    """Populate ``site_page_metrics``/``site_block_metrics`` from raw events.
+
+    Ingestion (the public ``POST /v1/public/site/events`` beacon) folds
+    events into hourly buckets and appends them to ``site_metric_hourly``. ``rollup_metrics`` consumes buckets past the
+    watermark, adds them to the running totals of every day, ISO week and
+    calendar month they fall into (``site_metric_rollups``) and rewrites only
+    the metric rows of those periods, so a run costs O(new buckets) no matter
+    how much history has been rolled up before.
+    """
+
+    if TYPE_CHECKING:
+
+        async def _require_engine(self) -> AsyncEngine: ...
+
+    async def record_metric_events(self, events: Iterable[MetricEvent]) -> int:
+        """Append hourly buckets for ``events``; returns the number of rows."""
+
+        buckets: dict[tuple[str, UUID, UUID | None, str, datetime], _Totals] = {}
+
+        def bucket(
+            entity_type: str, entity_id: UUID, page_id: UUID | None, event: MetricEvent
+        ) -> _Totals:
+            key = (
+                entity_type,
+                entity_id,
+                page_id,
+                event.locale or helpers._DEFAULT_METRIC_LOCALE,
+                hour_floor(event.occurred_at),
+            )
+            totals = buckets.get(key)
+            if totals is None:
+                totals = buckets[key] = _Totals()
+            return totals
+
+        for event in events:
+            kind = event.kind
+            if kind in _PAGE_KINDS:
+                page = bucket("page", event.page_id, None, event)
+                if kind is MetricEventKind.PAGE_VIEW:
+                    page.views += 1
+                    page.bounces += int(event.bounced)
+                    page.mobile_views += int(event.mobile)
+                    if event.time_on_page_ms is not None:
+                        page.time_on_page_ms += max(int(event.time_on_page_ms), 0)
+                        page.time_samples += 1
+                    if event.visitor_id:
+                        page.visitor_sketch().add(event.visitor_id)
+                elif kind is MetricEventKind.CTA_CLICK:
+                    page.clicks += 1
+                else:
+                    page.conversions += 1
+                    page.revenue += float(event.revenue or 0)
+            if event.block_id is not None and kind in _BLOCK_KINDS:
+                block = bucket("block", event.block_id, event.page_id, event)
+                if kind is MetricEventKind.BLOCK_IMPRESSION:
+                    block.views += 1
+                    if event.visitor_id:
+                        block.visitor_sketch().add(event.visitor_id)
+                elif kind is MetricEventKind.BLOCK_CLICK:
+                    block.clicks += 1
+                else:
+                    block.conversions += 1
+                    block.revenue += float(event.revenue or 0)
+        if not buckets:
+            return 0
+        rows = [
+            {
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "page_id": page_id,
+                "locale": locale,
+                "hour_start": hour_start,
+                **totals.as_values(),
+            }
+            for (entity_type, entity_id, page_id, locale, hour_start), totals in buckets.items()
+        ]
+        engine = await self._require_engine()
+        async with engine.begin() as conn:
+            await conn.execute(sa.insert(SITE_METRIC_HOURLY_TABLE), rows)
+        return len(rows)
+
+    async def rollup_metrics(
+        self,
+        *,
+        batch_size: int = 5000,
+        settle_seconds: float = 5.0,
+        now: datetime | None = None,
+    ) -> MetricsRollupReport:
+        """Fold up to ``batch_size`` new hourly rows into the period metrics.
+
+        Rows younger than ``settle_seconds`` are left for the next run: ids are
+        assigned before commit, so a fresh row with a lower id may still be in
+        flight and must not end up behind the watermark.
+        """
+
+        moment = now or helpers.utcnow()
+        engine = await self._require_engine()
+        async with engine.begin() as conn:
+            watermark = await self._lock_watermark(conn)
+            hourly = SITE_METRIC_HOURLY_TABLE
+            rows = (
+                (
+                    await conn.execute(
+                        sa.select(hourly)
+                        .where(hourly.c.id > watermark)
+                        .where(
+                            hourly.c.created_at
+                            <= moment - timedelta(seconds=settle_seconds)
+                        )
+                        .order_by(hourly.c.id)
+                        .limit(max(int(batch_size), 1))
+                    )
+                )
+                .mappings()
+                .all()
+            )
+            if not rows:
+                return MetricsRollupReport(watermark=watermark)
+
+            deltas = self._period_deltas(rows)
+            oldest = min(_aware(row["created_at"]) for row in rows)
+            lag_ms = max(int((moment - oldest).total_seconds() * 1000), 0)
+            keys = await self._existing_keys(conn, deltas)
+            states = await self._load_rollup_states(conn, keys)
+            for key in keys:
+                states.setdefault(key, _Totals()).merge(deltas[key])
+            await self._write_rollups(conn, states, moment, lag_ms)
+
+            new_watermark = int(rows[-1]["id"])
+            await conn.execute(
+                sa.update(SITE_METRIC_WATERMARKS_TABLE)
+                .where(SITE_METRIC_WATERMARKS_TABLE.c.name == _ROLLUP_WATERMARK)
+                .values(last_id=new_watermark, updated_at=moment)
+            )
+        return MetricsRollupReport(
+            hourly_rows=len(rows), periods=len(keys), watermark=new_watermark
+        )
+
+    async def prune_metric_hourly(self, *, before: datetime) -> int:
+        """Delete rolled-up hourly rows for hours earlier than ``before``."""
+
+        engine = await self._require_engine()
+        async with engine.begin() as conn:
+            watermark = await self._lock_watermark(conn)
+            result = await conn.execute(
+                sa.delete(SITE_METRIC_HOURLY_TABLE)
+                .where(SITE_METRIC_HOURLY_TABLE.c.id <= watermark)
+                .where(SITE_METRIC_HOURLY_TABLE.c.hour_start < before)
+            )
+        return int(result.rowcount or 0)
+
+    async def _lock_watermark(self, conn: AsyncConnection) -> int:
+        table = SITE_METRIC_WATERMARKS_TABLE
+        stmt = (
+            sa.select(table.c.last_id)
+            .where(table.c.name == _ROLLUP_WATERMARK)
+            .with_for_update()
+        )
+        value = (await conn.execute(stmt)).scalar_one_or_none()
+        if value is not None:
+            return int(value)
+        await self._upsert(
+            conn,
+            table,
+            [{"name": _ROLLUP_WATERMARK, "last_id": 0, "updated_at": helpers.utcnow()}],
+            index_elements=("name",),
+            update_columns=(),
+        )
+        return int((await conn.execute(stmt)).scalar_one())
+
+    @staticmethod
+    def _period_deltas(
+        rows: Sequence[Mapping[str, Any]],
+    ) -> dict[tuple[str, UUID, str, str, datetime], _Totals]:
+        # Fold hours into days first: a day is then merged into its three
+        # periods once, instead of once per hourly row.
+        days: dict[tuple[str, UUID, str, datetime], _Totals] = {}
+        for row in rows:
+            hour = _aware(row["hour_start"])
+            day = hour.replace(hour=0)
+            key = (row["entity_type"], row["entity_id"], row["locale"], day)
+            totals = _Totals.from_row(row)
+            if row["entity_type"] == "block" and row.get("page_id") is not None:
+                totals.pages = {str(row["page_id"]): [totals.views, totals.clicks]}
+            current = days.get(key)
+            if current is None:
+                days[key] = totals
+            else:
+                current.merge(totals)
+        deltas: dict[tuple[str, UUID, str, str, datetime], _Totals] = {}
+        for (entity_type, entity_id, locale, day), totals in days.items():
+            for period in METRIC_PERIODS:
+                start, _ = period_bounds(period, day)
+                key = (entity_type, entity_id, period, locale, start)
+                current = deltas.get(key)
+                if current is None:
+                    current = deltas[key] = _Totals()
+                current.merge(totals)
+        return deltas
+
+    async def _existing_keys(
+        self,
+        conn: AsyncConnection,
+        deltas: Mapping[tuple[str, UUID, str, str, datetime], _Totals],
+    ) -> list[tuple[str, UUID, str, str, datetime]]:
+        # Events may reference pages or blocks deleted since; their buckets are
+        # consumed but not rolled up (the metric tables reference the entities).
+        page_ids = sorted({key[1] for key in deltas if key[0] == "page"})
+        block_ids = sorted({key[1] for key in deltas if key[0] == "block"})
+        existing: set[tuple[str, UUID]] = set()
+        for entity_type, table, ids in (
+            ("page", SITE_PAGES_TABLE, page_ids),
+            ("block", SITE_BLOCKS_TABLE, block_ids),
+        ):
+            for chunk in _chunks(ids):
+                result = await conn.execute(
+                    sa.select(table.c.id).where(table.c.id.in_(chunk))
+                )
+                existing.update((entity_type, row_id) for row_id in result.scalars())
+        return [key for key in deltas if (key[0], key[1]) in existing]
+
+    async def _load_rollup_states(
+        self,
+        conn: AsyncConnection,
+        keys: Sequence[tuple[str, UUID, str, str, datetime]],
+    ) -> dict[tuple[str, UUID, str, str, datetime], _Totals]:
+        if not keys:
+            return {}
+        wanted = set(keys)
+        since = min(key[4] for key in keys)
+        table = SITE_METRIC_ROLLUPS_TABLE
+        states: dict[tuple[str, UUID, str, str, datetime], _Totals] = {}
+        for entity_type in ("page", "block"):
+            ids = sorted({key[1] for key in keys if key[0] == entity_type})
+            for chunk in _chunks(ids):
+                result = await conn.execute(
+                    sa.select(table)
+                    .where(table.c.entity_type == entity_type)
+                    .where(table.c.entity_id.in_(chunk))
+                    .where(table.c.range_start >= since)
+                )
+                for row in result.mappings():
+                    key = (
+                        entity_type,
+                        row["entity_id"],
+                        row["period"],
+                        row["locale"],
+                        _aware(row["range_start"]),
+                    )
+                    if key in wanted:
+                        states[key] = _Totals.from_row(row)
+        return states
+
+    async def _write_rollups(
+        self,
+        conn: AsyncConnection,
+        states: Mapping[tuple[str, UUID, str, str, datetime], _Totals],
+        moment: datetime,
+        lag_ms: int,
+    ) -> None:
+        state_rows: list[dict[str, Any]] = []
+        page_rows: list[dict[str, Any]] = []
+        block_rows: list[dict[str, Any]] = []
+        top_pages: dict[tuple[str, UUID, str, str, datetime], list[tuple[str, int, int]]] = {}
+        for key, totals in states.items():
+            entity_type, entity_id, period, locale, range_start = key
+            state_rows.append(
+                {
+                    "entity_type": entity_type,
+                    "entity_id": entity_id,
+                    "period": period,
+                    "locale": locale,
+                    "range_start": range_start,
+                    **totals.as_values(),
+                    "pages": totals.pages or None,
+                    "updated_at": moment,
+                }
+            )
+            _, range_end = period_bounds(period, range_start)
+            base = {
+                "period": period,
+                "locale": locale,
+                "range_start": range_start,
+                "range_end": range_end,
+                "conversions": totals.conversions,
+                "status": "ok",
+                "source_lag_ms": lag_ms,
+                "updated_at": moment,
+            }
+            if entity_type == "page":
+                unique = totals.sketch.estimate() if totals.sketch else 0
+                avg_time = (
+                    round(totals.time_on_page_ms / totals.time_samples / 1000, 4)
+                    if totals.time_samples
+                    else None
+                )
+                page_rows.append(
+                    {
+                        **base,
+                        "page_id": entity_id,
+                        "views": totals.views,
+                        "unique_users": min(unique, totals.views) if totals.views else unique,
+                        "cta_clicks": totals.clicks,
+                        "avg_time_on_page": avg_time,
+                        "bounce_rate": _ratio(totals.bounces, totals.views),
+                        "mobile_share": _ratio(totals.mobile_views, totals.views),
+                    }
+                )
+            else:
+                ranked = sorted(
+                    totals.pages.items(), key=lambda item: (-item[1][0], item[0])
+                )[:_TOP_PAGES_LIMIT]
+                top_pages[key] = [(page_id, imp, clk) for page_id, (imp, clk) in ranked]
+                block_rows.append(
+                    {
+                        **base,
+                        "block_id": entity_id,
+                        "impressions": totals.views,
+                        "clicks": totals.clicks,
+                        "revenue": round(totals.revenue, 4),
+                        "top_pages": None,
+                    }
+                )
+
+        if top_pages:
+            pages = await self._page_labels(
+                conn, {page_id for items in top_pages.values() for page_id, _, _ in items}
+            )
+            for row in block_rows:
+                key = (
+                    "block",
+                    row["block_id"],
+                    row["period"],
+                    row["locale"],
+                    row["range_start"],
+                )
+                row["top_pages"] = [
+                    {
+                        "page_id": page_id,
+                        "slug": pages[page_id][0],
+                        "title": pages[page_id][1],
+                        "impressions": impressions,
+                        "clicks": clicks,
+                        "ctr": _ratio(clicks, impressions),
+                    }
+                    for page_id, impressions, clicks in top_pages[key]
+                    if page_id in pages
+                ] or None
+
+        metric_columns = ("period", "locale", "range_start")
+        await self._upsert(
+            conn,
+            SITE_METRIC_ROLLUPS_TABLE,
+            state_rows,
+            index_elements=("entity_type", "entity_id", *metric_columns),
+            update_columns=(*_COUNTERS, "revenue", "visitors", "pages", "updated_at"),
+        )
+        if page_rows:
+            await self._upsert(
+                conn,
+                SITE_PAGE_METRICS_TABLE,
+                page_rows,
+                index_elements=("page_id", *metric_columns),
+                update_columns=tuple(
+                    name for name in page_rows[0] if name not in {"page_id", *metric_columns}
+                ),
+            )
+        if block_rows:
+            await self._upsert(
+                conn,
+                SITE_BLOCK_METRICS_TABLE,
+                block_rows,
+                index_elements=("block_id", *metric_columns),
+                update_columns=tuple(
+                    name
+                    for name in block_rows[0]
+                    if name not in {"block_id", *metric_columns}
+                ),
+            )
+
+    async def _page_labels(
+        self, conn: AsyncConnection, page_ids: Iterable[str]
+    ) -> dict[str, tuple[str, str]]:
+        ids = sorted(UUID(page_id) for page_id in page_ids)
+        labels: dict[str, tuple[str, str]] = {}
+        for chunk in _chunks(ids):
+            result = await conn.execute(
+                sa.select(
+                    SITE_PAGES_TABLE.c.id,
+                    SITE_PAGES_TABLE.c.slug,
+                    SITE_PAGES_TABLE.c.title,
+                ).where(SITE_PAGES_TABLE.c.id.in_(chunk))
+            )
+            for row in result:
+                labels[str(row.id)] = (row.slug, row.title or "")
+        return labels
+
+    @staticmethod
+    async def _upsert(
+        conn: AsyncConnection,
+        table: sa.Table,
+        rows: Sequence[Mapping[str, Any]],
+        *,
+        index_elements: Sequence[str],
+        update_columns: Sequence[str],
+    ) -> None:
+        if not rows:
+            return
+        dialect = conn.dialect.name
+        if dialect == "postgresql":
+            stmt = pg.insert(table)
+        elif dialect == "sqlite":
+            stmt = sqlite.insert(table)
+        else:  # pragma: no cover - the site editor runs on Postgres
+            raise SiteRepositoryError("site_metrics_dialect_unsupported")
+        if update_columns:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(index_elements),
+                set_={name: stmt.excluded[name] for name in update_columns},
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=list(index_elements))
+        await conn.execute(stmt, list(rows))
+
+
+__all__ = ["AnalyticsRepositoryMixin", "MetricsRollupReport"]
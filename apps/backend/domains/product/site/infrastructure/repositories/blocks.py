@@ -688,6 +688,7 @@ class BlockRepositoryMixin:
                     previous_meta,
                     block.data,
                     block.meta,
+                    default_locale=block.default_locale or "ru",
                 )
             diff_to_store = list(computed_diff) if computed_diff else None
 
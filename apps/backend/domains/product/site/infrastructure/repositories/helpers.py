@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Hashable, Iterable, Mapping, Sequence
 from copy import deepcopy
 from datetime import UTC, datetime
 from decimal import Decimal
@@ -9,6 +9,12 @@ from typing import Any, cast
 from uuid import UUID
 
 from domains.product.site.domain import BlockTopPage
+from domains.product.site.domain.diff import (
+    DiffCache,
+    DocumentDiff,
+    diff_documents,
+    split_pointer,
+)
 
 _DEFAULT_METRIC_LOCALE = "ru"
 _SUPPORTED_METRIC_PERIODS = {"1d", "7d", "30d"}
@@ -17,6 +23,10 @@ _TREND_POINTS = 14
 _SLA_WARNING_LAG_MS = 30 * 60 * 1000  # 30 minutes
 _VIEWS_DROP_THRESHOLD = -0.25
 _CTR_DROP_THRESHOLD = -0.3
+# Differing containers descended into before whole subtrees are replaced;
+# keeps a diff of a pathological document from stalling a request.
+_DIFF_MAX_NODES = 20_000
+_DIFF_CACHE = DiffCache(maxsize=256)
 _OWNER_ALIASES = {
     "Маркетинг": "team_marketing",
     "Продукт": "team_product",
@@ -202,6 +212,42 @@ def extract_trend(
     return tuple(series) if series else None
 
 
+def prorate_previous(
+    current: Mapping[str, Any],
+    previous: Mapping[str, Any] | None,
+    fields: Iterable[str],
+    *,
+    now: datetime | None = None,
+) -> Mapping[str, Any] | None:
+    """Scale additive ``fields`` of ``previous`` to the elapsed share of ``current``.
+
+    The rollup keeps the running period with its natural ``range_end``; comparing
+    a half-finished week with the whole previous week would report a drop at
+    the start of every period.
+    """
+
+    if previous is None:
+        return None
+    start = current.get("range_start")
+    end = current.get("range_end")
+    if not isinstance(start, datetime) or not isinstance(end, datetime):
+        return previous
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=UTC)
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=UTC)
+    moment = now or utcnow()
+    if moment >= end or moment <= start:
+        return previous
+    share = (moment - start) / (end - start)
+    scaled = dict(previous)
+    for field in fields:
+        value = normalize_numeric(previous.get(field))
+        if value is not None:
+            scaled[field] = value * share
+    return scaled
+
+
 def parse_top_pages(payload: Any) -> list[BlockTopPage]:
     if not payload:
         return []
@@ -603,46 +649,297 @@ def project_localized_document(
     return selected, _copy_locales_map(locales_map), active_locale, fallback_locale
 
 
-def compute_page_diff(
+def _diff_document(
+    data: Mapping[str, Any] | None,
+    meta: Mapping[str, Any] | None,
+    default_locale: str,
+) -> dict[str, Any]:
+    return {
+        "data": normalize_localized_document(data, default_locale=default_locale),
+        "meta": normalize_localized_document(meta, default_locale=default_locale),
+    }
+
+
+def _locale_section(document: Mapping[str, Any], scope: str, locale: str) -> dict:
+    return as_mapping(as_mapping(as_mapping(document.get(scope)).get("locales")).get(locale))
+
+
+def _field_entry(
+    scope: str,
+    field: str,
+    change: str,
+    before: Any,
+    after: Any,
+    locale: str | None,
+) -> dict[str, Any]:
+    entry: dict[str, Any] = {"type": scope, "field": field, "change": change}
+    if change != "added":
+        entry["before"] = deepcopy(before)
+    if change != "removed":
+        entry["after"] = deepcopy(after)
+    if locale is not None:
+        entry["locale"] = locale
+    return entry
+
+
+def _summarize_blocks(
+    previous: Any, current: Any, updated: set[str], locale: str
+) -> list[dict[str, Any]]:
+    previous_index = blocks_index(previous)
+    current_index = blocks_index(current)
+    if "*" in updated:
+        updated = {
+            block_id
+            for block_id in previous_index.keys() & current_index.keys()
+            if previous_index[block_id][1] != current_index[block_id][1]
+        }
+    if not updated and previous_index.keys() == current_index.keys() and all(
+        previous_index[key][0] == current_index[key][0] for key in current_index
+    ):
+        return []
+    if len(previous_index) != len(previous or []) or len(current_index) != len(
+        current or []
+    ):
+        # Blocks without ids are not tracked by key; compare them the old way.
+        entries = compute_blocks_diff(previous, current)
+    else:
+        entries = []
+        for block_id in sorted(current_index.keys() - previous_index.keys()):
+            entries.append(
+                {
+                    "type": "block",
+                    "blockId": block_id,
+                    "change": "added",
+                    "after": deepcopy(current_index[block_id][1]),
+                }
+            )
+        for block_id in sorted(previous_index.keys() - current_index.keys()):
+            entries.append(
+                {
+                    "type": "block",
+                    "blockId": block_id,
+                    "change": "removed",
+                    "before": deepcopy(previous_index[block_id][1]),
+                }
+            )
+        for block_id in sorted(previous_index.keys() & current_index.keys()):
+            previous_pos, previous_block = previous_index[block_id]
+            current_pos, current_block = current_index[block_id]
+            if previous_pos != current_pos:
+                entries.append(
+                    {
+                        "type": "block",
+                        "blockId": block_id,
+                        "change": "moved",
+                        "from": previous_pos,
+                        "to": current_pos,
+                    }
+                )
+            if block_id in updated:
+                entries.append(
+                    {
+                        "type": "block",
+                        "blockId": block_id,
+                        "change": "updated",
+                        "before": deepcopy(previous_block),
+                        "after": deepcopy(current_block),
+                    }
+                )
+    for entry in entries:
+        entry["locale"] = locale
+    return entries
+
+
+def summarize_document_diff(
+    diff: DocumentDiff,
+    before: Mapping[str, Any],
+    after: Mapping[str, Any],
+    *,
+    collection: str | None = "blocks",
+) -> list[dict[str, Any]]:
+    """Fold patch operations into the editor's change entries.
+
+    ``before``/``after`` are ``{"data": ..., "meta": ...}`` documents in the
+    normalized localized form. Blocks of ``data[collection]`` are reported
+    per block id (``added``/``removed``/``moved``/``updated``), everything
+    else per top-level field; entries carry the locale they apply to.
+    """
+
+    touched: dict[str, set[str]] = {}
+    fields: dict[tuple[str, str | None, str], str] = {}
+    coarse: set[tuple[str, str]] = set()
+
+    def touch_field(scope: str, locale: str | None, name: str, change: str) -> None:
+        key = (scope, locale, name)
+        fields[key] = change if key not in fields else "updated"
+
+    for operation in diff.operations:
+        tokens = split_pointer(operation.path)
+        scope = tokens[0] if tokens else ""
+        if len(tokens) < 3 or tokens[1] != "locales":
+            if len(tokens) >= 2 and tokens[1] != "locales":
+                touch_field(scope, None, tokens[1], "updated")
+                continue
+            # A whole scope or locale map was replaced (only past the node
+            # budget): compare every locale field by field instead.
+            for candidate in ("data", "meta") if not scope else (scope,):
+                for document in (before, after):
+                    locales = as_mapping(as_mapping(document.get(candidate)).get("locales"))
+                    coarse.update((candidate, locale) for locale in locales)
+            continue
+        locale, rest = tokens[2], tokens[3:]
+        whole_collection = scope == "data" and rest == [collection]
+        if not rest or (whole_collection and operation.op == "replace"):
+            coarse.add((scope, locale))
+            continue
+        if scope == "data" and rest[0] == collection:
+            updated = touched.setdefault(locale, set())
+            if len(rest) > 2 or (len(rest) == 2 and operation.op == "replace"):
+                current = _locale_section(after, "data", locale).get(collection)
+                try:
+                    block = current[int(rest[1])]
+                except (IndexError, TypeError, ValueError):
+                    continue
+                if isinstance(block, Mapping) and isinstance(block.get("id"), str):
+                    updated.add(block["id"])
+            continue
+        if len(rest) == 1 and operation.op in {"add", "remove"}:
+            touch_field(
+                scope, locale, rest[0], "added" if operation.op == "add" else "removed"
+            )
+        else:
+            touch_field(scope, locale, rest[0], "updated")
+
+    for scope, locale in coarse:
+        previous_section = _locale_section(before, scope, locale)
+        current_section = _locale_section(after, scope, locale)
+        for name in previous_section.keys() | current_section.keys():
+            if scope == "data" and name == collection:
+                touched.setdefault(locale, set()).add("*")
+            elif name not in current_section:
+                touch_field(scope, locale, name, "removed")
+            elif name not in previous_section:
+                touch_field(scope, locale, name, "added")
+            elif previous_section[name] != current_section[name]:
+                touch_field(scope, locale, name, "updated")
+
+    entries: list[dict[str, Any]] = []
+    for locale in sorted(touched):
+        entries.extend(
+            _summarize_blocks(
+                _locale_section(before, "data", locale).get(collection),
+                _locale_section(after, "data", locale).get(collection),
+                touched[locale],
+                locale,
+            )
+        )
+    for scope in ("data", "meta"):
+        for (entry_scope, locale, name), change in sorted(
+            fields.items(), key=lambda item: (item[0][1] or "", item[0][2])
+        ):
+            if entry_scope != scope:
+                continue
+            if locale is None:
+                before_value = as_mapping(before.get(scope)).get(name)
+                after_value = as_mapping(after.get(scope)).get(name)
+            else:
+                before_value = _locale_section(before, scope, locale).get(name)
+                after_value = _locale_section(after, scope, locale).get(name)
+            entries.append(
+                _field_entry(scope, name, change, before_value, after_value, locale)
+            )
+    return entries
+
+
+def _cached_document_diff(
+    kind: str,
+    previous: tuple[Mapping[str, Any] | None, Mapping[str, Any] | None],
+    current: tuple[Mapping[str, Any] | None, Mapping[str, Any] | None],
+    *,
+    default_locale: str,
+    collection: str | None,
+    cache_key: Hashable | None,
+) -> tuple[DocumentDiff, list[dict[str, Any]]]:
+    def compute() -> tuple[DocumentDiff, list[dict[str, Any]]]:
+        before = _diff_document(*previous, default_locale)
+        after = _diff_document(*current, default_locale)
+        diff = diff_documents(before, after, max_nodes=_DIFF_MAX_NODES)
+        return diff, summarize_document_diff(diff, before, after, collection=collection)
+
+    # Hashing a large document costs several times more than diffing it, so
+    # only callers that know the version identity of both sides get memoized.
+    if cache_key is None:
+        return compute()
+    key = (kind, cache_key, default_locale, _DIFF_MAX_NODES)
+    return _DIFF_CACHE.get_or_compute(key, compute)
+
+
+def compute_page_patch(
     previous_data: Mapping[str, Any] | None,
     previous_meta: Mapping[str, Any] | None,
     current_data: Mapping[str, Any] | None,
     current_meta: Mapping[str, Any] | None,
-) -> list[dict[str, Any]]:
-    previous_data = as_mapping(previous_data)
-    current_data = as_mapping(current_data)
-    diff: list[dict[str, Any]] = []
-    diff.extend(
-        compute_blocks_diff(previous_data.get("blocks"), current_data.get("blocks"))
-    )
+    *,
+    default_locale: str = "ru",
+    cache_key: Hashable | None = None,
+) -> DocumentDiff:
+    """JSON-Patch from one page version to another (localized form).
+
+    ``cache_key`` must identify both versions (e.g. page id with published and
+    draft version numbers); diffs with the same key are served from memory.
+    ``default_locale`` is part of the memo key, because changing a page's
+    default locale does not bump its draft version.
+    """
 
-    filtered_previous_data = {k: v for k, v in previous_data.items() if k != "blocks"}
-    filtered_current_data = {k: v for k, v in current_data.items() if k != "blocks"}
-    diff.extend(
-        compute_mapping_diff(
-            filtered_previous_data,
-            filtered_current_data,
-            scope="data",
-        )
+    diff, _ = _cached_document_diff(
+        "page",
+        (previous_data, previous_meta),
+        (current_data, current_meta),
+        default_locale=default_locale,
+        collection="blocks",
+        cache_key=cache_key,
     )
-    diff.extend(compute_mapping_diff(previous_meta, current_meta, scope="meta"))
     return diff
 
 
+def compute_page_diff(
+    previous_data: Mapping[str, Any] | None,
+    previous_meta: Mapping[str, Any] | None,
+    current_data: Mapping[str, Any] | None,
+    current_meta: Mapping[str, Any] | None,
+    *,
+    default_locale: str = "ru",
+    cache_key: Hashable | None = None,
+) -> list[dict[str, Any]]:
+    _, entries = _cached_document_diff(
+        "page",
+        (previous_data, previous_meta),
+        (current_data, current_meta),
+        default_locale=default_locale,
+        collection="blocks",
+        cache_key=cache_key,
+    )
+    return [dict(entry) for entry in entries]
+
+
 def compute_global_block_diff(
     previous_data: Mapping[str, Any] | None,
     previous_meta: Mapping[str, Any] | None,
     current_data: Mapping[str, Any] | None,
     current_meta: Mapping[str, Any] | None,
+    *,
+    default_locale: str = "ru",
+    cache_key: Hashable | None = None,
 ) -> list[dict[str, Any]]:
-    diff: list[dict[str, Any]] = []
-    diff.extend(
-        compute_mapping_diff(
-            as_mapping(previous_data), as_mapping(current_data), scope="data"
-        )
+    _, entries = _cached_document_diff(
+        "block",
+        (previous_data, previous_meta),
+        (current_data, current_meta),
+        default_locale=default_locale,
+        collection=None,
+        cache_key=cache_key,
     )
-    diff.extend(compute_mapping_diff(previous_meta, current_meta, scope="meta"))
-    return diff
+    return [dict(entry) for entry in entries]
 
 
 __all__ = [
@@ -660,6 +957,7 @@ __all__ = [
     "compute_ratio",
     "format_delta_percentage",
     "extract_trend",
+    "prorate_previous",
     "parse_top_pages",
     "as_list_of_mapping",
     "row_value",
@@ -667,7 +965,9 @@ __all__ = [
     "compute_blocks_diff",
     "compute_mapping_diff",
     "compute_page_diff",
+    "compute_page_patch",
     "compute_global_block_diff",
+    "summarize_document_diff",
     "extract_shared_block_refs",
     "format_shared_block_refs",
     "normalize_localized_document",
@@ -47,6 +47,9 @@ class MetricsRepositoryMixin:
         current = rows[0]
         previous = rows[1] if len(rows) > 1 else None
         trend_rows = list(reversed(rows[: min(len(rows), helpers._TREND_POINTS)]))
+        previous = helpers.prorate_previous(
+            current, previous, ("views", "unique_users", "cta_clicks", "conversions")
+        )
 
         views_value = helpers.normalize_numeric(current.get("views"))
         prev_views = (
@@ -199,6 +202,9 @@ class MetricsRepositoryMixin:
         current = rows[0]
         previous = rows[1] if len(rows) > 1 else None
         trend_rows = list(reversed(rows[: min(len(rows), helpers._TREND_POINTS)]))
+        previous = helpers.prorate_previous(
+            current, previous, ("impressions", "clicks", "conversions", "revenue")
+        )
 
         impressions_value = helpers.normalize_numeric(current.get("impressions"))
         prev_impressions = (
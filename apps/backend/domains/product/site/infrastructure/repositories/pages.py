@@ -22,6 +22,7 @@ from domains.product.site.domain import (
     SitePageVersionNotFound,
     SiteRepositoryError,
 )
+from domains.product.site.domain.diff import DocumentDiff
 
 from ..tables import (
     SITE_AUDIT_LOG_TABLE,
@@ -41,6 +42,9 @@ if TYPE_CHECKING:
         def _row_to_page(self, row: Mapping[str, Any]) -> Page: ...
         def _row_to_draft(self, row: Mapping[str, Any]) -> PageDraft: ...
         def _row_to_version(self, row: Mapping[str, Any]) -> PageVersion: ...
+        async def _materialize_page_snapshots(
+            self, conn: AsyncConnection, page_id: UUID
+        ) -> int: ...
 
 else:
 
@@ -622,6 +626,8 @@ class PageRepositoryMixin(_RepositoryProtocol):
                     created_at=now,
                 )
             )
+            if updates.keys() & {"slug", "title", "default_locale"}:
+                await self._materialize_page_snapshots(conn, page_id)
 
         return await self.get_page(page_id)
 
@@ -874,6 +880,7 @@ class PageRepositoryMixin(_RepositoryProtocol):
                     previous_version_meta,
                     draft_obj.data,
                     draft_obj.meta,
+                    default_locale=draft_obj.default_locale,
                 )
             diff_to_store = list(computed_diff) if computed_diff else None
             version_id = uuid4()
@@ -922,11 +929,14 @@ class PageRepositoryMixin(_RepositoryProtocol):
                 meta=draft_obj.meta,
                 default_locale=draft_obj.default_locale,
             )
+            await self._materialize_page_snapshots(conn, page_id)
         return await self.get_page_version(page_id, next_version)
 
-    async def diff_current_draft(
+    async def _load_draft_diff_inputs(
         self, page_id: UUID
-    ) -> tuple[list[dict[str, Any]], int, int | None]:
+    ) -> tuple[Mapping[str, Any], Mapping[str, Any], int, int | None]:
+        """Return published and draft ``{"data", "meta"}`` with their versions."""
+
         engine = await self._require_engine()
         async with engine.connect() as conn:
             draft_row = await self._fetch_draft_row(conn, page_id)
@@ -963,12 +973,6 @@ class PageRepositoryMixin(_RepositoryProtocol):
                 if previous_row:
                     previous_data = helpers.as_mapping(previous_row.get("data"))
                     previous_meta = helpers.as_mapping(previous_row.get("meta"))
-            diff = helpers.compute_page_diff(
-                previous_data,
-                previous_meta,
-                draft_data,
-                draft_meta,
-            )
         published_version_int: int | None
         if published_version is None:
             published_version_int = None
@@ -977,7 +981,45 @@ class PageRepositoryMixin(_RepositoryProtocol):
                 published_version_int = int(published_version)
             except (TypeError, ValueError):
                 published_version_int = None
-        return diff, draft_version, published_version_int
+        default_locale = str(draft_row.get("page_default_locale") or "ru")
+        return (
+            {"data": previous_data, "meta": previous_meta, "locale": default_locale},
+            {"data": draft_data, "meta": draft_meta, "locale": default_locale},
+            draft_version,
+            published_version_int,
+        )
+
+    async def diff_current_draft(
+        self, page_id: UUID
+    ) -> tuple[list[dict[str, Any]], int, int | None]:
+        previous, draft, draft_version, published_version = (
+            await self._load_draft_diff_inputs(page_id)
+        )
+        diff = helpers.compute_page_diff(
+            previous["data"],
+            previous["meta"],
+            draft["data"],
+            draft["meta"],
+            default_locale=draft["locale"],
+            cache_key=(page_id, published_version, draft_version),
+        )
+        return diff, draft_version, published_version
+
+    async def patch_current_draft(
+        self, page_id: UUID
+    ) -> tuple[DocumentDiff, int, int | None]:
+        previous, draft, draft_version, published_version = (
+            await self._load_draft_diff_inputs(page_id)
+        )
+        patch = helpers.compute_page_patch(
+            previous["data"],
+            previous["meta"],
+            draft["data"],
+            draft["meta"],
+            default_locale=draft["locale"],
+            cache_key=(page_id, published_version, draft_version),
+        )
+        return patch, draft_version, published_version
 
     async def list_page_global_blocks(
         self, page_id: UUID, *, include_inactive: bool = False
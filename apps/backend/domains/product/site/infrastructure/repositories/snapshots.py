@@ -0,0 +1,357 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Protocol
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from domains.product.site.domain import (
+    BlockScope,
+    BlockStatus,
+    PageSnapshot,
+    PageStatus,
+    SitePageNotFound,
+)
+from domains.product.site.domain.diff import document_hash
+
+from ..tables import (
+    SITE_BLOCK_BINDINGS_TABLE,
+    SITE_BLOCK_VERSIONS_TABLE,
+    SITE_BLOCKS_TABLE,
+    SITE_PAGE_SNAPSHOTS_TABLE,
+    SITE_PAGE_VERSIONS_TABLE,
+    SITE_PAGES_TABLE,
+)
+from . import helpers
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+    class _RepositoryProtocol(Protocol):
+        async def _require_engine(self) -> AsyncEngine: ...
+
+else:
+
+    class _RepositoryProtocol:  # pragma: no cover - runtime placeholder
+        pass
+
+
+class SnapshotRepositoryMixin(_RepositoryProtocol):
+    """Render-ready copies of published pages.
+
+    A snapshot is the published page version projected to one locale with
+    every referenced shared block inlined at its published version, so the
+    public site reads one row per request instead of assembling the page from
+    versions, bindings and blocks. Snapshots are rebuilt inside the publish
+    transaction of the page and, for pages using a shared block, when that
+    block is republished.
+    """
+
+    async def _build_page_documents(
+        self, conn: AsyncConnection, page_id: UUID
+    ) -> tuple[int, dict[str, dict[str, Any]]] | None:
+        page_row = (
+            (
+                await conn.execute(
+                    sa.select(
+                        SITE_PAGES_TABLE.c.id,
+                        SITE_PAGES_TABLE.c.slug,
+                        SITE_PAGES_TABLE.c.type,
+                        SITE_PAGES_TABLE.c.title,
+                        SITE_PAGES_TABLE.c.status,
+                        SITE_PAGES_TABLE.c.default_locale,
+                        SITE_PAGES_TABLE.c.available_locales,
+                        SITE_PAGES_TABLE.c.published_version,
+                        SITE_PAGE_VERSIONS_TABLE.c.data,
+                        SITE_PAGE_VERSIONS_TABLE.c.meta,
+                    )
+                    .select_from(
+                        SITE_PAGES_TABLE.join(
+                            SITE_PAGE_VERSIONS_TABLE,
+                            sa.and_(
+                                SITE_PAGE_VERSIONS_TABLE.c.page_id
+                                == SITE_PAGES_TABLE.c.id,
+                                SITE_PAGE_VERSIONS_TABLE.c.version
+                                == SITE_PAGES_TABLE.c.published_version,
+                            ),
+                        )
+                    )
+                    .where(SITE_PAGES_TABLE.c.id == page_id)
+                )
+            )
+            .mappings()
+            .first()
+        )
+        if not page_row or page_row["status"] != PageStatus.PUBLISHED.value:
+            return None
+        default_locale = str(page_row["default_locale"] or "ru")
+        version = int(page_row["published_version"])
+        locales = list(helpers.as_locale_list(page_row["available_locales"]))
+        if default_locale not in locales:
+            locales.insert(0, default_locale)
+
+        views: dict[str, tuple[dict[str, Any], dict[str, Any], str | None]] = {}
+        keys: set[str] = set()
+        for locale in locales:
+            data, _, _, fallback = helpers.project_localized_document(
+                page_row["data"], default_locale=default_locale, locale=locale
+            )
+            meta, *_ = helpers.project_localized_document(
+                page_row["meta"],
+                default_locale=default_locale,
+                locale=locale,
+                allow_shared=False,
+            )
+            views[locale] = (data, meta, fallback)
+            keys.update(key for key, _ in helpers.extract_shared_block_refs(data, meta))
+
+        # Blocks assigned in the editor live in bindings, not in the document.
+        binding_rows = await conn.execute(
+            sa.select(
+                SITE_BLOCK_BINDINGS_TABLE.c.block_id,
+                SITE_BLOCK_BINDINGS_TABLE.c.section,
+                SITE_BLOCK_BINDINGS_TABLE.c.locale,
+            )
+            .where(
+                sa.and_(
+                    SITE_BLOCK_BINDINGS_TABLE.c.page_id == page_id,
+                    SITE_BLOCK_BINDINGS_TABLE.c.active.is_(True),
+                )
+            )
+            .order_by(SITE_BLOCK_BINDINGS_TABLE.c.position)
+        )
+        bindings = binding_rows.all()
+
+        blocks_by_key: dict[str, Mapping[str, Any]] = {}
+        blocks_by_id: dict[UUID, Mapping[str, Any]] = {}
+        if keys or bindings:
+            block_rows = await conn.execute(
+                sa.select(
+                    SITE_BLOCKS_TABLE.c.id,
+                    SITE_BLOCKS_TABLE.c.key,
+                    SITE_BLOCKS_TABLE.c.section,
+                    SITE_BLOCKS_TABLE.c.default_locale,
+                    SITE_BLOCKS_TABLE.c.published_version,
+                    SITE_BLOCK_VERSIONS_TABLE.c.data,
+                    SITE_BLOCK_VERSIONS_TABLE.c.meta,
+                )
+                .select_from(
+                    SITE_BLOCKS_TABLE.join(
+                        SITE_BLOCK_VERSIONS_TABLE,
+                        sa.and_(
+                            SITE_BLOCK_VERSIONS_TABLE.c.block_id
+                            == SITE_BLOCKS_TABLE.c.id,
+                            SITE_BLOCK_VERSIONS_TABLE.c.version
+                            == SITE_BLOCKS_TABLE.c.published_version,
+                        ),
+                    )
+                )
+                .where(
+                    sa.and_(
+                        sa.or_(
+                            SITE_BLOCKS_TABLE.c.key.in_(sorted(keys)),
+                            SITE_BLOCKS_TABLE.c.id.in_(
+                                {row.block_id for row in bindings}
+                            ),
+                        ),
+                        SITE_BLOCKS_TABLE.c.scope == BlockScope.SHARED.value,
+                        SITE_BLOCKS_TABLE.c.status != BlockStatus.ARCHIVED.value,
+                    )
+                )
+            )
+            for row in block_rows.mappings():
+                blocks_by_id[row["id"]] = row
+                if row["key"]:
+                    blocks_by_key[str(row["key"])] = row
+
+        documents: dict[str, dict[str, Any]] = {}
+        for locale, (data, meta, fallback) in views.items():
+            placements: list[tuple[Mapping[str, Any], str | None]] = []
+            for key, section in helpers.extract_shared_block_refs(data, meta):
+                if key in blocks_by_key:
+                    placements.append((blocks_by_key[key], section))
+            placed = {block["id"] for block, _ in placements}
+            for binding in bindings:
+                block = blocks_by_id.get(binding.block_id)
+                if (
+                    block is not None
+                    and binding.locale == locale
+                    and block["id"] not in placed
+                ):
+                    placed.add(block["id"])
+                    placements.append((block, binding.section))
+            shared: list[dict[str, Any]] = []
+            for block, section in placements:
+                block_locale = str(block["default_locale"] or "ru")
+                block_data, *_ = helpers.project_localized_document(
+                    block["data"], default_locale=block_locale, locale=locale
+                )
+                block_meta, *_ = helpers.project_localized_document(
+                    block["meta"],
+                    default_locale=block_locale,
+                    locale=locale,
+                    allow_shared=False,
+                )
+                shared.append(
+                    {
+                        "key": block["key"],
+                        "section": section or block["section"],
+                        "block_id": str(block["id"]),
+                        "version": int(block["published_version"]),
+                        "data": block_data,
+                        "meta": block_meta,
+                    }
+                )
+            documents[locale] = {
+                "page": {
+                    "id": str(page_row["id"]),
+                    "slug": page_row["slug"],
+                    "type": str(page_row["type"]),
+                    "title": page_row["title"],
+                    "locale": locale,
+                    "fallback_locale": fallback,
+                    "version": version,
+                },
+                "data": data,
+                "meta": meta,
+                "shared_blocks": shared,
+            }
+        return version, documents
+
+    async def _materialize_page_snapshots(
+        self, conn: AsyncConnection, page_id: UUID
+    ) -> int:
+        built = await self._build_page_documents(conn, page_id)
+        if built is None:
+            await conn.execute(
+                SITE_PAGE_SNAPSHOTS_TABLE.delete().where(
+                    SITE_PAGE_SNAPSHOTS_TABLE.c.page_id == page_id
+                )
+            )
+            return 0
+        version, documents = built
+        existing_rows = await conn.execute(
+            sa.select(
+                SITE_PAGE_SNAPSHOTS_TABLE.c.locale,
+                SITE_PAGE_SNAPSHOTS_TABLE.c.content_hash,
+            ).where(SITE_PAGE_SNAPSHOTS_TABLE.c.page_id == page_id)
+        )
+        existing = {row.locale: row.content_hash for row in existing_rows}
+        now = helpers.utcnow()
+        changed: list[dict[str, Any]] = []
+        for locale, document in documents.items():
+            digest = document_hash(document)
+            if existing.get(locale) == digest:
+                continue
+            changed.append(
+                {
+                    "page_id": page_id,
+                    "locale": locale,
+                    "version": version,
+                    "content_hash": digest,
+                    "document": document,
+                    "rendered_at": now,
+                }
+            )
+        # Locales dropped from the page go too; unchanged rows keep their
+        # hash (and the clients' cached copies stay valid).
+        stale = set(existing) - set(documents)
+        replaced = stale | {row["locale"] for row in changed if row["locale"] in existing}
+        if replaced:
+            await conn.execute(
+                SITE_PAGE_SNAPSHOTS_TABLE.delete().where(
+                    sa.and_(
+                        SITE_PAGE_SNAPSHOTS_TABLE.c.page_id == page_id,
+                        SITE_PAGE_SNAPSHOTS_TABLE.c.locale.in_(sorted(replaced)),
+                    )
+                )
+            )
+        if changed:
+            await conn.execute(SITE_PAGE_SNAPSHOTS_TABLE.insert(), changed)
+        return len(changed)
+
+    async def materialize_page_snapshots(self, page_id: UUID) -> int:
+        """Rebuild the snapshots of ``page_id``; returns the locales rewritten."""
+
+        engine = await self._require_engine()
+        async with engine.begin() as conn:
+            return await self._materialize_page_snapshots(conn, page_id)
+
+    async def render_page_document(
+        self, page_id: UUID, locale: str | None = None
+    ) -> dict[str, Any]:
+        """Assemble the published document without reading snapshots."""
+
+        engine = await self._require_engine()
+        async with engine.connect() as conn:
+            built = await self._build_page_documents(conn, page_id)
+        if built is None:
+            raise SitePageNotFound("site_page_not_found")
+        _, documents = built
+        page_locale = next(iter(documents))
+        return documents.get(locale or page_locale) or documents[page_locale]
+
+    async def get_page_snapshot(
+        self,
+        *,
+        page_id: UUID | None = None,
+        slug: str | None = None,
+        locale: str | None = None,
+    ) -> PageSnapshot:
+        if page_id is None and not slug:
+            raise SitePageNotFound("site_page_not_found")
+        engine = await self._require_engine()
+        page_filter = (
+            SITE_PAGES_TABLE.c.id == page_id
+            if page_id is not None
+            else SITE_PAGES_TABLE.c.slug == slug
+        )
+        requested = (locale or "").strip()
+        snapshots = SITE_PAGE_SNAPSHOTS_TABLE
+        stmt = (
+            sa.select(snapshots, SITE_PAGES_TABLE.c.id.label("source_page_id"))
+            .select_from(
+                SITE_PAGES_TABLE.outerjoin(
+                    snapshots,
+                    sa.and_(
+                        snapshots.c.page_id == SITE_PAGES_TABLE.c.id,
+                        sa.or_(
+                            snapshots.c.locale == requested,
+                            snapshots.c.locale == SITE_PAGES_TABLE.c.default_locale,
+                        ),
+                    ),
+                )
+            )
+            .where(
+                sa.and_(
+                    page_filter,
+                    SITE_PAGES_TABLE.c.status == PageStatus.PUBLISHED.value,
+                )
+            )
+            .order_by(sa.case((snapshots.c.locale == requested, 0), else_=1))
+            .limit(1)
+        )
+        async with engine.connect() as conn:
+            row = (await conn.execute(stmt)).mappings().first()
+        if row is None:
+            raise SitePageNotFound("site_page_not_found")
+        if row["page_id"] is None:
+            # Published before snapshots existed: build them on first read.
+            if not await self.materialize_page_snapshots(row["source_page_id"]):
+                raise SitePageNotFound("site_page_not_found")
+            return await self.get_page_snapshot(
+                page_id=row["source_page_id"], locale=locale
+            )
+        return PageSnapshot(
+            page_id=row["page_id"],
+            locale=row["locale"],
+            version=int(row["version"]),
+            content_hash=row["content_hash"],
+            document=helpers.as_mapping(row["document"]),
+            rendered_at=row["rendered_at"],
+        )
+
+
+__all__ = ["SnapshotRepositoryMixin"]
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+from .repositories.analytics import AnalyticsRepositoryMixin, MetricsRollupReport
 from .repositories.audit import AuditRepositoryMixin
 from .repositories.base import EngineFactory, SiteRepositoryBase
 from .repositories.blocks import BlockRepositoryMixin
 from .repositories.metrics import MetricsRepositoryMixin
 from .repositories.pages import PageRepositoryMixin
+from .repositories.snapshots import SnapshotRepositoryMixin
 
 
 class SiteRepository(
@@ -12,10 +14,12 @@ class SiteRepository(
     PageRepositoryMixin,
     BlockRepositoryMixin,
     MetricsRepositoryMixin,
+    AnalyticsRepositoryMixin,
+    SnapshotRepositoryMixin,
     AuditRepositoryMixin,
 ):
     def __init__(self, engine_factory: EngineFactory) -> None:
         super().__init__(engine_factory)
 
 
-__all__ = ["SiteRepository", "EngineFactory"]
+__all__ = ["SiteRepository", "EngineFactory", "MetricsRollupReport"]
@@ -140,6 +140,29 @@ sa.Index(
     unique=True,
 )
 
+# Render-ready published pages, one row per locale. Rows are replaced as a
+# whole on publish or when a shared block they inline is republished.
+SITE_PAGE_SNAPSHOTS_TABLE = sa.Table(
+    "site_page_snapshots",
+    metadata,
+    sa.Column(
+        "page_id",
+        sa.Uuid(as_uuid=True),
+        sa.ForeignKey(
+            "site_pages.id", ondelete="CASCADE", name="fk_site_page_snapshots_page"
+        ),
+        primary_key=True,
+        nullable=False,
+    ),
+    sa.Column("locale", sa.Text(), primary_key=True, nullable=False),
+    sa.Column("version", sa.BigInteger(), nullable=False),
+    sa.Column("content_hash", sa.Text(), nullable=False),
+    sa.Column("document", JSON_TYPE, nullable=False),
+    sa.Column(
+        "rendered_at", sa.DateTime(timezone=True), nullable=False, default=_utcnow
+    ),
+)
+
 SITE_BLOCKS_TABLE = sa.Table(
     "site_blocks",
     metadata,
@@ -473,6 +496,79 @@ sa.Index(
     SITE_BLOCK_METRICS_TABLE.c.range_end,
 )
 
+# Append-only hourly buckets written by metrics ingestion. Each ingest batch
+# adds new rows (never updates), so the rollup can consume them past a
+# watermark on ``id``. Block rows keep the page the block was shown on.
+SITE_METRIC_HOURLY_TABLE = sa.Table(
+    "site_metric_hourly",
+    metadata,
+    sa.Column(
+        "id",
+        sa.BigInteger().with_variant(sa.Integer(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    sa.Column("entity_type", sa.Text(), nullable=False),
+    sa.Column("entity_id", sa.Uuid(as_uuid=True), nullable=False),
+    sa.Column("page_id", sa.Uuid(as_uuid=True), nullable=True),
+    sa.Column("locale", sa.Text(), nullable=False),
+    sa.Column("hour_start", sa.DateTime(timezone=True), nullable=False),
+    sa.Column("views", sa.BigInteger(), nullable=False, default=0),
+    sa.Column("clicks", sa.BigInteger(), nullable=False, default=0),
+    sa.Column("conversions", sa.BigInteger(), nullable=False, default=0),
+    sa.Column("revenue", sa.Numeric(14, 4), nullable=False, default=0),
+    sa.Column("time_on_page_ms", sa.BigInteger(), nullable=False, default=0),
+    sa.Column("time_samples", sa.BigInteger(), nullable=False, default=0),
+    sa.Column("bounces", sa.BigInteger(), nullable=False, default=0),
+    sa.Column("mobile_views", sa.BigInteger(), nullable=False, default=0),
+    sa.Column("visitors", sa.LargeBinary(), nullable=True),
+    sa.Column(
+        "created_at", sa.DateTime(timezone=True), nullable=False, default=_utcnow
+    ),
+)
+
+sa.Index(
+    "ix_site_metric_hourly_hour_start",
+    SITE_METRIC_HOURLY_TABLE.c.hour_start,
+)
+
+# Running totals of every rolled-up period, including the mergeable visitor
+# sketch and per-page block counters the metrics tables cannot hold.
+SITE_METRIC_ROLLUPS_TABLE = sa.Table(
+    "site_metric_rollups",
+    metadata,
+    sa.Column("entity_type", sa.Text(), primary_key=True, nullable=False),
+    sa.Column("entity_id", sa.Uuid(as_uuid=True), primary_key=True, nullable=False),
+    sa.Column("period", sa.Text(), primary_key=True, nullable=False),
+    sa.Column("locale", sa.Text(), primary_key=True, nullable=False),
+    sa.Column(
+        "range_start", sa.DateTime(timezone=True), primary_key=True, nullable=False
+    ),
+    sa.Column("views", sa.BigInteger(), nullable=False, default=0),
+    sa.Column("clicks", sa.BigInteger(), nullable=False, default=0),
+    sa.Column("conversions", sa.BigInteger(), nullable=False, default=0),
+    sa.Column("revenue", sa.Numeric(14, 4), nullable=False, default=0),
+    sa.Column("time_on_page_ms", sa.BigInteger(), nullable=False, default=0),
+    sa.Column("time_samples", sa.BigInteger(), nullable=False, default=0),
+    sa.Column("bounces", sa.BigInteger(), nullable=False, default=0),
+    sa.Column("mobile_views", sa.BigInteger(), nullable=False, default=0),
+    sa.Column("visitors", sa.LargeBinary(), nullable=True),
+    sa.Column("pages", JSON_TYPE, nullable=True),
+    sa.Column(
+        "updated_at", sa.DateTime(timezone=True), nullable=False, default=_utcnow
+    ),
+)
+
+SITE_METRIC_WATERMARKS_TABLE = sa.Table(
+    "site_metric_watermarks",
+    metadata,
+    sa.Column("name", sa.Text(), primary_key=True, nullable=False),
+    sa.Column("last_id", sa.BigInteger(), nullable=False, default=0),
+    sa.Column(
+        "updated_at", sa.DateTime(timezone=True), nullable=False, default=_utcnow
+    ),
+)
+
 # ---------------------------------------------------------------------------
 # Legacy aliases for compatibility during the migration window.
 
@@ -514,12 +610,16 @@ __all__ = [
     "SITE_PAGES_TABLE",
     "SITE_PAGE_DRAFTS_TABLE",
     "SITE_PAGE_VERSIONS_TABLE",
+    "SITE_PAGE_SNAPSHOTS_TABLE",
     "SITE_BLOCKS_TABLE",
     "SITE_BLOCK_TEMPLATES_TABLE",
     "SITE_BLOCK_VERSIONS_TABLE",
     "SITE_BLOCK_BINDINGS_TABLE",
     "SITE_PAGE_METRICS_TABLE",
     "SITE_BLOCK_METRICS_TABLE",
+    "SITE_METRIC_HOURLY_TABLE",
+    "SITE_METRIC_ROLLUPS_TABLE",
+    "SITE_METRIC_WATERMARKS_TABLE",
     "SITE_AUDIT_LOG_TABLE",
     "PAGE_TYPE_ENUM",
     "PAGE_STATUS_ENUM",
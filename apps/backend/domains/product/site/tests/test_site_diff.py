@@ -0,0 +1,159 @@
+import random
+from copy import deepcopy
+from typing import Any
+
+import pytest
+
+from domains.product.site.domain.diff import (
+    DiffCache,
+    apply_patch,
+    diff_documents,
+    document_hash,
+)
+from domains.product.site.infrastructure.repositories import helpers
+
+
+def _block(rng: random.Random, key: str) -> dict[str, Any]:
+    return {
+        "id": key,
+        "type": rng.choice(("hero", "text", "nodes_carousel")),
+        "title": f"Title {rng.randrange(10)}",
+        "items": [{"text": rng.choice("abc")} for _ in range(rng.randrange(3))],
+    }
+
+
+def _mutate(rng: random.Random, document: dict[str, Any]) -> dict[str, Any]:
+    result = deepcopy(document)
+    blocks = result["blocks"]
+    for step in range(rng.randrange(8)):
+        roll = rng.random()
+        if roll < 0.2 and blocks:
+            blocks.pop(rng.randrange(len(blocks)))
+        elif roll < 0.4:
+            blocks.insert(rng.randrange(len(blocks) + 1), _block(rng, f"new-{step}"))
+        elif roll < 0.7 and blocks:
+            blocks.insert(rng.randrange(len(blocks)), blocks.pop(rng.randrange(len(blocks))))
+        elif blocks:
+            target = rng.choice(blocks)
+            target["title"] = "changed"
+            target["items"].append({"text": "z"})
+    if rng.random() < 0.3:
+        result["tags"] = result["tags"][: rng.randrange(len(result["tags"]) + 1)]
+    if rng.random() < 0.3:
+        result["seo"] = {"title/with~escapes": rng.randrange(3)}
+    return result
+
+
+@pytest.mark.parametrize("max_nodes", [None, 1, 4])
+def test_patch_applies_back_to_target(max_nodes):
+    for seed in range(300):
+        rng = random.Random(seed)
+        before = {
+            "blocks": [_block(rng, f"b{index}") for index in range(rng.randrange(12))],
+            "tags": ["a", "b", "c"],
+        }
+        after = _mutate(rng, before)
+        diff = diff_documents(before, after, max_nodes=max_nodes)
+        assert apply_patch(before, diff.to_patch()) == after, seed
+        assert bool(diff) == (before != after)
+
+
+def test_reordered_blocks_become_minimal_moves():
+    before = {"blocks": [{"id": key, "n": 0} for key in "abcdef"]}
+    rotated = {"blocks": before["blocks"][1:] + before["blocks"][:1]}
+    assert diff_documents(before, rotated).to_patch() == [
+        {"op": "move", "path": "/blocks/5", "from": "/blocks/0"}
+    ]
+
+    reversed_ = {"blocks": before["blocks"][::-1]}
+    moves = diff_documents(before, reversed_).operations
+    assert [op.op for op in moves] == ["move"] * 5
+
+    # A moved and edited block is one move plus a field replace, not a
+    # replace of every block in between.
+    edited = deepcopy(rotated)
+    edited["blocks"][5]["n"] = 1
+    assert diff_documents(before, edited).to_patch() == [
+        {"op": "move", "path": "/blocks/5", "from": "/blocks/0"},
+        {"op": "replace", "path": "/blocks/5/n", "value": 1},
+    ]
+
+
+def test_budget_replaces_subtrees_and_cache_is_content_addressed():
+    before = {"blocks": [{"id": f"b{i}", "data": {"x": i}} for i in range(50)]}
+    after = deepcopy(before)
+    for block in after["blocks"]:
+        block["data"]["x"] += 1
+    bounded = diff_documents(before, after, max_nodes=10)
+    assert bounded.truncated
+    # Past the budget whole blocks are replaced instead of their fields.
+    assert sum(op.path.count("/") > 2 for op in bounded.operations) < 10
+    assert apply_patch(before, bounded.to_patch()) == after
+    assert not diff_documents(before, after).truncated
+
+    cache = DiffCache(maxsize=2)
+    key = (document_hash(before), document_hash(after))
+    first = cache.get_or_compute(key, lambda: diff_documents(before, after))
+    again = cache.get_or_compute(
+        (document_hash(deepcopy(before)), document_hash(after)),
+        lambda: pytest.fail("expected a cache hit"),
+    )
+    assert again is first and (cache.hits, cache.misses) == (1, 1)
+
+
+def test_page_diff_reports_blocks_per_locale():
+    previous = {
+        "locales": {
+            "ru": {"blocks": [{"id": "hero", "title": "A"}, {"id": "cta"}]},
+            "en": {"blocks": [{"id": "hero", "title": "A"}]},
+        }
+    }
+    current = {
+        "locales": {
+            "ru": {"blocks": [{"id": "cta"}, {"id": "hero", "title": "B"}]},
+            "en": {"blocks": [{"id": "hero", "title": "A"}, {"id": "promo"}]},
+        }
+    }
+    entries = helpers.compute_page_diff(
+        previous, {"title": "Old"}, current, {"title": "New"}
+    )
+    signatures = {
+        (
+            entry["type"],
+            entry.get("blockId") or entry["field"],
+            entry["change"],
+            entry.get("locale"),
+        )
+        for entry in entries
+    }
+    assert signatures == {
+        ("block", "promo", "added", "en"),
+        ("block", "cta", "moved", "ru"),
+        ("block", "hero", "moved", "ru"),
+        ("block", "hero", "updated", "ru"),
+        ("meta", "title", "updated", "ru"),
+    }
+    updated = next(
+        entry for entry in entries if (entry["type"], entry["change"]) == ("block", "updated")
+    )
+    assert (updated["before"]["title"], updated["after"]["title"]) == ("A", "B")
+
+    patch = helpers.compute_page_patch(
+        previous, {"title": "Old"}, current, {"title": "New"}, cache_key=("page", 1, 2)
+    )
+    added = {"op": "add", "path": "/data/locales/en/blocks/1", "value": {"id": "promo"}}
+    assert added in patch.to_patch()
+    assert (
+        helpers.compute_page_patch(None, None, None, None, cache_key=("page", 1, 2)) is patch
+    )
+    # A default-locale change keeps the versions but must not reuse the diff.
+    relocalized = helpers.compute_page_patch(
+        previous,
+        {"title": "Old"},
+        current,
+        {"title": "New"},
+        default_locale="en",
+        cache_key=("page", 1, 2),
+    )
+    assert relocalized is not patch
+    assert relocalized.to_patch() != patch.to_patch()
@@ -0,0 +1,148 @@
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from domains.product.site.domain import (
+    BlockScope,
+    MetricEvent,
+    MetricEventKind,
+    PageType,
+    VisitorSketch,
+)
+from domains.product.site.domain.analytics import period_bounds
+from domains.product.site.infrastructure import SiteRepository
+from domains.product.site.infrastructure.repositories import helpers
+
+# Wednesday; its ISO week starts on Monday 2025-03-10.
+NOON = datetime(2025, 3, 12, 12, 30, tzinfo=UTC)
+
+
+def test_period_bounds_and_visitor_sketch() -> None:
+    assert period_bounds("1d", NOON) == (
+        datetime(2025, 3, 12, tzinfo=UTC),
+        datetime(2025, 3, 13, tzinfo=UTC),
+    )
+    assert period_bounds("7d", NOON)[0] == datetime(2025, 3, 10, tzinfo=UTC)
+    assert period_bounds("30d", datetime(2026, 12, 31, tzinfo=UTC)) == (
+        datetime(2026, 12, 1, tzinfo=UTC),
+        datetime(2027, 1, 1, tzinfo=UTC),
+    )
+
+    # A running week is compared with the same share of the previous week.
+    current = dict(
+        zip(("range_start", "range_end"), period_bounds("7d", NOON), strict=True)
+    )
+    previous = {"views": 700, "status": "ok"}
+    scaled = helpers.prorate_previous(current, previous, ("views",), now=NOON)
+    assert round(scaled["views"]) == round(700 * (2.5 + 0.5 / 24) / 7)
+    later = NOON + timedelta(days=7)
+    assert helpers.prorate_previous(current, previous, ("views",), now=later) is previous
+
+    left, right = VisitorSketch(), VisitorSketch()
+    for index in range(3000):
+        (left if index % 2 else right).add(f"visitor-{index % 2000}")
+    left.merge(right)
+    restored = VisitorSketch.from_bytes(left.to_bytes())
+    assert abs(restored.estimate() - 2000) < 2000 * 0.1
+
+
+@pytest.mark.asyncio()
+async def test_rollup_populates_metrics_past_watermark(service, repository: SiteRepository):
+    page = await service.create_page(
+        slug="/promo",
+        page_type=PageType.LANDING,
+        title="Промо",
+        locale="ru",
+        owner="team",
+    )
+    block = await service.create_block(
+        key="promo-hero",
+        title="Hero",
+        section="hero",
+        scope=BlockScope.SHARED,
+        default_locale="ru",
+        data={},
+        meta={},
+    )
+
+    def events(day: datetime, views: int) -> list[MetricEvent]:
+        batch: list[MetricEvent] = []
+        for index in range(views):
+            batch.append(
+                MetricEvent(
+                    MetricEventKind.PAGE_VIEW,
+                    day + timedelta(minutes=index),
+                    page.id,
+                    visitor_id=f"v{index % 5}",
+                    time_on_page_ms=4000,
+                    bounced=index % 2 == 0,
+                )
+            )
+            batch.append(
+                MetricEvent(
+                    MetricEventKind.BLOCK_IMPRESSION,
+                    day + timedelta(minutes=index),
+                    page.id,
+                    block_id=block.id,
+                )
+            )
+        batch.append(MetricEvent(MetricEventKind.CTA_CLICK, day, page.id))
+        batch.append(
+            MetricEvent(MetricEventKind.BLOCK_CLICK, day, page.id, block_id=block.id)
+        )
+        batch.append(
+            MetricEvent(
+                MetricEventKind.CONVERSION, day, page.id, block_id=block.id, revenue=9.5
+            )
+        )
+        # Events for deleted entities are consumed without breaking the batch.
+        batch.append(MetricEvent(MetricEventKind.PAGE_VIEW, day, uuid4()))
+        return batch
+
+    yesterday = NOON - timedelta(days=1)
+    assert await repository.record_metric_events(events(yesterday, 40)) > 0
+    first = await repository.rollup_metrics(settle_seconds=0)
+    assert first.hourly_rows > 0 and first.watermark > 0
+    noop = await repository.rollup_metrics(settle_seconds=0)
+    assert (noop.hourly_rows, noop.watermark) == (0, first.watermark)
+
+    # A second batch only touches the periods it falls into; the day before
+    # keeps its totals and the week accumulates both days.
+    await repository.record_metric_events(events(NOON, 10))
+    second = await repository.rollup_metrics(settle_seconds=0)
+    assert second.watermark > first.watermark
+    assert (first.periods, second.periods) == (6, 6)  # page and block x 3 periods
+
+    daily = await repository.get_page_metrics(page.id, period="1d", locale="ru")
+    assert daily is not None
+    assert daily.range_start.replace(tzinfo=UTC) == datetime(2025, 3, 12, tzinfo=UTC)
+    assert daily.metrics["views"].value == 10
+    assert daily.metrics["views"].trend == (40.0, 10.0)
+    assert daily.metrics["unique_users"].value == 5
+    assert daily.metrics["cta_clicks"].value == 1
+    assert daily.metrics["avg_time_on_page"].value == 4
+    assert daily.previous_range_start is not None
+
+    weekly = await repository.get_page_metrics(page.id, period="7d", locale="ru")
+    assert weekly.metrics["views"].value == 50
+    assert weekly.metrics["unique_users"].value == 5
+    assert weekly.metrics["conversions"].value == 2
+
+    block_metrics = await repository.get_block_metrics(
+        block.id, period="30d", locale="ru"
+    )
+    assert block_metrics.metrics["impressions"].value == 50
+    assert block_metrics.metrics["clicks"].value == 2
+    assert block_metrics.metrics["revenue"].value == 19
+    [top] = block_metrics.top_pages
+    assert (top.page_id, top.slug, top.impressions, top.clicks) == (
+        page.id,
+        "/promo",
+        50,
+        2,
+    )
+
+    assert await repository.prune_metric_hourly(before=NOON) > 0
+    weekly_again = await repository.get_page_metrics(page.id, period="7d", locale="ru")
+    assert weekly_again.metrics["views"].value == 50
@@ -0,0 +1,71 @@
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from domains.product.site.api import public_http
+from domains.product.site.api.admin_http import get_site_service
+from domains.product.site.domain import MetricEventKind
+
+
+class _RecordingService:
+    def __init__(self) -> None:
+        self.events: list = []
+
+    async def record_metric_events(self, events) -> int:
+        self.events.extend(events)
+        return len(events)
+
+
+class _NoRateLimit:
+    def as_dependencies(self):
+        return ()
+
+
+@pytest.mark.asyncio()
+async def test_beacon_records_events_for_the_rollup(monkeypatch) -> None:
+    monkeypatch.setitem(public_http.PUBLIC_RATE_LIMITS, "site_events", _NoRateLimit())
+    monkeypatch.setitem(public_http.PUBLIC_RATE_LIMITS, "content", _NoRateLimit())
+    service = _RecordingService()
+    app = FastAPI()
+    app.include_router(public_http.make_public_router())
+    app.dependency_overrides[get_site_service] = lambda: service
+    page_id, block_id = uuid4(), uuid4()
+    now = datetime.now(UTC)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+        response = await client.post(
+            "/v1/public/site/events",
+            json={
+                "events": [
+                    {"kind": "page_view", "page_id": str(page_id), "visitor_id": "v1"},
+                    {
+                        "kind": "block_click",
+                        "page_id": str(page_id),
+                        "block_id": str(block_id),
+                        "occurred_at": (now + timedelta(hours=3)).isoformat(),
+                    },
+                    {
+                        "kind": "cta_click",
+                        "page_id": str(page_id),
+                        "occurred_at": (now - timedelta(days=3)).isoformat(),
+                    },
+                ]
+            },
+        )
+        invalid = await client.post(
+            "/v1/public/site/events",
+            json={"events": [{"kind": "block_click", "page_id": str(page_id)}]},
+        )
+
+    assert response.status_code == 202
+    # Events from the future are clamped to now; stale ones are dropped.
+    assert response.json() == {"accepted": 2}
+    view, click = service.events
+    assert (view.kind, view.visitor_id) == (MetricEventKind.PAGE_VIEW, "v1")
+    assert (click.block_id, click.occurred_at <= datetime.now(UTC)) == (block_id, True)
+    assert invalid.status_code == 422
+    assert len(service.events) == 2
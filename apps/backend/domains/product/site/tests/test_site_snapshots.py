@@ -0,0 +1,89 @@
+import pytest
+
+from domains.product.site.application import SiteService
+from domains.product.site.domain import (
+    PageReviewStatus,
+    PageType,
+    SitePageNotFound,
+)
+
+
+async def _publish_block(service: SiteService, block, title: str) -> None:
+    current = await service.get_block(block.id)
+    await service.save_global_block(
+        block_id=block.id,
+        payload={"title": title},
+        meta={},
+        version=current.draft_version,
+        comment=None,
+        review_status=PageReviewStatus.NONE,
+        actor="editor@example.com",
+    )
+    await service.publish_global_block(block_id=block.id, actor=None, comment=None)
+
+
+async def _publish_page(service: SiteService, slug: str, meta: dict) -> object:
+    page = await service.create_page(
+        slug=slug,
+        page_type=PageType.LANDING,
+        title=slug.strip("/").title(),
+        locale="ru",
+        owner=None,
+    )
+    draft = await service.get_page_draft(page.id)
+    await service.save_page_draft(
+        page_id=page.id,
+        payload={"blocks": []},
+        meta=meta,
+        comment=None,
+        review_status=PageReviewStatus.NONE,
+        expected_version=draft.version,
+        actor="editor@example.com",
+    )
+    await service.publish_page(page_id=page.id, actor=None, comment=None)
+    return page
+
+
+@pytest.mark.asyncio()
+async def test_snapshot_inlines_shared_blocks_and_follows_republish(
+    service: SiteService,
+):
+    header = await service.create_global_block(
+        key="snap-header",
+        title="Header",
+        section="header",
+        locale="ru",
+        requires_publisher=False,
+        data={},
+        meta={},
+    )
+    await _publish_block(service, header, "Шапка v1")
+    page = await _publish_page(
+        service, "/snap-with-header", {"globalBlocks": {"header": "snap-header"}}
+    )
+    other = await _publish_page(service, "/snap-plain", {})
+
+    with pytest.raises(SitePageNotFound):
+        await service.get_page_snapshot(slug="/snap-missing")
+
+    snapshot = await service.get_page_snapshot(slug="/snap-with-header", locale="en")
+    assert (snapshot.page_id, snapshot.locale, snapshot.version) == (page.id, "ru", 1)
+    assert snapshot.etag == f'"{snapshot.content_hash}"'
+    [inlined] = snapshot.document["shared_blocks"]
+    assert (inlined["key"], inlined["section"]) == ("snap-header", "header")
+    assert inlined["data"]["title"] == "Шапка v1"
+    plain = await service.get_page_snapshot(page_id=other.id)
+
+    # Republishing the block rewrites only the pages that inline it.
+    await _publish_block(service, header, "Шапка v2")
+    refreshed = await service.get_page_snapshot(page_id=page.id)
+    assert refreshed.content_hash != snapshot.content_hash
+    assert refreshed.version == 1
+    assert refreshed.document["shared_blocks"][0]["data"]["title"] == "Шапка v2"
+    untouched = await service.get_page_snapshot(page_id=other.id)
+    assert untouched.rendered_at == plain.rendered_at
+
+    # An unchanged rebuild keeps the hash, so client caches stay valid.
+    assert await service._repo.materialize_page_snapshots(page.id) == 0
+    rendered = await service._repo.render_page_document(page.id)
+    assert rendered == refreshed.document
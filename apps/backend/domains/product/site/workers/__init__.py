@@ -0,0 +1,4 @@
+from .metrics_rollup import build_site_metrics_rollup_worker
+from .page_republish import build_site_page_republish_worker
+
+__all__ = ["build_site_metrics_rollup_worker", "build_site_page_republish_worker"]
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import timedelta
+
+from domains.product.site.infrastructure import SiteRepository
+from domains.product.site.infrastructure.repositories import helpers
+from packages.core.db import dispose_async_engines, get_async_engine
+from packages.core.sql_fallback import evaluate_sql_backend
+from packages.worker import PeriodicWorker, PeriodicWorkerConfig
+from packages.worker.registry import WorkerRuntimeContext, register_worker
+
+_WORKER_NAME = "site.metrics_rollup"
+
+
+def _env_float(env: Mapping[str, str], key: str, default: float) -> float:
+    try:
+        return float(env.get(key, default))
+    except (TypeError, ValueError):  # pragma: no cover - defensive
+        return default
+
+
+def _env_int(env: Mapping[str, str], key: str, default: int) -> int:
+    try:
+        return int(env.get(key, default))
+    except (TypeError, ValueError):  # pragma: no cover - defensive
+        return default
+
+
+class SiteMetricsRollupWorker(PeriodicWorker):
+    def __init__(
+        self,
+        *,
+        context: WorkerRuntimeContext,
+        repository: SiteRepository,
+        interval: float,
+        jitter: float,
+        batch_size: int,
+        max_batches: int,
+        retention_days: int,
+    ) -> None:
+        self._repository = repository
+        self._batch_size = batch_size
+        self._max_batches = max_batches
+        self._retention = timedelta(days=retention_days)
+
+        async def _tick() -> None:
+            await self.run_once()
+
+        config = PeriodicWorkerConfig(interval=interval, jitter=jitter, immediate=True)
+        super().__init__(_WORKER_NAME, _tick, config=config, logger=context.logger)
+
+    async def run_once(self) -> int:
+        """Drain hourly buckets past the watermark, then prune old ones."""
+
+        rolled = 0
+        for _ in range(self._max_batches):
+            report = await self._repository.rollup_metrics(batch_size=self._batch_size)
+            rolled += report.hourly_rows
+            if report.hourly_rows < self._batch_size:
+                break
+        pruned = await self._repository.prune_metric_hourly(
+            before=helpers.utcnow() - self._retention
+        )
+        if rolled or pruned:
+            self.logger.info(
+                "site metrics rollup hourly_rows=%s pruned=%s watermark=%s",
+                rolled,
+                pruned,
+                report.watermark,
+            )
+        return rolled
+
+    async def shutdown(self) -> None:
+        await dispose_async_engines()
+        await super().shutdown()
+
+
+@register_worker(_WORKER_NAME)
+async def build_site_metrics_rollup_worker(context: WorkerRuntimeContext):
+    env = dict(context.env)
+    interval = max(_env_float(env, "SITE_METRICS_ROLLUP_INTERVAL", 60.0), 5.0)
+    jitter = min(_env_float(env, "SITE_METRICS_ROLLUP_JITTER", 5.0), interval / 2)
+    batch_size = max(1, _env_int(env, "SITE_METRICS_ROLLUP_BATCH_SIZE", 5000))
+    max_batches = max(1, _env_int(env, "SITE_METRICS_ROLLUP_MAX_BATCHES", 20))
+    retention_days = max(1, _env_int(env, "SITE_METRICS_HOURLY_RETENTION_DAYS", 35))
+    decision = evaluate_sql_backend(context.settings)
+    if not decision.dsn:
+        raise RuntimeError(f"site metrics rollup requires SQL: {decision.reason}")
+    engine = get_async_engine("site-editor", url=decision.dsn, future=True)
+
+    async def _engine_factory():
+        return engine
+
+    return SiteMetricsRollupWorker(
+        context=context,
+        repository=SiteRepository(_engine_factory),
+        interval=interval,
+        jitter=jitter,
+        batch_size=batch_size,
+        max_batches=max_batches,
+        retention_days=retention_days,
+    )
+
+
+__all__ = ["SiteMetricsRollupWorker", "build_site_metrics_rollup_worker"]
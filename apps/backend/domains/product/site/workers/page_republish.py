@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import os
+import socket
+from collections.abc import Mapping
+from uuid import UUID
+
+from domains.platform.worker.application.service import (
+    JobCompletionCommand,
+    JobFailureCommand,
+    WorkerQueueService,
+)
+from domains.platform.worker.wires import build_container
+from domains.product.site.infrastructure import SiteRepository
+from packages.core.db import dispose_async_engines, get_async_engine
+from packages.core.sql_fallback import evaluate_sql_backend
+from packages.worker import PeriodicWorker, PeriodicWorkerConfig
+from packages.worker.registry import WorkerRuntimeContext, register_worker
+
+_WORKER_NAME = "site.page_republish"
+_JOB_TYPE = "page_republish"
+
+
+def _env_float(env: Mapping[str, str], key: str, default: float) -> float:
+    try:
+        return float(env.get(key, default))
+    except (TypeError, ValueError):  # pragma: no cover - defensive
+        return default
+
+
+def _env_int(env: Mapping[str, str], key: str, default: int) -> int:
+    try:
+        return int(env.get(key, default))
+    except (TypeError, ValueError):  # pragma: no cover - defensive
+        return default
+
+
+class SitePageRepublishWorker(PeriodicWorker):
+    """Consume ``page_republish`` jobs enqueued when a shared block is published."""
+
+    def __init__(
+        self,
+        *,
+        context: WorkerRuntimeContext,
+        repository: SiteRepository,
+        queue: WorkerQueueService,
+        interval: float,
+        jitter: float,
+        batch_size: int,
+        lease_seconds: int,
+        wait_seconds: float,
+    ) -> None:
+        self._repository = repository
+        self._queue = queue
+        self._batch_size = batch_size
+        self._lease_seconds = lease_seconds
+        self._wait_seconds = wait_seconds
+        self._worker_id = f"{_WORKER_NAME}:{socket.gethostname()}:{os.getpid()}"
+
+        async def _tick() -> None:
+            await self.run_once()
+
+        config = PeriodicWorkerConfig(interval=interval, jitter=jitter, immediate=True)
+        super().__init__(_WORKER_NAME, _tick, config=config, logger=context.logger)
+
+    async def run_once(self) -> int:
+        jobs = await self._queue.lease(
+            worker_id=self._worker_id,
+            job_types=[_JOB_TYPE],
+            limit=self._batch_size,
+            lease_seconds=self._lease_seconds,
+            wait_seconds=self._wait_seconds,
+        )
+        done = 0
+        for job in jobs:
+            try:
+                page_id = UUID(str(job.input["page_id"]))
+                rewritten = await self._repository.materialize_page_snapshots(page_id)
+            except (KeyError, ValueError) as exc:
+                await self._queue.fail(
+                    JobFailureCommand(
+                        job_id=job.job_id,
+                        worker_id=self._worker_id,
+                        error="site_page_republish_invalid_input",
+                        retryable=False,
+                        details={"message": str(exc)},
+                    )
+                )
+                continue
+            except Exception as exc:
+                self.logger.warning(
+                    "site page republish failed job=%s", job.job_id, exc_info=exc
+                )
+                await self._queue.fail(
+                    JobFailureCommand(
+                        job_id=job.job_id,
+                        worker_id=self._worker_id,
+                        error="site_page_republish_failed",
+                        retryable=True,
+                        details={"message": str(exc)},
+                    )
+                )
+                continue
+            await self._queue.complete(
+                JobCompletionCommand(
+                    job_id=job.job_id,
+                    worker_id=self._worker_id,
+                    result={"page_id": str(page_id), "locales_rewritten": rewritten},
+                )
+            )
+            done += 1
+        if jobs:
+            self.logger.info("site page republish jobs=%s done=%s", len(jobs), done)
+        return done
+
+    async def shutdown(self) -> None:
+        await dispose_async_engines()
+        await super().shutdown()
+
+
+@register_worker(_WORKER_NAME)
+async def build_site_page_republish_worker(context: WorkerRuntimeContext):
+    env = dict(context.env)
+    interval = max(_env_float(env, "SITE_PAGE_REPUBLISH_INTERVAL", 1.0), 0.1)
+    jitter = min(_env_float(env, "SITE_PAGE_REPUBLISH_JITTER", 0.2), interval / 2)
+    batch_size = max(1, _env_int(env, "SITE_PAGE_REPUBLISH_BATCH_SIZE", 20))
+    lease_seconds = max(5, _env_int(env, "SITE_PAGE_REPUBLISH_LEASE_SECONDS", 60))
+    wait_seconds = max(0.0, _env_float(env, "SITE_PAGE_REPUBLISH_WAIT_SECONDS", 10.0))
+    decision = evaluate_sql_backend(context.settings)
+    if not decision.dsn:
+        raise RuntimeError(f"site page republish requires SQL: {decision.reason}")
+    engine = get_async_engine("site-editor", url=decision.dsn, future=True)
+
+    async def _engine_factory():
+        return engine
+
+    return SitePageRepublishWorker(
+        context=context,
+        repository=SiteRepository(_engine_factory),
+        queue=build_container(settings=context.settings).service,
+        interval=interval,
+        jitter=jitter,
+        batch_size=batch_size,
+        lease_seconds=lease_seconds,
+        wait_seconds=wait_seconds,
+    )
+
+
+__all__ = ["SitePageRepublishWorker", "build_site_page_republish_worker"]
@@ -60,7 +60,7 @@ class MemoryAdminRepo(AdminRepo):
                     total += int(items.get(slug, 0))
         return int(total)
 
-    def list_with_counters(
+    async def list_with_counters(
         self, q: str | None, limit: int, offset: int, content_type: str | None = None
     ) -> list[TagListItem]:
         items = list(self._tags.values())
@@ -88,7 +88,7 @@ class MemoryAdminRepo(AdminRepo):
             )
         return out
 
-    def list_groups(self) -> list[TagGroupSummary]:
+    async def list_groups(self) -> list[TagGroupSummary]:
         store = getattr(self._usage, "_cnt", {})  # type: ignore[attr-defined]
         totals: dict[str, dict[str, Any]] = {}
         for author_id, by_type in store.items():
@@ -112,7 +112,7 @@ class MemoryAdminRepo(AdminRepo):
         groups.sort(key=lambda g: g.usage_count, reverse=True)
         return groups
 
-    def list_aliases(self, tag_id: str) -> list[AliasView]:
+    async def list_aliases(self, tag_id: str) -> list[AliasView]:
         ids = self._aliases_by_tag.get(str(tag_id), [])
         out: list[AliasView] = []
         for aid in ids:
@@ -128,7 +128,7 @@ class MemoryAdminRepo(AdminRepo):
             )
         return out
 
-    def add_alias(self, tag_id: str, alias: str) -> AliasView:
+    async def add_alias(self, tag_id: str, alias: str) -> AliasView:
         if str(tag_id) not in self._tags:
             raise ValueError("tag_not_found")
         if alias in self._by_slug:
@@ -144,7 +144,7 @@ class MemoryAdminRepo(AdminRepo):
             created_at=a.created_at,
         )
 
-    def remove_alias(self, alias_id: str) -> None:
+    async def remove_alias(self, alias_id: str) -> None:
         a = self._aliases.pop(str(alias_id), None)
         if not a:
             return
@@ -152,7 +152,7 @@ class MemoryAdminRepo(AdminRepo):
         if lst and alias_id in lst:
             lst.remove(alias_id)
 
-    def blacklist_list(self, q: str | None) -> list[BlacklistItem]:
+    async def blacklist_list(self, q: str | None) -> list[BlacklistItem]:
         items = list(self._blacklist.items())
         if q:
             ql = q.lower()
@@ -162,16 +162,16 @@ class MemoryAdminRepo(AdminRepo):
             for (k, v) in items
         ]
 
-    def blacklist_add(self, slug: str, reason: str | None) -> BlacklistItem:
+    async def blacklist_add(self, slug: str, reason: str | None) -> BlacklistItem:
         self._blacklist[str(slug)] = reason
         return BlacklistItem(
             slug=str(slug), reason=reason, created_at=datetime.now(tz=UTC)
         )
 
-    def blacklist_delete(self, slug: str) -> None:
+    async def blacklist_delete(self, slug: str) -> None:
         self._blacklist.pop(str(slug), None)
 
-    def create_tag(self, slug: str, name: str) -> TagListItem:
+    async def create_tag(self, slug: str, name: str) -> TagListItem:
         if slug in self._by_slug:
             raise ValueError("conflict")
         tid = _uuid()
@@ -188,7 +188,7 @@ class MemoryAdminRepo(AdminRepo):
             aliases_count=0,
         )
 
-    def delete_tag(self, tag_id: str) -> None:
+    async def delete_tag(self, tag_id: str) -> None:
         t = self._tags.pop(str(tag_id), None)
         if not t:
             return
@@ -203,7 +203,7 @@ class MemoryAdminRepo(AdminRepo):
             for ctype in list(by_type.keys()):
                 by_type[ctype].pop(t.slug, None)
 
-    def merge_dry_run(
+    async def merge_dry_run(
         self, from_id: str, to_id: str, content_type: str | None = None
     ) -> dict:
         f = self._tags.get(str(from_id))
@@ -222,7 +222,7 @@ class MemoryAdminRepo(AdminRepo):
             "errors": [],
         }
 
-    def merge_apply(
+    async def merge_apply(
         self,
         from_id: str,
         to_id: str,
@@ -230,7 +230,7 @@ class MemoryAdminRepo(AdminRepo):
         reason: str | None,
         content_type: str | None = None,
     ) -> dict:
-        report = self.merge_dry_run(from_id, to_id, content_type)
+        report = await self.merge_dry_run(from_id, to_id, content_type)
         if report.get("errors"):
             return report
         f = self._tags.get(str(from_id))
@@ -261,5 +261,5 @@ class MemoryAdminRepo(AdminRepo):
             self._aliases_by_tag.setdefault(t.id, []).append(aid)
         self._aliases_by_tag.pop(f.id, None)
         # Delete old tag
-        self.delete_tag(f.id)
+        await self.delete_tag(f.id)
         return report
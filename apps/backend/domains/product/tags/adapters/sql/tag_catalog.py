@@ -9,7 +9,6 @@ from typing import Any
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine
-from sqlalchemy.pool import NullPool
 
 from packages.core.db import get_async_engine
 
@@ -41,11 +40,7 @@ class SQLTagCatalog:
             self._engine_factory = lambda: get_async_engine(
                 "tags.catalog",
                 url=dsn,
-                cache=False,
-                pool_pre_ping=False,
-                poolclass=NullPool,
             )
-        self._engine_lock = Lock()
         self._cache_ttl = max(float(cache_ttl), 0.0)
         self._lock = Lock()
         self._aliases: dict[str, str] = {}
@@ -154,10 +149,8 @@ class SQLTagCatalog:
         factory = self._engine_factory
         if factory is None:
             raise RuntimeError("tag catalog engine is not configured")
-        with self._engine_lock:
-            if self._engine is None:
-                self._engine = factory()
-            return self._engine
+        # Resolved per call: the registry keeps one shared pool per event loop.
+        return factory()
 
 
 __all__ = ["SQLTagCatalog"]
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from collections import Counter
+from collections.abc import Iterable
 from typing import Any
 
 from sqlalchemy import text
@@ -33,24 +34,28 @@ class SQLTagUsageWriter:
         )
 
     async def apply(self, payload: dict[str, Any]) -> None:
-        aid = str(payload.get("author_id") or "").strip()
-        if not aid:
+        await self.apply_many([payload])
+
+    async def apply_many(self, payloads: Iterable[dict[str, Any]]) -> None:
+        """Apply several usage payloads in one transaction.
+
+        Deltas are merged per (author, content type, slug) first, so a bulk
+        tag action touching thousands of nodes issues one batched statement
+        per direction instead of one transaction per node.
+        """
+        add_counts: Counter[tuple[str, str, str]] = Counter()
+        remove_counts: Counter[tuple[str, str, str]] = Counter()
+        for payload in payloads:
+            aid = str(payload.get("author_id") or "").strip()
+            if not aid:
+                continue
+            ctype = str(payload.get("content_type") or "node").strip() or "node"
+            for slug in _normalize_slugs(payload.get("added")):
+                add_counts[(aid, ctype, slug)] += 1
+            for slug in _normalize_slugs(payload.get("removed")):
+                remove_counts[(aid, ctype, slug)] += 1
+        if not add_counts and not remove_counts:
             return
-        ctype = str(payload.get("content_type") or "node").strip() or "node"
-        added = [
-            str(s).strip().lower()
-            for s in (payload.get("added") or [])
-            if str(s).strip()
-        ]
-        removed = [
-            str(s).strip().lower()
-            for s in (payload.get("removed") or [])
-            if str(s).strip()
-        ]
-        if not added and not removed:
-            return
-        add_counts = Counter(added)
-        remove_counts = Counter(removed)
         async with self._engine.begin() as conn:
             if add_counts:
                 sql_inc = text(
@@ -63,7 +68,7 @@ class SQLTagUsageWriter:
                 )
                 params = [
                     {"aid": aid, "ctype": ctype, "slug": slug, "delta": delta}
-                    for slug, delta in add_counts.items()
+                    for (aid, ctype, slug), delta in sorted(add_counts.items())
                 ]
                 await conn.execute(sql_inc, params)
             if remove_counts:
@@ -78,7 +83,7 @@ class SQLTagUsageWriter:
                 )
                 dec_params = [
                     {"aid": aid, "ctype": ctype, "slug": slug, "delta": delta}
-                    for slug, delta in remove_counts.items()
+                    for (aid, ctype, slug), delta in sorted(remove_counts.items())
                 ]
                 await conn.execute(sql_dec, dec_params)
                 sql_del = text(
@@ -90,12 +95,22 @@ class SQLTagUsageWriter:
                       AND count <= 0
                     """
                 )
+                removed_by_owner: dict[tuple[str, str], list[str]] = {}
+                for aid, ctype, slug in sorted(remove_counts):
+                    removed_by_owner.setdefault((aid, ctype), []).append(slug)
                 await conn.execute(
                     sql_del,
-                    {"aid": aid, "ctype": ctype, "slugs": list(remove_counts.keys())},
+                    [
+                        {"aid": aid, "ctype": ctype, "slugs": slugs}
+                        for (aid, ctype), slugs in removed_by_owner.items()
+                    ],
                 )
 
 
+def _normalize_slugs(values: Any) -> list[str]:
+    return [str(s).strip().lower() for s in (values or []) if str(s).strip()]
+
+
 def register_tags_usage_writer(
     events: Events, engine_or_dsn: AsyncEngine | str
 ) -> None:
@@ -114,9 +129,18 @@ def register_tags_usage_writer(
         logger.warning("Skipping tag usage writer registration: %s", exc)
         return
 
-    async def _on_node_tags_updated(_topic: str, payload: dict[str, Any]) -> None:
+    async def _on_node_tags_updated(topic: str, payload: dict[str, Any]) -> None:
         try:
-            await writer.apply(payload)
+            if topic.endswith(".batch.v1"):
+                # Batch envelopes carry the per-author deltas for all their nodes.
+                usage = payload.get("usage") or []
+                await writer.apply_many(
+                    {**item, "content_type": payload.get("content_type") or "node"}
+                    for item in usage
+                    if isinstance(item, dict)
+                )
+            else:
+                await writer.apply(payload)
         except SQLAlchemyError as exc:
             logger.warning("Failed to update tag usage counters: %s", exc)
         except (ValueError, KeyError, TypeError, RuntimeError) as exc:
@@ -143,6 +167,7 @@ def register_tags_usage_writer(
             asyncio.run(_on_node_tags_updated(topic, payload))
 
     events.on("node.tags.updated.v1", _schedule)
+    events.on("node.tags.updated.batch.v1", _schedule)
     events.on("quest.tags.updated.v1", _schedule)
 
 
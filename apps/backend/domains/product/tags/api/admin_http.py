@@ -33,12 +33,12 @@ def make_router() -> APIRouter:
         return service
 
     @router.get("/groups", summary="List tag content groups")
-    def list_groups(
+    async def list_groups(
         _: None = Depends(require_admin),
         container=Depends(get_container),
     ):
         svc = _svc(container)
-        groups = svc.list_groups()
+        groups = await svc.list_groups()
         return [
             {
                 "key": g.key,
@@ -50,7 +50,7 @@ def make_router() -> APIRouter:
         ]
 
     @router.get("/list", summary="List tags with usage")
-    def list_tags(
+    async def list_tags(
         q: str | None = Query(default=None),
         limit: int = Query(ge=1, le=1000, default=200),
         offset: int = Query(ge=0, default=0),
@@ -62,7 +62,7 @@ def make_router() -> APIRouter:
         ctype = (type_ or "all").lower()
         if ctype not in ("all", "node", "quest"):
             ctype = "all"
-        rows = svc.list_tags(q, limit, offset, content_type=ctype)
+        rows = await svc.list_tags(q, limit, offset, content_type=ctype)
         return [
             {
                 "id": r.id,
@@ -77,11 +77,11 @@ def make_router() -> APIRouter:
         ]
 
     @router.get("/{tag_id}/aliases", summary="List tag aliases")
-    def get_aliases(
+    async def get_aliases(
         tag_id: UUID, _: None = Depends(require_admin), container=Depends(get_container)
     ):
         svc = _svc(container)
-        items = svc.list_aliases(str(tag_id))
+        items = await svc.list_aliases(str(tag_id))
         return [
             {
                 "id": a.id,
@@ -97,7 +97,7 @@ def make_router() -> APIRouter:
         summary="Add tag alias",
         dependencies=(optional_rate_limiter(times=30, seconds=60)),
     )
-    def post_alias(
+    async def post_alias(
         tag_id: UUID,
         alias: str,
         request: Request,
@@ -107,7 +107,7 @@ def make_router() -> APIRouter:
     ):
         try:
             svc = _svc(container)
-            item = svc.add_alias(str(tag_id), alias)
+            item = await svc.add_alias(str(tag_id), alias)
             return {
                 "id": item.id,
                 "alias": item.alias,
@@ -118,13 +118,13 @@ def make_router() -> APIRouter:
             raise HTTPException(status_code=409, detail=str(e)) from e
 
     @router.get("/blacklist", summary="List blacklisted tags")
-    def get_blacklist(
+    async def get_blacklist(
         q: str | None = Query(default=None),
         _: None = Depends(require_admin),
         container=Depends(get_container),
     ):
         svc = _svc(container)
-        items = svc.blacklist_list(q)
+        items = await svc.blacklist_list(q)
         return [
             {"slug": i.slug, "reason": i.reason, "created_at": i.created_at}
             for i in items
@@ -135,7 +135,7 @@ def make_router() -> APIRouter:
         summary="Add tag to blacklist",
         dependencies=(optional_rate_limiter(times=30, seconds=60)),
     )
-    def add_blacklist(
+    async def add_blacklist(
         payload: dict,
         request: Request,
         _: None = Depends(require_admin),
@@ -147,7 +147,7 @@ def make_router() -> APIRouter:
         if not slug:
             raise HTTPException(status_code=400, detail="slug_required")
         svc = _svc(container)
-        item = svc.blacklist_add(slug, reason)
+        item = await svc.blacklist_add(slug, reason)
         return {"slug": item.slug, "reason": item.reason, "created_at": item.created_at}
 
     @router.delete(
@@ -155,7 +155,7 @@ def make_router() -> APIRouter:
         summary="Remove tag from blacklist",
         dependencies=(optional_rate_limiter(times=30, seconds=60)),
     )
-    def delete_blacklist(
+    async def delete_blacklist(
         slug: str,
         request: Request,
         _: None = Depends(require_admin),
@@ -163,7 +163,7 @@ def make_router() -> APIRouter:
         container=Depends(get_container),
     ):
         svc = _svc(container)
-        svc.blacklist_delete(slug)
+        await svc.blacklist_delete(slug)
         return {"ok": True}
 
     @router.post(
@@ -171,7 +171,7 @@ def make_router() -> APIRouter:
         summary="Create tag",
         dependencies=(optional_rate_limiter(times=20, seconds=60)),
     )
-    def create_tag(
+    async def create_tag(
         body: dict,
         request: Request,
         _: None = Depends(require_admin),
@@ -184,7 +184,7 @@ def make_router() -> APIRouter:
             raise HTTPException(status_code=400, detail="slug_and_name_required")
         try:
             svc = _svc(container)
-            t = svc.create_tag(slug, name)
+            t = await svc.create_tag(slug, name)
             return {
                 "id": t.id,
                 "slug": t.slug,
@@ -202,7 +202,7 @@ def make_router() -> APIRouter:
         summary="Delete tag",
         dependencies=(optional_rate_limiter(times=20, seconds=60)),
     )
-    def delete_tag(
+    async def delete_tag(
         tag_id: UUID,
         request: Request,
         _: None = Depends(require_admin),
@@ -210,7 +210,7 @@ def make_router() -> APIRouter:
         container=Depends(get_container),
     ):
         svc = _svc(container)
-        svc.delete_tag(str(tag_id))
+        await svc.delete_tag(str(tag_id))
         return {"ok": True}
 
     @router.post(
@@ -218,7 +218,7 @@ def make_router() -> APIRouter:
         summary="Merge tags (dry-run/apply)",
         dependencies=(optional_rate_limiter(times=10, seconds=60)),
     )
-    def merge_tags(
+    async def merge_tags(
         body: dict,
         request: Request,
         _: None = Depends(require_admin),
@@ -236,8 +236,8 @@ def make_router() -> APIRouter:
             raise HTTPException(status_code=400, detail="from_id_and_to_id_required")
         svc = _svc(container)
         if dry:
-            return svc.merge_dry_run(str(from_id), str(to_id), content_type=type_)
-        return svc.merge_apply(
+            return await svc.merge_dry_run(str(from_id), str(to_id), content_type=type_)
+        return await svc.merge_apply(
             str(from_id), str(to_id), None, reason, content_type=type_
         )
 
@@ -12,22 +12,22 @@ from domains.product.tags.domain.admin_models import (
 
 @runtime_checkable
 class AdminRepo(Protocol):
-    def list_with_counters(
+    async def list_with_counters(
         self, q: str | None, limit: int, offset: int, content_type: str | None = None
     ) -> list[TagListItem]: ...
-    def list_groups(self) -> list[TagGroupSummary]: ...
-    def list_aliases(self, tag_id: str) -> list[AliasView]: ...
-    def add_alias(self, tag_id: str, alias: str) -> AliasView: ...
-    def remove_alias(self, alias_id: str) -> None: ...
-    def blacklist_list(self, q: str | None) -> list[BlacklistItem]: ...
-    def blacklist_add(self, slug: str, reason: str | None) -> BlacklistItem: ...
-    def blacklist_delete(self, slug: str) -> None: ...
-    def create_tag(self, slug: str, name: str) -> TagListItem: ...
-    def delete_tag(self, tag_id: str) -> None: ...
-    def merge_dry_run(
+    async def list_groups(self) -> list[TagGroupSummary]: ...
+    async def list_aliases(self, tag_id: str) -> list[AliasView]: ...
+    async def add_alias(self, tag_id: str, alias: str) -> AliasView: ...
+    async def remove_alias(self, alias_id: str) -> None: ...
+    async def blacklist_list(self, q: str | None) -> list[BlacklistItem]: ...
+    async def blacklist_add(self, slug: str, reason: str | None) -> BlacklistItem: ...
+    async def blacklist_delete(self, slug: str) -> None: ...
+    async def create_tag(self, slug: str, name: str) -> TagListItem: ...
+    async def delete_tag(self, tag_id: str) -> None: ...
+    async def merge_dry_run(
         self, from_id: str, to_id: str, content_type: str | None = None
     ) -> dict: ...
-    def merge_apply(
+    async def merge_apply(
         self,
         from_id: str,
         to_id: str,
@@ -58,7 +58,7 @@ class TagAdminService:
             ) from exc
 
     # Queries
-    def list_tags(
+    async def list_tags(
         self, q: str | None, limit: int, offset: int, *, content_type: str | None = None
     ):
         limit = max(1, min(int(limit or 50), 1000))
@@ -66,55 +66,55 @@ class TagAdminService:
         if content_type not in (None, "node", "quest", "all"):
             content_type = None
         ctype = None if content_type in (None, "all") else content_type
-        return self.repo.list_with_counters(q, limit, offset, ctype)
+        return await self.repo.list_with_counters(q, limit, offset, ctype)
 
-    def list_groups(self) -> list[TagGroupSummary]:
-        return self.repo.list_groups()
+    async def list_groups(self) -> list[TagGroupSummary]:
+        return await self.repo.list_groups()
 
-    def list_aliases(self, tag_id: str):
-        return self.repo.list_aliases(tag_id)
+    async def list_aliases(self, tag_id: str):
+        return await self.repo.list_aliases(tag_id)
 
     # Mutations
-    def add_alias(self, tag_id: str, alias: str):
-        res = self.repo.add_alias(tag_id, _norm_alias(alias))
+    async def add_alias(self, tag_id: str, alias: str):
+        res = await self.repo.add_alias(tag_id, _norm_alias(alias))
         self._publish("tag.alias.added.v1", {"tag_id": tag_id, "alias": res.alias})
         return res
 
-    def remove_alias(self, alias_id: str) -> None:
-        self.repo.remove_alias(alias_id)
+    async def remove_alias(self, alias_id: str) -> None:
+        await self.repo.remove_alias(alias_id)
         self._publish("tag.alias.removed.v1", {"alias_id": alias_id})
 
-    def blacklist_list(self, q: str | None):
-        return self.repo.blacklist_list(q)
+    async def blacklist_list(self, q: str | None):
+        return await self.repo.blacklist_list(q)
 
-    def blacklist_add(self, slug: str, reason: str | None):
-        res = self.repo.blacklist_add(_norm_slug(slug), reason)
+    async def blacklist_add(self, slug: str, reason: str | None):
+        res = await self.repo.blacklist_add(_norm_slug(slug), reason)
         self._publish(
             "tag.blacklist.added.v1", {"slug": res.slug, "reason": res.reason}
         )
         return res
 
-    def blacklist_delete(self, slug: str) -> None:
-        self.repo.blacklist_delete(_norm_slug(slug))
+    async def blacklist_delete(self, slug: str) -> None:
+        await self.repo.blacklist_delete(_norm_slug(slug))
         self._publish("tag.blacklist.removed.v1", {"slug": _norm_slug(slug)})
 
-    def create_tag(self, slug: str, name: str):
-        res = self.repo.create_tag(_norm_slug(slug), _norm_name(name))
+    async def create_tag(self, slug: str, name: str):
+        res = await self.repo.create_tag(_norm_slug(slug), _norm_name(name))
         self._publish(
             "tag.created.v1", {"id": res.id, "slug": res.slug, "name": res.name}
         )
         return res
 
-    def delete_tag(self, tag_id: str) -> None:
-        self.repo.delete_tag(tag_id)
+    async def delete_tag(self, tag_id: str) -> None:
+        await self.repo.delete_tag(tag_id)
         self._publish("tag.deleted.v1", {"id": tag_id})
 
-    def merge_dry_run(
+    async def merge_dry_run(
         self, from_id: str, to_id: str, *, content_type: str | None = None
     ) -> dict:
-        return self.repo.merge_dry_run(from_id, to_id, content_type)
+        return await self.repo.merge_dry_run(from_id, to_id, content_type)
 
-    def merge_apply(
+    async def merge_apply(
         self,
         from_id: str,
         to_id: str,
@@ -123,7 +123,7 @@ class TagAdminService:
         *,
         content_type: str | None = None,
     ) -> dict:
-        report = self.repo.merge_apply(from_id, to_id, actor_id, reason, content_type)
+        report = await self.repo.merge_apply(from_id, to_id, actor_id, reason, content_type)
         self._publish(
             "tag.merged.v1",
             {
@@ -21,13 +21,13 @@ class MemoryRepo(Repo):
         self._chars_by_world: dict[str, set[str]] = {}
 
     # Worlds
-    def list_worlds(self) -> list[WorldTemplate]:
+    async def list_worlds(self) -> list[WorldTemplate]:
         return list(self._worlds.values())
 
-    def get_world(self, world_id: str) -> WorldTemplate | None:
+    async def get_world(self, world_id: str) -> WorldTemplate | None:
         return self._worlds.get(world_id)
 
-    def create_world(self, data: dict, actor_id: str) -> WorldTemplate:
+    async def create_world(self, data: dict, actor_id: str) -> WorldTemplate:
         wid = _uuid()
         world = WorldTemplate(
             id=wid,
@@ -41,7 +41,7 @@ class MemoryRepo(Repo):
         self._worlds[wid] = world
         return world
 
-    def update_world(
+    async def update_world(
         self, world: WorldTemplate, data: dict, actor_id: str
     ) -> WorldTemplate:
         if "title" in data and data["title"] is not None:
@@ -56,23 +56,23 @@ class MemoryRepo(Repo):
         world.updated_at = datetime.now(tz=UTC)
         return world
 
-    def delete_world(self, world: WorldTemplate) -> None:
+    async def delete_world(self, world: WorldTemplate) -> None:
         self._worlds.pop(world.id, None)
         for cid in list(self._chars_by_world.get(world.id, set())):
             self._chars.pop(cid, None)
         self._chars_by_world.pop(world.id, None)
 
     # Characters
-    def list_characters(self, world_id: str) -> list[Character]:
+    async def list_characters(self, world_id: str) -> list[Character]:
         if world_id not in self._worlds:
             return []
         ids = list(self._chars_by_world.get(world_id, set()))
         return [self._chars[i] for i in ids]
 
-    def get_character(self, char_id: str) -> Character | None:
+    async def get_character(self, char_id: str) -> Character | None:
         return self._chars.get(char_id)
 
-    def create_character(self, world_id: str, data: dict, actor_id: str) -> Character:
+    async def create_character(self, world_id: str, data: dict, actor_id: str) -> Character:
         if world_id not in self._worlds:
             raise ValueError("world_not_found")
         cid = _uuid()
@@ -90,7 +90,7 @@ class MemoryRepo(Repo):
         self._chars_by_world.setdefault(world_id, set()).add(cid)
         return ch
 
-    def update_character(self, ch: Character, data: dict, actor_id: str) -> Character:
+    async def update_character(self, ch: Character, data: dict, actor_id: str) -> Character:
         if ch.world_id not in self._worlds:
             return ch
         if "name" in data and data["name"] is not None:
@@ -106,7 +106,7 @@ class MemoryRepo(Repo):
         ch.updated_at = datetime.now(tz=UTC)
         return ch
 
-    def delete_character(self, ch: Character) -> None:
+    async def delete_character(self, ch: Character) -> None:
         self._chars.pop(ch.id, None)
         ids = self._chars_by_world.get(ch.world_id)
         if ids and ch.id in ids:
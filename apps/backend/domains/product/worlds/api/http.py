@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from uuid import UUID
 
-import anyio
 from fastapi import APIRouter, Depends, HTTPException
 
 from apps.backend.app.api_gateway.routers import get_container
@@ -31,7 +30,7 @@ def make_router() -> APIRouter:
         _: None = Depends(admin_required),
         container=Depends(get_container),
     ):
-        items = await anyio.to_thread.run_sync(container.worlds_service.list_worlds)
+        items = await container.worlds_service.list_worlds()
         return [
             WorldTemplateOut(
                 id=UUID(w.id),
@@ -59,9 +58,7 @@ def make_router() -> APIRouter:
         _: None = Depends(admin_required),
         container=Depends(get_container),
     ):
-        w = await anyio.to_thread.run_sync(
-            container.worlds_service.get_world, str(world_id)
-        )
+        w = await container.worlds_service.get_world(str(world_id))
         if not w:
             raise HTTPException(status_code=404, detail="not_found")
         return WorldTemplateOut(
@@ -89,8 +86,7 @@ def make_router() -> APIRouter:
         container=Depends(get_container),
     ):
         actor = str(claims.get("sub") or "")
-        w = await anyio.to_thread.run_sync(
-            container.worlds_service.create_world,
+        w = await container.worlds_service.create_world(
             payload.model_dump(exclude_none=True),
             actor,
         )
@@ -122,8 +118,7 @@ def make_router() -> APIRouter:
         container=Depends(get_container),
     ):
         actor = str(claims.get("sub") or "")
-        out = await anyio.to_thread.run_sync(
-            container.worlds_service.update_world,
+        out = await container.worlds_service.update_world(
             str(world_id),
             payload.model_dump(exclude_none=True),
             actor,
@@ -153,9 +148,7 @@ def make_router() -> APIRouter:
         _csrf: None = Depends(csrf_protect),
         container=Depends(get_container),
     ):
-        ok = await anyio.to_thread.run_sync(
-            container.worlds_service.delete_world, str(world_id)
-        )
+        ok = await container.worlds_service.delete_world(str(world_id))
         if not ok:
             raise HTTPException(status_code=404, detail="not_found")
         return {"status": "ok"}
@@ -168,9 +161,7 @@ def make_router() -> APIRouter:
         _: None = Depends(admin_required),
         container=Depends(get_container),
     ):
-        ch = await anyio.to_thread.run_sync(
-            container.worlds_service.get_character, str(char_id)
-        )
+        ch = await container.worlds_service.get_character(str(char_id))
         if not ch:
             raise HTTPException(status_code=404, detail="not_found")
         return CharacterOut(
@@ -200,10 +191,7 @@ def make_router() -> APIRouter:
         _: None = Depends(admin_required),
         container=Depends(get_container),
     ):
-        chs = await anyio.to_thread.run_sync(
-            container.worlds_service.list_characters,
-            str(world_id),
-        )
+        chs = await container.worlds_service.list_characters(str(world_id))
         return [
             CharacterOut(
                 id=UUID(c.id),
@@ -238,8 +226,7 @@ def make_router() -> APIRouter:
         container=Depends(get_container),
     ):
         actor = str(claims.get("sub") or "")
-        ch = await anyio.to_thread.run_sync(
-            container.worlds_service.create_character,
+        ch = await container.worlds_service.create_character(
             str(world_id),
             payload.model_dump(exclude_none=True),
             actor,
@@ -277,8 +264,7 @@ def make_router() -> APIRouter:
         container=Depends(get_container),
     ):
         actor = str(claims.get("sub") or "")
-        ch = await anyio.to_thread.run_sync(
-            container.worlds_service.update_character,
+        ch = await container.worlds_service.update_character(
             str(char_id),
             payload.model_dump(exclude_none=True),
             actor,
@@ -309,10 +295,7 @@ def make_router() -> APIRouter:
         _csrf: None = Depends(csrf_protect),
         container=Depends(get_container),
     ):
-        ok = await anyio.to_thread.run_sync(
-            container.worlds_service.delete_character,
-            str(char_id),
-        )
+        ok = await container.worlds_service.delete_character(str(char_id))
         if not ok:
             raise HTTPException(status_code=404, detail="not_found")
         return {"status": "ok"}
@@ -43,48 +43,48 @@ class WorldsService:
             )
             raise OutboxError("worlds_outbox_publish_unexpected", topic=topic) from exc
 
-    def list_worlds(self) -> list[WorldTemplate]:
-        return self.repo.list_worlds()
+    async def list_worlds(self) -> list[WorldTemplate]:
+        return await self.repo.list_worlds()
 
-    def get_world(self, world_id: str) -> WorldTemplate | None:
-        return self.repo.get_world(world_id)
+    async def get_world(self, world_id: str) -> WorldTemplate | None:
+        return await self.repo.get_world(world_id)
 
-    def create_world(self, data: dict[str, Any], actor_id: str) -> WorldTemplate:
-        world = self.repo.create_world(data, actor_id)
+    async def create_world(self, data: dict[str, Any], actor_id: str) -> WorldTemplate:
+        world = await self.repo.create_world(data, actor_id)
         self._safe_publish(
             "world.created.v1",
             {"id": world.id, "actor_id": actor_id},
         )
         return world
 
-    def update_world(
+    async def update_world(
         self, world_id: str, data: dict[str, Any], actor_id: str
     ) -> WorldTemplate | None:
-        world = self.repo.get_world(world_id)
+        world = await self.repo.get_world(world_id)
         if not world:
             return None
-        updated = self.repo.update_world(world, data, actor_id)
+        updated = await self.repo.update_world(world, data, actor_id)
         self._safe_publish(
             "world.updated.v1",
             {"id": updated.id, "actor_id": actor_id},
         )
         return updated
 
-    def delete_world(self, world_id: str) -> bool:
-        world = self.repo.get_world(world_id)
+    async def delete_world(self, world_id: str) -> bool:
+        world = await self.repo.get_world(world_id)
         if not world:
             return False
-        self.repo.delete_world(world)
+        await self.repo.delete_world(world)
         self._safe_publish("world.deleted.v1", {"id": world.id})
         return True
 
-    def list_characters(self, world_id: str) -> list[Character]:
-        return self.repo.list_characters(world_id)
+    async def list_characters(self, world_id: str) -> list[Character]:
+        return await self.repo.list_characters(world_id)
 
-    def create_character(
+    async def create_character(
         self, world_id: str, data: dict[str, Any], actor_id: str
     ) -> Character | None:
-        character = self.repo.create_character(world_id, data, actor_id)
+        character = await self.repo.create_character(world_id, data, actor_id)
         if character:
             self._safe_publish(
                 "world.character.created.v1",
@@ -96,13 +96,13 @@ class WorldsService:
             )
         return character
 
-    def update_character(
+    async def update_character(
         self, char_id: str, data: dict[str, Any], actor_id: str
     ) -> Character | None:
-        character = self.repo.get_character(char_id)
+        character = await self.repo.get_character(char_id)
         if not character:
             return None
-        updated = self.repo.update_character(character, data, actor_id)
+        updated = await self.repo.update_character(character, data, actor_id)
         if updated:
             self._safe_publish(
                 "world.character.updated.v1",
@@ -110,16 +110,16 @@ class WorldsService:
             )
         return updated
 
-    def delete_character(self, char_id: str) -> bool:
-        character = self.repo.get_character(char_id)
+    async def delete_character(self, char_id: str) -> bool:
+        character = await self.repo.get_character(char_id)
         if not character:
             return False
-        self.repo.delete_character(character)
+        await self.repo.delete_character(character)
         self._safe_publish(
             "world.character.deleted.v1",
             {"id": character.id, "world_id": character.world_id},
         )
         return True
 
-    def get_character(self, char_id: str) -> Character | None:
-        return self.repo.get_character(char_id)
+    async def get_character(self, char_id: str) -> Character | None:
+        return await self.repo.get_character(char_id)
@@ -37,6 +37,12 @@ PUBLIC_RATE_LIMITS: Mapping[str, RateLimitSpec] = {
     "content": RateLimitSpec(
         key="content", times=20, seconds=60, description="Public content queries"
     ),
+    "site_events": RateLimitSpec(
+        key="site_events",
+        times=120,
+        seconds=60,
+        description="Site analytics beacons",
+    ),
 }
 
 
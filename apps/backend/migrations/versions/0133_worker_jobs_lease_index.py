@@ -0,0 +1,32 @@
+"""Index expired worker job leases for the lease reaper.
+
+Revision ID: 0133_worker_jobs_lease_index
+Revises: 0132_site_block_template_flags
+Create Date: 2026-01-12
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0133_worker_jobs_lease_index"
+down_revision = "0132_site_block_template_flags"
+branch_labels = None
+depends_on = None
+
+
+_CREATE_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS ix_worker_jobs_leased_until ON worker_jobs (lease_until) WHERE status = 'leased'",
+)
+
+_DROP_INDEXES = ("DROP INDEX IF EXISTS ix_worker_jobs_leased_until",)
+
+
+def upgrade() -> None:
+    for statement in _CREATE_INDEXES:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    for statement in _DROP_INDEXES:
+        op.execute(statement)
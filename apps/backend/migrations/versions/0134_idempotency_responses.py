@@ -0,0 +1,57 @@
+"""Store idempotent responses and expiry on idempotency keys.
+
+Revision ID: 0134_idempotency_responses
+Revises: 0133_worker_jobs_lease_index
+Create Date: 2026-01-19
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0134_idempotency_responses"
+down_revision = "0133_worker_jobs_lease_index"
+branch_labels = None
+depends_on = None
+
+
+_UPGRADE_STATEMENTS = (
+    """
+    CREATE TABLE IF NOT EXISTS idempotency_keys (
+        key text PRIMARY KEY,
+        locked boolean NOT NULL DEFAULT true,
+        created_at timestamptz NOT NULL DEFAULT now()
+    )
+    """,
+    "ALTER TABLE idempotency_keys ADD COLUMN IF NOT EXISTS fingerprint text",
+    "ALTER TABLE idempotency_keys ADD COLUMN IF NOT EXISTS locked_until timestamptz",
+    "ALTER TABLE idempotency_keys ADD COLUMN IF NOT EXISTS status_code integer",
+    "ALTER TABLE idempotency_keys ADD COLUMN IF NOT EXISTS response_headers jsonb",
+    "ALTER TABLE idempotency_keys ADD COLUMN IF NOT EXISTS response_body bytea",
+    "ALTER TABLE idempotency_keys ADD COLUMN IF NOT EXISTS completed_at timestamptz",
+    "ALTER TABLE idempotency_keys ADD COLUMN IF NOT EXISTS expires_at timestamptz",
+    "CREATE INDEX IF NOT EXISTS ix_idempotency_keys_expires_at ON idempotency_keys (expires_at)",
+    "CREATE INDEX IF NOT EXISTS ix_idempotency_keys_legacy_created_at ON idempotency_keys (created_at) WHERE expires_at IS NULL",
+)
+
+_DOWNGRADE_STATEMENTS = (
+    "DROP INDEX IF EXISTS ix_idempotency_keys_legacy_created_at",
+    "DROP INDEX IF EXISTS ix_idempotency_keys_expires_at",
+    "ALTER TABLE idempotency_keys DROP COLUMN IF EXISTS expires_at",
+    "ALTER TABLE idempotency_keys DROP COLUMN IF EXISTS completed_at",
+    "ALTER TABLE idempotency_keys DROP COLUMN IF EXISTS response_body",
+    "ALTER TABLE idempotency_keys DROP COLUMN IF EXISTS response_headers",
+    "ALTER TABLE idempotency_keys DROP COLUMN IF EXISTS status_code",
+    "ALTER TABLE idempotency_keys DROP COLUMN IF EXISTS locked_until",
+    "ALTER TABLE idempotency_keys DROP COLUMN IF EXISTS fingerprint",
+)
+
+
+def upgrade() -> None:
+    for statement in _UPGRADE_STATEMENTS:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    for statement in _DOWNGRADE_STATEMENTS:
+        op.execute(statement)
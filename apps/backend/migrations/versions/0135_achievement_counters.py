@@ -0,0 +1,45 @@
+"""Per-user counters for the achievements rule engine.
+
+Revision ID: 0135_achievement_counters
+Revises: 0134_idempotency_responses
+Create Date: 2026-01-26
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0135_achievement_counters"
+down_revision = "0134_idempotency_responses"
+branch_labels = None
+depends_on = None
+
+
+_UPGRADE_STATEMENTS = (
+    """
+    CREATE TABLE IF NOT EXISTS product_achievement_counters (
+        user_id uuid NOT NULL,
+        counter text NOT NULL,
+        bucket integer NOT NULL DEFAULT 0,
+        value double precision NOT NULL DEFAULT 0,
+        updated_at timestamptz NOT NULL DEFAULT now(),
+        PRIMARY KEY (user_id, counter, bucket)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_product_achievement_counters_counter ON product_achievement_counters (counter)",
+)
+
+_DOWNGRADE_STATEMENTS = (
+    "DROP INDEX IF EXISTS ix_product_achievement_counters_counter",
+    "DROP TABLE IF EXISTS product_achievement_counters",
+)
+
+
+def upgrade() -> None:
+    for statement in _UPGRADE_STATEMENTS:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    for statement in _DOWNGRADE_STATEMENTS:
+        op.execute(statement)
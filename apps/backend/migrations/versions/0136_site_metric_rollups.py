@@ -0,0 +1,85 @@
+"""Hourly buckets, rollup state and watermarks for site metrics.
+
+Revision ID: 0136_site_metric_rollups
+Revises: 0135_achievement_counters
+Create Date: 2026-01-27
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0136_site_metric_rollups"
+down_revision = "0135_achievement_counters"
+branch_labels = None
+depends_on = None
+
+
+_UPGRADE_STATEMENTS = (
+    """
+    CREATE TABLE IF NOT EXISTS site_metric_hourly (
+        id bigserial PRIMARY KEY,
+        entity_type text NOT NULL,
+        entity_id uuid NOT NULL,
+        page_id uuid,
+        locale text NOT NULL,
+        hour_start timestamptz NOT NULL,
+        views bigint NOT NULL DEFAULT 0,
+        clicks bigint NOT NULL DEFAULT 0,
+        conversions bigint NOT NULL DEFAULT 0,
+        revenue numeric(14, 4) NOT NULL DEFAULT 0,
+        time_on_page_ms bigint NOT NULL DEFAULT 0,
+        time_samples bigint NOT NULL DEFAULT 0,
+        bounces bigint NOT NULL DEFAULT 0,
+        mobile_views bigint NOT NULL DEFAULT 0,
+        visitors bytea,
+        created_at timestamptz NOT NULL DEFAULT now()
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_site_metric_hourly_hour_start ON site_metric_hourly (hour_start)",
+    """
+    CREATE TABLE IF NOT EXISTS site_metric_rollups (
+        entity_type text NOT NULL,
+        entity_id uuid NOT NULL,
+        period text NOT NULL,
+        locale text NOT NULL,
+        range_start timestamptz NOT NULL,
+        views bigint NOT NULL DEFAULT 0,
+        clicks bigint NOT NULL DEFAULT 0,
+        conversions bigint NOT NULL DEFAULT 0,
+        revenue numeric(14, 4) NOT NULL DEFAULT 0,
+        time_on_page_ms bigint NOT NULL DEFAULT 0,
+        time_samples bigint NOT NULL DEFAULT 0,
+        bounces bigint NOT NULL DEFAULT 0,
+        mobile_views bigint NOT NULL DEFAULT 0,
+        visitors bytea,
+        pages jsonb,
+        updated_at timestamptz NOT NULL DEFAULT now(),
+        PRIMARY KEY (entity_type, entity_id, period, locale, range_start)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS site_metric_watermarks (
+        name text PRIMARY KEY,
+        last_id bigint NOT NULL DEFAULT 0,
+        updated_at timestamptz NOT NULL DEFAULT now()
+    )
+    """,
+)
+
+_DOWNGRADE_STATEMENTS = (
+    "DROP TABLE IF EXISTS site_metric_watermarks",
+    "DROP TABLE IF EXISTS site_metric_rollups",
+    "DROP INDEX IF EXISTS ix_site_metric_hourly_hour_start",
+    "DROP TABLE IF EXISTS site_metric_hourly",
+)
+
+
+def upgrade() -> None:
+    for statement in _UPGRADE_STATEMENTS:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    for statement in _DOWNGRADE_STATEMENTS:
+        op.execute(statement)
@@ -0,0 +1,44 @@
+"""Per-locale render snapshots of published site pages.
+
+Revision ID: 0137_site_page_snapshots
+Revises: 0136_site_metric_rollups
+Create Date: 2026-01-29
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0137_site_page_snapshots"
+down_revision = "0136_site_metric_rollups"
+branch_labels = None
+depends_on = None
+
+
+_UPGRADE_STATEMENTS = (
+    """
+    CREATE TABLE IF NOT EXISTS site_page_snapshots (
+        page_id uuid NOT NULL,
+        locale text NOT NULL,
+        version bigint NOT NULL,
+        content_hash text NOT NULL,
+        document jsonb NOT NULL,
+        rendered_at timestamptz NOT NULL DEFAULT now(),
+        CONSTRAINT pk_site_page_snapshots PRIMARY KEY (page_id, locale),
+        CONSTRAINT fk_site_page_snapshots_page FOREIGN KEY (page_id)
+            REFERENCES site_pages (id) ON DELETE CASCADE
+    )
+    """,
+)
+
+_DOWNGRADE_STATEMENTS = ("DROP TABLE IF EXISTS site_page_snapshots",)
+
+
+def upgrade() -> None:
+    for statement in _UPGRADE_STATEMENTS:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    for statement in _DOWNGRADE_STATEMENTS:
+        op.execute(statement)
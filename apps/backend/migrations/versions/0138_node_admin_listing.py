@@ -0,0 +1,114 @@
+"""Admin node listing: per-node comment stats, keyset and trigram indexes.
+
+Revision ID: 0138_node_admin_listing
+Revises: 0137_site_page_snapshots
+Create Date: 2026-02-02
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0138_node_admin_listing"
+down_revision = "0137_site_page_snapshots"
+branch_labels = None
+depends_on = None
+
+
+def _ensure_pg_trgm_extension() -> bool:
+    try:
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    except Exception:
+        # Extension creation may fail in restricted environments; search then
+        # falls back to sequential ILIKE scans.
+        return False
+    return True
+
+
+_UPGRADE_STATEMENTS = (
+    """
+    CREATE TABLE IF NOT EXISTS node_admin_stats (
+        node_id bigint PRIMARY KEY REFERENCES nodes (id) ON DELETE CASCADE,
+        total_comments bigint NOT NULL DEFAULT 0,
+        pending_count bigint NOT NULL DEFAULT 0,
+        published_count bigint NOT NULL DEFAULT 0,
+        hidden_count bigint NOT NULL DEFAULT 0,
+        deleted_count bigint NOT NULL DEFAULT 0,
+        blocked_count bigint NOT NULL DEFAULT 0,
+        bans_count bigint NOT NULL DEFAULT 0,
+        last_comment_created_at timestamptz NULL,
+        last_comment_updated_at timestamptz NULL,
+        refreshed_at timestamptz NOT NULL DEFAULT now()
+    )
+    """,
+    """
+    INSERT INTO node_admin_stats (
+        node_id, total_comments, pending_count, published_count, hidden_count,
+        deleted_count, blocked_count, bans_count,
+        last_comment_created_at, last_comment_updated_at
+    )
+    SELECT n.id,
+           COALESCE(c.total_comments, 0),
+           COALESCE(c.pending_count, 0),
+           COALESCE(c.published_count, 0),
+           COALESCE(c.hidden_count, 0),
+           COALESCE(c.deleted_count, 0),
+           COALESCE(c.blocked_count, 0),
+           COALESCE(b.bans_count, 0),
+           c.last_comment_created_at,
+           c.last_comment_updated_at
+      FROM nodes AS n
+      LEFT JOIN (
+          SELECT node_id,
+                 COUNT(*) AS total_comments,
+                 COUNT(*) FILTER (WHERE status = 'pending') AS pending_count,
+                 COUNT(*) FILTER (WHERE status = 'published') AS published_count,
+                 COUNT(*) FILTER (WHERE status = 'hidden') AS hidden_count,
+                 COUNT(*) FILTER (WHERE status = 'deleted') AS deleted_count,
+                 COUNT(*) FILTER (WHERE status = 'blocked') AS blocked_count,
+                 MAX(created_at) AS last_comment_created_at,
+                 MAX(updated_at) AS last_comment_updated_at
+            FROM node_comments
+           GROUP BY node_id
+      ) AS c ON c.node_id = n.id
+      LEFT JOIN (
+          SELECT node_id, COUNT(*) AS bans_count
+            FROM node_comment_bans
+           GROUP BY node_id
+      ) AS b ON b.node_id = n.id
+    ON CONFLICT (node_id) DO NOTHING
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_node_admin_stats_comments ON node_admin_stats (total_comments, node_id)",
+    # Keyset paging on (sort key, id); btree scans backwards for DESC.
+    "CREATE INDEX IF NOT EXISTS ix_nodes_updated_at_id ON nodes (updated_at, id)",
+    "CREATE INDEX IF NOT EXISTS ix_nodes_created_at_id ON nodes (created_at, id)",
+    "CREATE INDEX IF NOT EXISTS ix_nodes_views_count_id ON nodes (views_count, id)",
+)
+
+_TRIGRAM_STATEMENTS = (
+    "CREATE INDEX IF NOT EXISTS ix_nodes_title_trgm ON nodes USING gin (title gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_nodes_slug_trgm ON nodes USING gin (slug gin_trgm_ops)",
+)
+
+_DOWNGRADE_STATEMENTS = (
+    "DROP INDEX IF EXISTS ix_nodes_slug_trgm",
+    "DROP INDEX IF EXISTS ix_nodes_title_trgm",
+    "DROP INDEX IF EXISTS ix_nodes_views_count_id",
+    "DROP INDEX IF EXISTS ix_nodes_created_at_id",
+    "DROP INDEX IF EXISTS ix_nodes_updated_at_id",
+    "DROP INDEX IF EXISTS ix_node_admin_stats_comments",
+    "DROP TABLE IF EXISTS node_admin_stats",
+)
+
+
+def upgrade() -> None:
+    for statement in _UPGRADE_STATEMENTS:
+        op.execute(statement)
+    if _ensure_pg_trgm_extension():
+        for statement in _TRIGRAM_STATEMENTS:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    for statement in _DOWNGRADE_STATEMENTS:
+        op.execute(statement)
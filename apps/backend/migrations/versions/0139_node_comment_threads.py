@@ -0,0 +1,106 @@
+"""Threaded node comments: materialized paths and incremental reply counts.
+
+Revision ID: 0139_node_comment_threads
+Revises: 0138_node_admin_listing
+Create Date: 2026-02-09
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0139_node_comment_threads"
+down_revision = "0138_node_admin_listing"
+branch_labels = None
+depends_on = None
+
+# Path segments are comment ids zero-padded to 19 digits (any bigint), joined
+# by '.'. With the "C" collation a plain btree on (node_id, path) yields
+# depth-first thread order and every subtree is the range (path || '.',
+# path || '/').
+_UPGRADE_STATEMENTS = (
+    'ALTER TABLE node_comments ADD COLUMN IF NOT EXISTS path text COLLATE "C"',
+    "ALTER TABLE node_comments ADD COLUMN IF NOT EXISTS reply_count integer NOT NULL DEFAULT 0",
+    "ALTER TABLE node_comments ADD COLUMN IF NOT EXISTS descendant_count integer NOT NULL DEFAULT 0",
+    """
+    WITH RECURSIVE tree AS (
+        SELECT id, lpad(id::text, 19, '0') AS path
+          FROM node_comments
+         WHERE parent_comment_id IS NULL
+        UNION ALL
+        SELECT c.id, t.path || '.' || lpad(c.id::text, 19, '0')
+          FROM node_comments AS c
+          JOIN tree AS t ON c.parent_comment_id = t.id
+    )
+    UPDATE node_comments AS nc
+       SET path = tree.path
+      FROM tree
+     WHERE nc.id = tree.id
+    """,
+    "ALTER TABLE node_comments ALTER COLUMN path SET NOT NULL",
+    """
+    UPDATE node_comments AS p
+       SET reply_count = s.replies
+      FROM (
+          SELECT parent_comment_id, COUNT(*) AS replies
+            FROM node_comments
+           WHERE parent_comment_id IS NOT NULL
+             AND status NOT IN ('deleted', 'hidden', 'blocked')
+           GROUP BY parent_comment_id
+      ) AS s
+     WHERE p.id = s.parent_comment_id
+    """,
+    """
+    UPDATE node_comments AS a
+       SET descendant_count = s.descendants
+      FROM (
+          SELECT a.id, COUNT(*) AS descendants
+            FROM node_comments AS a
+            JOIN node_comments AS d
+              ON d.node_id = a.node_id
+             AND d.path > a.path || '.'
+             AND d.path < a.path || '/'
+           WHERE d.status NOT IN ('deleted', 'hidden', 'blocked')
+           GROUP BY a.id
+      ) AS s
+     WHERE a.id = s.id
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_node_comments_node_path ON node_comments (node_id, path)",
+    """
+    CREATE TABLE IF NOT EXISTS node_comment_counters (
+        node_id bigint PRIMARY KEY REFERENCES nodes (id) ON DELETE CASCADE,
+        comments_count bigint NOT NULL DEFAULT 0,
+        threads_count bigint NOT NULL DEFAULT 0,
+        updated_at timestamptz NOT NULL DEFAULT now()
+    )
+    """,
+    """
+    INSERT INTO node_comment_counters (node_id, comments_count, threads_count)
+    SELECT c.node_id,
+           COUNT(*),
+           COUNT(*) FILTER (WHERE c.parent_comment_id IS NULL)
+      FROM node_comments AS c
+      JOIN nodes AS n ON n.id = c.node_id
+     WHERE c.status NOT IN ('deleted', 'hidden', 'blocked')
+     GROUP BY c.node_id
+    ON CONFLICT (node_id) DO NOTHING
+    """,
+)
+
+_DOWNGRADE_STATEMENTS = (
+    "DROP TABLE IF EXISTS node_comment_counters",
+    "DROP INDEX IF EXISTS ix_node_comments_node_path",
+    "ALTER TABLE node_comments DROP COLUMN IF EXISTS descendant_count",
+    "ALTER TABLE node_comments DROP COLUMN IF EXISTS reply_count",
+    "ALTER TABLE node_comments DROP COLUMN IF EXISTS path",
+)
+
+
+def upgrade() -> None:
+    for statement in _UPGRADE_STATEMENTS:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    for statement in _DOWNGRADE_STATEMENTS:
+        op.execute(statement)
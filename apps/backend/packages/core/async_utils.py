@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import inspect
 import threading
 from collections.abc import Coroutine
 from concurrent.futures import Future
@@ -108,4 +110,35 @@ def submit_async(
     asyncio.run_coroutine_threadsafe(coro, target_loop)
 
 
-__all__ = ["run_sync", "submit_async"]
+class BlockingProxy:
+    """Synchronous facade over an async repository or service (scripts, REPL).
+
+    Coroutine functions of the wrapped object are executed through
+    :func:`run_sync`; other attributes are returned as is. Request handlers must
+    ``await`` the async API directly instead.
+    """
+
+    __slots__ = ("_target",)
+
+    def __init__(self, target: Any) -> None:
+        self._target = target
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._target, name)
+        if not inspect.iscoroutinefunction(attr):
+            return attr
+
+        @functools.wraps(attr)
+        def _call(*args: Any, **kwargs: Any) -> Any:
+            return run_sync(attr(*args, **kwargs))
+
+        return _call
+
+
+def blocking(target: Any) -> Any:
+    """Wrap an async repository/service so scripts can call it synchronously."""
+
+    return BlockingProxy(target)
+
+
+__all__ = ["BlockingProxy", "blocking", "run_sync", "submit_async"]
@@ -180,6 +180,105 @@ class Settings(BaseSettings):
         default=None,
         validation_alias=AliasChoices("DATABASE_SSL_CA", "APP_DATABASE_SSL_CA"),
     )
+    # connection pools (packages/core/db_pool.py)
+    database_pool_budget: int = Field(
+        default=40,
+        ge=1,
+        validation_alias=AliasChoices(
+            "DATABASE_POOL_BUDGET", "APP_DATABASE_POOL_BUDGET"
+        ),
+    )
+    database_pool_size: int = Field(
+        default=5,
+        ge=1,
+        validation_alias=AliasChoices("DATABASE_POOL_SIZE", "APP_DATABASE_POOL_SIZE"),
+    )
+    database_pool_max_overflow: int = Field(
+        default=5,
+        ge=0,
+        validation_alias=AliasChoices(
+            "DATABASE_POOL_MAX_OVERFLOW", "APP_DATABASE_POOL_MAX_OVERFLOW"
+        ),
+    )
+    database_pool_timeout: float = Field(
+        default=10.0,
+        gt=0,
+        validation_alias=AliasChoices(
+            "DATABASE_POOL_TIMEOUT", "APP_DATABASE_POOL_TIMEOUT"
+        ),
+    )
+    database_pool_recycle: int = Field(
+        default=1800,
+        validation_alias=AliasChoices(
+            "DATABASE_POOL_RECYCLE", "APP_DATABASE_POOL_RECYCLE"
+        ),
+    )
+    # CSV "domain=connections", e.g. "worker=4,billing=6"; other engines share one pool.
+    database_pool_domains: str = Field(
+        default="",
+        validation_alias=AliasChoices(
+            "DATABASE_POOL_DOMAINS", "APP_DATABASE_POOL_DOMAINS"
+        ),
+    )
+    database_statement_cache_size: int = Field(
+        default=256,
+        ge=0,
+        validation_alias=AliasChoices(
+            "DATABASE_STATEMENT_CACHE_SIZE", "APP_DATABASE_STATEMENT_CACHE_SIZE"
+        ),
+    )
+    # query instrumentation (packages/core/db_queries.py)
+    database_slow_query_ms: float = Field(
+        default=200.0,
+        ge=0,
+        validation_alias=AliasChoices(
+            "DATABASE_SLOW_QUERY_MS", "APP_DATABASE_SLOW_QUERY_MS"
+        ),
+    )
+    database_n_plus_one_threshold: int = Field(
+        default=10,
+        ge=2,
+        validation_alias=AliasChoices(
+            "DATABASE_N_PLUS_ONE_THRESHOLD", "APP_DATABASE_N_PLUS_ONE_THRESHOLD"
+        ),
+    )
+    # read replicas (packages/core/db_replicas.py); CSV of DSNs, empty disables routing.
+    database_replica_urls: str = Field(
+        default="",
+        validation_alias=AliasChoices(
+            "DATABASE_REPLICA_URLS", "APP_DATABASE_REPLICA_URLS"
+        ),
+    )
+    database_replica_max_lag_seconds: float = Field(
+        default=5.0,
+        ge=0,
+        validation_alias=AliasChoices(
+            "DATABASE_REPLICA_MAX_LAG_SECONDS", "APP_DATABASE_REPLICA_MAX_LAG_SECONDS"
+        ),
+    )
+    database_replica_lag_check_interval: float = Field(
+        default=2.0,
+        gt=0,
+        validation_alias=AliasChoices(
+            "DATABASE_REPLICA_LAG_CHECK_INTERVAL",
+            "APP_DATABASE_REPLICA_LAG_CHECK_INTERVAL",
+        ),
+    )
+    database_replica_simulated_lag_seconds: float = Field(
+        default=0.0,
+        ge=0,
+        validation_alias=AliasChoices(
+            "DATABASE_REPLICA_SIMULATED_LAG_SECONDS",
+            "APP_DATABASE_REPLICA_SIMULATED_LAG_SECONDS",
+        ),
+    )
+    database_read_your_writes_seconds: float = Field(
+        default=5.0,
+        ge=0,
+        validation_alias=AliasChoices(
+            "DATABASE_READ_YOUR_WRITES_SECONDS", "APP_DATABASE_READ_YOUR_WRITES_SECONDS"
+        ),
+    )
     profile_require_wallet_signature: bool = Field(
         default=False,
         validation_alias=AliasChoices(
@@ -194,6 +293,35 @@ class Settings(BaseSettings):
     event_rate_qps: int = 1000
     event_idempotency_ttl: int = 86400
 
+    # HTTP idempotency keys (Idempotency-Key header)
+    idempotency_ttl_seconds: int = Field(
+        default=86400,
+        ge=60,
+        validation_alias=AliasChoices(
+            "IDEMPOTENCY_TTL_SECONDS", "APP_IDEMPOTENCY_TTL_SECONDS"
+        ),
+    )
+    idempotency_lock_seconds: int = Field(
+        default=30,
+        ge=1,
+        validation_alias=AliasChoices(
+            "IDEMPOTENCY_LOCK_SECONDS", "APP_IDEMPOTENCY_LOCK_SECONDS"
+        ),
+    )
+    idempotency_wait_seconds: float = Field(
+        default=10.0,
+        ge=0.0,
+        validation_alias=AliasChoices(
+            "IDEMPOTENCY_WAIT_SECONDS", "APP_IDEMPOTENCY_WAIT_SECONDS"
+        ),
+    )
+    idempotency_redis_url: AnyUrl | None = Field(
+        default=None,
+        validation_alias=AliasChoices(
+            "IDEMPOTENCY_REDIS_URL", "APP_IDEMPOTENCY_REDIS_URL"
+        ),
+    )
+
     # notifications
     notify_topics: str | None = None  # CSV; if None, reuse event_topics
     notify_webhook_url: AnyUrl | None = None
@@ -239,6 +367,59 @@ class Settings(BaseSettings):
         default=True,
         validation_alias=AliasChoices("RUM_EXPORT_COMPRESS", "APP_RUM_EXPORT_COMPRESS"),
     )
+    rum_sample_rate: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        validation_alias=AliasChoices("RUM_SAMPLE_RATE", "APP_RUM_SAMPLE_RATE"),
+    )
+    rum_batch_max_events: int = Field(
+        default=500,
+        ge=1,
+        validation_alias=AliasChoices(
+            "RUM_BATCH_MAX_EVENTS", "APP_RUM_BATCH_MAX_EVENTS"
+        ),
+    )
+    rum_max_inflight_writes: int = Field(
+        default=16,
+        ge=1,
+        validation_alias=AliasChoices(
+            "RUM_MAX_INFLIGHT_WRITES", "APP_RUM_MAX_INFLIGHT_WRITES"
+        ),
+    )
+    rum_slow_write_ms: float = Field(
+        default=50.0,
+        gt=0.0,
+        validation_alias=AliasChoices("RUM_SLOW_WRITE_MS", "APP_RUM_SLOW_WRITE_MS"),
+    )
+    # per-process metrics flushed to Redis and merged for admin and /metrics
+    telemetry_fleet_enabled: bool = Field(
+        default=True,
+        validation_alias=AliasChoices(
+            "TELEMETRY_FLEET_ENABLED", "APP_TELEMETRY_FLEET_ENABLED"
+        ),
+    )
+    telemetry_fleet_flush_interval_sec: float = Field(
+        default=10.0,
+        gt=0.0,
+        validation_alias=AliasChoices(
+            "TELEMETRY_FLEET_FLUSH_INTERVAL_SEC", "APP_TELEMETRY_FLEET_FLUSH_INTERVAL_SEC"
+        ),
+    )
+    telemetry_fleet_stale_after_sec: float = Field(
+        default=30.0,
+        gt=0.0,
+        validation_alias=AliasChoices(
+            "TELEMETRY_FLEET_STALE_AFTER_SEC", "APP_TELEMETRY_FLEET_STALE_AFTER_SEC"
+        ),
+    )
+    telemetry_fleet_retention_sec: int = Field(
+        default=3600,
+        ge=60,
+        validation_alias=AliasChoices(
+            "TELEMETRY_FLEET_RETENTION_SEC", "APP_TELEMETRY_FLEET_RETENTION_SEC"
+        ),
+    )
 
     # SMTP (email notifications)
     smtp_mock: bool = True
@@ -275,6 +456,54 @@ class Settings(BaseSettings):
         validation_alias=AliasChoices("OPS_API_KEY", "APP_OPS_API_KEY"),
     )
 
+    # media uploads
+    media_upload_dir: str = Field(
+        default="apps/backend/var/uploads",
+        validation_alias=AliasChoices("MEDIA_UPLOAD_DIR", "APP_MEDIA_UPLOAD_DIR"),
+    )
+    media_max_upload_bytes: int = Field(
+        default=5 * 1024 * 1024,
+        ge=1,
+        validation_alias=AliasChoices(
+            "MEDIA_MAX_UPLOAD_BYTES", "APP_MEDIA_MAX_UPLOAD_BYTES"
+        ),
+    )
+    media_upload_chunk_bytes: int = Field(
+        default=256 * 1024,
+        ge=4096,
+        validation_alias=AliasChoices(
+            "MEDIA_UPLOAD_CHUNK_BYTES", "APP_MEDIA_UPLOAD_CHUNK_BYTES"
+        ),
+    )
+    media_variant_cache_bytes: int = Field(
+        default=512 * 1024 * 1024,
+        ge=0,
+        validation_alias=AliasChoices(
+            "MEDIA_VARIANT_CACHE_BYTES", "APP_MEDIA_VARIANT_CACHE_BYTES"
+        ),
+    )
+    media_variant_workers: int = Field(
+        default=2,
+        ge=1,
+        validation_alias=AliasChoices(
+            "MEDIA_VARIANT_WORKERS", "APP_MEDIA_VARIANT_WORKERS"
+        ),
+    )
+
+    # audit exports
+    audit_export_dir: str = Field(
+        default="apps/backend/var/audit_exports",
+        validation_alias=AliasChoices("AUDIT_EXPORT_DIR", "APP_AUDIT_EXPORT_DIR"),
+    )
+    audit_export_batch_size: int = Field(
+        default=1000,
+        ge=1,
+        le=50000,
+        validation_alias=AliasChoices(
+            "AUDIT_EXPORT_BATCH_SIZE", "APP_AUDIT_EXPORT_BATCH_SIZE"
+        ),
+    )
+
     # search (in-memory only)
     search_persist_path: str | None = "apps/backend/var/search_index.json"
 
@@ -293,6 +522,36 @@ class Settings(BaseSettings):
             "NODES_CACHE_MAX_ENTRIES", "APP_NODES_CACHE_MAX_ENTRIES"
         ),
     )
+    # Also publish per-node events next to the batch envelope of bulk admin
+    # actions, for consumers that only know the per-node topics.
+    nodes_bulk_item_events: bool = Field(
+        default=True,
+        validation_alias=AliasChoices(
+            "NODES_BULK_ITEM_EVENTS", "APP_NODES_BULK_ITEM_EVENTS"
+        ),
+    )
+    premium_entitlements_local_ttl_seconds: float = Field(
+        default=15.0,
+        ge=0,
+        validation_alias=AliasChoices(
+            "PREMIUM_ENTITLEMENTS_LOCAL_TTL", "APP_PREMIUM_ENTITLEMENTS_LOCAL_TTL"
+        ),
+    )
+    premium_entitlements_local_max_entries: int = Field(
+        default=10000,
+        ge=1,
+        validation_alias=AliasChoices(
+            "PREMIUM_ENTITLEMENTS_LOCAL_MAX_ENTRIES",
+            "APP_PREMIUM_ENTITLEMENTS_LOCAL_MAX_ENTRIES",
+        ),
+    )
+    premium_entitlements_cache_ttl_seconds: int = Field(
+        default=600,
+        ge=1,
+        validation_alias=AliasChoices(
+            "PREMIUM_ENTITLEMENTS_CACHE_TTL", "APP_PREMIUM_ENTITLEMENTS_CACHE_TTL"
+        ),
+    )
 
     # billing/webhook integration
     billing_webhook_secret: SecretStr | None = None
@@ -6,15 +6,19 @@ import logging
 import re
 import ssl
 import traceback
+import weakref
 from collections.abc import AsyncIterator, Callable, Mapping
 from pathlib import Path
 from threading import Lock
 from typing import Any
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
-from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine
 
 from .config import load_settings, sanitize_async_dsn
+from .db_pool import pool_manager
+from .db_queries import instrument_engine
+from .db_replicas import REPLICA_SUFFIX, replica_router
 
 logger = logging.getLogger(__name__)
 
@@ -28,14 +32,37 @@ class EngineRegistry:
         self._canonical_cache: dict[EngineKey, AsyncEngine] = {}
         self._alias_to_key: dict[str, EngineKey] = {}
         self._refcounts: dict[EngineKey, int] = {}
+        self._loops: dict[EngineKey, weakref.ref[asyncio.AbstractEventLoop]] = {}
+        # (name, url, kwargs, loop id) -> engine; skips DSN sanitising on hot paths.
+        self._lookups: dict[
+            tuple[Any, ...], tuple[AsyncEngine, weakref.ref[asyncio.AbstractEventLoop]]
+        ] = {}
+
+    def lookup(
+        self, key: tuple[Any, ...], loop: asyncio.AbstractEventLoop
+    ) -> AsyncEngine | None:
+        entry = self._lookups.get(key)
+        # Loop ids can be reused after a loop is garbage collected.
+        if entry is None or entry[1]() is not loop:
+            return None
+        return entry[0]
+
+    def remember(
+        self, key: tuple[Any, ...], engine: AsyncEngine, loop: asyncio.AbstractEventLoop
+    ) -> None:
+        with self._lock:
+            self._lookups[key] = (engine, weakref.ref(loop))
 
     def get_or_create(
         self,
         alias: str,
         canonical_key: EngineKey,
         factory: Callable[[], AsyncEngine],
+        *,
+        loop: asyncio.AbstractEventLoop | None = None,
     ) -> AsyncEngine:
         with self._lock:
+            self._prune_closed_loops_locked()
             engine = self._alias_cache.get(alias)
             if engine is not None:
                 logger.debug("engine_registry_hit alias=%s", alias)
@@ -44,11 +71,41 @@ class EngineRegistry:
             if engine is None:
                 engine = factory()
                 self._canonical_cache[canonical_key] = engine
+                if loop is not None:
+                    self._loops[canonical_key] = weakref.ref(loop)
             self._alias_cache[alias] = engine
             self._alias_to_key[alias] = canonical_key
             self._refcounts[canonical_key] = self._refcounts.get(canonical_key, 0) + 1
             return engine
 
+    def _prune_closed_loops_locked(self) -> None:
+        """Forget engines bound to loops that have closed.
+
+        Their connections cannot be closed gracefully any more; dropping the
+        references lets the pool manager reclaim the connection budget.
+        """
+
+        dead = [
+            key
+            for key, ref in self._loops.items()
+            if (loop := ref()) is None or loop.is_closed()
+        ]
+        if not dead:
+            return
+        dead_set = set(dead)
+        for key in dead:
+            self._loops.pop(key, None)
+            self._refcounts.pop(key, None)
+            self._canonical_cache.pop(key, None)
+        for alias in [a for a, k in self._alias_to_key.items() if k in dead_set]:
+            self._alias_to_key.pop(alias, None)
+            self._alias_cache.pop(alias, None)
+        self._drop_stale_lookups_locked()
+
+    def _drop_stale_lookups_locked(self) -> None:
+        live = set(map(id, self._alias_cache.values()))
+        self._lookups = {k: v for k, v in self._lookups.items() if id(v[0]) in live}
+
     async def dispose(self, prefixes: tuple[str, ...] | None = None) -> None:
         to_dispose: list[AsyncEngine] = []
         with self._lock:
@@ -73,11 +130,13 @@ class EngineRegistry:
                 remaining = self._refcounts.get(canonical, 0) - 1
                 if remaining <= 0:
                     self._refcounts.pop(canonical, None)
+                    self._loops.pop(canonical, None)
                     shared = self._canonical_cache.pop(canonical, None)
                     if shared is not None:
                         to_dispose.append(shared)
                 else:
                     self._refcounts[canonical] = remaining
+            self._drop_stale_lookups_locked()
 
         seen: set[int] = set()
         for engine in to_dispose:
@@ -274,15 +333,43 @@ def get_async_engine(
     cache: bool = True,
     **create_kwargs: Any,
 ) -> AsyncEngine:
-    """Return a sanitized async engine.
+    """Return a sanitized async engine backed by a shared, instrumented pool.
 
     Args:
         name: Logical identifier for the engine cache (e.g. "notifications").
+            It also selects the pool domain (see ``packages.core.db_pool``).
         url: Optional DSN. Defaults to APP_DATABASE_URL if omitted.
         cache: Reuse/dispose behaviour. When False, no caching is performed.
-        create_kwargs: Extra keyword arguments forwarded to `create_async_engine`.
+        create_kwargs: Extra keyword arguments forwarded to `create_async_engine`;
+            passing ``poolclass`` bypasses the pool manager.
+
+    Inside ``packages.core.db_replicas.read_only()`` a lookup for the primary
+    database may return a replica engine instead (see ``db_replicas``).
     """
 
+    router = replica_router()
+    if router.enabled:
+        replica = router.route(url)
+        if replica is not None:
+            name, url = f"{name}{REPLICA_SUFFIX}", replica.url
+
+    loop: asyncio.AbstractEventLoop | None = None
+    if cache:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+    lookup_key: tuple[Any, ...] | None = None
+    if loop is not None and url is not None:
+        try:
+            lookup_key = (name, str(url), id(loop), repr(sorted(create_kwargs.items())))
+        except TypeError:
+            lookup_key = None
+        if lookup_key is not None:
+            hit = _ENGINE_REGISTRY.lookup(lookup_key, loop)
+            if hit is not None:
+                return hit
+
     if url is not None:
         raw_url = url
     else:
@@ -316,35 +403,36 @@ def get_async_engine(
         else:
             overrides["ssl"] = repr(ssl_value)
 
+    manager = pool_manager()
+    if loop is None:
+        return instrument_engine(manager.create_engine(name, sanitized, **effective_kwargs))
+
+    # Engines are shared per pool domain and event loop: names in the same
+    # domain reuse one pool, and a pool never hands a connection to another loop.
+    loop_marker = f"loop:{id(loop)}"
     connect_key = _stable_items(connect_args, overrides=overrides)
-    kwargs_key = _stable_kwargs(effective_kwargs)
+    kwargs_key = _stable_kwargs(effective_kwargs) + (
+        ("pool", manager.domain_for(name)),
+        ("loop", loop_marker),
+    )
     canonical_key: EngineKey = (str(sanitized), connect_key, kwargs_key)
-
-    effective_cache = bool(cache)
-    loop_marker: str | None = None
-    if effective_cache:
-        try:
-            loop_marker = f"loop:{id(asyncio.get_running_loop())}"
-        except RuntimeError:
-            effective_cache = False
-
-    if not effective_cache:
-        return create_async_engine(sanitized, **effective_kwargs)
-
     alias_key = f"{name}:{loop_marker}:{repr(canonical_key)}"
 
     def _factory() -> AsyncEngine:
         stack = "".join(traceback.format_stack(limit=8))
         logger.debug(
-            "creating_async_engine name=%s loop=%s cache=%s\n%s",
+            "creating_async_engine name=%s loop=%s pool=%s\n%s",
             name,
             loop_marker,
-            effective_cache,
+            manager.domain_for(name),
             stack,
         )
-        return create_async_engine(sanitized, **effective_kwargs)
+        return instrument_engine(manager.create_engine(name, sanitized, **effective_kwargs))
 
-    return _ENGINE_REGISTRY.get_or_create(alias_key, canonical_key, _factory)
+    engine = _ENGINE_REGISTRY.get_or_create(alias_key, canonical_key, _factory, loop=loop)
+    if lookup_key is not None:
+        _ENGINE_REGISTRY.remember(lookup_key, engine, loop)
+    return engine
 
 
 async def dispose_async_engines(*names: str) -> None:
@@ -0,0 +1,417 @@
+from __future__ import annotations
+
+"""Shared, instrumented connection pools for async engines.
+
+Every engine created through :func:`packages.core.db.get_async_engine` gets its
+pool from the process-wide :class:`PoolManager`:
+
+* engine names are folded into *pool domains*: names that start with a
+  configured domain (``DATABASE_POOL_DOMAINS="worker=4,billing=6"``) get that
+  domain's pool, everything else shares the ``shared`` pool;
+* pools are keyed by event loop as well, because asyncpg connections cannot
+  cross loops (``run_sync`` runs coroutines on a background loop);
+* the sum of ``pool_size + max_overflow`` over live pools never exceeds
+  ``DATABASE_POOL_BUDGET``: a pool that does not fit is shrunk to what is left
+  with a warning, and once nothing is left :class:`PoolBudgetExceeded` is
+  raised instead of creating the engine;
+* checkout wait, connections in use, overflow and checkout timeouts are
+  exported to Prometheus when ``prometheus_client`` is installed.
+"""
+
+import logging
+import threading
+import time
+import weakref
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+try:  # pragma: no cover - optional dependency
+    from prometheus_client import REGISTRY, Counter, Gauge, Histogram  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    Counter = None  # type: ignore
+    Gauge = None  # type: ignore
+    Histogram = None  # type: ignore
+    REGISTRY = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+SHARED_POOL = "shared"
+
+
+def _existing(name: str) -> Any | None:
+    registry: Any | None = REGISTRY  # type: ignore[assignment]
+    if registry is None:
+        return None
+    return getattr(registry, "_names_to_collectors", {}).get(name)
+
+
+def _build_counter(
+    name: str, documentation: str, *, labelnames: Iterable[str] = ()
+):  # pragma: no cover - thin wrapper
+    if Counter is None:
+        return None
+    try:
+        return Counter(name, documentation, labelnames=tuple(labelnames))  # type: ignore[misc]
+    except ValueError:
+        return _existing(name)
+
+
+def _build_gauge(
+    name: str, documentation: str, *, labelnames: Iterable[str] = ()
+):  # pragma: no cover - thin wrapper
+    if Gauge is None:
+        return None
+    try:
+        return Gauge(name, documentation, labelnames=tuple(labelnames))  # type: ignore[misc]
+    except ValueError:
+        return _existing(name)
+
+
+def _build_histogram(
+    name: str,
+    documentation: str,
+    *,
+    buckets: Iterable[float],
+    labelnames: Iterable[str] = (),
+):  # pragma: no cover - thin wrapper
+    if Histogram is None:
+        return None
+    try:
+        return Histogram(  # type: ignore[misc]
+            name,
+            documentation,
+            labelnames=tuple(labelnames),
+            buckets=tuple(buckets),
+        )
+    except ValueError:
+        return _existing(name)
+
+
+CHECKOUT_WAIT_SECONDS = _build_histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent obtaining a connection from the pool (includes connect/pre-ping).",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+    labelnames=("pool",),
+)
+CONNECTIONS_IN_USE = _build_gauge(
+    "db_pool_connections_in_use",
+    "Connections currently checked out of the pool.",
+    labelnames=("pool",),
+)
+CONNECTIONS_OVERFLOW = _build_gauge(
+    "db_pool_overflow",
+    "Connections open beyond pool_size.",
+    labelnames=("pool",),
+)
+CHECKOUT_TIMEOUTS_TOTAL = _build_counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts that gave up after pool_timeout.",
+    labelnames=("pool",),
+)
+POOL_CAPACITY = _build_gauge(
+    "db_pool_capacity",
+    "pool_size + max_overflow allocated to the pool domain.",
+    labelnames=("pool",),
+)
+BUDGET_ALLOCATED = _build_gauge(
+    "db_pool_budget_allocated",
+    "Connections reserved out of DATABASE_POOL_BUDGET by live pools.",
+)
+
+
+class PoolBudgetExceeded(RuntimeError):
+    """No connections are left in ``DATABASE_POOL_BUDGET`` for a new pool."""
+
+    def __init__(self, domain: str, wanted: int, budget: int) -> None:
+        super().__init__(
+            f"database pool budget exhausted: domain={domain} wanted={wanted} "
+            f"budget={budget}; raise DATABASE_POOL_BUDGET or reuse an existing engine"
+        )
+        self.domain = domain
+        self.wanted = wanted
+        self.budget = budget
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """``AsyncAdaptedQueuePool`` that reports checkout metrics per domain."""
+
+    label: str = SHARED_POOL
+
+    def connect(self):  # type: ignore[override]
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except sa_exc.TimeoutError:
+            if CHECKOUT_TIMEOUTS_TOTAL is not None:
+                CHECKOUT_TIMEOUTS_TOTAL.labels(pool=self.label).inc()
+            raise
+        finally:
+            if CHECKOUT_WAIT_SECONDS is not None:
+                CHECKOUT_WAIT_SECONDS.labels(pool=self.label).observe(
+                    time.perf_counter() - started
+                )
+
+    def recreate(self) -> InstrumentedPool:
+        pool = super().recreate()
+        pool.label = self.label
+        return pool  # type: ignore[return-value]
+
+
+def _report_usage(pool: Any) -> None:
+    label = getattr(pool, "label", SHARED_POOL)
+    if CONNECTIONS_IN_USE is not None:
+        CONNECTIONS_IN_USE.labels(pool=label).set(pool.checkedout())
+    if CONNECTIONS_OVERFLOW is not None:
+        CONNECTIONS_OVERFLOW.labels(pool=label).set(max(0, pool.overflow()))
+
+
+def _usage_listener(sync_engine: Any):
+    # Weak reference: the listener lives in the engine's dispatch and must not
+    # keep the engine alive (its finalizer releases the budget).
+    ref = weakref.ref(sync_engine)
+
+    def _listener(*_args: Any) -> None:
+        engine = ref()
+        if engine is not None:
+            _report_usage(engine.pool)
+
+    return _listener
+
+
+def parse_domain_limits(raw: str | Mapping[str, int] | None) -> dict[str, int]:
+    """Parse ``"worker=4, billing=6"`` into ``{"worker": 4, "billing": 6}``."""
+
+    if not raw:
+        return {}
+    if isinstance(raw, Mapping):
+        items = raw.items()
+    else:
+        pairs = [chunk.split("=", 1) for chunk in str(raw).split(",") if "=" in chunk]
+        items = [(name, value) for name, value in pairs]
+    limits: dict[str, int] = {}
+    for name, value in items:
+        key = str(name).strip()
+        try:
+            limit = int(str(value).strip())
+        except ValueError:
+            logger.warning("database pool limit for %s is not an integer: %r", key, value)
+            continue
+        if key and limit > 0:
+            limits[key] = limit
+    return limits
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    budget: int = 40
+    pool_size: int = 5
+    max_overflow: int = 5
+    timeout: float = 10.0
+    recycle: int = 1800
+    statement_cache_size: int = 256
+    domain_limits: Mapping[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> PoolSettings:
+        return cls(
+            budget=int(settings.database_pool_budget),
+            pool_size=int(settings.database_pool_size),
+            max_overflow=int(settings.database_pool_max_overflow),
+            timeout=float(settings.database_pool_timeout),
+            recycle=int(settings.database_pool_recycle),
+            statement_cache_size=int(settings.database_statement_cache_size),
+            domain_limits=parse_domain_limits(settings.database_pool_domains),
+        )
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    domain: str
+    capacity: int
+    size: int
+    checked_out: int
+    overflow: int
+
+
+class PoolManager:
+    """Creates pooled engines and keeps their total capacity within budget."""
+
+    def __init__(self, settings: PoolSettings) -> None:
+        self.settings = settings
+        self._lock = threading.Lock()
+        self._allocated: dict[int, tuple[str, int]] = {}
+        self._engines: dict[int, weakref.ref[Engine]] = {}
+        # Longest prefix first so "nodes-admin" beats "nodes".
+        self._domains = sorted(settings.domain_limits, key=len, reverse=True)
+
+    def domain_for(self, name: str) -> str:
+        for domain in self._domains:
+            if name == domain or name.startswith(domain):
+                return domain
+        return SHARED_POOL
+
+    @property
+    def allocated(self) -> int:
+        with self._lock:
+            return sum(capacity for _, capacity in self._allocated.values())
+
+    def _limits(self, domain: str) -> tuple[int, int]:
+        limit = self.settings.domain_limits.get(domain)
+        if limit is None:
+            return self.settings.pool_size, self.settings.max_overflow
+        size = min(self.settings.pool_size, limit)
+        return size, limit - size
+
+    def _reserve_locked(self, domain: str, size: int, overflow: int) -> tuple[int, int]:
+        used = sum(capacity for _, capacity in self._allocated.values())
+        remaining = self.settings.budget - used
+        if remaining <= 0:
+            raise PoolBudgetExceeded(domain, size + overflow, self.settings.budget)
+        if size + overflow > remaining:
+            logger.warning(
+                "database pool budget exhausted: domain=%s wanted=%d granted=%d budget=%d",
+                domain,
+                size + overflow,
+                remaining,
+                self.settings.budget,
+            )
+            size = min(size, remaining)
+            overflow = remaining - size
+        return size, overflow
+
+    def _statement_cache_url(self, url: Any) -> Any:
+        parsed = make_url(str(url))
+        if not parsed.drivername.endswith("+asyncpg"):
+            return url
+        if "prepared_statement_cache_size" in parsed.query:
+            return url
+        return parsed.update_query_dict(
+            {"prepared_statement_cache_size": str(self.settings.statement_cache_size)}
+        )
+
+    def create_engine(self, name: str, url: Any, **kwargs: Any) -> AsyncEngine:
+        """Create an engine for ``name``; callers passing ``poolclass`` opt out."""
+
+        if "poolclass" in kwargs:
+            return create_async_engine(url, **kwargs)
+        domain = self.domain_for(name)
+        options = dict(kwargs)
+        options["poolclass"] = InstrumentedPool
+        options.setdefault("pool_timeout", self.settings.timeout)
+        options.setdefault("pool_recycle", self.settings.recycle)
+        target = self._statement_cache_url(url)
+        # Reserve and register under one lock so concurrent creations cannot
+        # both see the same remaining budget; creating an engine does no I/O.
+        # Explicit pool_size/max_overflow are a request, clamped like the defaults.
+        default_size, default_overflow = self._limits(domain)
+        with self._lock:
+            size, overflow = self._reserve_locked(
+                domain,
+                int(options.get("pool_size", default_size)),
+                int(options.get("max_overflow", default_overflow)),
+            )
+            options["pool_size"] = size
+            options["max_overflow"] = overflow
+            engine = create_async_engine(target, **options)
+            marker = id(engine.sync_engine)
+            capacity = size + overflow
+            self._allocated[marker] = (domain, capacity)
+            self._engines[marker] = weakref.ref(engine.sync_engine)
+        engine.sync_engine.pool.label = domain  # type: ignore[attr-defined]
+        listener = _usage_listener(engine.sync_engine)
+        event.listen(engine.sync_engine, "checkout", listener)
+        event.listen(engine.sync_engine, "checkin", listener)
+        weakref.finalize(engine.sync_engine, self.release, marker)
+        self._report_capacity()
+        return engine
+
+    def release(self, marker: int) -> None:
+        with self._lock:
+            self._allocated.pop(marker, None)
+            self._engines.pop(marker, None)
+        self._report_capacity()
+
+    def _report_capacity(self) -> None:
+        with self._lock:
+            allocated = list(self._allocated.values())
+        if BUDGET_ALLOCATED is not None:
+            BUDGET_ALLOCATED.set(sum(capacity for _, capacity in allocated))
+        if POOL_CAPACITY is not None:
+            totals: dict[str, int] = {domain: 0 for domain in self.settings.domain_limits}
+            totals.setdefault(SHARED_POOL, 0)
+            for domain, capacity in allocated:
+                totals[domain] = totals.get(domain, 0) + capacity
+            for domain, capacity in totals.items():
+                POOL_CAPACITY.labels(pool=domain).set(capacity)
+
+    def stats(self) -> list[PoolStats]:
+        with self._lock:
+            entries = [
+                (self._allocated[marker], ref())
+                for marker, ref in self._engines.items()
+                if marker in self._allocated
+            ]
+        result: list[PoolStats] = []
+        for (domain, capacity), engine in entries:
+            if engine is None:
+                continue
+            pool = engine.pool
+            result.append(
+                PoolStats(
+                    domain=domain,
+                    capacity=capacity,
+                    size=pool.size(),
+                    checked_out=pool.checkedout(),
+                    overflow=max(0, pool.overflow()),
+                )
+            )
+        return result
+
+
+_MANAGER: PoolManager | None = None
+_MANAGER_LOCK = threading.Lock()
+
+
+def pool_manager() -> PoolManager:
+    global _MANAGER
+    if _MANAGER is None:
+        with _MANAGER_LOCK:
+            if _MANAGER is None:
+                from .config import load_settings
+
+                try:
+                    pool_settings = PoolSettings.from_settings(load_settings())
+                except Exception as exc:  # pragma: no cover - defensive default
+                    logger.warning("database pool settings unavailable: %s", exc)
+                    pool_settings = PoolSettings()
+                _MANAGER = PoolManager(pool_settings)
+    return _MANAGER
+
+
+def configure_pools(settings: PoolSettings) -> PoolManager:
+    """Replace the process pool manager (startup and tests)."""
+
+    global _MANAGER
+    with _MANAGER_LOCK:
+        _MANAGER = PoolManager(settings)
+    return _MANAGER
+
+
+__all__ = [
+    "SHARED_POOL",
+    "InstrumentedPool",
+    "PoolBudgetExceeded",
+    "PoolManager",
+    "PoolSettings",
+    "PoolStats",
+    "configure_pools",
+    "parse_domain_limits",
+    "pool_manager",
+]
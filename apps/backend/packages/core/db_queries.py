@@ -0,0 +1,368 @@
+from __future__ import annotations
+
+"""Statement timing, slow-query log and N+1 detection for async engines.
+
+``instrument_engine`` hooks SQLAlchemy cursor events on an engine (every
+engine from ``get_async_engine`` is instrumented) and, per executed statement:
+
+* observes ``db_statement_duration_seconds`` keyed by the statement
+  *fingerprint* — the SQL with literals, bind placeholders and ``IN`` lists
+  collapsed, identified by a short hash;
+* logs statements slower than ``DATABASE_SLOW_QUERY_MS`` to
+  ``packages.core.db.slow`` with bind parameters redacted to their shape;
+* adds the statement to the ``QueryStats`` of the current request (a
+  contextvar set by ``track_queries``) and warns once per request when the
+  same SELECT fingerprint runs ``DATABASE_N_PLUS_ONE_THRESHOLD`` times.
+"""
+
+import hashlib
+import logging
+import re
+import threading
+import time
+from collections import Counter as TallyCounter
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import event
+
+try:  # pragma: no cover - optional dependency
+    from prometheus_client import REGISTRY, Counter, Histogram  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    Counter = None  # type: ignore
+    Histogram = None  # type: ignore
+    REGISTRY = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+slow_logger = logging.getLogger("packages.core.db.slow")
+
+# Fingerprints beyond this many distinct ids share the "other" metric label.
+MAX_TRACKED_FINGERPRINTS = 500
+
+_COMMENTS = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_STRINGS = re.compile(r"'(?:[^']|'')*'")
+_NUMBERS = re.compile(r"(?<![\w$])-?\d+(?:\.\d+)?(?![\w])")
+_PLACEHOLDERS = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<![:\w]):\w+|\?")
+_IN_LISTS = re.compile(r"\bin\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_VALUES_ROWS = re.compile(r"(\(\s*\?(?:\s*,\s*\?)*\s*\))(?:\s*,\s*\(\s*\?(?:\s*,\s*\?)*\s*\))+")
+_WHITESPACE = re.compile(r"\s+")
+_SENSITIVE = re.compile(r"pass|secret|token|key|hash|salt|otp|email|phone", re.IGNORECASE)
+
+
+def _existing(name: str) -> Any | None:
+    registry: Any | None = REGISTRY  # type: ignore[assignment]
+    if registry is None:
+        return None
+    return getattr(registry, "_names_to_collectors", {}).get(name)
+
+
+def _build_counter(
+    name: str, documentation: str, *, labelnames: Iterable[str] = ()
+):  # pragma: no cover - thin wrapper
+    if Counter is None:
+        return None
+    try:
+        return Counter(name, documentation, labelnames=tuple(labelnames))  # type: ignore[misc]
+    except ValueError:
+        return _existing(name)
+
+
+def _build_histogram(
+    name: str,
+    documentation: str,
+    *,
+    buckets: Iterable[float],
+    labelnames: Iterable[str] = (),
+):  # pragma: no cover - thin wrapper
+    if Histogram is None:
+        return None
+    try:
+        return Histogram(  # type: ignore[misc]
+            name,
+            documentation,
+            labelnames=tuple(labelnames),
+            buckets=tuple(buckets),
+        )
+    except ValueError:
+        return _existing(name)
+
+
+STATEMENT_DURATION_SECONDS = _build_histogram(
+    "db_statement_duration_seconds",
+    "Statement execution time by normalized SQL fingerprint.",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+    labelnames=("fingerprint", "operation"),
+)
+SLOW_STATEMENTS_TOTAL = _build_counter(
+    "db_slow_statements_total",
+    "Statements slower than DATABASE_SLOW_QUERY_MS.",
+    labelnames=("fingerprint", "operation"),
+)
+N_PLUS_ONE_TOTAL = _build_counter(
+    "db_n_plus_one_total",
+    "Requests where one SELECT fingerprint ran at least the N+1 threshold times.",
+    labelnames=("fingerprint",),
+)
+STATEMENTS_PER_REQUEST = _build_histogram(
+    "db_statements_per_request",
+    "Statements executed while serving one HTTP request.",
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144),
+    labelnames=("path",),
+)
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(statement: str) -> str:
+    """Normalize SQL so executions differing only in values share a key."""
+
+    text = _COMMENTS.sub(" ", statement)
+    text = _STRINGS.sub("?", text)
+    text = _NUMBERS.sub("?", text)
+    text = _PLACEHOLDERS.sub("?", text)
+    text = _WHITESPACE.sub(" ", text).strip().lower()
+    text = _IN_LISTS.sub("in (?)", text)
+    return _VALUES_ROWS.sub(r"\1", text)
+
+
+@lru_cache(maxsize=4096)
+def fingerprint_id(fp: str) -> str:
+    return hashlib.sha1(fp.encode("utf-8"), usedforsecurity=False).hexdigest()[:12]
+
+
+def _operation(fp: str) -> str:
+    head = fp.split(" ", 1)[0] if fp else ""
+    if head == "with":
+        for verb in ("insert", "update", "delete"):
+            if f") {verb} " in fp:
+                return verb
+        return "select"
+    return head if head in {"select", "insert", "update", "delete"} else "other"
+
+
+_known_lock = threading.Lock()
+_known: dict[str, str] = {}
+
+
+def _metric_label(fp: str) -> str:
+    fid = fingerprint_id(fp)
+    if fid in _known:
+        return fid
+    with _known_lock:
+        if fid in _known:
+            return fid
+        if len(_known) >= MAX_TRACKED_FINGERPRINTS:
+            return "other"
+        _known[fid] = fp
+    logger.debug("db fingerprint %s: %s", fid, fp)
+    return fid
+
+
+def known_fingerprints() -> dict[str, str]:
+    """Metric label -> normalized SQL, for reading dashboards."""
+
+    with _known_lock:
+        return dict(_known)
+
+
+def _redact_value(key: str | None, value: Any) -> Any:
+    if key is not None and _SENSITIVE.search(key):
+        return "***"
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, str):
+        return f"<str:{len(value)}>"
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return f"<bytes:{len(value)}>"
+    if isinstance(value, (list, tuple)):
+        return f"<{type(value).__name__}:{len(value)}>"
+    return f"<{type(value).__name__}>"
+
+
+def redact_parameters(parameters: Any, *, executemany: bool = False) -> Any:
+    """Describe bind parameters without leaking their values."""
+
+    if executemany and isinstance(parameters, Sequence) and parameters:
+        return {"rows": len(parameters), "first": redact_parameters(parameters[0])}
+    if isinstance(parameters, Mapping):
+        return {str(k): _redact_value(str(k), v) for k, v in parameters.items()}
+    if isinstance(parameters, Sequence) and not isinstance(parameters, (str, bytes)):
+        return [_redact_value(None, v) for v in parameters]
+    return _redact_value(None, parameters)
+
+
+@dataclass
+class QueryStats:
+    """Statements seen inside one ``track_queries`` block."""
+
+    label: str | None = None
+    statements: int = 0
+    duration: float = 0.0
+    by_fingerprint: TallyCounter[str] = field(default_factory=TallyCounter)
+    flagged: set[str] = field(default_factory=set)
+    parent: QueryStats | None = field(default=None, repr=False)
+
+    def record(self, fp: str, elapsed: float) -> None:
+        self.statements += 1
+        self.duration += elapsed
+        self.by_fingerprint[fp] += 1
+        if self.parent is not None:
+            self.parent.record(fp, elapsed)
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        return [(fp, n) for fp, n in self.by_fingerprint.most_common() if n >= threshold]
+
+
+_CURRENT: ContextVar[QueryStats | None] = ContextVar("db_query_stats", default=None)
+
+
+@contextmanager
+def track_queries(label: str | None = None) -> Iterator[QueryStats]:
+    """Collect statements executed in this context (nested blocks roll up)."""
+
+    parent = _CURRENT.get()
+    stats = QueryStats(label=label or (parent.label if parent else None), parent=parent)
+    token = _CURRENT.set(stats)
+    try:
+        yield stats
+    finally:
+        _CURRENT.reset(token)
+
+
+def current_query_stats() -> QueryStats | None:
+    return _CURRENT.get()
+
+
+@dataclass(frozen=True)
+class QuerySettings:
+    slow_query_ms: float = 200.0
+    n_plus_one_threshold: int = 10
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> QuerySettings:
+        return cls(
+            slow_query_ms=float(settings.database_slow_query_ms),
+            n_plus_one_threshold=int(settings.database_n_plus_one_threshold),
+        )
+
+
+_SETTINGS: QuerySettings | None = None
+
+
+def query_settings() -> QuerySettings:
+    global _SETTINGS
+    if _SETTINGS is None:
+        from .config import load_settings
+
+        try:
+            _SETTINGS = QuerySettings.from_settings(load_settings())
+        except Exception as exc:  # pragma: no cover - defensive default
+            logger.warning("database query settings unavailable: %s", exc)
+            _SETTINGS = QuerySettings()
+    return _SETTINGS
+
+
+def configure_queries(settings: QuerySettings | None) -> None:
+    """Replace the thresholds (tests and startup); ``None`` reloads lazily."""
+
+    global _SETTINGS
+    _SETTINGS = settings
+
+
+def _named_parameters(context: Any, parameters: Any) -> Any:
+    # Cursor parameters are positional for asyncpg/sqlite; the compiled ones
+    # keep bind names, which the redaction needs to spot sensitive keys.
+    compiled = getattr(context, "compiled_parameters", None)
+    if not compiled:
+        return parameters
+    return compiled if len(compiled) > 1 else compiled[0]
+
+
+def _before_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    conn.info.setdefault("_query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    started = conn.info.get("_query_started")
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    fp = fingerprint(statement)
+    operation = _operation(fp)
+    label = _metric_label(fp)
+    if STATEMENT_DURATION_SECONDS is not None:
+        STATEMENT_DURATION_SECONDS.labels(fingerprint=label, operation=operation).observe(
+            elapsed
+        )
+    settings = query_settings()
+    if settings.slow_query_ms and elapsed * 1000 >= settings.slow_query_ms:
+        if SLOW_STATEMENTS_TOTAL is not None:
+            SLOW_STATEMENTS_TOTAL.labels(fingerprint=label, operation=operation).inc()
+        slow_logger.warning(
+            "slow query %.1fms fingerprint=%s sql=%s params=%s",
+            elapsed * 1000,
+            fingerprint_id(fp),
+            fp,
+            redact_parameters(_named_parameters(context, parameters), executemany=executemany),
+        )
+    stats = _CURRENT.get()
+    if stats is None:
+        return
+    stats.record(fp, elapsed)
+    count = stats.by_fingerprint[fp]
+    if (
+        operation == "select"
+        and count >= settings.n_plus_one_threshold
+        and fp not in stats.flagged
+    ):
+        stats.flagged.add(fp)
+        if N_PLUS_ONE_TOTAL is not None:
+            N_PLUS_ONE_TOTAL.labels(fingerprint=label).inc()
+        logger.warning(
+            "possible N+1: %s ran %d times in %s fingerprint=%s",
+            fp,
+            count,
+            stats.label or "<untracked>",
+            fingerprint_id(fp),
+        )
+
+
+def _handle_error(context: Any) -> None:
+    conn = getattr(context, "connection", None)
+    info = getattr(conn, "info", None) if conn is not None else None
+    if info and info.get("_query_started"):
+        info["_query_started"].pop()
+
+
+def instrument_engine(engine: Any) -> Any:
+    """Attach timing listeners to an (async) engine once; returns the engine."""
+
+    sync_engine = getattr(engine, "sync_engine", engine)
+    if event.contains(sync_engine, "after_cursor_execute", _after_cursor_execute):
+        return engine
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+    return engine
+
+
+__all__ = [
+    "QuerySettings",
+    "QueryStats",
+    "configure_queries",
+    "current_query_stats",
+    "fingerprint",
+    "fingerprint_id",
+    "instrument_engine",
+    "known_fingerprints",
+    "query_settings",
+    "redact_parameters",
+    "track_queries",
+]
@@ -0,0 +1,359 @@
+from __future__ import annotations
+
+"""Read-replica routing for async engines.
+
+Replicas are listed in ``DATABASE_REPLICA_URLS`` (CSV of DSNs). Reads go to a
+replica only when all of the following hold:
+
+* the code runs inside :func:`read_only` — use cases that tolerate slightly
+  stale data opt in explicitly, everything else keeps using the primary;
+* the engine requested from :func:`packages.core.db.get_async_engine` points at
+  the primary database (same host/port/database as ``DATABASE_URL``);
+* the request is not pinned to the primary by :func:`use_primary` — the
+  ``ReadYourWritesMiddleware`` pins requests that write, and requests from a
+  client that wrote within ``DATABASE_READ_YOUR_WRITES_SECONDS``;
+* the replica reported a replication lag within
+  ``DATABASE_REPLICA_MAX_LAG_SECONDS`` on its last probe. Lag is probed in the
+  background at most every ``DATABASE_REPLICA_LAG_CHECK_INTERVAL`` seconds;
+  until the first probe finishes, or when it fails, reads fall back to the
+  primary.
+
+For local testing, point ``DATABASE_REPLICA_URLS`` at the primary itself and
+set ``DATABASE_REPLICA_SIMULATED_LAG_SECONDS`` to add a fixed lag to every
+probe.
+"""
+
+import asyncio
+import contextvars
+import itertools
+import logging
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+try:  # pragma: no cover - optional dependency
+    from prometheus_client import REGISTRY, Counter, Gauge  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    Counter = None  # type: ignore
+    Gauge = None  # type: ignore
+    REGISTRY = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+REPLICA_SUFFIX = ".replica"
+
+_LAG_SQL = text(
+    "SELECT CASE"
+    " WHEN NOT pg_is_in_recovery() THEN 0"
+    " WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+    " ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)"
+    " END"
+)
+
+
+def _existing(name: str) -> Any | None:
+    registry: Any | None = REGISTRY  # type: ignore[assignment]
+    if registry is None:
+        return None
+    return getattr(registry, "_names_to_collectors", {}).get(name)
+
+
+def _build_counter(
+    name: str, documentation: str, *, labelnames: Iterable[str] = ()
+):  # pragma: no cover - thin wrapper
+    if Counter is None:
+        return None
+    try:
+        return Counter(name, documentation, labelnames=tuple(labelnames))  # type: ignore[misc]
+    except ValueError:
+        return _existing(name)
+
+
+def _build_gauge(
+    name: str, documentation: str, *, labelnames: Iterable[str] = ()
+):  # pragma: no cover - thin wrapper
+    if Gauge is None:
+        return None
+    try:
+        return Gauge(name, documentation, labelnames=tuple(labelnames))  # type: ignore[misc]
+    except ValueError:
+        return _existing(name)
+
+
+REPLICA_LAG_SECONDS = _build_gauge(
+    "db_replica_lag_seconds",
+    "Replication lag reported by the last probe (-1 when the probe failed)",
+    labelnames=("replica",),
+)
+READS_ROUTED_TOTAL = _build_counter(
+    "db_reads_routed_total",
+    "Read-only engine lookups by routing decision",
+    labelnames=("target", "reason"),
+)
+
+
+_READ_ONLY: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "db_read_only", default=False
+)
+_PRIMARY_PINNED: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "db_primary_pinned", default=False
+)
+
+
+@contextmanager
+def read_only() -> Iterator[None]:
+    """Mark the enclosed code as a read-only use case that may use a replica."""
+
+    token = _READ_ONLY.set(True)
+    try:
+        yield
+    finally:
+        _READ_ONLY.reset(token)
+
+
+@contextmanager
+def use_primary() -> Iterator[None]:
+    """Pin the enclosed code to the primary, even inside :func:`read_only`."""
+
+    token = _PRIMARY_PINNED.set(True)
+    try:
+        yield
+    finally:
+        _PRIMARY_PINNED.reset(token)
+
+
+def is_read_only() -> bool:
+    return _READ_ONLY.get() and not _PRIMARY_PINNED.get()
+
+
+def _split_urls(raw: str | Iterable[str] | None) -> tuple[str, ...]:
+    if not raw:
+        return ()
+    items = raw.split(",") if isinstance(raw, str) else list(raw)
+    return tuple(item.strip() for item in items if item and item.strip())
+
+
+@lru_cache(maxsize=256)
+def _database_identity(url: str) -> tuple[str, int, str] | None:
+    try:
+        parsed = make_url(url)
+    except Exception:
+        return None
+    if not parsed.host or not parsed.database:
+        return None
+    return (parsed.host.lower(), int(parsed.port or 5432), parsed.database)
+
+
+@dataclass(frozen=True)
+class ReplicaSettings:
+    primary_url: str | None = None
+    urls: tuple[str, ...] = ()
+    max_lag_seconds: float = 5.0
+    lag_check_interval: float = 2.0
+    read_your_writes_seconds: float = 5.0
+    simulated_lag_seconds: float = 0.0
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> ReplicaSettings:
+        primary = getattr(settings, "database_url", None)
+        return cls(
+            primary_url=str(primary) if primary else None,
+            urls=_split_urls(settings.database_replica_urls),
+            max_lag_seconds=float(settings.database_replica_max_lag_seconds),
+            lag_check_interval=float(settings.database_replica_lag_check_interval),
+            read_your_writes_seconds=float(settings.database_read_your_writes_seconds),
+            simulated_lag_seconds=float(settings.database_replica_simulated_lag_seconds),
+        )
+
+
+@dataclass
+class ReplicaState:
+    url: str
+    label: str
+    lag: float | None = None
+    checked_at: float | None = None
+    error: str | None = None
+
+
+LagProbe = Callable[[AsyncEngine], Awaitable[float]]
+
+
+async def probe_lag(engine: AsyncEngine) -> float:
+    """Return the replication lag of the server behind ``engine`` in seconds."""
+
+    async with engine.connect() as conn:
+        value = (await conn.execute(_LAG_SQL)).scalar()
+    return max(0.0, float(value or 0.0))
+
+
+class ReplicaRouter:
+    """Pick a replica DSN for read-only engine lookups."""
+
+    def __init__(
+        self,
+        settings: ReplicaSettings,
+        *,
+        lag_probe: LagProbe = probe_lag,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.settings = settings
+        self.lag_probe = lag_probe
+        self.clock = clock
+        self.replicas = [
+            ReplicaState(url=url, label=f"replica-{index}")
+            for index, url in enumerate(settings.urls)
+        ]
+        self._cycle = itertools.count()
+        self._refreshing: asyncio.Task[None] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.replicas)
+
+    def targets_primary(self, url: Any | None) -> bool:
+        if url is None:
+            return True
+        primary = self.settings.primary_url
+        if not primary:
+            return False
+        identity = _database_identity(str(url))
+        return identity is not None and identity == _database_identity(primary)
+
+    def _stale(self) -> bool:
+        now = self.clock()
+        return any(
+            state.checked_at is None
+            or now - state.checked_at >= self.settings.lag_check_interval
+            for state in self.replicas
+        )
+
+    def choose(self) -> ReplicaState | None:
+        """Return a replica within the lag budget, or ``None`` for the primary."""
+
+        self._schedule_refresh()
+        healthy = [
+            state
+            for state in self.replicas
+            if state.lag is not None and state.lag <= self.settings.max_lag_seconds
+        ]
+        if not healthy:
+            return None
+        return healthy[next(self._cycle) % len(healthy)]
+
+    def _schedule_refresh(self) -> None:
+        if not self._stale():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        with self._lock:
+            task = self._refreshing
+            if task is not None and not task.done() and task.get_loop() is loop:
+                return
+            # A fresh context: the probe must not inherit the caller's
+            # read-only marker or its query-tracking block.
+            self._refreshing = loop.create_task(
+                self.refresh(), context=contextvars.Context()
+            )
+
+    async def refresh(self) -> None:
+        """Probe every replica's lag; failures mark the replica unavailable."""
+
+        from .db import get_async_engine
+
+        for state in self.replicas:
+            try:
+                engine = get_async_engine(f"replica-probe.{state.label}", url=state.url)
+                lag = await self.lag_probe(engine) + self.settings.simulated_lag_seconds
+            except Exception as exc:
+                if state.error is None:
+                    logger.warning("replica %s lag probe failed: %s", state.label, exc)
+                state.lag, state.error = None, str(exc)
+            else:
+                if state.lag is not None and lag > self.settings.max_lag_seconds >= state.lag:
+                    logger.warning(
+                        "replica %s lag %.1fs exceeds %.1fs, reading from primary",
+                        state.label,
+                        lag,
+                        self.settings.max_lag_seconds,
+                    )
+                state.lag, state.error = lag, None
+            state.checked_at = self.clock()
+            if REPLICA_LAG_SECONDS is not None:
+                REPLICA_LAG_SECONDS.labels(replica=state.label).set(
+                    -1 if state.lag is None else state.lag
+                )
+
+    def route(self, url: Any | None) -> ReplicaState | None:
+        """Replica for an engine lookup made in the current context, if any."""
+
+        if not self.enabled or not _READ_ONLY.get() or not self.targets_primary(url):
+            return None
+        if _PRIMARY_PINNED.get():
+            _count("primary", "pinned")
+            return None
+        state = self.choose()
+        if state is None:
+            _count("primary", "lagging")
+            return None
+        _count("replica", "healthy")
+        return state
+
+
+def _count(target: str, reason: str) -> None:
+    if READS_ROUTED_TOTAL is not None:
+        READS_ROUTED_TOTAL.labels(target=target, reason=reason).inc()
+
+
+_ROUTER: ReplicaRouter | None = None
+_ROUTER_LOCK = threading.Lock()
+
+
+def replica_router() -> ReplicaRouter:
+    global _ROUTER
+    router = _ROUTER
+    if router is not None:
+        return router
+    with _ROUTER_LOCK:
+        if _ROUTER is None:
+            from .config import load_settings
+
+            try:
+                settings = ReplicaSettings.from_settings(load_settings())
+            except Exception as exc:  # pragma: no cover - defensive default
+                logger.warning("database replica settings unavailable: %s", exc)
+                settings = ReplicaSettings()
+            _ROUTER = ReplicaRouter(settings)
+        return _ROUTER
+
+
+def configure_replicas(router: ReplicaRouter | None) -> None:
+    """Replace the process router (tests and startup); ``None`` reloads lazily."""
+
+    global _ROUTER
+    with _ROUTER_LOCK:
+        _ROUTER = router
+
+
+__all__ = [
+    "REPLICA_SUFFIX",
+    "ReplicaRouter",
+    "ReplicaSettings",
+    "ReplicaState",
+    "configure_replicas",
+    "is_read_only",
+    "probe_lag",
+    "read_only",
+    "replica_router",
+    "use_primary",
+]
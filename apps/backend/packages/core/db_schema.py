@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+"""Process-wide cache of which tables and columns exist in the database.
+
+Repositories that adapt their SQL to the schema (optional ``user_roles`` table,
+``users.username`` vs ``display_name``, billing amount columns...) used to
+probe ``information_schema`` on every request. :class:`SchemaCapabilityService`
+reflects the catalog once per database and process instead:
+
+* :meth:`SchemaCapabilityService.get` returns the cached
+  :class:`SchemaCapabilities`, introspecting on first use only;
+* while the database revision (``alembic_version``) is behind the migration
+  heads shipped with the code, the revision is re-read at most every
+  ``recheck_interval`` seconds and the catalog is reflected again once it
+  changes — so a running process picks up ``alembic upgrade``. At head no
+  query runs at all;
+* :meth:`SchemaCapabilityService.refresh` re-reflects on demand (after DDL
+  applied by the process itself).
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine.reflection import ObjectKind
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+_MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / "migrations"
+_VERSION_TABLE = "alembic_version"
+
+
+def _code_heads() -> frozenset[str] | None:
+    """Migration heads shipped with this build, or ``None`` when unknown."""
+
+    try:
+        from alembic.script import ScriptDirectory
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    try:
+        return frozenset(ScriptDirectory(str(_MIGRATIONS_DIR)).get_heads())
+    except Exception as exc:  # pragma: no cover - broken/missing scripts
+        logger.warning("schema capabilities: cannot read migration heads: %s", exc)
+        return None
+
+
+@dataclass(frozen=True)
+class SchemaCapabilities:
+    """Tables (with their columns) visible on the connection's search path."""
+
+    columns: Mapping[str, frozenset[str]] = field(default_factory=dict)
+    revisions: frozenset[str] = frozenset()
+    heads: frozenset[str] | None = None
+
+    @property
+    def tables(self) -> frozenset[str]:
+        return frozenset(self.columns)
+
+    @property
+    def at_head(self) -> bool:
+        return self.heads is not None and bool(self.heads) and self.revisions == self.heads
+
+    def has_table(self, table: str) -> bool:
+        return table in self.columns
+
+    def has_column(self, table: str, column: str) -> bool:
+        return column in self.columns.get(table, ())
+
+    def columns_of(self, table: str) -> frozenset[str]:
+        return self.columns.get(table, frozenset())
+
+    def first_table(self, candidates: Iterable[str]) -> str | None:
+        return next((name for name in candidates if name in self.columns), None)
+
+    def first_column(self, table: str, candidates: Iterable[str]) -> str | None:
+        present = self.columns.get(table, ())
+        return next((name for name in candidates if name in present), None)
+
+
+@dataclass
+class _Entry:
+    capabilities: SchemaCapabilities
+    checked_at: float
+
+
+def _reflect(sync_conn: Any) -> dict[str, frozenset[str]]:
+    inspector = inspect(sync_conn)
+    reflected = inspector.get_multi_columns(kind=ObjectKind.ANY)
+    return {
+        table: frozenset(str(column["name"]) for column in columns)
+        for (_schema, table), columns in reflected.items()
+    }
+
+
+async def _read_revisions(conn: AsyncConnection) -> frozenset[str]:
+    rows = await conn.execute(text(f"SELECT version_num FROM {_VERSION_TABLE}"))
+    return frozenset(str(row[0]) for row in rows)
+
+
+def _database_key(conn: AsyncConnection | AsyncEngine) -> str:
+    return conn.engine.url.render_as_string(hide_password=True)
+
+
+class SchemaCapabilityService:
+    """Reflect each database's catalog once and serve it from memory."""
+
+    def __init__(
+        self,
+        *,
+        heads: Callable[[], frozenset[str] | None] = _code_heads,
+        recheck_interval: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._heads_loader = heads
+        self._heads: frozenset[str] | None = None
+        self._heads_loaded = False
+        self.recheck_interval = recheck_interval
+        self.clock = clock
+        self._entries: dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+
+    def _code_heads(self) -> frozenset[str] | None:
+        if not self._heads_loaded:
+            self._heads = self._heads_loader()
+            self._heads_loaded = True
+        return self._heads
+
+    async def get(self, conn: AsyncConnection | AsyncEngine) -> SchemaCapabilities:
+        """Cached capabilities of the database behind ``conn``."""
+
+        entry = self._entries.get(_database_key(conn))
+        if entry is not None:
+            caps = entry.capabilities
+            if caps.at_head or self.clock() - entry.checked_at < self.recheck_interval:
+                return caps
+            if isinstance(conn, AsyncEngine):
+                async with conn.connect() as connection:
+                    return await self._recheck(connection, entry)
+            return await self._recheck(conn, entry)
+        return await self.refresh(conn)
+
+    async def _recheck(self, conn: AsyncConnection, entry: _Entry) -> SchemaCapabilities:
+        caps = entry.capabilities
+        if caps.has_table(_VERSION_TABLE):
+            try:
+                revisions = await _read_revisions(conn)
+            except SQLAlchemyError as exc:
+                logger.debug("schema capabilities: revision check failed: %s", exc)
+                revisions = caps.revisions
+            if revisions == caps.revisions:
+                entry.checked_at = self.clock()
+                return caps
+        return await self.refresh(conn)
+
+    async def refresh(self, conn: AsyncConnection | AsyncEngine) -> SchemaCapabilities:
+        """Reflect the catalog now and replace the cached capabilities."""
+
+        if isinstance(conn, AsyncEngine):
+            async with conn.connect() as connection:
+                return await self.refresh(connection)
+        columns = await conn.run_sync(_reflect)
+        revisions: frozenset[str] = frozenset()
+        if _VERSION_TABLE in columns:
+            revisions = await _read_revisions(conn)
+        caps = SchemaCapabilities(
+            columns=columns, revisions=revisions, heads=self._code_heads()
+        )
+        with self._lock:
+            self._entries[_database_key(conn)] = _Entry(caps, self.clock())
+        if caps.heads is not None and not caps.at_head:
+            logger.info(
+                "schema capabilities: database revision %s is not at head %s; "
+                "rechecking every %.0fs",
+                sorted(caps.revisions) or "-",
+                sorted(caps.heads),
+                self.recheck_interval,
+            )
+        return caps
+
+    def invalidate(self, conn: AsyncConnection | AsyncEngine | None = None) -> None:
+        """Drop cached capabilities (all databases when ``conn`` is ``None``)."""
+
+        with self._lock:
+            if conn is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(_database_key(conn), None)
+
+
+_SERVICE: SchemaCapabilityService | None = None
+_SERVICE_LOCK = threading.Lock()
+
+
+def schema_capabilities() -> SchemaCapabilityService:
+    global _SERVICE
+    service = _SERVICE
+    if service is not None:
+        return service
+    with _SERVICE_LOCK:
+        if _SERVICE is None:
+            _SERVICE = SchemaCapabilityService()
+        return _SERVICE
+
+
+def configure_schema_capabilities(service: SchemaCapabilityService | None) -> None:
+    """Replace the process service (tests); ``None`` recreates it lazily."""
+
+    global _SERVICE
+    with _SERVICE_LOCK:
+        _SERVICE = service
+
+
+__all__ = [
+    "SchemaCapabilities",
+    "SchemaCapabilityService",
+    "configure_schema_capabilities",
+    "schema_capabilities",
+]
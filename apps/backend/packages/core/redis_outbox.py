@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import json
+import time
+from collections.abc import Sequence
 from importlib import import_module
 from typing import Any, Protocol, cast
 
@@ -17,10 +19,22 @@ class RedisStreamWriter(Protocol):
 
     def xadd(self, name: str, fields: dict[str, Any]) -> str: ...
 
+    def pipeline(self, transaction: bool = True) -> Any: ...
+
+
+def _entry(topic: str, payload: dict, key: str | None) -> tuple[str, dict[str, Any]]:
+    data: dict[str, Any] = {"payload": json.dumps(payload)}
+    if key is not None:
+        data["key"] = key
+    return f"events:{topic}", data
+
 
 class RedisOutboxCore:
     """Low-level Redis Streams outbox."""
 
+    # XADDs sent per pipeline round trip by ``publish_many``.
+    batch_size = 500
+
     def __init__(self, redis_url: str, client: RedisStreamWriter | None = None):
         if client is not None:
             self._client = client
@@ -31,24 +45,42 @@ class RedisOutboxCore:
             )
 
     def publish(self, topic: str, payload: dict, key: str | None = None) -> str:
-        stream = f"events:{topic}"
-        data: dict[str, Any] = {"payload": json.dumps(payload)}
-        if key is not None:
-            data["key"] = key
+        stream, data = _entry(topic, payload, key)
+        return self._with_retry(lambda: self._client.xadd(stream, data))
+
+    def publish_many(self, events: Sequence[tuple[str, dict, str | None]]) -> list[str]:
+        """XADD every ``(topic, payload, key)`` with one round trip per chunk.
+
+        A failed chunk is retried whole, so like ``publish`` delivery is
+        at-least-once.
+        """
+
+        entries = [_entry(topic, payload, key) for topic, payload, key in events]
+        ids: list[str] = []
+        for start in range(0, len(entries), self.batch_size):
+            chunk = entries[start : start + self.batch_size]
+
+            def _send(chunk: list[tuple[str, dict[str, Any]]] = chunk) -> list[str]:
+                pipe = self._client.pipeline(transaction=False)
+                for stream, data in chunk:
+                    pipe.xadd(stream, data)
+                return list(pipe.execute())
+
+            ids.extend(self._with_retry(_send))
+        return ids
+
+    def _with_retry(self, send: Any) -> Any:
         delay = 0.05
         last_err: Exception | None = None
         for _ in range(5):
             try:
-                return self._client.xadd(stream, data)
+                return send()
             except Exception as exc:  # pragma: no cover - network transient
                 last_err = exc
-                import time as _time
-
-                _time.sleep(delay)
+                time.sleep(delay)
                 delay = min(delay * 2, 0.5)
         if last_err is not None:
             raise last_err
         raise RuntimeError("failed to publish to redis outbox")
 
-
 __all__ = ["RedisOutboxCore"]
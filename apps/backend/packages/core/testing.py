@@ -4,7 +4,10 @@ import os
 import sys
 from collections.abc import Iterator
 from contextlib import contextmanager
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .db_queries import QueryStats
 
 _override: bool | None = None
 
@@ -70,4 +73,41 @@ def override_test_mode(value: bool) -> Iterator[None]:
         set_test_mode(previous)
 
 
-__all__ = ["is_test_mode", "override_test_mode", "set_test_mode"]
+@contextmanager
+def statement_budget(
+    max_statements: int, *, max_per_fingerprint: int | None = None
+) -> Iterator[QueryStats]:
+    """Fail when the block runs more SQL statements than allowed.
+
+    Usage in tests of hot endpoints::
+
+        with statement_budget(3, max_per_fingerprint=1):
+            await client.get("/v1/nodes/42")
+
+    Only statements through instrumented engines (``get_async_engine`` or
+    ``instrument_engine``) are counted.
+    """
+
+    from .db_queries import track_queries
+
+    with track_queries("statement_budget") as stats:
+        yield stats
+    problems: list[str] = []
+    if stats.statements > max_statements:
+        problems.append(f"{stats.statements} statements > budget {max_statements}")
+    if max_per_fingerprint is not None:
+        problems.extend(
+            f"{count}x (> {max_per_fingerprint}) {fp}"
+            for fp, count in stats.by_fingerprint.most_common()
+            if count > max_per_fingerprint
+        )
+    if problems:
+        top = "\n".join(
+            f"  {count}x {fp}" for fp, count in stats.by_fingerprint.most_common(10)
+        )
+        raise AssertionError(
+            "statement budget exceeded: " + "; ".join(problems) + "\n" + top
+        )
+
+
+__all__ = ["is_test_mode", "override_test_mode", "set_test_mode", "statement_budget"]
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+
+from apps.backend.app.api_gateway.wires import build_container
+from packages.core.config import Settings, load_settings
+
+logger = logging.getLogger(__name__)
+
+
+async def main(argv: list[str] | None = None) -> None:
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s"
+    )
+    parser = argparse.ArgumentParser(
+        description="Grant rule-based achievements already earned by existing users"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=500, help="Users evaluated per page"
+    )
+    args = parser.parse_args(argv)
+
+    settings: Settings = load_settings()
+    container = build_container(env=settings.env)
+    engine = container.achievement_rules
+
+    report = await engine.backfill(batch_size=max(1, args.batch_size))
+    logger.info(
+        "achievements_backfill_summary rules=%s users=%s granted=%s",
+        len(engine.rules),
+        report.users,
+        report.granted,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -5,6 +5,10 @@ from functools import lru_cache
 
 from apps.backend.app.api_gateway.wires import Container, build_container
 
+from domains.platform.telemetry.application.fleet_metrics_service import FleetMetrics
+from domains.platform.telemetry.wires import build_fleet_metrics
+from packages.core.config import load_settings
+
 
 @lru_cache(maxsize=1)
 def get_worker_container() -> Container:
@@ -15,4 +19,11 @@ def get_worker_container() -> Container:
     return build_container()
 
 
-__all__ = ["get_worker_container"]
+def start_metrics_flush(role: str) -> FleetMetrics:
+    """Flush this worker process' metrics to the fleet store until ``stop()``."""
+    fleet = build_fleet_metrics(load_settings(), role=f"worker:{role}")
+    fleet.start()
+    return fleet
+
+
+__all__ = ["get_worker_container", "start_metrics_flush"]
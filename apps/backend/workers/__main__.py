@@ -4,7 +4,17 @@ import argparse
 import logging
 from collections.abc import Sequence
 
-from . import events_worker, notifications_worker, schedule_worker, telemetry_worker
+from . import (
+    events_worker,
+    idempotency_worker,
+    jobs_worker,
+    notifications_worker,
+    schedule_worker,
+    site_metrics_worker,
+    site_republish_worker,
+    start_metrics_flush,
+    telemetry_worker,
+)
 
 
 def _configure_logging(level: str | None) -> None:
@@ -70,10 +80,71 @@ def main(argv: Sequence[str] | None = None) -> int:
         "--log-level", dest="log_level", help="Logging level", default="INFO"
     )
 
+    jobs_parser = subparsers.add_parser(
+        "jobs-reaper",
+        help="Run the worker jobs lease reaper",
+    )
+    jobs_parser.add_argument(
+        "extra",
+        nargs=argparse.REMAINDER,
+        help="Additional arguments forwarded to packages.worker runner",
+    )
+    jobs_parser.add_argument(
+        "--log-level", dest="log_level", help="Logging level", default="INFO"
+    )
+
+    idempotency_parser = subparsers.add_parser(
+        "idempotency-sweeper",
+        help="Run the idempotency keys TTL sweeper",
+    )
+    idempotency_parser.add_argument(
+        "extra",
+        nargs=argparse.REMAINDER,
+        help="Additional arguments forwarded to packages.worker runner",
+    )
+    idempotency_parser.add_argument(
+        "--log-level", dest="log_level", help="Logging level", default="INFO"
+    )
+
+    site_metrics_parser = subparsers.add_parser(
+        "site-metrics",
+        help="Run the site page/block metrics rollup worker",
+    )
+    site_metrics_parser.add_argument(
+        "extra",
+        nargs=argparse.REMAINDER,
+        help="Additional arguments forwarded to packages.worker runner",
+    )
+    site_metrics_parser.add_argument(
+        "--log-level", dest="log_level", help="Logging level", default="INFO"
+    )
+
+    site_republish_parser = subparsers.add_parser(
+        "site-republish",
+        help="Run the worker re-materializing page snapshots after block publishes",
+    )
+    site_republish_parser.add_argument(
+        "extra",
+        nargs=argparse.REMAINDER,
+        help="Additional arguments forwarded to packages.worker runner",
+    )
+    site_republish_parser.add_argument(
+        "--log-level", dest="log_level", help="Logging level", default="INFO"
+    )
+
     args = parser.parse_args(argv)
 
     _configure_logging(getattr(args, "log_level", None))
 
+    fleet = start_metrics_flush(args.worker)
+    try:
+        _dispatch(parser, args)
+    finally:
+        fleet.stop()
+    return 0
+
+
+def _dispatch(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
     if args.worker == "events":
         events_worker.run(topics=args.topics)
     elif args.worker == "scheduler":
@@ -84,9 +155,20 @@ def main(argv: Sequence[str] | None = None) -> int:
     elif args.worker == "telemetry":
         extra = getattr(args, "extra", None) or []
         telemetry_worker.run(list(extra))
+    elif args.worker == "jobs-reaper":
+        extra = getattr(args, "extra", None) or []
+        jobs_worker.run(list(extra))
+    elif args.worker == "idempotency-sweeper":
+        extra = getattr(args, "extra", None) or []
+        idempotency_worker.run(list(extra))
+    elif args.worker == "site-metrics":
+        extra = getattr(args, "extra", None) or []
+        site_metrics_worker.run(list(extra))
+    elif args.worker == "site-republish":
+        extra = getattr(args, "extra", None) or []
+        site_republish_worker.run(list(extra))
     else:  # pragma: no cover - argparse prevents this
         parser.error(f"Unknown worker: {args.worker}")
-    return 0
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+from app.api_gateway.idempotency import IdempotencySweeper, _get_store
+from packages.core.db import dispose_async_engines
+from packages.worker import PeriodicWorker, PeriodicWorkerConfig
+from packages.worker import main as worker_main
+from packages.worker.registry import WorkerRuntimeContext, register_worker
+
+_WORKER_NAME = "idempotency.sweeper"
+
+
+def _env_float(env: Mapping[str, str], key: str, default: float) -> float:
+    try:
+        return float(env.get(key, default))
+    except (TypeError, ValueError):  # pragma: no cover - defensive
+        return default
+
+
+def _env_int(env: Mapping[str, str], key: str, default: int) -> int:
+    try:
+        return int(env.get(key, default))
+    except (TypeError, ValueError):  # pragma: no cover - defensive
+        return default
+
+
+class IdempotencySweeperWorker(PeriodicWorker):
+    def __init__(
+        self,
+        *,
+        context: WorkerRuntimeContext,
+        sweeper: IdempotencySweeper,
+        interval: float,
+        jitter: float,
+    ) -> None:
+        self._sweeper = sweeper
+
+        async def _tick() -> None:
+            removed = await self._sweeper.run_once()
+            if removed:
+                self.logger.info("idempotency sweeper removed=%s", removed)
+
+        config = PeriodicWorkerConfig(interval=interval, jitter=jitter, immediate=True)
+        super().__init__(_WORKER_NAME, _tick, config=config, logger=context.logger)
+
+    async def shutdown(self) -> None:
+        await dispose_async_engines()
+        await super().shutdown()
+
+
+@register_worker(_WORKER_NAME)
+async def build_idempotency_sweeper_worker(context: WorkerRuntimeContext):
+    env = dict(context.env)
+    interval = max(_env_float(env, "IDEMPOTENCY_SWEEPER_INTERVAL", 300.0), 5.0)
+    jitter = min(_env_float(env, "IDEMPOTENCY_SWEEPER_JITTER", 30.0), interval / 2)
+    batch_size = max(1, _env_int(env, "IDEMPOTENCY_SWEEPER_BATCH_SIZE", 1000))
+    store = _get_store(context.settings)
+    if store is None:
+        raise RuntimeError("idempotency storage unavailable")
+    sweeper = IdempotencySweeper(
+        store,
+        batch_size=batch_size,
+        legacy_ttl_seconds=int(context.settings.idempotency_ttl_seconds),
+    )
+    return IdempotencySweeperWorker(
+        context=context, sweeper=sweeper, interval=interval, jitter=jitter
+    )
+
+
+def run(extra_args: list[str] | None = None) -> None:
+    args = ["--name", _WORKER_NAME]
+    if extra_args:
+        args.extend(extra_args)
+    worker_main(args)
+
+
+def main() -> None:  # pragma: no cover - runtime script
+    run()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,175 @@
+"""Achievement rule evaluation throughput with hundreds of active rules.
+
+Builds ``--rules`` achievements over ``--topics`` event topics (thresholds,
+``where`` predicates, 7-day windows and ``all``/``any`` combinations) and feeds
+``--events`` synthetic events for ``--users`` users through:
+
+* ``incremental`` — :class:`AchievementRuleEngine` with in-memory counters:
+  each event updates only the counters subscribed to its topic and
+  re-evaluates the rules depending on them;
+* ``recompute`` — the naive approach the engine replaces: on every event all
+  rules are re-evaluated by rescanning the user's event history (run on
+  ``--recompute-events`` events only, it slows down as history grows).
+
+Both use the in-memory repository and counter store, so the numbers show the
+evaluation cost, not database latency. Results go to
+``var/achievements-rules-benchmark.json``.
+
+    python scripts/achievements_rules_benchmark.py --rules 500 --events 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_BACKEND_ROOT = _REPO_ROOT / "apps" / "backend"
+for candidate in (_REPO_ROOT, _BACKEND_ROOT):
+    candidate_str = str(candidate)
+    if candidate_str not in sys.path:
+        sys.path.insert(0, candidate_str)
+
+from domains.product.achievements.adapters.memory.counters import (  # noqa: E402
+    MemoryCounterStore,
+)
+from domains.product.achievements.adapters.memory.repository import (  # noqa: E402
+    MemoryRepo,
+)
+from domains.product.achievements.application.rule_engine import (  # noqa: E402
+    AchievementRuleEngine,
+)
+from domains.product.achievements.domain.rules import compile_condition  # noqa: E402
+
+_STATUSES = ("published", "draft", "archived")
+
+
+def _condition(rng: random.Random, topics: list[str], index: int) -> dict[str, Any]:
+    def leaf() -> dict[str, Any]:
+        node: dict[str, Any] = {
+            "event": rng.choice(topics),
+            "count": rng.choice((1, 5, 10, 50, 100, 500)),
+        }
+        if rng.random() < 0.5:
+            node["where"] = {"status": rng.choice(_STATUSES)}
+        if rng.random() < 0.3:
+            node["window_days"] = 7
+        return node
+
+    if index % 5 == 0:
+        return {rng.choice(("all", "any")): [leaf(), leaf()]}
+    return leaf()
+
+
+def _events(args: argparse.Namespace, topics: list[str], count: int) -> list[tuple]:
+    rng = random.Random(args.seed + 1)
+    return [
+        (
+            rng.choice(topics),
+            {"user_id": f"user-{rng.randrange(args.users)}", "status": rng.choice(_STATUSES)},
+        )
+        for _ in range(count)
+    ]
+
+
+async def _catalog(args: argparse.Namespace, topics: list[str]) -> MemoryRepo:
+    rng = random.Random(args.seed)
+    repo = MemoryRepo()
+    for index in range(args.rules):
+        await repo.create(
+            {
+                "code": f"rule-{index}",
+                "title": f"Rule {index}",
+                "condition": _condition(rng, topics, index),
+            }
+        )
+    return repo
+
+
+async def _incremental(args: argparse.Namespace, topics: list[str]) -> dict[str, Any]:
+    repo = await _catalog(args, topics)
+    engine = AchievementRuleEngine(repo, MemoryCounterStore())
+    await engine.load()
+    events = _events(args, topics, args.events)
+    granted = 0
+    started = time.perf_counter()
+    for topic, payload in events:
+        granted += len(await engine.handle(topic, payload))
+    elapsed = time.perf_counter() - started
+    return {
+        "events": len(events),
+        "distinct_counters": sum(len(engine._specs_by_topic[t]) for t in engine.topics),
+        "grants": granted,
+        "events_per_sec": round(len(events) / elapsed, 1),
+    }
+
+
+async def _recompute(args: argparse.Namespace, topics: list[str]) -> dict[str, Any]:
+    repo = await _catalog(args, topics)
+    rules = [
+        (a.id, compile_condition(a.condition)) for a in await repo.list_all() if a.condition
+    ]
+    history: dict[str, list[tuple[str, dict[str, Any], float]]] = defaultdict(list)
+    granted: set[tuple[str, str]] = set()
+    events = _events(args, topics, args.recompute_events)
+    started = time.perf_counter()
+    for topic, payload in events:
+        now = time.time()
+        user = payload["user_id"]
+        history[user].append((topic, payload, now))
+        for achievement_id, expr in rules:
+            values: dict[str, float] = {}
+            for spec in expr.counters:
+                since = spec.since(now)
+                values[spec.key] = sum(
+                    spec.delta(p)
+                    for t, p, ts in history[user]
+                    if t == spec.topic and spec.bucket(ts) >= since and spec.matches(p)
+                )
+            if expr.evaluate(values) and (user, achievement_id) not in granted:
+                granted.add((user, achievement_id))
+                await repo.grant(user, achievement_id)
+    elapsed = time.perf_counter() - started
+    return {
+        "events": len(events),
+        "grants": len(granted),
+        "events_per_sec": round(len(events) / elapsed, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rules", type=int, default=300)
+    parser.add_argument("--topics", type=int, default=20)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--events", type=int, default=50000)
+    parser.add_argument("--recompute-events", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    topics = [f"bench.topic{index}.v1" for index in range(args.topics)]
+    results = {
+        "incremental": asyncio.run(_incremental(args, topics)),
+        "recompute": asyncio.run(_recompute(args, topics)),
+    }
+    payload = {
+        "rules": args.rules,
+        "topics": args.topics,
+        "users": args.users,
+        "results": results,
+    }
+    output_path = _REPO_ROOT / "var" / "achievements-rules-benchmark.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    print(json.dumps(payload, indent=2))
+
+
+if __name__ == "__main__":
+    main()
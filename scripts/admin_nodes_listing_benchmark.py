@@ -0,0 +1,237 @@
+"""Admin node listing page latency by depth: OFFSET vs keyset.
+
+Times one page of ``--page-size`` rows at page 10, 1 000 and 10 000 of the
+admin node listing (``updated_at DESC``) in two shapes:
+
+* ``offset`` — the previous query: ``LIMIT/OFFSET`` with comment and ban
+  counts aggregated per row from ``node_comments``/``node_comment_bans``;
+* ``keyset`` — ``fetch_node_page`` continuing from the cursor of the previous
+  page, with counts read from ``node_admin_stats``.
+
+Pass ``--database-url`` (asyncpg DSN of a migrated database) to measure real
+data; depths beyond the table size are skipped, and ``--search`` also times a
+title/slug search served by the trigram indexes. Without it a temporary
+SQLite file is seeded with enough nodes for the deepest page. Results go to
+``var/admin-nodes-listing-benchmark.json``.
+
+    python scripts/admin_nodes_listing_benchmark.py --page-size 20 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_BACKEND_ROOT = _REPO_ROOT / "apps" / "backend"
+for candidate in (_REPO_ROOT, _BACKEND_ROOT):
+    candidate_str = str(candidate)
+    if candidate_str not in sys.path:
+        sys.path.insert(0, candidate_str)
+
+from sqlalchemy import text  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine  # noqa: E402
+
+from domains.product.nodes.adapters.sql.admin_stats import SQLNodeAdminStats  # noqa: E402
+from domains.product.nodes.application.admin_queries.listing import (  # noqa: E402
+    NodeListCursor,
+    NodeListFilters,
+    fetch_node_page,
+)
+
+DEPTHS = (10, 1_000, 10_000)
+
+_OFFSET_SQL = """
+    SELECT n.id, n.slug, n.title, n.status, n.is_public, n.updated_at,
+           n.created_at, n.views_count, n.moderation_status,
+           (SELECT COUNT(*) FROM node_comments c WHERE c.node_id = n.id)
+               AS total_comments,
+           (SELECT COUNT(*) FROM node_comments c
+             WHERE c.node_id = n.id AND c.status = 'pending') AS pending_count,
+           (SELECT COUNT(*) FROM node_comments c
+             WHERE c.node_id = n.id AND c.status = 'hidden') AS hidden_count,
+           (SELECT COUNT(*) FROM node_comment_bans b WHERE b.node_id = n.id)
+               AS bans_count,
+           (SELECT MAX(c.created_at) FROM node_comments c WHERE c.node_id = n.id)
+               AS last_comment_created_at
+      FROM nodes AS n
+     ORDER BY n.updated_at DESC, n.id DESC
+     LIMIT :limit OFFSET :offset
+"""
+
+_SQLITE_SCHEMA = (
+    """
+    CREATE TABLE nodes (
+        id INTEGER PRIMARY KEY, slug TEXT NOT NULL, title TEXT, author_id TEXT,
+        status TEXT NOT NULL DEFAULT 'published', is_public BOOLEAN DEFAULT 1,
+        updated_at TIMESTAMP NOT NULL, created_at TIMESTAMP NOT NULL,
+        views_count INTEGER NOT NULL DEFAULT 0, embedding_ready BOOLEAN,
+        embedding_status TEXT, moderation_status TEXT NOT NULL DEFAULT 'pending',
+        moderation_status_updated_at TIMESTAMP
+    )
+    """,
+    "CREATE INDEX ix_nodes_updated_at_id ON nodes (updated_at, id)",
+    "CREATE TABLE product_node_tags (node_id INTEGER NOT NULL, slug TEXT NOT NULL)",
+    "CREATE INDEX ix_tags_node ON product_node_tags (node_id, slug)",
+    """
+    CREATE TABLE node_comments (
+        id INTEGER PRIMARY KEY, node_id INTEGER NOT NULL, status TEXT NOT NULL,
+        created_at TIMESTAMP NOT NULL, updated_at TIMESTAMP NOT NULL
+    )
+    """,
+    "CREATE INDEX ix_comments_node ON node_comments (node_id, status)",
+    "CREATE TABLE node_comment_bans (node_id INTEGER NOT NULL, target_user_id TEXT)",
+    "CREATE INDEX ix_bans_node ON node_comment_bans (node_id)",
+    """
+    CREATE TABLE node_admin_stats (
+        node_id INTEGER PRIMARY KEY, total_comments INTEGER NOT NULL DEFAULT 0,
+        pending_count INTEGER NOT NULL DEFAULT 0, published_count INTEGER NOT NULL DEFAULT 0,
+        hidden_count INTEGER NOT NULL DEFAULT 0, deleted_count INTEGER NOT NULL DEFAULT 0,
+        blocked_count INTEGER NOT NULL DEFAULT 0, bans_count INTEGER NOT NULL DEFAULT 0,
+        last_comment_created_at TIMESTAMP, last_comment_updated_at TIMESTAMP,
+        refreshed_at TIMESTAMP NOT NULL
+    )
+    """,
+)
+
+
+async def _seed(engine: AsyncEngine, nodes: int, comments_per_node: int) -> None:
+    base = datetime(2026, 1, 1, tzinfo=UTC)
+    statuses = ("published", "pending", "hidden")
+    async with engine.begin() as conn:
+        for statement in _SQLITE_SCHEMA:
+            await conn.execute(text(statement))
+        for start in range(1, nodes + 1, 5_000):
+            ids = range(start, min(nodes, start + 4_999) + 1)
+            await conn.execute(
+                text(
+                    "INSERT INTO nodes (id, slug, title, updated_at, created_at, views_count)"
+                    " VALUES (:id, :slug, :title, :ts, :ts, :views)"
+                ),
+                [
+                    {
+                        "id": i,
+                        "slug": f"node-{i}",
+                        "title": f"Node {i}",
+                        "ts": base + timedelta(seconds=i),
+                        "views": i % 97,
+                    }
+                    for i in ids
+                ],
+            )
+            await conn.execute(
+                text(
+                    "INSERT INTO node_comments (node_id, status, created_at, updated_at)"
+                    " VALUES (:node_id, :status, :ts, :ts)"
+                ),
+                [
+                    {"node_id": i, "status": statuses[k % 3], "ts": base}
+                    for i in ids
+                    for k in range(comments_per_node)
+                ],
+            )
+    stats = SQLNodeAdminStats(engine)
+    for start in range(1, nodes + 1, 5_000):
+        await stats.refresh(range(start, min(nodes, start + 4_999) + 1))
+
+
+async def _time(call: Any, repeat: int) -> float:
+    await call()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(samples), 3)
+
+
+async def _run(engine: AsyncEngine, args: argparse.Namespace) -> dict[str, Any]:
+    filters = NodeListFilters.create(sort="updated_at", order="desc")
+    async with engine.connect() as conn:
+        total = int((await conn.execute(text("SELECT COUNT(*) FROM nodes"))).scalar_one())
+    results: dict[str, Any] = {}
+    for depth in DEPTHS:
+        offset = (depth - 1) * args.page_size
+        if offset >= total:
+            results[f"page_{depth}"] = "skipped"
+            continue
+        cursor = None
+        if offset:
+            # The cursor a client would hold after walking to the previous page.
+            async with engine.connect() as conn:
+                previous = await fetch_node_page(
+                    conn, filters, cursor=None, limit=1, offset=offset - 1
+                )
+            cursor = NodeListCursor.from_row(previous[0], filters)
+
+        async def offset_page(offset: int = offset) -> None:
+            async with engine.connect() as conn:
+                await conn.execute(
+                    text(_OFFSET_SQL), {"limit": args.page_size, "offset": offset}
+                )
+
+        async def keyset_page(cursor: NodeListCursor | None = cursor) -> None:
+            async with engine.connect() as conn:
+                await fetch_node_page(
+                    conn, filters, cursor=cursor, limit=args.page_size, include_stats=True
+                )
+
+        results[f"page_{depth}"] = {
+            "offset_ms": await _time(offset_page, args.repeat),
+            "keyset_ms": await _time(keyset_page, args.repeat),
+        }
+    if args.database_url and args.search:
+        search = NodeListFilters.create(q=args.search)
+
+        async def search_page() -> None:
+            async with engine.connect() as conn:
+                await fetch_node_page(conn, search, cursor=None, limit=args.page_size)
+
+        results["search_ms"] = await _time(search_page, args.repeat)
+    return {"nodes": total, **results}
+
+
+async def _main(args: argparse.Namespace, tmp: str) -> dict[str, Any]:
+    if args.database_url:
+        engine = create_async_engine(args.database_url)
+    else:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{Path(tmp) / 'bench.sqlite'}")
+        await _seed(engine, DEPTHS[-1] * args.page_size, args.comments_per_node)
+    try:
+        return await _run(engine, args)
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--comments-per-node", type=int, default=3)
+    parser.add_argument("--search", default=None, help="title/slug search term (Postgres)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = asyncio.run(_main(args, tmp))
+    payload = {
+        "backend": "postgres" if args.database_url else "sqlite",
+        "page_size": args.page_size,
+        "results": results,
+    }
+    output_path = _REPO_ROOT / "var" / "admin-nodes-listing-benchmark.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    print(json.dumps(payload, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""Time-to-first-byte, throughput and peak RSS of streaming audit exports.
+
+Streams ``--rows`` synthetic audit rows through ``AuditExportService`` (a
+generated keyset source unless ``--database-url`` points at a Postgres with
+``audit_logs``) and then, for comparison, builds the same export the legacy way
+(all rows in memory, one ``StringIO``) for ``--legacy-rows``. The legacy run
+goes last because ``ru_maxrss`` only ever grows. Results go to
+``var/audit-export-benchmark.json``.
+
+    python scripts/audit_export_benchmark.py --rows 2000000 --format csv --gzip
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import csv
+import json
+import resource
+import sys
+import time
+from datetime import UTC, datetime, timedelta
+from io import StringIO
+from pathlib import Path
+from typing import Any
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_BACKEND_ROOT = _REPO_ROOT / "apps" / "backend"
+for candidate in (_REPO_ROOT, _BACKEND_ROOT):
+    candidate_str = str(candidate)
+    if candidate_str not in sys.path:
+        sys.path.insert(0, candidate_str)
+
+from domains.platform.audit.application.export import (  # noqa: E402
+    EXPORT_COLUMNS,
+    AuditExportFilters,
+    AuditExportService,
+    build_export_item,
+)
+
+_START = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _row(index: int) -> dict[str, Any]:
+    return {
+        "id": f"00000000-0000-4000-8000-{index:012d}",
+        "created_at": _START - timedelta(milliseconds=index),
+        "actor_id": "11111111-1111-4111-8111-111111111111",
+        "action": "nodes.update" if index % 7 else "auth.login_failed",
+        "resource_type": "node",
+        "resource_id": str(index % 50_000),
+        "before": '{"status": "draft"}',
+        "after": '{"status": "published"}',
+        "reason": None,
+        "ip": "10.0.0.1",
+        "user_agent": "Mozilla/5.0 (X11; Linux x86_64)",
+        "extra": '{"source": "benchmark"}',
+    }
+
+
+class _SyntheticRepo:
+    """Keyset source that generates rows on demand instead of holding them."""
+
+    def __init__(self, rows: int) -> None:
+        self._rows = rows
+
+    async def list_after(self, *, after=None, limit: int = 1000, **_: Any):
+        start = 0
+        if after is not None:
+            start = int(str(after[1]).rsplit("-", 1)[1]) + 1
+        stop = min(self._rows, start + limit)
+        return [_row(index) for index in range(start, stop)]
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+async def _streaming(repo: Any, args: argparse.Namespace) -> dict[str, Any]:
+    service = AuditExportService(repo, batch_size=args.batch_size)
+    started = time.perf_counter()
+    ttfb: float | None = None
+    total = 0
+    async for chunk in service.stream(
+        AuditExportFilters(), fmt=args.format, limit=args.rows, compress=args.gzip
+    ):
+        if ttfb is None:
+            ttfb = time.perf_counter() - started
+        total += len(chunk)
+    elapsed = time.perf_counter() - started
+    return {
+        "rows": args.rows,
+        "ttfb_ms": round((ttfb or 0.0) * 1000, 2),
+        "seconds": round(elapsed, 2),
+        "rows_per_sec": round(args.rows / elapsed, 1) if elapsed else 0.0,
+        "bytes": total,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def _legacy(rows: int) -> dict[str, Any]:
+    started = time.perf_counter()
+    items = [build_export_item(_row(index), "") for index in range(rows)]
+    buffer = StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(EXPORT_COLUMNS))
+    writer.writeheader()
+    for item in items:
+        writer.writerow({key: item.get(key) for key in EXPORT_COLUMNS})
+    body = buffer.getvalue().encode("utf-8")
+    elapsed = time.perf_counter() - started
+    return {
+        "rows": rows,
+        # The legacy endpoint sent nothing until the whole body was built.
+        "ttfb_ms": round(elapsed * 1000, 2),
+        "bytes": len(body),
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+async def _run(args: argparse.Namespace) -> dict[str, Any]:
+    if args.database_url:
+        from domains.platform.audit.adapters.sql.repository import SQLAuditRepo
+
+        repo: Any = SQLAuditRepo(args.database_url)
+        backend = "postgres"
+    else:
+        repo = _SyntheticRepo(args.rows)
+        backend = "synthetic"
+    results: dict[str, Any] = {
+        "backend": backend,
+        "format": args.format,
+        "gzip": args.gzip,
+        "batch_size": args.batch_size,
+        "baseline_rss_mb": _peak_rss_mb(),
+        "streaming": await _streaming(repo, args),
+    }
+    if args.legacy_rows:
+        results["legacy"] = _legacy(args.legacy_rows)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--legacy-rows", type=int, default=20_000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--format", choices=("csv", "ndjson", "json"), default="csv")
+    parser.add_argument("--gzip", action="store_true")
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+    args.rows = max(1, args.rows)
+
+    results = asyncio.run(_run(args))
+    output_path = _REPO_ROOT / "var" / "audit-export-benchmark.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+"""End-to-end cost of a bulk admin update: per-node events vs batch envelopes.
+
+Replays what ``bulk_update_status`` publishes for ``--nodes`` ids (10 000 by
+default) and what the node cache consumer then does, in two shapes:
+
+* ``per_item`` — the previous flow: one ``node.updated.v1`` XADD per node and
+  one cache invalidation (slug lookup + DEL) per consumed event;
+* ``batch`` — ``Events.publish_many`` with ``node.updated.batch.v1``
+  envelopes of ``BATCH_EVENT_MAX_IDS`` ids (pipelined XADDs) and one
+  ``invalidate_many`` per envelope. ``--with-item-events`` also publishes
+  the per-node events kept for legacy consumers.
+
+The outbox and the node cache run on fakeredis unless ``--redis-url`` points
+at a real server; fakeredis has no network round trip, so it understates the
+gain of pipelining. ``--database-url`` (asyncpg DSN of a migrated database)
+adds the tag write of ``bulk_update_tags`` — one INSERT per (node, tag) vs
+the single set-based INSERT — run inside a transaction that is rolled back.
+Results go to ``var/bulk-events-benchmark.json``.
+
+    python scripts/bulk_events_benchmark.py --nodes 10000 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Any
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_BACKEND_ROOT = _REPO_ROOT / "apps" / "backend"
+for candidate in (_REPO_ROOT, _BACKEND_ROOT):
+    candidate_str = str(candidate)
+    if candidate_str not in sys.path:
+        sys.path.insert(0, candidate_str)
+
+import fakeredis  # noqa: E402
+import redis  # noqa: E402
+import redis.asyncio as aioredis  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+from sqlalchemy.ext.asyncio import create_async_engine  # noqa: E402
+
+from domains.platform.events.adapters.event_bus_memory import (  # noqa: E402
+    InMemoryEventBus,
+)
+from domains.platform.events.adapters.outbox_redis import RedisOutbox  # noqa: E402
+from domains.platform.events.service import Events  # noqa: E402
+from domains.product.nodes.adapters.cache_events import invalidate_batch  # noqa: E402
+from domains.product.nodes.application.interactors.events import (  # noqa: E402
+    BATCH_EVENT_MAX_IDS,
+    NODE_UPDATED_BATCH_TOPIC,
+)
+from domains.product.nodes.application.ports import NodeDTO  # noqa: E402
+from domains.product.nodes.infrastructure.cache import (  # noqa: E402
+    NodeCacheConfig,
+    RedisNodeCache,
+)
+
+_FIELDS = ["status", "publish_at", "unpublish_at"]
+
+
+def _clients(args: argparse.Namespace) -> tuple[Any, Any]:
+    if args.redis_url:
+        return (
+            redis.Redis.from_url(args.redis_url, decode_responses=True),
+            aioredis.from_url(args.redis_url, decode_responses=False),
+        )
+    server = fakeredis.FakeServer()
+    return (
+        fakeredis.FakeRedis(server=server, decode_responses=True),
+        fakeredis.aioredis.FakeRedis(server=server),
+    )
+
+
+async def _fill_cache(cache: RedisNodeCache, ids: list[int]) -> None:
+    for node_id in ids:
+        await cache.set(
+            NodeDTO(
+                id=node_id,
+                slug=f"node-{node_id}",
+                author_id="bench",
+                title=None,
+                tags=[],
+                is_public=True,
+            )
+        )
+
+
+async def _per_item(events: Events, cache: RedisNodeCache, ids: list[int]) -> float:
+    started = time.perf_counter()
+    for node_id in ids:
+        events.publish("node.updated.v1", {"id": node_id, "fields": _FIELDS}, f"node:{node_id}")
+    for node_id in ids:
+        await cache.invalidate(node_id)
+    return (time.perf_counter() - started) * 1000
+
+
+async def _batch(
+    events: Events, cache: RedisNodeCache, ids: list[int], with_items: bool
+) -> float:
+    started = time.perf_counter()
+    envelopes: list[dict[str, Any]] = []
+    outgoing: list[tuple[str, dict[str, Any], str | None]] = []
+    for start in range(0, len(ids), BATCH_EVENT_MAX_IDS):
+        chunk = ids[start : start + BATCH_EVENT_MAX_IDS]
+        batch_id = uuid.uuid4().hex
+        payload = {
+            "batch_id": batch_id,
+            "ids": chunk,
+            "slugs": [f"node-{node_id}" for node_id in chunk],
+            "fields": _FIELDS,
+            "status": "archived",
+            "is_public": False,
+            "source": "bulk_status",
+        }
+        envelopes.append(payload)
+        outgoing.append((NODE_UPDATED_BATCH_TOPIC, payload, f"nodes:batch:{batch_id}"))
+        if with_items:
+            outgoing.extend(
+                (
+                    "node.updated.v1",
+                    {"id": node_id, "fields": _FIELDS, "batch_id": batch_id},
+                    f"node:{node_id}",
+                )
+                for node_id in chunk
+            )
+    events.publish_many(outgoing)
+    for payload in envelopes:
+        await invalidate_batch(cache, payload)
+    return (time.perf_counter() - started) * 1000
+
+
+async def _run_events(args: argparse.Namespace) -> dict[str, Any]:
+    sync_client, async_client = _clients(args)
+    events = Events(
+        outbox=RedisOutbox("redis://bench", redis_client=sync_client),
+        bus=InMemoryEventBus(),
+    )
+    cache = RedisNodeCache(async_client, NodeCacheConfig(namespace="bench:nodes"))
+    ids = list(range(1, args.nodes + 1))
+    samples: dict[str, list[float]] = {"per_item_ms": [], "batch_ms": []}
+    for _ in range(args.repeat):
+        await _fill_cache(cache, ids)
+        samples["per_item_ms"].append(await _per_item(events, cache, ids))
+        await _fill_cache(cache, ids)
+        samples["batch_ms"].append(await _batch(events, cache, ids, args.with_item_events))
+        for stream in ("events:node.updated.v1", f"events:{NODE_UPDATED_BATCH_TOPIC}"):
+            sync_client.delete(stream)
+    await async_client.aclose()
+    return {name: round(statistics.median(values), 2) for name, values in samples.items()}
+
+
+async def _run_tags(args: argparse.Namespace) -> dict[str, Any]:
+    engine = create_async_engine(args.database_url)
+    slugs = ["bench-a", "bench-b"]
+    results: dict[str, Any] = {}
+    try:
+        async with engine.connect() as conn:
+            ids = [
+                int(row[0])
+                for row in await conn.execute(
+                    text("SELECT id FROM nodes ORDER BY id LIMIT :limit"),
+                    {"limit": args.nodes},
+                )
+            ]
+        results["nodes"] = len(ids)
+
+        async def per_row() -> float:
+            async with engine.connect() as conn:
+                tx = await conn.begin()
+                started = time.perf_counter()
+                for node_id in ids:
+                    for slug in slugs:
+                        await conn.execute(
+                            text(
+                                "INSERT INTO product_node_tags(node_id, slug)"
+                                " VALUES (:id, :slug) ON CONFLICT DO NOTHING"
+                            ),
+                            {"id": node_id, "slug": slug},
+                        )
+                elapsed = (time.perf_counter() - started) * 1000
+                await tx.rollback()
+            return elapsed
+
+        async def set_based() -> float:
+            async with engine.connect() as conn:
+                tx = await conn.begin()
+                started = time.perf_counter()
+                await conn.execute(
+                    text(
+                        """
+                        INSERT INTO product_node_tags (node_id, slug)
+                        SELECT n.id, s.slug
+                          FROM nodes AS n
+                         CROSS JOIN unnest(cast(:slugs as text[])) AS s(slug)
+                         WHERE n.id = ANY(:ids)
+                        ON CONFLICT DO NOTHING
+                        RETURNING node_id, slug
+                        """
+                    ),
+                    {"ids": ids, "slugs": slugs},
+                )
+                elapsed = (time.perf_counter() - started) * 1000
+                await tx.rollback()
+            return elapsed
+
+        results["tags_per_row_ms"] = round(
+            statistics.median([await per_row() for _ in range(args.repeat)]), 2
+        )
+        results["tags_set_based_ms"] = round(
+            statistics.median([await set_based() for _ in range(args.repeat)]), 2
+        )
+    finally:
+        await engine.dispose()
+    return results
+
+
+async def _main(args: argparse.Namespace) -> dict[str, Any]:
+    results: dict[str, Any] = {"events_and_cache": await _run_events(args)}
+    if args.database_url:
+        results["tag_writes"] = await _run_tags(args)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--redis-url", default=None)
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument(
+        "--with-item-events",
+        action="store_true",
+        help="also publish per-node events for legacy consumers",
+    )
+    args = parser.parse_args()
+
+    payload = {
+        "redis": "server" if args.redis_url else "fakeredis",
+        "nodes": args.nodes,
+        "batch_size": BATCH_EVENT_MAX_IDS,
+        "with_item_events": args.with_item_events,
+        "results": asyncio.run(_main(args)),
+    }
+    output_path = _REPO_ROOT / "var" / "bulk-events-benchmark.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    print(json.dumps(payload, indent=2))
+
+
+if __name__ == "__main__":
+    main()
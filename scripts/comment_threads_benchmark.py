@@ -0,0 +1,289 @@
+"""Threaded comment loading latency: per-branch OFFSET queries vs path windows.
+
+Renders a window of ``--window`` comments of one discussion, replies nested
+in place, in two shapes:
+
+* ``per_branch`` — the previous flow: ``list_for_node`` page of root
+  comments (``LIMIT/OFFSET``), then one query per expanded comment for its
+  replies, depth first, until the window is full;
+* ``threaded`` — ``fetch_thread_window``: one range scan over
+  ``(node_id, path)`` continuing from the cursor of the previous window.
+
+Both are timed for the first window and for a window deep into the thread
+(after ``--deep-roots`` root comments with all their replies). Pass
+``--database-url`` (asyncpg DSN of a migrated database) and ``--node-id`` to
+measure a real discussion. Without it a temporary SQLite file is seeded with
+one node holding ``--comments`` comments (10 000 by default). Results go to
+``var/comment-threads-benchmark.json``.
+
+    python scripts/comment_threads_benchmark.py --comments 10000 --window 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_BACKEND_ROOT = _REPO_ROOT / "apps" / "backend"
+for candidate in (_REPO_ROOT, _BACKEND_ROOT):
+    candidate_str = str(candidate)
+    if candidate_str not in sys.path:
+        sys.path.insert(0, candidate_str)
+
+from sqlalchemy import text  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine  # noqa: E402
+
+from domains.product.nodes.adapters.sql.comment_threads import (  # noqa: E402
+    fetch_thread_window,
+)
+from domains.product.nodes.application.comment_threads import (  # noqa: E402
+    ThreadCursor,
+    ThreadScope,
+    comment_path,
+)
+
+_NODE_ID = 1
+_MAX_DEPTH = 5
+
+# Portable form of SQLNodeCommentsRepo.list_for_node.
+_CHILDREN_SQL = """
+    SELECT id, node_id, parent_comment_id, depth, content, status, created_at
+      FROM node_comments
+     WHERE node_id = :node_id AND {parent}
+       AND status NOT IN ('deleted', 'hidden', 'blocked')
+     ORDER BY created_at ASC
+     LIMIT :limit OFFSET :offset
+"""
+
+_SQLITE_SCHEMA = (
+    """
+    CREATE TABLE node_comments (
+        id INTEGER PRIMARY KEY, node_id INTEGER NOT NULL, author_id TEXT NOT NULL,
+        parent_comment_id INTEGER, depth INTEGER NOT NULL, content TEXT NOT NULL,
+        status TEXT NOT NULL DEFAULT 'published', metadata TEXT NOT NULL DEFAULT '{}',
+        created_at TIMESTAMP NOT NULL, updated_at TIMESTAMP NOT NULL,
+        path TEXT NOT NULL, reply_count INTEGER NOT NULL DEFAULT 0,
+        descendant_count INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    "CREATE INDEX ix_node_comments_node_created ON node_comments (node_id, created_at)",
+    "CREATE INDEX ix_node_comments_parent ON node_comments (parent_comment_id, created_at)",
+    "CREATE INDEX ix_node_comments_node_path ON node_comments (node_id, path)",
+    """
+    CREATE TABLE node_comment_counters (
+        node_id INTEGER PRIMARY KEY, comments_count INTEGER NOT NULL DEFAULT 0,
+        threads_count INTEGER NOT NULL DEFAULT 0, updated_at TIMESTAMP NOT NULL
+    )
+    """,
+)
+
+
+async def _seed(engine: AsyncEngine, comments: int, replies_ratio: float) -> None:
+    """One discussion: each comment replies to a random recent one or starts a thread."""
+
+    rng = random.Random(7)
+    base = datetime(2026, 1, 1, tzinfo=UTC)
+    rows: list[dict[str, Any]] = []
+    paths: dict[int, tuple[str, int]] = {}
+    for comment_id in range(1, comments + 1):
+        parent_id = None
+        if paths and rng.random() < replies_ratio:
+            candidate = rng.randint(max(1, comment_id - 200), comment_id - 1)
+            if paths[candidate][1] < _MAX_DEPTH:
+                parent_id = candidate
+        parent_path, parent_depth = paths.get(parent_id, (None, -1))  # type: ignore[arg-type]
+        path = comment_path(parent_path, comment_id)
+        paths[comment_id] = (path, parent_depth + 1)
+        rows.append(
+            {
+                "id": comment_id,
+                "parent": parent_id,
+                "depth": parent_depth + 1,
+                "ts": base + timedelta(seconds=comment_id),
+                "path": path,
+            }
+        )
+    async with engine.begin() as conn:
+        for statement in _SQLITE_SCHEMA:
+            await conn.execute(text(statement))
+        await conn.execute(
+            text(
+                "INSERT INTO node_comments (id, node_id, author_id, parent_comment_id,"
+                " depth, content, created_at, updated_at, path)"
+                f" VALUES (:id, {_NODE_ID}, 'u', :parent, :depth, 'text', :ts, :ts, :path)"
+            ),
+            rows,
+        )
+
+
+async def _per_branch(
+    engine: AsyncEngine, node_id: int, window: int, root_offset: int
+) -> int:
+    """Depth-first expansion with one query per listed parent, as the UI did."""
+
+    collected = 0
+    queries = 0
+    async with engine.connect() as conn:
+
+        async def children(parent_id: int | None, limit: int, offset: int) -> list[Any]:
+            nonlocal queries
+            queries += 1
+            parent = (
+                "parent_comment_id IS NULL"
+                if parent_id is None
+                else "parent_comment_id = :parent_id"
+            )
+            params = {"node_id": node_id, "limit": limit, "offset": offset}
+            if parent_id is not None:
+                params["parent_id"] = parent_id
+            return list(
+                await conn.execute(text(_CHILDREN_SQL.format(parent=parent)), params)
+            )
+
+        async def expand(parent_id: int) -> None:
+            nonlocal collected
+            for reply in await children(parent_id, window, 0):
+                if collected >= window:
+                    return
+                collected += 1
+                await expand(int(reply[0]))
+
+        offset = root_offset
+        while collected < window:
+            roots = await children(None, window, offset)
+            if not roots:
+                break
+            offset += len(roots)
+            for root in roots:
+                if collected >= window:
+                    break
+                collected += 1
+                await expand(int(root[0]))
+    return queries
+
+
+async def _deep_cursor(
+    engine: AsyncEngine, node_id: int, deep_roots: int
+) -> ThreadCursor | None:
+    """Cursor a client would hold after reading ``deep_roots`` whole threads."""
+
+    async with engine.connect() as conn:
+        row = (
+            await conn.execute(
+                text(
+                    """
+                    SELECT MAX(c.path)
+                      FROM node_comments AS c
+                     WHERE c.node_id = :node_id
+                       AND c.path < (
+                           SELECT path FROM node_comments
+                            WHERE node_id = :node_id AND parent_comment_id IS NULL
+                            ORDER BY path LIMIT 1 OFFSET :offset
+                       )
+                    """
+                ),
+                {"node_id": node_id, "offset": deep_roots},
+            )
+        ).first()
+    if row is None or row[0] is None:
+        return None
+    return ThreadCursor(path=str(row[0]))
+
+
+async def _time(call: Any, repeat: int) -> float:
+    await call()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(samples), 3)
+
+
+async def _run(engine: AsyncEngine, args: argparse.Namespace) -> dict[str, Any]:
+    node_id = args.node_id if args.database_url else _NODE_ID
+    scope = ThreadScope(node_id=node_id)
+    async with engine.connect() as conn:
+        total = int(
+            (
+                await conn.execute(
+                    text("SELECT COUNT(*) FROM node_comments WHERE node_id = :node_id"),
+                    {"node_id": node_id},
+                )
+            ).scalar_one()
+        )
+    results: dict[str, Any] = {"comments": total}
+    deep = await _deep_cursor(engine, node_id, args.deep_roots)
+    for label, root_offset, cursor in (
+        ("first_window", 0, None),
+        ("deep_window", args.deep_roots, deep),
+    ):
+        if label == "deep_window" and deep is None:
+            results[label] = "skipped"
+            continue
+        queries = await _per_branch(engine, node_id, args.window, root_offset)
+
+        async def per_branch(offset: int = root_offset) -> None:
+            await _per_branch(engine, node_id, args.window, offset)
+
+        async def threaded(position: ThreadCursor | None = cursor) -> None:
+            async with engine.connect() as conn:
+                await fetch_thread_window(conn, scope, cursor=position, limit=args.window)
+
+        results[label] = {
+            "per_branch_ms": await _time(per_branch, args.repeat),
+            "per_branch_queries": queries,
+            "threaded_ms": await _time(threaded, args.repeat),
+            "threaded_queries": 1,
+        }
+    return results
+
+
+async def _main(args: argparse.Namespace, tmp: str) -> dict[str, Any]:
+    if args.database_url:
+        engine = create_async_engine(args.database_url)
+    else:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{Path(tmp) / 'bench.sqlite'}")
+        await _seed(engine, args.comments, args.replies_ratio)
+    try:
+        return await _run(engine, args)
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--node-id", type=int, default=_NODE_ID)
+    parser.add_argument("--comments", type=int, default=10_000)
+    parser.add_argument("--replies-ratio", type=float, default=0.8)
+    parser.add_argument("--window", type=int, default=50)
+    parser.add_argument("--deep-roots", type=int, default=1_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = asyncio.run(_main(args, tmp))
+    payload = {
+        "backend": "postgres" if args.database_url else "sqlite",
+        "window": args.window,
+        "results": results,
+    }
+    output_path = _REPO_ROOT / "var" / "comment-threads-benchmark.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    print(json.dumps(payload, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Per-request overhead of the HTTP metrics middleware.
+
+Builds one FastAPI app with a JSON route and a streaming route and drives it
+directly through ASGI (no network, no HTTP client), timing ``--rounds``
+rounds of ``--requests`` requests per variant:
+
+* ``bare`` — no instrumentation;
+* ``pure_asgi`` — ``HTTPMetricsMiddleware``;
+* ``base_http`` — the previous ``BaseHTTPMiddleware``-based recorder.
+
+Overhead is reported relative to ``bare``. Results go to
+``var/http-metrics-benchmark.json``.
+
+    python scripts/http_metrics_benchmark.py --requests 2000 --rounds 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_BACKEND_ROOT = _REPO_ROOT / "apps" / "backend"
+for candidate in (_REPO_ROOT, _BACKEND_ROOT):
+    candidate_str = str(candidate)
+    if candidate_str not in sys.path:
+        sys.path.insert(0, candidate_str)
+
+from fastapi import FastAPI, Request  # noqa: E402
+from fastapi.responses import StreamingResponse  # noqa: E402
+
+from app.api_gateway import metrics_middleware  # noqa: E402
+
+
+def _build_app(variant: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int) -> dict[str, Any]:
+        return {"id": item_id, "title": "bench"}
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks():
+            for _ in range(4):
+                yield b"x" * 256
+
+        return StreamingResponse(chunks())
+
+    if variant == "pure_asgi":
+        app.add_middleware(metrics_middleware.HTTPMetricsMiddleware)
+    elif variant == "base_http":
+        requests = metrics_middleware.HTTP_REQUESTS
+        duration = metrics_middleware.HTTP_REQUEST_DURATION
+
+        @app.middleware("http")
+        async def _legacy(request: Request, call_next: Callable):
+            started = time.perf_counter()
+            status = "500"
+            try:
+                response = await call_next(request)
+                status = str(response.status_code)
+                return response
+            finally:
+                ms = (time.perf_counter() - started) * 1000.0
+                requests.labels("GET", request.url.path, status).inc()
+                duration.labels("GET", request.url.path, status[0] + "xx").observe(ms)
+
+    return app
+
+
+async def _call(app: FastAPI, path: str) -> None:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1),
+        "server": ("bench", 80),
+    }
+
+    messages = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive() -> dict[str, Any]:
+        if messages:
+            return messages.pop()
+        await asyncio.Event().wait()  # the client stays connected
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict[str, Any]) -> None:
+        return None
+
+    await app(scope, receive, send)
+
+
+async def _measure(app: FastAPI, path: str, requests: int) -> float:
+    started = time.perf_counter()
+    for index in range(requests):
+        await _call(app, path.format(index=index % 100))
+    return (time.perf_counter() - started) * 1e6 / requests
+
+
+async def _run(requests: int, rounds: int) -> dict[str, Any]:
+    metrics_middleware._ensure_metrics()
+    apps = {name: _build_app(name) for name in ("bare", "pure_asgi", "base_http")}
+    results: dict[str, Any] = {"requests": requests, "rounds": rounds}
+    for label, path in (("json", "/items/{index}"), ("stream", "/stream")):
+        for app in apps.values():
+            await _measure(app, path, 100)
+        # Variants alternate within each round; the best round counts.
+        timings = {name: float("inf") for name in apps}
+        for _ in range(rounds):
+            for name, app in apps.items():
+                timings[name] = min(timings[name], await _measure(app, path, requests))
+        results[label] = {
+            **{f"{name}_us": round(value, 1) for name, value in timings.items()},
+            "pure_asgi_overhead_us": round(timings["pure_asgi"] - timings["bare"], 1),
+            "base_http_overhead_us": round(timings["base_http"] - timings["bare"], 1),
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    payload = asyncio.run(_run(args.requests, args.rounds))
+    output_path = _REPO_ROOT / "var" / "http-metrics-benchmark.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    print(json.dumps(payload, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""Bytes on the wire for media revisits and seeks: FileResponse vs MediaFileResponse.
+
+Stores ``--files`` blobs of ``--size-mb`` MiB in a temporary content-addressed
+store and replays two client patterns against both response classes in-process
+(httpx over ASGI):
+
+* ``revisit`` — every file is fetched once, then ``--revisits`` more times with
+  the validators a browser cache would send (``If-None-Match``);
+* ``seek`` — a player fetches ``--seeks`` random 256 KiB windows guarded by
+  ``If-Range``.
+
+Reports bytes transferred, status counts and requests/sec for each variant.
+Results go to ``var/media-serving-benchmark.json``.
+
+    python scripts/media_serving_benchmark.py --files 20 --size-mb 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_BACKEND_ROOT = _REPO_ROOT / "apps" / "backend"
+for candidate in (_REPO_ROOT, _BACKEND_ROOT):
+    candidate_str = str(candidate)
+    if candidate_str not in sys.path:
+        sys.path.insert(0, candidate_str)
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from starlette.responses import FileResponse  # noqa: E402
+
+from domains.platform.media.adapters.local_storage import (  # noqa: E402
+    LocalStorageGateway,
+)
+from domains.platform.media.api.serving import MediaFileResponse  # noqa: E402
+
+_WINDOW = 256 * 1024
+
+
+def _app(base_dir: Path, response_cls: type) -> FastAPI:
+    app = FastAPI()
+
+    @app.api_route("/file/{name:path}", methods=["GET", "HEAD"])
+    async def serve(name: str):
+        return response_cls(base_dir / name)
+
+    return app
+
+
+async def _revisit(client: httpx.AsyncClient, names: list[str], revisits: int) -> Counter:
+    stats: Counter = Counter()
+    for name in names:
+        first = await client.get(f"/file/{name}")
+        stats["bytes"] += len(first.content)
+        stats[str(first.status_code)] += 1
+        etag = first.headers.get("etag")
+        for _ in range(revisits):
+            headers = {"If-None-Match": etag} if etag else {}
+            response = await client.get(f"/file/{name}", headers=headers)
+            stats["bytes"] += len(response.content)
+            stats[str(response.status_code)] += 1
+    return stats
+
+
+async def _seek(
+    client: httpx.AsyncClient, names: list[str], size: int, seeks: int, seed: int
+) -> Counter:
+    rng = random.Random(seed)
+    stats: Counter = Counter()
+    for name in names:
+        head = await client.head(f"/file/{name}")
+        validator = head.headers.get("etag") or head.headers.get("last-modified", "")
+        for _ in range(seeks):
+            start = rng.randrange(0, max(1, size - _WINDOW))
+            headers = {"Range": f"bytes={start}-{start + _WINDOW - 1}", "If-Range": validator}
+            response = await client.get(f"/file/{name}", headers=headers)
+            stats["bytes"] += len(response.content)
+            stats[str(response.status_code)] += 1
+    return stats
+
+
+async def _run(args: argparse.Namespace) -> dict[str, Any]:
+    size = int(args.size_mb * 1024 * 1024)
+    results: dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = LocalStorageGateway(tmp)
+        names = []
+        for _ in range(args.files):
+            url = storage.save(io.BytesIO(os.urandom(size)), "clip.webp", "image/webp")
+            names.append(url.removeprefix(storage.public_route_prefix + "/"))
+
+        for label, response_cls in (
+            ("file_response", FileResponse),
+            ("media_file_response", MediaFileResponse),
+        ):
+            transport = httpx.ASGITransport(app=_app(storage.base_dir, response_cls))
+            async with httpx.AsyncClient(transport=transport, base_url="http://b") as client:
+                entry: dict[str, Any] = {}
+                for pattern in ("revisit", "seek"):
+                    started = time.perf_counter()
+                    if pattern == "revisit":
+                        stats = await _revisit(client, names, args.revisits)
+                    else:
+                        stats = await _seek(client, names, size, args.seeks, args.seed)
+                    elapsed = time.perf_counter() - started
+                    requests = sum(v for k, v in stats.items() if k != "bytes")
+                    entry[pattern] = {
+                        "requests": requests,
+                        "bytes_transferred": stats["bytes"],
+                        "statuses": {k: v for k, v in stats.items() if k != "bytes"},
+                        "requests_per_sec": round(requests / elapsed, 2),
+                    }
+                results[label] = entry
+    baseline = results["file_response"]
+    tuned = results["media_file_response"]
+    return {
+        "files": args.files,
+        "size_bytes": size,
+        "revisits": args.revisits,
+        "seeks": args.seeks,
+        "results": results,
+        "bytes_saved": {
+            pattern: baseline[pattern]["bytes_transferred"] - tuned[pattern]["bytes_transferred"]
+            for pattern in ("revisit", "seek")
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=20)
+    parser.add_argument("--size-mb", type=float, default=4.0)
+    parser.add_argument("--revisits", type=int, default=3)
+    parser.add_argument("--seeks", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    args.files = max(1, args.files)
+
+    results = asyncio.run(_run(args))
+    output_path = _REPO_ROOT / "var" / "media-serving-benchmark.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Event-loop latency while media uploads are being stored.
+
+Runs ``--concurrency`` simultaneous uploads of ``--size-mb`` each through the
+legacy path (whole body in memory, synchronous ``write`` on the loop) and
+through ``LocalStorageGateway.save_stream`` (chunked, hashed and written in a
+worker thread), while a probe task measures how late ``asyncio.sleep`` wakes
+up. Results go to ``var/media-upload-benchmark.json``.
+
+    python scripts/media_upload_benchmark.py --concurrency 8 --size-mb 32
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_BACKEND_ROOT = _REPO_ROOT / "apps" / "backend"
+for candidate in (_REPO_ROOT, _BACKEND_ROOT):
+    candidate_str = str(candidate)
+    if candidate_str not in sys.path:
+        sys.path.insert(0, candidate_str)
+
+from domains.platform.media.adapters.local_storage import (  # noqa: E402
+    LocalStorageGateway,
+)
+
+_PROBE_INTERVAL = 0.001
+
+
+async def _probe(stop: asyncio.Event, lags: list[float]) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + _PROBE_INTERVAL
+        await asyncio.sleep(_PROBE_INTERVAL)
+        lags.append(max(0.0, loop.time() - expected) * 1000)
+
+
+async def _body(payload: bytes, chunk: int) -> AsyncIterator[bytes]:
+    # Mimics UploadFile.read(chunk): yields to the loop between chunks.
+    for offset in range(0, len(payload), chunk):
+        await asyncio.sleep(0)
+        yield payload[offset : offset + chunk]
+
+
+async def _legacy_upload(base: Path, payload: bytes, chunk: int) -> None:
+    data = b"".join([part async for part in _body(payload, chunk)])
+    uid = uuid.uuid4().hex
+    target = base / uid[:2] / uid[2:4] / f"{uid}.png"
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with open(target, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+async def _scenario(
+    upload: Callable[[bytes], Awaitable[Any]], payloads: list[bytes]
+) -> dict[str, Any]:
+    stop = asyncio.Event()
+    lags: list[float] = []
+    probe = asyncio.create_task(_probe(stop, lags))
+    await asyncio.sleep(0.05)
+    started = time.perf_counter()
+    await asyncio.gather(*(upload(payload) for payload in payloads))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await probe
+    lags.sort()
+    total_mb = sum(len(p) for p in payloads) / (1024 * 1024)
+    return {
+        "seconds": round(elapsed, 3),
+        "mb_per_sec": round(total_mb / elapsed, 1) if elapsed else 0.0,
+        "loop_lag_ms": {
+            "p50": round(statistics.median(lags), 2) if lags else 0.0,
+            "p99": round(lags[int(0.99 * (len(lags) - 1))], 2) if lags else 0.0,
+            "max": round(lags[-1], 2) if lags else 0.0,
+            "samples": len(lags),
+        },
+    }
+
+
+async def _run(args: argparse.Namespace) -> dict[str, Any]:
+    size = int(args.size_mb * 1024 * 1024)
+    # Distinct payloads so the streaming path cannot dedup its way out.
+    payloads = [os.urandom(size) for _ in range(args.concurrency)]
+    chunk = args.chunk_kb * 1024
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        root = Path(tmp)
+        legacy_dir = root / "legacy"
+        legacy = await _scenario(
+            lambda payload: _legacy_upload(legacy_dir, payload, chunk), payloads
+        )
+        storage = LocalStorageGateway(str(root / "cas"), chunk_size=chunk)
+        streaming = await _scenario(
+            lambda payload: storage.save_stream(
+                _body(payload, chunk), "bench.png", "image/png"
+            ),
+            payloads,
+        )
+        dedup = await _scenario(
+            lambda payload: storage.save_stream(
+                _body(payload, chunk), "bench.png", "image/png"
+            ),
+            payloads,
+        )
+    return {
+        "concurrency": args.concurrency,
+        "size_mb": args.size_mb,
+        "chunk_kb": args.chunk_kb,
+        "legacy": legacy,
+        "streaming": streaming,
+        "streaming_dedup_hit": dedup,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--size-mb", type=float, default=32.0)
+    parser.add_argument("--chunk-kb", type=int, default=256)
+    parser.add_argument("--dir", default=None, help="Scratch directory (same disk)")
+    args = parser.parse_args()
+    args.concurrency = max(1, args.concurrency)
+
+    results = asyncio.run(_run(args))
+    output_path = _REPO_ROOT / "var" / "media-upload-benchmark.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Throughput and byte savings of the media image variant pipeline.
+
+Generates ``--images`` synthetic photos (``--width`` px wide JPEGs), renders
+every preset through ``ImageVariantService`` with process pools of increasing
+size and reports images/sec overall and per worker, plus the average bytes a
+client saves per request by fetching each preset instead of the original.
+Results go to ``var/media-variants-benchmark.json``.
+
+    python scripts/media_variants_benchmark.py --images 40 --workers 1,2,4
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_BACKEND_ROOT = _REPO_ROOT / "apps" / "backend"
+for candidate in (_REPO_ROOT, _BACKEND_ROOT):
+    candidate_str = str(candidate)
+    if candidate_str not in sys.path:
+        sys.path.insert(0, candidate_str)
+
+from PIL import Image, ImageDraw, ImageFilter  # noqa: E402
+
+from domains.platform.media.adapters.local_storage import (  # noqa: E402
+    LocalStorageGateway,
+)
+from domains.platform.media.adapters.variant_cache import (  # noqa: E402
+    VariantDiskCache,
+)
+from domains.platform.media.application.variants import (  # noqa: E402
+    DEFAULT_PRESETS,
+    ImageVariantService,
+)
+
+
+def _photo(width: int, seed: int) -> bytes:
+    rng = random.Random(seed)
+    height = width * 2 // 3
+    image = Image.effect_noise((width, height), 40).convert("RGB")
+    draw = ImageDraw.Draw(image)
+    for _ in range(60):
+        x, y = rng.randrange(width), rng.randrange(height)
+        radius = rng.randrange(20, width // 6)
+        color = tuple(rng.randrange(256) for _ in range(3))
+        draw.ellipse((x - radius, y - radius, x + radius, y + radius), fill=color)
+    image = image.filter(ImageFilter.GaussianBlur(2))
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=90)
+    return buffer.getvalue()
+
+
+async def _render_all(
+    root: Path, names: list[str], workers: int
+) -> tuple[float, ImageVariantService]:
+    cache = VariantDiskCache(root / f".variants-{workers}", budget_bytes=1 << 40)
+    service = ImageVariantService(root, cache, max_workers=workers)
+    # Warm the pool so process start-up is not counted.
+    await asyncio.gather(*(service.get(names[0], p.name) for p in DEFAULT_PRESETS))
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(service.get(name, preset.name) for name in names[1:] for preset in DEFAULT_PRESETS)
+    )
+    return time.perf_counter() - started, service
+
+
+async def _run(args: argparse.Namespace) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = LocalStorageGateway(tmp)
+        names: list[str] = []
+        originals: dict[str, int] = {}
+        for index in range(args.images + 1):
+            payload = _photo(args.width, index)
+            url = storage.save(io.BytesIO(payload), "photo.jpg", "image/jpeg")
+            name = url.removeprefix(storage.public_route_prefix + "/")
+            names.append(name)
+            originals[name] = len(payload)
+
+        throughput: dict[str, Any] = {}
+        savings: dict[str, Any] = {}
+        renders = (len(names) - 1) * len(DEFAULT_PRESETS)
+        for workers in args.workers:
+            elapsed, service = await _render_all(storage.base_dir, names, workers)
+            throughput[str(workers)] = {
+                "renders_per_sec": round(renders / elapsed, 2),
+                "renders_per_sec_per_worker": round(renders / elapsed / workers, 2),
+                "source_images_per_sec": round((len(names) - 1) / elapsed, 2),
+            }
+            if not savings:
+                for preset in DEFAULT_PRESETS:
+                    sizes = []
+                    for name in names[1:]:
+                        path, _ = await service.get(name, preset.name)
+                        sizes.append(path.stat().st_size)
+                    original = sum(originals[n] for n in names[1:]) / len(sizes)
+                    variant = sum(sizes) / len(sizes)
+                    savings[preset.name] = {
+                        "original_bytes": round(original),
+                        "variant_bytes": round(variant),
+                        "bytes_saved_per_request": round(original - variant),
+                        "ratio": round(variant / original, 4),
+                    }
+            service.close()
+    return {
+        "images": args.images,
+        "source_width": args.width,
+        "cpu_count": os.cpu_count(),
+        "presets": [preset.name for preset in DEFAULT_PRESETS],
+        "throughput": throughput,
+        "savings": savings,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--images", type=int, default=40)
+    parser.add_argument("--width", type=int, default=2400)
+    parser.add_argument("--workers", default="1,2,4")
+    args = parser.parse_args()
+    args.images = max(1, args.images)
+    args.workers = [max(1, int(item)) for item in args.workers.split(",") if item.strip()]
+
+    results = asyncio.run(_run(args))
+    output_path = _REPO_ROOT / "var" / "media-variants-benchmark.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Per-process cost of flushing worker/LLM metrics to the fleet store.
+
+Fills a worker metrics object and an LLM sink with ``--stages`` stage series
+and ``--models`` provider/model/stage combinations, then times:
+
+* ``flush_full`` — the first flush of a process, which overwrites its hash
+  with every series;
+* ``flush_steady`` — later flushes after ``--touched`` series changed, which
+  only send those deltas (the usual case every flush interval);
+* ``flush_idle`` — flushes with nothing changed (metadata heartbeat only);
+* ``collect`` — one admin/``/metrics`` read merging ``--processes`` processes.
+
+Uses ``--redis-url`` when given, otherwise an in-process fakeredis, so the
+numbers show the CPU side without network latency. Results go to
+``var/metrics-flush-benchmark.json``.
+
+    python scripts/metrics_flush_benchmark.py --stages 40 --models 30 --processes 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_BACKEND_ROOT = _REPO_ROOT / "apps" / "backend"
+for candidate in (_REPO_ROOT, _BACKEND_ROOT):
+    candidate_str = str(candidate)
+    if candidate_str not in sys.path:
+        sys.path.insert(0, candidate_str)
+
+from domains.platform.telemetry.adapters.fleet_metrics_redis import (  # noqa: E402
+    RedisFleetMetricsStore,
+)
+from domains.platform.telemetry.adapters.llm_metrics_adapter import (  # noqa: E402
+    InMemoryLLMMetricsSink,
+)
+from domains.platform.telemetry.application.fleet_metrics_service import (  # noqa: E402
+    FleetMetrics,
+    ProcessIdentity,
+)
+from domains.platform.telemetry.application.llm_metrics_facade import (  # noqa: E402
+    LLMMetricsFacade,
+)
+from domains.platform.telemetry.application.worker_metrics_service import (  # noqa: E402
+    WorkerMetrics,
+)
+from domains.platform.telemetry.ports.llm_metrics_port import LLMCallLabels  # noqa: E402
+
+
+def _client(redis_url: str | None) -> Any:
+    if redis_url:
+        import redis
+
+        return redis.Redis.from_url(redis_url, decode_responses=True)
+    import fakeredis
+
+    return fakeredis.FakeRedis(decode_responses=True)
+
+
+def _process(store: RedisFleetMetricsStore, pid: int, stages: int, models: int):
+    worker = WorkerMetrics()
+    llm = LLMMetricsFacade(InMemoryLLMMetricsSink())
+    labels = [
+        LLMCallLabels(provider=f"p{i % 3}", model=f"model-{i}", stage=f"stage-{i % 5}")
+        for i in range(models)
+    ]
+    for stage in range(stages):
+        worker.inc("completed")
+        worker.observe_stage(f"stage-{stage}", 12.5)
+    for label in labels:
+        llm.inc("calls", label)
+        llm.observe_latency(label, 250.0)
+        llm.observe_tokens(label, 100, 50)
+        llm.observe_cost(label, 0.01)
+    fleet = FleetMetrics(
+        {"worker": worker, "llm": llm},
+        store=store,
+        identity=ProcessIdentity(f"bench@host:{pid}", "bench", "host", pid, time.time()),
+    )
+    return fleet, worker, llm, labels
+
+
+def _timed(rounds: int, fn: Callable[[], Any]) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - started) * 1000.0 / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--stages", type=int, default=40)
+    parser.add_argument("--models", type=int, default=30)
+    parser.add_argument("--touched", type=int, default=10)
+    parser.add_argument("--processes", type=int, default=8)
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--redis-url", default=None)
+    args = parser.parse_args()
+
+    client = _client(args.redis_url)
+    store = RedisFleetMetricsStore(client, namespace="bench:fleet")
+    fleet, worker, llm, labels = _process(store, 1, args.stages, args.models)
+    series = len(fleet._export())
+
+    def full() -> None:
+        fleet._needs_full = True
+        fleet.flush()
+
+    full_ms = _timed(args.rounds, full)
+
+    sent: list[int] = []
+
+    def steady() -> None:
+        for i in range(args.touched):
+            if i % 2:
+                worker.observe_stage(f"stage-{i % max(args.stages, 1)}", 10.0)
+            else:
+                llm.inc("calls", labels[i % max(len(labels), 1)])
+        sent.append(fleet.flush())
+
+    steady_ms = _timed(args.rounds, steady)
+    idle_ms = _timed(args.rounds, fleet.flush)
+
+    for pid in range(2, args.processes + 1):
+        _process(store, pid, args.stages, args.models)[0].flush()
+    collect_ms = _timed(max(1, args.rounds // 10), fleet.collect)
+    client.delete(*client.keys("bench:fleet:*"))
+
+    payload = {
+        "series_per_process": series,
+        "touched_per_flush": args.touched,
+        "processes": args.processes,
+        "backend": "redis" if args.redis_url else "fakeredis",
+        "results": {
+            "flush_full": {"ms_per_flush": round(full_ms, 3), "series_sent": series},
+            "flush_steady": {
+                "ms_per_flush": round(steady_ms, 3),
+                "series_sent": max(sent) if sent else 0,
+            },
+            "flush_idle": {"ms_per_flush": round(idle_ms, 3), "series_sent": 0},
+            "collect": {"ms_per_read": round(collect_ms, 3)},
+        },
+        "overhead_at_10s_interval_pct": round(steady_ms / 10_000 * 100, 4),
+    }
+    output_path = _REPO_ROOT / "var" / "metrics-flush-benchmark.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    print(json.dumps(payload, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Events/sec of RUM ingestion for different beacon batch sizes.
+
+Drives ``RumMetricsService`` against ``RumRedisRepository`` (fakeredis with
+Lua support unless ``--redis-url`` is given): the per-event ``record`` path
+and ``record_batch`` at each batch size. Results go to
+``var/rum-batch-benchmark.json``.
+
+    python scripts/rum_batch_benchmark.py --events 20000 --batch-sizes 1,20,200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_BACKEND_ROOT = _REPO_ROOT / "apps" / "backend"
+for candidate in (_REPO_ROOT, _BACKEND_ROOT):
+    candidate_str = str(candidate)
+    if candidate_str not in sys.path:
+        sys.path.insert(0, candidate_str)
+
+from domains.platform.telemetry.adapters.rum_repository import (  # noqa: E402
+    RumRedisRepository,
+)
+from domains.platform.telemetry.application.rum_service import (  # noqa: E402
+    RumMetricsService,
+)
+
+
+def _client(redis_url: str | None) -> Any:
+    if redis_url:
+        import redis.asyncio as aioredis  # type: ignore[import-untyped]
+
+        return aioredis.from_url(redis_url, decode_responses=True)
+    import fakeredis.aioredis
+
+    return fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+
+def _events(count: int, seed: int) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    now_ms = int(time.time() * 1000)
+    names = ("navigation", "web_vital_lcp", "web_vital_cls", "pageview")
+    return [
+        {
+            "event": names[index % len(names)],
+            "ts": now_ms - rng.randint(0, 300_000),
+            "url": f"https://app.local/page/{index % 40}",
+            "data": {
+                "ttfb": rng.lognormvariate(5.5, 0.9),
+                "lcp_ms": rng.lognormvariate(7.6, 0.5),
+                "cls": rng.paretovariate(2.5) * 0.01,
+            },
+        }
+        for index in range(count)
+    ]
+
+
+async def _cleanup(client: Any, prefix: str) -> None:
+    keys = [key async for key in client.scan_iter(match=f"{prefix}:*")]
+    if keys:
+        await client.delete(*keys)
+
+
+async def _run(events: int, batch_sizes: list[int], redis_url: str | None, seed: int):
+    client = _client(redis_url)
+    payloads = _events(events, seed)
+    results: dict[str, Any] = {
+        "backend": "redis" if redis_url else "fakeredis",
+        "events": events,
+    }
+
+    prefix = f"bench:rum-batch:{int(time.time())}:single"
+    service = RumMetricsService(RumRedisRepository(client, key_prefix=prefix))
+    started = time.perf_counter()
+    for payload in payloads:
+        await service.record(payload)
+    elapsed = time.perf_counter() - started
+    results["record"] = {"events_per_sec": round(events / elapsed, 1)}
+    await _cleanup(client, prefix)
+
+    for size in batch_sizes:
+        prefix = f"bench:rum-batch:{int(time.time())}:{size}"
+        service = RumMetricsService(
+            RumRedisRepository(client, key_prefix=prefix), slow_write_ms=1e9
+        )
+        started = time.perf_counter()
+        accepted = 0
+        for offset in range(0, events, size):
+            result = await service.record_batch(payloads[offset : offset + size])
+            accepted += result.accepted
+        elapsed = time.perf_counter() - started
+        results[f"record_batch_{size}"] = {
+            "events_per_sec": round(events / elapsed, 1),
+            "accepted": accepted,
+            "round_trips": -(-events // size),
+        }
+        await _cleanup(client, prefix)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=20_000)
+    parser.add_argument("--batch-sizes", default="1,20,200")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--redis-url", default=None)
+    args = parser.parse_args()
+
+    sizes = [max(1, int(item)) for item in args.batch_sizes.split(",") if item.strip()]
+    results = asyncio.run(_run(max(1, args.events), sizes, args.redis_url, args.seed))
+    output_path = _REPO_ROOT / "var" / "rum-batch-benchmark.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
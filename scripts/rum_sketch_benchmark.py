@@ -0,0 +1,176 @@
+"""Accuracy and ingestion cost of the RUM quantile sketches.
+
+Compares sketch quantiles with exact ones on synthetic Web Vitals
+distributions, times ``QuantileSketch.add`` and measures ``RumRedisRepository``
+ingestion per event (fakeredis unless ``--redis-url`` is given). Results go to
+``var/rum-sketch-benchmark.json``.
+
+    python scripts/rum_sketch_benchmark.py --samples 100000 --events 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_BACKEND_ROOT = _REPO_ROOT / "apps" / "backend"
+for candidate in (_REPO_ROOT, _BACKEND_ROOT):
+    candidate_str = str(candidate)
+    if candidate_str not in sys.path:
+        sys.path.insert(0, candidate_str)
+
+from domains.platform.telemetry.adapters.rum_repository import (  # noqa: E402
+    RumRedisRepository,
+)
+from domains.platform.telemetry.domain.sketch import (  # noqa: E402
+    DEFAULT_QUANTILES,
+    QuantileSketch,
+    quantile_label,
+)
+
+_DISTRIBUTIONS: dict[str, Callable[[random.Random], float]] = {
+    "lcp_ms_lognormal": lambda rng: rng.lognormvariate(7.6, 0.5),
+    "ttfb_ms_lognormal": lambda rng: rng.lognormvariate(5.5, 0.9),
+    "fid_ms_exponential": lambda rng: rng.expovariate(1 / 40.0),
+    "cls_pareto": lambda rng: rng.paretovariate(2.5) * 0.01,
+}
+
+
+def _exact(ordered: list[float], q: float) -> float:
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+def _accuracy(samples: int, alpha: float, seed: int) -> dict[str, Any]:
+    report: dict[str, Any] = {}
+    for name, draw in _DISTRIBUTIONS.items():
+        rng = random.Random(seed)
+        values = [draw(rng) for _ in range(samples)]
+        sketch = QuantileSketch(alpha)
+        started = time.perf_counter()
+        for value in values:
+            sketch.add(value)
+        elapsed = time.perf_counter() - started
+        ordered = sorted(values)
+        errors = {}
+        for q in DEFAULT_QUANTILES:
+            exact = _exact(ordered, q)
+            estimate = sketch.quantile(q) or 0.0
+            errors[quantile_label(q)] = {
+                "exact": round(exact, 4),
+                "sketch": round(estimate, 4),
+                "relative_error": round(abs(estimate - exact) / exact, 5)
+                if exact
+                else 0.0,
+            }
+        report[name] = {
+            "bins": sum(1 for _ in sketch.bins()),
+            "add_ns_per_value": round(elapsed / samples * 1e9, 1),
+            "quantiles": errors,
+        }
+    return report
+
+
+class _CountingClient:
+    """Proxy counting commands queued on pipelines."""
+
+    def __init__(self, client: Any) -> None:
+        self._client = client
+        self.commands = 0
+
+    def pipeline(self, *args: Any, **kwargs: Any) -> Any:
+        pipe = self._client.pipeline(*args, **kwargs)
+        counter = self
+
+        class _Pipe:
+            def __getattr__(self, name: str) -> Any:
+                attr = getattr(pipe, name)
+                if name == "execute" or not callable(attr):
+                    return attr
+
+                def _call(*a: Any, **kw: Any) -> Any:
+                    counter.commands += 1
+                    return attr(*a, **kw)
+
+                return _call
+
+        return _Pipe()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+
+async def _ingestion(events: int, redis_url: str | None, seed: int) -> dict[str, Any]:
+    if redis_url:
+        import redis.asyncio as aioredis  # type: ignore[import-untyped]
+
+        client = aioredis.from_url(redis_url, decode_responses=True)
+        backend = "redis"
+    else:
+        import fakeredis.aioredis
+
+        client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        backend = "fakeredis"
+    prefix = f"bench:rum:{int(time.time())}"
+    counting = _CountingClient(client)
+    repo = RumRedisRepository(counting, key_prefix=prefix)  # type: ignore[arg-type]
+    rng = random.Random(seed)
+    now_ms = int(time.time() * 1000)
+    started = time.perf_counter()
+    for index in range(events):
+        await repo.add(
+            {
+                "event": "navigation",
+                "ts": now_ms - rng.randint(0, 600_000),
+                "url": f"https://app.local/page/{index % 25}",
+                "data": {
+                    "ttfb": rng.lognormvariate(5.5, 0.9),
+                    "domContentLoaded": rng.lognormvariate(6.8, 0.6),
+                    "loadEvent": rng.lognormvariate(7.3, 0.6),
+                },
+            }
+        )
+    elapsed = time.perf_counter() - started
+    keys = [key async for key in client.scan_iter(match=f"{prefix}:*")]
+    if keys:
+        await client.delete(*keys)
+    return {
+        "backend": backend,
+        "events": events,
+        "events_per_sec": round(events / elapsed, 1) if elapsed else 0.0,
+        "us_per_event": round(elapsed / events * 1e6, 1) if events else 0.0,
+        "commands_per_event": round(counting.commands / events, 2) if events else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=100_000)
+    parser.add_argument("--events", type=int, default=5_000)
+    parser.add_argument("--alpha", type=float, default=0.01)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--redis-url", default=None)
+    args = parser.parse_args()
+
+    results = {
+        "alpha": args.alpha,
+        "accuracy": _accuracy(max(1, args.samples), args.alpha, args.seed),
+        "ingestion": asyncio.run(
+            _ingestion(max(1, args.events), args.redis_url, args.seed)
+        ),
+    }
+    output_path = _REPO_ROOT / "var" / "rum-sketch-benchmark.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""Page diff cost on documents with hundreds of blocks.
+
+Builds a page with ``--blocks`` blocks and a draft that edits, inserts,
+removes and reorders ``--changes`` of them, then times ``--rounds`` diffs of
+the pair via:
+
+* ``legacy`` — the previous ``compute_page_diff``: index both block lists,
+  compare every block and every top-level field and deep-copy all changes;
+* ``engine_cold`` — :func:`diff_documents` plus the editor summary with an
+  empty memo cache (every call diffs from scratch);
+* ``engine_cached`` — ``helpers.compute_page_diff`` as the repository calls
+  it for the draft view: repeated opens of the same draft/published pair are
+  keyed by page id and version numbers and served from the memo cache.
+
+The patch size and move count are reported next to the legacy entry count.
+Results go to ``var/site-diff-benchmark.json``.
+
+    python scripts/site_diff_benchmark.py --blocks 500 --changes 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from collections.abc import Callable
+from copy import deepcopy
+from pathlib import Path
+from typing import Any
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_BACKEND_ROOT = _REPO_ROOT / "apps" / "backend"
+for candidate in (_REPO_ROOT, _BACKEND_ROOT):
+    candidate_str = str(candidate)
+    if candidate_str not in sys.path:
+        sys.path.insert(0, candidate_str)
+
+from domains.product.site.domain.diff import diff_documents  # noqa: E402
+from domains.product.site.infrastructure.repositories import helpers  # noqa: E402
+
+
+def _legacy_page_diff(
+    previous_data: dict[str, Any],
+    previous_meta: dict[str, Any],
+    current_data: dict[str, Any],
+    current_meta: dict[str, Any],
+) -> list[dict[str, Any]]:
+    diff = helpers.compute_blocks_diff(previous_data.get("blocks"), current_data.get("blocks"))
+    diff.extend(
+        helpers.compute_mapping_diff(
+            {k: v for k, v in previous_data.items() if k != "blocks"},
+            {k: v for k, v in current_data.items() if k != "blocks"},
+            scope="data",
+        )
+    )
+    diff.extend(helpers.compute_mapping_diff(previous_meta, current_meta, scope="meta"))
+    return diff
+
+
+def _documents(args: argparse.Namespace) -> tuple[dict[str, Any], dict[str, Any]]:
+    rng = random.Random(args.seed)
+
+    def block(index: int) -> dict[str, Any]:
+        return {
+            "id": f"block-{index}",
+            "type": rng.choice(("hero", "text", "nodes_carousel", "faq")),
+            "enabled": True,
+            "data": {
+                "title": f"Block {index}",
+                "items": [
+                    {"text": "lorem ipsum " * 4, "href": f"/n/{index}-{item}"}
+                    for item in range(8)
+                ],
+            },
+        }
+
+    published = {"blocks": [block(index) for index in range(args.blocks)], "theme": "light"}
+    draft = deepcopy(published)
+    blocks = draft["blocks"]
+    for step in range(args.changes):
+        roll = step % 4
+        if roll == 0:
+            rng.choice(blocks)["data"]["title"] += " (edited)"
+        elif roll == 1:
+            blocks.insert(rng.randrange(len(blocks)), block(args.blocks + step))
+        elif roll == 2:
+            blocks.pop(rng.randrange(len(blocks)))
+        else:
+            blocks.insert(rng.randrange(len(blocks)), blocks.pop(rng.randrange(len(blocks))))
+    return published, draft
+
+
+def _timed(rounds: int, call: Callable[[], Any]) -> tuple[float, Any]:
+    result = None
+    started = time.perf_counter()
+    for _ in range(rounds):
+        result = call()
+    return (time.perf_counter() - started) * 1000 / rounds, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--blocks", type=int, default=300)
+    parser.add_argument("--changes", type=int, default=40)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    published, draft = _documents(args)
+    meta_before, meta_after = {"title": "Page"}, {"title": "Page v2"}
+    before = {"data": {"locales": {"ru": published}}, "meta": {"locales": {"ru": meta_before}}}
+    after = {"data": {"locales": {"ru": draft}}, "meta": {"locales": {"ru": meta_after}}}
+
+    legacy_ms, legacy = _timed(
+        args.rounds, lambda: _legacy_page_diff(published, meta_before, draft, meta_after)
+    )
+
+    def cold() -> Any:
+        diff = diff_documents(before, after, max_nodes=helpers._DIFF_MAX_NODES)
+        helpers.summarize_document_diff(diff, before, after)
+        return diff
+
+    cold_ms, patch = _timed(args.rounds, cold)
+    helpers._DIFF_CACHE.clear()
+    cached_ms, entries = _timed(
+        args.rounds,
+        lambda: helpers.compute_page_diff(
+            published, meta_before, draft, meta_after, cache_key=("bench", 1, 2)
+        ),
+    )
+
+    payload = {
+        "blocks": args.blocks,
+        "changes": args.changes,
+        "results": {
+            "legacy": {"ms_per_diff": round(legacy_ms, 3), "entries": len(legacy)},
+            "engine_cold": {
+                "ms_per_diff": round(cold_ms, 3),
+                "patch_operations": len(patch.operations),
+                "moves": sum(op.op == "move" for op in patch.operations),
+                "patch_bytes": len(json.dumps(patch.to_patch(), ensure_ascii=False)),
+                "full_replace_bytes": len(json.dumps(after, ensure_ascii=False)),
+            },
+            "engine_cached": {
+                "ms_per_diff": round(cached_ms, 3),
+                "entries": len(entries),
+                "cache_hits": helpers._DIFF_CACHE.hits,
+            },
+        },
+    }
+    output_path = _REPO_ROOT / "var" / "site-diff-benchmark.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    print(json.dumps(payload, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+"""Synthetic site traffic and rollup time per million events.
+
+Creates ``--pages`` pages with ``--blocks`` shared blocks, generates
+``--events`` page views, block impressions, clicks and conversions spread
+over ``--days`` days for ``--visitors`` visitors, and measures:
+
+* ``ingest`` — folding events into hourly buckets (``record_metric_events``,
+  flushed every ``--flush`` events, as an ingestion endpoint would);
+* ``rollup_full`` — draining every hourly row into day/week/month metrics;
+* ``rollup_incremental`` — one more flush of traffic after the backlog is
+  rolled up: the run only touches rows past the watermark.
+
+Times are also reported per million events. Without ``--dsn`` the run uses a
+temporary SQLite database; pass a Postgres DSN (``postgresql+asyncpg://...``)
+with the site schema migrated to measure the production path or to seed a
+dev database for the editor's metrics panels. Results go to
+``var/site-metrics-benchmark.json``.
+
+    python scripts/site_metrics_benchmark.py --events 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_BACKEND_ROOT = _REPO_ROOT / "apps" / "backend"
+for candidate in (_REPO_ROOT, _BACKEND_ROOT):
+    candidate_str = str(candidate)
+    if candidate_str not in sys.path:
+        sys.path.insert(0, candidate_str)
+
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine  # noqa: E402
+
+from domains.product.site.application import SiteService  # noqa: E402
+from domains.product.site.domain import (  # noqa: E402
+    BlockScope,
+    MetricEvent,
+    MetricEventKind,
+    PageType,
+)
+from domains.product.site.infrastructure import SiteRepository, metadata  # noqa: E402
+
+
+def generate_traffic(
+    pages: list[UUID],
+    blocks: list[UUID],
+    *,
+    events: int,
+    days: int,
+    visitors: int,
+    seed: int,
+    end: datetime,
+) -> Iterator[MetricEvent]:
+    """Yield ``events`` events in time order, as they would arrive live.
+
+    Every view shows two blocks and ~5% of views click a CTA, a fifth of which
+    convert.
+    """
+
+    rng = random.Random(seed)
+    span = days * 86400
+    start = end - timedelta(seconds=span)
+    step = span / max(events / 2.3, 1)  # ~2.3 events per view
+    # Popularity follows a rough power law, like real landing pages.
+    weights = [1 / (rank + 1) for rank in range(len(pages))]
+    produced = 0
+    offset = 0.0
+    while produced < events:
+        page_id = rng.choices(pages, weights)[0]
+        offset += rng.expovariate(1 / step)
+        occurred_at = start + timedelta(seconds=min(offset, span - 1))
+        locale = "ru" if rng.random() < 0.8 else "en"
+        visitor = f"visitor-{rng.randrange(visitors)}"
+        yield MetricEvent(
+            MetricEventKind.PAGE_VIEW,
+            occurred_at,
+            page_id,
+            locale=locale,
+            visitor_id=visitor,
+            time_on_page_ms=rng.randrange(1000, 180_000),
+            bounced=rng.random() < 0.4,
+            mobile=rng.random() < 0.6,
+        )
+        produced += 1
+        shown = rng.sample(blocks, k=min(2, len(blocks)))
+        for block_id in shown:
+            yield MetricEvent(
+                MetricEventKind.BLOCK_IMPRESSION,
+                occurred_at,
+                page_id,
+                block_id=block_id,
+                locale=locale,
+                visitor_id=visitor,
+            )
+        produced += len(shown)
+        if rng.random() < 0.05:
+            block_id = rng.choice(shown)
+            yield MetricEvent(MetricEventKind.CTA_CLICK, occurred_at, page_id, locale=locale)
+            yield MetricEvent(
+                MetricEventKind.BLOCK_CLICK,
+                occurred_at,
+                page_id,
+                block_id=block_id,
+                locale=locale,
+            )
+            produced += 2
+            if rng.random() < 0.2:
+                yield MetricEvent(
+                    MetricEventKind.CONVERSION,
+                    occurred_at,
+                    page_id,
+                    block_id=block_id,
+                    locale=locale,
+                    revenue=round(rng.uniform(1, 50), 2),
+                )
+                produced += 1
+
+
+async def _seed_entities(
+    repository: SiteRepository, args: argparse.Namespace
+) -> tuple[list[UUID], list[UUID]]:
+    service = SiteService(repository)
+    suffix = int(time.time())
+    pages = [
+        (
+            await service.create_page(
+                slug=f"/bench-{suffix}-{index}",
+                page_type=PageType.LANDING,
+                title=f"Bench page {index}",
+                locale="ru",
+                owner="bench",
+            )
+        ).id
+        for index in range(args.pages)
+    ]
+    blocks = [
+        (
+            await service.create_block(
+                key=f"bench-{suffix}-{index}",
+                title=f"Bench block {index}",
+                section="promo",
+                scope=BlockScope.SHARED,
+                default_locale="ru",
+                data={},
+                meta={},
+            )
+        ).id
+        for index in range(args.blocks)
+    ]
+    return pages, blocks
+
+
+async def _ingest(repository: SiteRepository, traffic: Iterator[MetricEvent], flush: int) -> int:
+    rows = 0
+    batch: list[MetricEvent] = []
+    for event in traffic:
+        batch.append(event)
+        if len(batch) >= flush:
+            rows += await repository.record_metric_events(batch)
+            batch = []
+    if batch:
+        rows += await repository.record_metric_events(batch)
+    return rows
+
+
+async def _drain(repository: SiteRepository, batch_size: int) -> tuple[int, int]:
+    hourly_rows = periods = 0
+    while True:
+        report = await repository.rollup_metrics(batch_size=batch_size, settle_seconds=0)
+        hourly_rows += report.hourly_rows
+        periods += report.periods
+        if report.hourly_rows < batch_size:
+            return hourly_rows, periods
+
+
+def _per_million(seconds: float, events: int) -> float:
+    return round(seconds * 1_000_000 / max(events, 1), 3)
+
+
+async def _run(args: argparse.Namespace, engine: AsyncEngine) -> dict[str, Any]:
+    async def factory() -> AsyncEngine:
+        return engine
+
+    repository = SiteRepository(factory)
+    pages, blocks = await _seed_entities(repository, args)
+    end = datetime.now(UTC)
+    traffic = generate_traffic(
+        pages,
+        blocks,
+        events=args.events,
+        days=args.days,
+        visitors=args.visitors,
+        seed=args.seed,
+        end=end,
+    )
+
+    started = time.perf_counter()
+    hourly = await _ingest(repository, traffic, args.flush)
+    ingest_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    rolled, periods = await _drain(repository, args.batch_size)
+    full_seconds = time.perf_counter() - started
+
+    extra = generate_traffic(
+        pages,
+        blocks,
+        events=args.flush,
+        days=1,
+        visitors=args.visitors,
+        seed=args.seed + 1,
+        end=end,
+    )
+    await _ingest(repository, extra, args.flush)
+    started = time.perf_counter()
+    extra_rows, extra_periods = await _drain(repository, args.batch_size)
+    incremental_seconds = time.perf_counter() - started
+
+    return {
+        "ingest": {
+            "events": args.events,
+            "hourly_rows": hourly,
+            "seconds": round(ingest_seconds, 3),
+            "seconds_per_million_events": _per_million(ingest_seconds, args.events),
+        },
+        "rollup_full": {
+            "hourly_rows": rolled,
+            "periods_written": periods,
+            "seconds": round(full_seconds, 3),
+            "seconds_per_million_events": _per_million(full_seconds, args.events),
+        },
+        "rollup_incremental": {
+            "events": args.flush,
+            "hourly_rows": extra_rows,
+            "periods_written": extra_periods,
+            "seconds": round(incremental_seconds, 3),
+        },
+    }
+
+
+async def _main(args: argparse.Namespace) -> dict[str, Any]:
+    if args.dsn:
+        engine = create_async_engine(args.dsn, future=True)
+        try:
+            return await _run(args, engine)
+        finally:
+            await engine.dispose()
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp}/site-metrics.db")
+        async with engine.begin() as conn:
+            await conn.run_sync(metadata.create_all)
+        try:
+            return await _run(args, engine)
+        finally:
+            await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dsn", help="Async SQLAlchemy DSN; SQLite temp file if omitted")
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--blocks", type=int, default=20)
+    parser.add_argument("--days", type=int, default=45)
+    parser.add_argument("--visitors", type=int, default=20_000)
+    parser.add_argument("--flush", type=int, default=10_000)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    payload = {
+        "backend": "custom-dsn" if args.dsn else "sqlite",
+        "pages": args.pages,
+        "blocks": args.blocks,
+        "days": args.days,
+        "results": asyncio.run(_main(args)),
+    }
+    output_path = _REPO_ROOT / "var" / "site-metrics-benchmark.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    print(json.dumps(payload, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""Public read latency of site pages: assembled per request vs snapshots.
+
+Publishes ``--blocks`` shared blocks and ``--pages`` pages, each inlining all of
+them, then reads random pages ``--reads`` times via:
+
+* ``assembled`` — the published version, bindings and every shared block
+  version are loaded and projected on each request (the path without
+  snapshots, :meth:`SiteRepository.render_page_document`);
+* ``snapshot`` — one indexed row per request
+  (:meth:`SiteRepository.get_page_snapshot`).
+
+It also times republishing one shared block, which rewrites the snapshots of
+the pages using it. Without ``--dsn`` the run uses a temporary SQLite database.
+Results go to ``var/site-snapshots-benchmark.json``.
+
+    python scripts/site_snapshots_benchmark.py --pages 200 --blocks 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_BACKEND_ROOT = _REPO_ROOT / "apps" / "backend"
+for candidate in (_REPO_ROOT, _BACKEND_ROOT):
+    candidate_str = str(candidate)
+    if candidate_str not in sys.path:
+        sys.path.insert(0, candidate_str)
+
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine  # noqa: E402
+
+from domains.product.site.application import SiteService  # noqa: E402
+from domains.product.site.domain import PageReviewStatus, PageType  # noqa: E402
+from domains.product.site.infrastructure import SiteRepository, metadata  # noqa: E402
+
+
+async def _publish_block(service: SiteService, block_id: UUID, payload: dict) -> None:
+    block = await service.get_block(block_id)
+    await service.save_global_block(
+        block_id=block_id,
+        payload=payload,
+        meta={},
+        version=block.draft_version,
+        comment=None,
+        review_status=PageReviewStatus.NONE,
+        actor="bench",
+    )
+    await service.publish_global_block(block_id=block_id, actor="bench", comment=None)
+
+
+async def _seed(service: SiteService, args: argparse.Namespace) -> list[UUID]:
+    suffix = int(time.time())
+    keys = []
+    for index in range(args.blocks):
+        block = await service.create_global_block(
+            key=f"bench-{suffix}-{index}",
+            title=f"Bench block {index}",
+            section=f"section-{index}",
+            locale="ru",
+            requires_publisher=False,
+        )
+        await _publish_block(
+            service,
+            block.id,
+            {
+                "title": f"Block {index}",
+                "items": [{"text": "x" * 80, "href": "/"} for _ in range(10)],
+            },
+        )
+        keys.append(block.key)
+    pages = []
+    for index in range(args.pages):
+        page = await service.create_page(
+            slug=f"/bench-{suffix}-{index}",
+            page_type=PageType.LANDING,
+            title=f"Bench page {index}",
+            locale="ru",
+            owner="bench",
+        )
+        draft = await service.get_page_draft(page.id)
+        await service.save_page_draft(
+            page_id=page.id,
+            payload={
+                "blocks": [
+                    {
+                        "id": f"b{position}",
+                        "type": "hero",
+                        "enabled": True,
+                        "data": {"title": "y" * 200},
+                    }
+                    for position in range(12)
+                ]
+            },
+            meta={"globalBlocks": [{"key": key} for key in keys]},
+            comment=None,
+            review_status=PageReviewStatus.NONE,
+            expected_version=draft.version,
+            actor="bench",
+        )
+        await service.publish_page(page_id=page.id, actor="bench", comment=None)
+        pages.append(page.id)
+    return pages
+
+
+async def _measure(
+    reads: int, call: Callable[[], Awaitable[Any]]
+) -> dict[str, float]:
+    samples = []
+    started = time.perf_counter()
+    for _ in range(reads):
+        begin = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - begin) * 1000)
+    elapsed = time.perf_counter() - started
+    samples.sort()
+    return {
+        "p50_ms": round(statistics.median(samples), 3),
+        "p95_ms": round(samples[int(len(samples) * 0.95) - 1], 3),
+        "reads_per_sec": round(reads / elapsed, 1),
+    }
+
+
+async def _run(args: argparse.Namespace, engine: AsyncEngine) -> dict[str, Any]:
+    async def factory() -> AsyncEngine:
+        return engine
+
+    repository = SiteRepository(factory)
+    service = SiteService(repository)
+    pages = await _seed(service, args)
+    rng = random.Random(args.seed)
+
+    async def assembled() -> None:
+        await repository.render_page_document(rng.choice(pages), "ru")
+
+    async def snapshot() -> None:
+        await repository.get_page_snapshot(page_id=rng.choice(pages), locale="ru")
+
+    results = {
+        "assembled": await _measure(args.reads, assembled),
+        "snapshot": await _measure(args.reads, snapshot),
+    }
+    blocks, _ = await service.list_global_blocks(page_size=1)
+    started = time.perf_counter()
+    await _publish_block(service, blocks[0].id, {"title": "republished"})
+    results["block_republish"] = {
+        "pages_using_block": len(pages),
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+    return results
+
+
+async def _main(args: argparse.Namespace) -> dict[str, Any]:
+    if args.dsn:
+        engine = create_async_engine(args.dsn, future=True)
+        try:
+            return await _run(args, engine)
+        finally:
+            await engine.dispose()
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp}/site-snapshots.db")
+        async with engine.begin() as conn:
+            await conn.run_sync(metadata.create_all)
+        try:
+            return await _run(args, engine)
+        finally:
+            await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dsn", help="Async SQLAlchemy DSN; SQLite temp file if omitted")
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--blocks", type=int, default=6)
+    parser.add_argument("--reads", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    payload = {
+        "backend": "custom-dsn" if args.dsn else "sqlite",
+        "pages": args.pages,
+        "blocks": args.blocks,
+        "results": asyncio.run(_main(args)),
+    }
+    output_path = _REPO_ROOT / "var" / "site-snapshots-benchmark.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    print(json.dumps(payload, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Scrape and observation cost of the telemetry metrics core.
+
+Scrape: fills ``--series`` counter series, then times rendering the
+exposition via:
+
+* ``legacy`` — the previous services' approach: take the lock and format
+  every series on every scrape;
+* ``core_cold`` — first render of a fresh registry;
+* ``core_cached`` — repeated scrapes with no writes in between;
+* ``core_after_writes`` — scrapes after ``--touched`` series changed, which
+  re-render only those series.
+
+Observation: ``--threads`` threads each record ``--ops`` values, timed for a
+single lock-guarded dict (legacy), a sharded counter and a histogram.
+Results go to ``var/telemetry-metrics-benchmark.json``.
+
+    python scripts/telemetry_metrics_benchmark.py --series 10000 --threads 1,4,8
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_BACKEND_ROOT = _REPO_ROOT / "apps" / "backend"
+for candidate in (_REPO_ROOT, _BACKEND_ROOT):
+    candidate_str = str(candidate)
+    if candidate_str not in sys.path:
+        sys.path.insert(0, candidate_str)
+
+from domains.platform.telemetry.domain.metrics import MetricsRegistry  # noqa: E402
+
+
+class _LegacyCounter:
+    """Lock-guarded dict formatted on every scrape, as the services used to."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._values: dict[str, int] = {}
+
+    def inc(self, key: str) -> None:
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + 1
+
+    def prometheus(self) -> str:
+        lines = ["# HELP bench_total Bench", "# TYPE bench_total counter"]
+        with self._lock:
+            for key, value in self._values.items():
+                lines.append(f'bench_total{{key="{key}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+
+def _timed(rounds: int, fn: Callable[[], Any], before: Callable[[], None] | None = None) -> float:
+    total = 0.0
+    for _ in range(rounds):
+        if before is not None:
+            before()
+        started = time.perf_counter()
+        fn()
+        total += time.perf_counter() - started
+    return total * 1000.0 / rounds
+
+
+def _scrape(series: int, touched: int, rounds: int) -> dict[str, Any]:
+    keys = [f"k{i}" for i in range(series)]
+    legacy = _LegacyCounter()
+    registry = MetricsRegistry()
+    counter = registry.counter("bench", "Bench", ("key",), max_series=series)
+    for key in keys:
+        legacy.inc(key)
+        counter.inc(key)
+
+    cold_ms = _timed(1, registry.exposition)
+    step = max(1, series // max(touched, 1))
+
+    def touch() -> None:
+        for key in keys[::step][:touched]:
+            counter.inc(key)
+
+    return {
+        "series": series,
+        "legacy_ms": round(_timed(rounds, legacy.prometheus), 3),
+        "core_cold_ms": round(cold_ms, 3),
+        "core_cached_ms": round(_timed(rounds, registry.exposition), 4),
+        "core_after_writes_ms": round(_timed(rounds, registry.exposition, touch), 3),
+        "touched": touched,
+        "bytes": len(registry.exposition()),
+    }
+
+
+def _observe(threads: int, ops: int) -> dict[str, Any]:
+    legacy = _LegacyCounter()
+    registry = MetricsRegistry()
+    counter = registry.counter("bench", "Bench", ("key",))
+    histogram = registry.histogram("bench_ms", "Bench", ("key",))
+    cases: dict[str, Callable[[int], None]] = {
+        "legacy_lock_dict": lambda i: legacy.inc("k"),
+        "core_counter": lambda i: counter.inc("k"),
+        "core_histogram": lambda i: histogram.observe(i % 1000, "k"),
+    }
+    out: dict[str, Any] = {"threads": threads}
+    for name, fn in cases.items():
+        barrier = threading.Barrier(threads + 1)
+
+        def run(fn: Callable[[int], None] = fn, barrier: threading.Barrier = barrier) -> None:
+            barrier.wait()
+            for i in range(ops):
+                fn(i)
+
+        workers = [threading.Thread(target=run) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        barrier.wait()
+        started = time.perf_counter()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - started
+        out[f"{name}_ns_per_op"] = round(elapsed * 1e9 / (threads * ops), 1)
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--series", type=int, default=10_000)
+    parser.add_argument("--touched", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--threads", default="1,4,8")
+    parser.add_argument("--ops", type=int, default=50_000)
+    args = parser.parse_args()
+
+    payload = {
+        "scrape": _scrape(args.series, args.touched, args.rounds),
+        "observe": [
+            _observe(int(count), args.ops) for count in args.threads.split(",") if count
+        ],
+    }
+    output_path = _REPO_ROOT / "var" / "telemetry-metrics-benchmark.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    print(json.dumps(payload, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Throughput benchmark for the worker job queue.
+
+Enqueues trivial jobs one by one and via ``enqueue_many``, then drains them
+with batched leases, against the database/Redis configured for the backend
+(``APP_DATABASE_URL``, ``APP_REDIS_URL``). Results go to
+``var/worker-jobs-benchmark.json``.
+
+    python scripts/worker_jobs_benchmark.py --jobs 100000 --batch 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_BACKEND_ROOT = _REPO_ROOT / "apps" / "backend"
+for candidate in (_REPO_ROOT, _BACKEND_ROOT):
+    candidate_str = str(candidate)
+    if candidate_str not in sys.path:
+        sys.path.insert(0, candidate_str)
+
+from sqlalchemy import text  # noqa: E402
+
+from domains.platform.worker.application.service import (  # noqa: E402
+    JobCompletionCommand,
+    JobCreateCommand,
+)
+from domains.platform.worker.wires import build_container  # noqa: E402
+
+_JOB_TYPE = "bench.noop"
+
+
+def _rate(count: int, seconds: float) -> float:
+    return round(count / seconds, 1) if seconds > 0 else 0.0
+
+
+async def _cleanup(container: Any) -> None:
+    engine = container.repo._engine
+    async with engine.begin() as conn:
+        await conn.execute(
+            text(
+                "DELETE FROM worker_job_events WHERE job_id IN "
+                "(SELECT job_id FROM worker_jobs WHERE type = :type)"
+            ),
+            {"type": _JOB_TYPE},
+        )
+        await conn.execute(
+            text("DELETE FROM worker_jobs WHERE type = :type"), {"type": _JOB_TYPE}
+        )
+
+
+async def _benchmark(jobs: int, batch: int, single: int, lease_limit: int) -> dict[str, Any]:
+    container = build_container()
+    service = container.service
+    await _cleanup(container)
+    results: dict[str, Any] = {
+        "jobs": jobs,
+        "batch": batch,
+        "queue": "redis" if container.queue is not None else "sql",
+    }
+
+    started = time.perf_counter()
+    for n in range(single):
+        await service.enqueue(JobCreateCommand(type=_JOB_TYPE, input={"n": n}))
+    elapsed = time.perf_counter() - started
+    results["enqueue_single"] = {
+        "jobs": single,
+        "seconds": round(elapsed, 3),
+        "jobs_per_sec": _rate(single, elapsed),
+    }
+
+    started = time.perf_counter()
+    for offset in range(0, jobs, batch):
+        size = min(batch, jobs - offset)
+        await service.enqueue_many(
+            [
+                JobCreateCommand(type=_JOB_TYPE, input={"n": offset + i})
+                for i in range(size)
+            ]
+        )
+    elapsed = time.perf_counter() - started
+    results["enqueue_many"] = {
+        "jobs": jobs,
+        "seconds": round(elapsed, 3),
+        "jobs_per_sec": _rate(jobs, elapsed),
+    }
+
+    total = jobs + single
+    drained = 0
+    started = time.perf_counter()
+    while drained < total:
+        leased = await service.lease(
+            worker_id="bench",
+            job_types=None,
+            limit=lease_limit,
+            lease_seconds=60,
+            wait_seconds=1.0,
+        )
+        if not leased:
+            break
+        for job in leased:
+            await service.complete(
+                JobCompletionCommand(job_id=job.job_id, worker_id="bench")
+            )
+        drained += len(leased)
+    elapsed = time.perf_counter() - started
+    results["lease_complete"] = {
+        "jobs": drained,
+        "lease_limit": lease_limit,
+        "seconds": round(elapsed, 3),
+        "jobs_per_sec": _rate(drained, elapsed),
+    }
+
+    await _cleanup(container)
+    await container.repo.close()
+    if container.queue is not None:
+        await container.queue.close()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=100_000)
+    parser.add_argument("--batch", type=int, default=500)
+    parser.add_argument(
+        "--single", type=int, default=2_000, help="jobs enqueued one per call"
+    )
+    parser.add_argument("--lease-limit", type=int, default=100)
+    args = parser.parse_args()
+
+    results = asyncio.run(
+        _benchmark(args.jobs, max(1, args.batch), max(0, args.single), args.lease_limit)
+    )
+    output_path = _REPO_ROOT / "var" / "worker-jobs-benchmark.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
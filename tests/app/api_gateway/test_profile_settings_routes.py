@@ -48,10 +48,19 @@ class _DummyIdempotencyStore:
         self.accept = accept
         self.keys: list[str] = []
 
-    async def reserve(self, key: str) -> bool:
+    async def reserve(self, key: str, **_: Any) -> bool:
         self.keys.append(key)
         return self.accept
 
+    async def get(self, key: str) -> None:
+        return None
+
+    async def complete(self, key: str, **_: Any) -> None:
+        return None
+
+    async def release(self, key: str) -> None:
+        return None
+
 
 def test_personal_profile_get_returns_profile(profile_client: TestClient) -> None:
     response = profile_client.get("/v1/me/settings/profile")
@@ -44,6 +44,24 @@ def test_redis_outbox_and_bus_roundtrip() -> None:
     assert bus.xpending(topic, group) == 0
 
 
+def test_redis_outbox_publish_many_preserves_order_across_chunks() -> None:
+    client = fakeredis.FakeRedis(decode_responses=True)
+    bus = RedisBus("redis://localhost/0", client=client)
+    outbox = RedisOutboxCore("redis://localhost/0", client=client)
+    outbox.batch_size = 3
+
+    events = [("node.updated.v1", {"id": i}, f"node:{i}") for i in range(7)]
+    events.append(("node.updated.batch.v1", {"ids": list(range(7))}, None))
+    ids = outbox.publish_many(events)
+
+    assert len(ids) == 8
+    assert bus.xlen("node.updated.v1") == 7
+    entries = client.xrange("events:node.updated.v1")
+    assert [bus.to_payload(fields)["id"] for _, fields in entries] == list(range(7))
+    assert [fields["key"] for _, fields in entries][:2] == ["node:0", "node:1"]
+    assert bus.xlen("node.updated.batch.v1") == 1
+
+
 @pytest.mark.asyncio
 async def test_redis_flag_store_roundtrip() -> None:
     client = fakeredis.aioredis.FakeRedis(decode_responses=True)
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+
+from app.api_gateway import metrics_middleware as metrics_mod
+from app.api_gateway.metrics_middleware import HTTPMetricsMiddleware
+
+pytest.importorskip("prometheus_client")
+from prometheus_client import REGISTRY  # noqa: E402
+
+
+def _sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def _app(**kwargs) -> FastAPI:
+    metrics_mod._ensure_metrics()
+    app = FastAPI()
+
+    @app.get("/metrics-test/items/{item_id}")
+    async def item(item_id: int) -> dict[str, object]:
+        in_flight = _sample("http_requests_in_flight", method="GET")
+        return {"id": item_id, "in_flight": in_flight}
+
+    @app.get("/metrics-test/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks():
+            for _ in range(3):
+                await asyncio.sleep(0.04)
+                yield b"x" * 100
+
+        return StreamingResponse(chunks())
+
+    @app.get("/metrics-test/boom")
+    async def boom() -> None:
+        raise RuntimeError("boom")
+
+    app.add_middleware(HTTPMetricsMiddleware, **kwargs)
+    return app
+
+
+def test_second_import_reuses_registered_collectors() -> None:
+    metrics_mod._ensure_metrics()
+    spec = importlib.util.spec_from_file_location(
+        "_http_metrics_second_copy", metrics_mod.__file__
+    )
+    assert spec is not None and spec.loader is not None
+    copy = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(copy)
+
+    copy._ensure_metrics()
+
+    assert copy.HTTP_REQUESTS is metrics_mod.HTTP_REQUESTS
+    assert copy.HTTP_REQUEST_DURATION is metrics_mod.HTTP_REQUEST_DURATION
+    assert copy.HTTP_RESPONSE_SIZE is metrics_mod.HTTP_RESPONSE_SIZE
+    assert copy.HTTP_IN_FLIGHT is metrics_mod.HTTP_IN_FLIGHT
+
+
+@pytest.mark.asyncio
+async def test_records_by_route_template_with_size_and_in_flight() -> None:
+    app = _app()
+    path = "/metrics-test/items/{item_id}"
+    before = _sample("http_requests_total", method="GET", path=path, status="200")
+    idle = _sample("http_requests_in_flight", method="GET")
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        first = await client.get("/metrics-test/items/1")
+        await client.get("/metrics-test/items/2")
+        await client.get("/metrics-test/missing/abc")
+        await client.get("/metrics-test/boom")
+
+    assert first.json()["in_flight"] == idle + 1
+    assert _sample("http_requests_in_flight", method="GET") == idle
+    assert _sample("http_requests_total", method="GET", path=path, status="200") == before + 2
+    assert _sample(
+        "http_request_duration_ms_count", method="GET", path=path, status_class="2xx"
+    ) >= 2
+    assert _sample("http_response_size_bytes_sum", method="GET", path=path) >= 2 * len(
+        first.content
+    )
+    assert _sample("http_requests_total", method="GET", path="unmatched", status="404") >= 1
+    assert _sample(
+        "http_requests_total", method="GET", path="/metrics-test/boom", status="500"
+    ) >= 1
+    assert _sample("http_requests_total", method="GET", path="/metrics-test/items/1") == 0
+
+
+@pytest.mark.asyncio
+async def test_streaming_is_timed_until_last_chunk_and_routes_are_capped() -> None:
+    app = _app(max_routes=1)
+    labels = {"method": "GET", "path": "other", "status_class": "2xx"}
+    before_sum = _sample("http_request_duration_ms_sum", **labels)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        await client.get("/metrics-test/items/1")
+        response = await client.get("/metrics-test/stream")
+
+    assert response.content == b"x" * 300
+    # The first template took the only slot; the stream falls into "other".
+    assert _sample("http_request_duration_ms_sum", **labels) - before_sum >= 110
+    assert _sample("http_response_size_bytes_sum", method="GET", path="other") >= 300
@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import fakeredis.aioredis
+import httpx
+import pytest
+from fastapi import Depends, FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from app.api_gateway import idempotency as idempotency_mod
+from app.api_gateway.idempotency import (
+    IDEMPOTENCY_HEADER,
+    IDEMPOTENCY_REPLAYED_HEADER,
+    IdempotencyRecord,
+    IdempotencySweeper,
+    IdempotentReplay,
+    RedisIdempotencyCache,
+    idempotent_replay_handler,
+    require_idempotency_key,
+)
+from app.api_gateway.middlewares.idempotency import IdempotencyMiddleware
+from packages.core.errors import ApiError
+
+
+class _MemoryStore:
+    def __init__(self) -> None:
+        self.rows: dict[str, dict[str, Any]] = {}
+        self.completed: list[str] = []
+        self.released: list[str] = []
+
+    async def reserve(self, key: str, *, fingerprint, lock_seconds, ttl_seconds) -> bool:
+        row = self.rows.get(key)
+        if row is not None:
+            return False
+        self.rows[key] = {"fingerprint": fingerprint, "status": None}
+        return True
+
+    async def get(self, key: str) -> IdempotencyRecord | None:
+        row = self.rows.get(key)
+        if row is None:
+            return None
+        return IdempotencyRecord(
+            key=key,
+            fingerprint=row["fingerprint"],
+            status_code=row["status"],
+            headers=tuple(row.get("headers", ())),
+            body=row.get("body"),
+            locked_until=None if row["status"] is not None else object(),  # type: ignore[arg-type]
+        )
+
+    async def complete(self, key: str, *, status_code, headers, body, **_: Any) -> None:
+        row = self.rows[key]
+        row.update(status=status_code, headers=list(headers), body=body)
+        self.completed.append(key)
+
+    async def release(self, key: str) -> None:
+        self.rows.pop(key, None)
+        self.released.append(key)
+
+
+def _build_app(
+    store: _MemoryStore,
+    monkeypatch,
+    *,
+    wait_seconds: float = 2.0,
+    max_body_bytes: int = 1024 * 1024,
+):
+    monkeypatch.setattr(idempotency_mod, "_get_store", lambda settings: store)
+    app = FastAPI()
+    app.state.container = SimpleNamespace(
+        settings=SimpleNamespace(
+            idempotency_ttl_seconds=3600,
+            idempotency_lock_seconds=30,
+            idempotency_wait_seconds=wait_seconds,
+        )
+    )
+    app.add_exception_handler(IdempotentReplay, idempotent_replay_handler)
+
+    async def _api_error(request: Request, exc: ApiError) -> JSONResponse:
+        return JSONResponse(
+            {"error": {"code": exc.code}},
+            status_code=exc.status_code,
+            headers=exc.headers,
+        )
+
+    app.add_exception_handler(ApiError, _api_error)
+    app.add_middleware(IdempotencyMiddleware, max_body_bytes=max_body_bytes)
+    calls: list[dict[str, Any]] = []
+    gate = asyncio.Event()
+    gate.set()
+
+    @app.post("/charge", dependencies=[Depends(require_idempotency_key)])
+    async def charge(request: Request) -> JSONResponse:
+        payload = await request.json()
+        calls.append(payload)
+        await gate.wait()
+        if payload.get("explode"):
+            return JSONResponse({"error": "boom"}, status_code=503)
+        return JSONResponse(
+            {"charge": len(calls), "amount": payload["amount"]},
+            status_code=201,
+            headers={"X-Charge-Id": f"ch_{len(calls)}"},
+        )
+
+    return app, calls, gate
+
+
+def _client(app: FastAPI) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    )
+
+
+@pytest.mark.asyncio
+async def test_retry_replays_stored_response(monkeypatch) -> None:
+    store = _MemoryStore()
+    app, calls, _gate = _build_app(store, monkeypatch)
+
+    async with _client(app) as client:
+        first = await client.post(
+            "/charge", json={"amount": 10}, headers={IDEMPOTENCY_HEADER: "k1"}
+        )
+        second = await client.post(
+            "/charge", json={"amount": 10}, headers={IDEMPOTENCY_HEADER: "k1"}
+        )
+
+    assert len(calls) == 1
+    assert first.status_code == second.status_code == 201
+    assert second.json() == first.json() == {"charge": 1, "amount": 10}
+    assert second.headers["x-charge-id"] == "ch_1"
+    assert second.headers[IDEMPOTENCY_REPLAYED_HEADER] == "true"
+    assert IDEMPOTENCY_REPLAYED_HEADER not in first.headers
+    assert store.completed == ["k1"]
+
+
+@pytest.mark.asyncio
+async def test_reused_key_with_different_payload_is_rejected(monkeypatch) -> None:
+    store = _MemoryStore()
+    app, calls, _gate = _build_app(store, monkeypatch)
+
+    async with _client(app) as client:
+        await client.post(
+            "/charge", json={"amount": 10}, headers={IDEMPOTENCY_HEADER: "k2"}
+        )
+        reused = await client.post(
+            "/charge", json={"amount": 99}, headers={IDEMPOTENCY_HEADER: "k2"}
+        )
+
+    assert reused.status_code == 422
+    assert reused.json()["error"]["code"] == "E_IDEMPOTENCY_KEY_REUSED"
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_server_error_releases_key_for_retry(monkeypatch) -> None:
+    store = _MemoryStore()
+    app, calls, _gate = _build_app(store, monkeypatch)
+
+    async with _client(app) as client:
+        failed = await client.post(
+            "/charge",
+            json={"amount": 5, "explode": True},
+            headers={IDEMPOTENCY_HEADER: "k3"},
+        )
+        retried = await client.post(
+            "/charge",
+            json={"amount": 5, "explode": True},
+            headers={IDEMPOTENCY_HEADER: "k3"},
+        )
+
+    assert failed.status_code == retried.status_code == 503
+    assert len(calls) == 2
+    assert store.released == ["k3", "k3"]
+    assert "k3" not in store.rows
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicate_waits_for_original(monkeypatch) -> None:
+    store = _MemoryStore()
+    app, calls, gate = _build_app(store, monkeypatch)
+    gate.clear()
+
+    async with _client(app) as client:
+        original = asyncio.create_task(
+            client.post(
+                "/charge", json={"amount": 7}, headers={IDEMPOTENCY_HEADER: "k4"}
+            )
+        )
+        while not calls:
+            await asyncio.sleep(0.01)
+        duplicate = asyncio.create_task(
+            client.post(
+                "/charge", json={"amount": 7}, headers={IDEMPOTENCY_HEADER: "k4"}
+            )
+        )
+        await asyncio.sleep(0.1)
+        assert not duplicate.done()
+        gate.set()
+        first, second = await asyncio.gather(original, duplicate)
+
+    assert len(calls) == 1
+    assert first.json() == second.json()
+    assert second.headers[IDEMPOTENCY_REPLAYED_HEADER] == "true"
+
+
+@pytest.mark.asyncio
+async def test_in_flight_duplicate_conflicts_after_wait(monkeypatch) -> None:
+    store = _MemoryStore()
+    store.rows["k5"] = {"fingerprint": None, "status": None}
+    app, calls, _gate = _build_app(store, monkeypatch, wait_seconds=0.1)
+
+    async with _client(app) as client:
+        response = await client.post(
+            "/charge", json={"amount": 1}, headers={IDEMPOTENCY_HEADER: "k5"}
+        )
+
+    assert response.status_code == 409
+    assert response.headers["retry-after"] == "5"
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_oversized_response_is_not_replayed_empty(monkeypatch) -> None:
+    store = _MemoryStore()
+    app, calls, _gate = _build_app(store, monkeypatch, max_body_bytes=8)
+
+    async with _client(app) as client:
+        first = await client.post(
+            "/charge", json={"amount": 3}, headers={IDEMPOTENCY_HEADER: "k7"}
+        )
+        retry = await client.post(
+            "/charge", json={"amount": 3}, headers={IDEMPOTENCY_HEADER: "k7"}
+        )
+
+    assert first.status_code == 201 and first.json()["amount"] == 3
+    assert store.rows["k7"]["body"] is None and store.rows["k7"]["headers"] == []
+    assert retry.status_code == 409
+    assert retry.json()["error"]["code"] == "E_IDEMPOTENCY_RESPONSE_UNAVAILABLE"
+    assert IDEMPOTENCY_REPLAYED_HEADER not in retry.headers
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_round_trip() -> None:
+    cache = RedisIdempotencyCache(fakeredis.aioredis.FakeRedis())
+    record = IdempotencyRecord(
+        key="k6",
+        fingerprint="abc",
+        status_code=201,
+        headers=(("content-type", "application/json"),),
+        body=b'{"ok":true}' * 100,
+    )
+
+    await cache.put(record, ttl_seconds=60)
+    loaded = await cache.get("k6")
+
+    assert loaded == record
+    assert await cache.get("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_sweeper_drains_in_batches() -> None:
+    class _SweepStore:
+        def __init__(self, expired: int) -> None:
+            self.expired = expired
+            self.calls = 0
+
+        async def sweep(self, *, limit: int, legacy_ttl_seconds: int) -> int:
+            self.calls += 1
+            removed = min(limit, self.expired)
+            self.expired -= removed
+            return removed
+
+    store = _SweepStore(expired=25)
+    sweeper = IdempotencySweeper(store, batch_size=10)  # type: ignore[arg-type]
+
+    assert await sweeper.run_once() == 25
+    assert store.calls == 3
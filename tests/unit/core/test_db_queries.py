@@ -0,0 +1,108 @@
+import logging
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from apps.backend.app.api_gateway.middlewares.query_stats import QueryStatsMiddleware
+from packages.core import db_queries
+from packages.core.db_queries import (
+    QuerySettings,
+    configure_queries,
+    fingerprint,
+    instrument_engine,
+    redact_parameters,
+    track_queries,
+)
+from packages.core.testing import statement_budget
+
+pytest.importorskip("aiosqlite")
+
+
+@pytest_asyncio.fixture()
+async def engine():
+    configure_queries(QuerySettings(slow_query_ms=0.001, n_plus_one_threshold=3))
+    engine = instrument_engine(create_async_engine("sqlite+aiosqlite://"))
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, secret TEXT)"))
+        for item_id in range(5):
+            await conn.execute(
+                text("INSERT INTO items (id, secret) VALUES (:id, 'x')"), {"id": item_id}
+            )
+    yield engine
+    await engine.dispose()
+    configure_queries(None)
+
+
+def test_fingerprint_collapses_literals_placeholders_and_in_lists() -> None:
+    assert fingerprint(
+        "SELECT id FROM users WHERE id = :id AND role IN (1, 2, 3) -- admin\n"
+        "AND name = 'it''s' AND created_at::date > $2"
+    ) == "select id from users where id = ? and role in (?) and name = ? and created_at::date > ?"
+    assert fingerprint("INSERT INTO t (a) VALUES (:a_1), (:a_2)") == "insert into t (a) values (?)"
+    assert fingerprint("select col1 from t2") == "select col1 from t2"
+
+
+def test_redact_parameters_keeps_shape_only() -> None:
+    assert redact_parameters({"id": 7, "email": "a@b.c", "title": "hello", "tags": ["a"]}) == {
+        "id": 7,
+        "email": "***",
+        "title": "<str:5>",
+        "tags": "<list:1>",
+    }
+    assert redact_parameters([{"password": "x"}, {"password": "y"}], executemany=True) == {
+        "rows": 2,
+        "first": {"password": "***"},
+    }
+
+
+@pytest.mark.asyncio
+async def test_statements_are_counted_and_n_plus_one_flagged(engine, caplog) -> None:
+    caplog.set_level(logging.WARNING)
+    with track_queries("GET /items") as outer:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT count(*) FROM items"))
+            with track_queries() as inner:
+                for item_id in range(4):
+                    await conn.execute(
+                        text("SELECT secret FROM items WHERE id = :id"), {"id": item_id}
+                    )
+
+    assert inner.statements == 4
+    assert outer.statements == 5
+    assert outer.repeated(3) == [("select secret from items where id = ?", 4)]
+    n_plus_one = [r for r in caplog.records if "possible N+1" in r.getMessage()]
+    assert len(n_plus_one) == 1 and "GET /items" in n_plus_one[0].getMessage()
+    slow = [r for r in caplog.records if r.name == "packages.core.db.slow"]
+    assert slow and "'id': 3" in slow[-1].getMessage()
+    assert "'x'" not in " ".join(r.getMessage() for r in slow)
+
+
+@pytest.mark.asyncio
+async def test_statement_budget_and_request_middleware(engine) -> None:
+    app = FastAPI()
+
+    @app.get("/items/{count}")
+    async def items(count: int):
+        async with engine.connect() as conn:
+            for item_id in range(count):
+                await conn.execute(text("SELECT id FROM items WHERE id = :id"), {"id": item_id})
+        return {"stats": db_queries.current_query_stats().statements}
+
+    app.add_middleware(QueryStatsMiddleware)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/items/2")
+        assert response.json() == {"stats": 2}
+
+        with statement_budget(2):
+            await client.get("/items/2")
+        with pytest.raises(AssertionError, match="3x \\(> 1\\) select id from items"):
+            with statement_budget(5, max_per_fingerprint=1):
+                await client.get("/items/3")
+        with pytest.raises(AssertionError, match="4 statements > budget 3"):
+            with statement_budget(3):
+                await client.get("/items/4")
@@ -0,0 +1,68 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from packages.core.db_queries import instrument_engine, track_queries
+from packages.core.db_schema import SchemaCapabilityService, _code_heads
+
+pytest.importorskip("aiosqlite")
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest_asyncio.fixture()
+async def engine():
+    engine = instrument_engine(create_async_engine("sqlite+aiosqlite://"))
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE users (id INTEGER PRIMARY KEY, email TEXT, role TEXT)"))
+        await conn.execute(text("CREATE TABLE alembic_version (version_num TEXT PRIMARY KEY)"))
+        await conn.execute(text("INSERT INTO alembic_version VALUES ('0001')"))
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_capabilities_are_cached_and_follow_migrations(engine) -> None:
+    clock = FakeClock()
+    service = SchemaCapabilityService(
+        heads=lambda: frozenset({"0002"}), recheck_interval=60, clock=clock
+    )
+    async with engine.connect() as conn:
+        caps = await service.get(conn)
+        assert caps.has_table("users") and not caps.has_table("user_roles")
+        assert caps.has_column("users", "role") and not caps.has_column("users", "username")
+        assert caps.first_column("users", ("username", "email")) == "email"
+        assert caps.revisions == frozenset({"0001"}) and not caps.at_head
+
+        with track_queries() as stats:
+            assert await service.get(conn) is caps
+            clock.now += 61  # behind head: only the revision is re-read
+            assert await service.get(conn) is caps
+        assert stats.statements == 1
+
+        await conn.execute(text("CREATE TABLE user_roles (user_id INTEGER, role TEXT)"))
+        await conn.execute(text("UPDATE alembic_version SET version_num = '0002'"))
+        clock.now += 61
+        caps = await service.get(conn)
+        assert caps.has_table("user_roles") and caps.at_head
+
+        with track_queries() as stats:
+            for _ in range(3):
+                clock.now += 600
+                assert await service.get(conn) is caps
+        assert stats.statements == 0
+
+    service.invalidate(engine)
+    assert (await service.get(engine)).has_table("user_roles")
+
+
+def test_code_heads_come_from_the_backend_migrations() -> None:
+    heads = _code_heads()
+    assert heads and all(isinstance(head, str) for head in heads)
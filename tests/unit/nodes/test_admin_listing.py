@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+from datetime import UTC, datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from domains.product.nodes.adapters.admin_stats_events import (
+    register_admin_stats_projection,
+)
+from domains.product.nodes.adapters.sql.admin_stats import SQLNodeAdminStats
+from domains.product.nodes.application.admin_queries.listing import (
+    InvalidListCursor,
+    NodeListCursor,
+    NodeListFilters,
+    build_page_query,
+    fetch_node_page,
+    stream_nodes_csv,
+)
+
+pytest.importorskip("aiosqlite")
+
+_SCHEMA = (
+    """
+    CREATE TABLE nodes (
+        id INTEGER PRIMARY KEY,
+        slug TEXT NOT NULL,
+        title TEXT,
+        author_id TEXT,
+        status TEXT NOT NULL DEFAULT 'published',
+        is_public BOOLEAN NOT NULL DEFAULT 1,
+        updated_at TIMESTAMP NOT NULL,
+        created_at TIMESTAMP NOT NULL,
+        views_count INTEGER NOT NULL DEFAULT 0,
+        embedding_ready BOOLEAN,
+        embedding_status TEXT,
+        moderation_status TEXT NOT NULL DEFAULT 'pending',
+        moderation_status_updated_at TIMESTAMP
+    )
+    """,
+    "CREATE TABLE product_node_tags (node_id INTEGER NOT NULL, slug TEXT NOT NULL)",
+    """
+    CREATE TABLE node_comments (
+        id INTEGER PRIMARY KEY,
+        node_id INTEGER NOT NULL,
+        status TEXT NOT NULL,
+        created_at TIMESTAMP NOT NULL,
+        updated_at TIMESTAMP NOT NULL
+    )
+    """,
+    "CREATE TABLE node_comment_bans (node_id INTEGER NOT NULL, target_user_id TEXT NOT NULL)",
+    """
+    CREATE TABLE node_admin_stats (
+        node_id INTEGER PRIMARY KEY,
+        total_comments INTEGER NOT NULL DEFAULT 0,
+        pending_count INTEGER NOT NULL DEFAULT 0,
+        published_count INTEGER NOT NULL DEFAULT 0,
+        hidden_count INTEGER NOT NULL DEFAULT 0,
+        deleted_count INTEGER NOT NULL DEFAULT 0,
+        blocked_count INTEGER NOT NULL DEFAULT 0,
+        bans_count INTEGER NOT NULL DEFAULT 0,
+        last_comment_created_at TIMESTAMP,
+        last_comment_updated_at TIMESTAMP,
+        refreshed_at TIMESTAMP NOT NULL
+    )
+    """,
+)
+
+_BASE = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+@pytest_asyncio.fixture()
+async def engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'nodes.db'}")
+    async with engine.begin() as conn:
+        for statement in _SCHEMA:
+            await conn.execute(text(statement))
+        for index in range(1, 31):
+            # Pairs of nodes share updated_at, so ties must be broken by id.
+            stamp = _BASE + timedelta(minutes=index // 2)
+            await conn.execute(
+                text(
+                    "INSERT INTO nodes (id, slug, title, updated_at, created_at,"
+                    " views_count, moderation_status)"
+                    " VALUES (:id, :slug, :title, :ts, :ts, :views, :mod)"
+                ),
+                {
+                    "id": index,
+                    "slug": f"node-{index}",
+                    "title": f"Node {index}",
+                    "ts": stamp,
+                    "views": index % 4,
+                    "mod": "hidden" if index % 5 == 0 else "pending",
+                },
+            )
+        await conn.execute(
+            text("INSERT INTO product_node_tags (node_id, slug) VALUES (3, 'dev-blog')")
+        )
+    yield engine
+    await engine.dispose()
+
+
+async def _walk(engine, filters: NodeListFilters, limit: int) -> list[int]:
+    ids: list[int] = []
+    cursor = None
+    while True:
+        async with engine.connect() as conn:
+            rows = await fetch_node_page(conn, filters, cursor=cursor, limit=limit)
+        ids.extend(int(row["id"]) for row in rows)
+        if len(rows) < limit:
+            return ids
+        cursor = NodeListCursor.decode(rows[-1]["cursor"], filters)
+
+
+@pytest.mark.asyncio
+async def test_keyset_pages_cover_listing_once_in_order(engine) -> None:
+    newest_first = NodeListFilters.create(sort="updated_at", order="desc")
+    ids = await _walk(engine, newest_first, limit=4)
+    expected = sorted(
+        (i for i in range(1, 31) if i != 3), key=lambda i: (i // 2, i), reverse=True
+    )
+    assert ids == expected
+
+    by_views = NodeListFilters.create(sort="views", order="asc", moderation_status="hidden")
+    assert await _walk(engine, by_views, limit=2) == [20, 5, 25, 10, 30, 15]
+
+
+@pytest.mark.asyncio
+async def test_cursor_is_bound_to_filters(engine) -> None:
+    filters = NodeListFilters.create(sort="created_at")
+    async with engine.connect() as conn:
+        rows = await fetch_node_page(conn, filters, cursor=None, limit=5)
+    token = rows[-1]["cursor"]
+
+    decoded = NodeListCursor.decode(token, filters)
+    assert decoded.id == int(rows[-1]["id"])
+    with pytest.raises(InvalidListCursor):
+        NodeListCursor.decode(token, NodeListFilters.create(sort="created_at", q="x"))
+    with pytest.raises(InvalidListCursor):
+        NodeListCursor.decode("not-a-cursor", filters)
+
+
+def test_search_escapes_like_wildcards_and_matches_ids_only_for_digits() -> None:
+    sql, params = build_page_query(NodeListFilters.create(q="50%_off"), cursor=None, limit=10)
+    assert params["q"] == "%50\\%\\_off%"
+    assert "qid" not in params and "n.id = :qid" not in sql
+
+    sql, params = build_page_query(NodeListFilters.create(q=" 42 "), cursor=None, limit=10)
+    assert params["qid"] == 42 and "n.id = :qid" in sql
+    assert "OFFSET" not in sql and "node_admin_stats" not in sql
+
+
+class _Events:
+    def __init__(self) -> None:
+        self.handlers: dict[str, list] = {}
+
+    def on(self, topic, handler) -> None:
+        self.handlers.setdefault(topic, []).append(handler)
+
+    def emit(self, topic, payload) -> None:
+        for handler in self.handlers.get(topic, []):
+            handler(topic, payload)
+
+
+@pytest.mark.asyncio
+async def test_comment_events_refresh_stats_used_for_sorting(engine) -> None:
+    async with engine.begin() as conn:
+        for comment_id, (node_id, status) in enumerate(
+            [(4, "published"), (4, "pending"), (4, "hidden"), (9, "published")], start=1
+        ):
+            await conn.execute(
+                text(
+                    "INSERT INTO node_comments (id, node_id, status, created_at, updated_at)"
+                    " VALUES (:id, :node_id, :status, :ts, :ts)"
+                ),
+                {"id": comment_id, "node_id": node_id, "status": status, "ts": _BASE},
+            )
+        await conn.execute(
+            text("INSERT INTO node_comment_bans (node_id, target_user_id) VALUES (9, 'u1')")
+        )
+
+    stats = SQLNodeAdminStats(engine)
+    refreshed: list[list[int]] = []
+
+    class _Recorder:
+        async def refresh(self, node_ids):
+            refreshed.append(list(node_ids))
+            await stats.refresh(node_ids)
+
+    events = _Events()
+    register_admin_stats_projection(events, _Recorder())
+    events.emit("node.comment.created.v1", {"node_id": 4})
+    events.emit("node.comment.status_changed.v1", {"node_id": 4})
+    events.emit("node.comments.user_banned.v1", {"node_id": 9})
+    events.emit("node.comment.deleted.v1", {"id": 1})
+    await asyncio.sleep(0.2)
+
+    assert refreshed == [[4, 9]]
+    filters = NodeListFilters.create(sort="comments", order="desc")
+    async with engine.connect() as conn:
+        rows = await fetch_node_page(conn, filters, cursor=None, limit=2, include_stats=True)
+    assert [(int(r["id"]), r["total_comments"]) for r in rows] == [(4, 3), (9, 1)]
+    assert rows[0]["pending_count"] == 1 and rows[0]["hidden_count"] == 1
+    assert rows[1]["bans_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_csv_export_streams_pages_and_resumes_from_cursor(engine) -> None:
+    filters = NodeListFilters.create(sort="updated_at", order="asc")
+    chunks = [chunk async for chunk in stream_nodes_csv(engine, filters, batch_size=8)]
+    assert len(chunks) == 1 + 4  # header, then one chunk per page
+    rows = list(csv.DictReader(io.StringIO(b"".join(chunks).decode("utf-8"))))
+    assert [int(row["id"]) for row in rows] == [i for i in range(1, 31) if i != 3]
+
+    resume = NodeListCursor.decode(rows[9]["cursor"], filters)
+    tail = b"".join(
+        [chunk async for chunk in stream_nodes_csv(engine, filters, cursor=resume, max_rows=5)]
+    )
+    tail_rows = list(csv.DictReader(io.StringIO(tail.decode("utf-8"))))
+    assert [row["id"] for row in tail_rows] == [row["id"] for row in rows[10:15]]
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import fakeredis
+import pytest
+
+from domains.platform.events.adapters.outbox_memory import InMemoryOutbox
+from domains.platform.events.service import Events
+from domains.platform.search.adapters.memory_index import InMemoryIndex
+from domains.platform.search.application.service import SearchService
+from domains.platform.search.ports import Doc
+from domains.platform.search.wires import SearchContainer, register_event_indexers
+from domains.product.nodes.adapters.cache_events import (
+    invalidate_batch,
+    register_node_cache_invalidation,
+)
+from domains.product.nodes.application.interactors.events import (
+    NODE_TAGS_UPDATED_BATCH_TOPIC,
+    NODE_UPDATED_BATCH_TOPIC,
+    NodeEventPublisher,
+)
+from domains.product.nodes.application.ports import NodeDTO
+from domains.product.nodes.infrastructure import AdminEvent, emit_admin_events
+from domains.product.nodes.infrastructure.cache import (
+    InMemoryNodeCache,
+    RedisNodeCache,
+)
+from domains.product.tags.adapters.sql.usage_writer import (
+    SQLTagUsageWriter,
+    register_tags_usage_writer,
+)
+
+
+class _Bus:
+    def __init__(self) -> None:
+        self.handlers: dict[str, list] = {}
+
+    def subscribe(self, topic, handler) -> None:
+        self.handlers.setdefault(topic, []).append(handler)
+
+    def emit(self, topic, payload) -> None:
+        for handler in self.handlers.get(topic, []):
+            handler(topic, payload)
+
+
+class _CountingOutbox(InMemoryOutbox):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def publish_many(self, events) -> None:
+        self.calls += 1
+        super().publish_many(events)
+
+
+class _PlainOutbox:
+    def __init__(self) -> None:
+        self.events: list[tuple] = []
+
+    def publish(self, topic, payload, key=None) -> None:
+        self.events.append((topic, payload, key))
+
+
+def _dto(node_id: int) -> NodeDTO:
+    return NodeDTO(
+        id=node_id,
+        slug=f"node-{node_id}",
+        author_id="a",
+        title=None,
+        tags=[],
+        is_public=True,
+    )
+
+
+def test_events_publish_many_uses_one_outbox_call_and_falls_back() -> None:
+    batch_outbox = _CountingOutbox()
+    events = [("node.updated.v1", {"id": i}, f"node:{i}") for i in range(3)]
+    Events(outbox=batch_outbox, bus=_Bus()).publish_many(events)
+    assert batch_outbox.calls == 1
+    assert list(batch_outbox.drain()) == events
+
+    plain = _PlainOutbox()
+    Events(outbox=plain, bus=_Bus()).publish_many(events)
+    assert plain.events == events
+
+
+def test_emit_admin_events_publishes_batch_through_nodes_service() -> None:
+    outbox = _CountingOutbox()
+    publisher = NodeEventPublisher(outbox)
+    nodes_service = SimpleNamespace(_safe_publish_many=publisher.publish_many)
+    container = SimpleNamespace(nodes_service=nodes_service, events=None)
+
+    emit_admin_events(
+        container,
+        [
+            AdminEvent(
+                event=NODE_UPDATED_BATCH_TOPIC,
+                payload={"ids": [1, 2], "batch_id": "b1"},
+                key="nodes:batch:b1",
+            ),
+            AdminEvent(event="node.updated.v1", payload={"id": 1}, key="node:1"),
+            AdminEvent(event="node.updated.v1", payload=None),
+        ],
+    )
+
+    assert outbox.calls == 1
+    assert [topic for topic, _, _ in outbox.drain()] == [
+        NODE_UPDATED_BATCH_TOPIC,
+        "node.updated.v1",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batch_envelope_invalidates_node_cache_in_one_pass() -> None:
+    memory = InMemoryNodeCache()
+    redis_cache = RedisNodeCache(fakeredis.aioredis.FakeRedis())
+    for cache in (memory, redis_cache):
+        for node_id in (1, 2, 3):
+            await cache.set(_dto(node_id))
+
+    bus = _Bus()
+    register_node_cache_invalidation(Events(outbox=InMemoryOutbox(), bus=bus), memory)
+    bus.emit(NODE_TAGS_UPDATED_BATCH_TOPIC, {"ids": [1, 2], "slugs": ["node-1", "node-2"]})
+    await asyncio.sleep(0)
+    assert await memory.get(1) is None and await memory.get_by_slug("node-2") is None
+    assert await memory.get(3) is not None
+
+    assert await invalidate_batch(redis_cache, {"ids": [1, 2], "slugs": ["node-1"]}) == 2
+    assert await redis_cache.get_by_slug("node-1") is None
+    assert await redis_cache.get(2) is None and await redis_cache.get(3) is not None
+
+    invalidated: list[int] = []
+
+    class _LegacyCache:
+        async def invalidate(self, node_id, slug=None) -> None:
+            invalidated.append(node_id)
+
+    await invalidate_batch(_LegacyCache(), {"ids": [5, 6]})
+    assert invalidated == [5, 6]
+
+
+class _RecordingConn:
+    def __init__(self, calls: list) -> None:
+        self._calls = calls
+
+    async def execute(self, statement, params=None) -> None:
+        self._calls.append((" ".join(str(statement).split()), params))
+
+
+class _RecordingEngine:
+    def __init__(self) -> None:
+        self.calls: list = []
+        self.transactions = 0
+
+    def begin(self):
+        engine = self
+
+        class _Tx:
+            async def __aenter__(self):
+                engine.transactions += 1
+                return _RecordingConn(engine.calls)
+
+            async def __aexit__(self, *exc) -> None:
+                return None
+
+        return _Tx()
+
+
+@pytest.mark.asyncio
+async def test_usage_writer_applies_batch_usage_in_one_transaction(monkeypatch) -> None:
+    engine = _RecordingEngine()
+    writer = SQLTagUsageWriter(engine)  # type: ignore[arg-type]
+    monkeypatch.setattr(
+        "domains.product.tags.adapters.sql.usage_writer.SQLTagUsageWriter",
+        lambda _engine: writer,
+    )
+    bus = _Bus()
+    register_tags_usage_writer(Events(outbox=InMemoryOutbox(), bus=bus), "unused")
+
+    bus.emit(
+        NODE_TAGS_UPDATED_BATCH_TOPIC,
+        {
+            "content_type": "node",
+            "usage": [
+                {"author_id": "u1", "added": ["a", "b", "a"], "removed": []},
+                {"author_id": "u2", "added": ["a"], "removed": []},
+                {"author_id": "", "added": ["ignored"]},
+            ],
+        },
+    )
+    await asyncio.sleep(0.05)
+
+    assert engine.transactions == 1
+    [(sql, params)] = engine.calls
+    assert sql.startswith("INSERT INTO tag_usage_counters")
+    assert [(p["aid"], p["slug"], p["delta"]) for p in params] == [
+        ("u1", "a", 2),
+        ("u1", "b", 1),
+        ("u2", "a", 1),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_unpublish_batch_removes_node_documents_with_one_cache_bump() -> None:
+    bumps: list[int] = []
+
+    class _Cache:
+        async def bump_version(self) -> None:
+            bumps.append(1)
+
+    index = InMemoryIndex()
+    service = SearchService(index=index, query=index, cache=_Cache())  # type: ignore[arg-type]
+    for node_id in (1, 2, 3):
+        await index.upsert(Doc(id=f"node:{node_id}", title=f"n{node_id}", text=""))
+
+    bus = _Bus()
+    register_event_indexers(Events(outbox=InMemoryOutbox(), bus=bus), SearchContainer(service))
+    bus.emit(NODE_UPDATED_BATCH_TOPIC, {"ids": [1, 2], "is_public": True})
+    bus.emit(NODE_UPDATED_BATCH_TOPIC, {"ids": [1, 2], "is_public": False})
+    await asyncio.sleep(0)
+
+    assert [doc.id for doc in await index.list_all()] == ["node:3"]
+    assert bumps == [1]
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from domains.product.nodes.adapters.memory.comments import MemoryNodeCommentsRepo
+from domains.product.nodes.adapters.sql.comment_threads import (
+    apply_reply_counts,
+    fetch_comment_counters,
+    fetch_thread_window,
+)
+from domains.product.nodes.application.comment_threads import (
+    InvalidThreadCursor,
+    ThreadCursor,
+    ThreadScope,
+    comment_path,
+)
+
+pytest.importorskip("aiosqlite")
+
+
+async def _build_tree(repo: MemoryNodeCommentsRepo) -> dict[str, int]:
+    """r1 -> (a -> (a1, a2), b), r2 -> c, on node 1; one comment on node 2."""
+
+    ids: dict[str, int] = {}
+
+    async def add(name: str, parent: str | None = None, node_id: int = 1) -> None:
+        comment = await repo.create(
+            node_id=node_id,
+            author_id="u1",
+            content=name,
+            parent_comment_id=ids[parent] if parent else None,
+        )
+        ids[name] = comment.id
+
+    await add("r1")
+    await add("r2")
+    await add("a", "r1")
+    await add("c", "r2")
+    await add("a1", "a")
+    await add("b", "r1")
+    await add("a2", "a")
+    await add("other", node_id=2)
+    return ids
+
+
+async def _walk(repo: MemoryNodeCommentsRepo, limit: int, **kwargs) -> list[str]:
+    names: list[str] = []
+    cursor = None
+    while True:
+        page = await repo.list_thread(1, cursor=cursor, limit=limit, **kwargs)
+        names.extend(item.content for item in page.items)
+        if page.next_cursor is None:
+            return names
+        cursor = page.next_cursor
+
+
+@pytest.mark.asyncio
+async def test_thread_windows_walk_tree_depth_first_once() -> None:
+    repo = MemoryNodeCommentsRepo()
+    ids = await _build_tree(repo)
+
+    assert await _walk(repo, limit=2) == ["r1", "a", "a1", "a2", "b", "r2", "c"]
+    assert await _walk(repo, limit=3, max_depth=1) == ["r1", "a", "b", "r2", "c"]
+
+    subtree = await repo.list_thread(1, parent_comment_id=ids["r1"], max_depth=0)
+    assert [item.content for item in subtree.items] == ["a", "b"]
+    subtree = await repo.list_thread(1, parent_comment_id=ids["a"])
+    assert [item.content for item in subtree.items] == ["a1", "a2"]
+    missing = await repo.list_thread(1, parent_comment_id=ids["other"])
+    assert missing.items == []
+
+
+@pytest.mark.asyncio
+async def test_reply_counts_follow_status_changes_and_deletes() -> None:
+    repo = MemoryNodeCommentsRepo()
+    ids = await _build_tree(repo)
+
+    page = await repo.list_thread(1)
+    counts = {item.content: (item.reply_count, item.descendant_count) for item in page.items}
+    assert counts["r1"] == (2, 4) and counts["a"] == (2, 2) and counts["r2"] == (1, 1)
+    assert (page.comments_count, page.threads_count) == (7, 2)
+
+    await repo.update_status(ids["a1"], "hidden")
+    await repo.soft_delete(ids["r2"], actor_id="mod")
+    page = await repo.list_thread(1)
+    counts = {item.content: (item.reply_count, item.descendant_count) for item in page.items}
+    assert counts["r1"] == (2, 3) and counts["a"] == (1, 1)
+    assert "r2" not in counts and counts["c"] == (0, 0)
+    assert (page.comments_count, page.threads_count) == (5, 1)
+
+    await repo.update_status(ids["a1"], "published")
+    await repo.hard_delete(ids["a"])
+    page = await repo.list_thread(1)
+    assert [item.content for item in page.items] == ["r1", "b", "c"]
+    assert (page.items[0].reply_count, page.items[0].descendant_count) == (1, 1)
+    assert (page.comments_count, page.threads_count) == (3, 1)
+
+
+def test_thread_cursor_roundtrip_is_bound_to_scope() -> None:
+    scope = ThreadScope(node_id=1, max_depth=2)
+    path = comment_path(comment_path(None, 12), 345)
+    token = ThreadCursor(path=path).encode(scope)
+
+    assert ThreadCursor.decode(token, scope).path == path
+    with pytest.raises(InvalidThreadCursor):
+        ThreadCursor.decode(token, ThreadScope(node_id=1, max_depth=3))
+    with pytest.raises(ValueError, match="cursor_invalid"):
+        ThreadCursor.decode("%%%", scope)
+
+
+_SCHEMA = (
+    """
+    CREATE TABLE node_comments (
+        id INTEGER PRIMARY KEY,
+        node_id INTEGER NOT NULL,
+        author_id TEXT NOT NULL,
+        parent_comment_id INTEGER,
+        depth INTEGER NOT NULL,
+        content TEXT NOT NULL,
+        status TEXT NOT NULL DEFAULT 'published',
+        metadata TEXT NOT NULL DEFAULT '{}',
+        created_at TIMESTAMP NOT NULL,
+        updated_at TIMESTAMP NOT NULL,
+        path TEXT NOT NULL,
+        reply_count INTEGER NOT NULL DEFAULT 0,
+        descendant_count INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    "CREATE INDEX ix_node_comments_node_path ON node_comments (node_id, path)",
+    """
+    CREATE TABLE node_comment_counters (
+        node_id INTEGER PRIMARY KEY,
+        comments_count INTEGER NOT NULL DEFAULT 0,
+        threads_count INTEGER NOT NULL DEFAULT 0,
+        updated_at TIMESTAMP NOT NULL
+    )
+    """,
+)
+
+
+@pytest_asyncio.fixture()
+async def engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'comments.db'}")
+    async with engine.begin() as conn:
+        for statement in _SCHEMA:
+            await conn.execute(text(statement))
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_sql_window_and_counters_match_memory_repo(engine) -> None:
+    repo = MemoryNodeCommentsRepo()
+    await _build_tree(repo)
+    stamp = datetime(2026, 1, 1, tzinfo=UTC)
+    created = sorted(repo._comments.values(), key=lambda state: state["id"])
+    async with engine.begin() as conn:
+        for state in created:
+            await conn.execute(
+                text(
+                    "INSERT INTO node_comments (id, node_id, author_id, parent_comment_id,"
+                    " depth, content, created_at, updated_at, path)"
+                    " VALUES (:id, :node_id, :author_id, :parent, :depth, :content,"
+                    " :ts, :ts, :path)"
+                ),
+                {
+                    "id": state["id"],
+                    "node_id": state["node_id"],
+                    "author_id": state["author_id"],
+                    "parent": state["parent_comment_id"],
+                    "depth": state["depth"],
+                    "content": state["content"],
+                    "ts": stamp,
+                    "path": state["path"],
+                },
+            )
+            await apply_reply_counts(
+                conn,
+                node_id=state["node_id"],
+                path=state["path"],
+                visible_delta=1,
+                own_delta=1,
+            )
+
+    scope = ThreadScope(node_id=1)
+    expected = (await repo.list_thread(1)).items
+    async with engine.connect() as conn:
+        first = await fetch_thread_window(conn, scope, cursor=None, limit=4)
+        rest = await fetch_thread_window(
+            conn, scope, cursor=ThreadCursor(path=first[-1]["path"]), limit=10
+        )
+        counters = await fetch_comment_counters(conn, 1)
+    rows = first + rest
+    assert [row["content"] for row in rows] == [item.content for item in expected]
+    assert [(row["reply_count"], row["descendant_count"]) for row in rows] == [
+        (item.reply_count, item.descendant_count) for item in expected
+    ]
+    assert rows[0]["created_at"] == "2026-01-01T00:00:00Z" and rows[0]["metadata"] == {}
+    assert counters == (7, 2)
+
+    parent = created[0]  # r1
+    async with engine.connect() as conn:
+        subtree = await fetch_thread_window(
+            conn,
+            ThreadScope(node_id=1, parent_comment_id=parent["id"], max_depth=0),
+            cursor=None,
+            limit=10,
+        )
+    assert [row["content"] for row in subtree] == ["a", "b"]
@@ -0,0 +1,238 @@
+import csv
+import gzip
+import io
+import json
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+
+from domains.platform.audit.adapters.memory.repository import InMemoryAuditRepo
+from domains.platform.audit.api.http import make_router
+from domains.platform.audit.application.export import (
+    AuditExportFilters,
+    AuditExportService,
+    ExportCursor,
+    InvalidExportCursor,
+    accepts_gzip,
+)
+from domains.platform.iam.security import csrf_protect, require_admin
+
+
+async def _seeded_repo(count: int) -> InMemoryAuditRepo:
+    repo = InMemoryAuditRepo(max_items=count)
+    base_ms = int(datetime.now(UTC).timestamp() * 1000) - count * 1000
+    for index in range(count):
+        repo._items.append(
+            {
+                "id": f"00000000-0000-0000-0000-{index:012d}",
+                # Pairs of rows share a timestamp so the id tie-breaker matters.
+                "ts": base_ms + (index // 2) * 1000,
+                "actor_id": None,
+                "action": "nodes.update" if index % 3 else "auth.login_failed",
+                "resource_type": "node",
+                "resource_id": str(index),
+                "before": None,
+                "after": None,
+                "ip": "127.0.0.1",
+                "user_agent": "pytest",
+                "extra": None,
+            }
+        )
+    return repo
+
+
+async def _collect(stream) -> bytes:
+    return b"".join([chunk async for chunk in stream])
+
+
+@pytest.mark.asyncio
+async def test_stream_pages_with_keyset_and_resumes_from_cursor() -> None:
+    repo = await _seeded_repo(25)
+    service = AuditExportService(repo, batch_size=4)
+    filters = AuditExportFilters()
+
+    full = await _collect(service.stream(filters, fmt="ndjson"))
+    items = [json.loads(line) for line in full.splitlines()]
+    assert len(items) == 25
+    assert len({item["id"] for item in items}) == 25
+
+    head = await _collect(service.stream(filters, fmt="ndjson", limit=10))
+    head_items = [json.loads(line) for line in head.splitlines()]
+    assert len(head_items) == 10
+    cursor = service.decode_cursor(head_items[-1]["cursor"], filters)
+    rest = await _collect(service.stream(filters, fmt="ndjson", cursor=cursor))
+    rest_ids = [json.loads(line)["id"] for line in rest.splitlines()]
+
+    assert [item["id"] for item in head_items] + rest_ids == [
+        item["id"] for item in items
+    ]
+
+
+@pytest.mark.asyncio
+async def test_gzip_csv_stream_matches_plain_output() -> None:
+    repo = await _seeded_repo(9)
+    service = AuditExportService(repo, batch_size=2)
+    filters = AuditExportFilters(modules=("nodes",))
+
+    plain = await _collect(service.stream(filters, fmt="csv"))
+    chunks = [c async for c in service.stream(filters, fmt="csv", compress=True)]
+
+    assert len(chunks) > 2
+    assert gzip.decompress(b"".join(chunks)) == plain
+    rows = list(csv.DictReader(io.StringIO(plain.decode("utf-8"))))
+    assert len(rows) == 6
+    assert {row["module"] for row in rows} == {"nodes"}
+
+
+def test_cursor_rejects_tampering_and_foreign_filters() -> None:
+    filters = AuditExportFilters(actions=("nodes.update",))
+    cursor = ExportCursor(
+        created_at=datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=UTC), id="abc"
+    )
+    token = cursor.encode(filters)
+
+    assert ExportCursor.decode(token, filters) == cursor
+    with pytest.raises(InvalidExportCursor):
+        ExportCursor.decode(token, AuditExportFilters())
+    with pytest.raises(InvalidExportCursor):
+        ExportCursor.decode("not-a-token!", filters)
+
+
+@pytest.mark.asyncio
+async def test_export_job_writes_file_and_manifest(tmp_path) -> None:
+    repo = await _seeded_repo(12)
+    now = datetime(2026, 1, 1, tzinfo=UTC)
+    service = AuditExportService(
+        repo, storage_dir=tmp_path, batch_size=5, clock=lambda: now
+    )
+    filters = AuditExportFilters()
+
+    job = service.create_job(filters, fmt="ndjson", limit=7, compress=True)
+    finished = await service.run_job(job.id)
+
+    assert finished.status == "completed"
+    assert finished.rows == 7 and finished.next_cursor
+    assert service.get_job(job.id) == finished
+    path = service.file_path(finished)
+    assert not path.with_name(path.name + ".part").exists()
+    lines = gzip.decompress(path.read_bytes()).splitlines()
+    assert len(lines) == 7
+    assert finished.bytes == path.stat().st_size
+
+    follow_up = service.create_job(filters, fmt="ndjson", cursor=finished.next_cursor)
+    rest = await service.run_job(follow_up.id)
+    assert rest.rows == 5 and rest.next_cursor is None
+    assert service.get_job("../etc/passwd") is None
+    assert finished.finished_at == now
+
+
+def test_accept_encoding_is_parsed_as_tokens() -> None:
+    assert accepts_gzip("gzip")
+    assert accepts_gzip("br;q=1.0, GZIP;q=0.5")
+    assert accepts_gzip("identity, *")
+    assert not accepts_gzip("gzip;q=0, *")
+    assert not accepts_gzip("x-notgzip, br")
+    assert not accepts_gzip("gzipped")
+    assert not accepts_gzip(None)
+
+
+@pytest.mark.asyncio
+async def test_job_with_expired_lease_is_failed_and_reclaimed(tmp_path) -> None:
+    repo = await _seeded_repo(4)
+    clock = {"now": datetime(2026, 1, 1, tzinfo=UTC)}
+    service = AuditExportService(
+        repo, storage_dir=tmp_path, lease_seconds=60, clock=lambda: clock["now"]
+    )
+    job = service.create_job(AuditExportFilters(), fmt="csv")
+    # A worker took the job and died before finishing it.
+    service._save(
+        replace(job, status="running", lease_until=clock["now"] + timedelta(seconds=60))
+    )
+    assert service.get_job(job.id).status == "running"
+    assert (await service.run_job(job.id)).status == "running"  # lease still held
+
+    clock["now"] += timedelta(seconds=61)
+    lost = service.get_job(job.id)
+    assert (lost.status, lost.error) == ("failed", "export_worker_lost")
+
+    finished = await service.run_job(job.id)
+    assert (finished.status, finished.rows, finished.error) == ("completed", 4, None)
+    assert finished.lease_until is None
+
+
+@pytest.mark.asyncio
+async def test_taken_over_worker_stops_without_writing(tmp_path) -> None:
+    repo = await _seeded_repo(4)
+    clock = {"now": datetime(2026, 1, 1, tzinfo=UTC)}
+    service = AuditExportService(
+        repo, storage_dir=tmp_path, batch_size=1, lease_seconds=60, clock=lambda: clock["now"]
+    )
+    job = service.create_job(AuditExportFilters(), fmt="csv", compress=False)
+    list_after = repo.list_after
+    takeover: dict[str, object] = {}
+
+    async def stalled_list_after(**kwargs):
+        if kwargs.get("after") is not None and not takeover:
+            # The first worker stalls past its lease; a second one claims the job.
+            takeover["pending"] = True
+            assert (await service.run_job(job.id)).status == "running"  # still leased
+            clock["now"] += timedelta(seconds=61)
+            takeover["job"] = await service.run_job(job.id)
+        return await list_after(**kwargs)
+
+    repo.list_after = stalled_list_after  # type: ignore[method-assign]
+    first = await service.run_job(job.id)
+
+    second = takeover["job"]
+    assert (second.status, second.rows, second.lease_token) == ("completed", 4, None)
+    assert first == second == service.get_job(job.id)
+    rows = list(csv.reader(io.StringIO(service.file_path(second).read_text())))
+    assert len(rows) == 5
+    assert sorted(path.suffix for path in tmp_path.iterdir()) == [".csv", ".json"]
+
+
+@pytest.mark.asyncio
+async def test_export_endpoint_streams_and_validates_cursor(tmp_path) -> None:
+    repo = await _seeded_repo(6)
+    exports = AuditExportService(repo, storage_dir=tmp_path, batch_size=2)
+    app = FastAPI()
+    app.include_router(make_router())
+    app.state.container = SimpleNamespace(
+        audit=SimpleNamespace(repo=repo, exports=exports)
+    )
+
+    async def _noop(_: Request) -> None:
+        return None
+
+    app.dependency_overrides[require_admin] = _noop
+    app.dependency_overrides[csrf_protect] = _noop
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get("/v1/audit/export", params={"format": "json"})
+        assert resp.status_code == 200
+        assert len(resp.json()["items"]) == 6
+
+        resp = await client.get(
+            "/v1/audit/export",
+            params={"format": "csv"},
+            headers={"Accept-Encoding": "gzip"},
+        )
+        assert resp.headers["content-encoding"] == "gzip"
+        assert resp.text.count("\n") == 7
+
+        resp = await client.get("/v1/audit/export", params={"cursor": "bogus"})
+        assert resp.status_code == 400
+
+        resp = await client.post("/v1/audit/exports", params={"format": "ndjson"})
+        assert resp.status_code == 202
+        job_id = resp.json()["id"]
+        status = (await client.get(f"/v1/audit/exports/{job_id}")).json()
+        assert status["status"] == "completed" and status["rows"] == 6
+        download = await client.get(status["download_url"])
+        assert download.status_code == 200
+        assert download.headers["content-type"] == "application/gzip"
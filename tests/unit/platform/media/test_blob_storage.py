@@ -0,0 +1,81 @@
+import asyncio
+import hashlib
+import io
+
+import pytest
+
+from domains.platform.media.adapters.local_storage import LocalStorageGateway
+from domains.platform.media.application.storage_service import StorageService
+from domains.platform.media.ports.storage_port import UploadTooLarge
+
+
+async def _chunks(data: bytes, size: int = 4096):
+    for offset in range(0, len(data), size):
+        await asyncio.sleep(0)
+        yield data[offset : offset + size]
+
+
+@pytest.mark.asyncio
+async def test_save_stream_is_content_addressed_and_deduplicated(tmp_path) -> None:
+    storage = LocalStorageGateway(str(tmp_path), chunk_size=4096)
+    payload = bytes(range(256)) * 200
+    digest = hashlib.sha256(payload).hexdigest()
+
+    first = await storage.save_stream(_chunks(payload), "a.png", "image/png")
+    second = await storage.save_stream(_chunks(payload), "b.png", "image/png")
+
+    assert first.sha256 == digest and first.size == len(payload)
+    assert first.url == second.url == f"/v1/media/file/{digest[:2]}/{digest[2:4]}/{digest}.png"
+    assert second.refs == 2 and second.deduplicated
+    blobs = list(tmp_path.rglob(f"{digest}.png"))
+    assert len(blobs) == 1 and blobs[0].read_bytes() == payload
+    assert list((tmp_path / ".tmp").iterdir()) == []
+
+    # The blocking path shares the same addressing and counters.
+    assert storage.save(io.BytesIO(payload), "c.png", "image/png") == first.url
+    assert storage.refs(first.url) == 3
+
+
+@pytest.mark.asyncio
+async def test_release_removes_blob_after_last_reference(tmp_path) -> None:
+    storage = LocalStorageGateway(str(tmp_path))
+    service = StorageService(storage)
+    blob = await service.save_upload(_chunks(b"x" * 10_000), "a.jpg", "image/jpeg")
+    await service.save_upload(_chunks(b"x" * 10_000), "b.jpg", "image/jpeg")
+    path = next(tmp_path.rglob(f"{blob.sha256}.jpg"))
+
+    assert await service.release_file(blob.url) == 1
+    assert path.exists()
+    assert await service.release_file(blob.url) == 0
+    assert not path.exists()
+    assert await service.release_file("/v1/media/file/../../etc/passwd") == 0
+
+
+@pytest.mark.asyncio
+async def test_oversized_upload_is_rejected_and_temp_file_removed(tmp_path) -> None:
+    storage = LocalStorageGateway(str(tmp_path))
+
+    with pytest.raises(UploadTooLarge):
+        await storage.save_stream(
+            _chunks(b"y" * 50_000), "big.webp", "image/webp", max_bytes=20_000
+        )
+
+    assert list((tmp_path / ".tmp").iterdir()) == []
+    assert not any(p.suffix == ".webp" for p in tmp_path.rglob("*"))
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_uploads_share_one_blob(tmp_path) -> None:
+    storage = LocalStorageGateway(str(tmp_path), chunk_size=4096)
+    payload = b"concurrent" * 5_000
+
+    blobs = await asyncio.gather(
+        *(
+            storage.save_stream(_chunks(payload), f"{i}.png", "image/png")
+            for i in range(8)
+        )
+    )
+
+    assert len({blob.url for blob in blobs}) == 1
+    assert sorted(blob.refs for blob in blobs) == list(range(1, 9))
+    assert len(list(tmp_path.rglob("*.png"))) == 1
@@ -0,0 +1,137 @@
+import asyncio
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from domains.platform.media.adapters.local_storage import LocalStorageGateway
+from domains.platform.media.adapters.variant_cache import VariantDiskCache
+from domains.platform.media.application.variants import (
+    ImageVariantService,
+    VariantPreset,
+    VariantUnavailable,
+    render_variant,
+    variant_key,
+)
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def _png(width: int, height: int, mode: str = "RGB") -> bytes:
+    color = (200, 30, 30, 128) if mode == "RGBA" else (200, 30, 30)
+    buffer = io.BytesIO()
+    Image.new(mode, (width, height), color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    def __init__(self) -> None:
+        super().__init__(max_workers=2)
+        self.submitted = 0
+
+    def submit(self, fn, /, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+def _stored(tmp_path, payload: bytes) -> tuple[LocalStorageGateway, str]:
+    storage = LocalStorageGateway(str(tmp_path / "uploads"))
+    url = storage.save(io.BytesIO(payload), "image.png", "image/png")
+    return storage, url.removeprefix(storage.public_route_prefix + "/")
+
+
+def test_variant_keys_are_deterministic_per_preset_parameters() -> None:
+    preset = VariantPreset("thumb-320", 320)
+    assert variant_key("abc.png", preset) == variant_key("abc.jpg", preset)
+    assert variant_key("abc.png", preset) != variant_key(
+        "abc.png", VariantPreset("thumb-320", 320, quality=60)
+    )
+    assert variant_key("abc.png", preset).endswith(".webp")
+
+
+def test_render_variant_downscales_without_upscaling(tmp_path) -> None:
+    source = tmp_path / "source.png"
+    source.write_bytes(_png(1000, 500, mode="RGBA"))
+
+    small = Image.open(io.BytesIO(render_variant(str(source), 200, "jpeg", 80)))
+    assert (small.format, small.size, small.mode) == ("JPEG", (200, 100), "RGB")
+
+    same = Image.open(io.BytesIO(render_variant(str(source), 4000, "webp", 80)))
+    assert (same.format, same.size) == ("WEBP", (1000, 500))
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_render_missing_variant_once(tmp_path) -> None:
+    _, name = _stored(tmp_path, _png(800, 600))
+    executor = _CountingExecutor()
+    service = ImageVariantService(
+        tmp_path / "uploads",
+        VariantDiskCache(tmp_path / "variants", budget_bytes=10_000_000),
+        executor=executor,
+    )
+
+    results = await asyncio.gather(*(service.get(name, "thumb-320") for _ in range(6)))
+
+    assert executor.submitted == 1
+    assert len({path for path, _ in results}) == 1
+    path, preset = results[0]
+    assert preset.media_type == "image/webp"
+    assert Image.open(path).size == (320, 240)
+
+    await service.get(name, "thumb-320")
+    assert executor.submitted == 1
+    with pytest.raises(VariantUnavailable):
+        await service.get("../etc/passwd", "thumb-320")
+    with pytest.raises(VariantUnavailable):
+        await service.get(name, "missing-preset")
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_decompression_bomb_is_reported_as_unavailable(tmp_path, monkeypatch) -> None:
+    _, name = _stored(tmp_path, _png(800, 600))
+    monkeypatch.setattr(Image, "MAX_IMAGE_PIXELS", 1000)
+    executor = ThreadPoolExecutor(max_workers=1)
+    service = ImageVariantService(
+        tmp_path / "uploads",
+        VariantDiskCache(tmp_path / "variants", budget_bytes=10_000_000),
+        executor=executor,
+    )
+    try:
+        with pytest.raises(VariantUnavailable):
+            await service.get(name, "thumb-320")
+    finally:
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_pregenerate_renders_eager_presets_in_process_pool(tmp_path) -> None:
+    _, name = _stored(tmp_path, _png(640, 640))
+    service = ImageVariantService(
+        tmp_path / "uploads",
+        VariantDiskCache(tmp_path / "variants", budget_bytes=10_000_000),
+        presets=(
+            VariantPreset("avatar-64", 64, eager=True),
+            VariantPreset("card-640", 640),
+        ),
+        max_workers=1,
+    )
+    try:
+        assert await service.pregenerate(name) == 1
+    finally:
+        service.close()
+    assert len(service.cache) == 1
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path) -> None:
+    cache = VariantDiskCache(tmp_path, budget_bytes=250)
+    cache.put("aa-first", b"x" * 100)
+    cache.put("bb-second", b"x" * 100)
+    assert cache.get("aa-first") is not None
+
+    cache.put("cc-third", b"x" * 100)
+
+    assert cache.get("bb-second") is None
+    assert cache.get("aa-first") is not None and cache.get("cc-third") is not None
+    assert cache.total_bytes == 200
+    assert len(VariantDiskCache(tmp_path, budget_bytes=250)) == 2
@@ -0,0 +1,151 @@
+import io
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+
+from domains.platform.iam.security import get_current_user
+from domains.platform.media.adapters.local_storage import LocalStorageGateway
+from domains.platform.media.api.http import make_router
+from domains.platform.media.api.serving import (
+    IMMUTABLE_CACHE_CONTROL,
+    NO_STORE_CACHE_CONTROL,
+    MediaFileResponse,
+    parse_ranges,
+)
+from domains.platform.media.application.variants import VariantUnavailable
+
+PAYLOAD = bytes(range(256)) * 40
+
+
+def test_parse_ranges_merges_and_ignores_malformed() -> None:
+    assert parse_ranges("bytes=0-9,5-19,-10", 100) == [(0, 20), (90, 100)]
+    assert parse_ranges("bytes=50-", 100) == [(50, 100)]
+    assert parse_ranges("bytes=90-200", 100) == [(90, 100)]
+    assert parse_ranges("items=0-1", 100) is None
+    assert parse_ranges("bytes=5-1", 100) is None
+    assert parse_ranges("bytes=" + ",".join(["0-1"] * 40), 100) is None
+
+
+def _client(storage: LocalStorageGateway, variants=None) -> httpx.AsyncClient:
+    app = FastAPI()
+    app.include_router(make_router())
+    app.state.container = SimpleNamespace(
+        media=SimpleNamespace(
+            storage=storage, upload_dir=str(storage.base_dir), variants=variants
+        )
+    )
+
+    async def _user(_: Request) -> dict:
+        return {"sub": "u1"}
+
+    app.dependency_overrides[get_current_user] = _user
+    transport = httpx.ASGITransport(app=app)
+    return httpx.AsyncClient(transport=transport, base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_content_addressed_file_is_immutable_and_revalidates(tmp_path) -> None:
+    storage = LocalStorageGateway(str(tmp_path))
+    url = storage.save(io.BytesIO(PAYLOAD), "a.png", "image/png")
+    digest = url.rsplit("/", 1)[-1].split(".")[0]
+
+    async with _client(storage) as client:
+        first = await client.get(url)
+        assert first.status_code == 200 and first.content == PAYLOAD
+        assert first.headers["etag"] == f'"{digest}"'
+        assert first.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+        assert first.headers["content-type"] == "image/png"
+
+        revisit = await client.get(url, headers={"If-None-Match": first.headers["etag"]})
+        assert revisit.status_code == 304 and revisit.content == b""
+
+        head = await client.head(url)
+        assert head.status_code == 200 and head.content == b""
+        assert head.headers["content-length"] == str(len(PAYLOAD))
+
+
+@pytest.mark.asyncio
+async def test_unavailable_variant_falls_back_without_long_caching(tmp_path) -> None:
+    class _NoVariants:
+        presets = {"thumb-320": object()}
+
+        async def get(self, name: str, preset: str):
+            raise VariantUnavailable("source is not a readable image")
+
+    storage = LocalStorageGateway(str(tmp_path))
+    url = storage.save(io.BytesIO(PAYLOAD), "a.png", "image/png")
+
+    async with _client(storage, _NoVariants()) as client:
+        fallback = await client.get(url, params={"variant": "thumb-320"})
+        assert fallback.status_code == 200 and fallback.content == PAYLOAD
+        assert fallback.headers["cache-control"] == NO_STORE_CACHE_CONTROL
+        original = await client.get(url)
+        assert original.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+
+
+@pytest.mark.asyncio
+async def test_single_and_multi_range_responses(tmp_path) -> None:
+    storage = LocalStorageGateway(str(tmp_path))
+    url = storage.save(io.BytesIO(PAYLOAD), "a.png", "image/png")
+    size = len(PAYLOAD)
+
+    async with _client(storage) as client:
+        single = await client.get(url, headers={"Range": "bytes=100-199"})
+        assert single.status_code == 206
+        assert single.headers["content-range"] == f"bytes 100-199/{size}"
+        assert single.content == PAYLOAD[100:200]
+
+        multi = await client.get(url, headers={"Range": "bytes=0-9,-5"})
+        assert multi.status_code == 206
+        content_type = multi.headers["content-type"]
+        assert content_type.startswith("multipart/byteranges; boundary=")
+        boundary = content_type.split("boundary=")[1]
+        assert int(multi.headers["content-length"]) == len(multi.content)
+        parts = multi.content.split(f"--{boundary}".encode())
+        bodies = [part.split(b"\r\n\r\n", 1)[1].removesuffix(b"\r\n") for part in parts[1:-1]]
+        assert bodies == [PAYLOAD[:10], PAYLOAD[-5:]]
+        assert f"Content-Range: bytes 0-9/{size}".encode() in multi.content
+
+        stale = await client.get(
+            url, headers={"Range": "bytes=0-9", "If-Range": '"not-the-etag"'}
+        )
+        assert stale.status_code == 200 and stale.content == PAYLOAD
+
+        fresh = await client.get(
+            url, headers={"Range": "bytes=0-9", "If-Range": single.headers["etag"]}
+        )
+        assert fresh.status_code == 206 and fresh.content == PAYLOAD[:10]
+
+        unsatisfiable = await client.get(url, headers={"Range": f"bytes={size}-"})
+        assert unsatisfiable.status_code == 416
+        assert unsatisfiable.headers["content-range"] == f"bytes */{size}"
+
+
+@pytest.mark.asyncio
+async def test_zerocopysend_extension_is_used_when_offered(tmp_path) -> None:
+    path = tmp_path / "legacy-upload.bin"
+    path.write_bytes(PAYLOAD)
+    messages: list[dict] = []
+
+    async def _send(message: dict) -> None:
+        if message["type"] == "http.response.zerocopysend":
+            handle = message["file"]
+            handle.seek(message["offset"])
+            message = {**message, "data": handle.read(message["count"])}
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "headers": [(b"range", b"bytes=10-19")],
+        "extensions": {"http.response.zerocopysend": {}},
+    }
+    await MediaFileResponse(path)(scope, None, _send)
+
+    start, zerocopy, end = messages
+    assert start["status"] == 206
+    assert dict(start["headers"])[b"etag"].startswith(b'W/"')
+    assert zerocopy["data"] == PAYLOAD[10:20]
+    assert end == {"type": "http.response.body", "body": b"", "more_body": False}
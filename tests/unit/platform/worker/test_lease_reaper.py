@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from typing import cast
+from uuid import UUID, uuid4
+
+import fakeredis.aioredis
+import pytest
+
+from domains.platform.worker.adapters.queue_redis import RedisWorkerQueue
+from domains.platform.worker.adapters.sql.jobs import SQLWorkerJobRepository
+from domains.platform.worker.application.lease_reaper import LeaseReaper
+from domains.platform.worker.application.service import (
+    JobFailureCommand,
+    WorkerQueueService,
+)
+from domains.platform.worker.domain.models import (
+    JobStatus,
+    LeaseStats,
+    ReclaimedLease,
+    WorkerJob,
+)
+
+
+class _Clock:
+    def __init__(self, start: datetime) -> None:
+        self.now = start
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += timedelta(seconds=seconds)
+
+
+class _LeaseRepo:
+    """In-memory stand-in mirroring the SQL lease/reclaim semantics."""
+
+    def __init__(self, clock: _Clock) -> None:
+        self._clock = clock
+        self.jobs: dict[UUID, WorkerJob] = {}
+        self.events: list[tuple[UUID, str]] = []
+
+    def add(self, *, priority: int = 5, max_attempts: int = 3) -> WorkerJob:
+        now = self._clock()
+        job = WorkerJob(
+            job_id=uuid4(),
+            type="test",
+            status=JobStatus.QUEUED,
+            priority=priority,
+            idempotency_key=None,
+            code_version=None,
+            model_version=None,
+            config_hash=None,
+            lease_until=None,
+            lease_owner=None,
+            attempts=0,
+            max_attempts=max_attempts,
+            available_at=now,
+            cost_cap_eur=None,
+            budget_tag=None,
+            input={},
+            result=None,
+            created_at=now,
+            updated_at=now,
+        )
+        self.jobs[job.job_id] = job
+        return job
+
+    async def lease_jobs(
+        self, *, worker_id, job_types, limit, lease_seconds, job_ids=None
+    ):
+        now = self._clock()
+        ids = list(job_ids or self.jobs)
+        leased: list[WorkerJob] = []
+        for jid in ids[:limit]:
+            job = self.jobs.get(jid)
+            if job is None or job.status is not JobStatus.QUEUED:
+                continue
+            if job.available_at > now:
+                continue
+            job = replace(
+                job,
+                status=JobStatus.LEASED,
+                lease_owner=worker_id,
+                lease_until=now + timedelta(seconds=lease_seconds),
+                attempts=job.attempts + 1,
+            )
+            self.jobs[jid] = job
+            leased.append(job)
+        return leased
+
+    async def get(self, job_id):
+        return self.jobs.get(job_id)
+
+    async def record_event(self, job_id, event, details=None):
+        self.events.append((job_id, event))
+
+    async def requeue_job(self, job_id, *, worker_id, available_at, priority=None):
+        job = replace(
+            self.jobs[job_id],
+            status=JobStatus.QUEUED,
+            lease_owner=None,
+            lease_until=None,
+            available_at=available_at,
+        )
+        self.jobs[job_id] = job
+        return job
+
+    async def reclaim_expired_leases(self, *, now, limit):
+        expired = sorted(
+            (
+                job
+                for job in self.jobs.values()
+                if job.status is JobStatus.LEASED
+                and job.lease_until is not None
+                and job.lease_until < now
+            ),
+            key=lambda job: job.lease_until,
+        )[:limit]
+        reclaimed: list[ReclaimedLease] = []
+        for job in expired:
+            exhausted = job.attempts >= job.max_attempts
+            updated = replace(
+                job,
+                status=JobStatus.EXPIRED if exhausted else JobStatus.QUEUED,
+                lease_owner=None,
+                lease_until=None,
+                available_at=job.available_at if exhausted else now,
+            )
+            self.jobs[job.job_id] = updated
+            self.events.append(
+                (job.job_id, "dead_lettered" if exhausted else "lease_expired")
+            )
+            reclaimed.append(
+                ReclaimedLease(
+                    job_id=job.job_id,
+                    type=job.type,
+                    priority=job.priority,
+                    status=updated.status,
+                    previous_owner=job.lease_owner,
+                    lease_until=cast(datetime, job.lease_until),
+                    attempts=job.attempts,
+                    max_attempts=job.max_attempts,
+                    available_at=updated.available_at,
+                )
+            )
+        return reclaimed
+
+    async def lease_stats(self, *, now):
+        leased = [j for j in self.jobs.values() if j.status is JobStatus.LEASED]
+        expired = [j for j in leased if j.lease_until and j.lease_until < now]
+        oldest = min((j.lease_until for j in expired), default=None)
+        return LeaseStats(
+            active=len(leased) - len(expired),
+            expired=len(expired),
+            oldest_overdue_seconds=(now - oldest).total_seconds() if oldest else 0.0,
+        )
+
+
+def _setup(start: datetime | None = None):
+    clock = _Clock(start or datetime(2026, 1, 1, 12, 0, tzinfo=UTC))
+    repo = _LeaseRepo(clock)
+    queue = RedisWorkerQueue(
+        fakeredis.aioredis.FakeRedis(decode_responses=False), clock=clock
+    )
+    service = WorkerQueueService(cast(SQLWorkerJobRepository, repo), queue=queue)
+    reaper = LeaseReaper(
+        cast(SQLWorkerJobRepository, repo), queue=queue, batch_size=2, clock=clock
+    )
+    return clock, repo, queue, service, reaper
+
+
+@pytest.mark.asyncio
+async def test_reaper_requeues_lease_of_crashed_worker() -> None:
+    clock, repo, queue, service, reaper = _setup()
+    job = repo.add()
+    await queue.push(job.job_id, job.priority)
+
+    leased = await service.lease(
+        worker_id="w-crashed", job_types=None, limit=1, lease_seconds=30
+    )
+    assert [j.job_id for j in leased] == [job.job_id]
+
+    clock.advance(29)
+    summary = await reaper.run_once()
+    assert summary.reclaimed == 0
+    assert repo.jobs[job.job_id].lease_owner == "w-crashed"
+
+    clock.advance(2)
+    summary = await reaper.run_once()
+    assert summary.requeued == 1
+    assert summary.dead_lettered == 0
+    assert repo.jobs[job.job_id].status is JobStatus.QUEUED
+    assert repo.events == [(job.job_id, "lease_expired")]
+
+    retried = await service.lease(
+        worker_id="w-healthy", job_types=None, limit=1, lease_seconds=30
+    )
+    assert [j.lease_owner for j in retried] == ["w-healthy"]
+    assert retried[0].attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_reaper_dead_letters_exhausted_jobs() -> None:
+    clock, repo, queue, service, reaper = _setup()
+    job = repo.add(max_attempts=1)
+    await queue.push(job.job_id, job.priority)
+    await service.lease(worker_id="w-1", job_types=None, limit=1, lease_seconds=10)
+
+    clock.advance(11)
+    summary = await reaper.run_once()
+
+    assert summary.dead_lettered == 1
+    assert repo.jobs[job.job_id].status is JobStatus.EXPIRED
+    assert repo.events == [(job.job_id, "dead_lettered")]
+    assert await queue.ready_count() == 0
+    assert await queue.delayed_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_reaper_drains_more_than_one_batch() -> None:
+    clock, repo, queue, service, reaper = _setup()
+    jobs = [repo.add() for _ in range(5)]
+    await repo.lease_jobs(
+        worker_id="w-1", job_types=None, limit=5, lease_seconds=5
+    )
+
+    clock.advance(6)
+    summary = await reaper.run_once()
+
+    assert summary.requeued == len(jobs)
+    assert await queue.ready_count() == len(jobs)
+
+
+@pytest.mark.asyncio
+async def test_delayed_job_is_not_popped_before_available_at() -> None:
+    clock, _repo, queue, _service, _reaper = _setup()
+    job_id = uuid4()
+    await queue.push(job_id, 5, available_at=clock() + timedelta(seconds=60))
+
+    clock.advance(59.9)
+    assert await queue.pop_many(10) == []
+    assert await queue.delayed_count() == 1
+
+    clock.advance(0.1)
+    assert await queue.pop_many(10) == [job_id]
+    assert await queue.delayed_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_promoted_jobs_keep_priority_order() -> None:
+    clock, _repo, queue, _service, reaper = _setup()
+    low, high, ready = uuid4(), uuid4(), uuid4()
+    due = clock() + timedelta(seconds=5)
+    await queue.push(low, 9, available_at=due)
+    await queue.push(high, 1, available_at=due)
+    await queue.push(ready, 5)
+
+    clock.advance(5)
+    summary = await reaper.run_once()
+
+    assert summary.promoted == 2
+    assert await queue.pop_many(3) == [high, ready, low]
+
+
+@pytest.mark.asyncio
+async def test_retryable_failure_waits_in_delayed_set() -> None:
+    clock, repo, queue, service, _reaper = _setup(datetime.now(UTC))
+    job = repo.add()
+    await queue.push(job.job_id, job.priority)
+    await service.lease(worker_id="w-1", job_types=None, limit=1, lease_seconds=30)
+
+    await service.fail(
+        JobFailureCommand(
+            job_id=job.job_id, worker_id="w-1", error="boom", retryable=True
+        )
+    )
+
+    assert await queue.delayed_count() == 1
+    assert await queue.pop_many(1) == []
+    clock.advance(31)
+    assert await queue.pop_many(1) == [job.job_id]
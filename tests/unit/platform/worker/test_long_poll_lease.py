@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import replace
+from datetime import UTC, datetime
+from typing import cast
+from uuid import UUID
+
+import fakeredis.aioredis
+import pytest
+
+from domains.platform.worker.adapters.queue_redis import RedisWorkerQueue
+from domains.platform.worker.adapters.sql.jobs import SQLWorkerJobRepository
+from domains.platform.worker.application.service import (
+    JobCreateCommand,
+    WorkerQueueService,
+)
+from domains.platform.worker.domain.models import JobStatus, WorkerJob
+
+
+class _Repo:
+    def __init__(self) -> None:
+        self.jobs: dict[UUID, WorkerJob] = {}
+        self.by_key: dict[tuple[str, str | None], WorkerJob] = {}
+        self.batch_calls = 0
+        self._wakeup = asyncio.Event()
+
+    def _make(self, payload) -> WorkerJob:
+        now = datetime.now(UTC)
+        return WorkerJob(
+            job_id=payload["job_id"],
+            type=payload["type"],
+            status=JobStatus.QUEUED,
+            priority=payload["priority"],
+            idempotency_key=payload["idempotency_key"],
+            code_version=None,
+            model_version=None,
+            config_hash=None,
+            lease_until=None,
+            lease_owner=None,
+            attempts=0,
+            max_attempts=3,
+            available_at=now,
+            cost_cap_eur=None,
+            budget_tag=None,
+            input={},
+            result=None,
+            created_at=now,
+            updated_at=now,
+        )
+
+    async def find_by_idempotency(self, job_type, key):
+        return self.by_key.get((job_type, key))
+
+    async def enqueue(self, payload):
+        job = self._make(payload)
+        self.jobs[job.job_id] = job
+        if job.idempotency_key:
+            self.by_key[(job.type, job.idempotency_key)] = job
+        self._wakeup.set()
+        return job
+
+    async def enqueue_many(self, payloads):
+        self.batch_calls += 1
+        out = []
+        for payload in payloads:
+            key = (payload["type"], payload["idempotency_key"])
+            if payload["idempotency_key"] and key in self.by_key:
+                out.append(self.by_key[key])
+                continue
+            out.append(await self.enqueue(payload))
+        return out
+
+    async def lease_jobs(
+        self, *, worker_id, job_types, limit, lease_seconds, job_ids=None
+    ):
+        ids = list(job_ids or self.jobs)
+        leased = []
+        for jid in ids:
+            job = self.jobs.get(jid)
+            if job is None or job.status is not JobStatus.QUEUED:
+                continue
+            if job_types and job.type not in job_types:
+                continue
+            job = replace(job, status=JobStatus.LEASED, lease_owner=worker_id)
+            self.jobs[jid] = job
+            leased.append(job)
+            if len(leased) >= limit:
+                break
+        return leased
+
+    async def get(self, job_id):
+        return self.jobs.get(job_id)
+
+    async def wait_for_jobs(self, timeout):
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except TimeoutError:
+            return False
+        self._wakeup.clear()
+        return True
+
+
+def _service(with_queue: bool) -> tuple[_Repo, RedisWorkerQueue | None, WorkerQueueService]:
+    repo = _Repo()
+    queue = (
+        RedisWorkerQueue(fakeredis.aioredis.FakeRedis(decode_responses=False))
+        if with_queue
+        else None
+    )
+    service = WorkerQueueService(
+        cast(SQLWorkerJobRepository, repo), queue=queue, poll_interval=0.5
+    )
+    return repo, queue, service
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("with_queue", [True, False])
+async def test_lease_long_polls_until_job_arrives(with_queue: bool) -> None:
+    _repo, _queue, service = _service(with_queue)
+
+    async def _produce() -> WorkerJob:
+        await asyncio.sleep(0.15)
+        return await service.enqueue(JobCreateCommand(type="t", input={}))
+
+    producer = asyncio.create_task(_produce())
+    started = time.perf_counter()
+    leased = await service.lease(
+        worker_id="w", job_types=None, limit=5, lease_seconds=30, wait_seconds=3
+    )
+    elapsed = time.perf_counter() - started
+    job = await producer
+
+    assert [j.job_id for j in leased] == [job.job_id]
+    assert elapsed < 1.0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("with_queue", [True, False])
+async def test_lease_wait_is_bounded(with_queue: bool) -> None:
+    _repo, _queue, service = _service(with_queue)
+
+    started = time.perf_counter()
+    leased = await service.lease(
+        worker_id="w", job_types=None, limit=1, lease_seconds=30, wait_seconds=0.3
+    )
+
+    assert leased == []
+    assert 0.25 <= time.perf_counter() - started < 1.5
+
+
+@pytest.mark.asyncio
+async def test_blocking_pop_returns_batch() -> None:
+    _repo, queue, service = _service(True)
+    assert queue is not None
+    await service.enqueue_many(
+        [JobCreateCommand(type="t", input={"n": n}) for n in range(5)]
+    )
+
+    leased = await service.lease(
+        worker_id="w", job_types=None, limit=3, lease_seconds=30, wait_seconds=1
+    )
+
+    assert len(leased) == 3
+    assert await queue.ready_count() == 2
+
+
+@pytest.mark.asyncio
+async def test_enqueue_many_single_repo_call_and_skips_duplicates() -> None:
+    repo, queue, service = _service(True)
+    assert queue is not None
+    existing = await service.enqueue(
+        JobCreateCommand(type="t", input={}, idempotency_key="dup")
+    )
+    await queue.pop_many(10)
+
+    jobs = await service.enqueue_many(
+        [
+            JobCreateCommand(type="t", input={}, idempotency_key="dup"),
+            JobCreateCommand(type="t", input={}),
+            JobCreateCommand(type="t", input={}),
+        ]
+    )
+
+    assert repo.batch_calls == 1
+    assert jobs[0].job_id == existing.job_id
+    assert await queue.ready_count() == 2
@@ -0,0 +1,128 @@
+import pytest
+
+from domains.platform.events.adapters.outbox_memory import InMemoryOutbox
+from domains.product.achievements.adapters.memory.counters import MemoryCounterStore
+from domains.product.achievements.adapters.memory.repository import MemoryRepo
+from domains.product.achievements.application.rule_engine import AchievementRuleEngine
+from domains.product.achievements.application.service import AchievementsAdminService
+from domains.product.achievements.domain.rules import (
+    ConditionError,
+    compile_condition,
+)
+
+DAY = 86400.0
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100 * DAY
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_conditions_compile_and_share_counters() -> None:
+    one = compile_condition({"event": "node.created.v1", "where": {"status": "published"}})
+    ten = compile_condition(
+        {"event": "node.created.v1", "where": {"status": "published"}, "count": 10}
+    )
+    assert one.counters[0].key == ten.counters[0].key
+    assert compile_condition({}) is None
+
+    combo = compile_condition(
+        {
+            "any": [
+                {"event": "node.created.v1", "count": 5, "window_days": 7},
+                {"event": "billing.paid.v1", "sum": "amount", "gte": 100},
+            ]
+        }
+    )
+    assert len({spec.key for spec in combo.counters}) == 2
+
+    for broken in ({"count": 3}, {"event": "x", "where": {"a": {"like": 1}}}, {"all": []}):
+        with pytest.raises(ConditionError):
+            compile_condition(broken)
+
+
+@pytest.mark.asyncio
+async def test_engine_grants_once_from_incremental_counters() -> None:
+    repo = MemoryRepo()
+    admin = AchievementsAdminService(repo)
+    first = await admin.create(
+        {"code": "first", "title": "First", "condition": {"event": "node.created.v1"}},
+        "admin",
+    )
+    prolific = await admin.create(
+        {
+            "code": "prolific",
+            "title": "Prolific",
+            "condition": {
+                "event": "node.created.v1",
+                "where": {"status": {"in": ["published"]}},
+                "count": 3,
+                "window_days": 7,
+            },
+        },
+        "admin",
+    )
+    await admin.create({"code": "manual", "title": "Manual"}, "admin")
+    with pytest.raises(ConditionError):
+        await admin.create(
+            {"code": "bad", "title": "Bad", "condition": {"event": "x", "count": 0}}, "admin"
+        )
+
+    clock = FakeClock()
+    outbox = InMemoryOutbox()
+    counters = MemoryCounterStore()
+    engine = AchievementRuleEngine(repo, counters, outbox=outbox, clock=clock)
+    published = {"author_id": "u1", "status": "published"}
+
+    assert await engine.handle("node.created.v1", published) == [first.id]
+    assert await engine.handle("node.created.v1", {"author_id": "u1", "status": "draft"}) == []
+    assert await engine.handle("profile.updated.v1", {"user_id": "u1"}) == []
+    assert len(engine.rules) == 2 and engine.topics == {"node.created.v1"}
+
+    clock.now += 8 * DAY  # the first published node falls out of the window
+    assert await engine.handle("node.created.v1", published) == []
+    assert await engine.handle("node.created.v1", published) == []
+    assert await engine.handle("node.created.v1", published) == [prolific.id]
+    assert await engine.handle("node.created.v1", published) == []  # already granted
+
+    granted = [p for t, p, _ in outbox.drain() if t == "achievement.granted.v1"]
+    assert [payload["code"] for payload in granted] == ["first", "prolific"]
+
+    # A rule added later is picked up after the catalog-change event and
+    # granted to users whose counters already satisfy it by the backfill.
+    veteran = await admin.create(
+        {
+            "code": "veteran",
+            "title": "Veteran",
+            "condition": {"event": "node.created.v1", "count": 5},
+        },
+        "admin",
+    )
+    await engine.handle("achievement.created.v1", {"id": veteran.id})
+    report = await engine.backfill(batch_size=1)
+    assert (report.users, report.granted) == (1, 1)
+    [(item, unlocked)] = [
+        pair for pair in await repo.list_for_user("u1") if pair[0].id == veteran.id
+    ]
+    assert unlocked is not None
+    assert (await engine.backfill()).granted == 0
+
+
+@pytest.mark.asyncio
+async def test_conditions_without_rule_keys_are_stored_as_manual_only() -> None:
+    repo = MemoryRepo()
+    admin = AchievementsAdminService(repo)
+    legacy = await admin.create(
+        {"code": "legacy", "title": "Legacy", "condition": {"t": 1}}, "admin"
+    )
+    await admin.update(legacy.id, {"condition": {"badge": "gold"}}, "admin")
+    assert compile_condition({"t": 1}) is None
+
+    engine = AchievementRuleEngine(repo, MemoryCounterStore(), clock=FakeClock())
+    assert await engine.handle("node.created.v1", {"author_id": "u1"}) == []
+    assert engine.rules == []
+    [stored] = await repo.list_all()
+    assert stored.condition == {"badge": "gold"}
@@ -0,0 +1,42 @@
+import pytest
+
+from domains.product.achievements.adapters.memory.repository import (
+    MemoryRepo as MemoryAchievementsRepo,
+)
+from domains.product.achievements.application.service import (
+    AchievementsAdminService,
+    AchievementsService,
+)
+from domains.product.tags.adapters.memory.admin_repository import MemoryAdminRepo
+from domains.product.tags.application.admin_service import TagAdminService
+from domains.product.worlds.adapters.memory.repository import MemoryRepo as MemoryWorldsRepo
+from domains.product.worlds.application.service import WorldsService
+from packages.core.async_utils import blocking
+
+
+@pytest.mark.asyncio
+async def test_services_await_async_repositories() -> None:
+    worlds = WorldsService(MemoryWorldsRepo())
+    world = await worlds.create_world({"title": "Avalon"}, "u1")
+    assert [w.id for w in await worlds.list_worlds()] == [world.id]
+
+    repo = MemoryAchievementsRepo()
+    badge = await AchievementsAdminService(repo).create({"code": "first", "title": "First"}, "u1")
+    achievements = AchievementsService(repo)
+    assert await achievements.grant_manual("u1", badge.id)
+    [(item, unlocked)] = await achievements.list("u1")
+    assert item.id == badge.id and unlocked is not None
+
+    tags = TagAdminService(MemoryAdminRepo())
+    src = await tags.create_tag("old", "Old")
+    dst = await tags.create_tag("new", "New")
+    report = await tags.merge_apply(src.id, dst.id, None, None)
+    assert not report.get("errors")
+    assert [t.slug for t in await tags.list_tags(None, 10, 0)] == ["new"]
+
+
+def test_blocking_proxy_serves_scripts() -> None:
+    repo = blocking(MemoryWorldsRepo())
+    world = repo.create_world({"title": "Avalon"}, "u1")
+    assert repo.get_world(world.id).title == "Avalon"
+    assert repo._worlds  # plain attributes pass through
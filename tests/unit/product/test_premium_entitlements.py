@@ -0,0 +1,153 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import fakeredis.aioredis
+import pytest
+
+from domains.platform.events.adapters.event_bus_memory import InMemoryEventBus
+from domains.platform.events.adapters.outbox_memory import InMemoryOutbox
+from domains.platform.events.service import Events
+from domains.platform.quota.adapters.redis_dao import RedisQuotaDAO
+from domains.platform.quota.application.service import QuotaService
+from domains.product.premium.adapters.billing_events import (
+    register_entitlement_invalidation,
+)
+from domains.product.premium.adapters.memory.cache import MemoryEntitlementsCache
+from domains.product.premium.adapters.memory.repository import MemoryEntitlementsRepo
+from domains.product.premium.adapters.redis_cache import RedisEntitlementsCache
+from domains.product.premium.application.service import PremiumService
+
+PLANS = {
+    "free": {"stories": {"month": 1}},
+    "pro": {"stories": {"month": 10}, "__features__": {"ai_assist": True}},
+}
+
+
+class CountingRepo(MemoryEntitlementsRepo):
+    def __init__(self, clock) -> None:
+        super().__init__(clock=clock)
+        self.queries: list[list[str]] = []
+
+    async def active_grants(self, user_ids, *, at):
+        self.queries.append(list(user_ids))
+        return await super().active_grants(user_ids, at=at)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = datetime.now(UTC)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def _service(repo, clock, **kwargs) -> PremiumService:
+    return PremiumService(
+        PLANS,
+        repo=repo,
+        cache=MemoryEntitlementsCache(ttl_seconds=30, clock=clock),
+        clock=clock,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_steady_state_checks_do_not_query_and_bulk_loads_once() -> None:
+    clock = FakeClock()
+    repo = CountingRepo(clock)
+    service = _service(repo, clock)
+    await service.set_user_plan("u1", "pro")
+
+    assert await service.get_effective_plan_slug("u1") == "pro"
+    assert await service.has_feature("u1", "ai_assist")
+    assert (await service.get_quota_status("u1", quota_key="stories"))["limit"] == 10
+    assert repo.queries == [["u1"]]
+
+    resolved = await service.resolve_many(["u1", "u2", "u3", "u2"])
+    assert [value.plan for value in resolved.values()] == ["pro", "free", "free"]
+    assert repo.queries == [["u1"], ["u2", "u3"]]
+    assert await service.get_effective_plan_slug(None) == "free"
+
+    # The local TTL bounds how stale another replica can be.
+    clock.now += timedelta(seconds=31)
+    await service.resolve("u2")
+    assert repo.queries[-1] == ["u2"]
+
+
+@pytest.mark.asyncio
+async def test_subscription_window_end_expires_cached_entitlements() -> None:
+    clock = FakeClock()
+    repo = CountingRepo(clock)
+    service = _service(repo, clock)
+    await service.set_user_plan("u1", "pro", ends_at=clock.now + timedelta(seconds=5))
+    assert await service.get_effective_plan_slug("u1") == "pro"
+
+    clock.now += timedelta(seconds=6)
+    assert await service.get_effective_plan_slug("u1") == "free"
+    assert len(repo.queries) == 2
+
+
+@pytest.mark.asyncio
+async def test_billing_event_and_shared_cache_reach_other_replicas() -> None:
+    clock = FakeClock()
+    repo = CountingRepo(clock)
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    shared = RedisEntitlementsCache(redis, ttl_seconds=600)
+    api = _service(repo, clock, shared_cache=shared)
+    relay = _service(repo, clock, shared_cache=shared)
+    bus = InMemoryEventBus()
+    register_entitlement_invalidation(Events(outbox=InMemoryOutbox(), bus=bus), relay)
+
+    await api.resolve_many(["u1", "u2"])
+    other = _service(repo, clock, shared_cache=shared)
+    assert (await other.resolve("u1")).plan == "free"
+    assert len(repo.queries) == 1  # served by the shared layer
+
+    # Billing activates a plan; the relay process sees the event and drops
+    # the shared entry, so replicas reload once their local entry lapses.
+    await repo.assign("u1", "pro")
+    bus.emit("billing.plan.changed.v1", {"user_id": "u1", "plan": {"slug": "pro"}})
+    await asyncio.sleep(0)
+    assert await redis.get("product:premium:entitlements:v1:u1") is None
+    clock.now += timedelta(seconds=31)
+    assert await other.get_effective_plan_slug("u1") == "pro"
+    assert repo.queries[-1] == ["u1"]
+
+
+@pytest.mark.asyncio
+async def test_invalidation_during_load_is_not_overwritten() -> None:
+    clock = FakeClock()
+    gate = asyncio.Event()
+
+    class SlowRepo(CountingRepo):
+        async def active_grants(self, user_ids, *, at):
+            grants = await super().active_grants(user_ids, at=at)
+            await gate.wait()
+            return grants
+
+    repo = SlowRepo(clock)
+    service = _service(repo, clock)
+    pending = asyncio.create_task(service.resolve("u1"))
+    await asyncio.sleep(0)
+    await service.set_user_plan("u1", "pro")
+    gate.set()
+    assert (await pending).plan == "free"
+    assert await service.get_effective_plan_slug("u1") == "pro"
+
+
+@pytest.mark.asyncio
+async def test_quota_checks_go_through_quota_service() -> None:
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    quota = QuotaService(RedisQuotaDAO(redis))
+    clock = FakeClock()
+    service = _service(CountingRepo(clock), clock, quota=quota)
+    await service.set_user_plan("u1", "pro")
+
+    first = await service.consume_quota("u1", quota_key="stories", amount=4)
+    assert (first["allowed"], first["remaining"]) == (True, 6)
+    status = await service.get_quota_status("u1", quota_key="stories")
+    assert status == {"limit": 10, "used": 4, "remaining": 6}
+    assert not (await service.consume_quota("u1", quota_key="stories", amount=7))["allowed"]
+
+    await service.set_user_plan("u1", "free")
+    assert (await service.consume_quota("u1", quota_key="uploads"))["allowed"] is False
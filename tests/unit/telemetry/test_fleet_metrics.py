@@ -0,0 +1,155 @@
+import fakeredis
+import pytest
+
+from domains.platform.admin.adapters.metrics import MetricsProbe
+from domains.platform.telemetry.adapters.fleet_metrics_redis import (
+    RedisFleetMetricsStore,
+)
+from domains.platform.telemetry.adapters.llm_metrics_adapter import (
+    InMemoryLLMMetricsSink,
+)
+from domains.platform.telemetry.application.fleet_metrics_service import (
+    FleetMetrics,
+    ProcessIdentity,
+)
+from domains.platform.telemetry.application.llm_metrics_facade import LLMMetricsFacade
+from domains.platform.telemetry.application.worker_metrics_service import WorkerMetrics
+from domains.platform.telemetry.ports.llm_metrics_port import LLMCallLabels
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Process:
+    """One simulated process: its own metric singletons and flusher."""
+
+    def __init__(self, store, clock, role: str, pid: int) -> None:
+        self.worker = WorkerMetrics()
+        self.llm = LLMMetricsFacade(InMemoryLLMMetricsSink())
+        self.fleet = FleetMetrics(
+            {"worker": self.worker, "llm": self.llm},
+            store=store,
+            identity=ProcessIdentity(f"{role}@host:{pid}", role, "host", pid, clock()),
+            flush_interval=10,
+            stale_after=30,
+            retention_s=600,
+            clock=clock,
+        )
+
+
+@pytest.fixture
+def store():
+    return RedisFleetMetricsStore(fakeredis.FakeRedis(decode_responses=True))
+
+
+def test_series_round_trip_preserves_snapshots() -> None:
+    worker = WorkerMetrics()
+    worker.inc("completed", 3)
+    worker.observe_duration(120)
+    worker.observe_stage("draft:beats", 40)
+    sink = InMemoryLLMMetricsSink()
+    labels = LLMCallLabels(provider="openai", model="gpt", stage="beats")
+    sink.inc("calls", labels)
+    sink.observe_latency(labels, 300)
+    sink.observe_tokens(labels, 10, 20)
+
+    assert WorkerMetrics.from_series(worker.export_series()).snapshot() == worker.snapshot()
+    rebuilt = InMemoryLLMMetricsSink.from_series(sink.export_series())
+    assert rebuilt.prometheus() == sink.prometheus()
+
+
+def test_flushes_send_deltas_and_collectors_see_merged_fleet(store) -> None:
+    clock = FakeClock()
+    api = Process(store, clock, "api", 1)
+    worker = Process(store, clock, "worker:jobs", 2)
+    worker.worker.inc("completed", 5)
+    worker.worker.inc("failed", 1)
+    api.worker.inc("completed", 2)
+    labels = LLMCallLabels(provider="openai", model="gpt", stage="beats")
+    worker.llm.inc("calls", labels, 4)
+
+    assert api.fleet.flush() > 0
+    first = worker.fleet.flush()
+    worker.worker.inc("completed", 1)
+    assert worker.fleet.flush() == 1  # only the changed series travels
+    assert worker.fleet.flush() == 0
+
+    # A third process merges both and overlays its own live values.
+    admin = Process(store, clock, "api", 3)
+    admin.worker.inc("failed", 2)
+    view = admin.fleet.collect()
+    assert first > 1
+    assert [item.instance for item in view.instances] == [
+        "api@host:3",
+        "api@host:1",
+        "worker:jobs@host:2",
+    ]
+    jobs = view.merged("worker").snapshot()["jobs"]
+    assert jobs["completed"] == 8 and jobs["failed"] == 3
+    calls = view.merged("llm").snapshot()["calls"]
+    assert calls[0]["count"] == 4
+    assert 'telemetry_fleet_instance_up{instance="worker:jobs@host:2"' in view.prometheus()
+
+
+def test_stale_processes_are_flagged_then_expire(store) -> None:
+    clock = FakeClock()
+    gone = Process(store, clock, "worker:events", 7)
+    gone.worker.inc("completed", 3)
+    gone.fleet.flush()
+
+    clock.now += 45
+    live = Process(store, clock, "api", 8)
+    view = live.fleet.collect()
+    stale = {item.instance: item.stale for item in view.instances}
+    assert stale == {"api@host:8": False, "worker:events@host:7": True}
+    # Stale counters still count: that work happened.
+    assert view.merged("worker").snapshot()["jobs"]["completed"] == 3
+
+    signals, summary = MetricsProbe().worker_signals("now", view)
+    process = next(s for s in signals if s["id"] == "process:worker:events@host:7")
+    assert process["status"] == "warning" and process["jobs_completed"] == 3
+    assert summary["processes_stale"] == 1
+
+    clock.now += 600
+    assert [item.instance for item in live.fleet.collect().instances] == ["api@host:8"]
+
+
+def test_reset_and_failed_flushes_resync(store) -> None:
+    clock = FakeClock()
+    proc = Process(store, clock, "worker:jobs", 4)
+    proc.worker.inc("completed", 5)
+    proc.fleet.flush()
+    proc.worker.reset()
+    proc.worker.inc("completed")
+    proc.fleet.flush()
+    reader = Process(store, clock, "api", 5)
+    assert reader.fleet.collect().merged("worker").snapshot()["jobs"]["completed"] == 1
+
+    class Broken:
+        def push(self, *args, **kwargs):
+            raise ConnectionError("redis down")
+
+    proc.fleet._store = Broken()
+    proc.worker.inc("completed", 2)
+    assert proc.fleet.flush() == 0
+    assert proc.fleet.stats()["errors"] == 1
+    proc.fleet._store = store
+    proc.fleet.flush()
+    assert reader.fleet.collect().merged("worker").snapshot()["jobs"]["completed"] == 3
+
+
+def test_without_store_probe_uses_local_process_only() -> None:
+    local = WorkerMetrics()
+    local.inc("completed", 2)
+    fleet = FleetMetrics({"worker": local, "llm": LLMMetricsFacade(InMemoryLLMMetricsSink())})
+    assert fleet.flush() == 0
+    view = fleet.collect()
+    assert not view.shared and len(view.instances) == 1
+    signals, summary = MetricsProbe(fleet=fleet).worker_signals("now", view)
+    assert [s["id"] for s in signals] == ["worker:aggregate"]
+    assert signals[0]["jobs_completed"] == 2 and "processes_total" not in summary
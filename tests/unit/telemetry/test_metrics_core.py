@@ -0,0 +1,122 @@
+import threading
+
+from domains.platform.telemetry.application.event_metrics_service import EventMetrics
+from domains.platform.telemetry.application.transition_metrics_service import (
+    TransitionMetrics,
+)
+from domains.platform.telemetry.application.worker_metrics_service import WorkerMetrics
+from domains.platform.telemetry.domain.metrics import (
+    DROPPED_SERIES,
+    OVERFLOW,
+    Histogram,
+    MetricsRegistry,
+)
+
+
+def test_exposition_formats_and_exemplars() -> None:
+    registry = MetricsRegistry()
+    calls = registry.counter("jobs", "Jobs", ("status",))
+    latency = registry.histogram("latency_ms", "Latency", ("route",), buckets=(10, 100))
+    calls.inc("ok", amount=2)
+    latency.observe(5, "/a")
+    latency.observe(50, "/a", exemplar={"trace_id": "abc"})
+
+    text = registry.exposition()
+    assert "# TYPE jobs_total counter\njobs_total{status=\"ok\"} 2\n" in text
+    assert 'latency_ms_bucket{route="/a",le="10"} 1\n' in text
+    assert 'latency_ms_bucket{route="/a",le="100"} 2\n' in text
+    assert 'latency_ms_bucket{route="/a",le="+Inf"} 2\n' in text
+    assert 'latency_ms_sum{route="/a"} 55\nlatency_ms_count{route="/a"} 2\n' in text
+    assert "#" not in text.split("le=\"100\"} 2")[1].split("\n")[0]
+
+    om = registry.exposition(openmetrics=True)
+    assert "# TYPE jobs counter\n" in om
+    assert 'le="100"} 2 # {trace_id="abc"} 50 ' in om
+
+
+def test_exposition_is_cached_and_only_dirty_series_rerender() -> None:
+    registry = MetricsRegistry()
+    counter = registry.counter("hits", "Hits", ("key",))
+    for i in range(100):
+        counter.inc(str(i))
+    rendered: list[tuple] = []
+    original = counter._render_many
+
+    def spy(values, *args):
+        rendered.extend(values)
+        return original(values, *args)
+
+    counter._render_many = spy
+    first = registry.exposition()
+    assert len(rendered) == 100
+    assert registry.exposition() is first
+    counter.inc("7")
+    second = registry.exposition()
+    assert rendered[100:] == [("7",)]
+    assert 'hits_total{key="7"} 2\n' in second and second.count("\n") == 102
+
+
+def test_label_cardinality_is_capped() -> None:
+    registry = MetricsRegistry()
+    counter = registry.counter("capped_paths", "Paths", ("path",), max_series=3)
+    before = DROPPED_SERIES.value("capped_paths")
+    for i in range(10):
+        counter.inc(f"/p/{i}")
+    values = counter.values()
+    assert len(values) == 4 and values[(OVERFLOW,)] == 7
+    assert DROPPED_SERIES.value("capped_paths") == before + 7
+    assert "telemetry_metric_series_dropped" not in registry.exposition()
+
+    # Rebuilding a merged view must not count the same drops again.
+    rebuilt = MetricsRegistry()
+    rebuilt.counter("capped_paths", "Paths", ("path",), max_series=1).inc("/x")
+    rebuilt.load({("capped_paths", "/y"): 1.0})
+    assert DROPPED_SERIES.value("capped_paths") == before + 7
+
+
+def test_concurrent_observations_are_not_lost() -> None:
+    histogram = Histogram("work_ms", "Work", ("kind",), buckets=(1, 10))
+
+    def worker() -> None:
+        for i in range(5000):
+            histogram.observe(i % 20, "a")
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    count, total = histogram.stats("a")
+    assert count == 40000 and total == 8 * sum(i % 20 for i in range(5000))
+    assert 9 <= histogram.quantile(0.5, "a") <= 10
+
+
+def test_services_keep_snapshot_shapes_and_merge_histograms() -> None:
+    events = EventMetrics()
+    events.inc("node.published")
+    events.record_handler("node.published", "index", True, 12.0)
+    events.record_handler("node.published", "index", False, 30.0)
+    assert events.snapshot() == {"node.published": 1}
+    row = events.handler_snapshot()[0]
+    assert (row["success"], row["failure"], row["total"], row["avg_ms"]) == (1, 1, 2, 21.0)
+
+    transitions = TransitionMetrics()
+    transitions.observe_latency("Compass", 40)
+    transitions.observe_latency("compass", 60)
+    transitions.inc_no_route("compass")
+    snap = transitions.snapshot()[0]
+    assert (snap["mode"], snap["count"], snap["avg_latency_ms"]) == ("compass", 2, 50.0)
+    assert snap["no_route_ratio"] == 0.5
+
+    a, b = WorkerMetrics(), WorkerMetrics()
+    a.observe_duration(20)
+    b.observe_duration(400)
+    b.inc("completed")
+    merged = {
+        key: a.export_series().get(key, 0) + b.export_series().get(key, 0)
+        for key in {**a.export_series(), **b.export_series()}
+    }
+    combined = WorkerMetrics.from_series(merged)
+    assert combined.duration_count == 2 and combined.duration_sum_ms == 420
+    assert combined.counters == {"started": 0, "completed": 1, "failed": 0}
+    assert 'ai_worker_job_duration_ms_bucket{le="500"} 2' in combined.prometheus()
@@ -0,0 +1,67 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from domains.platform.telemetry.api import http as telemetry_http
+from domains.platform.telemetry.domain.metrics import MetricsRegistry
+
+prometheus_client = pytest.importorskip("prometheus_client")
+from prometheus_client.openmetrics.parser import (  # noqa: E402
+    text_string_to_metric_families as parse_openmetrics,
+)
+from prometheus_client.parser import (  # noqa: E402
+    text_string_to_metric_families as parse_prometheus,
+)
+
+
+class _Source:
+    def __init__(self, name: str) -> None:
+        self.registry = MetricsRegistry()
+        calls = self.registry.counter(f"{name}_calls", "Calls", ("route",), max_series=2)
+        latency = self.registry.histogram(
+            f"{name}_latency_ms", "Latency", ("route",), buckets=(10,), max_series=2
+        )
+        for index in range(5):
+            calls.inc(f"/r/{index}")
+            latency.observe(5, f"/r/{index}")
+
+    def prometheus(self, *, openmetrics: bool = False) -> str:
+        return self.registry.exposition(openmetrics=openmetrics)
+
+
+@pytest.fixture()
+def client(monkeypatch) -> TestClient:
+    for name in ("event_metrics", "ux_metrics", "transition_metrics"):
+        monkeypatch.setattr(telemetry_http, name, _Source(f"scrape_{name}"))
+    for name in ("worker_metrics", "llm_metrics"):
+        monkeypatch.setattr(telemetry_http, name, SimpleNamespace(prometheus=lambda **_: ""))
+    container = SimpleNamespace(telemetry=SimpleNamespace(fleet_metrics=None))
+    monkeypatch.setattr(telemetry_http, "get_container", lambda request: container)
+    app = FastAPI()
+    app.include_router(telemetry_http.make_router())
+    return TestClient(app)
+
+
+def _dropped(families) -> dict[str, float]:
+    found = [family for family in families if family.name == "telemetry_metric_series_dropped"]
+    assert len(found) == 1
+    return {
+        sample.labels["metric"]: sample.value
+        for sample in found[0].samples
+        if sample.name == "telemetry_metric_series_dropped_total"
+    }
+
+
+def test_overflowing_families_parse_in_both_formats(client: TestClient) -> None:
+    text = client.get("/v1/metrics").text
+    assert text.count("# TYPE telemetry_metric_series_dropped_total counter") == 1
+    dropped = _dropped(list(parse_prometheus(text)))
+    assert dropped["scrape_ux_metrics_calls"] >= 3
+    assert dropped["scrape_event_metrics_latency_ms"] >= 3
+
+    response = client.get("/v1/metrics", headers={"Accept": "application/openmetrics-text"})
+    assert "# TYPE telemetry_metric_series_dropped counter\n" in response.text
+    dropped = _dropped(list(parse_openmetrics(response.text)))
+    assert dropped["scrape_transition_metrics_calls"] >= 3
@@ -0,0 +1,185 @@
+import asyncio
+import gzip
+import random
+import time
+
+import fakeredis.aioredis
+import pytest
+from fastapi import HTTPException
+
+from domains.platform.telemetry.adapters.rum_memory import RumMemoryRepository
+from domains.platform.telemetry.adapters.rum_repository import RumRedisRepository
+from domains.platform.telemetry.api.http import MAX_RUM_BATCH_BYTES, _decode_batch_body
+from domains.platform.telemetry.application.rum_service import RumMetricsService
+
+
+def _events(count: int) -> list[dict]:
+    base_ms = int(time.time() * 1000) - 5 * 60_000
+    return [
+        {
+            "event": "navigation",
+            "ts": base_ms + (index % 3) * 60_000,
+            "url": f"https://app.local/{index % 4}",
+            "data": {"ttfb": 10.0 + index, "loadEvent": 500.0 + 3 * index},
+        }
+        for index in range(count)
+    ]
+
+
+def _snapshot(aggregates) -> dict:
+    return {
+        agg.key: (
+            agg.count,
+            agg.bucket_ms,
+            agg.last_ts,
+            {name: round(value, 6) for name, value in agg.sums.items()},
+            {name: dict(sketch.bins()) for name, sketch in agg.sketches.items()},
+        )
+        for agg in aggregates
+    }
+
+
+@pytest.mark.asyncio
+async def test_add_many_matches_sequential_adds() -> None:
+    events = _events(40)
+    single = RumRedisRepository(fakeredis.aioredis.FakeRedis(decode_responses=True))
+    batched = RumRedisRepository(fakeredis.aioredis.FakeRedis(decode_responses=True))
+    for event in events:
+        await single.add(event)
+
+    assert await batched.add_many(events) == 40
+
+    now_ms = int(time.time() * 1000)
+    expected = _snapshot(await single.fetch_pending_aggregates(now_ms))
+    assert _snapshot(await batched.fetch_pending_aggregates(now_ms)) == expected
+    assert len(await batched.list(100)) == 40
+
+
+@pytest.mark.asyncio
+async def test_record_batch_drops_invalid_items_and_keeps_errors() -> None:
+    repo = RumMemoryRepository()
+    service = RumMetricsService(repo, sample_rate=0.0)
+    payloads = [
+        *_events(3),
+        {"event": "ui_error", "ts": 1, "url": "/", "data": {"message": "boom"}},
+        {"event": "navigation", "ts": "soon"},
+        "not-an-object",
+    ]
+
+    result = await service.record_batch(payloads)
+
+    assert result.as_dict() == {
+        "received": 6,
+        "accepted": 1,
+        "rejected": 2,
+        "sampled_out": 3,
+        "shed": 0,
+    }
+    stored = await repo.list(10)
+    assert [item["event"] for item in stored] == ["ui_error"]
+
+
+@pytest.mark.asyncio
+async def test_sampled_events_are_weighted_in_aggregates() -> None:
+    repo = RumRedisRepository(fakeredis.aioredis.FakeRedis(decode_responses=True))
+    service = RumMetricsService(repo, sample_rate=0.25, rng=random.Random(7))
+    error = {
+        "event": "ui_error",
+        "ts": int(time.time() * 1000),
+        "url": "/",
+        "data": {"code": 1},
+    }
+
+    result = await service.record_batch([*_events(40), error])
+
+    stored = await repo.list(100)
+    kept = [item for item in stored if item["event"] == "navigation"]
+    assert 0 < len(kept) < 40
+    assert result.sampled_out == 40 - len(kept)
+    assert {item["sample_weight"] for item in kept} == {4}
+    errors = [item for item in stored if item["event"] == "ui_error"]
+    assert [item["sample_weight"] for item in errors] == [1]
+
+    now_ms = int(time.time() * 1000)
+    navigation = [
+        agg
+        for agg in await repo.fetch_pending_aggregates(now_ms)
+        if agg.event == "navigation"
+    ]
+    assert sum(agg.count for agg in navigation) == 4 * len(kept)
+    assert sum(agg.sketches["ttfb"].count for agg in navigation) == 4 * len(kept)
+    assert sum(agg.sums["ttfb"] for agg in navigation) == pytest.approx(
+        4 * sum(item["data"]["ttfb"] for item in kept)
+    )
+
+    summary = await service.summary(100)
+    assert summary["counts"] == {"navigation": 4 * len(kept), "ui_error": 1}
+
+
+@pytest.mark.asyncio
+async def test_weighted_add_many_matches_sequential_adds() -> None:
+    events = [
+        {**event, "sample_weight": 1 + index % 3}
+        for index, event in enumerate(_events(12))
+    ]
+    single = RumRedisRepository(fakeredis.aioredis.FakeRedis(decode_responses=True))
+    batched = RumRedisRepository(fakeredis.aioredis.FakeRedis(decode_responses=True))
+    for event in events:
+        await single.add(event)
+    await batched.add_many(events)
+
+    now_ms = int(time.time() * 1000)
+    expected = _snapshot(await single.fetch_pending_aggregates(now_ms))
+    assert _snapshot(await batched.fetch_pending_aggregates(now_ms)) == expected
+    assert sum(value[0] for value in expected.values()) == 24
+
+
+class _SlowRepo(RumMemoryRepository):
+    def __init__(self, delay: float) -> None:
+        super().__init__()
+        self.delay = delay
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def add_many(self, events):
+        await self.release.wait()
+        await asyncio.sleep(self.delay)
+        return await super().add_many(events)
+
+
+@pytest.mark.asyncio
+async def test_slow_writes_reduce_sample_rate() -> None:
+    service = RumMetricsService(
+        _SlowRepo(delay=0.02), slow_write_ms=5.0, rng=random.Random(1)
+    )
+    for _ in range(3):
+        await service.record_batch(_events(5))
+
+    assert service.effective_sample_rate < 0.2
+
+
+@pytest.mark.asyncio
+async def test_batches_over_inflight_limit_are_shed() -> None:
+    repo = _SlowRepo(delay=0.0)
+    repo.release.clear()
+    service = RumMetricsService(repo, max_inflight_writes=1)
+
+    pending = asyncio.create_task(service.record_batch(_events(2)))
+    await asyncio.sleep(0)
+    shed = await service.record_batch(_events(4))
+    repo.release.set()
+    first = await pending
+
+    assert first.accepted == 2
+    assert shed.shed == 4 and shed.accepted == 0
+
+
+def test_decode_batch_body_handles_gzip_and_limits() -> None:
+    body = b'[{"event":"navigation"}]'
+    assert _decode_batch_body(gzip.compress(body), "gzip") == body
+    assert _decode_batch_body(body, None) == body
+
+    bomb = gzip.compress(b" " * (MAX_RUM_BATCH_BYTES + 10))
+    with pytest.raises(HTTPException) as excinfo:
+        _decode_batch_body(bomb, "gzip")
+    assert excinfo.value.status_code == 413
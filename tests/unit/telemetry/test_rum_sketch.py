@@ -0,0 +1,149 @@
+import random
+import time
+
+import fakeredis.aioredis
+import pytest
+
+from domains.platform.telemetry.adapters.rum_repository import RumRedisRepository
+from domains.platform.telemetry.application.rum_service import RumMetricsService
+from domains.platform.telemetry.domain.sketch import QuantileSketch, quantile_label
+
+
+def _exact(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+def test_sketch_quantiles_within_relative_accuracy() -> None:
+    rng = random.Random(7)
+    values = [rng.lognormvariate(6.0, 0.8) for _ in range(20_000)]
+    sketch = QuantileSketch(0.01)
+    for value in values:
+        sketch.add(value)
+
+    assert sketch.count == len(values)
+    for q in (0.5, 0.75, 0.95, 0.99):
+        exact = _exact(values, q)
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.011)
+
+
+def test_sketch_merge_matches_single_sketch() -> None:
+    rng = random.Random(11)
+    values = [rng.uniform(0, 3000) for _ in range(5_000)] + [0.0, 0.0]
+    whole = QuantileSketch()
+    left, right = QuantileSketch(), QuantileSketch()
+    for index, value in enumerate(values):
+        whole.add(value)
+        (left if index % 2 else right).add(value)
+
+    left.merge(right)
+    restored = QuantileSketch.from_dict(left.to_dict())
+
+    assert dict(restored.bins()) == dict(whole.bins())
+    assert restored.quantiles() == whole.quantiles()
+    assert quantile_label(0.999) == "p99_9"
+
+
+@pytest.mark.asyncio
+async def test_repository_sketches_roll_up_into_windows() -> None:
+    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    repo = RumRedisRepository(fake)
+    service = RumMetricsService(repo)
+    base_ms = int(time.time() * 1000) - 5 * 60_000
+    ttfbs = [float(v) for v in range(10, 1010, 10)]
+    for index, ttfb in enumerate(ttfbs):
+        await repo.add(
+            {
+                "event": "navigation",
+                "ts": base_ms + (index % 2) * 60_000,
+                "url": f"https://app.local/{'a' if index % 3 else 'b'}",
+                "data": {"ttfb": ttfb},
+            }
+        )
+
+    aggregates = await repo.fetch_pending_aggregates(int(time.time() * 1000))
+    assert len(aggregates) == 4
+    assert all("ttfb" in agg.sketches for agg in aggregates)
+    assert sum(agg.sketches["ttfb"].count for agg in aggregates) == len(ttfbs)
+
+    await repo.commit_aggregates(aggregates)
+    assert await repo.fetch_pending_aggregates(int(time.time() * 1000)) == []
+
+    result = await service.percentiles("navigation", window_minutes=30)
+    ttfb = result["metrics"]["ttfb"]
+    assert ttfb["count"] == len(ttfbs)
+    assert ttfb["p75"] == pytest.approx(_exact(ttfbs, 0.75), rel=0.02)
+    assert ttfb["p95"] == pytest.approx(_exact(ttfbs, 0.95), rel=0.02)
+
+
+@pytest.mark.asyncio
+async def test_minute_written_again_after_commit_is_merged_once() -> None:
+    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    repo = RumRedisRepository(fake)
+    service = RumMetricsService(repo)
+    minute_ms = (int(time.time() * 1000) // 60_000) * 60_000 - 5 * 60_000
+    first = [100.0, 200.0, 300.0]
+    late = [1000.0, 2000.0]
+
+    for ttfb in first:
+        await repo.add({"event": "navigation", "ts": minute_ms, "data": {"ttfb": ttfb}})
+    await repo.commit_aggregates(await repo.fetch_pending_aggregates(minute_ms))
+
+    # A beacon lands after the fetch of the second commit; it must survive it.
+    await repo.add({"event": "navigation", "ts": minute_ms, "data": {"ttfb": late[0]}})
+    pending = await repo.fetch_pending_aggregates(minute_ms)
+    assert [agg.count for agg in pending] == [1]
+    await repo.add({"event": "navigation", "ts": minute_ms, "data": {"ttfb": late[1]}})
+    await repo.commit_aggregates(pending)
+
+    remaining = await repo.fetch_pending_aggregates(minute_ms)
+    assert [agg.count for agg in remaining] == [1]
+    assert remaining[0].sums["ttfb"] == pytest.approx(late[1])
+    await repo.commit_aggregates(remaining)
+    assert await repo.fetch_pending_aggregates(minute_ms) == []
+
+    result = await service.percentiles("navigation", window_minutes=30)
+    ttfb = result["metrics"]["ttfb"]
+    assert ttfb["count"] == len(first) + len(late)
+    assert ttfb["p50"] == pytest.approx(300.0, rel=0.02)
+
+
+@pytest.mark.asyncio
+async def test_window_percentiles_per_route_with_capped_routes() -> None:
+    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    repo = RumRedisRepository(fake, max_window_routes=2)
+    service = RumMetricsService(repo)
+    minute_ms = (int(time.time() * 1000) // 60_000) * 60_000 - 5 * 60_000
+    routes = {"a": [100.0, 110.0], "b": [900.0], "c": [5000.0], "d": [7000.0]}
+    for name, values in routes.items():
+        for ttfb in values:
+            await repo.add(
+                {
+                    "event": "navigation",
+                    "ts": minute_ms,
+                    "url": f"https://app.local/{name}?q=1",
+                    "data": {"ttfb": ttfb},
+                }
+            )
+    # Commit route by route so the first two routes take the slots.
+    pending = await repo.fetch_pending_aggregates(minute_ms)
+    for name in routes:
+        await repo.commit_aggregates(
+            [agg for agg in pending if agg.route == f"app.local/{name}"]
+        )
+
+    everything = await service.percentiles("navigation", window_minutes=30)
+    assert everything["metrics"]["ttfb"]["count"] == 5
+    first = await service.percentiles(
+        "navigation", route="https://app.local/a", window_minutes=30
+    )
+    assert first["route"] == "app.local/a"
+    assert first["metrics"]["ttfb"]["count"] == 2
+    assert first["metrics"]["ttfb"]["p50"] == pytest.approx(100.0, rel=0.02)
+    assert (await service.percentiles("navigation", route="app.local/b"))["metrics"][
+        "ttfb"
+    ]["count"] == 1
+    # Routes past the cap are only found under "other".
+    assert (await service.percentiles("navigation", route="app.local/c"))["metrics"] == {}
+    other = await service.percentiles("navigation", route="other")
+    assert other["metrics"]["ttfb"]["count"] == 2